@@ -35,7 +35,8 @@ from agents.prompts import (
 )
 from app.config import settings
 from app.api.routes.settings import get_upbit_access_key, get_upbit_secret_key
-from services.upbit import UpbitClient
+from app.core.upbit_singleton import get_shared_upbit_client
+from services.realtime_service import get_running_realtime_service
 
 logger = structlog.get_logger()
 
@@ -73,20 +74,23 @@ async def coin_data_collection_node(state: dict) -> dict:
     )
 
     try:
-        async with UpbitClient() as client:
-            # Fetch comprehensive market data
-            analysis_data = await client.get_analysis_data(
-                market=market,
-                candle_count=100,
-                trade_count=50,
-            )
-
-            # Get orderbook
-            orderbooks = await client.get_orderbook([market])
-            orderbook = orderbooks[0] if orderbooks else None
-
-            # Get recent trades
-            trades = await client.get_trades(market, count=50)
+        realtime = get_running_realtime_service()
+        async with get_shared_upbit_client() as client:
+            # Fetch comprehensive market data (orderbook and trades included)
+            if realtime is not None:
+                # Reuses daily candles already held by the realtime service
+                analysis_data = await realtime.get_analysis_data(
+                    client,
+                    market,
+                    candle_count=100,
+                    trade_count=50,
+                )
+            else:
+                analysis_data = await client.get_analysis_data(
+                    market=market,
+                    candle_count=100,
+                    trade_count=50,
+                )
 
         market_data = {
             "market": market,
@@ -101,8 +105,8 @@ async def coin_data_collection_node(state: dict) -> dict:
 
         # analysis_data.candles is already a list of dicts from get_analysis_data()
         candles = analysis_data.candles if analysis_data.candles else []
-        orderbook_dict = orderbook.model_dump() if orderbook else None
-        trades_list = [t.model_dump() for t in trades] if trades else []
+        orderbook_dict = analysis_data.orderbook
+        trades_list = analysis_data.trades
 
         reasoning = (
             f"[Data Collection] {market}: "
@@ -472,7 +476,7 @@ async def coin_strategic_decision_node(state: dict) -> dict:
             secret_key = get_upbit_secret_key()
 
             if access_key and secret_key:
-                client = UpbitClient(access_key=access_key, secret_key=secret_key)
+                client = get_shared_upbit_client()
                 accounts = await client.get_accounts()
 
                 # Find KRW balance
@@ -785,11 +789,8 @@ async def _execute_live_order(
                 "reasoning_log": add_coin_reasoning_log(state, reasoning),
             }
 
-        # Create Upbit client and execute order (using runtime or environment keys)
-        async with UpbitClient(
-            access_key=get_upbit_access_key(),
-            secret_key=get_upbit_secret_key(),
-        ) as client:
+        # Execute order via the shared Upbit client (runtime or environment keys)
+        async with get_shared_upbit_client() as client:
             # Place the order
             order = await client.place_order(
                 market=market,
@@ -939,6 +940,13 @@ def _format_coin_market_context(market_data: dict, candles: list, orderbook: dic
         lines.append("=== Orderbook ===")
         lines.append(f"Total Ask Size: {orderbook.get('total_ask_size', 0):.4f}")
         lines.append(f"Total Bid Size: {orderbook.get('total_bid_size', 0):.4f}")
+        # Streamed book metrics (services.orderbook), when available
+        if orderbook.get("imbalance") is not None:
+            lines.append(f"Depth Imbalance (top {orderbook.get('levels')}): {orderbook['imbalance']:+.2f}")
+        if orderbook.get("spread_bps") is not None:
+            lines.append(f"Spread: {orderbook['spread_bps']:.1f} bps")
+        if orderbook.get("microprice") is not None:
+            lines.append(f"Microprice: {orderbook['microprice']:,.2f} KRW")
 
     return "\n".join(lines)
 
@@ -14,11 +14,18 @@ from agents.graph.kr_stock_state import (
     add_kr_stock_reasoning_log,
 )
 from agents.tools.kr_market_data import (
+    chart_df_to_records,
     get_kr_daily_chart,
     get_kr_orderbook,
     get_kr_stock_info,
 )
-from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+from services.compute import get_compute_executor
+from services.market_snapshot import (
+    ALL_PARTS,
+    BARS,
+    POSITION,
+    get_market_snapshot_service,
+)
 from .helpers import _get_stk_cd_safely
 
 logger = structlog.get_logger()
@@ -39,75 +46,42 @@ async def kr_stock_data_collection_node(state: dict) -> dict:
     )
 
     try:
-        # Fetch stock info
-        stock_info = await get_kr_stock_info(stk_cd)
+        # Quote, chart, orderbook and portfolio from the shared market snapshot
+        # (fetched concurrently, reused if chat/scanner pulled them recently)
+        snapshot = await get_market_snapshot_service().get_snapshot(stk_cd, parts=ALL_PARTS)
 
-        # Fetch daily chart
-        chart_df = await get_kr_daily_chart(stk_cd)
+        # Fall back to the tools (mock data when Kiwoom is unavailable)
+        stock_info = snapshot.quote or await get_kr_stock_info(stk_cd)
+        orderbook = dict(snapshot.orderbook) if snapshot.orderbook else await get_kr_orderbook(stk_cd)
 
-        # Fetch orderbook
-        orderbook = await get_kr_orderbook(stk_cd)
+        if snapshot.has(BARS):
+            chart_data = list(snapshot.chart_records)
+        else:
+            chart_df = await get_kr_daily_chart(stk_cd)
+            chart_data = await get_compute_executor().run_frame(chart_df_to_records, chart_df)
 
-        # Fetch portfolio to check for existing position
+        # Existing position for this stock and portfolio summary
         existing_position = None
         portfolio_summary = None
-        try:
-            client = await get_shared_kiwoom_client_async()
-            account_balance = await client.get_account_balance()
-
-            # Find existing position for this stock
-            for holding in account_balance.holdings:
-                if holding.stk_cd == stk_cd:
-                    existing_position = {
-                        "stk_cd": holding.stk_cd,
-                        "stk_nm": holding.stk_nm,
-                        "quantity": holding.hldg_qty,
-                        "avg_buy_price": holding.avg_buy_prc,
-                        "current_price": holding.cur_prc,
-                        "eval_amount": holding.evlu_amt,
-                        "profit_loss": holding.evlu_pfls_amt,
-                        "profit_loss_pct": holding.evlu_pfls_rt,
-                    }
-                    logger.info(
-                        "existing_position_found",
-                        stk_cd=stk_cd,
-                        quantity=holding.hldg_qty,
-                        avg_price=holding.avg_buy_prc,
-                        pnl_pct=holding.evlu_pfls_rt,
-                    )
-                    break
-
-            # Portfolio summary for context
-            portfolio_summary = {
-                "total_purchase": account_balance.pchs_amt,
-                "total_eval": account_balance.evlu_amt,
-                "total_pnl": account_balance.evlu_pfls_amt,
-                "total_pnl_pct": account_balance.evlu_pfls_rt,
-                "available_cash": account_balance.d2_ord_psbl_amt,
-                "holdings_count": len(account_balance.holdings),
-            }
-
-        except Exception as e:
+        if snapshot.portfolio is not None:
+            portfolio_summary = dict(snapshot.portfolio)
+            if snapshot.position is not None:
+                existing_position = dict(snapshot.position)
+                logger.info(
+                    "existing_position_found",
+                    stk_cd=stk_cd,
+                    quantity=existing_position["quantity"],
+                    avg_price=existing_position["avg_buy_price"],
+                    pnl_pct=existing_position["profit_loss_pct"],
+                )
+        else:
             logger.warning(
                 "portfolio_fetch_failed",
                 stk_cd=stk_cd,
-                error=str(e),
+                error=snapshot.errors.get(POSITION),
             )
             # Continue without portfolio data
 
-        # Convert chart DataFrame to list of dicts for serialization
-        chart_data = []
-        if not chart_df.empty:
-            for idx, row in chart_df.iterrows():
-                chart_data.append({
-                    "date": idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx),
-                    "open": int(row["open"]),
-                    "high": int(row["high"]),
-                    "low": int(row["low"]),
-                    "close": int(row["close"]),
-                    "volume": int(row["volume"]),
-                })
-
         stk_nm = stock_info.get("stk_nm", "")
         cur_prc = stock_info.get("cur_prc", 0)
         prdy_ctrt = stock_info.get("prdy_ctrt", 0)
@@ -442,6 +442,30 @@ def _calculate_enhanced_indicators(df: pd.DataFrame) -> tuple[dict, list]:
         return {}, []
 
 
+def _calculate_technical_bundle(
+    df: pd.DataFrame,
+    market_data: dict,
+    orderbook: dict,
+) -> tuple[str, dict, dict, list]:
+    """
+    Compute everything technical analysis needs from the chart in one call.
+
+    Module-level so it can run in the compute process pool.
+
+    Returns:
+        Tuple of (market_context text, basic indicators, enhanced indicators, detected signals)
+    """
+    from agents.tools.kr_market_data import (
+        calculate_kr_technical_indicators,
+        format_kr_market_data_for_llm,
+    )
+
+    market_context = format_kr_market_data_for_llm(market_data, df, orderbook)
+    indicators = calculate_kr_technical_indicators(df)
+    enhanced_indicators, detected_signals = _calculate_enhanced_indicators(df)
+    return market_context, indicators, enhanced_indicators, detected_signals
+
+
 def _format_detected_signals_text(detected_signals: list) -> str:
     """Format detected signals as text for LLM prompt."""
     if not detected_signals:
@@ -499,10 +523,7 @@ async def analyze_technical_core(state: dict) -> KRStockAnalysisResult:
 
     from agents.llm_provider import get_llm_provider
     from agents.prompts import KR_STOCK_TECHNICAL_ANALYST_PROMPT
-    from agents.tools.kr_market_data import (
-        calculate_kr_technical_indicators,
-        format_kr_market_data_for_llm,
-    )
+    from services.compute import get_compute_executor
 
     stk_cd = state.get("stk_cd", "")
     stk_nm = state.get("stk_nm", stk_cd)
@@ -515,10 +536,12 @@ async def analyze_technical_core(state: dict) -> KRStockAnalysisResult:
     # Prepare DataFrame
     df = _prepare_chart_dataframe(chart_data)
 
-    # Calculate indicators
-    market_context = format_kr_market_data_for_llm(market_data, df, orderbook)
-    indicators = calculate_kr_technical_indicators(df)
-    enhanced_indicators, detected_signals = _calculate_enhanced_indicators(df)
+    # Calculate indicators (single trip to the compute pool)
+    market_context, indicators, enhanced_indicators, detected_signals = (
+        await get_compute_executor().run_frame(
+            _calculate_technical_bundle, df, market_data, orderbook
+        )
+    )
 
     # Format signals for LLM
     signals_text = _format_detected_signals_text(detected_signals)
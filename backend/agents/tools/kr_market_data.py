@@ -15,6 +15,8 @@ import pandas as pd
 import structlog
 
 from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+from services.account_state import get_account_state_service
+from services.kr_realtime_service import get_running_kr_realtime_service
 
 logger = structlog.get_logger()
 
@@ -28,6 +30,75 @@ def _to_python_float(value, default: float = 0.0) -> float:
     return float(value)
 
 
+def stock_info_to_dict(info) -> dict:
+    """Convert a Kiwoom stock info model to the stock info dict used by agents."""
+    return {
+        "stk_cd": info.stk_cd,
+        "stk_nm": info.stk_nm,
+        "cur_prc": info.cur_prc,
+        "prdy_vrss": info.prdy_vrss,
+        "prdy_ctrt": info.prdy_ctrt,
+        "acml_vol": info.acml_vol,
+        "acml_tr_pbmn": info.acml_tr_pbmn,
+        "strt_prc": info.strt_prc,
+        "high_prc": info.high_prc,
+        "low_prc": info.low_prc,
+        "stk_hgpr": info.stk_hgpr,
+        "stk_lwpr": info.stk_lwpr,
+        "per": info.per,
+        "pbr": info.pbr,
+        "eps": info.eps,
+        "bps": info.bps,
+        "lstg_stqt": info.lstg_stqt,
+        "mrkt_tot_amt": info.mrkt_tot_amt,
+    }
+
+
+def orderbook_to_dict(orderbook, metrics=None) -> dict:
+    """
+    Convert a Kiwoom orderbook model to the orderbook dict used by agents.
+
+    Args:
+        orderbook: Kiwoom Orderbook model
+        metrics: Optional BookMetrics of the streamed book (keys merged in)
+    """
+    result = {
+        "stk_cd": orderbook.stk_cd,
+        "sell_hogas": [
+            {"price": h.price, "quantity": h.quantity}
+            for h in orderbook.sell_hogas
+        ],
+        "buy_hogas": [
+            {"price": h.price, "quantity": h.quantity}
+            for h in orderbook.buy_hogas
+        ],
+        "tot_sell_qty": orderbook.tot_sell_qty,
+        "tot_buy_qty": orderbook.tot_buy_qty,
+        "bid_ask_ratio": (
+            orderbook.tot_buy_qty / orderbook.tot_sell_qty
+            if orderbook.tot_sell_qty > 0
+            else 1.0
+        ),
+    }
+    if metrics is not None:
+        result.update(metrics.to_dict())
+    return result
+
+
+async def load_kr_orderbook(client, stk_cd: str) -> dict:
+    """
+    Orderbook dict for a stock: the streamed L2 book (with book metrics)
+    when the KR realtime service runs, otherwise a REST snapshot.
+    """
+    realtime = get_running_kr_realtime_service()
+    if realtime is not None:
+        orderbook = await realtime.get_orderbook(client, stk_cd)
+        if orderbook is not None:
+            return orderbook_to_dict(orderbook, realtime.get_orderbook_metrics(stk_cd))
+
+    return orderbook_to_dict(await client.get_orderbook(stk_cd))
+
+
 async def get_kr_stock_info(stk_cd: str) -> dict:
     """
     Get Korean stock basic information via Kiwoom API.
@@ -44,26 +115,7 @@ async def get_kr_stock_info(stk_cd: str) -> dict:
 
         logger.info("kr_stock_info_fetched", stk_cd=stk_cd)
 
-        return {
-            "stk_cd": info.stk_cd,
-            "stk_nm": info.stk_nm,
-            "cur_prc": info.cur_prc,
-            "prdy_vrss": info.prdy_vrss,
-            "prdy_ctrt": info.prdy_ctrt,
-            "acml_vol": info.acml_vol,
-            "acml_tr_pbmn": info.acml_tr_pbmn,
-            "strt_prc": info.strt_prc,
-            "high_prc": info.high_prc,
-            "low_prc": info.low_prc,
-            "stk_hgpr": info.stk_hgpr,
-            "stk_lwpr": info.stk_lwpr,
-            "per": info.per,
-            "pbr": info.pbr,
-            "eps": info.eps,
-            "bps": info.bps,
-            "lstg_stqt": info.lstg_stqt,
-            "mrkt_tot_amt": info.mrkt_tot_amt,
-        }
+        return stock_info_to_dict(info)
 
     except Exception as e:
         logger.error("kr_stock_info_error", stk_cd=stk_cd, error=str(e))
@@ -102,28 +154,11 @@ async def get_kr_orderbook(stk_cd: str) -> dict:
     """
     try:
         client = await get_shared_kiwoom_client_async()
-        orderbook = await client.get_orderbook(stk_cd)
+        orderbook = await load_kr_orderbook(client, stk_cd)
 
         logger.info("kr_orderbook_fetched", stk_cd=stk_cd)
 
-        return {
-            "stk_cd": orderbook.stk_cd,
-            "sell_hogas": [
-                {"price": h.price, "quantity": h.quantity}
-                for h in orderbook.sell_hogas
-            ],
-            "buy_hogas": [
-                {"price": h.price, "quantity": h.quantity}
-                for h in orderbook.buy_hogas
-            ],
-            "tot_sell_qty": orderbook.tot_sell_qty,
-            "tot_buy_qty": orderbook.tot_buy_qty,
-            "bid_ask_ratio": (
-                orderbook.tot_buy_qty / orderbook.tot_sell_qty
-                if orderbook.tot_sell_qty > 0
-                else 1.0
-            ),
-        }
+        return orderbook
 
     except Exception as e:
         logger.error("kr_orderbook_error", stk_cd=stk_cd, error=str(e))
@@ -133,6 +168,7 @@ async def get_kr_orderbook(stk_cd: str) -> dict:
 async def get_kr_daily_chart(
     stk_cd: str,
     base_dt: Optional[str] = None,
+    count: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Get daily chart data for a Korean stock.
@@ -140,13 +176,14 @@ async def get_kr_daily_chart(
     Args:
         stk_cd: Stock code
         base_dt: Base date (YYYYMMDD), None for today
+        count: Number of days (paged through next-key), None for one page
 
     Returns:
         DataFrame with OHLCV data
     """
     try:
         client = await get_shared_kiwoom_client_async()
-        df = await client.get_daily_chart_df(stk_cd, base_dt)
+        df = await client.get_daily_chart_df(stk_cd, base_dt, count=count)
 
         logger.info(
             "kr_daily_chart_fetched",
@@ -161,6 +198,39 @@ async def get_kr_daily_chart(
         return _generate_mock_kr_chart(stk_cd)
 
 
+def chart_df_to_records(df: pd.DataFrame) -> list[dict]:
+    """
+    Convert an OHLCV DataFrame to a list of JSON-serializable dicts.
+
+    Vectorized replacement for iterrows() loops. Uses the "date" column
+    when present, otherwise the index.
+
+    Args:
+        df: DataFrame with open/high/low/close/volume columns
+
+    Returns:
+        [{"date": "YYYY-MM-DD", "open": int, ...}, ...]
+    """
+    if df.empty:
+        return []
+
+    dates = df["date"] if "date" in df.columns else df.index.to_series(index=df.index)
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        dates = dates.dt.strftime("%Y-%m-%d")
+    else:
+        dates = dates.astype(str)
+
+    records = pd.DataFrame({
+        "date": dates.to_numpy(),
+        "open": df["open"].to_numpy(dtype="int64"),
+        "high": df["high"].to_numpy(dtype="int64"),
+        "low": df["low"].to_numpy(dtype="int64"),
+        "close": df["close"].to_numpy(dtype="int64"),
+        "volume": df["volume"].to_numpy(dtype="int64"),
+    })
+    return records.to_dict("records")
+
+
 async def get_kr_account_balance() -> dict:
     """
     Get account balance from Kiwoom.
@@ -169,8 +239,7 @@ async def get_kr_account_balance() -> dict:
         Account balance dictionary
     """
     try:
-        client = await get_shared_kiwoom_client_async()
-        balance = await client.get_account_balance()
+        balance = await get_account_state_service().get_snapshot()
 
         return {
             "pchs_amt": balance.pchs_amt,
@@ -376,8 +445,15 @@ def format_kr_market_data_for_llm(
             f"총 매수호가 잔량: {orderbook.get('tot_buy_qty', 0):,}주",
             f"매수/매도 비율: {bid_ask_ratio:.2f}",
             f"수급 판단: {'매수 우위' if bid_ask_ratio > 1.2 else '매도 우위' if bid_ask_ratio < 0.8 else '균형'}",
-            f"",
         ])
+        # Streamed book metrics (services.orderbook), when available
+        if orderbook.get("imbalance") is not None:
+            lines.append(f"상위 {orderbook.get('levels')}호가 잔량 불균형: {orderbook['imbalance']:+.2f}")
+        if orderbook.get("spread") is not None:
+            lines.append(f"스프레드: {orderbook['spread']:,.0f}원 ({orderbook['spread_bps']:.1f}bp)")
+        if orderbook.get("microprice") is not None:
+            lines.append(f"마이크로프라이스: {orderbook['microprice']:,.1f}원")
+        lines.append("")
 
     # Recent price action
     if not df.empty:
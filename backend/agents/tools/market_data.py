@@ -9,9 +9,9 @@ Supports:
 - Local SQLite storage for downloaded data
 """
 
+import asyncio
 import json
 import sqlite3
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -390,8 +390,25 @@ def format_market_data_for_llm(df: pd.DataFrame, ticker: str) -> str:
 # Data Caching System
 # -------------------------------------------
 
+# Cache databases whose schema has already been created in this process
+_initialized_cache_dbs: set[str] = set()
+
+# Column mapping between the SQLite table and the yfinance OHLCV frame
+_CACHE_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+}
+
+
 def _init_cache_db() -> None:
-    """Initialize SQLite cache database."""
+    """Initialize SQLite cache database (schema is created once per process)."""
+    db_key = str(CACHE_DB)
+    if db_key in _initialized_cache_dbs and CACHE_DB.exists():
+        return
+
     conn = sqlite3.connect(CACHE_DB)
     cursor = conn.cursor()
 
@@ -427,49 +444,85 @@ def _init_cache_db() -> None:
 
     conn.commit()
     conn.close()
+    _initialized_cache_dbs.add(db_key)
     logger.debug("cache_db_initialized", db_path=str(CACHE_DB))
 
 
-def save_to_cache(ticker: str, df: pd.DataFrame) -> None:
-    """Save market data to local cache."""
+def _format_cache_dates(index: pd.Index) -> list[str]:
+    """Format a DataFrame index as YYYY-MM-DD strings in one vectorized call."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.strftime("%Y-%m-%d").tolist()
+    return index.astype(str).tolist()
+
+
+def save_to_cache(ticker: str, df: pd.DataFrame) -> int:
+    """
+    Save market data to local cache.
+
+    Rows are upserted in a single executemany() transaction, so existing
+    dates are overwritten and new dates are appended.
+
+    Args:
+        ticker: Stock symbol
+        df: OHLCV DataFrame indexed by date (yfinance format)
+
+    Returns:
+        Number of rows written
+    """
+    if df is None or df.empty:
+        return 0
+
     _init_cache_db()
     conn = sqlite3.connect(CACHE_DB)
 
     try:
-        for idx, row in df.iterrows():
-            date_str = idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx)
-            # Convert all numpy types to Python native types for SQLite
-            conn.execute(
+        # Convert whole columns at once; tolist() yields Python native types for SQLite
+        prices = df[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64)
+        volumes = df["Volume"].fillna(0).to_numpy(dtype=np.int64)
+        rows = zip(
+            [ticker] * len(df),
+            _format_cache_dates(df.index),
+            prices[:, 0].tolist(),
+            prices[:, 1].tolist(),
+            prices[:, 2].tolist(),
+            prices[:, 3].tolist(),
+            volumes.tolist(),
+        )
+
+        with conn:
+            conn.executemany(
                 """
-                INSERT OR REPLACE INTO price_history
+                INSERT INTO price_history
                 (ticker, date, open, high, low, close, volume)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ticker, date) DO UPDATE SET
+                    open = excluded.open,
+                    high = excluded.high,
+                    low = excluded.low,
+                    close = excluded.close,
+                    volume = excluded.volume
                 """,
-                (
-                    ticker,
-                    date_str,
-                    float(row["Open"]),
-                    float(row["High"]),
-                    float(row["Low"]),
-                    float(row["Close"]),
-                    int(row["Volume"]),
-                ),
+                rows,
             )
 
-        # Update metadata
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO cache_metadata (ticker, last_updated, period)
-            VALUES (?, ?, ?)
-            """,
-            (ticker, datetime.now().isoformat(), f"{len(df)} days"),
-        )
+            # Update metadata
+            total_rows = conn.execute(
+                "SELECT COUNT(*) FROM price_history WHERE ticker = ?", (ticker,)
+            ).fetchone()[0]
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO cache_metadata (ticker, last_updated, period)
+                VALUES (?, ?, ?)
+                """,
+                (ticker, datetime.now().isoformat(), f"{total_rows} days"),
+            )
 
-        conn.commit()
         logger.info("cache_saved", ticker=ticker, rows=len(df))
+        return len(df)
 
     except Exception as e:
         logger.error("cache_save_error", ticker=ticker, error=str(e))
+        return 0
     finally:
         conn.close()
 
@@ -488,16 +541,19 @@ def load_from_cache(ticker: str, days: int = 90) -> Optional[pd.DataFrame]:
             ORDER BY date DESC
             LIMIT ?
         """
-        df = pd.read_sql_query(query, conn, params=(ticker, days))
+        df = pd.read_sql_query(
+            query,
+            conn,
+            params=(ticker, days),
+            index_col="date",
+            parse_dates={"date": "%Y-%m-%d"},
+        )
 
         if df.empty:
             return None
 
-        # Convert to standard OHLCV format
-        df["date"] = pd.to_datetime(df["date"])
-        df.set_index("date", inplace=True)
-        df.columns = ["Open", "High", "Low", "Close", "Volume"]
-        df.sort_index(inplace=True)
+        # Convert to standard OHLCV format (rows come newest first)
+        df = df.rename(columns=_CACHE_COLUMNS).iloc[::-1]
 
         logger.info("cache_loaded", ticker=ticker, rows=len(df))
         return df
@@ -509,6 +565,23 @@ def load_from_cache(ticker: str, days: int = 90) -> Optional[pd.DataFrame]:
         conn.close()
 
 
+def get_latest_cached_date(ticker: str) -> Optional[str]:
+    """Get the newest cached date (YYYY-MM-DD) for a ticker, or None."""
+    if not CACHE_DB.exists():
+        return None
+
+    conn = sqlite3.connect(CACHE_DB)
+    try:
+        row = conn.execute(
+            "SELECT MAX(date) FROM price_history WHERE ticker = ?", (ticker,)
+        ).fetchone()
+        return row[0] if row else None
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        conn.close()
+
+
 def get_cached_tickers() -> list[str]:
     """Get list of tickers in cache."""
     if not CACHE_DB.exists():
@@ -530,6 +603,7 @@ async def download_historical_data(
     tickers: list[str],
     period: str = "2y",
     save_to_db: bool = True,
+    incremental: bool = False,
 ) -> dict[str, pd.DataFrame]:
     """
     Download historical data for multiple tickers.
@@ -543,21 +617,44 @@ async def download_historical_data(
         tickers: List of stock symbols
         period: Time period to download (1y, 2y, 5y, max)
         save_to_db: Whether to save to SQLite cache
+        incremental: Only fetch dates after the newest cached row.
+            Tickers without cached data are downloaded for the full period,
+            tickers that are already up to date are skipped.
 
     Returns:
-        Dictionary mapping ticker to DataFrame
+        Dictionary mapping ticker to the downloaded DataFrame
+        (only the new rows in incremental mode)
     """
     import yfinance as yf
 
     results = {}
+    today = datetime.now().strftime("%Y-%m-%d")
 
-    logger.info("download_started", tickers=tickers, period=period)
+    logger.info(
+        "download_started",
+        tickers=tickers,
+        period=period,
+        incremental=incremental,
+    )
 
     for ticker in tickers:
         try:
-            logger.info("downloading_ticker", ticker=ticker)
+            latest = get_latest_cached_date(ticker) if incremental else None
+            if latest is not None and latest >= today:
+                logger.debug("ticker_up_to_date", ticker=ticker, latest=latest)
+                continue
+
             stock = yf.Ticker(ticker)
-            df = stock.history(period=period, interval="1d")
+            if latest is not None:
+                start = (datetime.strptime(latest, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+                logger.info("downloading_ticker", ticker=ticker, start=start)
+                df = await asyncio.to_thread(stock.history, start=start, interval="1d")
+                if not df.empty:
+                    # yfinance may echo back the last cached session
+                    df = df[np.array(_format_cache_dates(df.index)) > latest]
+            else:
+                logger.info("downloading_ticker", ticker=ticker)
+                df = await asyncio.to_thread(stock.history, period=period, interval="1d")
 
             if not df.empty:
                 results[ticker] = df
@@ -572,11 +669,13 @@ async def download_historical_data(
                     start=df.index.min().strftime("%Y-%m-%d"),
                     end=df.index.max().strftime("%Y-%m-%d"),
                 )
+            elif latest is not None:
+                logger.debug("ticker_no_new_rows", ticker=ticker, latest=latest)
             else:
                 logger.warning("ticker_empty", ticker=ticker)
 
             # Rate limiting to avoid API throttling
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
 
         except Exception as e:
             logger.error("download_error", ticker=ticker, error=str(e))
@@ -602,9 +701,12 @@ POPULAR_TICKERS = [
 ]
 
 
-async def download_popular_tickers(period: str = "2y") -> dict[str, pd.DataFrame]:
+async def download_popular_tickers(
+    period: str = "2y",
+    incremental: bool = False,
+) -> dict[str, pd.DataFrame]:
     """Download historical data for popular tickers."""
-    return await download_historical_data(POPULAR_TICKERS, period=period)
+    return await download_historical_data(POPULAR_TICKERS, period=period, incremental=incremental)
 
 
 def export_cache_to_csv(output_dir: Optional[Path] = None) -> None:
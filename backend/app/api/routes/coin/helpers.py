@@ -18,6 +18,7 @@ from app.api.schemas.coin import (
     OrderResponse,
     TickerResponse,
 )
+from app.core.upbit_singleton import get_shared_upbit_client
 from services.upbit import UpbitClient
 from .constants import coin_sessions
 
@@ -28,11 +29,13 @@ from .constants import coin_sessions
 
 
 def get_upbit_client() -> UpbitClient:
-    """Get Upbit client instance using runtime keys or environment variables."""
-    return UpbitClient(
-        access_key=get_upbit_access_key(),
-        secret_key=get_upbit_secret_key(),
-    )
+    """
+    Get the shared Upbit client (runtime keys or environment variables).
+
+    The client is process-wide (pooled connections, rate limiter, cache);
+    leaving an `async with` block does not close it.
+    """
+    return get_shared_upbit_client()
 
 
 def get_coin_session(session_id: str) -> dict:
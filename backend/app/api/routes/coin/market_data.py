@@ -27,6 +27,10 @@ from app.api.schemas.coin import (
     TickerListResponse,
     TickerResponse,
 )
+from services.realtime_service import get_running_realtime_service
+from services.upbit import get_market_index
+from services.upbit.candle_builder import CANDLE_INTERVALS
+from services.upbit.history import fetch_candle_history
 from .constants import (
     CACHE_TTL_SECONDS,
     get_cached_markets,
@@ -81,6 +85,8 @@ async def get_markets(
     async with get_upbit_client() as client:
         try:
             markets = await client.get_markets(is_details=True)
+            # Share the fresh list with the analysis market index
+            get_market_index().load(markets)
 
             new_cached = [
                 MarketInfo(
@@ -239,17 +245,21 @@ async def get_candles(
     count: int = Query(
         default=100,
         ge=1,
-        le=200,
-        description="Number of candles",
+        le=1000,
+        description="Number of candles (1w/1M: max 200)",
     ),
 ):
     """
     Get candle (OHLCV) data for a market.
 
+    Served from candles built from the trade stream when the realtime
+    service is running (1s to 1d); otherwise, and for 1w/1M, from REST.
+    More than 200 candles are fetched as concurrent REST pages.
+
     Args:
         market: Market code
         interval: Candle interval
-        count: Number of candles (max 200)
+        count: Number of candles (max 1000; 200 for 1w/1M)
 
     Returns:
         List of candles (newest first)
@@ -278,22 +288,18 @@ async def get_candles(
             detail=f"Invalid interval: {interval}. Supported: {list(interval_map.keys())}",
         )
 
-    candle_type, unit = interval_map[interval]
+    candle_type, _ = interval_map[interval]
 
     async with get_upbit_client() as client:
         try:
-            if candle_type == "seconds":
-                candles = await client.get_candles_seconds(market=market, count=count)
-            elif candle_type == "minutes":
-                candles = await client.get_candles_minutes(
-                    market=market, unit=unit, count=count
-                )
-            elif candle_type == "days":
-                candles = await client.get_candles_days(market=market, count=count)
-            elif candle_type == "weeks":
-                candles = await client.get_candles_weeks(market=market, count=count)
-            else:  # months
-                candles = await client.get_candles_months(market=market, count=count)
+            # Candles built from the trade stream, if the realtime service runs
+            realtime = get_running_realtime_service()
+            candles = None
+            if realtime is not None:
+                candles = await realtime.get_candles(client, market, interval, count)
+
+            if candles is None:
+                candles = await _fetch_candles(client, market, interval, candle_type, count)
 
             return CandleListResponse(
                 market=market,
@@ -321,6 +327,21 @@ async def get_candles(
             )
 
 
+async def _fetch_candles(
+    client,
+    market: str,
+    interval: str,
+    candle_type: str,
+    count: int,
+):
+    """Fetch candles from REST (paged for 1s to 1d)."""
+    if interval in CANDLE_INTERVALS:
+        return await fetch_candle_history(client, market, interval, count)
+    if candle_type == "weeks":
+        return await client.get_candles_weeks(market=market, count=min(count, 200))
+    return await client.get_candles_months(market=market, count=min(count, 200))
+
+
 @router.get("/orderbook/{market}", response_model=OrderbookResponse)
 async def get_orderbook(market: str):
     """
@@ -330,20 +351,29 @@ async def get_orderbook(market: str):
         market: Market code
 
     Returns:
-        Bid/ask orderbook with totals
+        Bid/ask orderbook with totals (and book metrics when streamed)
     """
     market = market.upper()
 
     async with get_upbit_client() as client:
         try:
-            orderbooks = await client.get_orderbook([market])
-            if not orderbooks:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Market {market} not found",
-                )
+            # Streamed L2 book, if the realtime service runs
+            realtime = get_running_realtime_service()
+            ob = None
+            metrics = None
+            if realtime is not None:
+                ob = await realtime.get_orderbook(client, market)
+                metrics = realtime.get_orderbook_metrics(market)
+
+            if ob is None:
+                orderbooks = await client.get_orderbook([market])
+                if not orderbooks:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail=f"Market {market} not found",
+                    )
+                ob = orderbooks[0]
 
-            ob = orderbooks[0]
             bid_ask_ratio = (
                 ob.total_bid_size / ob.total_ask_size if ob.total_ask_size > 0 else 0
             )
@@ -361,6 +391,9 @@ async def get_orderbook(market: str):
                     OrderbookUnit(price=u.bid_price, size=u.bid_size)
                     for u in ob.orderbook_units
                 ],
+                spread=metrics.spread if metrics else None,
+                microprice=metrics.microprice if metrics else None,
+                imbalance=metrics.imbalance if metrics else None,
                 timestamp=datetime.now(timezone.utc),
             )
 
@@ -16,9 +16,9 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from agents.tools.kr_market_data import get_kr_daily_chart
+from services.compute import calculate_indicators_async, get_compute_executor
 from services.technical_indicators import (
     Signal,
-    TechnicalIndicators,
     calculate_indicators_for_ticker,
 )
 
@@ -144,14 +144,14 @@ def _normalize_signal(signal_value: Any) -> str:
 @router.get("/kr/{stk_cd}", response_model=IndicatorsResponse)
 async def get_kr_stock_indicators(
     stk_cd: str,
-    period: int = Query(default=100, ge=20, le=365, description="Number of days for calculation"),
+    period: int = Query(default=100, ge=20, le=1000, description="Number of days for calculation"),
 ):
     """
     Get technical indicators for a Korean stock.
 
     Args:
         stk_cd: Stock code (e.g., "005930" for Samsung Electronics)
-        period: Number of days to fetch (default: 100, min: 20, max: 365)
+        period: Number of days to fetch (default: 100, min: 20, max: 1000)
 
     Returns:
         Complete technical indicators including RSI, MACD, Bollinger Bands, etc.
@@ -159,8 +159,8 @@ async def get_kr_stock_indicators(
     try:
         logger.info("fetching_kr_indicators", stk_cd=stk_cd, period=period)
 
-        # Fetch price data
-        df = await get_kr_daily_chart(stk_cd)
+        # Fetch price data (paged when the period exceeds one chart page)
+        df = await get_kr_daily_chart(stk_cd, count=period)
 
         if df.empty:
             raise HTTPException(status_code=404, detail=f"No data found for stock: {stk_cd}")
@@ -170,7 +170,7 @@ async def get_kr_stock_indicators(
             df = df.tail(period)
 
         # Calculate indicators
-        result = calculate_indicators_for_ticker(df)
+        result = await get_compute_executor().run_frame(calculate_indicators_for_ticker, df)
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -225,8 +225,7 @@ async def get_kr_stock_indicators_summary(stk_cd: str):
             raise HTTPException(status_code=404, detail=f"No data found for stock: {stk_cd}")
 
         # Calculate indicators
-        indicators = TechnicalIndicators(df)
-        result = indicators.calculate_all()
+        result = await calculate_indicators_async(df)
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
@@ -283,7 +282,7 @@ async def get_kr_stock_indicators_summary(stk_cd: str):
 @router.get("/coin/{market}")
 async def get_coin_indicators(
     market: str,
-    period: int = Query(default=100, ge=20, le=365, description="Number of days for calculation"),
+    period: int = Query(default=100, ge=20, le=1000, description="Number of days for calculation"),
 ):
     """
     Get technical indicators for a cryptocurrency.
@@ -296,14 +295,21 @@ async def get_coin_indicators(
         Complete technical indicators
     """
     # Import here to avoid circular dependency
-    from services.upbit import UpbitClient
+    from app.core.upbit_singleton import get_shared_upbit_client
+    from services.realtime_service import get_running_realtime_service
+    from services.upbit.history import fetch_candle_history
 
     try:
         logger.info("fetching_coin_indicators", market=market, period=period)
 
-        # Fetch price data from Upbit
-        client = UpbitClient()
-        candles = await client.get_candles_days(market, count=min(period, 200))
+        # Daily candles built from the trade stream, else paged REST (shared, pooled client)
+        client = get_shared_upbit_client()
+        realtime = get_running_realtime_service()
+        candles = None
+        if realtime is not None:
+            candles = await realtime.get_candles(client, market.upper(), "1d", period)
+        if candles is None:
+            candles = await fetch_candle_history(client, market, "1d", period)
 
         if not candles:
             raise HTTPException(status_code=404, detail=f"No data found for market: {market}")
@@ -324,7 +330,7 @@ async def get_coin_indicators(
         df = df.iloc[::-1].reset_index(drop=True)
 
         # Calculate indicators
-        result = calculate_indicators_for_ticker(df)
+        result = await get_compute_executor().run_frame(calculate_indicators_for_ticker, df)
 
         if "error" in result:
             raise HTTPException(status_code=400, detail=result["error"])
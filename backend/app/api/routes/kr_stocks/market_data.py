@@ -26,6 +26,7 @@ from app.api.schemas.kr_stocks import (
     KRStockTickerResponse,
 )
 from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+from services.kr_realtime_service import get_running_kr_realtime_service
 from .constants import (
     CACHE_TTL_SECONDS,
     KOREAN_STOCKS,
@@ -407,7 +408,7 @@ async def get_orderbook(stk_cd: str):
         stk_cd: Stock code
 
     Returns:
-        Bid/ask orderbook with totals
+        Bid/ask orderbook with totals (and book metrics when streamed)
     """
     if len(stk_cd) != 6 or not stk_cd.isdigit():
         raise HTTPException(
@@ -418,9 +419,18 @@ async def get_orderbook(stk_cd: str):
     client = await get_shared_kiwoom_client_async()
 
     try:
-        orderbook = await client.get_orderbook(stk_cd)
-
-        if not orderbook:
+        # Streamed L2 book, if the KR realtime service runs
+        realtime = get_running_kr_realtime_service()
+        orderbook = None
+        metrics = None
+        if realtime is not None:
+            orderbook = await realtime.get_orderbook(client, stk_cd)
+            metrics = realtime.get_orderbook_metrics(stk_cd)
+
+        if orderbook is None:
+            orderbook = await client.get_orderbook(stk_cd)
+
+        if not orderbook.sell_hogas and not orderbook.buy_hogas:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No orderbook for stock {stk_cd}",
@@ -431,21 +441,13 @@ async def get_orderbook(stk_cd: str):
         stk_nm = info.stk_nm if info else None
 
         asks = [
-            KRStockOrderbookUnit(
-                price=ask.price,
-                volume=ask.volume,
-                change_rate=ask.change_rate if hasattr(ask, "change_rate") else None,
-            )
-            for ask in orderbook.asks
+            KRStockOrderbookUnit(price=ask.price, volume=ask.quantity)
+            for ask in orderbook.sell_hogas
         ]
 
         bids = [
-            KRStockOrderbookUnit(
-                price=bid.price,
-                volume=bid.volume,
-                change_rate=bid.change_rate if hasattr(bid, "change_rate") else None,
-            )
-            for bid in orderbook.bids
+            KRStockOrderbookUnit(price=bid.price, volume=bid.quantity)
+            for bid in orderbook.buy_hogas
         ]
 
         return KRStockOrderbookResponse(
@@ -453,9 +455,12 @@ async def get_orderbook(stk_cd: str):
             stk_nm=stk_nm,
             asks=asks,
             bids=bids,
-            total_ask_volume=orderbook.total_ask_volume,
-            total_bid_volume=orderbook.total_bid_volume,
+            total_ask_volume=orderbook.tot_sell_qty,
+            total_bid_volume=orderbook.tot_buy_qty,
             bid_ask_ratio=orderbook.bid_ask_ratio,
+            spread=metrics.spread if metrics else None,
+            microprice=metrics.microprice if metrics else None,
+            imbalance=metrics.imbalance if metrics else None,
             timestamp=datetime.now(timezone.utc),
         )
 
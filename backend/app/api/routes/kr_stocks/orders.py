@@ -26,6 +26,7 @@ from app.api.schemas.kr_stocks import (
 )
 from app.config import settings
 from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+from services.account_state import get_account_state_service
 from .helpers import check_kiwoom_api_keys
 
 logger = structlog.get_logger()
@@ -50,8 +51,8 @@ async def get_accounts():
         # Get cash balance
         cash_balance = await client.get_cash_balance()
 
-        # Get account balance (holdings)
-        account_balance = await client.get_account_balance()
+        # Holdings from the shared, stream-fed account state
+        account_balance = await get_account_state_service().get_snapshot()
 
         # Map CashBalance model attributes to schema
         cash = KRStockCashBalance(
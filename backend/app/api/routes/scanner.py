@@ -31,6 +31,16 @@ class StartScanRequest(BaseModel):
     custom_stocks: Optional[List[tuple]] = None  # [(stk_cd, stk_nm), ...]
     use_llm: bool = False  # Use LLM for analysis (slower but more accurate)
     auto_gpu_scaling: bool = True  # Automatically adjust concurrency based on GPU memory
+    incremental: bool = False  # Reuse previous results for stocks that barely moved
+    price_threshold_pct: Optional[float] = None  # Incremental price threshold (default 1.0%)
+    volume_threshold_pct: Optional[float] = None  # Incremental volume threshold (default 20.0%)
+
+
+class ResumeScanRequest(BaseModel):
+    """Request to resume an interrupted scan session"""
+    session_id: Optional[str] = None  # None = latest interrupted session
+    notify_progress: bool = True
+    auto_gpu_scaling: bool = True
 
 
 class ScanProgressResponse(BaseModel):
@@ -47,6 +57,7 @@ class ScanProgressResponse(BaseModel):
     hold_count: int
     watch_count: int
     avoid_count: int
+    reused_count: int = 0
     started_at: Optional[str] = None
     estimated_completion: Optional[str] = None
     completed_at: Optional[str] = None
@@ -90,6 +101,8 @@ class ScanSessionItem(BaseModel):
     hold_count: int = 0
     watch_count: int = 0
     avoid_count: int = 0
+    reused_count: int = 0
+    checkpoint_index: int = 0
     status: str = ""
 
 
@@ -127,24 +140,27 @@ async def start_scan(request: Optional[StartScanRequest] = None):
             )
 
         # Extract parameters with defaults
-        use_llm = request.use_llm if request else False
-        auto_gpu_scaling = request.auto_gpu_scaling if request else True
+        request = request or StartScanRequest()
 
         # Start scan
         await scanner.start_scan(
-            stock_list=request.custom_stocks if request else None,
-            notify_progress=request.notify_progress if request else True,
-            use_llm=use_llm,
-            auto_gpu_scaling=auto_gpu_scaling,
+            stock_list=request.custom_stocks,
+            notify_progress=request.notify_progress,
+            use_llm=request.use_llm,
+            auto_gpu_scaling=request.auto_gpu_scaling,
+            incremental=request.incremental,
+            price_threshold_pct=request.price_threshold_pct,
+            volume_threshold_pct=request.volume_threshold_pct,
         )
 
-        mode = "LLM 배치 분석" if use_llm else "기술적 지표 분석"
+        mode = "LLM 배치 분석" if request.use_llm else "기술적 지표 분석"
         return {
             "status": "started",
             "message": f"Background scan started ({mode})",
             "total_stocks": scanner.get_progress().total_stocks,
-            "mode": "llm" if use_llm else "quick",
-            "auto_gpu_scaling": auto_gpu_scaling,
+            "mode": "llm" if request.use_llm else "quick",
+            "auto_gpu_scaling": request.auto_gpu_scaling,
+            "incremental": request.incremental,
         }
 
     except HTTPException:
@@ -154,6 +170,53 @@ async def start_scan(request: Optional[StartScanRequest] = None):
         raise HTTPException(500, f"Failed to start scan: {e}")
 
 
+@router.post("/resume-interrupted")
+async def resume_interrupted_scan(request: Optional[ResumeScanRequest] = None):
+    """
+    Resume a scan session that was interrupted (restart or stop).
+
+    Continues from the session checkpoint instead of rescanning
+    stocks that were already analyzed.
+    """
+    try:
+        scanner = await get_background_scanner()
+
+        progress = scanner.get_progress()
+        if progress.status == ScanStatus.RUNNING:
+            raise HTTPException(
+                status_code=400,
+                detail="Scanner is already running"
+            )
+
+        request = request or ResumeScanRequest()
+        session_id = await scanner.resume_interrupted_scan(
+            session_id=request.session_id,
+            notify_progress=request.notify_progress,
+            auto_gpu_scaling=request.auto_gpu_scaling,
+        )
+
+        if session_id is None:
+            raise HTTPException(
+                status_code=404,
+                detail="No interrupted scan session to resume"
+            )
+
+        progress = scanner.get_progress()
+        return {
+            "status": "resumed",
+            "message": f"Background scan resumed (session {session_id})",
+            "session_id": session_id,
+            "total_stocks": progress.total_stocks,
+            "completed": progress.completed,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("[Scanner API] Resume interrupted failed")
+        raise HTTPException(500, f"Failed to resume interrupted scan: {e}")
+
+
 @router.post("/pause")
 async def pause_scan():
     """Pause the background scan."""
@@ -224,6 +287,7 @@ async def get_progress():
         hold_count=progress.hold_count,
         watch_count=progress.watch_count,
         avoid_count=progress.avoid_count,
+        reused_count=progress.reused_count,
         started_at=progress.started_at.isoformat() if progress.started_at else None,
         estimated_completion=progress.estimated_completion.isoformat() if progress.estimated_completion else None,
         completed_at=progress.completed_at.isoformat() if progress.completed_at else None,
@@ -426,6 +490,8 @@ async def get_sessions(limit: int = 10):
                     hold_count=s.get("hold_count") or 0,
                     watch_count=s.get("watch_count") or 0,
                     avoid_count=s.get("avoid_count") or 0,
+                    reused_count=s.get("reused_count") or 0,
+                    checkpoint_index=s.get("checkpoint_index") or 0,
                     status=s.get("status") or "",
                 )
                 for s in sessions
@@ -436,3 +502,132 @@ async def get_sessions(limit: int = 10):
     except Exception as e:
         logger.exception("[Scanner API] Sessions query failed")
         raise HTTPException(500, f"Failed to query sessions: {e}")
+
+
+# -------------------------------------------
+# Archive (cross-session) Endpoints
+# -------------------------------------------
+
+@router.get("/archive/sessions")
+async def get_archived_sessions():
+    """List sessions in the columnar archive (newest first)."""
+    try:
+        scanner = await get_background_scanner()
+        archive = await scanner.get_archive()
+        sessions = await archive.get_sessions()
+
+        return {"sessions": sessions, "count": len(sessions)}
+
+    except Exception as e:
+        logger.exception("[Scanner API] Archive sessions query failed")
+        raise HTTPException(500, f"Failed to query archived sessions: {e}")
+
+
+@router.get("/archive/history/{stk_cd}")
+async def get_ticker_history(stk_cd: str, limit: int = 30):
+    """
+    Get action/confidence history of one stock across sessions.
+
+    Args:
+        stk_cd: Stock code
+        limit: Maximum sessions to return (newest first)
+    """
+    try:
+        scanner = await get_background_scanner()
+        archive = await scanner.get_archive()
+        history = await archive.get_ticker_history(stk_cd, limit=limit)
+
+        return {"stk_cd": stk_cd, "history": history, "count": len(history)}
+
+    except Exception as e:
+        logger.exception("[Scanner API] Ticker history query failed")
+        raise HTTPException(500, f"Failed to query ticker history: {e}")
+
+
+@router.get("/archive/transitions")
+async def get_action_transitions(
+    from_session: Optional[str] = None,
+    to_session: Optional[str] = None,
+    from_action: Optional[str] = None,
+    to_action: Optional[str] = None,
+):
+    """
+    Get stocks whose action changed between two sessions.
+
+    Args:
+        from_session: Earlier session (None = second most recent)
+        to_session: Later session (None = most recent)
+        from_action: Only transitions from this action
+        to_action: Only transitions to this action (e.g. BUY)
+    """
+    try:
+        scanner = await get_background_scanner()
+        archive = await scanner.get_archive()
+        transitions = await archive.get_action_transitions(
+            from_session=from_session,
+            to_session=to_session,
+            from_action=from_action,
+            to_action=to_action,
+        )
+
+        return {"transitions": transitions, "count": len(transitions)}
+
+    except Exception as e:
+        logger.exception("[Scanner API] Action transitions query failed")
+        raise HTTPException(500, f"Failed to query action transitions: {e}")
+
+
+@router.get("/archive/streaks")
+async def get_action_streaks(action: str = "BUY", sessions: int = 3):
+    """
+    Get stocks that had the same action in each of the last N sessions.
+
+    Args:
+        action: Action (BUY, SELL, HOLD, WATCH, AVOID)
+        sessions: Number of consecutive recent sessions
+    """
+    try:
+        scanner = await get_background_scanner()
+        archive = await scanner.get_archive()
+        stocks = await archive.get_action_streaks(action, sessions=sessions)
+
+        return {
+            "action": action.upper(),
+            "sessions": sessions,
+            "stocks": stocks,
+            "count": len(stocks),
+        }
+
+    except Exception as e:
+        logger.exception("[Scanner API] Action streaks query failed")
+        raise HTTPException(500, f"Failed to query action streaks: {e}")
+
+
+@router.get("/archive/top")
+async def get_top_by_confidence(
+    n: int = 20,
+    session_id: Optional[str] = None,
+    action: Optional[str] = None,
+):
+    """
+    Get the highest-confidence results of a session.
+
+    Args:
+        n: Number of results
+        session_id: Session (None = most recent archived session)
+        action: Filter by action
+    """
+    try:
+        scanner = await get_background_scanner()
+        archive = await scanner.get_archive()
+        stocks = await archive.get_top_by_confidence(
+            n=n,
+            session_id=session_id,
+            action=action,
+        )
+
+        return {"stocks": stocks, "count": len(stocks), "session_id": session_id}
+
+    except Exception as e:
+        logger.exception("[Scanner API] Top results query failed")
+        raise HTTPException(500, f"Failed to query top results: {e}")
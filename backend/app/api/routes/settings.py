@@ -164,7 +164,11 @@ async def validate_upbit_api_keys():
         )
 
     try:
-        async with UpbitClient(access_key=access_key, secret_key=secret_key) as client:
+        async with UpbitClient(
+            access_key=access_key,
+            secret_key=secret_key,
+            base_url=settings.UPBIT_BASE_URL,
+        ) as client:
             accounts = await client.get_accounts()
 
             # Update validation status
@@ -320,6 +324,7 @@ async def validate_kiwoom_api_keys():
             app_key=app_key,
             secret_key=secret_key,
             is_mock=get_kiwoom_is_mock(),
+            base_url=settings.KIWOOM_BASE_URL,
         ) as client:
             # Try to get account balance to validate
             await client.get_cash_balance()
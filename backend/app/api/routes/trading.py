@@ -4,11 +4,14 @@ Trading API Routes
 Provides endpoints for auto-trading system control and monitoring.
 """
 
+import asyncio
 import logging
-from typing import Optional, List
+import math
+import uuid
+from typing import Any, Dict, Optional, List, Union
 
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from pydantic import BaseModel, Field, ValidationError
 
 from services.trading import (
     TradingMode,
@@ -27,7 +30,17 @@ from services.trading import (
     PositionSizingRules,
     get_strategy_preset,
     get_all_presets,
+    # Optimizer
+    OBJECTIVES,
+    BarPanel,
+    ParameterOptimizer,
+    apply_param_set,
+    get_optimization_store,
+    grid_samples,
+    random_samples,
 )
+from services.trading.optimizer import RISK_PREFIX
+from app.config import settings
 from app.dependencies import get_trading_coordinator
 
 logger = logging.getLogger(__name__)
@@ -775,6 +788,244 @@ async def apply_preset(
         raise HTTPException(404, f"Preset '{preset_name}' not found")
 
 
+# -------------------------------------------
+# Parameter Optimizer Endpoints
+# -------------------------------------------
+
+class OptimizationRequest(BaseModel):
+    """
+    Request to optimize risk/strategy parameters on historical bars.
+
+    Parameter paths are TradingStrategy dotted paths
+    ("exit_conditions.stop_loss_pct") or "risk.<field>" for RiskParameters.
+    Give either a grid, or ranges/choices to sample randomly.
+    """
+    stk_codes: List[str] = Field(..., min_length=1, max_length=500)
+    days: int = Field(default=500, ge=60, le=2500)
+    preset: Optional[str] = None  # Base strategy (default: current strategy)
+    grid: Optional[Dict[str, List[Any]]] = None
+    ranges: Optional[Dict[str, List[Union[int, float]]]] = None  # path -> [low, high]
+    choices: Optional[Dict[str, List[Any]]] = None
+    samples: int = Field(default=200, ge=1, le=settings.OPTIMIZER_MAX_SAMPLES)
+    seed: Optional[int] = None
+    objective: str = "sharpe"
+    min_trades: int = Field(default=5, ge=0)
+    name: Optional[str] = None
+
+
+class ApplyOptimizationRequest(BaseModel):
+    """Request to apply an optimization result (default: the run's best)"""
+    param_key: Optional[str] = None
+
+
+async def _load_bar_panel(stk_codes: List[str], days: int) -> BarPanel:
+    """Adjusted daily bars of the given stocks from Kiwoom."""
+    from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+
+    client = await get_shared_kiwoom_client_async()
+    frames = await asyncio.gather(
+        *(client.get_daily_chart_df(code, upd_stkpc_tp="1", count=days) for code in stk_codes),
+        return_exceptions=True,
+    )
+
+    bars = {}
+    failed = []
+    for code, df in zip(stk_codes, frames):
+        if isinstance(df, Exception):
+            failed.append(code)
+            logger.warning(f"[Optimizer API] Daily bars of {code} failed: {df}")
+        elif not df.empty:
+            bars[code] = df
+    if failed:
+        logger.warning(f"[Optimizer API] Skipped {len(failed)} of {len(stk_codes)} stocks without bars")
+    if not bars:
+        raise ValueError("No daily bars for the requested stocks")
+    return BarPanel.from_frames(bars)
+
+
+async def _run_optimization(
+    run_id: str,
+    request: OptimizationRequest,
+    strategy: TradingStrategy,
+    risk_params: RiskParameters,
+    samples: List[dict],
+):
+    """Load bars and evaluate the samples (background task)."""
+    store = get_optimization_store()
+    try:
+        panel = await _load_bar_panel(request.stk_codes, request.days)
+        optimizer = ParameterOptimizer(
+            panel,
+            strategy,
+            risk_params=risk_params,
+            store=store,
+            objective=request.objective,
+            min_trades=request.min_trades,
+            max_workers=settings.OPTIMIZER_MAX_WORKERS,
+        )
+        run = await asyncio.to_thread(optimizer.run, samples, request.name, run_id)
+        best = run.best
+        logger.info(
+            f"[Optimizer API] Run {run_id} completed: "
+            f"best {request.objective}={best.score if best else None}"
+        )
+    except Exception as e:
+        logger.error(f"[Optimizer API] Run {run_id} failed: {e}")
+        store.update_run(run_id, status="failed", error=str(e))
+
+
+@router.post("/optimizer/runs")
+async def start_optimization(
+    request: OptimizationRequest,
+    background_tasks: BackgroundTasks,
+    coordinator=Depends(get_trading_coordinator),
+):
+    """
+    Start a parameter optimization run.
+
+    Bars are loaded and the samples evaluated in the background; poll
+    GET /optimizer/runs/{run_id} for the results.
+    """
+    if request.objective not in OBJECTIVES:
+        raise HTTPException(400, f"Unknown objective '{request.objective}'")
+
+    if request.preset:
+        try:
+            strategy = get_strategy_preset(StrategyPreset(request.preset))
+        except ValueError:
+            raise HTTPException(404, f"Preset '{request.preset}' not found")
+    else:
+        strategy = coordinator.get_strategy() or TradingStrategy()
+    risk_params = coordinator.risk_params.model_copy()
+
+    try:
+        if request.grid:
+            if request.ranges or request.choices:
+                raise ValueError("Give either a grid or ranges/choices")
+            # Size the grid before building every combination
+            combinations = math.prod(len(values) for values in request.grid.values())
+            if combinations > settings.OPTIMIZER_MAX_SAMPLES:
+                raise ValueError(
+                    f"{combinations} grid combinations exceed the limit of {settings.OPTIMIZER_MAX_SAMPLES}"
+                )
+            samples = grid_samples(request.grid)
+        elif request.ranges or request.choices:
+            space = {path: tuple(bounds) for path, bounds in (request.ranges or {}).items()}
+            space.update(request.choices or {})
+            samples = random_samples(space, request.samples, seed=request.seed)
+        else:
+            raise ValueError("Give a grid or ranges/choices to sample")
+
+        if len(samples) > settings.OPTIMIZER_MAX_SAMPLES:
+            raise ValueError(f"{len(samples)} samples exceed the limit of {settings.OPTIMIZER_MAX_SAMPLES}")
+        for params in samples:
+            apply_param_set(strategy, risk_params, params)
+    except (KeyError, ValueError, ValidationError) as e:
+        # pydantic's ValidationError is a ValueError
+        raise HTTPException(400, f"Invalid parameters: {e}")
+
+    run_id = uuid.uuid4().hex
+    get_optimization_store().create_run(
+        run_id,
+        request.objective,
+        name=request.name,
+        strategy=strategy.model_dump(mode="json"),
+        risk_params=risk_params.model_dump(mode="json"),
+    )
+    background_tasks.add_task(_run_optimization, run_id, request, strategy, risk_params, samples)
+
+    logger.info(f"[Optimizer API] Started run {run_id}: {len(samples)} samples, {len(request.stk_codes)} stocks")
+
+    return {
+        "run_id": run_id,
+        "status": "running",
+        "samples": len(samples),
+    }
+
+
+@router.get("/optimizer/runs")
+async def list_optimization_runs(limit: int = 20):
+    """List recent optimization runs."""
+    return {"runs": get_optimization_store().list_runs(limit=limit)}
+
+
+@router.get("/optimizer/runs/{run_id}")
+async def get_optimization_run(
+    run_id: str,
+    order_by: str = "score",
+    descending: bool = True,
+    min_trades: int = 0,
+    limit: int = 20,
+):
+    """Get a run with its results, ordered by objective score or a metric."""
+    store = get_optimization_store()
+    run = store.get_run(run_id)
+    if run is None:
+        raise HTTPException(404, f"Optimization run '{run_id}' not found")
+
+    try:
+        results = store.get_results(
+            run_id, order_by=order_by, descending=descending, min_trades=min_trades, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+    return {"run": run, "results": results}
+
+
+@router.post("/optimizer/runs/{run_id}/apply")
+async def apply_optimization_result(
+    run_id: str,
+    request: Optional[ApplyOptimizationRequest] = None,
+    coordinator=Depends(get_trading_coordinator),
+):
+    """
+    Apply a run's best parameter set (or a chosen result).
+
+    "risk.*" values update the live risk parameters; strategy values are
+    applied to the run's base strategy, which becomes the current strategy.
+    """
+    store = get_optimization_store()
+    run = store.get_run(run_id)
+    if run is None:
+        raise HTTPException(404, f"Optimization run '{run_id}' not found")
+
+    param_key = request.param_key if request else None
+    if param_key:
+        result = store.get_result(run_id, param_key)
+        if result is None:
+            raise HTTPException(404, f"Result '{param_key}' not found in run '{run_id}'")
+    else:
+        result = run["best"]
+        if result is None:
+            raise HTTPException(409, f"Run '{run_id}' has no best result ({run['status']})")
+
+    params = result["params"]
+    base_strategy = TradingStrategy.model_validate(run["base_strategy"])
+    strategy, risk_params = apply_param_set(base_strategy, coordinator.risk_params, params)
+
+    # Update in place: the agents hold references to the same RiskParameters
+    for path in params:
+        if path.startswith(RISK_PREFIX):
+            name = path[len(RISK_PREFIX):]
+            setattr(coordinator.risk_params, name, getattr(risk_params, name))
+
+    strategy_applied = any(not path.startswith(RISK_PREFIX) for path in params)
+    if strategy_applied:
+        coordinator.set_strategy(strategy)
+
+    logger.info(f"[Optimizer API] Applied result {result['param_key']} of run {run_id}")
+
+    return {
+        "status": "applied",
+        "run_id": run_id,
+        "params": params,
+        "metrics": result["metrics"],
+        "risk_params": coordinator.risk_params.model_dump(),
+        "strategy": strategy.model_dump() if strategy_applied else None,
+    }
+
+
 # -------------------------------------------
 # Trade Queue Endpoints
 # -------------------------------------------
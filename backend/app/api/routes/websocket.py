@@ -865,6 +865,7 @@ async def websocket_ticker(websocket: WebSocket):
     - {"type": "error", "message": "..."}
     """
     from services.realtime_service import get_realtime_service
+    from services.stream_codec import StreamMessage
 
     await websocket.accept()
     logger.info("ticker_websocket_connected")
@@ -884,10 +885,13 @@ async def websocket_ticker(websocket: WebSocket):
     # Track subscribed markets for cleanup
     subscribed_markets: set[str] = set()
 
-    # Callback to send ticker data to this client
+    # Callback to send ticker data to this client (encoded once for all clients)
     async def send_ticker(data: dict):
         try:
-            await websocket.send_json(data)
+            if isinstance(data, StreamMessage):
+                await websocket.send_text(data.encoded)
+            else:
+                await websocket.send_json(data)
         except Exception:
             pass  # Will be handled in disconnect
 
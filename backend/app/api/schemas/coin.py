@@ -88,6 +88,11 @@ class OrderbookResponse(BaseModel):
     bid_ask_ratio: float = Field(description="Bid/Ask ratio")
     asks: list[OrderbookUnit] = Field(description="Ask orders (sell)")
     bids: list[OrderbookUnit] = Field(description="Bid orders (buy)")
+    spread: Optional[float] = Field(default=None, description="Best ask - best bid")
+    microprice: Optional[float] = Field(default=None, description="Size-weighted mid price")
+    imbalance: Optional[float] = Field(
+        default=None, description="Top-level depth imbalance (-1 ask heavy .. 1 bid heavy)"
+    )
     timestamp: datetime
 
 
@@ -94,6 +94,11 @@ class KRStockOrderbookResponse(BaseModel):
     total_ask_volume: int = Field(description="Total ask volume")
     total_bid_volume: int = Field(description="Total bid volume")
     bid_ask_ratio: float = Field(description="Bid/Ask ratio")
+    spread: Optional[float] = Field(default=None, description="Best ask - best bid (KRW)")
+    microprice: Optional[float] = Field(default=None, description="Size-weighted mid price")
+    imbalance: Optional[float] = Field(
+        default=None, description="Top-level depth imbalance (-1 ask heavy .. 1 bid heavy)"
+    )
     timestamp: datetime = Field(description="Data timestamp")
 
 
@@ -53,6 +53,11 @@ class Settings(BaseSettings):
     UPBIT_ACCESS_KEY: str | None = None
     UPBIT_SECRET_KEY: str | None = None
     UPBIT_TRADING_MODE: Literal["paper", "live"] = "paper"
+    UPBIT_MAX_CONNECTIONS: int = Field(default=20, ge=1, le=100)  # Shared client pool size
+    UPBIT_CANDLE_BUFFER_SIZE: int = Field(default=1000, ge=200, le=10000)  # Bars per market/interval
+    UPBIT_CANDLE_MAX_MARKETS: int = Field(default=30, ge=1, le=200)  # Markets with built candles
+    UPBIT_BASE_URL: str | None = None  # REST override (e.g. load-test stand-in)
+    UPBIT_WS_URL: str | None = None  # WebSocket override
 
     # -------------------------------------------
     # Kiwoom REST API Configuration (Korean Stocks)
@@ -61,6 +66,7 @@ class Settings(BaseSettings):
     KIWOOM_SECRET_KEY: str | None = None
     KIWOOM_ACCOUNT_NO: str | None = None
     KIWOOM_IS_MOCK: bool = True  # True: 모의투자, False: 실거래
+    KIWOOM_BASE_URL: str | None = None  # REST/WebSocket override (e.g. load-test stand-in)
 
     # -------------------------------------------
     # Naver API Configuration (News Search)
@@ -69,11 +75,74 @@ class Settings(BaseSettings):
     NAVER_CLIENT_ID: str | None = None
     NAVER_CLIENT_SECRET: str | None = None
 
+    # Per-article sentiment cache (articles are scored by the LLM once)
+    NEWS_SENTIMENT_CACHE_TTL: float = Field(default=86400.0, ge=0.0)
+    NEWS_SENTIMENT_CACHE_MAX_ENTRIES: int = Field(default=5000, ge=1)
+
     # -------------------------------------------
     # Redis Configuration (Optional - for caching)
     # -------------------------------------------
     REDIS_URL: str | None = None
 
+    # -------------------------------------------
+    # Compute Offloading (CPU-bound work off the event loop)
+    # 0 workers = run in threads instead of a process pool
+    # -------------------------------------------
+    COMPUTE_POOL_WORKERS: int = Field(default=2, ge=0, le=32)
+    LOOP_LAG_WARN_MS: float = Field(default=100.0, ge=1.0)
+
+    # -------------------------------------------
+    # Market Snapshot Cache (shared per-ticker market data)
+    # Max age in seconds per snapshot part
+    # -------------------------------------------
+    MARKET_SNAPSHOT_QUOTE_MAX_AGE: float = Field(default=5.0, ge=0.0)
+    MARKET_SNAPSHOT_BARS_MAX_AGE: float = Field(default=60.0, ge=0.0)
+    MARKET_SNAPSHOT_ORDERBOOK_MAX_AGE: float = Field(default=2.0, ge=0.0)
+    MARKET_SNAPSHOT_POSITION_MAX_AGE: float = Field(default=10.0, ge=0.0)
+    MARKET_SNAPSHOT_MAX_ENTRIES: int = Field(default=512, ge=1)
+
+    # -------------------------------------------
+    # Order Books (L2 books fed by the orderbook streams)
+    # Symbols kept per exchange (least recently read dropped), levels
+    # used for depth and imbalance, and seconds without an update before
+    # a book is treated as missing (reseeded from REST)
+    # -------------------------------------------
+    ORDERBOOK_MAX_SYMBOLS: int = Field(default=20, ge=1, le=100)
+    ORDERBOOK_DEPTH_LEVELS: int = Field(default=5, ge=1, le=15)
+    ORDERBOOK_MAX_AGE: float = Field(default=30.0, gt=0.0)
+
+    # -------------------------------------------
+    # Tick Recorder (market data streams to segment files for replay)
+    # Records per segment file and seconds between batch writes
+    # -------------------------------------------
+    TICK_RECORDER_ENABLED: bool = False
+    TICK_RECORDER_DIR: str = "data/ticks"
+    TICK_RECORDER_SEGMENT_RECORDS: int = Field(default=1_000_000, ge=1000)
+    TICK_RECORDER_FLUSH_INTERVAL: float = Field(default=1.0, gt=0.0, le=60.0)
+
+    # -------------------------------------------
+    # Parameter Optimizer (backtest-based tuning of risk/strategy parameters)
+    # 0 workers = evaluate in the calling thread
+    # -------------------------------------------
+    OPTIMIZER_MAX_WORKERS: int = Field(default=4, ge=0, le=64)
+    OPTIMIZER_MAX_SAMPLES: int = Field(default=2000, ge=1)
+
+    # -------------------------------------------
+    # Account State (Kiwoom balance/execution streams)
+    # REST reconciliation interval while streaming, max age without
+    # streams, and delay of the coalesced reconciliation after fills
+    # -------------------------------------------
+    ACCOUNT_STATE_RECONCILE_INTERVAL: float = Field(default=300.0, ge=10.0)
+    ACCOUNT_STATE_STALE_AFTER: float = Field(default=10.0, ge=0.0)
+    ACCOUNT_STATE_FILL_RECONCILE_DELAY: float = Field(default=5.0, ge=0.0)
+
+    # -------------------------------------------
+    # Agent Group Chat
+    # Parallel rounds: agents in a discussion round respond concurrently
+    # -------------------------------------------
+    AGENT_CHAT_PARALLEL_ROUNDS: bool = True
+    AGENT_CHAT_HISTORY_TOKEN_BUDGET: int = Field(default=1200, ge=100)
+
     # -------------------------------------------
     # API Server Configuration
     # -------------------------------------------
@@ -112,11 +181,14 @@ class Settings(BaseSettings):
     def kiwoom_base_url(self) -> str:
         """
         Kiwoom API Base URL.
-        Returns mock URL for paper trading, live URL for real trading.
+        Returns mock URL for paper trading, live URL for real trading,
+        unless KIWOOM_BASE_URL overrides both.
 
         Note: 모의투자(mockapi)는 KRX(한국거래소) 종목만 지원합니다.
               NXT(대체거래소), SOR(스마트오더라우팅)는 실서버에서만 사용 가능합니다.
         """
+        if self.KIWOOM_BASE_URL:
+            return self.KIWOOM_BASE_URL
         return (
             "https://mockapi.kiwoom.com"  # KRX만 지원
             if self.KIWOOM_IS_MOCK
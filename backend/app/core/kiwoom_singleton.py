@@ -10,6 +10,7 @@ from typing import Optional, Tuple
 
 import structlog
 
+from app.config import settings
 from services.kiwoom import KiwoomClient
 
 logger = structlog.get_logger()
@@ -67,6 +68,7 @@ def get_shared_kiwoom_client() -> KiwoomClient:
             app_key=current_keys[0],
             secret_key=current_keys[1],
             is_mock=current_keys[2],
+            base_url=settings.KIWOOM_BASE_URL,
         )
         _kiwoom_keys = current_keys
         logger.info(
@@ -99,6 +101,7 @@ async def get_shared_kiwoom_client_async() -> KiwoomClient:
                 app_key=current_keys[0],
                 secret_key=current_keys[1],
                 is_mock=current_keys[2],
+                base_url=settings.KIWOOM_BASE_URL,
             )
             _kiwoom_keys = current_keys
             logger.info(
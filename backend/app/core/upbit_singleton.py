@@ -0,0 +1,118 @@
+"""
+Upbit Client Singleton
+
+Provides a shared UpbitClient instance across the application.
+Ensures the connection pool, rate limiter and cache are shared between all
+requests instead of opening a new HTTP client per call.
+"""
+
+import asyncio
+from typing import Optional
+
+import structlog
+
+from services.upbit import UpbitClient
+
+logger = structlog.get_logger()
+
+
+class _SharedUpbitClient(UpbitClient):
+    """UpbitClient whose `async with` block leaves the shared pool open."""
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+# Singleton instance and the event loop its connection pool belongs to
+_upbit_client: Optional[UpbitClient] = None
+_upbit_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Close tasks of clients replaced after an event loop change
+_closing: set[asyncio.Future] = set()
+
+
+def _get_runtime_keys() -> tuple[Optional[str], Optional[str]]:
+    """Get Upbit API keys from runtime storage, falling back to environment config."""
+    # Import here to avoid circular import
+    from app.api.routes.settings import get_upbit_access_key, get_upbit_secret_key
+
+    return get_upbit_access_key(), get_upbit_secret_key()
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(client: UpbitClient) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        logger.debug("upbit_singleton_close_failed", error=str(e))
+
+
+def _close_replaced(client: UpbitClient, old_loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client left behind by another event loop, on that loop if it still runs."""
+    if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+        future = asyncio.run_coroutine_threadsafe(_close_quietly(client), old_loop)
+        future = asyncio.wrap_future(future)
+    else:
+        future = asyncio.ensure_future(_close_quietly(client))
+    _closing.add(future)
+    future.add_done_callback(_closing.discard)
+
+
+def get_shared_upbit_client() -> UpbitClient:
+    """
+    Get shared UpbitClient singleton.
+
+    Picks up API key changes without dropping the connection pool. A new
+    client is created (and the previous one closed) if the previous one
+    belongs to another event loop. `async with` on it does not close it.
+
+    Returns:
+        Shared UpbitClient instance
+    """
+    global _upbit_client, _upbit_loop
+
+    access_key, secret_key = _get_runtime_keys()
+    loop = _current_loop()
+
+    if _upbit_client is None or (loop is not None and loop is not _upbit_loop):
+        from app.config import settings
+
+        if _upbit_client is not None:
+            _close_replaced(_upbit_client, _upbit_loop)
+
+        _upbit_client = _SharedUpbitClient(
+            access_key=access_key,
+            secret_key=secret_key,
+            max_connections=settings.UPBIT_MAX_CONNECTIONS,
+            base_url=settings.UPBIT_BASE_URL,
+        )
+        _upbit_loop = loop
+        logger.info("upbit_singleton_created", has_keys=bool(access_key and secret_key))
+    elif (_upbit_client.access_key, _upbit_client.secret_key) != (access_key, secret_key):
+        _upbit_client.set_credentials(access_key, secret_key)
+        logger.info("upbit_singleton_keys_updated", has_keys=bool(access_key and secret_key))
+
+    return _upbit_client
+
+
+async def close_upbit_client() -> None:
+    """
+    Close the singleton client gracefully.
+    Call this on application shutdown.
+    """
+    global _upbit_client, _upbit_loop
+
+    if _upbit_client is not None:
+        try:
+            await _upbit_client.close()
+        except Exception:
+            pass
+        _upbit_client = None
+        _upbit_loop = None
+        logger.info("upbit_singleton_closed")
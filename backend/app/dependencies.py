@@ -160,8 +160,6 @@ async def get_trading_coordinator() -> "ExecutionCoordinator":
         from services.trading import ExecutionCoordinator, RiskParameters
         from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
 
-        settings = get_settings()
-
         # Use shared Kiwoom client singleton (same as kr_stocks routes)
         kiwoom_client = None
         try:
@@ -172,19 +170,9 @@ async def get_trading_coordinator() -> "ExecutionCoordinator":
             import logging
             logging.getLogger(__name__).warning(f"Failed to get shared Kiwoom client: {e}")
 
-        # Initialize Redis client if available
-        redis_client = None
-        if settings.REDIS_URL:
-            try:
-                import redis.asyncio as redis
-                redis_client = redis.from_url(settings.REDIS_URL)
-            except ImportError:
-                pass
-
         # Create coordinator
         _trading_coordinator_instance = ExecutionCoordinator(
             kiwoom_client=kiwoom_client,
-            redis_client=redis_client,
         )
 
     return _trading_coordinator_instance
@@ -20,12 +20,21 @@ from agents.llm_provider import get_llm_provider, reset_llm_provider
 from app.api.routes import analysis, analysis_unified, approval, websocket, auth, coin, kr_stocks, chat, indicators, settings as settings_routes, news, trading, scanner, holidays, agent_chat
 from app.config import settings
 from app.core.analysis_limiter import cleanup_old_sessions
+from app.core.upbit_singleton import close_upbit_client
 from app.logging_config import configure_logging, RequestLoggingMiddleware
 from services.realtime_service import close_realtime_service, get_realtime_service
+from services.kr_realtime_service import close_kr_realtime_service
+from services.tick_recorder import close_tick_recorder, get_tick_recorder
+from services.account_state import close_account_state_service, get_account_state_service
 from services.storage_service import close_storage_service, get_storage_service
-from services.telegram import get_telegram_notifier
+from services.telegram import close_telegram_notifier, get_telegram_notifier
 from services.krx_holiday import get_holiday_service
 from services.session_manager import get_session_manager
+from services.compute import (
+    get_compute_executor,
+    get_loop_lag_monitor,
+    shutdown_compute_executor,
+)
 
 # Configure enhanced logging
 configure_logging(
@@ -93,6 +102,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("storage_connection_failed", error=str(e))
 
+    # Start event loop lag monitoring and warm up the compute pool
+    get_loop_lag_monitor().start()
+    try:
+        compute_executor = get_compute_executor()
+        await compute_executor.start()
+        logger.info("compute_pool_ready", workers=compute_executor.max_workers)
+    except Exception as e:
+        logger.warning("compute_pool_start_failed", error=str(e))
+
+    # Record market data streams for replay (attached as the stream clients start)
+    if settings.TICK_RECORDER_ENABLED:
+        try:
+            await get_tick_recorder().start()
+        except Exception as e:
+            logger.warning("tick_recorder_start_failed", error=str(e))
+
     # Initialize realtime service (Upbit WebSocket)
     try:
         realtime_service = await get_realtime_service()
@@ -101,6 +126,16 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("realtime_service_start_failed", error=str(e))
 
+    # Feed account state from the Kiwoom balance/execution streams (if configured)
+    try:
+        from app.api.routes.settings import get_kiwoom_app_key, get_kiwoom_secret_key
+
+        if get_kiwoom_app_key() and get_kiwoom_secret_key():
+            await get_account_state_service().start()
+            logger.info("account_state_service_started")
+    except Exception as e:
+        logger.warning("account_state_service_start_failed", error=str(e))
+
     # Initialize unified SessionManager
     try:
         session_manager = await get_session_manager()
@@ -148,9 +183,16 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("application_shutdown")
     await close_realtime_service()
+    await close_account_state_service()
+    await close_kr_realtime_service()
+    await close_tick_recorder()
+    await close_upbit_client()
+    await close_telegram_notifier()
     await llm.close()
     reset_llm_provider()
     await close_storage_service()
+    await get_loop_lag_monitor().stop()
+    await shutdown_compute_executor()
 
     # Close holiday service
     try:
@@ -415,6 +457,8 @@ async def health_check():
             "llm": llm_health,
             "storage": storage_health,
         },
+        "event_loop": get_loop_lag_monitor().get_stats(),
+        "compute": get_compute_executor().get_stats(),
     }
 
 
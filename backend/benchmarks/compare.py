@@ -0,0 +1,160 @@
+"""
+Benchmark Comparison Report
+
+Compares a pytest-benchmark run against a stored baseline and flags
+benchmarks that got slower than the threshold.
+
+Usage (from backend/):
+    pytest benchmarks --benchmark-autosave          # writes .benchmarks/<machine>/NNNN_*.json
+    python -m benchmarks.compare                    # latest run vs baselines/baseline.json
+    python -m benchmarks.compare --save-baseline    # promote the latest run to the baseline
+    python -m benchmarks.compare run.json --stat mean --threshold 15 --output report.md
+
+Exit code is 1 when a regression is flagged, so the report can gate CI.
+Baselines are machine-specific: record them on the machine that compares.
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baselines" / "baseline.json"
+DEFAULT_STORAGE = Path(".benchmarks")  # pytest-benchmark's default storage
+
+STATS = ("min", "mean", "median", "max")
+
+
+@dataclass
+class Comparison:
+    """One benchmark's baseline vs current timing."""
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    change_pct: Optional[float]
+    status: str  # regression / improved / unchanged / new / missing
+
+
+def load_run(path: Path) -> Dict[str, dict]:
+    """fullname -> stats of a pytest-benchmark JSON file."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return {bench["fullname"]: bench["stats"] for bench in data.get("benchmarks", [])}
+
+
+def latest_run(storage: Path) -> Optional[Path]:
+    """Most recently written run in a pytest-benchmark storage directory."""
+    runs = sorted(storage.glob("*/*.json"), key=lambda p: p.stat().st_mtime)
+    return runs[-1] if runs else None
+
+
+def compare_runs(
+    baseline: Dict[str, dict],
+    current: Dict[str, dict],
+    stat: str = "median",
+    threshold_pct: float = 10.0,
+) -> List[Comparison]:
+    """
+    Compare two runs benchmark by benchmark.
+
+    A benchmark regresses when its stat grew by more than threshold_pct
+    and by more than the baseline's interquartile range (round-to-round
+    noise); it improved on the mirrored condition.
+    """
+    comparisons = []
+    for name in sorted(set(baseline) | set(current)):
+        old, new = baseline.get(name), current.get(name)
+        if old is None:
+            comparisons.append(Comparison(name, None, new[stat], None, "new"))
+            continue
+        if new is None:
+            comparisons.append(Comparison(name, old[stat], None, None, "missing"))
+            continue
+
+        change_pct = (new[stat] / old[stat] - 1) * 100 if old[stat] else 0.0
+        noise = old.get("iqr", 0.0)
+        if change_pct > threshold_pct and new[stat] - old[stat] > noise:
+            status = "regression"
+        elif change_pct < -threshold_pct and old[stat] - new[stat] > noise:
+            status = "improved"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(name, old[stat], new[stat], change_pct, status))
+    return comparisons
+
+
+def _format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def render_report(comparisons: List[Comparison], stat: str, threshold_pct: float) -> str:
+    """Markdown report, regressions first."""
+    order = {"regression": 0, "improved": 1, "new": 2, "missing": 3, "unchanged": 4}
+    marks = {"regression": "REGRESSION", "improved": "improved", "new": "new", "missing": "missing", "unchanged": ""}
+    regressions = sum(c.status == "regression" for c in comparisons)
+
+    lines = [
+        f"# Benchmark comparison ({stat}, threshold {threshold_pct:g}%)",
+        "",
+        f"{regressions} regression(s), "
+        f"{sum(c.status == 'improved' for c in comparisons)} improvement(s), "
+        f"{len(comparisons)} benchmark(s)",
+        "",
+        "| Benchmark | Baseline | Current | Change | Status |",
+        "|---|---:|---:|---:|---|",
+    ]
+    for c in sorted(comparisons, key=lambda c: (order[c.status], c.name)):
+        change = f"{c.change_pct:+.1f}%" if c.change_pct is not None else "-"
+        lines.append(
+            f"| {c.name} | {_format_time(c.baseline)} | {_format_time(c.current)} | {change} | {marks[c.status]} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare a benchmark run against the stored baseline")
+    parser.add_argument("run", nargs="?", type=Path, help="pytest-benchmark JSON (default: latest autosaved run)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON")
+    parser.add_argument("--storage", type=Path, default=DEFAULT_STORAGE, help="pytest-benchmark storage directory")
+    parser.add_argument("--stat", choices=STATS, default="median", help="Statistic to compare")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    parser.add_argument("--output", type=Path, help="Also write the report to this file")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the run as the new baseline")
+    args = parser.parse_args(argv)
+
+    run = args.run or latest_run(args.storage)
+    if run is None:
+        print(f"No benchmark run found in {args.storage} (run pytest benchmarks --benchmark-autosave)", file=sys.stderr)
+        return 2
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(run, args.baseline)
+        print(f"Saved {run} as baseline {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline} (create one with --save-baseline)", file=sys.stderr)
+        return 2
+
+    comparisons = compare_runs(load_run(args.baseline), load_run(run), args.stat, args.threshold)
+    report = render_report(comparisons, args.stat, args.threshold)
+    print(report)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+
+    return 1 if any(c.status == "regression" for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
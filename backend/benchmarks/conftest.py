@@ -0,0 +1,137 @@
+"""
+Benchmark Configuration and Fixtures
+
+Realistic, seeded market data shared by every benchmark:
+- universe: 2,500 tickers x 500 daily bars (Kiwoom chart frame layout)
+- tick_stream: one second of trade ticks at 1,000 ticks/s
+
+Run from backend/ (not collected by the regular test run):
+    pytest benchmarks --benchmark-autosave
+    pytest benchmarks -m "not slow" --bench-universe 200   # quick pass
+    python -m benchmarks.compare                           # vs stored baseline
+"""
+
+import asyncio
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Import the app first, as tests/conftest.py does: importing agents.graph
+# before the API routes hits a circular import
+from app.main import app  # noqa: F401
+
+UNIVERSE_SIZE = 2500
+BARS_PER_TICKER = 500
+TICKS_PER_SECOND = 1000
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--bench-universe",
+        type=int,
+        default=UNIVERSE_SIZE,
+        help=f"Tickers in the benchmark universe (default: {UNIVERSE_SIZE})",
+    )
+    group.addoption(
+        "--bench-bars",
+        type=int,
+        default=BARS_PER_TICKER,
+        help=f"Daily bars per ticker (default: {BARS_PER_TICKER})",
+    )
+
+
+def make_daily_bars(tickers: int, bars: int, seed: int = 42) -> List[pd.DataFrame]:
+    """
+    Random-walk OHLCV frames shaped like KiwoomClient.get_daily_chart_df.
+
+    Prices follow a geometric random walk with per-ticker volatility, so
+    indicator branches (crosses, overbought/oversold, ...) are all hit.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2026-10-16", periods=bars)
+
+    vol = rng.uniform(0.01, 0.04, tickers)
+    returns = rng.normal(0.0003, 1.0, (bars, tickers)) * vol
+    close = np.round(rng.uniform(1_000, 200_000, tickers) * np.exp(np.cumsum(returns, axis=0)))
+    gap = rng.normal(0, 0.3, (bars, tickers)) * vol
+    open_ = np.round(close * np.exp(gap))
+    spread = np.abs(rng.normal(0, 0.5, (bars, tickers))) * vol
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    volume = rng.lognormal(11, 1.0, (bars, tickers)).astype(np.int64)
+
+    return [
+        pd.DataFrame({
+            "date": dates,
+            "open": open_[:, i],
+            "high": np.round(high[:, i]),
+            "low": np.round(low[:, i]),
+            "close": close[:, i],
+            "volume": volume[:, i],
+        })
+        for i in range(tickers)
+    ]
+
+
+def make_ticks(count: int, codes: List[str], seed: int = 7) -> List[dict]:
+    """Trade ticks in the shape pushed to dashboard sockets."""
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(codes), count)
+    prices = rng.integers(1_000, 200_000, count)
+    volumes = rng.integers(1, 5_000, count)
+    return [
+        {
+            "type": "tick",
+            "data": {
+                "stk_cd": codes[pick],
+                "price": int(price),
+                "volume": int(qty),
+                "change_rate": round(float(rng.normal(0, 2)), 2),
+                "timestamp": f"2026-10-16T09:{(i // 60) % 60:02d}:{i % 60:02d}",
+            },
+        }
+        for i, (pick, price, qty) in enumerate(zip(picks, prices, volumes))
+    ]
+
+
+@pytest.fixture(scope="session")
+def universe(pytestconfig) -> Dict[str, pd.DataFrame]:
+    """stk_cd -> daily bars for the whole benchmark universe."""
+    tickers = pytestconfig.getoption("--bench-universe")
+    bars = pytestconfig.getoption("--bench-bars")
+    frames = make_daily_bars(tickers, bars)
+    return {f"{i + 1:06d}": df for i, df in enumerate(frames)}
+
+
+@pytest.fixture(scope="session")
+def stock_list(universe) -> List[tuple]:
+    """(stk_cd, stk_nm, market_type) tuples, as used by the scanner."""
+    return [
+        (code, f"종목{code}", "코스피" if i % 2 == 0 else "코스닥")
+        for i, code in enumerate(universe)
+    ]
+
+
+@pytest.fixture(scope="session")
+def tick_stream(universe) -> List[dict]:
+    """One second of ticks at TICKS_PER_SECOND."""
+    return make_ticks(TICKS_PER_SECOND, list(universe))
+
+
+@pytest.fixture(scope="session")
+def aio() -> Callable:
+    """
+    Run a coroutine to completion on a session-wide event loop.
+
+    pytest-benchmark times synchronous callables, so async hot paths are
+    measured as aio(coro) with the loop kept alive between rounds.
+    """
+    from services.compute import shutdown_compute_executor
+
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.run_until_complete(shutdown_compute_executor())
+    loop.close()
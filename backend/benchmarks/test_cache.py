@@ -0,0 +1,143 @@
+"""
+Benchmarks for MultiTierCache and KiwoomCache
+"""
+
+import os
+
+import pytest
+
+from services.cache import CacheConfig, MultiTierCache
+from services.kiwoom.cache import KiwoomCache
+
+OPS = 1000
+
+
+def _quote(i: int) -> dict:
+    return {
+        "stk_cd": f"{i:06d}",
+        "stk_nm": f"종목{i}",
+        "cur_prc": 70000 + i,
+        "prdy_ctrt": 1.25,
+        "acml_vol": 1_234_567,
+        "high_pric": 71000,
+        "low_pric": 69000,
+    }
+
+
+@pytest.fixture
+def multi_tier_cache(aio, tmp_path):
+    """MultiTierCache with L1 + SQLite L3 (no Redis)."""
+    cache = MultiTierCache(CacheConfig(
+        memory_max_size=OPS * 2,
+        sqlite_path=os.path.join(tmp_path, "cache.db"),
+    ))
+    aio(cache.initialize())
+    yield cache
+    aio(cache.close())
+
+
+class TestMultiTierCache:
+    """L1 hits, write-through sets and L3 reads."""
+
+    def test_get_l1_hit(self, benchmark, aio, multi_tier_cache):
+        keys = [f"quote:{i}" for i in range(OPS)]
+        for i, key in enumerate(keys):
+            aio(multi_tier_cache.set(key, _quote(i), memory_only=True))
+
+        async def run():
+            for key in keys:
+                await multi_tier_cache.get(key)
+
+        benchmark(lambda: aio(run()))
+        benchmark.extra_info["ops_per_round"] = OPS
+
+    def test_set_memory_only(self, benchmark, aio, multi_tier_cache):
+        values = [(f"quote:{i}", _quote(i)) for i in range(OPS)]
+
+        async def run():
+            for key, value in values:
+                await multi_tier_cache.set(key, value, memory_only=True)
+
+        benchmark(lambda: aio(run()))
+        benchmark.extra_info["ops_per_round"] = OPS
+
+    def test_set_write_through(self, benchmark, aio, multi_tier_cache):
+        """Sets that also persist to SQLite (one connection per write)."""
+        values = [(f"quote:{i}", _quote(i)) for i in range(100)]
+
+        async def run():
+            for key, value in values:
+                await multi_tier_cache.set(key, value, ttl=60)
+
+        benchmark(lambda: aio(run()))
+        benchmark.extra_info["ops_per_round"] = len(values)
+
+    def test_get_l3_promotion(self, benchmark, aio, multi_tier_cache):
+        """L1 misses served from SQLite (after restart or eviction)."""
+        keys = [f"quote:{i}" for i in range(100)]
+        for i, key in enumerate(keys):
+            aio(multi_tier_cache.set(key, _quote(i), ttl=600))
+
+        async def run():
+            multi_tier_cache._memory_cache.clear()
+            for key in keys:
+                await multi_tier_cache.get(key)
+
+        benchmark(lambda: aio(run()))
+        benchmark.extra_info["ops_per_round"] = len(keys)
+
+
+class TestKiwoomCache:
+    """L1 lookups, sets past capacity and account invalidation."""
+
+    def test_get_hit(self, benchmark):
+        cache = KiwoomCache(max_size=OPS)
+        keys = [f"stock_info:{i:06d}" for i in range(OPS)]
+        for i, key in enumerate(keys):
+            cache.set(key, _quote(i), ttl=600)
+
+        def run():
+            for key in keys:
+                cache.get(key)
+
+        benchmark(run)
+        benchmark.extra_info["ops_per_round"] = OPS
+
+    def test_set_at_capacity(self, benchmark):
+        """Every set evicts (full cache, nothing expired)."""
+        cache = KiwoomCache(max_size=OPS)
+        for i in range(OPS):
+            cache.set(f"stock_info:{i:06d}", _quote(i), ttl=600)
+        values = [(f"orderbook:{i:06d}", _quote(i)) for i in range(200)]
+
+        def run():
+            for key, value in values:
+                cache.set(key, value, ttl=600)
+
+        benchmark(run)
+        benchmark.extra_info["ops_per_round"] = len(values)
+
+    def test_get_async_hit(self, benchmark, aio):
+        cache = KiwoomCache(max_size=OPS)
+        keys = [f"stock_info:{i:06d}" for i in range(OPS)]
+        for i, key in enumerate(keys):
+            cache.set(key, _quote(i), ttl=600)
+
+        async def run():
+            for key in keys:
+                await cache.get_async(key)
+
+        benchmark(lambda: aio(run()))
+        benchmark.extra_info["ops_per_round"] = OPS
+
+    def test_invalidate_account_cache(self, benchmark):
+        """Invalidation after an order, with a full cache of quotes."""
+        cache = KiwoomCache(max_size=OPS * 2)
+        for i in range(OPS):
+            cache.set(f"stock_info:{i:06d}", _quote(i), ttl=600)
+
+        def setup():
+            for prefix in KiwoomCache.ACCOUNT_CACHE_PREFIXES:
+                cache.set(f"{prefix}:main", {"cash": 1_000_000}, ttl=600)
+
+        benchmark.pedantic(cache.invalidate_account_cache, setup=setup, rounds=200)
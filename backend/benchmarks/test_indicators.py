@@ -0,0 +1,36 @@
+"""
+Benchmarks for TechnicalIndicators.calculate_all
+"""
+
+import time
+
+import pytest
+
+from services.technical_indicators import TechnicalIndicators
+
+
+def test_calculate_all_single(benchmark, universe):
+    """One ticker's full indicator bundle (the per-analysis cost)."""
+    df = next(iter(universe.values()))
+
+    result = benchmark(lambda: TechnicalIndicators(df).calculate_all())
+
+    assert "error" not in result
+    benchmark.extra_info["bars"] = len(df)
+
+
+@pytest.mark.slow
+def test_calculate_all_universe(benchmark, universe):
+    """Every ticker of the universe in one process (the scanner's CPU floor)."""
+    frames = list(universe.values())
+
+    def run():
+        for df in frames:
+            TechnicalIndicators(df).calculate_all()
+
+    started = time.perf_counter()
+    benchmark.pedantic(run, rounds=1, iterations=1)
+    elapsed = time.perf_counter() - started
+
+    benchmark.extra_info["tickers"] = len(frames)
+    benchmark.extra_info["tickers_per_sec"] = round(len(frames) / elapsed, 1)
@@ -0,0 +1,98 @@
+"""
+Benchmarks for SessionManager.update_state and SqliteCheckpointer.aput
+"""
+
+import uuid
+
+import pytest
+
+from agents.graph.sqlite_checkpointer import SqliteCheckpointer
+from services import session_manager as session_manager_module
+from services.session_manager import MarketType, SessionManager
+from services.storage_service import StorageService
+
+WRITES = 50
+
+
+def _analysis_state(steps: int = 40) -> dict:
+    """A mid-analysis graph state (reasoning log, four analyses, proposal)."""
+    return {
+        "ticker": "005930",
+        "current_stage": "risk_assessment",
+        "reasoning_log": [f"[{i:02d}] 기술적 지표 검토: RSI 58.2, MACD 골든크로스, 거래량 평균 대비 1.4배" for i in range(steps)],
+        "analyses": [
+            {
+                "agent_type": agent,
+                "signal": "buy",
+                "confidence": 0.72,
+                "summary": "상승 추세 유지, 20일선 지지 확인 " * 4,
+                "key_factors": ["이동평균 정배열", "외국인 순매수", "실적 개선"],
+                "signals": {"rsi": 58.2, "macd": 120.5, "bb_position": 0.64},
+            }
+            for agent in ("technical", "fundamental", "sentiment", "risk")
+        ],
+        "trade_proposal": {
+            "action": "BUY",
+            "quantity": 10,
+            "entry_price": 71200,
+            "stop_loss": 67600,
+            "take_profit": 78300,
+            "rationale": "기술적/수급 신호 동조 " * 8,
+        },
+    }
+
+
+@pytest.fixture
+def session_manager(aio, tmp_path, monkeypatch):
+    monkeypatch.setattr(session_manager_module, "DB_PATH", str(tmp_path / "sessions.db"))
+    manager = SessionManager()
+    aio(manager.initialize())
+    return manager
+
+
+def test_update_state(benchmark, aio, session_manager):
+    """Node-by-node state updates of one running analysis."""
+    session_id = str(uuid.uuid4())
+    aio(session_manager.create_session(
+        session_id, MarketType.KIWOOM, "005930", "삼성전자", state=_analysis_state(),
+    ))
+    updates = [
+        ({"current_stage": f"node_{i}", "reasoning_log": _analysis_state(i)["reasoning_log"]}, f"node_{i}")
+        for i in range(WRITES)
+    ]
+
+    async def run():
+        for state_updates, node in updates:
+            await session_manager.update_state(session_id, state_updates, last_node=node)
+
+    benchmark(lambda: aio(run()))
+    benchmark.extra_info["writes_per_round"] = WRITES
+
+
+def test_checkpointer_aput(benchmark, aio, tmp_path):
+    """LangGraph checkpoints of a session, one per graph step."""
+    checkpointer = SqliteCheckpointer("bench-session")
+    checkpointer._storage_service = StorageService(tmp_path / "storage.db")
+    aio(checkpointer._storage_service.initialize())
+
+    state = _analysis_state()
+    checkpoints = [
+        {
+            "v": 1,
+            "id": str(uuid.uuid4()),
+            "ts": f"2026-10-16T09:00:{i:02d}+00:00",
+            "channel_values": state,
+            "channel_versions": {key: i for key in state},
+            "versions_seen": {"__input__": {}, "technical_analyst": {"ticker": i}},
+            "pending_sends": [],
+        }
+        for i in range(WRITES)
+    ]
+    config = {"configurable": {"thread_id": "bench-thread"}}
+
+    async def run():
+        for step, checkpoint in enumerate(checkpoints):
+            await checkpointer.aput(config, checkpoint, {"source": "loop", "step": step}, {})
+
+    benchmark(lambda: aio(run()))
+    benchmark.extra_info["writes_per_round"] = WRITES
@@ -0,0 +1,118 @@
+"""
+Benchmarks for BackgroundScanner throughput with a mocked Kiwoom client and LLM
+
+Quotes and daily charts come from the benchmark universe without network
+latency, so the numbers are the scanner's own cost: snapshot caching,
+indicator work in the compute pool, prompt building/parsing and the
+batched SQLite writes.
+"""
+
+import re
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.background_scanner import BackgroundScanner, ScanStatus
+from services.background_scanner import scanner as scanner_module
+from services.market_snapshot import MarketSnapshotService
+
+
+def _make_client(universe: dict):
+    """Kiwoom client serving quotes and charts from the universe."""
+    client = AsyncMock()
+
+    async def get_stock_info(stk_cd):
+        df = universe[stk_cd]
+        close, prev = df["close"].iloc[-1], df["close"].iloc[-2]
+        volume = int(df["volume"].iloc[-1])
+        return SimpleNamespace(
+            cur_prc=int(close),
+            prdy_ctrt=round((close / prev - 1) * 100, 2),
+            acml_vol=volume,
+            trd_qty=volume,
+        )
+
+    async def get_daily_chart_df(stk_cd, *args, **kwargs):
+        return universe[stk_cd].copy()
+
+    client.get_stock_info.side_effect = get_stock_info
+    client.get_daily_chart_df.side_effect = get_daily_chart_df
+    return client
+
+
+class FakeLLM:
+    """Answers batch prompts instantly with one parseable section per stock."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, messages):
+        self.calls += 1
+        match = re.search(r"다음 (\d+)개", messages[-1].content)
+        count = int(match.group(1)) if match else 1
+        return "\n".join(
+            f"[종목 {i + 1}]\nACTION: HOLD\nCONFIDENCE: 0.6\n"
+            f"SUMMARY: 박스권 횡보\nKEY_FACTORS: 거래량 감소, 20일선 근접"
+            for i in range(count)
+        )
+
+
+def _run_scan(benchmark, aio, tmp_path_factory, universe, stock_list, use_llm: bool):
+    client = _make_client(universe)
+    llm = FakeLLM()
+    runs = []
+
+    def setup():
+        db_path = tmp_path_factory.mktemp("scanner") / "scanner_results.db"
+        snapshots = MarketSnapshotService(max_entries=len(universe))
+        patches = [
+            patch.object(scanner_module, "DB_PATH", db_path),
+            patch.object(scanner_module, "get_market_snapshot_service", return_value=snapshots),
+            patch("app.core.kiwoom_singleton.get_shared_kiwoom_client_async", AsyncMock(return_value=client)),
+            patch("agents.llm_provider.get_llm_provider", return_value=llm),
+        ]
+        for p in patches:
+            p.start()
+        runs.append(patches)
+        return (BackgroundScanner(),), {}
+
+    async def scan(scanner: BackgroundScanner):
+        try:
+            await scanner.start_scan(
+                stock_list=stock_list,
+                notify_progress=False,
+                use_llm=use_llm,
+                auto_gpu_scaling=False,
+            )
+            await scanner._task
+        finally:
+            for p in runs.pop():
+                p.stop()
+        return scanner
+
+    started = time.perf_counter()
+    scanner = benchmark.pedantic(lambda s: aio(scan(s)), setup=setup, rounds=1, iterations=1)
+    elapsed = time.perf_counter() - started
+
+    progress = scanner.get_progress()
+    assert progress.status == ScanStatus.COMPLETED
+    assert progress.completed == len(stock_list)
+
+    benchmark.extra_info["stocks"] = len(stock_list)
+    benchmark.extra_info["stocks_per_sec"] = round(len(stock_list) / elapsed, 1)
+    if use_llm:
+        benchmark.extra_info["llm_calls"] = llm.calls
+
+
+@pytest.mark.slow
+def test_quick_scan_throughput(benchmark, aio, tmp_path_factory, universe, stock_list):
+    """Full quick (indicator-only) scan of the universe."""
+    _run_scan(benchmark, aio, tmp_path_factory, universe, stock_list, use_llm=False)
+
+
+@pytest.mark.slow
+def test_llm_batch_scan_throughput(benchmark, aio, tmp_path_factory, universe, stock_list):
+    """Full LLM batch scan of the universe with an instant LLM."""
+    _run_scan(benchmark, aio, tmp_path_factory, universe, stock_list, use_llm=True)
@@ -0,0 +1,71 @@
+"""
+Benchmarks for WebSocket fan-out (ConnectionManager, TradeNotificationManager)
+"""
+
+import json
+
+import pytest
+
+from app.api.routes.websocket import ConnectionManager, TradeNotificationManager
+
+
+class FakeWebSocket:
+    """Accepts sends like starlette's WebSocket (JSON-encodes each message)."""
+
+    def __init__(self):
+        self.sent = 0
+        self.bytes = 0
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data, mode: str = "text"):
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        self.sent += 1
+        self.bytes += len(text)
+
+
+@pytest.mark.parametrize("sockets", [10, 100])
+def test_session_fan_out(benchmark, aio, tick_stream, sockets):
+    """One second of ticks to every socket of one analysis session."""
+    manager = ConnectionManager()
+    clients = [FakeWebSocket() for _ in range(sockets)]
+    for ws in clients:
+        aio(manager.connect("dashboard", ws))
+
+    async def run():
+        for tick in tick_stream:
+            await manager.send_to_session("dashboard", tick)
+
+    benchmark(lambda: aio(run()))
+    benchmark.extra_info["sends_per_round"] = len(tick_stream) * sockets
+
+
+@pytest.mark.parametrize("sessions", [10, 100])
+def test_broadcast_all_sessions(benchmark, aio, tick_stream, sessions):
+    """One second of ticks broadcast across many sessions (two sockets each)."""
+    manager = ConnectionManager()
+    for i in range(sessions):
+        for _ in range(2):
+            aio(manager.connect(f"session-{i}", FakeWebSocket()))
+
+    async def run():
+        for tick in tick_stream:
+            await manager.broadcast(tick)
+
+    benchmark(lambda: aio(run()))
+    benchmark.extra_info["sends_per_round"] = len(tick_stream) * sessions * 2
+
+
+def test_trade_notification_broadcast(benchmark, aio):
+    """Trade notifications to 100 dashboard subscribers."""
+    manager = TradeNotificationManager()
+    for _ in range(100):
+        aio(manager.subscribe(FakeWebSocket()))
+    notification = {
+        "type": "trade_executed",
+        "data": {"stk_cd": "005930", "stk_nm": "삼성전자", "action": "BUY", "quantity": 10, "price": 71200},
+    }
+
+    benchmark(lambda: aio(manager.broadcast(notification)))
+    benchmark.extra_info["sends_per_round"] = 100
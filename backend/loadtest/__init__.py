@@ -0,0 +1,16 @@
+"""
+Load-Test Harness
+
+Local stand-ins for the external services the backend talks to, plus a
+scenario driver that loads the full stack through its public API:
+
+- kiwoom_sim: Kiwoom REST + WebSocket simulator (real 1700/429 rate-limit errors)
+- upbit_sim: Upbit REST + WebSocket simulator (Remaining-Req headers, 429s)
+- fake_llm: OpenAI-compatible chat server with configurable latency and tokens/sec
+- scenario: N concurrent analyses, a full scan and M dashboard sockets,
+  reported as p50/p99 latencies and throughput
+
+Usage (from backend/):
+    python -m loadtest serve                 # start the three stand-ins
+    python -m loadtest run --analyses 10 --sockets 50
+"""
@@ -0,0 +1,148 @@
+"""
+Load-test command line.
+
+    python -m loadtest serve [--stocks 2500] [--kiwoom-rate 5] [--llm-latency-ms 300] [--llm-tps 40] ...
+    python -m loadtest run [--target http://127.0.0.1:8000] [--analyses 10] [--sockets 50] [--no-scan] ...
+
+`serve` prints the environment the backend needs to use the stand-ins.
+`run` exits 1 when any workload recorded errors.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+KIWOOM_PORT = 9101
+UPBIT_PORT = 9102
+LLM_PORT = 9103
+
+
+async def serve(args: argparse.Namespace) -> None:
+    import uvicorn
+
+    from .fake_llm import FakeLLMServer
+    from .kiwoom_sim import KiwoomSimulator
+    from .market import SyntheticMarket
+    from .upbit_sim import UpbitSimulator
+
+    market = SyntheticMarket(stocks=args.stocks, coins=args.coins)
+    apps = [
+        (KiwoomSimulator(
+            market,
+            rate_limit=args.kiwoom_rate,
+            latency_ms=args.latency_ms,
+            tick_interval=args.tick_interval,
+        ).create_app(), args.kiwoom_port),
+        (UpbitSimulator(
+            market,
+            latency_ms=args.latency_ms,
+            tick_interval=args.tick_interval,
+        ).create_app(), args.upbit_port),
+        (FakeLLMServer(
+            latency_ms=args.llm_latency_ms,
+            tokens_per_sec=args.llm_tps,
+            completion_tokens=args.llm_tokens,
+            max_concurrency=args.llm_concurrency,
+        ).create_app(), args.llm_port),
+    ]
+
+    host = args.host
+    print("Stand-ins running. Start the backend with:")
+    print(f"  KIWOOM_BASE_URL=http://{host}:{args.kiwoom_port}")
+    print("  KIWOOM_APP_KEY=loadtest KIWOOM_SECRET_KEY=loadtest")
+    print(f"  UPBIT_BASE_URL=http://{host}:{args.upbit_port}/v1")
+    print(f"  UPBIT_WS_URL=ws://{host}:{args.upbit_port}/websocket/v1")
+    print(f"  LLM_BASE_URL=http://{host}:{args.llm_port}/v1")
+    sys.stdout.flush()
+
+    servers = [
+        uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level=args.log_level))
+        for app, port in apps
+    ]
+    await asyncio.gather(*(server.serve() for server in servers))
+
+
+async def run(args: argparse.Namespace) -> int:
+    from .scenario import ScenarioConfig, render_report, run_scenario
+
+    host = args.stand_in_host
+    config = ScenarioConfig(
+        target=args.target,
+        analyses=args.analyses,
+        scan=not args.no_scan,
+        scan_use_llm=args.scan_llm,
+        scan_stocks=args.scan_stocks,
+        sockets=args.sockets,
+        duration=args.duration,
+        timeout=args.timeout,
+        stand_ins={
+            "kiwoom": f"http://{host}:{args.kiwoom_port}",
+            "upbit": f"http://{host}:{args.upbit_port}",
+            "llm": f"http://{host}:{args.llm_port}",
+        },
+    )
+    if args.stocks:
+        config.stocks = args.stocks.split(",")
+
+    report = await run_scenario(config)
+    text = render_report(report)
+    print(text)
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    if args.json:
+        args.json.write_text(json.dumps(report.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+
+    return 1 if any(w["errors"] for w in report.workloads.values()) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Load-test harness")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ports = argparse.ArgumentParser(add_help=False)
+    ports.add_argument("--kiwoom-port", type=int, default=KIWOOM_PORT)
+    ports.add_argument("--upbit-port", type=int, default=UPBIT_PORT)
+    ports.add_argument("--llm-port", type=int, default=LLM_PORT)
+
+    p_serve = sub.add_parser("serve", parents=[ports], help="Run the Kiwoom, Upbit and LLM stand-ins")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--stocks", type=int, default=2500, help="Stocks in the Kiwoom universe")
+    p_serve.add_argument("--coins", type=int, default=30, help="Upbit markets")
+    p_serve.add_argument("--kiwoom-rate", type=int, default=5, help="Kiwoom requests/s per token and group")
+    p_serve.add_argument("--latency-ms", type=float, default=20.0, help="Kiwoom/Upbit REST latency")
+    p_serve.add_argument("--tick-interval", type=float, default=0.2, help="Seconds between stream frames")
+    p_serve.add_argument("--llm-latency-ms", type=float, default=300.0, help="LLM time to first token")
+    p_serve.add_argument("--llm-tps", type=float, default=40.0, help="LLM decode tokens/s per completion")
+    p_serve.add_argument("--llm-tokens", type=int, default=256, help="LLM completion length")
+    p_serve.add_argument("--llm-concurrency", type=int, default=8, help="Completions decoded at once")
+    p_serve.add_argument("--log-level", default="warning")
+
+    p_run = sub.add_parser("run", parents=[ports], help="Run the scenario against a backend")
+    p_run.add_argument("--target", default="http://127.0.0.1:8000", help="Backend base URL")
+    p_run.add_argument("--analyses", type=int, default=10, help="Concurrent KR stock analyses")
+    p_run.add_argument("--stocks", help="Comma-separated codes to analyze (round-robin)")
+    p_run.add_argument("--no-scan", action="store_true", help="Skip the background scan")
+    p_run.add_argument("--scan-llm", action="store_true", help="Scan in LLM batch mode")
+    p_run.add_argument("--scan-stocks", type=int, help="Scan only the first N stand-in stocks")
+    p_run.add_argument("--sockets", type=int, default=50, help="Dashboard ticker sockets")
+    p_run.add_argument("--duration", type=float, default=30.0, help="Minimum run time in seconds")
+    p_run.add_argument("--timeout", type=float, default=900.0, help="Per analysis/scan timeout")
+    p_run.add_argument("--stand-in-host", default="127.0.0.1", help="Where the stand-ins' /stats live")
+    p_run.add_argument("--output", type=Path, help="Also write the markdown report here")
+    p_run.add_argument("--json", type=Path, help="Write the raw report as JSON")
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
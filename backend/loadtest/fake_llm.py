@@ -0,0 +1,180 @@
+"""
+OpenAI-compatible Fake LLM Server
+
+Stands in for the vLLM/Ollama server behind LLM_BASE_URL. A completion
+costs `latency_ms` (prefill / time to first token) plus
+completion_tokens / tokens_per_sec (decode); at most `max_concurrency`
+completions decode at once and the rest queue, like a GPU batch.
+
+Replies are shaped for the app's parsers: scanner batch prompts
+("다음 N개 종목") get one [종목 i] section per stock, everything else a
+short ACTION/CONFIDENCE analysis padded to the configured length.
+
+Point the backend at it with LLM_BASE_URL=http://127.0.0.1:9103/v1.
+"""
+
+import asyncio
+import json
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+BATCH_PATTERN = re.compile(r"다음 (\d+)개")
+FILLER = "거래량 추세 지지선 저항선 이동평균 수급 모멘텀 변동성 실적 밸류에이션".split()
+CHUNK_SECONDS = 0.02  # Streamed tokens are flushed in ~20 ms chunks
+
+
+def build_reply(prompt: str, tokens: int) -> List[str]:
+    """Reply as a list of tokens (whitespace-separated words)."""
+    match = BATCH_PATTERN.search(prompt)
+    if match:
+        words = []
+        for i in range(int(match.group(1))):
+            words += f"[종목 {i + 1}]\nACTION: HOLD\nCONFIDENCE: 0.6\nSUMMARY: 박스권 횡보\nKEY_FACTORS: 거래량 감소, 20일선 근접\n".split(" ")
+        return words
+
+    words = "ACTION: HOLD\nCONFIDENCE: 0.6\nSIGNAL: hold\nSUMMARY: 단기 방향성 부재, 관망\nKEY_FACTORS:".split(" ")
+    while len(words) < tokens:
+        words.append(FILLER[len(words) % len(FILLER)])
+    return words
+
+
+class FakeLLMServer:
+    """
+    Fake OpenAI chat completions endpoint.
+
+    Args:
+        latency_ms: Time to first token
+        tokens_per_sec: Decode speed per completion
+        completion_tokens: Reply length (capped by the request's max_tokens)
+        max_concurrency: Completions decoded at once (others wait)
+        model: Model id reported by /v1/models and completions
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 300.0,
+        tokens_per_sec: float = 40.0,
+        completion_tokens: int = 256,
+        max_concurrency: int = 8,
+        model: str = "loadtest-fake",
+    ):
+        self.latency = latency_ms / 1000
+        self.tokens_per_sec = tokens_per_sec
+        self.completion_tokens = completion_tokens
+        self.model = model
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+        self.requests = 0
+        self.tokens = 0
+        self.active = 0
+        self.queued = 0
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "completion_tokens": self.tokens,
+            "active": self.active,
+            "queued": self.queued,
+        }
+
+    def create_app(self) -> FastAPI:
+        app = FastAPI(title="Fake LLM")
+
+        @app.get("/v1/models")
+        async def models():
+            return {"object": "list", "data": [{"id": self.model, "object": "model", "owned_by": "loadtest"}]}
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+            limit = body.get("max_tokens") or body.get("max_completion_tokens") or self.completion_tokens
+            reply = build_reply(prompt, min(self.completion_tokens, limit))
+            usage = {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": len(reply),
+                "total_tokens": len(prompt.split()) + len(reply),
+            }
+            self.requests += 1
+
+            if body.get("stream"):
+                return StreamingResponse(
+                    self._stream(reply, usage, body.get("stream_options")),
+                    media_type="text/event-stream",
+                )
+
+            async with self._slot():
+                await asyncio.sleep(self.latency + len(reply) / self.tokens_per_sec)
+                self.tokens += len(reply)
+            return self._completion(" ".join(reply), usage)
+
+        @app.get("/stats")
+        async def get_stats():
+            return self.stats()
+
+        return app
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Wait for a decode slot."""
+        self.queued += 1
+        async with self._slots:
+            self.queued -= 1
+            self.active += 1
+            try:
+                yield
+            finally:
+                self.active -= 1
+
+    def _completion(self, text: str, usage: dict) -> dict:
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": self.model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": usage,
+        }
+
+    def _chunk(self, completion_id: str, delta: dict, finish_reason: Optional[str] = None) -> str:
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": self.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        }
+        return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+    async def _stream(self, reply: List[str], usage: dict, options: Optional[dict]) -> AsyncIterator[str]:
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        per_chunk = max(1, int(self.tokens_per_sec * CHUNK_SECONDS))
+
+        async with self._slot():
+            await asyncio.sleep(self.latency)
+            yield self._chunk(completion_id, {"role": "assistant", "content": ""})
+            for start in range(0, len(reply), per_chunk):
+                words = reply[start:start + per_chunk]
+                await asyncio.sleep(len(words) / self.tokens_per_sec)
+                text = " ".join(words) + (" " if start + per_chunk < len(reply) else "")
+                self.tokens += len(words)
+                yield self._chunk(completion_id, {"content": text})
+
+        yield self._chunk(completion_id, {}, finish_reason="stop")
+        if options and options.get("include_usage"):
+            usage_chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": self.model,
+                "choices": [],
+                "usage": usage,
+            }
+            yield f"data: {json.dumps(usage_chunk)}\n\n"
+        yield "data: [DONE]\n\n"
@@ -0,0 +1,613 @@
+"""
+Kiwoom REST + WebSocket Simulator
+
+Speaks the subset of the Kiwoom REST API that services.kiwoom uses
+(token, quotes, daily charts with next-key paging, account, orders,
+stock list) and the real-time WebSocket protocol of KiwoomWebSocketClient.
+
+Rate limits behave like the real servers: requests over the per-token
+limit (조회/주문 각각 초당 5건) are rejected with HTTP 429 and
+return_code 5 "[1700:허용된 요청 개수를 초과하였습니다]", and the token
+endpoint answers 429 when hammered. Nothing is queued.
+
+Point the backend at it with KIWOOM_BASE_URL=http://127.0.0.1:9101.
+"""
+
+import asyncio
+import itertools
+import json
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse
+
+from .limits import SlidingWindowLimiter
+from .market import SyntheticMarket
+
+ORDER_API_IDS = {"kt10000", "kt10001", "kt10002", "kt10003"}
+CHART_PAGE_SIZE = 600
+STOCK_LIST_PAGE_SIZE = 1000
+ORDERBOOK_LEVELS = 10
+
+OK_MSG = "정상적으로 처리되었습니다"
+RATE_LIMIT_RETURN_CODE = 5
+RATE_LIMIT_MSG = "허용된 요청 개수를 초과하였습니다[1700:허용된 요청 개수를 초과하였습니다. API ID={api_id}]"
+INVALID_TOKEN_MSG = "Token이 유효하지 않습니다[8005:Token이 유효하지 않습니다]"
+
+# Result of an API handler: (body, next-key or None when the data is exhausted)
+HandlerResult = Tuple[dict, Optional[str]]
+
+
+def tick_size(price: int) -> int:
+    """KRX 호가단위."""
+    for limit, tick in ((2_000, 1), (5_000, 5), (20_000, 10), (50_000, 50), (200_000, 100), (500_000, 500)):
+        if price < limit:
+            return tick
+    return 1_000
+
+
+def signed(value: int, reference: int) -> str:
+    """Kiwoom price string: sign shows the direction versus the previous close."""
+    if value > reference:
+        return f"+{value}"
+    if value < reference:
+        return f"-{value}"
+    return str(value)
+
+
+@dataclass
+class SimOrder:
+    """An order held by the simulated account."""
+    ord_no: str
+    stk_cd: str
+    buy_sell_tp: str  # 1: 매도, 2: 매수
+    ord_qty: int
+    ord_uv: int
+    ccld_qty: int = 0
+    ccld_uv: int = 0
+    ord_dt: str = ""
+    ord_tm: str = ""
+
+    @property
+    def rmn_qty(self) -> int:
+        return self.ord_qty - self.ccld_qty
+
+
+class _Subscriber:
+    """One WebSocket client and its registered real-time types."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.types: Dict[str, Set[str]] = {}
+
+    def wants(self, rq_type: str, stk_cd: str = "") -> bool:
+        codes = self.types.get(rq_type)
+        return codes is not None and (not stk_cd or not codes or stk_cd in codes)
+
+
+class KiwoomSimulator:
+    """
+    Stateful Kiwoom stand-in.
+
+    Args:
+        market: Shared synthetic market data
+        rate_limit: Requests per second per token and API group (조회/주문)
+        token_rate_limit: Token requests per second per app key
+        latency_ms: Server processing time added to every REST request
+        tick_interval: Seconds between real-time frames per subscribed stock
+        cash: Starting deposit of the simulated account
+    """
+
+    def __init__(
+        self,
+        market: Optional[SyntheticMarket] = None,
+        rate_limit: int = 5,
+        token_rate_limit: int = 5,
+        latency_ms: float = 0.0,
+        tick_interval: float = 0.2,
+        cash: int = 100_000_000,
+    ):
+        self.market = market or SyntheticMarket()
+        self.latency = latency_ms / 1000
+        self.tick_interval = tick_interval
+
+        self._limiter = SlidingWindowLimiter(rate_limit)
+        self._token_limiter = SlidingWindowLimiter(token_rate_limit)
+
+        self.cash = cash
+        self.holdings: Dict[str, Tuple[int, int]] = {}  # stk_cd -> (qty, avg price)
+        self.orders: Dict[str, SimOrder] = {}
+        self._order_seq = itertools.count(1)
+        self._unpublished: List[SimOrder] = []  # Filled since the last 00/04 push
+
+        self._subscribers: Set[_Subscriber] = set()
+
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+        self.ws_frames = 0
+
+        self._handlers: Dict[str, Callable[[dict, str], HandlerResult]] = {
+            "ka10001": self._stock_info,
+            "ka10004": self._orderbook,
+            "ka10081": self._daily_chart,
+            "ka10099": self._stock_list,
+            "kt00001": self._cash_balance,
+            "kt00004": self._account_balance,
+            "ka10075": self._pending_orders,
+            "ka10076": self._filled_orders,
+            "kt10000": self._buy_order,
+            "kt10001": self._sell_order,
+            "kt10002": self._modify_order,
+            "kt10003": self._cancel_order,
+        }
+
+    def stats(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "rate_limited": self.rate_limited,
+            "ws_connections": len(self._subscribers),
+            "ws_frames": self.ws_frames,
+        }
+
+    # -------------------------------------------
+    # App
+    # -------------------------------------------
+
+    def create_app(self) -> FastAPI:
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            task = asyncio.create_task(self._stream_loop())
+            yield
+            task.cancel()
+
+        app = FastAPI(title="Kiwoom simulator", lifespan=lifespan)
+
+        @app.post("/oauth2/token")
+        async def issue_token(request: Request):
+            body = await request.json()
+            appkey = body.get("appkey")
+            if not appkey or not body.get("secretkey"):
+                return {"return_code": 3, "return_msg": "appkey 또는 secretkey 입력값이 없습니다"}
+            if not self._token_limiter.hit(appkey):
+                self.rate_limited += 1
+                return JSONResponse(
+                    {"return_code": RATE_LIMIT_RETURN_CODE, "return_msg": RATE_LIMIT_MSG.format(api_id="au10001")},
+                    status_code=429,
+                )
+            self.requests["au10001"] += 1
+            return {
+                "token": uuid.uuid4().hex,
+                "token_type": "bearer",
+                "expires_dt": (datetime.now() + timedelta(hours=24)).strftime("%Y%m%d%H%M%S"),
+                "return_code": 0,
+                "return_msg": OK_MSG,
+            }
+
+        @app.post("/api/dostk/{group}")
+        async def call_api(group: str, request: Request):
+            api_id = request.headers.get("api-id", "")
+            auth = request.headers.get("authorization", "")
+            token = auth[7:] if auth.lower().startswith("bearer ") else ""
+            if not token:
+                return {"return_code": 3, "return_msg": INVALID_TOKEN_MSG}
+
+            kind = "order" if api_id in ORDER_API_IDS else "query"
+            if not self._limiter.hit((token, kind)):
+                self.rate_limited += 1
+                return JSONResponse(
+                    {"return_code": RATE_LIMIT_RETURN_CODE, "return_msg": RATE_LIMIT_MSG.format(api_id=api_id)},
+                    status_code=429,
+                )
+
+            handler = self._handlers.get(api_id)
+            if handler is None:
+                return {"return_code": 2, "return_msg": f"지원하지 않는 API ID입니다 ({api_id})"}
+
+            self.requests[api_id] += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+            body = await request.json()
+            next_key = request.headers.get("next-key", "") if request.headers.get("cont-yn") == "Y" else ""
+            payload, more = handler(body, next_key)
+            payload.setdefault("return_code", 0)
+            payload.setdefault("return_msg", OK_MSG)
+
+            headers = {"api-id": api_id, "cont-yn": "Y" if more else "N", "next-key": more or ""}
+            if api_id in ORDER_API_IDS and payload["return_code"] == 0:
+                await self._publish_fills()
+            return JSONResponse(payload, headers=headers)
+
+        @app.websocket("/api/dostk/websocket")
+        async def realtime(websocket: WebSocket):
+            await websocket.accept()
+            subscriber = _Subscriber(websocket)
+            self._subscribers.add(subscriber)
+            try:
+                while True:
+                    message = json.loads(await websocket.receive_text())
+                    header = message.get("header", {})
+                    rq_type = header.get("rq_type", "")
+                    codes = set(message.get("body", {}).get("stk_cds", []))
+                    if header.get("tr_type") == "1":
+                        subscriber.types.setdefault(rq_type, set()).update(codes)
+                    elif header.get("tr_type") == "2":
+                        remaining = subscriber.types.get(rq_type, set()) - codes
+                        if codes and remaining:
+                            subscriber.types[rq_type] = remaining
+                        else:
+                            subscriber.types.pop(rq_type, None)
+            except (WebSocketDisconnect, ValueError):
+                pass
+            finally:
+                self._subscribers.discard(subscriber)
+
+        @app.get("/stats")
+        async def get_stats():
+            return self.stats()
+
+        return app
+
+    # -------------------------------------------
+    # Quotes
+    # -------------------------------------------
+
+    def _stock_info(self, body: dict, next_key: str) -> HandlerResult:
+        stk_cd = body.get("stk_cd", "")
+        bars = self.market.daily_bars(stk_cd)
+        price = self.market.stock_price(stk_cd)
+        prev = self.market.prev_close(stk_cd)
+        change = price - prev
+        return {
+            "stk_cd": stk_cd,
+            "stk_nm": self.market.stock_name(stk_cd),
+            "cur_prc": signed(price, prev),
+            "pred_pre": f"{change:+d}" if change else "0",
+            "flu_rt": f"{change / prev * 100:+.2f}",
+            "trde_qty": str(self.market.stock_volume(stk_cd)),
+            "open_pric": signed(int(bars["open"][-1]), prev),
+            "high_pric": signed(max(int(bars["high"][-1]), price), prev),
+            "low_pric": signed(min(int(bars["low"][-1]), price), prev),
+            "upl_pric": f"+{int(prev * 1.3)}",
+            "lst_pric": f"-{int(prev * 0.7)}",
+            "per": "12.40",
+            "pbr": "1.10",
+            "eps": str(max(1, price // 12)),
+            "bps": str(max(1, price * 10 // 11)),
+            "mac": str(price * 10_000_000 // 100_000_000),  # 억원
+        }, None
+
+    def _book(self, stk_cd: str) -> dict:
+        price = self.market.stock_price(stk_cd)
+        tick = tick_size(price)
+        seed = price + int(stk_cd) if stk_cd.isdigit() else price
+        book = {}
+        for i in range(1, ORDERBOOK_LEVELS + 1):
+            book[f"sell_hoga_{i}"] = str(price + i * tick)
+            book[f"sell_hoga_qty_{i}"] = str(100 + (seed * i) % 900)
+            book[f"buy_hoga_{i}"] = str(max(1, price - (i - 1) * tick))
+            book[f"buy_hoga_qty_{i}"] = str(100 + (seed * (i + 7)) % 900)
+        book["tot_sell_qty"] = str(sum(int(book[f"sell_hoga_qty_{i}"]) for i in range(1, ORDERBOOK_LEVELS + 1)))
+        book["tot_buy_qty"] = str(sum(int(book[f"buy_hoga_qty_{i}"]) for i in range(1, ORDERBOOK_LEVELS + 1)))
+        return book
+
+    def _orderbook(self, body: dict, next_key: str) -> HandlerResult:
+        return self._book(body.get("stk_cd", "")), None
+
+    def _daily_chart(self, body: dict, next_key: str) -> HandlerResult:
+        stk_cd = body.get("stk_cd", "")
+        bars = self.market.daily_bars(stk_cd)
+        offset = int(next_key) if next_key.isdigit() else 0
+        newest = len(self.market.dates) - 1 - offset
+        oldest = max(-1, newest - CHART_PAGE_SIZE)
+
+        rows = []
+        for i in range(newest, oldest, -1):
+            close, volume = int(bars["close"][i]), int(bars["volume"][i])
+            rows.append({
+                "dt": self.market.dates[i],
+                "open_pric": str(int(bars["open"][i])),
+                "high_pric": str(int(bars["high"][i])),
+                "low_pric": str(int(bars["low"][i])),
+                "cur_prc": str(close),
+                "trde_qty": str(volume),
+                "trde_prica": str(close * volume // 1_000_000),  # 백만원
+            })
+
+        more = str(offset + CHART_PAGE_SIZE) if oldest >= 0 else None
+        return {"stk_cd": stk_cd, "stk_dt_pole_chart_qry": rows}, more
+
+    def _stock_list(self, body: dict, next_key: str) -> HandlerResult:
+        market_name = {"0": "코스피", "10": "코스닥"}.get(body.get("mrkt_tp", "0"))
+        stocks = [s for s in self.market.stocks if s[2] == market_name]
+        offset = int(next_key) if next_key.isdigit() else 0
+        page = stocks[offset:offset + STOCK_LIST_PAGE_SIZE]
+
+        items = [
+            {
+                "code": code,
+                "name": name,
+                "listCount": "0000000010000000",
+                "auditInfo": "정상",
+                "regDay": "20000101",
+                "lastPrice": str(self.market.prev_close(code)),
+                "state": "증거금20%",
+                "marketCode": body.get("mrkt_tp", "0"),
+                "marketName": market,
+                "upName": "",
+                "upSizeName": "",
+                "companyClassName": "",
+                "orderWarning": "0",
+                "nxtEnable": "N",
+            }
+            for code, name, market in page
+        ]
+        more = str(offset + STOCK_LIST_PAGE_SIZE) if offset + STOCK_LIST_PAGE_SIZE < len(stocks) else None
+        return {"list": items}, more
+
+    # -------------------------------------------
+    # Account
+    # -------------------------------------------
+
+    def _cash_balance(self, body: dict, next_key: str) -> HandlerResult:
+        cash = str(self.cash)
+        return {
+            "entr": cash,
+            "ord_alow_amt": cash,
+            "pymn_alow_amt": cash,
+            "d1_pymn_alow_amt": cash,
+            "d2_pymn_alow_amt": cash,
+        }, None
+
+    def _account_balance(self, body: dict, next_key: str) -> HandlerResult:
+        rows = []
+        total_buy = total_eval = 0
+        for stk_cd, (qty, avg) in self.holdings.items():
+            price = self.market.stock_price(stk_cd)
+            buy, value = qty * avg, qty * price
+            total_buy += buy
+            total_eval += value
+            rows.append({
+                "stk_cd": stk_cd,
+                "stk_nm": self.market.stock_name(stk_cd),
+                "rmnd_qty": str(qty),
+                "hldg_qty": str(qty),
+                "avg_prc": str(avg),
+                "pchs_avg_pric": str(avg),
+                "cur_prc": str(price),
+                "evlt_amt": str(value),
+                "evlt_lspft_amt": str(value - buy),
+                "evlt_lspft_rt": f"{(value / buy - 1) * 100:.2f}" if buy else "0.00",
+            })
+        return {
+            "stk_acnt_evlt_prst": rows,
+            "tot_pur_amt": str(total_buy),
+            "aset_evlt_amt": str(self.cash + total_eval),
+            "lspft_amt": str(total_eval - total_buy),
+            "lspft_rt": f"{(total_eval / total_buy - 1) * 100:.2f}" if total_buy else "0.00",
+            "d2_entra": str(self.cash),
+        }, None
+
+    def _order_row(self, order: SimOrder) -> dict:
+        return {
+            "ord_no": order.ord_no,
+            "stk_cd": order.stk_cd,
+            "stk_nm": self.market.stock_name(order.stk_cd),
+            "ord_qty": str(order.ord_qty),
+            "ord_uv": str(order.ord_uv),
+            "ccld_qty": str(order.ccld_qty),
+            "rmn_qty": str(order.rmn_qty),
+            "ord_dt": order.ord_dt,
+            "ord_tm": order.ord_tm,
+            "buy_sell_tp": order.buy_sell_tp,
+        }
+
+    def _pending_orders(self, body: dict, next_key: str) -> HandlerResult:
+        return {"output": [self._order_row(o) for o in self.orders.values() if o.rmn_qty > 0]}, None
+
+    def _filled_orders(self, body: dict, next_key: str) -> HandlerResult:
+        rows = [
+            {
+                "ord_no": o.ord_no,
+                "stk_cd": o.stk_cd,
+                "stk_nm": self.market.stock_name(o.stk_cd),
+                "ccld_qty": str(o.ccld_qty),
+                "ccld_uv": str(o.ccld_uv),
+                "ccld_amt": str(o.ccld_qty * o.ccld_uv),
+                "ccld_dt": o.ord_dt,
+                "ccld_tm": o.ord_tm,
+                "buy_sell_tp": o.buy_sell_tp,
+            }
+            for o in self.orders.values()
+            if o.ccld_qty > 0
+        ]
+        return {"output": rows}, None
+
+    # -------------------------------------------
+    # Orders
+    # -------------------------------------------
+
+    def _next_order_no(self) -> str:
+        return f"{next(self._order_seq):07d}"
+
+    def _order_error(self, message: str) -> HandlerResult:
+        return {"return_code": 20, "return_msg": message}, None
+
+    def _place(self, body: dict, buy_sell_tp: str) -> HandlerResult:
+        stk_cd = body.get("stk_cd", "")
+        qty = int(body.get("ord_qty") or 0)
+        price = self.market.stock_price(stk_cd)
+        limit = int(body.get("ord_uv") or 0)
+        if qty <= 0:
+            return self._order_error("주문수량을 확인하세요")
+
+        is_market = body.get("trde_tp", "3") in ("3", "13", "23") or not limit
+        fill_price = price if is_market else limit
+        marketable = is_market or (limit >= price if buy_sell_tp == "2" else limit <= price)
+
+        if buy_sell_tp == "2" and fill_price * qty > self.cash:
+            return self._order_error("[2000](800100:모의투자 주문가능금액이 부족합니다)")
+        if buy_sell_tp == "1" and self.holdings.get(stk_cd, (0, 0))[0] < qty:
+            return self._order_error("[2000](800033:모의투자 매도가능수량이 부족합니다)")
+
+        now = datetime.now()
+        order = SimOrder(
+            ord_no=self._next_order_no(),
+            stk_cd=stk_cd,
+            buy_sell_tp=buy_sell_tp,
+            ord_qty=qty,
+            ord_uv=limit,
+            ord_dt=now.strftime("%Y%m%d"),
+            ord_tm=now.strftime("%H%M%S"),
+        )
+        self.orders[order.ord_no] = order
+        if marketable:
+            self._fill(order, fill_price)
+        return {"ord_no": order.ord_no, "dmst_stex_tp": body.get("dmst_stex_tp", "KRX")}, None
+
+    def _fill(self, order: SimOrder, price: int) -> None:
+        qty = order.rmn_qty
+        held, avg = self.holdings.get(order.stk_cd, (0, 0))
+        if order.buy_sell_tp == "2":
+            self.cash -= qty * price
+            avg = (held * avg + qty * price) // (held + qty)
+            held += qty
+        else:
+            self.cash += qty * price
+            held -= qty
+        if held:
+            self.holdings[order.stk_cd] = (held, avg)
+        else:
+            self.holdings.pop(order.stk_cd, None)
+        order.ccld_qty += qty
+        order.ccld_uv = price
+        self._unpublished.append(order)
+
+    def _buy_order(self, body: dict, next_key: str) -> HandlerResult:
+        return self._place(body, "2")
+
+    def _sell_order(self, body: dict, next_key: str) -> HandlerResult:
+        return self._place(body, "1")
+
+    def _modify_order(self, body: dict, next_key: str) -> HandlerResult:
+        original = self.orders.get(body.get("org_ord_no", ""))
+        if original is None or original.rmn_qty <= 0:
+            return self._order_error("[2000](800131:원주문번호가 존재하지 않습니다)")
+
+        qty = int(body.get("mdfy_qty") or body.get("ord_qty") or original.rmn_qty)
+        price = int(body.get("mdfy_uv") or body.get("ord_uv") or original.ord_uv)
+        original.ord_qty = original.ccld_qty  # Remainder moves to the new order
+        order = SimOrder(
+            ord_no=self._next_order_no(),
+            stk_cd=original.stk_cd,
+            buy_sell_tp=original.buy_sell_tp,
+            ord_qty=qty,
+            ord_uv=price,
+            ord_dt=original.ord_dt,
+            ord_tm=datetime.now().strftime("%H%M%S"),
+        )
+        self.orders[order.ord_no] = order
+        current = self.market.stock_price(order.stk_cd)
+        if (price >= current) if order.buy_sell_tp == "2" else (price <= current):
+            self._fill(order, price)
+        return {"ord_no": order.ord_no, "base_orig_ord_no": original.ord_no}, None
+
+    def _cancel_order(self, body: dict, next_key: str) -> HandlerResult:
+        original = self.orders.get(body.get("org_ord_no", ""))
+        if original is None or original.rmn_qty <= 0:
+            return self._order_error("[2000](800131:원주문번호가 존재하지 않습니다)")
+        cancelled = original.rmn_qty
+        original.ord_qty = original.ccld_qty
+        return {"ord_no": self._next_order_no(), "base_orig_ord_no": original.ord_no, "cncl_qty": str(cancelled)}, None
+
+    # -------------------------------------------
+    # Real-time
+    # -------------------------------------------
+
+    async def _send(self, subscriber: _Subscriber, rq_type: str, body: dict) -> None:
+        try:
+            await subscriber.websocket.send_text(json.dumps({"header": {"rq_type": rq_type}, "body": body}, ensure_ascii=False))
+            self.ws_frames += 1
+        except Exception:
+            self._subscribers.discard(subscriber)
+
+    async def _publish_fills(self) -> None:
+        """Order execution (00) and balance (04) frames for new fills."""
+        fills, self._unpublished = self._unpublished, []
+        for order in fills:
+            now = datetime.now().strftime("%H%M%S")
+            held, avg = self.holdings.get(order.stk_cd, (0, 0))
+            price = self.market.stock_price(order.stk_cd)
+            execution = {
+                "stk_cd": order.stk_cd,
+                "stk_nm": self.market.stock_name(order.stk_cd),
+                "ord_no": order.ord_no,
+                "ord_qty": str(order.ord_qty),
+                "ord_prc": str(order.ord_uv),
+                "ccld_qty": str(order.ccld_qty),
+                "ccld_prc": str(order.ccld_uv),
+                "rmn_qty": str(order.rmn_qty),
+                "ord_tp": "+매수" if order.buy_sell_tp == "2" else "-매도",
+                "ccld_tm": now,
+            }
+            balance = {
+                "stk_cd": order.stk_cd,
+                "stk_nm": self.market.stock_name(order.stk_cd),
+                "hldg_qty": str(held),
+                "ord_psbl_qty": str(held),
+                "avg_buy_prc": str(avg),
+                "cur_prc": str(price),
+                "evlu_amt": str(held * price),
+                "evlu_pfls_amt": str(held * (price - avg)),
+                "evlu_pfls_rt": f"{(price / avg - 1) * 100:.2f}" if avg else "0.00",
+            }
+            for subscriber in list(self._subscribers):
+                if subscriber.wants("00"):
+                    await self._send(subscriber, "00", execution)
+                if subscriber.wants("04"):
+                    await self._send(subscriber, "04", balance)
+
+    def _tick_frame(self, stk_cd: str) -> dict:
+        price, qty = self.market.step_stock(stk_cd)
+        prev = self.market.prev_close(stk_cd)
+        bars = self.market.daily_bars(stk_cd)
+        volume = self.market.stock_volume(stk_cd)
+        return {
+            "stk_cd": stk_cd,
+            "stk_nm": self.market.stock_name(stk_cd),
+            "cur_prc": signed(price, prev),
+            "prdy_vrss": f"{price - prev:+d}" if price != prev else "0",
+            "prdy_ctrt": f"{(price / prev - 1) * 100:+.2f}",
+            "acml_vol": str(volume),
+            "acml_tr_pbmn": str(volume * price),
+            "ccld_qty": f"+{qty}" if qty % 2 else f"-{qty}",
+            "ccld_tm": datetime.now().strftime("%H%M%S"),
+            "ask_bid": "1" if qty % 2 else "2",
+            "strt_prc": str(int(bars["open"][-1])),
+            "high_prc": str(max(int(bars["high"][-1]), price)),
+            "low_prc": str(min(int(bars["low"][-1]), price)),
+        }
+
+    async def _stream_loop(self) -> None:
+        """Push a tick (0B) and order book (0D) frame per subscribed stock each interval."""
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            subscribers = list(self._subscribers)
+            for rq_type, build in (("0B", self._tick_frame), ("0D", self._book_frame)):
+                codes = set().union(*(s.types.get(rq_type, set()) for s in subscribers))
+                for stk_cd in codes:
+                    body = build(stk_cd)
+                    for subscriber in subscribers:
+                        if subscriber.wants(rq_type, stk_cd):
+                            await self._send(subscriber, rq_type, body)
+
+    def _book_frame(self, stk_cd: str) -> dict:
+        book = self._book(stk_cd)
+        book["stk_cd"] = stk_cd
+        book["stk_nm"] = self.market.stock_name(stk_cd)
+        return book
@@ -0,0 +1,39 @@
+"""
+Server-side Rate Limits for the Stand-in Servers
+
+Exchanges count requests in a rolling window per key (token, IP) and
+reject the overflow outright instead of queueing it, which is what the
+client-side limiters and retry paths have to cope with.
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Hashable
+
+
+class SlidingWindowLimiter:
+    """At most `limit` hits per key in any rolling `window` seconds."""
+
+    def __init__(self, limit: int, window: float = 1.0):
+        self.limit = limit
+        self.window = window
+        self._hits: Dict[Hashable, Deque[float]] = {}
+
+    def _prune(self, key: Hashable, now: float) -> Deque[float]:
+        hits = self._hits.setdefault(key, deque())
+        while hits and now - hits[0] >= self.window:
+            hits.popleft()
+        return hits
+
+    def hit(self, key: Hashable) -> bool:
+        """Count a request; False when it is over the limit (not counted)."""
+        now = time.monotonic()
+        hits = self._prune(key, now)
+        if len(hits) >= self.limit:
+            return False
+        hits.append(now)
+        return True
+
+    def remaining(self, key: Hashable) -> int:
+        """Requests still allowed in the current window."""
+        return max(0, self.limit - len(self._prune(key, time.monotonic())))
@@ -0,0 +1,207 @@
+"""
+Synthetic Market Data for the Stand-in Servers
+
+Deterministic daily bars per stock code (regenerated on demand, so the
+whole universe is never held in memory) and live random-walk prices for
+stocks and coins that move each time a stream frame is produced.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Real tickers first so dashboards and logs look familiar
+MAJOR_STOCKS = [
+    ("005930", "삼성전자"),
+    ("000660", "SK하이닉스"),
+    ("035420", "NAVER"),
+    ("005380", "현대차"),
+    ("035720", "카카오"),
+    ("068270", "셀트리온"),
+    ("247540", "에코프로비엠"),
+    ("086520", "에코프로"),
+]
+
+MAJOR_COINS = [
+    ("KRW-BTC", "비트코인", "Bitcoin", 95_000_000.0),
+    ("KRW-ETH", "이더리움", "Ethereum", 4_200_000.0),
+    ("KRW-XRP", "리플", "XRP", 3_100.0),
+    ("KRW-SOL", "솔라나", "Solana", 240_000.0),
+    ("KRW-DOGE", "도지코인", "Dogecoin", 420.0),
+    ("KRW-ADA", "에이다", "Cardano", 1_050.0),
+]
+
+
+def business_days(end: date, count: int) -> List[str]:
+    """`count` weekdays ending at `end` (oldest first) as YYYYMMDD."""
+    days = []
+    day = end
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day.strftime("%Y%m%d"))
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+class SyntheticMarket:
+    """
+    Market state shared by the Kiwoom and Upbit simulators.
+
+    Stocks are (code, name, market_name); codes of the synthetic part of
+    the universe are zero-padded indexes. Bars depend only on the seed
+    and the code, so every process serves identical histories.
+    """
+
+    BARS = 800  # Daily bars per stock (more than one ka10081 page)
+    BAR_CACHE_SIZE = 512  # Stocks whose bars are kept generated
+
+    def __init__(self, stocks: int = 2500, coins: int = 30, seed: int = 42):
+        self.seed = seed
+        self.stocks: List[Tuple[str, str, str]] = []
+        for i in range(stocks):
+            if i < len(MAJOR_STOCKS):
+                code, name = MAJOR_STOCKS[i]
+            else:
+                code, name = f"{i + 1:06d}", f"종목{i + 1:06d}"
+            self.stocks.append((code, name, "코스피" if i % 2 == 0 else "코스닥"))
+        self._names = {code: name for code, name, _ in self.stocks}
+
+        self.coins: List[Tuple[str, str, str]] = []
+        self._coin_prices: Dict[str, float] = {}
+        self._coin_prev_close: Dict[str, float] = {}
+        self._coin_volume: Dict[str, float] = {}
+        for i in range(coins):
+            if i < len(MAJOR_COINS):
+                market, korean, english, price = MAJOR_COINS[i]
+            else:
+                market, korean, english = f"KRW-C{i:03d}", f"코인{i:03d}", f"Coin{i:03d}"
+                price = float(10 ** (1 + i % 5))
+            self.coins.append((market, korean, english))
+            self._coin_prices[market] = price
+            self._coin_prev_close[market] = price
+            self._coin_volume[market] = 0.0
+
+        self.dates = business_days(date.today(), self.BARS)
+        self._bars: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+        self._live: Dict[str, int] = {}
+        self._volume: Dict[str, int] = {}
+        self._rng = np.random.default_rng(seed)
+
+    # -------------------------------------------
+    # Stocks
+    # -------------------------------------------
+
+    def has_stock(self, code: str) -> bool:
+        return code in self._names
+
+    def stock_name(self, code: str) -> str:
+        return self._names.get(code, f"종목{code}")
+
+    def daily_bars(self, code: str) -> Dict[str, np.ndarray]:
+        """OHLCV arrays (oldest first) for a stock."""
+        bars = self._bars.get(code)
+        if bars is not None:
+            self._bars.move_to_end(code)
+            return bars
+
+        key = int(code) if code.isdigit() else sum(map(ord, code))
+        rng = np.random.default_rng([self.seed, key])
+        vol = rng.uniform(0.01, 0.04)
+        returns = rng.normal(0.0003, vol, self.BARS)
+        close = np.round(rng.uniform(1_000, 200_000) * np.exp(np.cumsum(returns)))
+        open_ = np.round(close * np.exp(rng.normal(0, vol * 0.3, self.BARS)))
+        spread = np.abs(rng.normal(0, vol * 0.5, self.BARS))
+        bars = {
+            "open": open_.astype(np.int64),
+            "high": np.round(np.maximum(open_, close) * (1 + spread)).astype(np.int64),
+            "low": np.round(np.minimum(open_, close) * (1 - spread)).astype(np.int64),
+            "close": close.astype(np.int64),
+            "volume": rng.lognormal(11, 1.0, self.BARS).astype(np.int64),
+        }
+
+        self._bars[code] = bars
+        if len(self._bars) > self.BAR_CACHE_SIZE:
+            self._bars.popitem(last=False)
+        return bars
+
+    def prev_close(self, code: str) -> int:
+        return int(self.daily_bars(code)["close"][-2])
+
+    def stock_price(self, code: str) -> int:
+        """Current price (starts at the last daily close)."""
+        price = self._live.get(code)
+        if price is None:
+            price = int(self.daily_bars(code)["close"][-1])
+            self._live[code] = price
+            self._volume[code] = int(self.daily_bars(code)["volume"][-1])
+        return price
+
+    def stock_volume(self, code: str) -> int:
+        self.stock_price(code)
+        return self._volume[code]
+
+    def step_stock(self, code: str) -> Tuple[int, int]:
+        """Move a stock by one trade; returns (price, traded quantity)."""
+        price = self.stock_price(code)
+        price = max(1, int(round(price * (1 + self._rng.normal(0, 0.0008)))))
+        qty = int(self._rng.integers(1, 500))
+        self._live[code] = price
+        self._volume[code] += qty
+        return price, qty
+
+    # -------------------------------------------
+    # Coins
+    # -------------------------------------------
+
+    def has_coin(self, market: str) -> bool:
+        return market in self._coin_prices
+
+    def coin_price(self, market: str) -> float:
+        return self._coin_prices[market]
+
+    def coin_prev_close(self, market: str) -> float:
+        return self._coin_prev_close[market]
+
+    def coin_volume(self, market: str) -> float:
+        return self._coin_volume[market]
+
+    def step_coin(self, market: str) -> Tuple[float, float]:
+        """Move a coin by one trade; returns (price, traded volume)."""
+        price = self._coin_prices[market] * (1 + self._rng.normal(0, 0.0005))
+        price = round(price, 2 if price < 100 else 0)
+        volume = round(float(self._rng.lognormal(-2, 1.0)), 8)
+        self._coin_prices[market] = price
+        self._coin_volume[market] += volume
+        return price, volume
+
+    def coin_candles(self, market: str, seconds: int, count: int, to_ms: int = 0) -> List[dict]:
+        """
+        Candles (newest first) walking back from the current price.
+
+        Seeded by market, interval and end time, so repeated requests for
+        the same window return the same candles.
+        """
+        end_ms = to_ms or int(time.time() * 1000)
+        end_ms -= end_ms % (seconds * 1000)
+        rng = np.random.default_rng([self.seed, sum(map(ord, market)), seconds, end_ms // 1000])
+
+        vol = 0.002 * max(1.0, (seconds / 60) ** 0.5)
+        close = self._coin_prices[market] / np.exp(np.cumsum(rng.normal(0, vol, count)))
+        open_ = close * np.exp(rng.normal(0, vol * 0.5, count))
+        spread = np.abs(rng.normal(0, vol * 0.5, count))
+        volume = rng.lognormal(0, 1.0, count)
+
+        return [
+            {
+                "start_ms": end_ms - i * seconds * 1000,
+                "open": float(open_[i]),
+                "high": float(max(open_[i], close[i]) * (1 + spread[i])),
+                "low": float(min(open_[i], close[i]) * (1 - spread[i])),
+                "close": float(close[i]),
+                "volume": float(volume[i]),
+            }
+            for i in range(count)
+        ]
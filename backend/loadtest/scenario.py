@@ -0,0 +1,285 @@
+"""
+Load-Test Scenario Driver
+
+Drives a running backend through its public API only:
+- N concurrent KR stock analyses (POST /analysis/start, polled to the end)
+- one full background scan (POST /scanner/start, progress polled)
+- M dashboard sockets on /ws/ticker for the whole run
+
+and reports p50/p99 latencies and throughput per workload, plus the
+request/rate-limit counters of the stand-in servers over the run.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import httpx
+import websockets
+
+from .market import MAJOR_STOCKS, SyntheticMarket
+from .stats import LatencyRecorder
+
+ANALYSIS_DONE = {"awaiting_approval", "completed", "error", "cancelled"}
+SCAN_DONE = {"completed", "failed", "idle"}
+GAUGES = {"ws_connections", "active", "queued"}  # Stand-in stats that are not counters
+
+WORKLOADS = (
+    "analysis.start",
+    "analysis.total",
+    "scan.poll",
+    "scan.total",
+    "scan.stocks",
+    "socket.connect",
+    "socket.delivery",
+)
+
+
+@dataclass
+class ScenarioConfig:
+    """What to run against the backend at `target`."""
+    target: str = "http://127.0.0.1:8000"
+    analyses: int = 10
+    stocks: List[str] = field(default_factory=lambda: [code for code, _ in MAJOR_STOCKS])
+    scan: bool = True
+    scan_use_llm: bool = False
+    scan_stocks: Optional[int] = None  # None = the backend's full stock list
+    sockets: int = 50
+    markets: List[str] = field(default_factory=lambda: ["KRW-BTC", "KRW-ETH", "KRW-XRP"])
+    duration: float = 30.0  # Minimum run time (sockets stay open at least this long)
+    poll_interval: float = 1.0
+    timeout: float = 900.0  # Per analysis / scan
+    stand_ins: Dict[str, str] = field(default_factory=dict)  # name -> base URL serving /stats
+
+
+@dataclass
+class ScenarioReport:
+    config: ScenarioConfig
+    wall_time: float
+    workloads: Dict[str, dict]
+    stand_ins: Dict[str, dict]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# -------------------------------------------
+# Workloads
+# -------------------------------------------
+
+
+async def run_analysis(
+    client: httpx.AsyncClient,
+    config: ScenarioConfig,
+    stk_cd: str,
+    recorders: Dict[str, LatencyRecorder],
+) -> None:
+    """Start one analysis and poll it until it stops running."""
+    started = time.perf_counter()
+    try:
+        with recorders["analysis.start"].measure():
+            response = await client.post("/api/kr_stocks/analysis/start", json={"stk_cd": stk_cd})
+            response.raise_for_status()
+        session_id = response.json()["session_id"]
+
+        while time.perf_counter() - started < config.timeout:
+            await asyncio.sleep(config.poll_interval)
+            response = await client.get(f"/api/kr_stocks/analysis/status/{session_id}")
+            response.raise_for_status()
+            status = response.json().get("status")
+            if status in ANALYSIS_DONE:
+                if status in ("error", "cancelled"):
+                    recorders["analysis.total"].error()
+                else:
+                    recorders["analysis.total"].record(time.perf_counter() - started, started)
+                return
+        recorders["analysis.total"].error()  # Timed out
+    except (httpx.HTTPError, KeyError, ValueError):
+        recorders["analysis.total"].error()
+
+
+async def run_scan(
+    client: httpx.AsyncClient,
+    config: ScenarioConfig,
+    recorders: Dict[str, LatencyRecorder],
+) -> None:
+    """Run one background scan to completion, polling progress like the dashboard."""
+    request = {"notify_progress": False, "use_llm": config.scan_use_llm, "auto_gpu_scaling": False}
+    if config.scan_stocks:
+        request["custom_stocks"] = [list(s) for s in SyntheticMarket(stocks=config.scan_stocks).stocks]
+
+    started = time.perf_counter()
+    recorders["scan.stocks"].count(0)
+    try:
+        response = await client.post("/api/scanner/start", json=request)
+        response.raise_for_status()
+
+        while time.perf_counter() - started < config.timeout:
+            await asyncio.sleep(config.poll_interval)
+            with recorders["scan.poll"].measure():
+                response = await client.get("/api/scanner/progress")
+                response.raise_for_status()
+            progress = response.json()
+            if progress.get("status") in SCAN_DONE:
+                recorders["scan.stocks"].count(progress.get("completed", 0))
+                if progress.get("status") == "completed":
+                    recorders["scan.total"].record(time.perf_counter() - started, started)
+                else:
+                    recorders["scan.total"].error()
+                return
+        recorders["scan.total"].error()  # Timed out
+    except (httpx.HTTPError, ValueError):
+        recorders["scan.total"].error()
+
+
+async def run_dashboard_socket(
+    config: ScenarioConfig,
+    stop: asyncio.Event,
+    recorders: Dict[str, LatencyRecorder],
+) -> None:
+    """
+    One dashboard ticker socket until `stop` is set.
+
+    Delivery latency is receive time minus the ticker's trade_timestamp,
+    i.e. stand-in stream -> backend -> client (same clock on one box).
+    """
+    url = config.target.replace("https://", "wss://").replace("http://", "ws://") + "/ws/ticker"
+    try:
+        with recorders["socket.connect"].measure():
+            ws = await websockets.connect(url)
+    except (OSError, websockets.WebSocketException):
+        return
+
+    delivery = recorders["socket.delivery"]
+    try:
+        await ws.send(json.dumps({"action": "subscribe", "markets": config.markets}))
+        while not stop.is_set():
+            try:
+                message = json.loads(await asyncio.wait_for(ws.recv(), timeout=0.5))
+            except asyncio.TimeoutError:
+                continue
+            if message.get("type") == "ticker" and message.get("trade_timestamp"):
+                delivery.record(max(0.0, time.time() - message["trade_timestamp"] / 1000))
+    except websockets.WebSocketException:
+        delivery.error()
+    finally:
+        await ws.close()
+
+
+# -------------------------------------------
+# Stand-in counters
+# -------------------------------------------
+
+
+async def fetch_stand_in_stats(stand_ins: Dict[str, str]) -> Dict[str, dict]:
+    """GET /stats of each stand-in (missing ones are left out)."""
+    stats = {}
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        for name, url in stand_ins.items():
+            try:
+                response = await client.get(f"{url.rstrip('/')}/stats")
+                stats[name] = response.json()
+            except (httpx.HTTPError, ValueError):
+                continue
+    return stats
+
+
+def diff_stats(before: dict, after: dict) -> dict:
+    """Counters over the run; gauges keep their final value."""
+    result = {}
+    for key, value in after.items():
+        old = before.get(key)
+        if isinstance(value, dict):
+            result[key] = diff_stats(old or {}, value)
+        elif isinstance(value, (int, float)) and isinstance(old, (int, float)) and key not in GAUGES:
+            result[key] = value - old
+        else:
+            result[key] = value
+    return result
+
+
+# -------------------------------------------
+# Scenario
+# -------------------------------------------
+
+
+async def run_scenario(config: ScenarioConfig) -> ScenarioReport:
+    recorders = {name: LatencyRecorder(name) for name in WORKLOADS}
+    before = await fetch_stand_in_stats(config.stand_ins)
+
+    stop = asyncio.Event()
+    started = time.perf_counter()
+    async with httpx.AsyncClient(base_url=config.target, timeout=60.0) as client:
+        sockets = [
+            asyncio.create_task(run_dashboard_socket(config, stop, recorders))
+            for _ in range(config.sockets)
+        ]
+
+        work = [
+            run_analysis(client, config, config.stocks[i % len(config.stocks)], recorders)
+            for i in range(config.analyses)
+        ]
+        if config.scan:
+            work.append(run_scan(client, config, recorders))
+        await asyncio.gather(*work)
+
+        remaining = config.duration - (time.perf_counter() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        stop.set()
+        await asyncio.gather(*sockets)
+    wall_time = time.perf_counter() - started
+
+    after = await fetch_stand_in_stats(config.stand_ins)
+    return ScenarioReport(
+        config=config,
+        wall_time=wall_time,
+        workloads={name: r.summary() for name, r in recorders.items() if r.samples or r.errors or r.events},
+        stand_ins={name: diff_stats(before.get(name, {}), stats) for name, stats in after.items()},
+    )
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1e3:.1f} ms"
+
+
+def render_report(report: ScenarioReport) -> str:
+    """Markdown report: one row per workload, then stand-in counters."""
+    config = report.config
+    lines = [
+        f"# Load test against {config.target}",
+        "",
+        f"{config.analyses} analyses, scan: {'LLM' if config.scan_use_llm else 'quick' if config.scan else 'off'}, "
+        f"{config.sockets} dashboard sockets, wall time {report.wall_time:.1f} s",
+        "",
+        "| Workload | Count | Errors | p50 | p99 | Max | Throughput (/s) |",
+        "|---|---:|---:|---:|---:|---:|---:|",
+    ]
+    for name, s in report.workloads.items():
+        count = s["count"] or s["events"]
+        throughput = f"{s['throughput']:.1f}" if s["throughput"] else "-"
+        lines.append(
+            f"| {name} | {count} | {s['errors']} | {_format_seconds(s['p50'])} | "
+            f"{_format_seconds(s['p99'])} | {_format_seconds(s['max'])} | {throughput} |"
+        )
+
+    if report.stand_ins:
+        lines += [
+            "",
+            "| Stand-in | Requests | Rate limited | WS frames |",
+            "|---|---:|---:|---:|",
+        ]
+        for name, stats in report.stand_ins.items():
+            requests = stats.get("requests", 0)
+            if isinstance(requests, dict):
+                requests = sum(requests.values())
+            lines.append(
+                f"| {name} | {requests} | {stats.get('rate_limited', '-')} | {stats.get('ws_frames', '-')} |"
+            )
+    return "\n".join(lines) + "\n"
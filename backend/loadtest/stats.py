@@ -0,0 +1,82 @@
+"""
+Latency and Throughput Recording for Load-Test Scenarios
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    """Linear-interpolated percentile (pct in 0..100) of unsorted samples."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class LatencyRecorder:
+    """
+    Latencies (seconds) and errors of one workload.
+
+    Throughput is completed operations per second between the first
+    start and the last finish seen by the recorder; `events` counts
+    items that are not timed individually (e.g. socket messages).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples: List[float] = []
+        self.errors = 0
+        self.events = 0
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+
+    def _mark(self, start: float, end: float) -> None:
+        self._first = start if self._first is None else min(self._first, start)
+        self._last = end if self._last is None else max(self._last, end)
+
+    def record(self, seconds: float, started: Optional[float] = None) -> None:
+        end = time.perf_counter()
+        self.samples.append(seconds)
+        self._mark(started if started is not None else end - seconds, end)
+
+    def error(self) -> None:
+        self.errors += 1
+
+    def count(self, events: int = 1) -> None:
+        now = time.perf_counter()
+        self.events += events
+        self._mark(now, now)
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Time the block; an exception counts as an error and propagates."""
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.error()
+            raise
+        self.record(time.perf_counter() - started, started)
+
+    @property
+    def elapsed(self) -> float:
+        if self._first is None or self._last is None:
+            return 0.0
+        return self._last - self._first
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        done = len(self.samples) or self.events
+        return {
+            "count": len(self.samples),
+            "errors": self.errors,
+            "events": self.events,
+            "p50": percentile(self.samples, 50),
+            "p99": percentile(self.samples, 99),
+            "max": max(self.samples) if self.samples else None,
+            "throughput": done / self.elapsed if self.elapsed > 0 else None,
+        }
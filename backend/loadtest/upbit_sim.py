@@ -0,0 +1,499 @@
+"""
+Upbit REST + WebSocket Simulator
+
+Serves the quotation endpoints (markets, ticker, candles, order book,
+trades), a paper exchange (accounts, orders) and the public WebSocket
+(ticker/trade/orderbook, binary JSON frames like the real server).
+
+Every REST response carries a Remaining-Req header for its group, and
+requests over the group quota (services.upbit.rate_limiter.GROUP_LIMITS,
+per client address) get the real plain-text 429 "Too many API requests.".
+
+Point the backend at it with UPBIT_BASE_URL=http://127.0.0.1:9102/v1 and
+UPBIT_WS_URL=ws://127.0.0.1:9102/websocket/v1.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from services.upbit.rate_limiter import DEFAULT_GROUP_LIMIT, GROUP_LIMITS, get_request_group
+
+from .limits import SlidingWindowLimiter
+from .market import SyntheticMarket
+
+CANDLE_SECONDS = {"minutes": 60, "days": 86_400, "weeks": 7 * 86_400, "months": 30 * 86_400, "seconds": 1}
+MAX_CANDLES = 200
+ORDERBOOK_LEVELS = 15
+STREAM_TYPES = ("ticker", "trade", "orderbook")
+
+KST = timezone(timedelta(hours=9))
+
+
+def _error(status: int, name: str, message: str) -> JSONResponse:
+    return JSONResponse({"error": {"name": name, "message": message}}, status_code=status)
+
+
+def _parse_to(value: Optional[str]) -> int:
+    """Candle `to` parameter (ISO 8601, UTC when no offset) to epoch ms; 0 = now."""
+    if not value:
+        return 0
+    parsed = datetime.fromisoformat(value.replace(" ", "T").replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+class _Subscriber:
+    """One WebSocket client and the codes it subscribed per stream type."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.codes: Dict[str, Set[str]] = {}
+
+
+class UpbitSimulator:
+    """
+    Stateful Upbit stand-in.
+
+    Args:
+        market: Shared synthetic market data
+        latency_ms: Server processing time added to every REST request
+        tick_interval: Seconds between stream frames per subscribed market
+        group_limits: Requests per second per group (default: Upbit quotas)
+        krw: Starting KRW balance of the paper account
+    """
+
+    def __init__(
+        self,
+        market: Optional[SyntheticMarket] = None,
+        latency_ms: float = 0.0,
+        tick_interval: float = 0.2,
+        group_limits: Optional[Dict[str, int]] = None,
+        krw: float = 100_000_000.0,
+    ):
+        self.market = market or SyntheticMarket()
+        self.latency = latency_ms / 1000
+        self.tick_interval = tick_interval
+
+        limits = group_limits or GROUP_LIMITS
+        self._second = {g: SlidingWindowLimiter(n) for g, n in limits.items()}
+        self._minute = {g: SlidingWindowLimiter(n * 60, window=60.0) for g, n in limits.items()}
+        self._default_limit = DEFAULT_GROUP_LIMIT
+
+        self.balances: Dict[str, float] = {"KRW": krw}
+        self.orders: Dict[str, dict] = {}
+        self._sequence = 0
+
+        self._subscribers: Set[_Subscriber] = set()
+
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+        self.ws_frames = 0
+
+    def stats(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "rate_limited": self.rate_limited,
+            "ws_connections": len(self._subscribers),
+            "ws_frames": self.ws_frames,
+        }
+
+    def _limiters(self, group: str):
+        if group not in self._second:
+            self._second[group] = SlidingWindowLimiter(self._default_limit)
+            self._minute[group] = SlidingWindowLimiter(self._default_limit * 60, window=60.0)
+        return self._second[group], self._minute[group]
+
+    # -------------------------------------------
+    # App
+    # -------------------------------------------
+
+    def create_app(self) -> FastAPI:
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            task = asyncio.create_task(self._stream_loop())
+            yield
+            task.cancel()
+
+        app = FastAPI(title="Upbit simulator", lifespan=lifespan)
+
+        @app.middleware("http")
+        async def rate_limit(request: Request, call_next):
+            path = request.url.path
+            if not path.startswith("/v1/"):
+                return await call_next(request)
+
+            endpoint = path[len("/v1"):]
+            group = get_request_group(request.method, endpoint)
+            second, minute = self._limiters(group)
+            client = request.client.host if request.client else ""
+            if not second.hit(client) or not minute.hit(client):
+                self.rate_limited += 1
+                return PlainTextResponse("Too many API requests.", status_code=429)
+
+            self.requests[group] += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            response = await call_next(request)
+            response.headers["Remaining-Req"] = (
+                f"group={group}; min={minute.remaining(client)}; sec={second.remaining(client)}"
+            )
+            return response
+
+        @app.get("/v1/market/all")
+        async def markets(isDetails: bool = False):
+            return [
+                {"market": m, "korean_name": k, "english_name": e, "market_warning": "NONE"}
+                for m, k, e in self.market.coins
+            ]
+
+        @app.get("/v1/ticker")
+        async def ticker(markets: str):
+            codes = markets.split(",")
+            if not all(self.market.has_coin(m) for m in codes):
+                return _error(404, "404", "Code not found")
+            return [self._ticker(m) for m in codes]
+
+        @app.get("/v1/candles/{kind}")
+        async def candles(kind: str, market: str, count: int = 1, to: Optional[str] = None):
+            return self._candles(kind, 1, market, count, to)
+
+        @app.get("/v1/candles/minutes/{unit}")
+        async def minute_candles(unit: int, market: str, count: int = 1, to: Optional[str] = None):
+            return self._candles("minutes", unit, market, count, to)
+
+        @app.get("/v1/orderbook")
+        async def orderbook(markets: str):
+            codes = markets.split(",")
+            if not all(self.market.has_coin(m) for m in codes):
+                return _error(404, "404", "Code not found")
+            return [self._orderbook(m) for m in codes]
+
+        @app.get("/v1/trades/ticks")
+        async def trades(market: str, count: int = 1):
+            if not self.market.has_coin(market):
+                return _error(404, "404", "Code not found")
+            return [self._trade(market, step=False) for _ in range(min(count, 500))]
+
+        @app.get("/v1/accounts")
+        async def accounts(request: Request):
+            if not request.headers.get("authorization"):
+                return _error(401, "jwt_verification", "jwt 토큰 검증에 실패했습니다.")
+            return [
+                {
+                    "currency": currency,
+                    "balance": f"{balance:.8f}",
+                    "locked": "0",
+                    "avg_buy_price": "0",
+                    "avg_buy_price_modified": False,
+                    "unit_currency": "KRW",
+                }
+                for currency, balance in self.balances.items()
+            ]
+
+        @app.post("/v1/orders")
+        async def place_order(request: Request):
+            if not request.headers.get("authorization"):
+                return _error(401, "jwt_verification", "jwt 토큰 검증에 실패했습니다.")
+            return self._place_order(await request.json())
+
+        @app.get("/v1/orders")
+        async def list_orders(request: Request, state: Optional[str] = None, market: Optional[str] = None):
+            if not request.headers.get("authorization"):
+                return _error(401, "jwt_verification", "jwt 토큰 검증에 실패했습니다.")
+            return [
+                o for o in self.orders.values()
+                if (state is None or o["state"] == state) and (market is None or o["market"] == market)
+            ]
+
+        @app.get("/v1/order")
+        async def get_order(request: Request, uuid: str):
+            if not request.headers.get("authorization"):
+                return _error(401, "jwt_verification", "jwt 토큰 검증에 실패했습니다.")
+            order = self.orders.get(uuid)
+            return order or _error(404, "order_not_found", "주문을 찾지 못했습니다.")
+
+        @app.delete("/v1/order")
+        async def cancel_order(request: Request, uuid: str):
+            if not request.headers.get("authorization"):
+                return _error(401, "jwt_verification", "jwt 토큰 검증에 실패했습니다.")
+            order = self.orders.get(uuid)
+            if order is None or order["state"] != "wait":
+                return _error(404, "order_not_found", "주문을 찾지 못했습니다.")
+            order["state"] = "cancel"
+            return order
+
+        @app.websocket("/websocket/v1")
+        async def stream(websocket: WebSocket):
+            await websocket.accept()
+            subscriber = _Subscriber(websocket)
+            self._subscribers.add(subscriber)
+            try:
+                while True:
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        break
+                    text = message.get("text") or (message.get("bytes") or b"").decode()
+                    if text == "PING":
+                        await websocket.send_text(json.dumps({"status": "UP"}))
+                        continue
+                    await self._subscribe(subscriber, json.loads(text))
+            except (WebSocketDisconnect, ValueError):
+                pass
+            finally:
+                self._subscribers.discard(subscriber)
+
+        @app.get("/stats")
+        async def get_stats():
+            return self.stats()
+
+        return app
+
+    # -------------------------------------------
+    # Quotation payloads
+    # -------------------------------------------
+
+    def _ticker(self, market: str) -> dict:
+        now = datetime.now(timezone.utc)
+        now_ms = int(now.timestamp() * 1000)
+        price = self.market.coin_price(market)
+        prev = self.market.coin_prev_close(market)
+        volume = self.market.coin_volume(market)
+        change = price - prev
+        return {
+            "market": market,
+            "trade_date": now.strftime("%Y%m%d"),
+            "trade_time": now.strftime("%H%M%S"),
+            "trade_date_kst": now.astimezone(KST).strftime("%Y%m%d"),
+            "trade_time_kst": now.astimezone(KST).strftime("%H%M%S"),
+            "trade_timestamp": now_ms,
+            "opening_price": prev,
+            "high_price": max(prev, price) * 1.01,
+            "low_price": min(prev, price) * 0.99,
+            "trade_price": price,
+            "prev_closing_price": prev,
+            "change": "RISE" if change > 0 else "FALL" if change < 0 else "EVEN",
+            "change_price": abs(change),
+            "change_rate": abs(change) / prev,
+            "signed_change_price": change,
+            "signed_change_rate": change / prev,
+            "trade_volume": 0.01,
+            "acc_trade_price": volume * price,
+            "acc_trade_price_24h": volume * price * 1.5,
+            "acc_trade_volume": volume,
+            "acc_trade_volume_24h": volume * 1.5,
+            "highest_52_week_price": prev * 1.8,
+            "highest_52_week_date": "2026-03-14",
+            "lowest_52_week_price": prev * 0.5,
+            "lowest_52_week_date": "2025-11-02",
+            "timestamp": now_ms,
+        }
+
+    def _candles(self, kind: str, unit: int, market: str, count: int, to: Optional[str]):
+        seconds = CANDLE_SECONDS.get(kind)
+        if seconds is None:
+            return _error(404, "404", "Not found")
+        if not self.market.has_coin(market):
+            return _error(404, "404", "Code not found")
+
+        seconds *= unit
+        rows = []
+        candles = self.market.coin_candles(market, seconds, min(max(count, 1), MAX_CANDLES), _parse_to(to))
+        for i, candle in enumerate(candles):
+            start = datetime.fromtimestamp(candle["start_ms"] / 1000, tz=timezone.utc)
+            row = {
+                "market": market,
+                "candle_date_time_utc": start.strftime("%Y-%m-%dT%H:%M:%S"),
+                "candle_date_time_kst": start.astimezone(KST).strftime("%Y-%m-%dT%H:%M:%S"),
+                "opening_price": candle["open"],
+                "high_price": candle["high"],
+                "low_price": candle["low"],
+                "trade_price": candle["close"],
+                "timestamp": candle["start_ms"] + seconds * 1000 - 1,
+                "candle_acc_trade_price": candle["volume"] * candle["close"],
+                "candle_acc_trade_volume": candle["volume"],
+            }
+            if kind == "minutes":
+                row["unit"] = unit
+            elif kind == "days":
+                prev = candles[i + 1]["close"] if i + 1 < len(candles) else candle["open"]
+                row["prev_closing_price"] = prev
+                row["change_price"] = candle["close"] - prev
+                row["change_rate"] = (candle["close"] - prev) / prev
+            elif kind in ("weeks", "months"):
+                row["first_day_of_period"] = start.strftime("%Y-%m-%d")
+            rows.append(row)
+        return rows
+
+    def _orderbook(self, market: str) -> dict:
+        price = self.market.coin_price(market)
+        tick = max(price * 0.0005, 0.01)
+        units = [
+            {
+                "ask_price": round(price + (i + 1) * tick, 2),
+                "bid_price": round(price - i * tick, 2),
+                "ask_size": round(0.5 + (i * 0.37) % 2, 8),
+                "bid_size": round(0.5 + (i * 0.53) % 2, 8),
+            }
+            for i in range(ORDERBOOK_LEVELS)
+        ]
+        return {
+            "market": market,
+            "timestamp": int(time.time() * 1000),
+            "total_ask_size": sum(u["ask_size"] for u in units),
+            "total_bid_size": sum(u["bid_size"] for u in units),
+            "orderbook_units": units,
+            "level": 0,
+        }
+
+    def _trade(self, market: str, step: bool = True) -> dict:
+        if step:
+            price, volume = self.market.step_coin(market)
+        else:
+            price, volume = self.market.coin_price(market), 0.01
+        now = datetime.now(timezone.utc)
+        self._sequence += 1
+        prev = self.market.coin_prev_close(market)
+        return {
+            "market": market,
+            "trade_date_utc": now.strftime("%Y-%m-%d"),
+            "trade_time_utc": now.strftime("%H:%M:%S"),
+            "timestamp": int(now.timestamp() * 1000),
+            "trade_price": price,
+            "trade_volume": volume,
+            "prev_closing_price": prev,
+            "change_price": price - prev,
+            "ask_bid": "BID" if self._sequence % 2 else "ASK",
+            "sequential_id": int(now.timestamp() * 1_000_000) + self._sequence,
+        }
+
+    # -------------------------------------------
+    # Exchange
+    # -------------------------------------------
+
+    def _place_order(self, body: dict):
+        market = body.get("market", "")
+        if not self.market.has_coin(market):
+            return _error(400, "invalid_parameter", "market 값이 올바르지 않습니다.")
+
+        side, ord_type = body.get("side"), body.get("ord_type")
+        price = self.market.coin_price(market)
+        currency = market.split("-")[1]
+        if ord_type == "price":  # Market buy by KRW amount
+            funds = float(body.get("price") or 0)
+            volume = funds / price
+        else:
+            volume = float(body.get("volume") or 0)
+            if ord_type == "limit":
+                price = float(body.get("price") or price)
+            funds = volume * price
+
+        if side == "bid" and funds > self.balances["KRW"]:
+            return _error(400, "insufficient_funds_bid", "매수가능금액이 부족합니다.")
+        if side == "ask" and volume > self.balances.get(currency, 0.0):
+            return _error(400, "insufficient_funds_ask", "매도가능금액이 부족합니다.")
+
+        marketable = ord_type != "limit" or (
+            price >= self.market.coin_price(market) if side == "bid" else price <= self.market.coin_price(market)
+        )
+        if marketable:
+            sign = 1 if side == "bid" else -1
+            self.balances["KRW"] -= sign * funds
+            self.balances[currency] = self.balances.get(currency, 0.0) + sign * volume
+
+        order = {
+            "uuid": str(uuid.uuid4()),
+            "side": side,
+            "ord_type": ord_type,
+            "price": str(body.get("price")) if body.get("price") else None,
+            "state": "done" if marketable else "wait",
+            "market": market,
+            "created_at": datetime.now(KST).isoformat(timespec="seconds"),
+            "volume": f"{volume:.8f}",
+            "remaining_volume": "0" if marketable else f"{volume:.8f}",
+            "reserved_fee": f"{funds * 0.0005:.8f}",
+            "remaining_fee": "0",
+            "paid_fee": f"{funds * 0.0005:.8f}" if marketable else "0",
+            "locked": "0" if marketable else f"{funds:.8f}",
+            "executed_volume": f"{volume:.8f}" if marketable else "0",
+            "trades_count": 1 if marketable else 0,
+        }
+        self.orders[order["uuid"]] = order
+        return JSONResponse(order, status_code=201)
+
+    # -------------------------------------------
+    # WebSocket
+    # -------------------------------------------
+
+    async def _subscribe(self, subscriber: _Subscriber, request: List[dict]) -> None:
+        """A request replaces the previous subscription; snapshots are sent right away."""
+        subscriber.codes = {}
+        for field in request:
+            if field.get("type") in STREAM_TYPES:
+                codes = {c for c in field.get("codes", []) if self.market.has_coin(c)}
+                subscriber.codes[field["type"]] = codes
+        for stream_type, codes in subscriber.codes.items():
+            for code in codes:
+                await self._send(subscriber, self._frame(stream_type, code, "SNAPSHOT"))
+
+    def _frame(self, stream_type: str, market: str, kind: str = "REALTIME", trade: Optional[dict] = None) -> dict:
+        if stream_type == "orderbook":
+            book = self._orderbook(market)
+            frame = {k: v for k, v in book.items() if k != "market"}
+        elif stream_type == "trade":
+            trade = trade or self._trade(market, step=False)
+            now = datetime.fromtimestamp(trade["timestamp"] / 1000, tz=timezone.utc)
+            frame = {
+                "trade_price": trade["trade_price"],
+                "trade_volume": trade["trade_volume"],
+                "ask_bid": trade["ask_bid"],
+                "prev_closing_price": trade["prev_closing_price"],
+                "change": "RISE" if trade["change_price"] > 0 else "FALL" if trade["change_price"] < 0 else "EVEN",
+                "change_price": abs(trade["change_price"]),
+                "trade_date": now.strftime("%Y-%m-%d"),
+                "trade_time": now.strftime("%H:%M:%S"),
+                "trade_timestamp": trade["timestamp"],
+                "timestamp": int(time.time() * 1000),
+                "sequential_id": trade["sequential_id"],
+            }
+        else:
+            ticker = self._ticker(market)
+            frame = {k: v for k, v in ticker.items() if k not in ("market", "trade_date_kst", "trade_time_kst")}
+            frame["ask_bid"] = "BID"
+            frame["acc_ask_volume"] = ticker["acc_trade_volume"] / 2
+            frame["acc_bid_volume"] = ticker["acc_trade_volume"] / 2
+            frame["market_state"] = "ACTIVE"
+        frame.update({"type": stream_type, "code": market, "stream_type": kind})
+        return frame
+
+    async def _send(self, subscriber: _Subscriber, frame: dict) -> None:
+        try:
+            await subscriber.websocket.send_bytes(json.dumps(frame, ensure_ascii=False).encode())
+            self.ws_frames += 1
+        except Exception:
+            self._subscribers.discard(subscriber)
+
+    async def _stream_loop(self) -> None:
+        """One trade per subscribed market each interval, fanned out as trade/ticker/orderbook frames."""
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            subscribers = list(self._subscribers)
+            markets = set().union(*(codes for s in subscribers for codes in s.codes.values()))
+            for market in markets:
+                trade = self._trade(market)
+                frames = {}
+                for subscriber in subscribers:
+                    for stream_type, codes in subscriber.codes.items():
+                        if market in codes:
+                            if stream_type not in frames:
+                                frames[stream_type] = self._frame(stream_type, market, trade=trade)
+                            await self._send(subscriber, frames[stream_type])
@@ -0,0 +1,21 @@
+"""
+Account State Service
+
+Stream-fed, immutable account snapshots (cash, holdings, totals) shared by
+the trading coordinator, position manager, market snapshots and account
+routes.
+"""
+
+from services.account_state.service import (
+    AccountSnapshot,
+    AccountStateService,
+    close_account_state_service,
+    get_account_state_service,
+)
+
+__all__ = [
+    "AccountSnapshot",
+    "AccountStateService",
+    "close_account_state_service",
+    "get_account_state_service",
+]
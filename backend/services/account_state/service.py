@@ -0,0 +1,468 @@
+"""
+Account State Service
+
+Keeps one in-memory view of the Kiwoom account (cash, holdings, totals)
+and shares it between the trading coordinator, the position manager, the
+market snapshot service and the account routes, so the account TR
+(kt00004) is no longer called by each of them separately.
+
+Features:
+- Fed by the Kiwoom balance (잔고, 04) and order execution (주문체결, 00)
+  WebSocket streams: holdings come only from the absolute 04 state (the
+  two streams are not ordered, so also adding 00 fills would count a
+  fill twice); fills update the cash estimate immediately
+- REST reconciliation only on a slow interval while streaming (and a
+  short, coalesced one after fills to pick up fees and settled cash)
+- REST-only fallback with a short max age when the streams are down
+- Immutable, versioned snapshots published to subscribers
+- Single-flight REST fetches
+
+Usage:
+    from services.account_state import get_account_state_service
+
+    service = get_account_state_service()
+    snapshot = await service.get_snapshot()
+    snapshot.available_cash, snapshot.holding("005930")
+
+    service.subscribe(on_snapshot)   # called with every new snapshot
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+import structlog
+
+from services.kiwoom.models import Holding
+
+logger = structlog.get_logger()
+
+
+# Snapshot sources
+SOURCE_REST = "rest"
+SOURCE_BALANCE = "balance"
+SOURCE_EXECUTION = "execution"
+
+SnapshotCallback = Callable[["AccountSnapshot"], None]
+ClientFactory = Callable[[], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """
+    Immutable account state.
+
+    Field names mirror kiwoom AccountBalance (kt00004) so a snapshot can be
+    used wherever a balance was. A new version is created for every change;
+    treat the contained Holding models as read-only, they are shared.
+    """
+    version: int
+    created_at: datetime
+    source: str
+
+    pchs_amt: int = 0
+    evlu_amt: int = 0
+    evlu_pfls_amt: int = 0
+    evlu_pfls_rt: float = 0.0
+    d2_ord_psbl_amt: int = 0
+    holdings: tuple = ()
+
+    # stk_cd -> Holding, built from holdings
+    by_code: Mapping[str, Holding] = field(default_factory=lambda: MappingProxyType({}))
+
+    # Monotonic time of the last REST reconciliation
+    reconciled_at: float = 0.0
+
+    def holding(self, stk_cd: str) -> Optional[Holding]:
+        """Get the holding for a stock (None if not held)."""
+        return self.by_code.get(stk_cd)
+
+    @property
+    def available_cash(self) -> int:
+        """D+2 orderable cash."""
+        return self.d2_ord_psbl_amt
+
+    @property
+    def stock_value(self) -> int:
+        """Evaluation of all holdings (evlu_amt of the account may include cash)."""
+        return sum(h.evlu_amt for h in self.holdings)
+
+    @property
+    def total_equity(self) -> int:
+        """Cash plus holdings."""
+        return self.available_cash + self.stock_value
+
+    @property
+    def total_value(self) -> int:
+        """Same as AccountBalance.total_value."""
+        return self.evlu_amt + self.d2_ord_psbl_amt
+
+
+def _index(holdings) -> tuple[tuple, Mapping[str, Holding]]:
+    holdings = tuple(h for h in holdings if h.hldg_qty > 0)
+    return holdings, MappingProxyType({h.stk_cd: h for h in holdings})
+
+
+def _totals(snapshot: AccountSnapshot, old: Optional[Holding], new: Optional[Holding]) -> dict:
+    """Shift the account totals by the difference between two holding states."""
+    def cost(h):
+        return h.total_cost if h else 0
+
+    def value(h):
+        return h.evlu_amt if h else 0
+
+    def pnl(h):
+        return h.evlu_pfls_amt if h else 0
+
+    pchs_amt = snapshot.pchs_amt + cost(new) - cost(old)
+    evlu_pfls_amt = snapshot.evlu_pfls_amt + pnl(new) - pnl(old)
+    return {
+        "pchs_amt": pchs_amt,
+        "evlu_amt": snapshot.evlu_amt + value(new) - value(old),
+        "evlu_pfls_amt": evlu_pfls_amt,
+        "evlu_pfls_rt": round(evlu_pfls_amt / pchs_amt * 100, 2) if pchs_amt else 0.0,
+    }
+
+
+class AccountStateService:
+    """
+    Stream-fed account state with slow REST reconciliation.
+
+    Without start() the service works REST-only: snapshots older than
+    stale_after are refetched (one shared call for all consumers).
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[ClientFactory] = None,
+        reconcile_interval: float = 300.0,
+        stale_after: float = 10.0,
+        fill_reconcile_delay: float = 5.0,
+    ):
+        """
+        Args:
+            client_factory: Async factory for the Kiwoom client
+                (defaults to the shared client)
+            reconcile_interval: Seconds between REST reconciliations while
+                the streams are attached
+            stale_after: Max age in seconds of a snapshot without streams
+            fill_reconcile_delay: Seconds after a fill before one coalesced
+                REST reconciliation (0 disables)
+        """
+        self._client_factory = client_factory
+        self.reconcile_interval = reconcile_interval
+        self.stale_after = stale_after
+        self.fill_reconcile_delay = fill_reconcile_delay
+
+        self._snapshot: Optional[AccountSnapshot] = None
+        self._version = 0
+        self._lock = asyncio.Lock()
+        self._subscribers: list[SnapshotCallback] = []
+
+        # Stream state
+        self._realtime = None
+        self._streaming = False
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self._fill_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self._stats = {"rest_calls": 0, "balance_updates": 0, "executions": 0, "published": 0}
+
+    # -------------------------------------------
+    # Lifecycle
+    # -------------------------------------------
+
+    async def start(self, realtime=None) -> None:
+        """
+        Attach the balance and order execution streams.
+
+        Args:
+            realtime: KrRealtimeService (defaults to the shared instance)
+        """
+        if self._streaming:
+            return
+
+        if realtime is None:
+            from services.kr_realtime_service import get_kr_realtime_service
+
+            realtime = await get_kr_realtime_service()
+
+        await realtime.subscribe_balance(self._on_balance)
+        await realtime.subscribe_order_execution(self._on_execution)
+        self._realtime = realtime
+        self._streaming = True
+        self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+        try:
+            await self.reconcile()
+        except Exception as e:
+            # Retried by the next get_snapshot() or the reconcile loop
+            logger.warning("account_state_reconcile_failed", error=str(e))
+        logger.info("account_state_streaming", reconcile_interval=self.reconcile_interval)
+
+    async def stop(self) -> None:
+        """Detach the streams and stop reconciliation."""
+        for task in (self._reconcile_task, self._fill_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._reconcile_task = None
+        self._fill_task = None
+
+        if self._realtime is not None:
+            try:
+                await self._realtime.unsubscribe_balance(self._on_balance)
+                await self._realtime.unsubscribe_order_execution(self._on_execution)
+            except Exception as e:
+                logger.warning("account_state_unsubscribe_failed", error=str(e))
+            self._realtime = None
+        self._streaming = False
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning("account_state_reconcile_failed", error=str(e))
+
+    # -------------------------------------------
+    # Public API
+    # -------------------------------------------
+
+    async def get_snapshot(self, refresh: bool = False) -> AccountSnapshot:
+        """
+        Get the current account state.
+
+        While the streams are connected the snapshot is kept current by
+        them and returned as is; otherwise it is refetched once older than
+        stale_after.
+
+        Args:
+            refresh: Force a REST reconciliation
+
+        Raises:
+            Exception: The REST error, if there is no snapshot to fall back to
+        """
+        if not refresh and self._is_fresh():
+            return self._snapshot
+
+        async with self._lock:
+            # Another caller may have reconciled while we waited
+            if not refresh and self._is_fresh():
+                return self._snapshot
+            return await self._reconcile_locked(bypass_cache=refresh)
+
+    def peek(self) -> Optional[AccountSnapshot]:
+        """Get the current snapshot without any network call."""
+        return self._snapshot
+
+    async def reconcile(self) -> AccountSnapshot:
+        """Replace the state with a fresh REST balance (kt00004)."""
+        async with self._lock:
+            return await self._reconcile_locked(bypass_cache=True)
+
+    def subscribe(self, callback: SnapshotCallback) -> None:
+        """Call callback (sync or async) with every new snapshot."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: SnapshotCallback) -> None:
+        """Remove a snapshot callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    @property
+    def is_streaming(self) -> bool:
+        return self._streaming
+
+    def get_stats(self) -> dict:
+        """Get service statistics."""
+        return {
+            **self._stats,
+            "streaming": self._streaming,
+            "version": self._version,
+            "subscribers": len(self._subscribers),
+        }
+
+    # -------------------------------------------
+    # Updates
+    # -------------------------------------------
+
+    def _is_fresh(self) -> bool:
+        if self._snapshot is None:
+            return False
+        if self._streaming and self._realtime.is_connected:
+            return True
+        return time.monotonic() - self._snapshot.reconciled_at < self.stale_after
+
+    async def _reconcile_locked(self, bypass_cache: bool = False) -> AccountSnapshot:
+        client = await self._get_client()
+        cache = getattr(client, "cache", None)
+        if bypass_cache and cache is not None:
+            # The client's own TTL cache could hand back a pre-fill balance
+            await cache.invalidate_account_cache_async()
+
+        balance = await client.get_account_balance()
+        self._stats["rest_calls"] += 1
+
+        holdings, by_code = _index(balance.holdings)
+        snapshot = AccountSnapshot(
+            version=self._version + 1,
+            created_at=datetime.now(),
+            source=SOURCE_REST,
+            pchs_amt=balance.pchs_amt,
+            evlu_amt=balance.evlu_amt,
+            evlu_pfls_amt=balance.evlu_pfls_amt,
+            evlu_pfls_rt=balance.evlu_pfls_rt,
+            d2_ord_psbl_amt=balance.d2_ord_psbl_amt,
+            holdings=holdings,
+            by_code=by_code,
+            reconciled_at=time.monotonic(),
+        )
+        await self._publish(snapshot)
+        return snapshot
+
+    async def _on_balance(self, data) -> None:
+        """Balance stream (04): the holding's absolute state."""
+        self._stats["balance_updates"] += 1
+        if self._snapshot is None:
+            return  # the initial reconciliation will include it
+
+        old = self._snapshot.holding(data.stk_cd)
+        new = None
+        if data.hldg_qty > 0:
+            new = Holding(
+                stk_cd=data.stk_cd,
+                stk_nm=data.stk_nm or (old.stk_nm if old else ""),
+                hldg_qty=data.hldg_qty,
+                avg_buy_prc=data.avg_buy_prc,
+                cur_prc=data.cur_prc,
+                evlu_amt=data.evlu_amt or data.cur_prc * data.hldg_qty,
+                evlu_pfls_amt=data.evlu_pfls_amt,
+                evlu_pfls_rt=data.evlu_pfls_rt,
+            )
+        await self._publish(self._with_holding(data.stk_cd, old, new, SOURCE_BALANCE))
+
+    async def _on_execution(self, execution) -> None:
+        """
+        Order execution stream (00): apply the fill to cash.
+
+        Holdings are left to the balance stream (04), which carries the
+        absolute quantity after the fill and may arrive before or after
+        this report.
+        """
+        if execution.ccld_qty <= 0 or self._snapshot is None:
+            return  # acceptance / confirmation without a fill
+        self._stats["executions"] += 1
+
+        qty = execution.ccld_qty
+        price = execution.ccld_prc or execution.ord_prc
+        is_buy = "매수" in execution.ord_tp or execution.ord_tp == "2"
+
+        current = self._snapshot
+        # Cash estimate before fees/taxes; corrected by the next reconciliation
+        cash_delta = -price * qty if is_buy else price * qty
+        snapshot = replace(
+            current,
+            version=self._version + 1,
+            created_at=datetime.now(),
+            source=SOURCE_EXECUTION,
+            d2_ord_psbl_amt=max(current.d2_ord_psbl_amt + cash_delta, 0),
+        )
+        await self._publish(snapshot)
+        self._schedule_fill_reconcile()
+
+    def _with_holding(
+        self,
+        stk_cd: str,
+        old: Optional[Holding],
+        new: Optional[Holding],
+        source: str,
+    ) -> AccountSnapshot:
+        current = self._snapshot
+        holdings = [h for h in current.holdings if h.stk_cd != stk_cd]
+        if new is not None:
+            holdings.append(new)
+        holdings, by_code = _index(holdings)
+
+        return replace(
+            current,
+            version=self._version + 1,
+            created_at=datetime.now(),
+            source=source,
+            holdings=holdings,
+            by_code=by_code,
+            **_totals(current, old, new),
+        )
+
+    def _schedule_fill_reconcile(self) -> None:
+        if not self.fill_reconcile_delay or (self._fill_task and not self._fill_task.done()):
+            return
+
+        async def run():
+            await asyncio.sleep(self.fill_reconcile_delay)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning("account_state_reconcile_failed", error=str(e))
+
+        self._fill_task = asyncio.create_task(run())
+
+    async def _publish(self, snapshot: AccountSnapshot) -> None:
+        self._snapshot = snapshot
+        self._version = snapshot.version
+        self._stats["published"] += 1
+
+        for callback in list(self._subscribers):
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(snapshot)
+                else:
+                    callback(snapshot)
+            except Exception as e:
+                logger.warning("account_state_callback_error", error=str(e))
+
+    async def _get_client(self) -> Any:
+        if self._client_factory is not None:
+            return await self._client_factory()
+
+        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+
+        return await get_shared_kiwoom_client_async()
+
+
+# Singleton instance
+_account_state_service: Optional[AccountStateService] = None
+
+
+def get_account_state_service() -> AccountStateService:
+    """Get or create the account state service singleton."""
+    global _account_state_service
+
+    if _account_state_service is None:
+        from app.config import settings
+
+        _account_state_service = AccountStateService(
+            reconcile_interval=settings.ACCOUNT_STATE_RECONCILE_INTERVAL,
+            stale_after=settings.ACCOUNT_STATE_STALE_AFTER,
+            fill_reconcile_delay=settings.ACCOUNT_STATE_FILL_RECONCILE_DELAY,
+        )
+
+    return _account_state_service
+
+
+async def close_account_state_service() -> None:
+    """Detach the streams and drop the singleton."""
+    global _account_state_service
+
+    if _account_state_service is not None:
+        await _account_state_service.stop()
+        _account_state_service = None
+        logger.info("account_state_service_closed")
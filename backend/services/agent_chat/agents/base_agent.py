@@ -10,6 +10,7 @@ from typing import List, Optional
 import structlog
 
 from agents.llm_provider import get_llm_provider
+from services.agent_chat.prompting import AGENT_EMOJI, HistorySummarizer
 from services.agent_chat.models import (
     AgentMessage,
     AgentType,
@@ -39,6 +40,22 @@ class BaseDiscussionAgent(ABC):
         self.agent_name = agent_name
         self.llm = get_llm_provider()
 
+        # Room-wide prompt parts (set by ChatRoom via bind_room)
+        self.shared_prefix: Optional[str] = None
+        self.history = HistorySummarizer()
+
+    def bind_room(self, shared_prefix: str, history: HistorySummarizer) -> None:
+        """
+        Use a room's shared prompt prefix and history summarizer.
+
+        Args:
+            shared_prefix: Discussion rules + market context, sent first in
+                every system prompt so all agents share the same prefix
+            history: Summarizer shared by all agents in the room
+        """
+        self.shared_prefix = shared_prefix
+        self.history = history
+
     @property
     @abstractmethod
     def system_prompt(self) -> str:
@@ -85,9 +102,17 @@ class BaseDiscussionAgent(ABC):
         )
 
     async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
-        """Call LLM with given prompts."""
+        """
+        Call LLM with given prompts.
+
+        The room's shared prefix goes before the agent persona so the
+        leading tokens are identical for every agent in the room.
+        """
         from langchain_core.messages import HumanMessage, SystemMessage
 
+        if self.shared_prefix:
+            system_prompt = f"{self.shared_prefix}\n\n---\n\n{system_prompt}"
+
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt),
@@ -180,27 +205,12 @@ class BaseDiscussionAgent(ABC):
         return False
 
     def _format_chat_history(self, messages: List[AgentMessage]) -> str:
-        """Format chat history for LLM context."""
-        if not messages:
-            return "이전 대화 없음"
-
-        lines = []
-        for msg in messages[-10:]:  # Last 10 messages for context
-            emoji = self._get_agent_emoji(msg.agent_type)
-            lines.append(f"{emoji} {msg.agent_name}: {msg.content[:300]}")
-
-        return "\n".join(lines)
+        """Format chat history for LLM context (token-budgeted)."""
+        return self.history.format(messages)
 
     def _get_agent_emoji(self, agent_type: AgentType) -> str:
         """Get emoji for agent type."""
-        emoji_map = {
-            AgentType.TECHNICAL: "📊",
-            AgentType.FUNDAMENTAL: "📈",
-            AgentType.SENTIMENT: "📰",
-            AgentType.RISK: "⚠️",
-            AgentType.MODERATOR: "👔",
-        }
-        return emoji_map.get(agent_type, "🤖")
+        return AGENT_EMOJI.get(agent_type, "🤖")
 
     def _parse_confidence(self, response: str) -> float:
         """Extract confidence from LLM response."""
@@ -3,6 +3,10 @@ Chat Room
 
 Manages a single discussion session where agents debate a trading opportunity.
 Handles message flow, round management, and session lifecycle.
+
+In parallel round mode the agents of a discussion round respond
+concurrently (each to the messages present when the round started),
+and all agents share one prompt prefix and history summarizer.
 """
 
 import asyncio
@@ -11,6 +15,7 @@ from typing import Dict, List, Optional
 
 import structlog
 
+from app.config import settings
 from services.agent_chat.models import (
     AgentMessage,
     AgentType,
@@ -30,6 +35,7 @@ from services.agent_chat.agents import (
     RiskDiscussionAgent,
     ModeratorAgent,
 )
+from services.agent_chat.prompting import HistorySummarizer, build_shared_prefix
 
 logger = structlog.get_logger()
 
@@ -53,6 +59,8 @@ class ChatRoom:
         context: MarketContext,
         max_discussion_rounds: int = 2,
         consensus_threshold: float = 0.75,
+        parallel_rounds: Optional[bool] = None,
+        history_token_budget: Optional[int] = None,
     ):
         """
         Initialize chat room.
@@ -63,6 +71,10 @@ class ChatRoom:
             context: Market data context
             max_discussion_rounds: Maximum discussion rounds before voting
             consensus_threshold: Required consensus level (0.0-1.0)
+            parallel_rounds: Run discussion-round responses concurrently
+                (default: AGENT_CHAT_PARALLEL_ROUNDS)
+            history_token_budget: Token budget for chat history in prompts
+                (default: AGENT_CHAT_HISTORY_TOKEN_BUDGET)
         """
         self.ticker = ticker
         self.stock_name = stock_name
@@ -86,6 +98,17 @@ class ChatRoom:
             AgentType.MODERATOR: ModeratorAgent(),
         }
 
+        # Shared prompt prefix + history summarizer for all agents
+        self.parallel_rounds = (
+            settings.AGENT_CHAT_PARALLEL_ROUNDS if parallel_rounds is None else parallel_rounds
+        )
+        self.shared_prefix = build_shared_prefix(context)
+        self.history = HistorySummarizer(
+            token_budget=history_token_budget or settings.AGENT_CHAT_HISTORY_TOKEN_BUDGET,
+        )
+        for agent in self.agents.values():
+            agent.bind_room(self.shared_prefix, self.history)
+
         # Discussion order (excluding moderator)
         self.discussion_order = [
             AgentType.TECHNICAL,
@@ -206,19 +229,28 @@ class ChatRoom:
 
         self.session.start_round("analysis")
 
-        # Moderator opens the discussion
+        # Moderator opening and agent analyses only depend on the context
         moderator = self.agents[AgentType.MODERATOR]
-        opening = await moderator.analyze(self.context)
-        self.session.add_message(opening)
-        await self._emit_message(opening)
-
-        # Each agent presents analysis (in parallel for speed)
         analysis_tasks = []
         for agent_type in self.discussion_order:
             agent = self.agents[agent_type]
             analysis_tasks.append(agent.analyze(self.context))
 
-        analyses = await asyncio.gather(*analysis_tasks, return_exceptions=True)
+        if self.parallel_rounds:
+            opening, *analyses = await asyncio.gather(
+                moderator.analyze(self.context),
+                *analysis_tasks,
+                return_exceptions=True,
+            )
+            if isinstance(opening, Exception):
+                raise opening
+        else:
+            opening = await moderator.analyze(self.context)
+            analyses = await asyncio.gather(*analysis_tasks, return_exceptions=True)
+
+        # Moderator opens the discussion
+        self.session.add_message(opening)
+        await self._emit_message(opening)
 
         for i, result in enumerate(analyses):
             if isinstance(result, Exception):
@@ -271,29 +303,10 @@ class ChatRoom:
         recent_messages = self.session.all_messages[-8:]  # Last 8 messages
 
         # Each agent can respond to others
-        responses = []
-        for agent_type in self.discussion_order:
-            agent = self.agents[agent_type]
-
-            # Find messages from other agents to respond to
-            other_messages = [
-                m for m in recent_messages
-                if m.agent_type != agent_type and m.agent_type != AgentType.MODERATOR
-            ]
-
-            if other_messages:
-                # Respond to the most recent relevant message
-                target_message = other_messages[-1]
-                response = await agent.respond(
-                    message=target_message,
-                    context=self.context,
-                    chat_history=self.session.all_messages,
-                )
-
-                if response:
-                    responses.append(response)
-                    self.session.add_message(response)
-                    await self._emit_message(response)
+        if self.parallel_rounds:
+            responses = await self._collect_parallel_responses(recent_messages)
+        else:
+            responses = await self._collect_sequential_responses(recent_messages)
 
         # Moderator summarizes if there were responses
         if responses and round_number < self.session.max_discussion_rounds:
@@ -317,6 +330,85 @@ class ChatRoom:
         # Continue if there were meaningful exchanges
         return len(responses) >= 2
 
+    def _response_target(
+        self,
+        agent_type: AgentType,
+        recent_messages: List[AgentMessage],
+    ) -> Optional[AgentMessage]:
+        """Most recent message from another (non-moderator) agent."""
+        for message in reversed(recent_messages):
+            if message.agent_type != agent_type and message.agent_type != AgentType.MODERATOR:
+                return message
+        return None
+
+    async def _collect_sequential_responses(
+        self,
+        recent_messages: List[AgentMessage],
+    ) -> List[AgentMessage]:
+        """Agents respond one at a time; later agents see earlier responses."""
+        responses = []
+        for agent_type in self.discussion_order:
+            target_message = self._response_target(agent_type, recent_messages)
+            if target_message is None:
+                continue
+
+            response = await self.agents[agent_type].respond(
+                message=target_message,
+                context=self.context,
+                chat_history=self.session.all_messages,
+            )
+
+            if response:
+                responses.append(response)
+                self.session.add_message(response)
+                await self._emit_message(response)
+
+        return responses
+
+    async def _collect_parallel_responses(
+        self,
+        recent_messages: List[AgentMessage],
+    ) -> List[AgentMessage]:
+        """
+        Agents respond concurrently to the history as of the round start.
+
+        Responses are added in discussion order, so the transcript is the
+        same regardless of which LLM call finishes first.
+        """
+        history = list(self.session.all_messages)
+        agent_types = []
+        tasks = []
+        for agent_type in self.discussion_order:
+            target_message = self._response_target(agent_type, recent_messages)
+            if target_message is None:
+                continue
+            agent_types.append(agent_type)
+            tasks.append(
+                self.agents[agent_type].respond(
+                    message=target_message,
+                    context=self.context,
+                    chat_history=history,
+                )
+            )
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses = []
+        for agent_type, result in zip(agent_types, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "agent_response_failed",
+                    agent=agent_type.value,
+                    error=str(result),
+                )
+                continue
+            if result:
+                responses.append(result)
+                self.session.add_message(result)
+                await self._emit_message(result)
+
+        return responses
+
     async def _run_voting_round(self) -> None:
         """Run voting round where each agent votes."""
         logger.info(
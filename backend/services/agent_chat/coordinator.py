@@ -3,6 +3,16 @@ Chat Coordinator
 
 Manages multiple chat rooms and coordinates with the trading system.
 Handles watch list monitoring, opportunity detection, and trade execution.
+
+Opportunity detection is event-driven: watched stocks are subscribed to
+live Kiwoom ticks and evaluated by WatchTriggerEngine, so a discussion
+starts on the tick that enters the target band. The interval job only
+reconciles the watch list (and polls quotes when no tick stream is up).
+
+Each watch list refresh scores the news of stale tickers with one
+batched sentiment call (up to 8 stocks per LLM prompt). The scores land
+in the shared per-article cache, so discussions and stock analyses of
+those tickers reuse them instead of prompting per ticker.
 """
 
 import asyncio
@@ -24,9 +34,13 @@ from services.agent_chat.position_manager import (
     PositionManager,
     get_position_manager,
 )
+from services.agent_chat.triggers import WatchTriggerEngine
 
 logger = structlog.get_logger()
 
+# News sentiment of a watched stock is refreshed after this long
+NEWS_SENTIMENT_TTL = timedelta(minutes=30)
+
 
 class ChatCoordinator:
     """
@@ -75,6 +89,18 @@ class ChatCoordinator:
         # Position manager (will be initialized in start())
         self._position_manager: Optional[PositionManager] = None
 
+        # Event-driven opportunity detection
+        self._triggers = WatchTriggerEngine()
+        self._tick_service = None  # KrRealtimeService once connected
+        self._tick_subscriptions: set[str] = set()
+        self._pending_discussions: set[str] = set()
+        self._event_task: Optional[asyncio.Task] = None
+        self._background_tasks: set[asyncio.Task] = set()  # Strong refs until done
+
+        # Batched news sentiment per watched ticker: ticker -> (scored at, result)
+        self._news_sentiment: Dict[str, tuple] = {}
+        self._sentiment_task: Optional[asyncio.Task] = None
+
         logger.info(
             "chat_coordinator_initialized",
             check_interval=check_interval_minutes,
@@ -108,7 +134,10 @@ class ChatCoordinator:
         # Sync positions from account
         await self._position_manager.sync_from_account()
 
-        # Schedule periodic watch list check
+        # Live ticks + watch list change notifications (connected in background)
+        self._event_task = asyncio.create_task(self._connect_event_sources())
+
+        # Schedule periodic watch list reconciliation
         self._scheduler.add_job(
             self._check_watch_list,
             'interval',
@@ -138,6 +167,15 @@ class ChatCoordinator:
             self._scheduler.shutdown(wait=False)
             self._scheduler = None
 
+        # Stop event-driven detection
+        if self._event_task:
+            self._event_task.cancel()
+            self._event_task = None
+        if self._tick_service:
+            await self._tick_service.unsubscribe_all(self._on_tick)
+            self._tick_service = None
+        self._tick_subscriptions.clear()
+
         # Stop position manager
         if self._position_manager:
             await self._position_manager.stop()
@@ -155,8 +193,132 @@ class ChatCoordinator:
         """Get position manager instance."""
         return self._position_manager
 
+    async def _connect_event_sources(self) -> None:
+        """Connect the live tick stream and watch list change notifications."""
+        try:
+            from app.dependencies import get_trading_coordinator
+            trading_coord = await get_trading_coordinator()
+            trading_coord.on_watch_list_change(self._on_watch_list_change)
+        except Exception as e:
+            logger.warning("watch_list_listener_failed", error=str(e))
+
+        try:
+            from services.kr_realtime_service import get_kr_realtime_service
+            self._tick_service = await get_kr_realtime_service()
+        except Exception as e:
+            # Falls back to quote polling in _check_watch_list
+            logger.warning("chat_tick_stream_unavailable", error=str(e))
+            return
+
+        await self._update_tick_subscriptions()
+        logger.info("chat_tick_stream_connected", tickers=len(self._tick_subscriptions))
+
+    def _on_watch_list_change(self) -> None:
+        """Resync triggers as soon as the watch list changes."""
+        if self._running:
+            self._spawn(self._check_watch_list())
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, holding a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    def _latest_prices(self, tickers: List[str]) -> Dict[str, float]:
+        """Latest streamed price per ticker (tickers without a tick are left out)."""
+        if not self._tick_service:
+            return {}
+        prices = {}
+        for ticker in tickers:
+            tick = self._tick_service.get_latest_tick(ticker)
+            if tick is not None:
+                prices[ticker] = tick.cur_prc
+        return prices
+
+    async def _update_tick_subscriptions(self) -> None:
+        """Subscribe ticks for watched stocks, drop removed ones."""
+        if not self._tick_service:
+            return
+
+        wanted = set(self._triggers.tickers)
+        added = wanted - self._tick_subscriptions
+        removed = self._tick_subscriptions - wanted
+
+        try:
+            if removed:
+                await self._tick_service.unsubscribe_tick(list(removed), self._on_tick)
+            if added:
+                await self._tick_service.subscribe_tick(list(added), self._on_tick)
+            self._tick_subscriptions = wanted
+        except Exception as e:
+            logger.warning("chat_tick_subscription_failed", error=str(e))
+
+    async def _on_tick(self, tick) -> None:
+        """Evaluate price triggers for a live tick."""
+        if not self._running:
+            return
+
+        rules = self._triggers.on_price(tick.stk_cd, tick.cur_prc)
+        if rules:
+            stock = self._triggers.get_stock(tick.stk_cd)
+            if stock:
+                self._on_trigger(stock, rules)
+
+    def _on_trigger(self, stock: dict, rules: List[str]) -> bool:
+        """
+        Start a discussion for a fired trigger if allowed.
+
+        Returns:
+            True if a discussion was scheduled
+        """
+        ticker = stock["ticker"]
+
+        if ticker in self._active_rooms or ticker in self._pending_discussions:
+            return False
+
+        if (
+            self._was_recently_discussed(ticker)
+            or len(self._active_rooms) + len(self._pending_discussions) >= self.max_concurrent
+        ):
+            # Keep the condition armed so it fires again once allowed
+            self._triggers.rearm(ticker)
+            return False
+
+        logger.info(
+            "opportunity_detected",
+            ticker=ticker,
+            rules=rules,
+            current=stock.get("current_price"),
+            target=stock.get("target_entry_price"),
+            confidence=stock.get("confidence"),
+        )
+
+        self._pending_discussions.add(ticker)
+        task = self._spawn(self._start_discussion(stock))
+        task.add_done_callback(lambda _: self._pending_discussions.discard(ticker))
+        return True
+
+    async def _poll_quotes(self) -> None:
+        """Feed snapshot quotes to the triggers when there is no tick stream."""
+        from services.market_snapshot import QUOTE, get_market_snapshot_service
+
+        service = get_market_snapshot_service()
+        for ticker in self._triggers.tickers:
+            try:
+                snapshot = await service.get_snapshot(ticker, parts=(QUOTE,))
+            except Exception as e:
+                logger.debug("chat_quote_poll_failed", ticker=ticker, error=str(e))
+                continue
+            if snapshot.stock_info is None:
+                continue
+
+            rules = self._triggers.on_price(ticker, snapshot.stock_info.cur_prc)
+            if rules:
+                self._on_trigger(self._triggers.get_stock(ticker), rules)
+
     async def _check_watch_list(self) -> None:
-        """Check watch list for discussion opportunities."""
+        """Reconcile the watch list with the trigger engine."""
         if not self._running:
             return
 
@@ -166,37 +328,73 @@ class ChatCoordinator:
             # Get active watch list stocks
             watch_list = await self._get_watch_list()
 
-            if not watch_list:
-                logger.debug("watch_list_empty")
-                return
+            # Rules for new/changed stocks are evaluated right away
+            # (price rules only against a live tick, never the stored snapshot)
+            prices = self._latest_prices([stock["ticker"] for stock in watch_list])
+            for stock, rules in self._triggers.sync(watch_list, prices):
+                self._on_trigger(stock, rules)
+
+            await self._update_tick_subscriptions()
+
+            if not self._tick_service:
+                await self._poll_quotes()
+
+            self._schedule_news_sentiment(watch_list)
+
+        except Exception as e:
+            logger.error("watch_list_check_failed", error=str(e))
 
-            # Check each stock for opportunity
-            opportunities = []
-            for stock in watch_list:
-                ticker = stock.get("ticker")
-                if not ticker:
-                    continue
+    def _schedule_news_sentiment(self, watch_list: List[dict]) -> None:
+        """Refresh stale news sentiment of watched stocks in the background (one batch)."""
+        watched = {stock["ticker"] for stock in watch_list}
+        for ticker in set(self._news_sentiment) - watched:
+            del self._news_sentiment[ticker]
 
-                # Skip if already discussing
-                if ticker in self._active_rooms:
-                    continue
+        if self._sentiment_task is not None and not self._sentiment_task.done():
+            return
 
-                # Skip if recently discussed
-                if self._was_recently_discussed(ticker):
-                    continue
+        now = datetime.now()
+        stale = [
+            (stock["ticker"], stock.get("stock_name") or stock["ticker"])
+            for stock in watch_list
+            if stock["ticker"] not in self._news_sentiment
+            or now - self._news_sentiment[stock["ticker"]][0] >= NEWS_SENTIMENT_TTL
+        ]
+        if stale:
+            self._sentiment_task = self._spawn(self._refresh_news_sentiment(stale))
 
-                # Check if opportunity exists
-                should_discuss = await self._detect_opportunity(stock)
-                if should_discuss:
-                    opportunities.append(stock)
+    async def _refresh_news_sentiment(self, stocks: List[tuple]) -> None:
+        """Score news sentiment for (ticker, name) pairs with batched LLM calls."""
+        try:
+            from agents.llm_provider import get_llm_provider
+            from app.dependencies import get_news_service
+            from services.news import analyze_stocks_news_sentiment
 
-            # Start discussions for opportunities (up to max concurrent)
-            available_slots = self.max_concurrent - len(self._active_rooms)
-            for stock in opportunities[:available_slots]:
-                await self._start_discussion(stock)
+            news_service = await get_news_service()
+            if not news_service.providers:
+                return
 
+            results = await analyze_stocks_news_sentiment(
+                stocks,
+                news_service,
+                get_llm_provider(),
+                article_count=50,
+            )
         except Exception as e:
-            logger.error("watch_list_check_failed", error=str(e))
+            logger.warning("watch_list_sentiment_failed", stocks=len(stocks), error=str(e))
+            return
+
+        now = datetime.now()
+        for ticker, result in results.items():
+            self._news_sentiment[ticker] = (now, result)
+        logger.info("watch_list_sentiment_refreshed", stocks=len(results))
+
+    def _get_news_sentiment(self, ticker: str):
+        """Batched news sentiment for a watched ticker, if fresh."""
+        entry = self._news_sentiment.get(ticker)
+        if entry is None or datetime.now() - entry[0] >= NEWS_SENTIMENT_TTL:
+            return None
+        return entry[1]
 
     async def _get_watch_list(self) -> List[dict]:
         """Get active watch list stocks from trading coordinator."""
@@ -230,43 +428,6 @@ class ChatCoordinator:
             return False
         return datetime.now() - last_time < self.min_interval
 
-    async def _detect_opportunity(self, stock: dict) -> bool:
-        """
-        Detect if a stock presents a trading opportunity.
-
-        Criteria:
-        - Price near target entry
-        - Significant price movement
-        - High confidence signal
-        """
-        ticker = stock.get("ticker")
-        current_price = stock.get("current_price", 0)
-        target_price = stock.get("target_entry_price")
-        confidence = stock.get("confidence", 0)
-
-        # Check if price is near target (within 3%)
-        if target_price and current_price:
-            price_diff = abs(current_price - target_price) / target_price
-            if price_diff <= 0.03:
-                logger.info(
-                    "opportunity_detected_target_reached",
-                    ticker=ticker,
-                    current=current_price,
-                    target=target_price,
-                )
-                return True
-
-        # Check for high confidence
-        if confidence >= 0.75:
-            logger.info(
-                "opportunity_detected_high_confidence",
-                ticker=ticker,
-                confidence=confidence,
-            )
-            return True
-
-        return False
-
     async def _start_discussion(self, stock: dict) -> None:
         """Start a new discussion for a stock."""
         ticker = stock["ticker"]
@@ -295,7 +456,7 @@ class ChatCoordinator:
             self._active_rooms[ticker] = room
 
             # Start discussion in background
-            asyncio.create_task(self._run_discussion(ticker, room))
+            self._spawn(self._run_discussion(ticker, room))
 
         except Exception as e:
             logger.error(
@@ -504,39 +665,31 @@ class ChatCoordinator:
         )
 
         try:
-            from agents.tools.kr_market_data import (
-                get_kr_stock_info,
-                get_kr_daily_chart,
-                calculate_kr_technical_indicators,
+            from agents.tools.kr_market_data import get_kr_stock_info
+            from services.market_snapshot import (
+                BARS,
+                POSITION,
+                QUOTE,
+                get_market_snapshot_service,
+            )
+
+            # Quote, chart (+ indicators) and portfolio come from the shared
+            # snapshot, fetched concurrently with the news search
+            snapshot, news_count = await asyncio.gather(
+                get_market_snapshot_service().get_snapshot(ticker, parts=(QUOTE, BARS, POSITION)),
+                self._fetch_news_count(ticker, stock_name),
             )
-            from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-
-            # Fetch stock info
-            stock_info = await get_kr_stock_info(ticker)
-
-            # Fetch chart data
-            chart_df = await get_kr_daily_chart(ticker)
-
-            # Calculate indicators
-            import pandas as pd
-            if not chart_df.empty:
-                indicators = calculate_kr_technical_indicators(chart_df)
-                chart_data = [
-                    {
-                        "date": idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx),
-                        "open": int(row["open"]),
-                        "high": int(row["high"]),
-                        "low": int(row["low"]),
-                        "close": int(row["close"]),
-                        "volume": int(row["volume"]),
-                    }
-                    for idx, row in chart_df.iterrows()
-                ]
+
+            # Fall back to the tool (mock data when Kiwoom is unavailable)
+            stock_info = snapshot.quote or await get_kr_stock_info(ticker)
+
+            if snapshot.has(BARS):
+                chart_data = list(snapshot.chart_records)
+                indicators = dict(snapshot.kr_indicators) if snapshot.kr_indicators else {}
             else:
-                indicators = {}
-                chart_data = []
+                chart_data, indicators = await self._fetch_fallback_chart(ticker)
 
-            # Fetch portfolio info
+            # Portfolio info
             has_position = False
             position_quantity = None
             position_avg_price = None
@@ -544,49 +697,33 @@ class ChatCoordinator:
             available_cash = None
             total_portfolio = None
 
-            try:
-                client = await get_shared_kiwoom_client_async()
-                account = await client.get_account_balance()
-
-                available_cash = account.d2_ord_psbl_amt
-                total_portfolio = account.evlu_amt + account.d2_ord_psbl_amt
-
-                for holding in account.holdings:
-                    if holding.stk_cd == ticker:
-                        has_position = True
-                        position_quantity = holding.hldg_qty
-                        position_avg_price = holding.avg_buy_prc
-                        position_pnl_pct = holding.evlu_pfls_rt
-                        break
-            except Exception as e:
-                logger.warning("portfolio_fetch_failed", error=str(e))
+            if snapshot.portfolio is not None:
+                available_cash = snapshot.portfolio["available_cash"]
+                total_portfolio = snapshot.portfolio["total_eval"] + snapshot.portfolio["available_cash"]
+
+                if snapshot.position is not None:
+                    has_position = True
+                    position_quantity = snapshot.position["quantity"]
+                    position_avg_price = snapshot.position["avg_buy_price"]
+                    position_pnl_pct = snapshot.position["profit_loss_pct"]
+            else:
+                logger.warning("portfolio_fetch_failed", error=snapshot.errors.get(POSITION))
 
-            # Fetch news sentiment
+            # Batched news sentiment from the watch list refresh, else
+            # price momentum as a proxy
             news_sentiment = None
-            news_count = 0
-            try:
-                from app.dependencies import get_news_service
-                news_service = await get_news_service()
-                if news_service.providers:
-                    result = await news_service.search_stock_news(
-                        stock_code=ticker,
-                        stock_name=stock_name,
-                        count=50,
-                    )
-                    news_count = len(result.articles)
-
-                    # Simple sentiment calculation
-                    if news_count > 0:
-                        # Use price momentum as proxy if no analyzer
-                        change = stock_info.get("prdy_ctrt", 0)
-                        if change > 2:
-                            news_sentiment = "positive"
-                        elif change < -2:
-                            news_sentiment = "negative"
-                        else:
-                            news_sentiment = "neutral"
-            except Exception as e:
-                logger.warning("news_fetch_failed", error=str(e))
+            scored = self._get_news_sentiment(ticker)
+            if scored is not None:
+                news_sentiment = scored.sentiment
+            elif news_count > 0:
+                # Use price momentum as proxy if no analyzer
+                change = stock_info.get("prdy_ctrt", 0)
+                if change > 2:
+                    news_sentiment = "positive"
+                elif change < -2:
+                    news_sentiment = "negative"
+                else:
+                    news_sentiment = "neutral"
 
             return MarketContext(
                 ticker=ticker,
@@ -623,6 +760,43 @@ class ChatCoordinator:
                 price_change_pct=0,
             )
 
+    async def _fetch_fallback_chart(self, ticker: str) -> tuple[list, dict]:
+        """Chart records and indicators from the tool (mock data when Kiwoom is unavailable)."""
+        from agents.tools.kr_market_data import (
+            calculate_kr_technical_indicators,
+            chart_df_to_records,
+            get_kr_daily_chart,
+        )
+        from services.compute import get_compute_executor
+
+        chart_df = await get_kr_daily_chart(ticker)
+        if chart_df.empty:
+            return [], {}
+
+        # Calculate indicators and serialize the chart off the event loop
+        executor = get_compute_executor()
+        indicators, chart_data = await asyncio.gather(
+            executor.run_frame(calculate_kr_technical_indicators, chart_df),
+            executor.run_frame(chart_df_to_records, chart_df),
+        )
+        return chart_data, indicators
+
+    async def _fetch_news_count(self, ticker: str, stock_name: str) -> int:
+        """Count recent news articles for the stock (0 if news is unavailable)."""
+        try:
+            from app.dependencies import get_news_service
+            news_service = await get_news_service()
+            if news_service.providers:
+                result = await news_service.search_stock_news(
+                    stock_code=ticker,
+                    stock_name=stock_name,
+                    count=50,
+                )
+                return len(result.articles)
+        except Exception as e:
+            logger.warning("news_fetch_failed", error=str(e))
+        return 0
+
     # -------------------------------------------
     # Manual Discussion API
     # -------------------------------------------
@@ -3,9 +3,14 @@ Position Manager
 
 Real-time position monitoring with Agent Group Chat integration.
 Triggers agent discussions for position management decisions.
+
+Price-level events (stop-loss, take-profit, warnings, gain/loss thresholds,
+trailing stops) are registered in the shared TriggerBook, so a price update
+only evaluates the levels it crosses.
 """
 
 import asyncio
+import uuid
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Callable, Any
@@ -13,10 +18,18 @@ from typing import Dict, List, Optional, Callable, Any
 import structlog
 from pydantic import BaseModel, Field
 
+from services.account_state import get_account_state_service
 from services.agent_chat.models import (
     MarketContext,
     DecisionAction,
 )
+from services.trading.trigger_book import (
+    LOWER,
+    UPPER,
+    Trigger,
+    TriggerBook,
+    get_trigger_book,
+)
 
 logger = structlog.get_logger()
 
@@ -218,6 +231,16 @@ class PositionManagerConfig(BaseModel):
 # Position Manager
 # -------------------------------------------
 
+# Trigger kinds registered in the trigger book
+_STOP_LOSS = "stop_loss"
+_STOP_LOSS_NEAR = "stop_loss_near"
+_TAKE_PROFIT = "take_profit"
+_TAKE_PROFIT_NEAR = "take_profit_near"
+_SIGNIFICANT_GAIN = "significant_gain"
+_SIGNIFICANT_LOSS = "significant_loss"
+_TRAILING_STOP = "trailing_stop"
+_TRAILING_ACTIVATION = "trailing_activation"
+
 
 class PositionManager:
     """
@@ -234,18 +257,24 @@ class PositionManager:
     def __init__(
         self,
         config: Optional[PositionManagerConfig] = None,
+        trigger_book: Optional[TriggerBook] = None,
     ):
         """
         Initialize position manager.
 
         Args:
             config: Manager configuration
+            trigger_book: Trigger book (defaults to the shared instance)
         """
         self.config = config or PositionManagerConfig()
 
         # Monitored positions
         self._positions: Dict[str, MonitoredPosition] = {}
 
+        # Holdings last applied from account snapshots (stk_cd -> Holding);
+        # positions added by hand are never in here, so syncs keep them
+        self._account_holdings: Dict[str, Any] = {}
+
         # Event history
         self._events: List[PositionEvent] = []
         self._pending_events: List[PositionEvent] = []
@@ -261,6 +290,11 @@ class PositionManager:
         # Chat coordinator reference (set by coordinator)
         self._chat_coordinator = None
 
+        # Price-level triggers
+        self._book = trigger_book or get_trigger_book()
+        self._owner = f"position_manager-{uuid.uuid4().hex[:6]}"
+        self._book.register_handler(self._owner, self._on_trigger_hits)
+
         logger.info(
             "position_manager_initialized",
             check_interval=self.config.check_interval_seconds,
@@ -290,7 +324,14 @@ class PositionManager:
 
         logger.info("position_manager_starting")
         self._running = True
+
+        # stop() dropped our handler and triggers from the shared book
+        self._book.register_handler(self._owner, self._on_trigger_hits)
+        for position in self._positions.values():
+            self._arm_triggers(position)
+
         self._task = asyncio.create_task(self._monitor_loop())
+        get_account_state_service().subscribe(self.apply_account_snapshot)
         logger.info("position_manager_started")
 
     async def stop(self) -> None:
@@ -300,6 +341,10 @@ class PositionManager:
 
         logger.info("position_manager_stopping")
         self._running = False
+        get_account_state_service().unsubscribe(self.apply_account_snapshot)
+
+        # Other owners keep pushing prices into the shared book
+        self._book.unregister_owner(self._owner)
 
         if self._task:
             self._task.cancel()
@@ -355,6 +400,7 @@ class PositionManager:
         )
 
         self._positions[ticker] = position
+        self._arm_triggers(position)
 
         logger.info(
             "position_added",
@@ -401,6 +447,9 @@ class PositionManager:
         if trailing_stop_pct is not None:
             position.trailing_stop_pct = trailing_stop_pct
 
+        if stop_loss is not None or take_profit is not None or trailing_stop_pct is not None:
+            self._arm_triggers(position)
+
         position.last_check = datetime.now()
 
         return position
@@ -409,6 +458,7 @@ class PositionManager:
         """Remove a position from monitoring."""
         if ticker in self._positions:
             del self._positions[ticker]
+            self._book.remove(self._owner, ticker)
             logger.info("position_removed", ticker=ticker)
             return True
         return False
@@ -477,91 +527,29 @@ class PositionManager:
             # Fallback: prices not updated
             pass
 
-    async def _check_position(self, position: MonitoredPosition) -> None:
-        """Check a single position for events."""
-        events = []
-
-        # Check stop-loss proximity
-        if position.stop_loss:
-            stop_distance_pct = (
-                (position.current_price - position.stop_loss) / position.current_price * 100
-            )
+    async def on_price(self, ticker: str, price: float) -> None:
+        """
+        Push a live price (e.g., from a WebSocket tick).
 
-            if stop_distance_pct <= 0:
-                # Stop-loss hit
-                events.append(self._create_event(
-                    position, PositionEventType.STOP_LOSS_HIT,
-                    position.stop_loss,
-                    f"손절가 도달: ₩{position.current_price:,.0f} <= ₩{position.stop_loss:,.0f}",
-                    auto_execute=self.config.auto_execute_stop_loss,
-                ))
-            elif stop_distance_pct <= self.config.stop_loss_warning_pct:
-                # Approaching stop-loss
-                if PositionEventType.STOP_LOSS_NEAR.value not in position.events_triggered:
-                    events.append(self._create_event(
-                        position, PositionEventType.STOP_LOSS_NEAR,
-                        stop_distance_pct,
-                        f"손절가 근접: {stop_distance_pct:.1f}% 거리",
-                    ))
-                    position.events_triggered.append(PositionEventType.STOP_LOSS_NEAR.value)
-
-        # Check take-profit proximity
-        if position.take_profit:
-            tp_distance_pct = (
-                (position.take_profit - position.current_price) / position.current_price * 100
-            )
+        Only the position's triggers crossed by this price are evaluated.
+        """
+        position = self.update_position(ticker, current_price=price)
+        if position is not None:
+            await self._check_position(position)
 
-            if tp_distance_pct <= 0:
-                # Take-profit hit
-                events.append(self._create_event(
-                    position, PositionEventType.TAKE_PROFIT_HIT,
-                    position.take_profit,
-                    f"익절가 도달: ₩{position.current_price:,.0f} >= ₩{position.take_profit:,.0f}",
-                    auto_execute=self.config.auto_execute_take_profit,
-                ))
-            elif tp_distance_pct <= self.config.take_profit_warning_pct:
-                # Approaching take-profit
-                if PositionEventType.TAKE_PROFIT_NEAR.value not in position.events_triggered:
-                    events.append(self._create_event(
-                        position, PositionEventType.TAKE_PROFIT_NEAR,
-                        tp_distance_pct,
-                        f"익절가 근접: {tp_distance_pct:.1f}% 거리",
-                    ))
-                    position.events_triggered.append(PositionEventType.TAKE_PROFIT_NEAR.value)
-
-        # Check significant gain/loss
-        pnl_pct = position.unrealized_pnl_pct
+    async def _check_position(self, position: MonitoredPosition) -> None:
+        """Check a single position for events."""
+        # Crossed price levels are delivered to _on_trigger_hits
+        await self._book.update_price(position.ticker, position.current_price)
 
-        if pnl_pct >= self.config.significant_gain_pct:
-            if PositionEventType.SIGNIFICANT_GAIN.value not in position.events_triggered:
-                events.append(self._create_event(
-                    position, PositionEventType.SIGNIFICANT_GAIN,
-                    pnl_pct,
-                    f"상당한 수익: {pnl_pct:.1f}% (₩{position.unrealized_pnl:,.0f})",
-                ))
-                position.events_triggered.append(PositionEventType.SIGNIFICANT_GAIN.value)
+        if position.ticker not in self._positions:
+            # Closed by an auto-executed event
+            return
 
-        if pnl_pct <= -self.config.significant_loss_pct:
-            if PositionEventType.SIGNIFICANT_LOSS.value not in position.events_triggered:
-                events.append(self._create_event(
-                    position, PositionEventType.SIGNIFICANT_LOSS,
-                    pnl_pct,
-                    f"상당한 손실: {pnl_pct:.1f}% (₩{position.unrealized_pnl:,.0f})",
-                ))
-                position.events_triggered.append(PositionEventType.SIGNIFICANT_LOSS.value)
+        events = []
 
         # Check trailing stop
-        if position.trailing_stop_pct:
-            await self._check_trailing_stop(position, events)
-        elif pnl_pct >= self.config.trailing_activation_pct:
-            # Auto-activate trailing stop
-            if self.config.auto_update_trailing:
-                position.trailing_stop_pct = self.config.default_trailing_pct
-                logger.info(
-                    "trailing_stop_activated",
-                    ticker=position.ticker,
-                    trailing_pct=position.trailing_stop_pct,
-                )
+        await self._check_trailing_stop(position, events)
 
         # Check long holding period
         if position.holding_days >= self.config.long_holding_days:
@@ -577,6 +565,141 @@ class PositionManager:
         for event in events:
             await self._handle_event(event, position)
 
+    # -------------------------------------------
+    # Price Triggers
+    # -------------------------------------------
+
+    def _arm_triggers(self, position: MonitoredPosition) -> None:
+        """
+        Register the position's price levels in the trigger book.
+
+        Warning and gain/loss levels that already fired stay disarmed
+        (they are reported once per position).
+        """
+        ticker = position.ticker
+        book = self._book
+        book.remove(self._owner, ticker)
+        fired = set(position.events_triggered)
+
+        if position.stop_loss:
+            book.set(self._owner, ticker, _STOP_LOSS, position.stop_loss, LOWER)
+            if PositionEventType.STOP_LOSS_NEAR.value not in fired:
+                near = position.stop_loss / (1 - self.config.stop_loss_warning_pct / 100)
+                book.set(self._owner, ticker, _STOP_LOSS_NEAR, near, LOWER)
+
+        if position.take_profit:
+            book.set(self._owner, ticker, _TAKE_PROFIT, position.take_profit, UPPER)
+            if PositionEventType.TAKE_PROFIT_NEAR.value not in fired:
+                near = position.take_profit / (1 + self.config.take_profit_warning_pct / 100)
+                book.set(self._owner, ticker, _TAKE_PROFIT_NEAR, near, UPPER)
+
+        if PositionEventType.SIGNIFICANT_GAIN.value not in fired:
+            level = position.avg_price * (1 + self.config.significant_gain_pct / 100)
+            book.set(self._owner, ticker, _SIGNIFICANT_GAIN, level, UPPER)
+
+        if PositionEventType.SIGNIFICANT_LOSS.value not in fired:
+            level = position.avg_price * (1 - self.config.significant_loss_pct / 100)
+            book.set(self._owner, ticker, _SIGNIFICANT_LOSS, level, LOWER)
+
+        if position.trailing_stop_pct:
+            book.set_trailing(
+                self._owner, ticker, _TRAILING_STOP,
+                position.trailing_stop_pct, position.highest_price,
+            )
+        elif self.config.auto_update_trailing:
+            level = position.avg_price * (1 + self.config.trailing_activation_pct / 100)
+            book.set(self._owner, ticker, _TRAILING_ACTIVATION, level, UPPER)
+
+    async def _on_trigger_hits(self, hits: List[Trigger], price: float) -> None:
+        """Turn this manager's crossed triggers into position events."""
+        position = self._positions.get(hits[0].ticker)
+        if position is None:
+            return
+
+        if position.current_price != price:
+            self.update_position(position.ticker, current_price=price)
+
+        kinds = {trigger.kind for trigger in hits}
+        events = []
+
+        # Stop-loss (fixed or trailing); a hit supersedes the warning
+        if kinds & {_STOP_LOSS, _TRAILING_STOP}:
+            stop = max(
+                trigger.level for trigger in hits
+                if trigger.kind in (_STOP_LOSS, _TRAILING_STOP)
+            )
+            for kind in (_STOP_LOSS, _TRAILING_STOP, _STOP_LOSS_NEAR):
+                self._book.remove(self._owner, position.ticker, kind)
+            events.append(self._create_event(
+                position, PositionEventType.STOP_LOSS_HIT,
+                stop,
+                f"손절가 도달: ₩{position.current_price:,.0f} <= ₩{stop:,.0f}",
+                auto_execute=self.config.auto_execute_stop_loss,
+            ))
+        elif _STOP_LOSS_NEAR in kinds and position.stop_loss:
+            stop_distance_pct = (
+                (position.current_price - position.stop_loss) / position.current_price * 100
+            )
+            events.append(self._create_event(
+                position, PositionEventType.STOP_LOSS_NEAR,
+                stop_distance_pct,
+                f"손절가 근접: {stop_distance_pct:.1f}% 거리",
+            ))
+            position.events_triggered.append(PositionEventType.STOP_LOSS_NEAR.value)
+
+        # Take-profit; a hit supersedes the warning
+        if _TAKE_PROFIT in kinds and position.take_profit:
+            self._book.remove(self._owner, position.ticker, _TAKE_PROFIT_NEAR)
+            events.append(self._create_event(
+                position, PositionEventType.TAKE_PROFIT_HIT,
+                position.take_profit,
+                f"익절가 도달: ₩{position.current_price:,.0f} >= ₩{position.take_profit:,.0f}",
+                auto_execute=self.config.auto_execute_take_profit,
+            ))
+        elif _TAKE_PROFIT_NEAR in kinds and position.take_profit:
+            tp_distance_pct = (
+                (position.take_profit - position.current_price) / position.current_price * 100
+            )
+            events.append(self._create_event(
+                position, PositionEventType.TAKE_PROFIT_NEAR,
+                tp_distance_pct,
+                f"익절가 근접: {tp_distance_pct:.1f}% 거리",
+            ))
+            position.events_triggered.append(PositionEventType.TAKE_PROFIT_NEAR.value)
+
+        # Significant gain/loss
+        pnl_pct = position.unrealized_pnl_pct
+
+        if _SIGNIFICANT_GAIN in kinds:
+            events.append(self._create_event(
+                position, PositionEventType.SIGNIFICANT_GAIN,
+                pnl_pct,
+                f"상당한 수익: {pnl_pct:.1f}% (₩{position.unrealized_pnl:,.0f})",
+            ))
+            position.events_triggered.append(PositionEventType.SIGNIFICANT_GAIN.value)
+
+        if _SIGNIFICANT_LOSS in kinds:
+            events.append(self._create_event(
+                position, PositionEventType.SIGNIFICANT_LOSS,
+                pnl_pct,
+                f"상당한 손실: {pnl_pct:.1f}% (₩{position.unrealized_pnl:,.0f})",
+            ))
+            position.events_triggered.append(PositionEventType.SIGNIFICANT_LOSS.value)
+
+        # Auto-activate trailing stop
+        if _TRAILING_ACTIVATION in kinds and not position.trailing_stop_pct:
+            position.trailing_stop_pct = self.config.default_trailing_pct
+            logger.info(
+                "trailing_stop_activated",
+                ticker=position.ticker,
+                trailing_pct=position.trailing_stop_pct,
+            )
+
+        for event in events:
+            if position.ticker not in self._positions:
+                break
+            await self._handle_event(event, position)
+
     async def _check_trailing_stop(
         self,
         position: MonitoredPosition,
@@ -586,8 +709,11 @@ class PositionManager:
         if not position.trailing_stop_pct:
             return
 
-        # Calculate trailing stop price
+        # Calculate trailing stop price (the book also tracks highs between checks)
         new_trailing_price = position.highest_price * (1 - position.trailing_stop_pct / 100)
+        armed = self._book.get(self._owner, position.ticker, _TRAILING_STOP)
+        if armed is not None:
+            new_trailing_price = max(new_trailing_price, armed.level)
 
         # Update if higher than current trailing stop
         if (
@@ -596,10 +722,15 @@ class PositionManager:
         ):
             old_price = position.trailing_stop_price
             position.trailing_stop_price = new_trailing_price
+            self._book.set_trailing(
+                self._owner, position.ticker, _TRAILING_STOP,
+                position.trailing_stop_pct, position.highest_price,
+            )
 
             # Also update stop-loss if trailing stop is higher
             if position.stop_loss is None or new_trailing_price > position.stop_loss:
                 position.stop_loss = new_trailing_price
+                self._book.set(self._owner, position.ticker, _STOP_LOSS, new_trailing_price, LOWER)
 
             if old_price:
                 events.append(self._create_event(
@@ -949,47 +1080,57 @@ class PositionManager:
     async def sync_from_account(self) -> None:
         """Sync positions from account holdings."""
         try:
-            from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-
-            client = await get_shared_kiwoom_client_async()
-            account = await client.get_account_balance()
-
-            # Update or add positions from holdings
-            for holding in account.holdings:
-                if holding.hldg_qty <= 0:
-                    continue
-
-                if holding.stk_cd in self._positions:
-                    # Update existing
-                    self.update_position(
-                        ticker=holding.stk_cd,
-                        quantity=holding.hldg_qty,
-                        current_price=holding.cur_prc,
-                    )
-                else:
-                    # Add new
-                    self.add_position(
-                        ticker=holding.stk_cd,
-                        stock_name=holding.stk_nm,
-                        quantity=holding.hldg_qty,
-                        avg_price=holding.avg_buy_prc,
-                        current_price=holding.cur_prc,
-                    )
-
-            # Remove positions no longer in holdings
-            holding_tickers = {h.stk_cd for h in account.holdings if h.hldg_qty > 0}
-            for ticker in list(self._positions.keys()):
-                if ticker not in holding_tickers:
-                    self.remove_position(ticker)
-
-            logger.info(
-                "positions_synced",
-                count=len(self._positions),
-            )
+            account = await get_account_state_service().get_snapshot()
+            self.apply_account_snapshot(account)
 
         except Exception as e:
             logger.error("position_sync_failed", error=str(e))
 
+    def apply_account_snapshot(self, account) -> None:
+        """
+        Sync positions from an account snapshot.
+
+        Subscribed to the account state service while running, so fills are
+        reflected without another balance call. Only holdings that changed
+        since the last snapshot are applied, and only positions the account
+        reported before are removed (positions added by hand are kept).
+        """
+        holdings = {h.stk_cd: h for h in account.holdings if h.hldg_qty > 0}
+        changed = 0
+
+        for code, holding in holdings.items():
+            if self._account_holdings.get(code) == holding:
+                continue
+            changed += 1
+
+            if code in self._positions:
+                self.update_position(
+                    ticker=code,
+                    quantity=holding.hldg_qty,
+                    current_price=holding.cur_prc,
+                )
+            else:
+                self.add_position(
+                    ticker=code,
+                    stock_name=holding.stk_nm,
+                    quantity=holding.hldg_qty,
+                    avg_price=holding.avg_buy_prc,
+                    current_price=holding.cur_prc,
+                )
+
+        # Remove positions the account no longer holds
+        for code in self._account_holdings.keys() - holdings.keys():
+            changed += 1
+            self.remove_position(code)
+
+        self._account_holdings = holdings
+
+        logger.debug(
+            "positions_synced",
+            changed=changed,
+            count=len(self._positions),
+        )
+
 
 # -------------------------------------------
 # Singleton Instance
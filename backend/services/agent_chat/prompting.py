@@ -0,0 +1,155 @@
+"""
+Discussion Prompt Layout
+
+Builds the parts of agent prompts that are shared by every agent in a room.
+
+Features:
+- Shared prefix (discussion rules + market context) rendered once per room,
+  byte-identical for all agents so the LLM server's prefix cache can reuse it
+- Token-budgeted chat history: recent messages verbatim, older ones folded
+  into one summary line per agent
+- Rendered history lines are cached per message id
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from services.agent_chat.models import AgentMessage, AgentType, MarketContext
+
+
+AGENT_EMOJI = {
+    AgentType.TECHNICAL: "📊",
+    AgentType.FUNDAMENTAL: "📈",
+    AgentType.SENTIMENT: "📰",
+    AgentType.RISK: "⚠️",
+    AgentType.MODERATOR: "👔",
+}
+
+DISCUSSION_RULES = """# 종목 토론방
+
+여러 분야의 분석가가 한 종목의 매매 여부를 토론합니다.
+- 아래 시장 데이터는 모든 분석가가 공유합니다
+- 각 분석가는 자신의 전문 분야 관점에서만 발언합니다
+- 근거는 구체적인 수치로 제시합니다"""
+
+_INDICATOR_KEYS = ("rsi", "macd", "sma_20", "sma_60", "trend", "cross", "volume_ratio")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for budget checks (no tokenizer dependency).
+
+    ASCII text averages ~4 characters per token; Hangul and other
+    non-ASCII characters are counted as one token each.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _format_number(value: Optional[float], suffix: str = "", fmt: str = ",.0f") -> str:
+    return "N/A" if value is None else f"{value:{fmt}}{suffix}"
+
+
+def build_shared_prefix(context: MarketContext) -> str:
+    """
+    Render the room-wide prompt prefix for a market context.
+
+    The output depends only on the context, so every agent in the room
+    (and every round) sends exactly the same leading bytes.
+    """
+    lines = [
+        DISCUSSION_RULES,
+        "",
+        "## 시장 데이터",
+        f"종목: {context.stock_name} ({context.ticker})",
+        f"현재가: {context.current_price:,.0f}원 ({context.price_change_pct:+.2f}%)",
+        f"PER: {_format_number(context.per, '배', '.1f')} / "
+        f"PBR: {_format_number(context.pbr, '배', '.2f')} / "
+        f"EPS: {_format_number(context.eps, '원')}",
+    ]
+
+    indicators = context.indicators or {}
+    selected = {k: indicators[k] for k in _INDICATOR_KEYS if k in indicators}
+    if selected:
+        # sort_keys + fixed separators keep the rendering stable
+        lines.append(
+            "지표: " + json.dumps(selected, ensure_ascii=False, sort_keys=True, separators=(", ", ": "), default=str)
+        )
+
+    if context.news_sentiment or context.news_count:
+        lines.append(f"뉴스: {context.news_sentiment or 'N/A'} ({context.news_count or 0}건)")
+
+    if context.has_position:
+        pnl = _format_number(context.position_pnl_pct, "%", "+.2f")
+        lines.append(
+            f"보유: {context.position_quantity or 0}주 @ {_format_number(context.position_avg_price, '원')} ({pnl})"
+        )
+
+    return "\n".join(lines)
+
+
+class HistorySummarizer:
+    """
+    Formats chat history within a token budget.
+
+    Newest messages are kept verbatim (truncated to max_chars) until the
+    budget is used up; everything older is folded into one line per agent
+    with the message count and last confidence.
+    """
+
+    def __init__(self, token_budget: int = 1200, max_chars: int = 300):
+        self.token_budget = token_budget
+        self.max_chars = max_chars
+        self._lines: Dict[str, tuple[str, int]] = {}
+
+    def _render(self, message: AgentMessage) -> tuple[str, int]:
+        cached = self._lines.get(message.id)
+        if cached is None:
+            emoji = AGENT_EMOJI.get(message.agent_type, "🤖")
+            line = f"{emoji} {message.agent_name}: {message.content[:self.max_chars]}"
+            cached = (line, estimate_tokens(line))
+            self._lines[message.id] = cached
+        return cached
+
+    def format(self, messages: List[AgentMessage]) -> str:
+        """
+        Format messages for an LLM prompt.
+
+        Args:
+            messages: Chat history in chronological order
+
+        Returns:
+            History text, "이전 대화 없음" if empty
+        """
+        if not messages:
+            return "이전 대화 없음"
+
+        verbatim: List[str] = []
+        used = 0
+        cutoff = len(messages)
+        for i in range(len(messages) - 1, -1, -1):
+            line, tokens = self._render(messages[i])
+            if verbatim and used + tokens > self.token_budget:
+                break
+            verbatim.append(line)
+            used += tokens
+            cutoff = i
+
+        older = messages[:cutoff]
+        if not older:
+            return "\n".join(reversed(verbatim))
+
+        # Fold older messages: one line per agent, in first-seen order
+        folded: Dict[AgentType, list] = {}
+        for msg in older:
+            entry = folded.setdefault(msg.agent_type, [msg.agent_name, 0, msg.confidence])
+            entry[1] += 1
+            entry[2] = msg.confidence
+
+        lines = [f"(이전 발언 {len(older)}건 요약)"]
+        for agent_type, (name, count, confidence) in folded.items():
+            emoji = AGENT_EMOJI.get(agent_type, "🤖")
+            lines.append(f"{emoji} {name}: {count}건, 최근 신뢰도 {confidence:.0%}")
+        lines.append("")
+        lines.extend(reversed(verbatim))
+        return "\n".join(lines)
@@ -0,0 +1,213 @@
+"""
+Watch List Trigger Engine
+
+Event-driven opportunity detection for the agent chat coordinator.
+
+Rules per watched stock:
+- target_band: price within ±band_pct of the target entry price
+- high_confidence: analysis confidence >= threshold (price independent)
+
+Price rules are indexed per ticker by their sorted band edges. A tick
+costs two bisects; rules are only re-evaluated when the price moves into
+a different zone between edges, and fire on the false -> true edge.
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+TARGET_BAND = "target_band"
+HIGH_CONFIDENCE = "high_confidence"
+
+
+@dataclass(frozen=True)
+class PriceBand:
+    """Inclusive price band rule."""
+    name: str
+    low: float
+    high: float
+
+    def contains(self, price: float) -> bool:
+        return self.low <= price <= self.high
+
+
+@dataclass
+class _TickerTriggers:
+    """Per-ticker rule index and evaluation state."""
+    stock: dict
+    bands: Tuple[PriceBand, ...]
+    edges: List[float]
+    zone: Optional[Tuple[int, int]] = None
+    active: FrozenSet[str] = frozenset()
+    rearmed: bool = False
+    zone_cache: Dict[Tuple[int, int], FrozenSet[str]] = field(default_factory=dict)
+
+
+class WatchTriggerEngine:
+    """
+    Incremental trigger evaluation for watch list stocks.
+
+    Usage:
+        engine = WatchTriggerEngine()
+        fired = engine.sync(watch_list, prices)  # [(stock, [rule, ...]), ...]
+        rules = engine.on_price("005930", 72500)  # [] unless a rule just became true
+    """
+
+    def __init__(self, band_pct: float = 0.03, confidence_threshold: float = 0.75):
+        self.band_pct = band_pct
+        self.confidence_threshold = confidence_threshold
+        self._tickers: Dict[str, _TickerTriggers] = {}
+
+        # Statistics
+        self._ticks = 0
+        self._evaluations = 0
+        self._fired = 0
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers currently watched."""
+        return list(self._tickers)
+
+    def get_stock(self, ticker: str) -> Optional[dict]:
+        """Watch list entry for a ticker."""
+        entry = self._tickers.get(ticker)
+        return entry.stock if entry else None
+
+    def _build_bands(self, stock: dict) -> Tuple[PriceBand, ...]:
+        target = stock.get("target_entry_price")
+        if not target:
+            return ()
+        return (
+            PriceBand(TARGET_BAND, target * (1 - self.band_pct), target * (1 + self.band_pct)),
+        )
+
+    @staticmethod
+    def _rule_key(stock: dict) -> tuple:
+        return (stock.get("target_entry_price"), stock.get("confidence"))
+
+    def sync(
+        self,
+        watch_list: List[dict],
+        prices: Optional[Mapping[str, float]] = None,
+    ) -> List[Tuple[dict, List[str]]]:
+        """
+        Reconcile the engine with the current watch list.
+
+        New or changed entries get fresh rules; removed tickers are
+        dropped. Price rules of new entries are evaluated right away only
+        against a live price from `prices`; the entry's stored
+        current_price is a snapshot from analysis time and is never used,
+        so without a live price they wait for the next tick.
+
+        Args:
+            watch_list: Active watch list entries (dicts with ticker,
+                target_entry_price, confidence, ...)
+            prices: Latest live price per ticker, if known
+
+        Returns:
+            (stock, fired rule names) for every entry that fired
+        """
+        fired: List[Tuple[dict, List[str]]] = []
+        seen = set()
+
+        for stock in watch_list:
+            ticker = stock.get("ticker")
+            if not ticker:
+                continue
+            seen.add(ticker)
+
+            existing = self._tickers.get(ticker)
+            if (
+                existing is not None
+                and not existing.rearmed
+                and self._rule_key(existing.stock) == self._rule_key(stock)
+            ):
+                existing.stock = stock
+                continue
+
+            bands = self._build_bands(stock)
+            entry = _TickerTriggers(
+                stock=stock,
+                bands=bands,
+                edges=sorted({edge for band in bands for edge in (band.low, band.high)}),
+            )
+            self._tickers[ticker] = entry
+
+            rules: List[str] = []
+            if (stock.get("confidence") or 0) >= self.confidence_threshold:
+                rules.append(HIGH_CONFIDENCE)
+
+            price = (prices or {}).get(ticker)
+            if price:
+                rules.extend(self._evaluate(entry, price))
+
+            if rules:
+                self._fired += 1
+                fired.append((stock, rules))
+
+        for ticker in set(self._tickers) - seen:
+            del self._tickers[ticker]
+
+        return fired
+
+    def on_price(self, ticker: str, price: float) -> List[str]:
+        """
+        Feed a live price.
+
+        Returns:
+            Names of price rules that became true on this tick
+        """
+        entry = self._tickers.get(ticker)
+        if entry is None or not entry.bands:
+            return []
+
+        self._ticks += 1
+        rules = self._evaluate(entry, price)
+        if rules:
+            self._fired += 1
+            entry.stock["current_price"] = price
+        return rules
+
+    def _evaluate(self, entry: _TickerTriggers, price: float) -> List[str]:
+        """Edge-triggered evaluation; skipped while the price stays in its zone."""
+        zone = (bisect_left(entry.edges, price), bisect_right(entry.edges, price))
+        if zone == entry.zone:
+            return []
+
+        active = entry.zone_cache.get(zone)
+        if active is None:
+            # Every price in a zone has the same band membership
+            self._evaluations += 1
+            active = frozenset(band.name for band in entry.bands if band.contains(price))
+            entry.zone_cache[zone] = active
+
+        newly_active = active - entry.active
+        entry.zone = zone
+        entry.active = active
+        return sorted(newly_active)
+
+    def rearm(self, ticker: str) -> None:
+        """
+        Forget a ticker's evaluation state so a still-true rule fires again
+        (price rules on the next tick, confidence on the next sync). Used
+        when a trigger could not be acted on.
+        """
+        entry = self._tickers.get(ticker)
+        if entry is not None:
+            entry.zone = None
+            entry.active = frozenset()
+            entry.rearmed = True
+
+    def get_stats(self) -> dict:
+        """Get engine statistics."""
+        return {
+            "tickers": len(self._tickers),
+            "ticks": self._ticks,
+            "evaluations": self._evaluations,
+            "fired": self._fired,
+        }
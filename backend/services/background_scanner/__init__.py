@@ -10,10 +10,16 @@ from services.background_scanner.scanner import (
     ScanStatus,
     ScanProgress,
 )
+from services.background_scanner.archive import (
+    ScanArchive,
+    ScanPartition,
+)
 
 __all__ = [
     "BackgroundScanner",
     "get_background_scanner",
     "ScanStatus",
     "ScanProgress",
+    "ScanArchive",
+    "ScanPartition",
 ]
@@ -0,0 +1,416 @@
+"""
+Scan Results Archive
+
+Append-only columnar archive of completed scan sessions, used for
+cross-session analytics (per-ticker history, action transitions,
+top-N by confidence) without scanning the row-per-stock scan_results table.
+
+Layout:
+- One row per completed session in the scan_archive table (the partition)
+- Every column is stored as one packed blob (NumPy array bytes or
+  newline-joined text), rows sorted by stock code
+- Partitions never change after being written, so decoded partitions
+  are cached in memory and queries run as vectorized NumPy operations
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiosqlite
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Action <-> int8 code mapping (order is part of the storage format)
+ACTIONS = ("BUY", "SELL", "HOLD", "WATCH", "AVOID")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+UNKNOWN_ACTION = -1
+
+
+def _encode_actions(actions: List[str]) -> np.ndarray:
+    return np.array(
+        [ACTION_CODES.get(action, UNKNOWN_ACTION) for action in actions],
+        dtype=np.int8,
+    )
+
+
+def _decode_action(code: int) -> str:
+    return ACTIONS[code] if 0 <= code < len(ACTIONS) else "UNKNOWN"
+
+
+def _pack_text(values) -> bytes:
+    return "\n".join(value.replace("\n", " ") for value in values).encode("utf-8")
+
+
+def _unpack_text(blob: bytes, count: int) -> List[str]:
+    if count == 0:
+        return []
+    return blob.decode("utf-8").split("\n")
+
+
+@dataclass(frozen=True)
+class ScanPartition:
+    """Immutable columnar view of one completed scan session."""
+    session_id: str
+    started_at: Optional[str]
+    stk_cd: np.ndarray          # str, sorted ascending
+    stk_nm: tuple
+    action: np.ndarray          # int8 codes (see ACTIONS)
+    confidence: np.ndarray      # float32
+    current_price: np.ndarray   # int64
+    volume: np.ndarray          # int64
+
+    def __len__(self) -> int:
+        return len(self.stk_cd)
+
+    def find(self, stk_cd: str) -> Optional[int]:
+        """Binary search for a stock code; returns its row index."""
+        pos = int(np.searchsorted(self.stk_cd, stk_cd))
+        if pos < len(self.stk_cd) and self.stk_cd[pos] == stk_cd:
+            return pos
+        return None
+
+    def row(self, index: int) -> dict:
+        return {
+            "stk_cd": str(self.stk_cd[index]),
+            "stk_nm": self.stk_nm[index],
+            "action": _decode_action(int(self.action[index])),
+            "confidence": round(float(self.confidence[index]), 4),
+            "current_price": int(self.current_price[index]),
+            "volume": int(self.volume[index]),
+        }
+
+    @classmethod
+    def from_rows(cls, session_id: str, started_at: Optional[str], rows: List[tuple]) -> "ScanPartition":
+        """
+        Build a partition from (stk_cd, stk_nm, action, confidence, price, volume) rows.
+
+        Later rows win when a stock appears more than once (e.g. a resumed session).
+        """
+        latest: Dict[str, tuple] = {row[0]: row for row in rows}
+        ordered = [latest[code] for code in sorted(latest)]
+        columns = list(zip(*ordered)) if ordered else [[] for _ in range(6)]
+
+        return cls(
+            session_id=session_id,
+            started_at=started_at,
+            stk_cd=np.array(columns[0], dtype=str),
+            stk_nm=tuple(columns[1]),
+            action=_encode_actions(list(columns[2])),
+            confidence=np.array([c or 0.0 for c in columns[3]], dtype=np.float32),
+            current_price=np.array([p or 0 for p in columns[4]], dtype=np.int64),
+            volume=np.array([v or 0 for v in columns[5]], dtype=np.int64),
+        )
+
+    def to_blobs(self) -> tuple:
+        return (
+            _pack_text(self.stk_cd.tolist()),
+            _pack_text(self.stk_nm),
+            self.action.tobytes(),
+            self.confidence.tobytes(),
+            self.current_price.tobytes(),
+            self.volume.tobytes(),
+        )
+
+    @classmethod
+    def from_blobs(cls, row) -> "ScanPartition":
+        count = row["row_count"]
+        return cls(
+            session_id=row["session_id"],
+            started_at=row["started_at"],
+            stk_cd=np.array(_unpack_text(row["stk_cd"], count), dtype=str),
+            stk_nm=tuple(_unpack_text(row["stk_nm"], count)),
+            action=np.frombuffer(row["action"], dtype=np.int8),
+            confidence=np.frombuffer(row["confidence"], dtype=np.float32),
+            current_price=np.frombuffer(row["current_price"], dtype=np.int64),
+            volume=np.frombuffer(row["volume"], dtype=np.int64),
+        )
+
+
+class ScanArchive:
+    """
+    Columnar, session-partitioned archive of scan results.
+
+    Completed sessions are appended with append_session(). Sessions that
+    completed before the archive existed are backfilled on first query.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._partitions: Dict[str, ScanPartition] = {}
+        self._order: List[str] = []  # Session IDs, oldest first
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    async def create_table(db: aiosqlite.Connection):
+        """Create the archive table (called from the scanner schema setup)."""
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS scan_archive (
+                session_id TEXT PRIMARY KEY,
+                started_at TIMESTAMP,
+                archived_at TIMESTAMP,
+                row_count INTEGER,
+                stk_cd BLOB,
+                stk_nm BLOB,
+                action BLOB,
+                confidence BLOB,
+                current_price BLOB,
+                volume BLOB
+            )
+        """)
+
+    # -------------------------------------------
+    # Writing
+    # -------------------------------------------
+
+    async def append_session(self, session_id: str) -> Optional[ScanPartition]:
+        """
+        Archive one session from scan_results.
+
+        Existing partitions are never rewritten (append-only).
+        """
+        async with self._lock:
+            async with aiosqlite.connect(self.db_path) as db:
+                return await self._append(db, session_id)
+
+    async def _append(self, db: aiosqlite.Connection, session_id: str) -> Optional[ScanPartition]:
+        if session_id in self._partitions:
+            return self._partitions[session_id]
+
+        async with db.execute(
+            "SELECT started_at FROM scan_sessions WHERE id = ?", (session_id,)
+        ) as cursor:
+            session = await cursor.fetchone()
+        if session is None:
+            return None
+
+        async with db.execute("""
+            SELECT stk_cd, stk_nm, action, confidence, current_price, volume
+            FROM scan_results
+            WHERE scan_session_id = ?
+            ORDER BY id
+        """, (session_id,)) as cursor:
+            rows = await cursor.fetchall()
+
+        started_at = str(session[0]) if session[0] is not None else None
+        partition = ScanPartition.from_rows(session_id, started_at, rows)
+
+        await db.execute("""
+            INSERT OR IGNORE INTO scan_archive
+            (session_id, started_at, archived_at, row_count,
+             stk_cd, stk_nm, action, confidence, current_price, volume)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (session_id, started_at, datetime.now(), len(partition), *partition.to_blobs()))
+        await db.commit()
+
+        if self._loaded:
+            self._add(partition)
+
+        logger.info("scan_session_archived", session_id=session_id, rows=len(partition))
+        return partition
+
+    def _add(self, partition: ScanPartition):
+        self._partitions[partition.session_id] = partition
+        self._order.append(partition.session_id)
+        self._order.sort(key=lambda sid: (self._partitions[sid].started_at or "", sid))
+
+    async def _ensure_loaded(self):
+        """Load all partitions once and backfill completed sessions missing from the archive."""
+        if self._loaded:
+            return
+
+        async with self._lock:
+            if self._loaded:
+                return
+
+            async with aiosqlite.connect(self.db_path) as db:
+                db.row_factory = aiosqlite.Row
+                async with db.execute("SELECT * FROM scan_archive") as cursor:
+                    rows = await cursor.fetchall()
+                for row in rows:
+                    self._add(ScanPartition.from_blobs(row))
+
+                db.row_factory = None
+                async with db.execute("""
+                    SELECT s.id FROM scan_sessions s
+                    LEFT JOIN scan_archive a ON a.session_id = s.id
+                    WHERE s.status = 'completed' AND a.session_id IS NULL
+                    ORDER BY s.started_at
+                """) as cursor:
+                    missing = [row[0] for row in await cursor.fetchall()]
+
+                for session_id in missing:
+                    partition = await self._append(db, session_id)
+                    if partition is not None:
+                        self._add(partition)
+
+            self._loaded = True
+            if missing:
+                logger.info("scan_archive_backfilled", sessions=len(missing))
+
+    def _resolve(self, session_id: Optional[str]) -> Optional[ScanPartition]:
+        if session_id is None:
+            return self._partitions[self._order[-1]] if self._order else None
+        return self._partitions.get(session_id)
+
+    # -------------------------------------------
+    # Queries
+    # -------------------------------------------
+
+    async def get_sessions(self) -> List[dict]:
+        """Archived sessions, newest first."""
+        await self._ensure_loaded()
+        return [
+            {
+                "session_id": sid,
+                "started_at": self._partitions[sid].started_at,
+                "rows": len(self._partitions[sid]),
+            }
+            for sid in reversed(self._order)
+        ]
+
+    async def get_ticker_history(self, stk_cd: str, limit: int = 30) -> List[dict]:
+        """
+        Action/confidence history of one stock across sessions (newest first).
+
+        Args:
+            stk_cd: Stock code
+            limit: Maximum number of sessions to return
+        """
+        await self._ensure_loaded()
+
+        history = []
+        for sid in reversed(self._order):
+            partition = self._partitions[sid]
+            index = partition.find(stk_cd)
+            if index is None:
+                continue
+            entry = partition.row(index)
+            entry["session_id"] = sid
+            entry["started_at"] = partition.started_at
+            history.append(entry)
+            if len(history) >= limit:
+                break
+        return history
+
+    async def get_action_transitions(
+        self,
+        from_session: Optional[str] = None,
+        to_session: Optional[str] = None,
+        from_action: Optional[str] = None,
+        to_action: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Stocks whose action changed between two sessions.
+
+        Defaults to the two most recent archived sessions.
+
+        Args:
+            from_session: Earlier session (None = second most recent)
+            to_session: Later session (None = most recent)
+            from_action: Only transitions from this action
+            to_action: Only transitions to this action
+        """
+        await self._ensure_loaded()
+
+        after = self._resolve(to_session)
+        if from_session is None and after is not None:
+            position = self._order.index(after.session_id)
+            before = self._partitions[self._order[position - 1]] if position > 0 else None
+        else:
+            before = self._resolve(from_session)
+        if before is None or after is None:
+            return []
+
+        _, i, j = np.intersect1d(before.stk_cd, after.stk_cd, assume_unique=True, return_indices=True)
+        mask = before.action[i] != after.action[j]
+        if from_action:
+            mask &= before.action[i] == ACTION_CODES.get(from_action.upper(), UNKNOWN_ACTION)
+        if to_action:
+            mask &= after.action[j] == ACTION_CODES.get(to_action.upper(), UNKNOWN_ACTION)
+
+        transitions = []
+        for bi, ai in zip(i[mask], j[mask]):
+            old, new = before.row(int(bi)), after.row(int(ai))
+            transitions.append({
+                "stk_cd": new["stk_cd"],
+                "stk_nm": new["stk_nm"],
+                "from_action": old["action"],
+                "to_action": new["action"],
+                "from_confidence": old["confidence"],
+                "to_confidence": new["confidence"],
+                "from_price": old["current_price"],
+                "to_price": new["current_price"],
+            })
+        return transitions
+
+    async def get_action_streaks(self, action: str, sessions: int = 3) -> List[dict]:
+        """
+        Stocks that had the same action in each of the last N sessions.
+
+        Args:
+            action: BUY, SELL, HOLD, WATCH or AVOID
+            sessions: Number of consecutive most recent sessions
+        """
+        await self._ensure_loaded()
+
+        if sessions < 1 or len(self._order) < sessions:
+            return []
+
+        code = ACTION_CODES.get(action.upper(), UNKNOWN_ACTION)
+        recent = [self._partitions[sid] for sid in self._order[-sessions:]]
+
+        codes = recent[0].stk_cd[recent[0].action == code]
+        for partition in recent[1:]:
+            codes = np.intersect1d(codes, partition.stk_cd[partition.action == code], assume_unique=True)
+            if len(codes) == 0:
+                return []
+
+        latest = recent[-1]
+        streaks = []
+        for stk_cd in codes:
+            entry = latest.row(latest.find(stk_cd))
+            entry["confidence_trend"] = [
+                round(float(p.confidence[p.find(stk_cd)]), 4) for p in recent
+            ]
+            streaks.append(entry)
+        return streaks
+
+    async def get_top_by_confidence(
+        self,
+        n: int = 20,
+        session_id: Optional[str] = None,
+        action: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Highest-confidence results of a session.
+
+        Args:
+            n: Number of results
+            session_id: Session (None = most recent)
+            action: Only results with this action
+        """
+        await self._ensure_loaded()
+
+        partition = self._resolve(session_id)
+        if partition is None or n <= 0:
+            return []
+
+        candidates = np.arange(len(partition))
+        if action:
+            candidates = candidates[partition.action == ACTION_CODES.get(action.upper(), UNKNOWN_ACTION)]
+        if len(candidates) == 0:
+            return []
+
+        scores = partition.confidence[candidates]
+        if len(candidates) > n:
+            top = np.argpartition(-scores, n - 1)[:n]
+            candidates, scores = candidates[top], scores[top]
+        ranked = candidates[np.argsort(-scores, kind="stable")]
+        return [partition.row(int(index)) for index in ranked]
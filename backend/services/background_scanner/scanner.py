@@ -9,19 +9,32 @@ Features:
 - Result storage in SQLite
 - Telegram notifications for progress
 - Monthly reminder system
+- Checkpointed sessions that resume after a restart
+- Incremental (delta-aware) rescans that reuse unchanged results
+- Market data from the shared snapshot service (no duplicate fetches)
+- Columnar archive of completed sessions for cross-session queries
 """
 
 import asyncio
+import json
 import aiosqlite
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Callable, Awaitable
+from typing import Optional, List, Dict, Callable, Awaitable
 
 from pydantic import BaseModel, Field
 
 import structlog
 
+from services.background_scanner.archive import ScanArchive
+from services.market_snapshot import (
+    BARS,
+    QUOTE,
+    MarketSnapshot,
+    get_market_snapshot_service,
+)
+
 logger = structlog.get_logger()
 
 
@@ -56,6 +69,9 @@ class ScanProgress(BaseModel):
     watch_count: int = 0
     avoid_count: int = 0
 
+    # Incremental mode: stocks whose previous result was reused
+    reused_count: int = 0
+
     # Timing
     started_at: Optional[datetime] = None
     estimated_completion: Optional[datetime] = None
@@ -82,6 +98,7 @@ class ScanResult(BaseModel):
     summary: str
     key_factors: List[str] = Field(default_factory=list)
     current_price: int = 0
+    volume: int = 0  # Accumulated daily volume at analysis time
     market_type: str = ""  # KOSPI, KOSDAQ
     scanned_at: datetime = Field(default_factory=datetime.now)
 
@@ -98,12 +115,22 @@ class BackgroundScanner:
     - Stores results in SQLite database
     - Sends Telegram notifications
     - Supports pause/resume
+    - Checkpoints progress per batch so an interrupted session can resume
+    - Incremental mode that skips stocks which barely moved since their last result
     """
 
     MIN_CONCURRENT_SCANS = 1
     MAX_CONCURRENT_SCANS = 8  # Optimized for RTX 3090 24GB
     DEFAULT_CONCURRENT_SCANS = 3
 
+    # Incremental mode defaults: reuse the previous result when both the
+    # price and the accumulated volume moved less than these thresholds.
+    DEFAULT_PRICE_THRESHOLD_PCT = 1.0
+    DEFAULT_VOLUME_THRESHOLD_PCT = 20.0
+
+    # Session statuses that can be resumed (process died or user stopped)
+    RESUMABLE_STATUSES = ("running", "stopped")
+
     def __init__(self):
         self._progress = ScanProgress()
         self._current_concurrency = self.DEFAULT_CONCURRENT_SCANS
@@ -116,6 +143,16 @@ class BackgroundScanner:
         self._db_initialized = False
         self._use_llm = False  # Whether to use LLM for analysis
         self._gpu_monitor = None
+        self._session_id: Optional[str] = None
+
+        # Incremental mode state
+        self._incremental = False
+        self._price_threshold_pct = self.DEFAULT_PRICE_THRESHOLD_PCT
+        self._volume_threshold_pct = self.DEFAULT_VOLUME_THRESHOLD_PCT
+        self._previous_results: Dict[str, ScanResult] = {}
+
+        # Columnar archive of completed sessions (cross-session analytics)
+        self.archive = ScanArchive(DB_PATH)
 
     async def _init_db(self):
         """Initialize SQLite database for storing scan results."""
@@ -205,11 +242,35 @@ class BackgroundScanner:
                 ON scan_sessions(status)
             """)
 
+            # Columns added after the initial schema (checkpoint/resume, incremental)
+            await self._ensure_columns(db, "scan_results", {
+                "volume": "INTEGER DEFAULT 0",
+            })
+            await self._ensure_columns(db, "scan_sessions", {
+                "stock_list": "TEXT",
+                "checkpoint_index": "INTEGER DEFAULT 0",
+                "use_llm": "INTEGER DEFAULT 0",
+                "incremental": "INTEGER DEFAULT 0",
+                "reused_count": "INTEGER DEFAULT 0",
+            })
+
+            await ScanArchive.create_table(db)
+
             await db.commit()
 
         self._db_initialized = True
         logger.info("scanner_db_initialized", path=str(DB_PATH))
 
+    @staticmethod
+    async def _ensure_columns(db: aiosqlite.Connection, table: str, columns: Dict[str, str]):
+        """Add missing columns to an existing table (lightweight migration)."""
+        async with db.execute(f"PRAGMA table_info({table})") as cursor:
+            existing = {row[1] for row in await cursor.fetchall()}
+
+        for name, definition in columns.items():
+            if name not in existing:
+                await db.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
     async def _load_stock_list(self) -> List[tuple]:
         """
         Load full KOSPI/KOSDAQ stock list from Kiwoom API.
@@ -271,6 +332,9 @@ class BackgroundScanner:
         notify_progress: bool = True,
         use_llm: bool = False,
         auto_gpu_scaling: bool = True,
+        incremental: bool = False,
+        price_threshold_pct: Optional[float] = None,
+        volume_threshold_pct: Optional[float] = None,
     ):
         """
         Start background scanning of all stocks.
@@ -280,6 +344,10 @@ class BackgroundScanner:
             notify_progress: Whether to send Telegram notifications
             use_llm: Use LLM for analysis (slower but more accurate)
             auto_gpu_scaling: Automatically adjust concurrency based on GPU memory
+            incremental: Reuse the previous result for stocks whose price and
+                volume moved less than the thresholds since it was produced
+            price_threshold_pct: Incremental price threshold (%, default 1.0)
+            volume_threshold_pct: Incremental volume threshold (%, default 20.0)
         """
         if self._running:
             logger.warning("scanner_already_running")
@@ -288,30 +356,18 @@ class BackgroundScanner:
         # Initialize database
         await self._init_db()
 
-        # Store LLM preference
-        self._use_llm = use_llm
-
-        # Initialize GPU monitor if using LLM with auto scaling
-        if use_llm and auto_gpu_scaling:
-            from services.gpu_monitor import get_gpu_monitor
-            self._gpu_monitor = get_gpu_monitor()
-
-            # Get initial optimal concurrency
-            if await self._gpu_monitor.is_available():
-                self._current_concurrency = await self._gpu_monitor.get_optimal_concurrency()
-                self._semaphore = asyncio.Semaphore(self._current_concurrency)
-                logger.info(
-                    "gpu_based_concurrency",
-                    concurrency=self._current_concurrency,
-                )
-            else:
-                logger.info("gpu_not_available, using default concurrency")
-        else:
-            self._gpu_monitor = None
+        await self._configure_run(
+            use_llm=use_llm,
+            auto_gpu_scaling=auto_gpu_scaling,
+            incremental=incremental,
+            price_threshold_pct=price_threshold_pct,
+            volume_threshold_pct=volume_threshold_pct,
+        )
 
         # Load stock list if not provided
         if stock_list is None:
             stock_list = await self._load_stock_list()
+        stock_list = [tuple(stock) for stock in stock_list]
 
         # Generate session ID
         session_id = datetime.now().strftime("%Y%m%d%H%M%S")
@@ -325,20 +381,25 @@ class BackgroundScanner:
         self._running = True
         self._paused = False
         self._cancel_event.clear()
+        self._session_id = session_id
 
         logger.info(
             "background_scan_started",
             total_stocks=len(stock_list),
             session_id=session_id,
             use_llm=use_llm,
+            incremental=incremental,
+            reusable_results=len(self._previous_results),
             concurrency=self._current_concurrency,
         )
 
-        # Save session start
-        await self._save_session_start(session_id)
+        # Save session start (including the stock list for resume)
+        await self._save_session_start(session_id, stock_list)
 
         # Send Telegram notification
         analysis_mode = "LLM 기반 상세 분석" if use_llm else "기술적 지표 분석"
+        if incremental:
+            analysis_mode += " (증분)"
         estimated_time = len(stock_list) * (5 if use_llm else 2) // self._current_concurrency
         if notify_progress:
             await self._send_telegram_notification(
@@ -354,14 +415,155 @@ class BackgroundScanner:
             self._scan_all_stocks(stock_list, session_id, notify_progress)
         )
 
-    async def _save_session_start(self, session_id: str):
+    async def resume_interrupted_scan(
+        self,
+        session_id: Optional[str] = None,
+        notify_progress: bool = True,
+        auto_gpu_scaling: bool = True,
+    ) -> Optional[str]:
+        """
+        Resume a scan session that did not complete (process restart or stop).
+
+        Continues from the session's checkpoint, i.e. right after the last
+        batch whose results were committed, with the same session ID so the
+        results end up in one session.
+
+        Args:
+            session_id: Session to resume (None = latest resumable session)
+            notify_progress: Whether to send Telegram notifications
+            auto_gpu_scaling: Automatically adjust concurrency based on GPU memory
+
+        Returns:
+            Resumed session ID, or None if there was nothing to resume
+        """
+        if self._running:
+            logger.warning("scanner_already_running")
+            return None
+
+        await self._init_db()
+
+        session = await self._get_resumable_session(session_id)
+        if not session:
+            logger.info("no_resumable_scan_session", session_id=session_id)
+            return None
+
+        session_id = session["id"]
+        stock_list = [tuple(stock) for stock in json.loads(session["stock_list"] or "[]")]
+        checkpoint = session["checkpoint_index"] or 0
+
+        if not stock_list or checkpoint >= len(stock_list):
+            # Nothing left to scan - just close the session
+            await self._mark_session_status(session_id, "completed")
+            return None
+
+        await self._configure_run(
+            use_llm=bool(session["use_llm"]),
+            auto_gpu_scaling=auto_gpu_scaling,
+            incremental=bool(session["incremental"]),
+        )
+
+        self._progress = ScanProgress(
+            status=ScanStatus.RUNNING,
+            total_stocks=len(stock_list),
+            completed=session["completed"] or 0,
+            failed=session["failed"] or 0,
+            buy_count=session["buy_count"] or 0,
+            sell_count=session["sell_count"] or 0,
+            hold_count=session["hold_count"] or 0,
+            watch_count=session["watch_count"] or 0,
+            avoid_count=session["avoid_count"] or 0,
+            reused_count=session["reused_count"] or 0,
+            started_at=datetime.now(),
+        )
+        self._results = await self.get_results_from_db(session_id=session_id, limit=len(stock_list))
+        self._running = True
+        self._paused = False
+        self._cancel_event.clear()
+        self._session_id = session_id
+
+        await self._mark_session_status(session_id, "running")
+
+        logger.info(
+            "background_scan_resumed_from_checkpoint",
+            session_id=session_id,
+            checkpoint_index=checkpoint,
+            remaining=len(stock_list) - checkpoint,
+        )
+
+        if notify_progress:
+            await self._send_telegram_notification(
+                f"🔁 *백그라운드 분석 이어하기*\n\n"
+                f"세션: {session_id}\n"
+                f"남은 종목: {len(stock_list) - checkpoint}/{len(stock_list)}개"
+            )
+
+        self._task = asyncio.create_task(
+            self._scan_all_stocks(stock_list, session_id, notify_progress, start_index=checkpoint)
+        )
+        return session_id
+
+    async def _configure_run(
+        self,
+        use_llm: bool,
+        auto_gpu_scaling: bool,
+        incremental: bool = False,
+        price_threshold_pct: Optional[float] = None,
+        volume_threshold_pct: Optional[float] = None,
+    ):
+        """Apply per-run settings (LLM mode, GPU scaling, incremental thresholds)."""
+        # Store LLM preference
+        self._use_llm = use_llm
+
+        # Initialize GPU monitor if using LLM with auto scaling
+        if use_llm and auto_gpu_scaling:
+            from services.gpu_monitor import get_gpu_monitor
+            self._gpu_monitor = get_gpu_monitor()
+
+            # Get initial optimal concurrency
+            if await self._gpu_monitor.is_available():
+                self._current_concurrency = await self._gpu_monitor.get_optimal_concurrency()
+                self._semaphore = asyncio.Semaphore(self._current_concurrency)
+                logger.info(
+                    "gpu_based_concurrency",
+                    concurrency=self._current_concurrency,
+                )
+            else:
+                logger.info("gpu_not_available, using default concurrency")
+        else:
+            self._gpu_monitor = None
+
+        # Incremental mode: load the latest result per stock as reuse baseline
+        self._incremental = incremental
+        self._price_threshold_pct = (
+            price_threshold_pct if price_threshold_pct is not None
+            else self.DEFAULT_PRICE_THRESHOLD_PCT
+        )
+        self._volume_threshold_pct = (
+            volume_threshold_pct if volume_threshold_pct is not None
+            else self.DEFAULT_VOLUME_THRESHOLD_PCT
+        )
+        self._previous_results = (
+            await self._load_latest_results_by_stock() if incremental else {}
+        )
+
+    async def _save_session_start(self, session_id: str, stock_list: List[tuple]):
         """Save scan session start to database."""
         async with aiosqlite.connect(DB_PATH) as db:
             await db.execute("""
                 INSERT INTO scan_sessions
-                (id, started_at, total_stocks, status)
-                VALUES (?, ?, ?, ?)
-            """, (session_id, datetime.now(), self._progress.total_stocks, "running"))
+                (id, started_at, total_stocks, status, stock_list,
+                 checkpoint_index, use_llm, incremental)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                session_id,
+                datetime.now(),
+                self._progress.total_stocks,
+                "running",
+                json.dumps([list(stock) for stock in stock_list], ensure_ascii=False),
+                0,
+                int(self._use_llm),
+                int(self._incremental),
+            ))
             await db.commit()
 
     async def _save_session_complete(self, session_id: str):
@@ -377,6 +579,7 @@ class BackgroundScanner:
                     hold_count = ?,
                     watch_count = ?,
                     avoid_count = ?,
+                    reused_count = ?,
                     status = ?
                 WHERE id = ?
             """, (
@@ -388,19 +591,55 @@ class BackgroundScanner:
                 self._progress.hold_count,
                 self._progress.watch_count,
                 self._progress.avoid_count,
+                self._progress.reused_count,
                 "completed",
                 session_id,
             ))
             await db.commit()
 
+    async def _mark_session_status(self, session_id: str, status: str):
+        """Update only the status of a scan session."""
+        async with aiosqlite.connect(DB_PATH) as db:
+            await db.execute(
+                "UPDATE scan_sessions SET status = ? WHERE id = ?",
+                (status, session_id),
+            )
+            await db.commit()
+
+    async def _get_resumable_session(self, session_id: Optional[str] = None) -> Optional[dict]:
+        """Find a session that was interrupted before completion."""
+        placeholders = ",".join("?" for _ in self.RESUMABLE_STATUSES)
+
+        async with aiosqlite.connect(DB_PATH) as db:
+            db.row_factory = aiosqlite.Row
+
+            if session_id:
+                query = f"""
+                    SELECT * FROM scan_sessions
+                    WHERE id = ? AND status IN ({placeholders})
+                """
+                params = [session_id, *self.RESUMABLE_STATUSES]
+            else:
+                query = f"""
+                    SELECT * FROM scan_sessions
+                    WHERE status IN ({placeholders}) AND stock_list IS NOT NULL
+                    ORDER BY started_at DESC
+                    LIMIT 1
+                """
+                params = list(self.RESUMABLE_STATUSES)
+
+            async with db.execute(query, params) as cursor:
+                row = await cursor.fetchone()
+                return dict(row) if row else None
+
     async def _save_result_to_db(self, result: ScanResult, session_id: str):
         """Save individual scan result to database."""
         async with aiosqlite.connect(DB_PATH) as db:
             await db.execute("""
                 INSERT INTO scan_results
                 (stk_cd, stk_nm, action, signal, confidence, summary,
-                 key_factors, current_price, market_type, scanned_at, scan_session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 key_factors, current_price, volume, market_type, scanned_at, scan_session_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 result.stk_cd,
                 result.stk_nm,
@@ -410,13 +649,19 @@ class BackgroundScanner:
                 result.summary,
                 ",".join(result.key_factors),
                 result.current_price,
+                result.volume,
                 result.market_type,
                 result.scanned_at,
                 session_id,
             ))
             await db.commit()
 
-    async def _save_results_batch(self, results: List[ScanResult], session_id: str):
+    async def _save_results_batch(
+        self,
+        results: List[ScanResult],
+        session_id: str,
+        checkpoint_index: Optional[int] = None,
+    ):
         """
         Save multiple scan results in a single transaction.
 
@@ -427,11 +672,16 @@ class BackgroundScanner:
 
         Performance: ~100x faster for large batches
 
+        When checkpoint_index is given, the session checkpoint and running
+        counters are updated in the same transaction, so a resumed scan never
+        re-inserts or loses results of an already committed batch.
+
         Args:
             results: List of scan results to save
             session_id: Session ID to associate with results
+            checkpoint_index: Index of the next stock to scan in the session's stock list
         """
-        if not results:
+        if not results and checkpoint_index is None:
             return
 
         async with aiosqlite.connect(DB_PATH) as db:
@@ -446,6 +696,7 @@ class BackgroundScanner:
                     result.summary,
                     ",".join(result.key_factors),
                     result.current_price,
+                    result.volume,
                     result.market_type,
                     result.scanned_at,
                     session_id,
@@ -453,12 +704,40 @@ class BackgroundScanner:
                 for result in results
             ]
 
-            await db.executemany("""
-                INSERT INTO scan_results
-                (stk_cd, stk_nm, action, signal, confidence, summary,
-                 key_factors, current_price, market_type, scanned_at, scan_session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, data)
+            if data:
+                await db.executemany("""
+                    INSERT INTO scan_results
+                    (stk_cd, stk_nm, action, signal, confidence, summary,
+                     key_factors, current_price, volume, market_type, scanned_at, scan_session_id)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, data)
+
+            if checkpoint_index is not None:
+                await db.execute("""
+                    UPDATE scan_sessions SET
+                        checkpoint_index = ?,
+                        completed = ?,
+                        failed = ?,
+                        buy_count = ?,
+                        sell_count = ?,
+                        hold_count = ?,
+                        watch_count = ?,
+                        avoid_count = ?,
+                        reused_count = ?
+                    WHERE id = ?
+                """, (
+                    checkpoint_index,
+                    self._progress.completed,
+                    self._progress.failed,
+                    self._progress.buy_count,
+                    self._progress.sell_count,
+                    self._progress.hold_count,
+                    self._progress.watch_count,
+                    self._progress.avoid_count,
+                    self._progress.reused_count,
+                    session_id,
+                ))
+
             await db.commit()
 
             logger.debug(
@@ -472,17 +751,30 @@ class BackgroundScanner:
         stocks: List[tuple],
         session_id: str,
         notify_progress: bool,
+        start_index: int = 0,
     ):
-        """Scan all stocks with controlled concurrency using batched processing."""
+        """
+        Scan all stocks with controlled concurrency using batched processing.
+
+        Args:
+            stocks: Full, ordered stock list of the session
+            session_id: Scan session ID
+            notify_progress: Whether to send Telegram notifications
+            start_index: Checkpoint to start from (> 0 when resuming)
+        """
         # Use larger batch size for LLM batch mode (combines requests into single LLM call)
         # For quick analysis, use smaller batches with concurrent individual analysis
         LLM_BATCH_SIZE = 10  # Number of stocks per LLM batch request
         QUICK_BATCH_SIZE = 50  # Process in smaller batches for memory management
 
         if self._use_llm:
-            await self._scan_all_stocks_llm_batch(stocks, session_id, notify_progress, LLM_BATCH_SIZE)
+            await self._scan_all_stocks_llm_batch(
+                stocks, session_id, notify_progress, LLM_BATCH_SIZE, start_index
+            )
         else:
-            await self._scan_all_stocks_quick(stocks, session_id, notify_progress, QUICK_BATCH_SIZE)
+            await self._scan_all_stocks_quick(
+                stocks, session_id, notify_progress, QUICK_BATCH_SIZE, start_index
+            )
 
         # Mark complete
         self._progress.status = ScanStatus.COMPLETED
@@ -493,11 +785,18 @@ class BackgroundScanner:
         # Save session completion
         await self._save_session_complete(session_id)
 
+        try:
+            await self.archive.append_session(session_id)
+        except Exception as e:
+            # The row store stays authoritative; the session is backfilled later
+            logger.warning("scan_archive_append_failed", session_id=session_id, error=str(e))
+
         logger.info(
             "background_scan_completed",
             total=self._progress.total_stocks,
             completed=self._progress.completed,
             failed=self._progress.failed,
+            reused=self._progress.reused_count,
             session_id=session_id,
         )
 
@@ -511,9 +810,10 @@ class BackgroundScanner:
         session_id: str,
         notify_progress: bool,
         batch_size: int,
+        start_index: int = 0,
     ):
         """Quick analysis mode - concurrent individual stock analysis."""
-        for batch_start in range(0, len(stocks), batch_size):
+        for batch_start in range(start_index, len(stocks), batch_size):
             # Check for cancellation at batch level
             if self._cancel_event.is_set():
                 logger.info("scan_cancelled_at_batch", batch_start=batch_start)
@@ -558,9 +858,10 @@ class BackgroundScanner:
                     self._results.append(result)
                     self._update_action_count(result.action)
 
-            # Batch save all valid results (N+1 optimization)
-            if valid_results:
-                await self._save_results_batch(valid_results, session_id)
+            # Batch save all valid results (N+1 optimization) and checkpoint
+            await self._save_results_batch(
+                valid_results, session_id, checkpoint_index=batch_start + len(batch)
+            )
 
             logger.debug(
                 "batch_completed",
@@ -575,6 +876,7 @@ class BackgroundScanner:
         session_id: str,
         notify_progress: bool,
         batch_size: int,
+        start_index: int = 0,
     ):
         """
         LLM batch analysis mode - combines multiple stocks into single LLM requests.
@@ -582,10 +884,8 @@ class BackgroundScanner:
         This is more efficient for GPU utilization as it reduces LLM call overhead
         and allows the model to process multiple analyses in one inference pass.
         """
-        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-        from services.technical_indicators import TechnicalIndicators
-
-        for batch_start in range(0, len(stocks), batch_size):
+        batch_start = start_index
+        while batch_start < len(stocks):
             # Check for cancellation at batch level
             if self._cancel_event.is_set():
                 logger.info("scan_cancelled_at_batch", batch_start=batch_start)
@@ -625,34 +925,44 @@ class BackgroundScanner:
             batch = stocks[batch_start:batch_start + batch_size]
 
             # Collect data for all stocks in batch IN PARALLEL
-            stocks_data = await self._collect_batch_data_parallel(batch)
+            # (incremental mode returns reused results for unchanged stocks)
+            reused_results: List[ScanResult] = []
+            stocks_data = await self._collect_batch_data_parallel(
+                batch, reused_results=reused_results
+            )
 
             # Run batch LLM analysis if we have data
-            if stocks_data:
-                results = await self._run_batch_llm_analysis(stocks_data)
+            results = await self._run_batch_llm_analysis(stocks_data) if stocks_data else []
+            results.extend(reused_results)
 
-                # Save results in batch (optimized - single DB transaction)
-                await self._save_results_batch(results, session_id)
+            # Update in-memory tracking
+            for result in results:
+                self._results.append(result)
+                self._update_action_count(result.action)
+                self._progress.completed += 1
+                self._update_eta()
 
-                # Update in-memory tracking
-                for result in results:
-                    self._results.append(result)
-                    self._update_action_count(result.action)
-                    self._progress.completed += 1
-                    self._update_eta()
+            # Save results and checkpoint in batch (single DB transaction)
+            await self._save_results_batch(
+                results, session_id, checkpoint_index=batch_start + len(batch)
+            )
 
             logger.debug(
                 "llm_batch_completed",
                 batch_start=batch_start,
                 batch_size=len(batch),
                 processed=len(stocks_data),
+                reused=len(reused_results),
                 total_completed=self._progress.completed,
             )
 
+            batch_start += len(batch)
+
     async def _collect_batch_data_parallel(
         self,
         batch: List[tuple],
         max_concurrent_fetch: int = 10,
+        reused_results: Optional[List[ScanResult]] = None,
     ) -> List[tuple]:
         """
         Collect stock data for a batch in parallel.
@@ -667,14 +977,13 @@ class BackgroundScanner:
         Args:
             batch: List of (stk_cd, stk_nm, market_type) tuples
             max_concurrent_fetch: Maximum concurrent API calls (default: 10)
+            reused_results: In incremental mode, receives reused results for
+                stocks that did not move enough to be re-analyzed
 
         Returns:
             List of (stk_cd, stk_nm, market_type, price, change, volume, tech_summary) tuples
         """
-        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-        from services.technical_indicators import TechnicalIndicators
-
-        client = await get_shared_kiwoom_client_async()
+        snapshots = get_market_snapshot_service()
         stocks_data = []
         fetch_semaphore = asyncio.Semaphore(max_concurrent_fetch)
 
@@ -692,36 +1001,28 @@ class BackgroundScanner:
                     self._progress.current_stocks.append(stk_cd)
                     self._progress.in_progress += 1
 
-                    # Fetch stock info and chart data in parallel
-                    stock_info_task = client.get_stock_info(stk_cd)
-                    chart_df_task = client.get_daily_chart_df(stk_cd)
-
-                    stock_info, chart_df = await asyncio.gather(
-                        stock_info_task,
-                        chart_df_task,
-                        return_exceptions=True,
-                    )
+                    if self._incremental and stk_cd in self._previous_results:
+                        # Quote first: the chart is only needed if the stock moved
+                        snapshot = await snapshots.get_snapshot(stk_cd, parts=(QUOTE,))
+                        reused = self._reuse_if_unchanged(stk_cd, self._snapshot_stock_info(snapshot))
+                        if reused is not None:
+                            if reused_results is not None:
+                                reused_results.append(reused)
+                            return None
 
-                    # Handle exceptions
-                    if isinstance(stock_info, Exception):
-                        raise stock_info
-                    if isinstance(chart_df, Exception):
-                        chart_df = None
+                    # Quote and chart (with indicators) from the shared snapshot
+                    snapshot = await snapshots.get_snapshot(stk_cd, parts=(QUOTE, BARS))
+                    stock_info = self._snapshot_stock_info(snapshot)
 
                     current_price = stock_info.cur_prc
                     prdy_ctrt = stock_info.prdy_ctrt if hasattr(stock_info, "prdy_ctrt") else 0
-                    trd_qty = stock_info.trd_qty if hasattr(stock_info, "trd_qty") else 0
+                    trd_qty = getattr(stock_info, "trd_qty", 0) or getattr(stock_info, "acml_vol", 0)
 
-                    # Calculate technical indicators
+                    # Technical indicators (computed once per snapshot)
                     tech_summary = "데이터 부족"
-                    if chart_df is not None and len(chart_df) >= 20:
-                        try:
-                            tech = TechnicalIndicators(chart_df)
-                            indicators = tech.calculate_all()
-                            signals = indicators.get("signals", [])
-                            tech_summary = self._build_tech_summary(indicators, signals)
-                        except Exception as e:
-                            logger.warning("tech_indicators_failed", stk_cd=stk_cd, error=str(e))
+                    if snapshot.indicators is not None:
+                        signals = snapshot.indicators.get("signals", [])
+                        tech_summary = self._build_tech_summary(snapshot.indicators, signals)
 
                     return (stk_cd, stk_nm, market_type, current_price, prdy_ctrt, trd_qty, tech_summary)
 
@@ -805,24 +1106,25 @@ class BackgroundScanner:
 
         This is a lightweight version that focuses on key indicators.
         """
-        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-        from services.technical_indicators import TechnicalIndicators
-
         try:
-            # Get Kiwoom client
-            client = await get_shared_kiwoom_client_async()
+            snapshots = get_market_snapshot_service()
 
-            # Get stock info and chart data
-            stock_info = await client.get_stock_info(stk_cd)
-            chart_df = await client.get_daily_chart_df(stk_cd)
+            # Get stock info first; in incremental mode an unchanged stock
+            # reuses its previous result and skips the chart fetch entirely
+            snapshot = await snapshots.get_snapshot(stk_cd, parts=(QUOTE,))
+            stock_info = self._snapshot_stock_info(snapshot)
+            if self._incremental:
+                reused = self._reuse_if_unchanged(stk_cd, stock_info)
+                if reused is not None:
+                    return reused
+
+            snapshot = await snapshots.get_snapshot(stk_cd, parts=(QUOTE, BARS))
 
             current_price = stock_info.cur_prc
 
-            # Calculate technical indicators
-            if len(chart_df) >= 20:
-                tech = TechnicalIndicators(chart_df)
-                indicators = tech.calculate_all()
-                signals = indicators.get("signals", [])
+            # Technical indicators (computed once per snapshot)
+            if snapshot.indicators is not None:
+                signals = snapshot.indicators.get("signals", [])
             else:
                 signals = []
 
@@ -845,6 +1147,7 @@ class BackgroundScanner:
                 summary=f"{stk_nm}: {summary}",
                 key_factors=signal_descriptions,
                 current_price=current_price,
+                volume=getattr(stock_info, "acml_vol", 0),
                 market_type=market_type,
             )
 
@@ -875,29 +1178,22 @@ class BackgroundScanner:
         This is a more comprehensive analysis using LLM for deeper insights.
         Requires GPU and takes longer but provides more accurate recommendations.
         """
-        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
-        from services.technical_indicators import TechnicalIndicators
         from agents.llm_provider import get_llm_provider
         from langchain_core.messages import HumanMessage, SystemMessage
 
         try:
-            # Get Kiwoom client
-            client = await get_shared_kiwoom_client_async()
-
-            # Get stock info and chart data
-            stock_info = await client.get_stock_info(stk_cd)
-            chart_df = await client.get_daily_chart_df(stk_cd)
+            # Get stock info and chart data from the shared snapshot
+            snapshot = await get_market_snapshot_service().get_snapshot(stk_cd, parts=(QUOTE, BARS))
+            stock_info = self._snapshot_stock_info(snapshot)
 
             current_price = stock_info.cur_prc
 
-            # Calculate technical indicators
+            # Technical indicators (computed once per snapshot)
             tech_summary = ""
             signals = []
-            if len(chart_df) >= 20:
-                tech = TechnicalIndicators(chart_df)
-                indicators = tech.calculate_all()
-                signals = indicators.get("signals", [])
-                tech_summary = self._build_tech_summary(indicators, signals)
+            if snapshot.indicators is not None:
+                signals = snapshot.indicators.get("signals", [])
+                tech_summary = self._build_tech_summary(snapshot.indicators, signals)
 
             # Build LLM prompt for analysis
             prompt = f"""한국 주식 종목 분석을 요청합니다.
@@ -1025,9 +1321,10 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
                     summary=f"배치 분석 실패: {str(e)}",
                     key_factors=[],
                     current_price=current_price,
+                    volume=trd_qty,
                     market_type=market_type,
                 )
-                for stk_cd, stk_nm, market_type, current_price, _, _, _ in stocks_data
+                for stk_cd, stk_nm, market_type, current_price, _, trd_qty, _ in stocks_data
             ]
 
     def _parse_batch_llm_response(
@@ -1043,7 +1340,7 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
         stock_sections = re.split(r'\[종목\s*\d+\]', response)
         stock_sections = [s.strip() for s in stock_sections if s.strip()]
 
-        for i, (stk_cd, stk_nm, market_type, current_price, _, _, _) in enumerate(stocks_data):
+        for i, (stk_cd, stk_nm, market_type, current_price, _, trd_qty, _) in enumerate(stocks_data):
             if i < len(stock_sections):
                 action, confidence, summary, key_factors = self._parse_llm_response(
                     stock_sections[i], stk_nm
@@ -1061,11 +1358,72 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
                 summary=summary,
                 key_factors=key_factors,
                 current_price=current_price,
+                volume=trd_qty,
                 market_type=market_type,
             ))
 
         return results
 
+    async def _load_latest_results_by_stock(self) -> Dict[str, ScanResult]:
+        """
+        Load the most recent stored result for every stock.
+
+        Used as the baseline for incremental scans. Reused results keep their
+        original price/volume, so small moves cannot accumulate unnoticed
+        across several incremental scans.
+        """
+        async with aiosqlite.connect(DB_PATH) as db:
+            db.row_factory = aiosqlite.Row
+
+            async with db.execute("""
+                SELECT r.* FROM scan_results r
+                JOIN (
+                    SELECT stk_cd, MAX(id) AS max_id
+                    FROM scan_results
+                    GROUP BY stk_cd
+                ) latest ON r.id = latest.max_id
+            """) as cursor:
+                rows = await cursor.fetchall()
+
+        return {row["stk_cd"]: self._row_to_result(row) for row in rows}
+
+    def _reuse_if_unchanged(self, stk_cd: str, stock_info) -> Optional[ScanResult]:
+        """
+        Return a copy of the previous result if the stock barely moved.
+
+        A stock is considered unchanged when both the price change and the
+        accumulated volume change since the previous result are below the
+        incremental thresholds. Previous results without price data are
+        never reused.
+        """
+        previous = self._previous_results.get(stk_cd)
+        if previous is None or previous.current_price <= 0:
+            return None
+
+        current_price = getattr(stock_info, "cur_prc", 0) or 0
+        current_volume = getattr(stock_info, "acml_vol", 0) or 0
+
+        price_change_pct = abs(current_price - previous.current_price) / previous.current_price * 100
+        if price_change_pct >= self._price_threshold_pct:
+            return None
+
+        if previous.volume > 0:
+            volume_change_pct = abs(current_volume - previous.volume) / previous.volume * 100
+            if volume_change_pct >= self._volume_threshold_pct:
+                return None
+        elif current_volume > 0:
+            return None
+
+        self._progress.reused_count += 1
+        return previous.model_copy(update={"scanned_at": datetime.now()})
+
+    @staticmethod
+    def _snapshot_stock_info(snapshot: MarketSnapshot):
+        """Quote of a snapshot; raises if it could not be fetched."""
+        if snapshot.stock_info is None:
+            raise RuntimeError(snapshot.errors.get(QUOTE, "quote unavailable"))
+        return snapshot.stock_info
+
     def _build_tech_summary(self, indicators: dict, signals: List[dict]) -> str:
         """Build technical indicators summary for LLM prompt."""
         lines = []
@@ -1225,6 +1583,10 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
             if self._task:
                 self._task.cancel()
 
+            # Keep the checkpoint so the session can be resumed later
+            if self._session_id:
+                await self._mark_session_status(self._session_id, "stopped")
+
             logger.info("background_scan_stopped")
 
             await self._send_telegram_notification(
@@ -1316,22 +1678,24 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
             async with db.execute(query, params) as cursor:
                 rows = await cursor.fetchall()
 
-            results = []
-            for row in rows:
-                results.append(ScanResult(
-                    stk_cd=row["stk_cd"],
-                    stk_nm=row["stk_nm"],
-                    action=row["action"],
-                    signal=row["signal"] or "",
-                    confidence=row["confidence"] or 0.5,
-                    summary=row["summary"] or "",
-                    key_factors=row["key_factors"].split(",") if row["key_factors"] else [],
-                    current_price=row["current_price"] or 0,
-                    market_type=row["market_type"] or "",
-                    scanned_at=datetime.fromisoformat(row["scanned_at"]) if row["scanned_at"] else datetime.now(),
-                ))
-
-            return results
+            return [self._row_to_result(row) for row in rows]
+
+    @staticmethod
+    def _row_to_result(row: aiosqlite.Row) -> ScanResult:
+        """Convert a scan_results row to a ScanResult."""
+        return ScanResult(
+            stk_cd=row["stk_cd"],
+            stk_nm=row["stk_nm"],
+            action=row["action"],
+            signal=row["signal"] or "",
+            confidence=row["confidence"] or 0.5,
+            summary=row["summary"] or "",
+            key_factors=row["key_factors"].split(",") if row["key_factors"] else [],
+            current_price=row["current_price"] or 0,
+            volume=row["volume"] or 0,
+            market_type=row["market_type"] or "",
+            scanned_at=datetime.fromisoformat(row["scanned_at"]) if row["scanned_at"] else datetime.now(),
+        )
 
     async def get_result_counts_from_db(
         self,
@@ -1393,6 +1757,11 @@ KEY_FACTORS: [주요 판단 근거, 쉼표 구분]
 
             return counts
 
+    async def get_archive(self) -> ScanArchive:
+        """Get the columnar session archive (ensures the schema exists)."""
+        await self._init_db()
+        return self.archive
+
     async def get_scan_sessions(self, limit: int = 10) -> List[dict]:
         """Get recent scan sessions."""
         await self._init_db()
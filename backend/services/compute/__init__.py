@@ -0,0 +1,33 @@
+"""
+Compute Offloading Services
+
+Keeps CPU-bound pandas/indicator work off the asyncio event loop.
+- Shared process pool with shared-memory transport for large frames
+- Event loop lag monitoring
+"""
+
+from services.compute.executor import (
+    ComputeExecutor,
+    get_compute_executor,
+    shutdown_compute_executor,
+    calculate_indicators_async,
+    frame_to_shared,
+    frame_from_shared,
+)
+from services.compute.loop_monitor import (
+    LoopLagMonitor,
+    get_loop_lag_monitor,
+)
+
+__all__ = [
+    # Executor
+    "ComputeExecutor",
+    "get_compute_executor",
+    "shutdown_compute_executor",
+    "calculate_indicators_async",
+    "frame_to_shared",
+    "frame_from_shared",
+    # Loop monitoring
+    "LoopLagMonitor",
+    "get_loop_lag_monitor",
+]
@@ -0,0 +1,325 @@
+"""
+Compute Executor
+
+Shared process pool for CPU-bound work (indicator math, DataFrame building)
+so it does not run on the asyncio event loop.
+
+Features:
+- Lazily started process pool shared by the whole application
+- Large DataFrames are shipped through shared memory instead of pickling
+- Small inputs skip IPC and run in a worker thread
+- Automatic fallback to threads if the pool breaks
+
+Usage:
+    from services.compute import get_compute_executor, calculate_indicators_async
+
+    indicators = await calculate_indicators_async(chart_df)
+    result = await get_compute_executor().run_frame(some_module_function, df)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Frames smaller than this are pickled; larger ones go through shared memory.
+SHARED_MEMORY_MIN_BYTES = 256 * 1024
+
+# Frames with fewer rows run in a thread: IPC would cost more than the math.
+INLINE_MAX_ROWS = 30
+
+
+# =========================================
+# Shared-memory DataFrame transport
+# =========================================
+
+@dataclass(frozen=True)
+class SharedFrameRef:
+    """Picklable handle to a DataFrame stored in a shared memory block."""
+    shm_name: str
+    shape: tuple
+    columns: tuple
+    dtypes: tuple
+    index_name: Optional[str] = None
+
+
+def frame_to_shared(df: pd.DataFrame) -> tuple[shared_memory.SharedMemory, SharedFrameRef]:
+    """
+    Copy a numeric/datetime DataFrame into a new shared memory block.
+
+    All columns are stored in one float64 matrix. Naive datetime columns
+    keep their int64 bits (reinterpreted, not converted), so the round
+    trip is lossless. A non-range index is stored as a column.
+
+    The caller owns the returned block and must close() and unlink() it.
+
+    Raises:
+        TypeError: If a column is neither numeric nor naive datetime
+    """
+    index_name = None
+    if not isinstance(df.index, pd.RangeIndex):
+        index_name = df.index.name or "__index__"
+        df = df.reset_index(names=index_name)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(df.shape[0] * df.shape[1] * 8, 1))
+    try:
+        matrix = np.ndarray(df.shape, dtype=np.float64, buffer=shm.buf)
+        dtypes = []
+        for i, column in enumerate(df.columns):
+            series = df[column]
+            if pd.api.types.is_datetime64_dtype(series):
+                values = series.to_numpy()
+                matrix[:, i] = values.view(np.int64).view(np.float64)
+                dtypes.append(str(values.dtype))
+            elif pd.api.types.is_numeric_dtype(series):
+                matrix[:, i] = series.to_numpy(dtype=np.float64)
+                dtypes.append(str(series.dtype))
+            else:
+                raise TypeError(f"Column {column!r} ({series.dtype}) cannot be shared")
+    except Exception:
+        shm.close()
+        shm.unlink()
+        raise
+
+    ref = SharedFrameRef(
+        shm_name=shm.name,
+        shape=df.shape,
+        columns=tuple(df.columns),
+        dtypes=tuple(dtypes),
+        index_name=index_name,
+    )
+    return shm, ref
+
+
+def frame_from_shared(ref: SharedFrameRef) -> pd.DataFrame:
+    """Rebuild a DataFrame (as a private copy) from a SharedFrameRef."""
+    # Workers are spawned children and share the creator's resource tracker,
+    # so attaching here must not unregister the block; the creator unlinks it.
+    shm = shared_memory.SharedMemory(name=ref.shm_name)
+    try:
+        matrix = np.ndarray(ref.shape, dtype=np.float64, buffer=shm.buf)
+        data = {}
+        for i, (column, dtype) in enumerate(zip(ref.columns, ref.dtypes)):
+            values = matrix[:, i].copy()
+            if dtype.startswith("datetime64"):
+                data[column] = values.view(np.int64).view(dtype)
+            else:
+                data[column] = values.astype(dtype, copy=False)
+        df = pd.DataFrame(data, columns=list(ref.columns))
+    finally:
+        shm.close()
+
+    if ref.index_name is not None:
+        df = df.set_index(ref.index_name)
+        if ref.index_name == "__index__":
+            df.index.name = None
+    return df
+
+
+# =========================================
+# Worker-side entry points (must be module level to be picklable)
+# =========================================
+
+def _call_with_frame(func: Callable, frame: Any, args: tuple, kwargs: dict) -> Any:
+    """Resolve a pickled or shared-memory frame and call func(df, *args, **kwargs)."""
+    df = frame_from_shared(frame) if isinstance(frame, SharedFrameRef) else frame
+    return func(df, *args, **kwargs)
+
+
+def _calculate_all_indicators(df: pd.DataFrame) -> dict:
+    """TechnicalIndicators.calculate_all() as a picklable function."""
+    from services.technical_indicators import TechnicalIndicators
+
+    return TechnicalIndicators(df).calculate_all()
+
+
+def _warm_up() -> int:
+    """Import heavy modules once per worker so the first real task is fast."""
+    import services.technical_indicators  # noqa: F401
+
+    return os.getpid()
+
+
+# =========================================
+# Executor
+# =========================================
+
+class ComputeExecutor:
+    """
+    Process pool shared by all CPU-bound hot paths.
+
+    Functions submitted with run()/run_frame() must be defined at module
+    level (picklable). With max_workers=0 everything runs in threads,
+    which keeps the loop responsive for I/O but not for pure-Python math.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._submitted = 0
+        self._inline = 0
+        self._shared_memory = 0
+        self._fallbacks = 0
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get or lazily create the process pool."""
+        if self._max_workers <= 0:
+            return None
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn: never fork a process that has a running event loop
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self._max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                    logger.info("compute_pool_started", workers=self._max_workers)
+        return self._pool
+
+    async def start(self) -> None:
+        """Start the pool and warm up every worker (optional, avoids first-call latency)."""
+        pool = self._get_pool()
+        if pool is None:
+            return
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(pool, _warm_up) for _ in range(self._max_workers)),
+            return_exceptions=True,
+        )
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Run func(*args) in the process pool.
+
+        Falls back to a worker thread if the pool is disabled or broken.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        self._submitted += 1
+
+        if pool is None:
+            self._inline += 1
+            return await asyncio.to_thread(func, *args)
+
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            logger.warning("compute_pool_broken", func=getattr(func, "__name__", str(func)))
+            self._reset_pool()
+            self._fallbacks += 1
+            return await asyncio.to_thread(func, *args)
+
+    async def run_frame(self, func: Callable, df: pd.DataFrame, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run func(df, *args, **kwargs) in the process pool.
+
+        Small frames run in a thread; large frames are passed through
+        shared memory instead of being pickled.
+        """
+        if df is None or len(df) < INLINE_MAX_ROWS or self._max_workers <= 0:
+            self._inline += 1
+            return await asyncio.to_thread(func, df, *args, **kwargs)
+
+        shm = None
+        frame: Any = df
+        if df.memory_usage(index=True).sum() >= SHARED_MEMORY_MIN_BYTES:
+            try:
+                shm, frame = frame_to_shared(df)
+                self._shared_memory += 1
+            except TypeError:
+                frame = df
+
+        try:
+            return await self.run(_call_with_frame, func, frame, args, kwargs)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    def _reset_pool(self) -> None:
+        """Drop a broken pool; the next call creates a new one."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    async def shutdown(self) -> None:
+        """Shut down the pool."""
+        pool = self._pool
+        self._pool = None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, True, cancel_futures=True)
+            logger.info("compute_pool_stopped")
+
+    def get_stats(self) -> dict:
+        """Get executor statistics."""
+        return {
+            "max_workers": self._max_workers,
+            "pool_running": self._pool is not None,
+            "submitted": self._submitted,
+            "inline": self._inline,
+            "shared_memory": self._shared_memory,
+            "fallbacks": self._fallbacks,
+        }
+
+
+# =========================================
+# Convenience functions
+# =========================================
+
+async def calculate_indicators_async(df: pd.DataFrame) -> dict:
+    """
+    TechnicalIndicators(df).calculate_all() off the event loop.
+
+    Raises the same exceptions as calculate_all().
+    """
+    return await get_compute_executor().run_frame(_calculate_all_indicators, df)
+
+
+# Singleton instance
+_compute_executor: Optional[ComputeExecutor] = None
+_compute_executor_lock = threading.Lock()
+
+
+def get_compute_executor() -> ComputeExecutor:
+    """Get or create the compute executor singleton (thread-safe)."""
+    global _compute_executor
+
+    if _compute_executor is None:
+        with _compute_executor_lock:
+            if _compute_executor is None:
+                from app.config import settings
+
+                _compute_executor = ComputeExecutor(max_workers=settings.COMPUTE_POOL_WORKERS)
+
+    return _compute_executor
+
+
+async def shutdown_compute_executor() -> None:
+    """Shut down and drop the compute executor singleton."""
+    global _compute_executor
+
+    if _compute_executor is not None:
+        await _compute_executor.shutdown()
+        _compute_executor = None
@@ -0,0 +1,129 @@
+"""
+Event Loop Lag Monitor
+
+Measures how late the asyncio event loop wakes up from a fixed-interval
+sleep. Lag close to zero means the loop stays responsive; large lag means
+something is blocking it (CPU-bound work, sync I/O).
+
+Exposed through /health so p50/p99 lag can be compared with and without
+a running scan.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class LoopLagMonitor:
+    """
+    Samples event loop lag on a fixed interval.
+
+    Keeps a rolling window of samples and logs a warning when a single
+    sample exceeds the warning threshold (rate limited to one per 10s).
+    """
+
+    WARN_LOG_INTERVAL = 10.0
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        window: int = 3000,
+        warn_threshold_ms: float = 100.0,
+    ):
+        """
+        Args:
+            interval: Sampling interval in seconds
+            window: Number of samples kept (3000 x 0.1s = last 5 minutes)
+            warn_threshold_ms: Lag that triggers a warning log
+        """
+        self.interval = interval
+        self.warn_threshold_ms = warn_threshold_ms
+        self._samples: deque[float] = deque(maxlen=window)
+        self._max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._last_warning = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("loop_lag_monitor_started", interval=self.interval)
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - start - self.interval) * 1000)
+            self.record(lag_ms)
+
+    def record(self, lag_ms: float) -> None:
+        """Record one lag sample (milliseconds)."""
+        self._samples.append(lag_ms)
+        self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+
+        if lag_ms >= self.warn_threshold_ms:
+            now = time.monotonic()
+            if now - self._last_warning >= self.WARN_LOG_INTERVAL:
+                self._last_warning = now
+                logger.warning("event_loop_lag_high", lag_ms=round(lag_ms, 1))
+
+    def _percentile(self, ordered: list[float], pct: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def get_stats(self) -> dict:
+        """Get lag statistics over the current window (milliseconds)."""
+        ordered = sorted(self._samples)
+        return {
+            "running": self.is_running,
+            "samples": len(ordered),
+            "last_ms": round(self._samples[-1], 2) if self._samples else 0.0,
+            "p50_ms": round(self._percentile(ordered, 50), 2),
+            "p99_ms": round(self._percentile(ordered, 99), 2),
+            "max_window_ms": round(ordered[-1], 2) if ordered else 0.0,
+            "max_ms": round(self._max_lag_ms, 2),
+        }
+
+    def reset(self) -> None:
+        """Clear collected samples."""
+        self._samples.clear()
+        self._max_lag_ms = 0.0
+
+
+# Singleton instance
+_loop_lag_monitor: Optional[LoopLagMonitor] = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    """Get or create the loop lag monitor singleton."""
+    global _loop_lag_monitor
+
+    if _loop_lag_monitor is None:
+        from app.config import settings
+
+        _loop_lag_monitor = LoopLagMonitor(warn_threshold_ms=settings.LOOP_LAG_WARN_MS)
+
+    return _loop_lag_monitor
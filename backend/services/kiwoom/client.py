@@ -74,6 +74,7 @@ class KiwoomClient:
         timeout: float = 30.0,
         enable_rate_limit: bool = True,
         enable_cache: bool = True,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize Kiwoom Client.
@@ -85,9 +86,10 @@ class KiwoomClient:
             timeout: HTTP 요청 타임아웃 (초)
             enable_rate_limit: Rate limit 활성화 여부 (기본: True)
             enable_cache: 캐시 활성화 여부 (기본: True)
+            base_url: API 서버 주소 재지정 (예: 부하 테스트용 로컬 시뮬레이터)
         """
         self.is_mock = is_mock
-        self.base_url = self.MOCK_URL if is_mock else self.LIVE_URL
+        self.base_url = base_url or (self.MOCK_URL if is_mock else self.LIVE_URL)
         self.timeout = timeout
         self.enable_rate_limit = enable_rate_limit
         self.enable_cache = enable_cache
@@ -266,6 +268,12 @@ class KiwoomClient:
 
             result = response.json()
 
+            # 연속조회 정보는 응답 헤더로 전달됨 (cont-yn / next-key)
+            if isinstance(result, dict):
+                for header in ("cont-yn", "next-key"):
+                    if header in response.headers:
+                        result.setdefault(header, response.headers[header])
+
             # 에러 체크
             return_code = result.get("return_code")
             if return_code is not None:
@@ -506,13 +514,101 @@ class KiwoomClient:
             endpoint="/api/dostk/chart",
             data=data,
         )
+        chart_data = self._parse_daily_chart(result, stk_cd)
+
+        # 캐시 저장
+        if self._cache:
+            self._cache.set(cache_key, chart_data)
+
+        return chart_data
+
+    # 일봉 연속조회 최대 페이지 수 (한 페이지 약 600일)
+    MAX_CHART_PAGES = 10
+
+    async def get_daily_chart_history(
+        self,
+        stk_cd: str,
+        count: int,
+        base_dt: Optional[str] = None,
+        upd_stkpc_tp: str = "0",
+    ) -> list[ChartData]:
+        """
+        주식일봉차트 연속조회 (ka10081, next-key 페이지네이션)
+
+        한 페이지보다 긴 기간(예: 1,000일)이 필요할 때 사용합니다.
+        연속조회 키는 이전 응답에서만 얻을 수 있으므로 페이지는 순차 조회되며,
+        여러 종목의 조회는 Rate Limiter 아래에서 동시에 진행될 수 있습니다.
 
+        Args:
+            stk_cd: 종목코드
+            count: 필요한 일봉 수
+            base_dt: 기준일자 (YYYYMMDD), None이면 오늘
+            upd_stkpc_tp: 수정주가구분 ("0" or "1")
+
+        Returns:
+            ChartData 리스트 (최신순, 최대 count개)
+        """
+        from datetime import datetime
+
+        if base_dt is None:
+            base_dt = datetime.now().strftime("%Y%m%d")
+
+        cache_key = make_cache_key("daily_chart", stk_cd, base_dt, str(count))
+        if self._cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        data = {
+            "stk_cd": stk_cd,
+            "base_dt": base_dt,
+            "upd_stkpc_tp": upd_stkpc_tp,
+        }
+
+        chart_data: list[ChartData] = []
+        seen: set[str] = set()
+        cont_yn = ""
+        next_key = ""
+
+        for _ in range(self.MAX_CHART_PAGES):
+            result = await self._request(
+                api_id="ka10081",
+                endpoint="/api/dostk/chart",
+                data=data,
+                cont_yn=cont_yn,
+                next_key=next_key,
+            )
+            for chart in self._parse_daily_chart(result, stk_cd):
+                if chart.dt not in seen:
+                    seen.add(chart.dt)
+                    chart_data.append(chart)
+
+            next_key = result.get("next-key", "")
+            if len(chart_data) >= count or result.get("cont-yn") != "Y" or not next_key:
+                break
+            cont_yn = "Y"
+
+        chart_data = chart_data[:count]
+
+        logger.debug(
+            "kiwoom_daily_chart_history_fetched",
+            stk_cd=stk_cd,
+            count=len(chart_data),
+        )
+
+        if self._cache:
+            self._cache.set(cache_key, chart_data)
+
+        return chart_data
+
+    def _parse_daily_chart(self, result: dict, stk_cd: str) -> list[ChartData]:
+        """ka10081 응답 파싱"""
         # 응답 필드명: stk_dt_pole_chart_qry (일봉차트 배열)
         output = result.get("stk_dt_pole_chart_qry", result.get("output", []))
         if not isinstance(output, list):
             output = [output] if output else []
 
-        chart_data = [
+        return [
             ChartData(
                 stk_cd=result.get("stk_cd", stk_cd),
                 dt=item.get("dt", ""),
@@ -526,17 +622,12 @@ class KiwoomClient:
             for item in output
         ]
 
-        # 캐시 저장
-        if self._cache:
-            self._cache.set(cache_key, chart_data)
-
-        return chart_data
-
     async def get_daily_chart_df(
         self,
         stk_cd: str,
         base_dt: Optional[str] = None,
         upd_stkpc_tp: str = "0",
+        count: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         일봉 차트를 DataFrame으로 반환
@@ -545,11 +636,15 @@ class KiwoomClient:
             stk_cd: 종목코드
             base_dt: 기준일자 (YYYYMMDD)
             upd_stkpc_tp: 수정주가구분 ("0" or "1")
+            count: 필요한 일봉 수 (지정 시 연속조회, None이면 한 페이지)
 
         Returns:
             OHLCV DataFrame
         """
-        charts = await self.get_daily_chart(stk_cd, base_dt, upd_stkpc_tp)
+        if count is None:
+            charts = await self.get_daily_chart(stk_cd, base_dt, upd_stkpc_tp)
+        else:
+            charts = await self.get_daily_chart_history(stk_cd, count, base_dt, upd_stkpc_tp)
 
         if not charts:
             return pd.DataFrame(columns=["date", "open", "high", "low", "close", "volume"])
@@ -1106,16 +1201,12 @@ class KiwoomClient:
 
         while True:
             # 연속 조회 헤더 설정
-            extra_headers = {}
-            if cont_yn == "Y":
-                extra_headers["cont-yn"] = cont_yn
-                extra_headers["next-key"] = next_key
-
             response = await self._request(
                 api_id="ka10099",
                 endpoint="/api/dostk/stkinfo",
                 data={"mrkt_tp": market_type.value},
-                extra_headers=extra_headers if extra_headers else None,
+                cont_yn=cont_yn if cont_yn == "Y" else "",
+                next_key=next_key if cont_yn == "Y" else "",
             )
 
             # 응답 파싱
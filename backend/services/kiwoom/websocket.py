@@ -30,6 +30,8 @@ import websockets
 from pydantic import BaseModel, Field
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+from services.stream_codec import loads
+
 logger = structlog.get_logger()
 
 
@@ -184,6 +186,7 @@ TickCallback = Callable[[StockTickData], None]
 OrderbookCallback = Callable[[OrderbookData], None]
 VICallback = Callable[[VITriggerData], None]
 ErrorCallback = Callable[[Exception], None]
+ConnectCallback = Callable[[], None]
 
 
 # -------------------------------------------
@@ -232,7 +235,7 @@ class KiwoomWebSocketClient:
             reconnect_delay: Initial delay between reconnection attempts
             max_reconnect_delay: Maximum delay between reconnection attempts
         """
-        self._base_url = base_url.replace("https://", "wss://")
+        self._base_url = base_url.replace("https://", "wss://").replace("http://", "ws://")
         self._ws_url = f"{self._base_url}/api/dostk/websocket"
         self._token = token
 
@@ -258,6 +261,16 @@ class KiwoomWebSocketClient:
         self._balance_callbacks: list[BalanceCallback] = []
         self._vi_callbacks: list[VICallback] = []
         self._error_callbacks: list[ErrorCallback] = []
+        self._connect_callbacks: list[ConnectCallback] = []
+
+        # Real-time type -> (callbacks, parser)
+        self._dispatch: dict[str, tuple[list, Callable[[dict], Any]]] = {
+            RealTimeType.STOCK_TICK.value: (self._tick_callbacks, self._parse_tick_data),
+            RealTimeType.ORDERBOOK.value: (self._orderbook_callbacks, self._parse_orderbook_data),
+            RealTimeType.ORDER_EXECUTION.value: (self._order_execution_callbacks, self._parse_order_execution_data),
+            RealTimeType.BALANCE.value: (self._balance_callbacks, self._parse_balance_data),
+            RealTimeType.VI_TRIGGER.value: (self._vi_callbacks, self._parse_vi_data),
+        }
 
         # Receive task
         self._receive_task: Optional[asyncio.Task] = None
@@ -291,6 +304,12 @@ class KiwoomWebSocketClient:
             logger.error("kiwoom_websocket_connect_failed", error=str(e))
             raise
 
+        for callback in self._connect_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("connect_callback_error", error=str(e))
+
     async def disconnect(self) -> None:
         """Close WebSocket connection."""
         self._running = False
@@ -474,6 +493,10 @@ class KiwoomWebSocketClient:
         """Register error callback."""
         self._error_callbacks.append(callback)
 
+    def on_connect(self, callback: ConnectCallback) -> None:
+        """Register callback run after every (re)connection."""
+        self._connect_callbacks.append(callback)
+
     # -------------------------------------------
     # Message Handling
     # -------------------------------------------
@@ -515,38 +538,28 @@ class KiwoomWebSocketClient:
                 break
 
             try:
-                data = json.loads(message)
-                await self._process_message(data)
-            except json.JSONDecodeError as e:
+                data = loads(message)
+            except ValueError as e:
                 logger.warning("kiwoom_websocket_invalid_json", error=str(e))
+                continue
+            await self._process_message(data)
 
     async def _process_message(self, data: dict[str, Any]) -> None:
-        """Process incoming WebSocket message."""
+        """Process incoming WebSocket message (parsed only if someone listens)."""
         header = data.get("header", {})
         body = data.get("body", data)  # Some messages may not have header/body structure
         msg_type = header.get("rq_type", data.get("rq_type", ""))
 
-        try:
-            if msg_type == RealTimeType.STOCK_TICK.value:
-                tick = self._parse_tick_data(body)
-                await self._invoke_callbacks(self._tick_callbacks, tick)
-
-            elif msg_type == RealTimeType.ORDERBOOK.value:
-                orderbook = self._parse_orderbook_data(body)
-                await self._invoke_callbacks(self._orderbook_callbacks, orderbook)
-
-            elif msg_type == RealTimeType.ORDER_EXECUTION.value:
-                execution = self._parse_order_execution_data(body)
-                await self._invoke_callbacks(self._order_execution_callbacks, execution)
-
-            elif msg_type == RealTimeType.BALANCE.value:
-                balance = self._parse_balance_data(body)
-                await self._invoke_callbacks(self._balance_callbacks, balance)
+        dispatch = self._dispatch.get(msg_type)
+        if dispatch is None:
+            return
 
-            elif msg_type == RealTimeType.VI_TRIGGER.value:
-                vi = self._parse_vi_data(body)
-                await self._invoke_callbacks(self._vi_callbacks, vi)
+        callbacks, parse = dispatch
+        if not callbacks:
+            return
 
+        try:
+            await self._invoke_callbacks(callbacks, parse(body))
         except Exception as e:
             logger.error("kiwoom_websocket_process_error", type=msg_type, error=str(e))
 
@@ -0,0 +1,470 @@
+"""
+Korean Stock Real-time Service
+
+Manages the Kiwoom WebSocket connection and fans out live stock ticks
+(주식체결, 0B), account order executions (주문체결, 00) and balance updates
+(잔고, 04) to in-process subscribers.
+
+Counterpart of services.realtime_service (Upbit) for KRX stocks:
+- One shared Kiwoom WebSocket per process
+- Per-stock callback sets; the stock is subscribed while it has callbacks
+- Latest tick cache (new subscribers get it immediately)
+- Order execution and balance streams are subscribed while they have callbacks
+- L2 order books (services.orderbook) kept current from 주식호가잔량 (0D)
+  for recently read stocks
+"""
+
+import asyncio
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Optional
+
+import structlog
+
+from services.kiwoom import (
+    BalanceData,
+    KiwoomWebSocketClient,
+    Orderbook,
+    OrderbookData,
+    OrderExecutionData,
+    StockTickData,
+)
+from services.kiwoom.models import OrderbookUnit
+from services.orderbook import BookMetrics, OrderBook
+from services.tick_recorder import get_running_tick_recorder
+
+if TYPE_CHECKING:
+    from services.kiwoom import KiwoomClient
+
+logger = structlog.get_logger()
+
+
+# -------------------------------------------
+# Singleton Service Instance
+# -------------------------------------------
+
+_kr_realtime_service: Optional["KrRealtimeService"] = None
+
+
+async def get_kr_realtime_service() -> "KrRealtimeService":
+    """Get or create (and start) the singleton KR realtime service."""
+    global _kr_realtime_service
+    if _kr_realtime_service is None:
+        from app.config import settings
+
+        service = KrRealtimeService(
+            orderbook_max_symbols=settings.ORDERBOOK_MAX_SYMBOLS,
+            orderbook_depth_levels=settings.ORDERBOOK_DEPTH_LEVELS,
+            orderbook_max_age=settings.ORDERBOOK_MAX_AGE,
+        )
+        await service.start()
+        _kr_realtime_service = service
+    return _kr_realtime_service
+
+
+def get_running_kr_realtime_service() -> Optional["KrRealtimeService"]:
+    """Get the KR realtime service only if it already exists (never starts it)."""
+    return _kr_realtime_service
+
+
+async def close_kr_realtime_service() -> None:
+    """Close the KR realtime service and clean up resources."""
+    global _kr_realtime_service
+    if _kr_realtime_service is not None:
+        await _kr_realtime_service.stop()
+        _kr_realtime_service = None
+        logger.info("kr_realtime_service_closed")
+
+
+# -------------------------------------------
+# Callback Types
+# -------------------------------------------
+
+TickCallback = Callable[[StockTickData], None]
+OrderExecutionCallback = Callable[[OrderExecutionData], None]
+BalanceCallback = Callable[[BalanceData], None]
+
+
+# -------------------------------------------
+# KR Realtime Service
+# -------------------------------------------
+
+
+class KrRealtimeService:
+    """
+    Real-time KRX tick service.
+
+    Usage:
+        service = await get_kr_realtime_service()
+        await service.subscribe_tick(["005930"], callback)
+        ...
+        await service.unsubscribe_tick(["005930"], callback)
+    """
+
+    # Levels streamed per side by 주식호가잔량 (0D)
+    ORDERBOOK_STREAM_LEVELS = 5
+
+    def __init__(
+        self,
+        orderbook_max_symbols: int = 20,
+        orderbook_depth_levels: int = 5,
+        orderbook_max_age: float = 30.0,
+    ):
+        """
+        Args:
+            orderbook_max_symbols: Stocks with streamed order books (least recently read dropped)
+            orderbook_depth_levels: Levels used for order book depth and imbalance
+            orderbook_max_age: Seconds without an update before a book is reseeded
+        """
+        self._ws: Optional[KiwoomWebSocketClient] = None
+        self._running = False
+        self._run_task: Optional[asyncio.Task] = None
+
+        # tick_callbacks[stk_cd] = set of callbacks
+        self._tick_callbacks: dict[str, set[TickCallback]] = {}
+        self._latest_ticks: dict[str, StockTickData] = {}
+
+        self._execution_callbacks: set[OrderExecutionCallback] = set()
+        self._balance_callbacks: set[BalanceCallback] = set()
+
+        # L2 order books fed by the orderbook stream, in read order
+        self._orderbooks: OrderedDict[str, OrderBook] = OrderedDict()
+        self._orderbook_max_symbols = orderbook_max_symbols
+        self._orderbook_depth_levels = orderbook_depth_levels
+        self._orderbook_max_age = orderbook_max_age
+        self._connected_once = False
+
+    async def start(self) -> None:
+        """Connect the Kiwoom WebSocket using the shared client's credentials."""
+        if self._running:
+            logger.warning("kr_realtime_service_already_running")
+            return
+
+        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+
+        client = await get_shared_kiwoom_client_async()
+        token = await client.auth.get_token()
+
+        self._ws = KiwoomWebSocketClient(
+            base_url=client.base_url,
+            token=token,
+            reconnect=True,
+            max_reconnect_attempts=0,  # Infinite reconnect
+        )
+        self._ws.on_tick(self._handle_tick)
+        self._ws.on_order_execution(self._handle_order_execution)
+        self._ws.on_balance(self._handle_balance)
+        self._ws.on_orderbook(self._handle_orderbook)
+        self._ws.on_connect(self._handle_connect)
+
+        recorder = get_running_tick_recorder()
+        if recorder:
+            recorder.attach_kiwoom(self._ws)
+
+        try:
+            await self._ws.connect()
+        except Exception as e:
+            logger.error("kr_realtime_service_start_failed", error=str(e))
+            self._ws = None
+            raise
+
+        self._running = True
+        self._run_task = asyncio.create_task(self._run_websocket())
+        logger.info("kr_realtime_service_started")
+
+    async def stop(self) -> None:
+        """Stop the service and close the WebSocket."""
+        self._running = False
+
+        if self._run_task:
+            self._run_task.cancel()
+            try:
+                await self._run_task
+            except asyncio.CancelledError:
+                pass
+            self._run_task = None
+
+        if self._ws:
+            await self._ws.disconnect()
+            self._ws = None
+
+        logger.info("kr_realtime_service_stopped")
+
+    async def _run_websocket(self) -> None:
+        """Run the WebSocket receive loop."""
+        if self._ws:
+            try:
+                await self._ws.run()
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error("kr_realtime_websocket_error", error=str(e))
+
+    # -------------------------------------------
+    # Subscription Management
+    # -------------------------------------------
+
+    async def subscribe_tick(self, stock_codes: list[str], callback: TickCallback) -> None:
+        """
+        Subscribe a callback to tick updates.
+
+        Args:
+            stock_codes: Stock codes (e.g., ["005930"])
+            callback: Called with StockTickData for every tick (sync or async)
+        """
+        new_codes = []
+
+        for stk_cd in stock_codes:
+            if stk_cd not in self._tick_callbacks:
+                self._tick_callbacks[stk_cd] = set()
+                new_codes.append(stk_cd)
+
+            self._tick_callbacks[stk_cd].add(callback)
+
+            # Send cached tick immediately if available
+            if stk_cd in self._latest_ticks:
+                await self._invoke(callback, self._latest_ticks[stk_cd])
+
+        if new_codes and self._ws:
+            await self._ws.subscribe_tick(new_codes)
+            logger.debug("kr_tick_subscribed", stocks=new_codes)
+
+    async def unsubscribe_tick(self, stock_codes: list[str], callback: TickCallback) -> None:
+        """Remove a callback; stocks without callbacks are unsubscribed."""
+        removed_codes = []
+
+        for stk_cd in stock_codes:
+            callbacks = self._tick_callbacks.get(stk_cd)
+            if callbacks is None:
+                continue
+            callbacks.discard(callback)
+            if not callbacks:
+                del self._tick_callbacks[stk_cd]
+                removed_codes.append(stk_cd)
+
+        if removed_codes and self._ws:
+            await self._ws.unsubscribe_tick(removed_codes)
+            logger.debug("kr_tick_unsubscribed", stocks=removed_codes)
+
+    async def unsubscribe_all(self, callback: TickCallback) -> None:
+        """Unsubscribe a callback from every stock."""
+        codes = [
+            stk_cd
+            for stk_cd, callbacks in self._tick_callbacks.items()
+            if callback in callbacks
+        ]
+        if codes:
+            await self.unsubscribe_tick(codes, callback)
+
+    async def subscribe_order_execution(self, callback: OrderExecutionCallback) -> None:
+        """
+        Subscribe a callback to account order executions (주문체결).
+
+        Args:
+            callback: Called with OrderExecutionData for every execution
+                report (sync or async)
+        """
+        first = not self._execution_callbacks
+        self._execution_callbacks.add(callback)
+
+        if first and self._ws:
+            await self._ws.subscribe_order_execution()
+            logger.debug("kr_order_execution_subscribed")
+
+    async def unsubscribe_order_execution(self, callback: OrderExecutionCallback) -> None:
+        """Remove an execution callback; the stream is dropped with the last one."""
+        if callback not in self._execution_callbacks:
+            return
+        self._execution_callbacks.discard(callback)
+
+        if not self._execution_callbacks and self._ws:
+            await self._ws.unsubscribe_order_execution()
+            logger.debug("kr_order_execution_unsubscribed")
+
+    async def subscribe_balance(self, callback: BalanceCallback) -> None:
+        """
+        Subscribe a callback to account balance updates (잔고).
+
+        Args:
+            callback: Called with BalanceData for every holding change
+                (sync or async)
+        """
+        first = not self._balance_callbacks
+        self._balance_callbacks.add(callback)
+
+        if first and self._ws:
+            await self._ws.subscribe_balance()
+            logger.debug("kr_balance_subscribed")
+
+    async def unsubscribe_balance(self, callback: BalanceCallback) -> None:
+        """Remove a balance callback; the stream is dropped with the last one."""
+        if callback not in self._balance_callbacks:
+            return
+        self._balance_callbacks.discard(callback)
+
+        if not self._balance_callbacks and self._ws:
+            await self._ws.unsubscribe_balance()
+            logger.debug("kr_balance_unsubscribed")
+
+    # -------------------------------------------
+    # Data Handlers
+    # -------------------------------------------
+
+    async def _handle_tick(self, tick: StockTickData) -> None:
+        """Cache the tick and fan it out to the stock's subscribers."""
+        self._latest_ticks[tick.stk_cd] = tick
+
+        for callback in self._tick_callbacks.get(tick.stk_cd, set()).copy():
+            await self._invoke(callback, tick)
+
+    async def _handle_order_execution(self, execution: OrderExecutionData) -> None:
+        """Fan an execution report out to the execution subscribers."""
+        for callback in self._execution_callbacks.copy():
+            await self._invoke(callback, execution)
+
+    async def _handle_balance(self, balance: BalanceData) -> None:
+        """Fan a balance update out to the balance subscribers."""
+        for callback in self._balance_callbacks.copy():
+            await self._invoke(callback, balance)
+
+    def _handle_orderbook(self, data: OrderbookData) -> None:
+        """Apply an orderbook snapshot to the stock's book."""
+        book = self._orderbooks.get(data.stk_cd)
+        if book is None:
+            return
+
+        levels = range(1, self.ORDERBOOK_STREAM_LEVELS + 1)
+        book.apply_snapshot(
+            bids=[(getattr(data, f"buy_hoga_{i}"), getattr(data, f"buy_hoga_qty_{i}")) for i in levels],
+            asks=[(getattr(data, f"sell_hoga_{i}"), getattr(data, f"sell_hoga_qty_{i}")) for i in levels],
+            total_bid_size=data.tot_buy_qty,
+            total_ask_size=data.tot_sell_qty,
+        )
+
+    async def feed(self, data: StockTickData | OrderbookData) -> None:
+        """
+        Apply data from outside the stream, e.g. a recorded session
+        (services.tick_recorder). Orderbook data starts a book for its stock.
+        """
+        if isinstance(data, StockTickData):
+            await self._handle_tick(data)
+        elif isinstance(data, OrderbookData):
+            if data.stk_cd not in self._orderbooks:
+                await self._track_orderbook(data.stk_cd)
+            self._handle_orderbook(data)
+
+    def _handle_connect(self) -> None:
+        """Book changes were missed while reconnecting; refill books on next read."""
+        if self._connected_once:
+            for book in self._orderbooks.values():
+                book.clear()
+        self._connected_once = True
+
+    @staticmethod
+    async def _invoke(callback: Callable, data) -> None:
+        try:
+            if asyncio.iscoroutinefunction(callback):
+                await callback(data)
+            else:
+                callback(data)
+        except Exception as e:
+            logger.warning("kr_realtime_callback_error", stk_cd=data.stk_cd, type=data.type, error=str(e))
+
+    # -------------------------------------------
+    # Order Books
+    # -------------------------------------------
+
+    async def get_orderbook(self, client: "KiwoomClient", stk_cd: str) -> Optional[Orderbook]:
+        """
+        Get the stock's order book from the streamed L2 book.
+
+        The first read of a stock starts its orderbook stream and fills the
+        book from one REST snapshot (ka10004); the stream keeps it current
+        after that, so later reads make no REST call. A book with no update
+        for longer than the max age is treated as missing and reseeded.
+
+        Args:
+            client: Kiwoom client for the one-time REST snapshot
+            stk_cd: Stock code
+
+        Returns:
+            Orderbook, or None if the stream is down or the snapshot failed
+        """
+        if not self.is_connected:
+            return None
+
+        try:
+            book = await self._track_orderbook(stk_cd)
+        except Exception as e:
+            logger.warning("kr_orderbook_subscribe_failed", stk_cd=stk_cd, error=str(e))
+            return None
+        if self._is_stale(book):
+            try:
+                orderbook = await client.get_orderbook(stk_cd)
+            except Exception as e:
+                logger.warning("kr_orderbook_seed_failed", stk_cd=stk_cd, error=str(e))
+                return None
+            # A streamed snapshot may have arrived while the request was in flight
+            if self._is_stale(book):
+                book.apply_snapshot(
+                    bids=[(h.price, h.quantity) for h in orderbook.buy_hogas],
+                    asks=[(h.price, h.quantity) for h in orderbook.sell_hogas],
+                    total_bid_size=orderbook.tot_buy_qty,
+                    total_ask_size=orderbook.tot_sell_qty,
+                )
+            if self._is_stale(book):
+                return None
+
+        return Orderbook(
+            stk_cd=stk_cd,
+            sell_hogas=[OrderbookUnit(price=int(p), quantity=int(q)) for p, q in book.asks()],
+            buy_hogas=[OrderbookUnit(price=int(p), quantity=int(q)) for p, q in book.bids()],
+            tot_sell_qty=int(book.total_ask_size),
+            tot_buy_qty=int(book.total_bid_size),
+        )
+
+    def get_orderbook_metrics(self, stk_cd: str, levels: Optional[int] = None) -> Optional[BookMetrics]:
+        """Get metrics of a streamed book (None if the stock has no live book)."""
+        book = self._orderbooks.get(stk_cd)
+        if book is None or self._is_stale(book) or not self.is_connected:
+            return None
+        return book.metrics(levels)
+
+    def _is_stale(self, book: OrderBook) -> bool:
+        """Whether a book is empty or has gone without updates for too long."""
+        age = book.age
+        return book.is_empty or age is None or age > self._orderbook_max_age
+
+    async def _track_orderbook(self, stk_cd: str) -> OrderBook:
+        """Start streaming a stock's book (dropping the least recently read)."""
+        book = self._orderbooks.get(stk_cd)
+        if book is not None:
+            self._orderbooks.move_to_end(stk_cd)
+            return book
+
+        while len(self._orderbooks) >= self._orderbook_max_symbols:
+            evicted, _ = self._orderbooks.popitem(last=False)
+            if self._ws:
+                await self._ws.unsubscribe_orderbook([evicted])
+
+        if self._ws:
+            await self._ws.subscribe_orderbook([stk_cd])
+        # A concurrent read may have tracked the stock while subscribing
+        book = self._orderbooks.setdefault(stk_cd, OrderBook(stk_cd, depth_levels=self._orderbook_depth_levels))
+        logger.debug("kr_orderbook_stock_tracked", stk_cd=stk_cd)
+        return book
+
+    def get_latest_tick(self, stk_cd: str) -> Optional[StockTickData]:
+        """Get the most recent tick for a stock, if any."""
+        return self._latest_ticks.get(stk_cd)
+
+    def get_subscribed_stocks(self) -> dict[str, int]:
+        """Stock code -> number of subscribed callbacks."""
+        return {stk_cd: len(callbacks) for stk_cd, callbacks in self._tick_callbacks.items()}
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_connected(self) -> bool:
+        return self._ws is not None and self._ws.is_connected
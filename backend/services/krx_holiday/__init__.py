@@ -4,6 +4,7 @@ KRX Holiday Service
 Provides KRX market holiday data fetching and storage.
 """
 
+from .calendar import TradingCalendar
 from .fetcher import KRXHolidayFetcher, HolidayInfo
 from .storage import HolidayStorage
 from .service import (
@@ -16,6 +17,7 @@ __all__ = [
     "KRXHolidayFetcher",
     "HolidayInfo",
     "HolidayStorage",
+    "TradingCalendar",
     "KRXHolidayService",
     "get_holiday_service",
     "get_holiday_service_sync",
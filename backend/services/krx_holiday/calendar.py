@@ -0,0 +1,197 @@
+"""
+Compiled KRX Trading Calendar
+
+Trading days are stored as a sorted array of date ordinals, so calendar
+queries are a bisect instead of stepping one day at a time:
+
+- is_trading_day / next / previous / nth trading day: O(log n)
+- trading day count between two dates: O(log n)
+- missing trading days in a bar history: O(n) over the bars
+
+No I/O: the calendar is compiled from an in-memory holiday set and
+extended a year at a time when a query falls outside its range.
+"""
+
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _compile_ordinals(start_year: int, end_year: int, holidays: frozenset) -> array:
+    """Trading-day ordinals (weekdays that are not holidays) for whole years."""
+    first = date(start_year, 1, 1).toordinal()
+    last = date(end_year, 12, 31).toordinal()
+    # date.fromordinal(1) is a Monday, so weekday == (ordinal - 1) % 7
+    return array("l", (
+        o for o in range(first, last + 1)
+        if (o - 1) % 7 < 5 and o not in holidays
+    ))
+
+
+class TradingCalendar:
+    """
+    Sorted trading-day index.
+
+    Usage:
+        calendar = TradingCalendar(holiday_dates)
+        calendar.next_trading_day(date(2025, 1, 27))  # -> 2025-01-31
+        calendar.count_trading_days(start, end)
+        calendar.missing_trading_days(bar_dates)
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[date] = (),
+        names: Optional[Dict[date, str]] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ):
+        """
+        Compile a calendar.
+
+        Args:
+            holidays: Market holidays (weekends are implied)
+            names: Optional holiday names by date
+            start_year: First compiled year (defaults to the earliest
+                holiday year, or this year)
+            end_year: Last compiled year (defaults to the latest holiday
+                year, at least next year)
+        """
+        self._holidays = frozenset(d.toordinal() for d in holidays)
+        self._names = dict(names or {})
+
+        years = [date.fromordinal(o).year for o in self._holidays]
+        this_year = date.today().year
+        self._start_year = start_year or min(years + [this_year])
+        self._end_year = end_year or max(years + [this_year + 1])
+        self._ordinals = _compile_ordinals(self._start_year, self._end_year, self._holidays)
+
+    # -------------------------------------------
+    # Range Management
+    # -------------------------------------------
+
+    @property
+    def start(self) -> date:
+        return date(self._start_year, 1, 1)
+
+    @property
+    def end(self) -> date:
+        return date(self._end_year, 12, 31)
+
+    def _ensure(self, ordinal: int) -> None:
+        """Extend the compiled range to cover an ordinal (whole years)."""
+        year = date.fromordinal(ordinal).year
+        if year < self._start_year:
+            head = _compile_ordinals(year, self._start_year - 1, self._holidays)
+            self._ordinals = head + self._ordinals
+            self._start_year = year
+        elif year > self._end_year:
+            tail = _compile_ordinals(self._end_year + 1, year, self._holidays)
+            self._ordinals.extend(tail)
+            self._end_year = year
+
+    def _extend_forward(self) -> None:
+        """Compile one more year at the end."""
+        self._ensure(self.end.toordinal() + 1)
+
+    def _extend_backward(self) -> int:
+        """Compile one more year at the start; returns the index shift."""
+        size = len(self._ordinals)
+        self._ensure(self.start.toordinal() - 1)
+        return len(self._ordinals) - size
+
+    def _index(self, d: date) -> tuple:
+        """(bisect_left, bisect_right) of a date in the trading-day array."""
+        o = d.toordinal()
+        self._ensure(o)
+        ords = self._ordinals
+        return bisect_left(ords, o), bisect_right(ords, o)
+
+    # -------------------------------------------
+    # Queries
+    # -------------------------------------------
+
+    def is_holiday(self, d: date) -> bool:
+        """Whether a date is a listed market holiday."""
+        return d.toordinal() in self._holidays
+
+    def holiday_name(self, d: date) -> Optional[str]:
+        """Holiday name, if known."""
+        return self._names.get(d)
+
+    def is_trading_day(self, d: date) -> bool:
+        """Whether the market trades on a date."""
+        lo, hi = self._index(d)
+        return hi > lo
+
+    def next_trading_day(self, d: date) -> date:
+        """First trading day strictly after a date."""
+        _, hi = self._index(d)
+        while hi >= len(self._ordinals):
+            self._extend_forward()
+        return date.fromordinal(self._ordinals[hi])
+
+    def previous_trading_day(self, d: date) -> date:
+        """Last trading day strictly before a date."""
+        lo, _ = self._index(d)
+        while lo == 0:
+            lo += self._extend_backward()
+        return date.fromordinal(self._ordinals[lo - 1])
+
+    def nth_trading_day(self, d: date, n: int) -> date:
+        """
+        The n-th trading day after (n > 0) or before (n < 0) a date.
+
+        n == 0 returns the date itself if it is a trading day, otherwise
+        the next trading day.
+        """
+        lo, hi = self._index(d)
+        if n > 0:
+            i = hi + n - 1
+            while i >= len(self._ordinals):
+                self._extend_forward()
+        elif n < 0:
+            i = lo + n
+            while i < 0:
+                i += self._extend_backward()
+        else:
+            return d if hi > lo else self.next_trading_day(d)
+        return date.fromordinal(self._ordinals[i])
+
+    def count_trading_days(self, start: date, end: date) -> int:
+        """Number of trading days in [start, end]."""
+        if end < start:
+            return 0
+        lo, _ = self._index(start)
+        _, hi = self._index(end)
+        return hi - lo
+
+    def trading_days(self, start: date, end: date) -> List[date]:
+        """All trading days in [start, end]."""
+        if end < start:
+            return []
+        lo, _ = self._index(start)
+        _, hi = self._index(end)
+        return [date.fromordinal(o) for o in self._ordinals[lo:hi]]
+
+    def missing_trading_days(self, dates: Iterable[date]) -> List[date]:
+        """
+        Trading days absent from a (daily bar) history.
+
+        Only the span between the first and last given dates is checked.
+        """
+        have = sorted({d.toordinal() for d in dates})
+        if not have:
+            return []
+
+        lo, _ = self._index(date.fromordinal(have[0]))
+        _, hi = self._index(date.fromordinal(have[-1]))
+        present = set(have)
+        return [date.fromordinal(o) for o in self._ordinals[lo:hi] if o not in present]
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
@@ -3,15 +3,19 @@ KRX Holiday Service
 
 High-level service that combines fetching and storage of KRX holidays.
 Provides automatic updates and integration with MarketHoursService.
+
+Trading-day queries are answered by a compiled TradingCalendar (sorted
+trading-day ordinals + bisect); it is rebuilt after holiday updates.
 """
 
 import asyncio
 import logging
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from typing import Optional, Set, List
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from .calendar import TradingCalendar
 from .fetcher import KRXHolidayFetcher, HolidayInfo
 from .storage import HolidayStorage
 
@@ -40,6 +44,19 @@ class KRXHolidayService:
         self.storage = HolidayStorage(db_path)
         self._scheduler: Optional[AsyncIOScheduler] = None
         self._initialized = False
+        self._calendar: Optional[TradingCalendar] = None
+
+    @property
+    def calendar(self) -> TradingCalendar:
+        """Compiled trading calendar (built from storage on first use)."""
+        if self._calendar is None:
+            names = self.storage.get_holiday_names()
+            self._calendar = TradingCalendar(names, names=names)
+            logger.debug(
+                f"Compiled trading calendar {self._calendar.start} ~ {self._calendar.end} "
+                f"({len(self._calendar)} trading days)"
+            )
+        return self._calendar
 
     async def initialize(self, fetch_if_empty: bool = True):
         """
@@ -97,6 +114,7 @@ class KRXHolidayService:
                 if holidays:
                     saved = self.storage.save_holidays(holidays)
                     total_saved += saved
+                    self._calendar = None  # Recompile on next query
                     logger.info(f"Updated {saved} holidays for {y}")
                 else:
                     logger.warning(f"No holidays fetched for {y}")
@@ -116,7 +134,7 @@ class KRXHolidayService:
 
     def is_holiday(self, check_date: date) -> bool:
         """Check if a date is a holiday."""
-        return self.storage.is_holiday(check_date)
+        return self.calendar.is_holiday(check_date)
 
     def get_holiday_info(self, check_date: date) -> Optional[HolidayInfo]:
         """Get holiday information for a date."""
@@ -136,15 +154,7 @@ class KRXHolidayService:
         Returns:
             True if it's a trading day
         """
-        # Check weekend
-        if check_date.weekday() >= 5:  # 5=Saturday, 6=Sunday
-            return False
-
-        # Check holiday
-        if self.is_holiday(check_date):
-            return False
-
-        return True
+        return self.calendar.is_trading_day(check_date)
 
     def get_next_trading_day(self, from_date: Optional[date] = None) -> date:
         """
@@ -156,21 +166,7 @@ class KRXHolidayService:
         Returns:
             Next trading day
         """
-        if from_date is None:
-            from_date = date.today()
-
-        next_day = from_date + timedelta(days=1)
-
-        # Find next trading day
-        while not self.is_trading_day(next_day):
-            next_day += timedelta(days=1)
-
-            # Safety limit (shouldn't happen)
-            if (next_day - from_date).days > 30:
-                logger.error("Could not find trading day within 30 days")
-                break
-
-        return next_day
+        return self.calendar.next_trading_day(from_date or date.today())
 
     def get_previous_trading_day(self, from_date: Optional[date] = None) -> date:
         """
@@ -182,21 +178,7 @@ class KRXHolidayService:
         Returns:
             Previous trading day
         """
-        if from_date is None:
-            from_date = date.today()
-
-        prev_day = from_date - timedelta(days=1)
-
-        # Find previous trading day
-        while not self.is_trading_day(prev_day):
-            prev_day -= timedelta(days=1)
-
-            # Safety limit
-            if (from_date - prev_day).days > 30:
-                logger.error("Could not find trading day within 30 days")
-                break
-
-        return prev_day
+        return self.calendar.previous_trading_day(from_date or date.today())
 
     def get_trading_days_in_range(self, start_date: date, end_date: date) -> List[date]:
         """
@@ -209,15 +191,24 @@ class KRXHolidayService:
         Returns:
             List of trading days
         """
-        trading_days = []
-        current = start_date
+        return self.calendar.trading_days(start_date, end_date)
+
+    def count_trading_days(self, start_date: date, end_date: date) -> int:
+        """Number of trading days in a date range (inclusive)."""
+        return self.calendar.count_trading_days(start_date, end_date)
+
+    def get_nth_trading_day(self, from_date: date, n: int) -> date:
+        """
+        Get the n-th trading day after (n > 0) or before (n < 0) a date.
 
-        while current <= end_date:
-            if self.is_trading_day(current):
-                trading_days.append(current)
-            current += timedelta(days=1)
+        Args:
+            from_date: Starting date
+            n: Trading-day offset
 
-        return trading_days
+        Returns:
+            Trading day
+        """
+        return self.calendar.nth_trading_day(from_date, n)
 
     def start_scheduler(self, update_day: int = 1, update_hour: int = 6):
         """
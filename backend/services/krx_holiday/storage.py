@@ -46,8 +46,7 @@ class HolidayStorage:
         self._init_database()
 
         # In-memory cache for fast lookups
-        self._holiday_cache: Dict[int, Set[date]] = {}
-        self._cache_loaded = False
+        self._info_cache: Optional[Dict[date, HolidayInfo]] = None
 
     @contextmanager
     def _get_connection(self):
@@ -149,8 +148,7 @@ class HolidayStorage:
             conn.commit()
 
         # Invalidate cache
-        self._cache_loaded = False
-        self._holiday_cache.clear()
+        self._invalidate_cache()
 
         logger.info(f"Saved {saved_count} holidays to database")
         return saved_count
@@ -198,6 +196,16 @@ class HolidayStorage:
 
         return holidays
 
+    def _invalidate_cache(self):
+        """Drop the in-memory cache after a write."""
+        self._info_cache = None
+
+    def _load_cache(self) -> Dict[date, HolidayInfo]:
+        """Load every holiday once; later lookups are served from memory."""
+        if self._info_cache is None:
+            self._info_cache = {h.date: h for h in self.get_holidays()}
+        return self._info_cache
+
     def get_holiday_dates(self, year: Optional[int] = None) -> Set[date]:
         """
         Get holiday dates as a set for fast lookup.
@@ -208,25 +216,19 @@ class HolidayStorage:
         Returns:
             Set of date objects
         """
-        # Check cache
-        if self._cache_loaded and year in self._holiday_cache:
-            return self._holiday_cache[year]
-
-        holidays = self.get_holidays(year)
-        dates = {h.date for h in holidays}
-
-        # Update cache
+        info = self._load_cache()
         if year:
-            self._holiday_cache[year] = dates
-        else:
-            # Build year-based cache
-            for h in holidays:
-                if h.year not in self._holiday_cache:
-                    self._holiday_cache[h.year] = set()
-                self._holiday_cache[h.year].add(h.date)
-            self._cache_loaded = True
+            return {d for d, h in info.items() if h.year == year}
+        return set(info)
 
-        return dates
+    def get_holiday_names(self) -> Dict[date, str]:
+        """
+        Get holiday names by date (served from the in-memory cache).
+
+        Returns:
+            Dict of date -> holiday name
+        """
+        return {d: h.name for d, h in self._load_cache().items()}
 
     def is_holiday(self, check_date: date) -> bool:
         """
@@ -238,9 +240,7 @@ class HolidayStorage:
         Returns:
             True if the date is a holiday
         """
-        year = check_date.year
-        holiday_dates = self.get_holiday_dates(year)
-        return check_date in holiday_dates
+        return check_date in self._load_cache()
 
     def get_holiday_info(self, check_date: date) -> Optional[HolidayInfo]:
         """
@@ -252,24 +252,7 @@ class HolidayStorage:
         Returns:
             HolidayInfo if it's a holiday, None otherwise
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT date, year, day_of_week, name
-                FROM krx_holidays
-                WHERE date = ?
-            """, (check_date.isoformat(),))
-
-            row = cursor.fetchone()
-            if row:
-                return HolidayInfo(
-                    date=date.fromisoformat(row["date"]),
-                    day_of_week=row["day_of_week"] or "",
-                    name=row["name"] or "",
-                    year=row["year"],
-                )
-
-        return None
+        return self._load_cache().get(check_date)
 
     def get_last_update(self) -> Optional[datetime]:
         """
@@ -348,8 +331,7 @@ class HolidayStorage:
             deleted = cursor.rowcount
 
         # Invalidate cache
-        if year in self._holiday_cache:
-            del self._holiday_cache[year]
+        self._invalidate_cache()
 
         logger.info(f"Deleted {deleted} holidays for year {year}")
         return deleted
@@ -362,8 +344,7 @@ class HolidayStorage:
             cursor.execute("DELETE FROM holiday_metadata")
             conn.commit()
 
-        self._holiday_cache.clear()
-        self._cache_loaded = False
+        self._invalidate_cache()
 
         logger.info("Cleared all holiday data")
 
@@ -0,0 +1,30 @@
+"""
+Market Snapshot Service
+
+Shared, immutable per-ticker market snapshots (quote, bars, indicators,
+orderbook, position) for agent chat, the KR stock graph and the scanner.
+"""
+
+from services.market_snapshot.service import (
+    ALL_PARTS,
+    BARS,
+    ORDERBOOK,
+    POSITION,
+    QUOTE,
+    MarketSnapshot,
+    MarketSnapshotService,
+    build_bar_bundle,
+    get_market_snapshot_service,
+)
+
+__all__ = [
+    "ALL_PARTS",
+    "BARS",
+    "ORDERBOOK",
+    "POSITION",
+    "QUOTE",
+    "MarketSnapshot",
+    "MarketSnapshotService",
+    "build_bar_bundle",
+    "get_market_snapshot_service",
+]
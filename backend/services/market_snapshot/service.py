@@ -0,0 +1,447 @@
+"""
+Market Snapshot Service
+
+Builds one immutable, versioned market snapshot per ticker and shares it
+between the agent chat coordinator, the KR stock analysis graph and the
+background scanner, so a ticker analyzed by several of them is fetched once.
+
+Features:
+- Snapshot parts (quote, bars, orderbook, position) fetched concurrently
+- Per-part freshness policy; only stale parts are refetched
+- Single-flight per ticker: concurrent callers share one fetch
+- Indicator bundle computed once per bar fetch in the compute pool
+- Account balance shared across tickers via the account state service
+  (stream-fed; REST only when the streams are down)
+- LRU-bounded cache
+
+Usage:
+    from services.market_snapshot import get_market_snapshot_service
+
+    service = get_market_snapshot_service()
+    snapshot = await service.get_snapshot("005930", parts=("quote", "bars"))
+    snapshot.quote["cur_prc"], snapshot.indicators, snapshot.chart_records
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional
+
+import pandas as pd
+import structlog
+
+from services.account_state import AccountStateService, get_account_state_service
+
+logger = structlog.get_logger()
+
+
+# Snapshot parts
+QUOTE = "quote"
+BARS = "bars"
+ORDERBOOK = "orderbook"
+POSITION = "position"
+ALL_PARTS = (QUOTE, BARS, ORDERBOOK, POSITION)
+
+# Default freshness policy (seconds)
+DEFAULT_MAX_AGE = {
+    QUOTE: 5.0,
+    BARS: 60.0,
+    ORDERBOOK: 2.0,
+    POSITION: 10.0,
+}
+
+
+# Snapshot fields of each part, as left when the part is missing
+_EMPTY_PARTS = {
+    QUOTE: {"stock_info": None},
+    BARS: {"chart_df": None, "chart_records": (), "indicators": None, "kr_indicators": None},
+    ORDERBOOK: {"orderbook": None},
+    POSITION: {"position": None, "portfolio": None, "account_version": 0},
+}
+
+
+def build_bar_bundle(df: pd.DataFrame) -> dict:
+    """
+    Derive everything consumers need from the daily bars in one pass.
+
+    Runs in the compute pool (module level, picklable).
+
+    Returns:
+        {"chart_records": [...], "indicators": {...} | None, "kr_indicators": {...}}
+    """
+    from agents.tools.kr_market_data import (
+        calculate_kr_technical_indicators,
+        chart_df_to_records,
+    )
+    from services.technical_indicators import TechnicalIndicators
+
+    if df is None or df.empty:
+        return {"chart_records": [], "indicators": None, "kr_indicators": {}}
+
+    indicators = None
+    if len(df) >= 20:
+        try:
+            indicators = TechnicalIndicators(df).calculate_all()
+        except Exception as e:
+            logger.warning("snapshot_indicators_failed", error=str(e))
+
+    return {
+        "chart_records": chart_df_to_records(df),
+        "indicators": indicators,
+        "kr_indicators": calculate_kr_technical_indicators(df),
+    }
+
+
+def _position_from_balance(balance: Any, stk_cd: str) -> tuple[Optional[dict], dict]:
+    """Extract (holding for stk_cd, portfolio summary) from an account balance."""
+    position = None
+    for holding in balance.holdings:
+        if holding.stk_cd == stk_cd:
+            position = {
+                "stk_cd": holding.stk_cd,
+                "stk_nm": holding.stk_nm,
+                "quantity": holding.hldg_qty,
+                "avg_buy_price": holding.avg_buy_prc,
+                "current_price": holding.cur_prc,
+                "eval_amount": holding.evlu_amt,
+                "profit_loss": holding.evlu_pfls_amt,
+                "profit_loss_pct": holding.evlu_pfls_rt,
+            }
+            break
+
+    portfolio = {
+        "total_purchase": balance.pchs_amt,
+        "total_eval": balance.evlu_amt,
+        "total_pnl": balance.evlu_pfls_amt,
+        "total_pnl_pct": balance.evlu_pfls_rt,
+        "available_cash": balance.d2_ord_psbl_amt,
+        "holdings_count": len(balance.holdings),
+    }
+    return position, portfolio
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """
+    Immutable market data for one ticker.
+
+    A new version is created whenever any part is refreshed; parts that
+    were still fresh are carried over. Treat the contained objects as
+    read-only, they are shared between consumers.
+    """
+    stk_cd: str
+    version: int
+    created_at: datetime
+
+    # quote: raw Kiwoom stock info model (attribute access)
+    stock_info: Any = None
+
+    # bars: daily chart and everything derived from it
+    chart_df: Optional[pd.DataFrame] = None
+    chart_records: tuple = ()
+    indicators: Optional[Mapping[str, Any]] = None      # TechnicalIndicators.calculate_all()
+    kr_indicators: Optional[Mapping[str, Any]] = None   # calculate_kr_technical_indicators()
+
+    # orderbook
+    orderbook: Optional[Mapping[str, Any]] = None
+
+    # position: holding for this ticker (None = not held) and portfolio summary
+    position: Optional[Mapping[str, Any]] = None
+    portfolio: Optional[Mapping[str, Any]] = None
+    account_version: int = 0  # AccountSnapshot version the position came from
+
+    # Monotonic fetch time per successfully fetched part, and last error per failed part
+    fetched_at: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+    errors: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    @property
+    def quote(self) -> Optional[dict]:
+        """Stock info as the dict format used by agents (a fresh copy)."""
+        if self.stock_info is None:
+            return None
+        from agents.tools.kr_market_data import stock_info_to_dict
+
+        return stock_info_to_dict(self.stock_info)
+
+    def has(self, part: str) -> bool:
+        return part in self.fetched_at
+
+    def age(self, part: str) -> Optional[float]:
+        """Seconds since the part was fetched (None if never fetched)."""
+        fetched = self.fetched_at.get(part)
+        return None if fetched is None else time.monotonic() - fetched
+
+    def is_fresh(self, part: str, max_age: float) -> bool:
+        age = self.age(part)
+        return age is not None and age < max_age
+
+
+class MarketSnapshotService:
+    """
+    Per-ticker snapshot cache with a freshness policy.
+
+    get_snapshot() returns the cached snapshot when every requested part
+    is fresh, otherwise fetches only the stale parts (concurrently) and
+    publishes a new version.
+    """
+
+    def __init__(
+        self,
+        max_age: Optional[dict[str, float]] = None,
+        max_entries: int = 512,
+        account_state: Optional[AccountStateService] = None,
+    ):
+        """
+        Args:
+            max_age: Per-part max age in seconds (defaults to DEFAULT_MAX_AGE)
+            max_entries: Maximum number of tickers kept (LRU)
+            account_state: Source of the position part (defaults to a
+                private REST-only instance using the POSITION max age)
+        """
+        self.max_age = {**DEFAULT_MAX_AGE, **(max_age or {})}
+        self.max_entries = max_entries
+
+        self._snapshots: OrderedDict[str, MarketSnapshot] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._versions: dict[str, int] = {}
+
+        # Account balance is shared by every ticker's position part
+        self._account_state = account_state or AccountStateService(
+            client_factory=self._get_client,
+            stale_after=self.max_age[POSITION],
+        )
+        self._refresh_balance = False
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._part_fetches = {part: 0 for part in ALL_PARTS}
+
+    # -------------------------------------------
+    # Public API
+    # -------------------------------------------
+
+    async def get_snapshot(
+        self,
+        stk_cd: str,
+        parts: Iterable[str] = ALL_PARTS,
+        max_age: Optional[float] = None,
+    ) -> MarketSnapshot:
+        """
+        Get a snapshot containing at least the requested parts.
+
+        Parts that fail to fetch are left empty (a previously fetched
+        value is dropped) and reported in snapshot.errors; they are
+        retried on the next call.
+
+        Args:
+            stk_cd: Stock code
+            parts: Parts required by the caller
+            max_age: Override the max age (seconds) for all requested parts
+        """
+        parts = tuple(parts)
+        unknown = set(parts) - set(ALL_PARTS)
+        if unknown:
+            raise ValueError(f"Unknown snapshot parts: {sorted(unknown)}")
+
+        cached = self._snapshots.get(stk_cd)
+        if cached is not None and not self._stale_parts(cached, parts, max_age):
+            self._hits += 1
+            self._snapshots.move_to_end(stk_cd)
+            return cached
+
+        lock = self._locks.setdefault(stk_cd, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed while we waited
+            cached = self._snapshots.get(stk_cd)
+            stale = self._stale_parts(cached, parts, max_age) if cached is not None else list(parts)
+            if not stale:
+                self._hits += 1
+                return cached
+
+            self._misses += 1
+            snapshot = await self._refresh(stk_cd, cached, stale)
+            self._store(snapshot)
+            return snapshot
+
+    def peek(self, stk_cd: str) -> Optional[MarketSnapshot]:
+        """Get the cached snapshot regardless of freshness (no network)."""
+        return self._snapshots.get(stk_cd)
+
+    def invalidate(self, stk_cd: Optional[str] = None) -> None:
+        """Drop one ticker (or everything) from the cache."""
+        if stk_cd is None:
+            self._snapshots.clear()
+            self._refresh_balance = True
+        else:
+            self._snapshots.pop(stk_cd, None)
+
+    def invalidate_position(self) -> None:
+        """Force the next position part to refetch the account balance (e.g. after a fill)."""
+        self._refresh_balance = True
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "tickers": len(self._snapshots),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            "part_fetches": dict(self._part_fetches),
+        }
+
+    # -------------------------------------------
+    # Internals
+    # -------------------------------------------
+
+    def _stale_parts(
+        self,
+        snapshot: MarketSnapshot,
+        parts: tuple,
+        max_age: Optional[float],
+    ) -> list[str]:
+        account = self._account_state.peek()
+        return [
+            part for part in parts
+            if not snapshot.is_fresh(part, max_age if max_age is not None else self.max_age[part])
+            # A fill or balance update published a newer account state
+            or (part == POSITION and account is not None and account.version != snapshot.account_version)
+        ]
+
+    def _store(self, snapshot: MarketSnapshot) -> None:
+        self._snapshots[snapshot.stk_cd] = snapshot
+        self._snapshots.move_to_end(snapshot.stk_cd)
+        while len(self._snapshots) > self.max_entries:
+            evicted, _ = self._snapshots.popitem(last=False)
+            lock = self._locks.get(evicted)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted]
+
+    async def _refresh(
+        self,
+        stk_cd: str,
+        cached: Optional[MarketSnapshot],
+        stale: list[str],
+    ) -> MarketSnapshot:
+        """Fetch the stale parts concurrently and build the next version."""
+        fetchers = {
+            QUOTE: self._fetch_quote,
+            BARS: self._fetch_bars,
+            ORDERBOOK: self._fetch_orderbook,
+            POSITION: self._fetch_position,
+        }
+        results = await asyncio.gather(
+            *(fetchers[part](stk_cd) for part in stale),
+            return_exceptions=True,
+        )
+
+        updates: dict[str, Any] = {}
+        fetched_at = dict(cached.fetched_at) if cached is not None else {}
+        errors = dict(cached.errors) if cached is not None else {}
+        now = time.monotonic()
+
+        for part, result in zip(stale, results):
+            self._part_fetches[part] += 1
+            if isinstance(result, Exception):
+                # Drop the old value rather than pass it off as fresh
+                updates.update(_EMPTY_PARTS[part])
+                fetched_at.pop(part, None)
+                errors[part] = str(result) or type(result).__name__
+                logger.warning("snapshot_part_failed", stk_cd=stk_cd, part=part, error=str(result))
+                continue
+            updates.update(result)
+            fetched_at[part] = now
+            errors.pop(part, None)
+
+        version = self._versions.get(stk_cd, 0) + 1
+        self._versions[stk_cd] = version
+
+        base = cached if cached is not None else MarketSnapshot(
+            stk_cd=stk_cd, version=0, created_at=datetime.now()
+        )
+        return replace(
+            base,
+            version=version,
+            created_at=datetime.now(),
+            fetched_at=MappingProxyType(fetched_at),
+            errors=MappingProxyType(errors),
+            **updates,
+        )
+
+    async def _get_client(self):
+        from app.core.kiwoom_singleton import get_shared_kiwoom_client_async
+
+        return await get_shared_kiwoom_client_async()
+
+    async def _fetch_quote(self, stk_cd: str) -> dict:
+        client = await self._get_client()
+        return {"stock_info": await client.get_stock_info(stk_cd)}
+
+    async def _fetch_bars(self, stk_cd: str) -> dict:
+        from services.compute import get_compute_executor
+
+        client = await self._get_client()
+        chart_df = await client.get_daily_chart_df(stk_cd)
+        bundle = await get_compute_executor().run_frame(build_bar_bundle, chart_df)
+
+        indicators = bundle["indicators"]
+        return {
+            "chart_df": chart_df,
+            "chart_records": tuple(bundle["chart_records"]),
+            "indicators": MappingProxyType(indicators) if indicators is not None else None,
+            "kr_indicators": MappingProxyType(bundle["kr_indicators"]),
+        }
+
+    async def _fetch_orderbook(self, stk_cd: str) -> dict:
+        from agents.tools.kr_market_data import load_kr_orderbook
+
+        client = await self._get_client()
+        orderbook = await load_kr_orderbook(client, stk_cd)
+        return {"orderbook": MappingProxyType(orderbook)}
+
+    async def _fetch_position(self, stk_cd: str) -> dict:
+        balance = await self._get_balance()
+        position, portfolio = _position_from_balance(balance, stk_cd)
+        return {
+            "position": MappingProxyType(position) if position is not None else None,
+            "portfolio": MappingProxyType(portfolio),
+            "account_version": balance.version,
+        }
+
+    async def _get_balance(self) -> Any:
+        """Account state shared by all tickers (and with the trading components)."""
+        refresh, self._refresh_balance = self._refresh_balance, False
+        try:
+            return await self._account_state.get_snapshot(refresh=refresh)
+        except Exception:
+            self._refresh_balance = refresh
+            raise
+
+
+# Singleton instance
+_market_snapshot_service: Optional[MarketSnapshotService] = None
+
+
+def get_market_snapshot_service() -> MarketSnapshotService:
+    """Get or create the market snapshot service singleton."""
+    global _market_snapshot_service
+
+    if _market_snapshot_service is None:
+        from app.config import settings
+
+        _market_snapshot_service = MarketSnapshotService(
+            max_age={
+                QUOTE: settings.MARKET_SNAPSHOT_QUOTE_MAX_AGE,
+                BARS: settings.MARKET_SNAPSHOT_BARS_MAX_AGE,
+                ORDERBOOK: settings.MARKET_SNAPSHOT_ORDERBOOK_MAX_AGE,
+                POSITION: settings.MARKET_SNAPSHOT_POSITION_MAX_AGE,
+            },
+            max_entries=settings.MARKET_SNAPSHOT_MAX_ENTRIES,
+            account_state=get_account_state_service(),
+        )
+
+    return _market_snapshot_service
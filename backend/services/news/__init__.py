@@ -2,13 +2,26 @@
 News Service Module
 
 Provides extensible news search and sentiment analysis capabilities.
-Currently supports Naver News API with caching layer.
+Currently supports Naver News API with caching layer and a per-article
+sentiment cache.
 """
 
+from .article_cache import (
+    ArticleSentiment,
+    ArticleSentimentCache,
+    collapse_duplicates,
+    get_article_sentiment_cache,
+)
 from .base import NewsProvider, NewsArticle, NewsSearchResult, QuotaExceededError, NewsProviderError
 from .naver import NaverNewsProvider
 from .service import NewsService
-from .sentiment import NewsSentimentAnalyzer, NewsSentimentResult, analyze_stock_news_sentiment
+from .sentiment import (
+    NewsSentimentAnalyzer,
+    NewsSentimentResult,
+    SentimentRequest,
+    analyze_stock_news_sentiment,
+    analyze_stocks_news_sentiment,
+)
 
 __all__ = [
     "NewsProvider",
@@ -20,5 +33,11 @@ __all__ = [
     "NewsService",
     "NewsSentimentAnalyzer",
     "NewsSentimentResult",
+    "SentimentRequest",
     "analyze_stock_news_sentiment",
+    "analyze_stocks_news_sentiment",
+    "ArticleSentiment",
+    "ArticleSentimentCache",
+    "collapse_duplicates",
+    "get_article_sentiment_cache",
 ]
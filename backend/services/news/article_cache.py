@@ -0,0 +1,236 @@
+"""
+Article Sentiment Cache
+
+Per-article sentiment scores keyed by stock and article identity, so an
+article is scored once per stock no matter how many analyses include it
+(the score is the article's impact on that stock, so stocks sharing a
+story are scored separately).
+
+- article_key(): hash of the canonical URL (original link preferred),
+  falling back to a hash of the normalized title + description
+- collapse_duplicates(): groups near-duplicate articles (one story
+  syndicated by several outlets) by title bigram similarity
+- ArticleSentimentCache: LRU + TTL store of ArticleSentiment results,
+  keyed by (stock, article key)
+
+Usage:
+    cache = get_article_sentiment_cache()
+    clusters = collapse_duplicates(articles)
+    cached = cache.get("005930", article_key(clusters[0].article))
+"""
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import structlog
+from pydantic import BaseModel, Field
+
+from .base import NewsArticle
+
+logger = structlog.get_logger()
+
+
+# Title prefixes/suffixes that differ between syndicated copies
+_TAG_PATTERN = re.compile(r"\[[^\]]*\]|\([^)]*\)|【[^】]*】|<[^>]*>")
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+_QUERY_PATTERN = re.compile(r"[?#].*$")
+
+# Bigram Jaccard similarity at which two titles are the same story
+DUPLICATE_THRESHOLD = 0.6
+
+
+class ArticleSentiment(BaseModel):
+    """Sentiment of a single article."""
+    score: int = Field(ge=-100, le=100, description="-100 (very negative) to 100 (very positive)")
+    sentiment: str = Field(default="neutral", description="positive, neutral, or negative")
+    topic: str = Field(default="", description="Short topic label")
+    factor: str = Field(default="", description="Short reason behind the score")
+
+
+@dataclass
+class ArticleCluster:
+    """An article and the number of near-duplicate copies it stands for."""
+    article: NewsArticle
+    count: int = 1
+
+    @property
+    def key(self) -> str:
+        return article_key(self.article)
+
+
+# -------------------------------------------
+# Identity and Deduplication
+# -------------------------------------------
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase title without bracketed tags, punctuation, or spaces."""
+    title = _TAG_PATTERN.sub(" ", title or "")
+    return _NON_WORD_PATTERN.sub("", title).lower()
+
+
+def article_key(article: NewsArticle) -> str:
+    """
+    Stable identity of an article.
+
+    The original publisher URL is preferred over the Naver link; query
+    strings and fragments are ignored. Articles without a URL are keyed by
+    their normalized content.
+    """
+    url = (article.original_link or article.link or "").strip()
+    if url:
+        basis = "url:" + _QUERY_PATTERN.sub("", url).rstrip("/").lower()
+    else:
+        basis = "text:" + normalize_title(article.title) + normalize_title(article.description)
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+def _bigrams(text: str) -> frozenset:
+    if len(text) < 2:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def collapse_duplicates(
+    articles: Iterable[NewsArticle],
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> List[ArticleCluster]:
+    """
+    Collapse duplicate and near-duplicate articles.
+
+    Articles with the same key, or whose normalized titles have a bigram
+    Jaccard similarity >= threshold, join the first (newest, for
+    date-sorted input) article's cluster.
+
+    Returns:
+        Clusters in input order of their representative article
+    """
+    clusters: List[ArticleCluster] = []
+    seen_keys = {}
+    shingles: List[Tuple[frozenset, ArticleCluster]] = []
+
+    for article in articles:
+        key = article_key(article)
+        cluster = seen_keys.get(key)
+
+        if cluster is None:
+            grams = _bigrams(normalize_title(article.title))
+            for other_grams, other in shingles:
+                if _similarity(grams, other_grams) >= threshold:
+                    cluster = other
+                    break
+
+            if cluster is None:
+                cluster = ArticleCluster(article=article, count=0)
+                clusters.append(cluster)
+                shingles.append((grams, cluster))
+            seen_keys[key] = cluster
+
+        cluster.count += 1
+
+    return clusters
+
+
+# -------------------------------------------
+# Cache
+# -------------------------------------------
+
+
+class ArticleSentimentCache:
+    """
+    In-process LRU + TTL cache of per-article sentiment for a stock.
+
+    Shared by every NewsSentimentAnalyzer, so repeated analyses of a stock
+    only score new articles.
+    """
+
+    def __init__(self, ttl: float = 86400.0, max_entries: int = 5000):
+        """
+        Args:
+            ttl: Seconds a score stays valid
+            max_entries: Maximum number of (stock, article) scores kept (LRU)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[ArticleSentiment, float]]" = OrderedDict()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, stock: str, key: str) -> Optional[ArticleSentiment]:
+        """Get an article's cached score for a stock (None if missing or expired)."""
+        key = (stock, key)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, stock: str, key: str, value: ArticleSentiment) -> None:
+        """Store an article's score for a stock."""
+        key = (stock, key)
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached scores."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": f"{(self._hits / total * 100) if total else 0.0:.1f}%",
+        }
+
+
+# Singleton instance
+_article_sentiment_cache: Optional[ArticleSentimentCache] = None
+
+
+def get_article_sentiment_cache() -> ArticleSentimentCache:
+    """Get or create the shared article sentiment cache."""
+    global _article_sentiment_cache
+
+    if _article_sentiment_cache is None:
+        from app.config import settings
+
+        _article_sentiment_cache = ArticleSentimentCache(
+            ttl=settings.NEWS_SENTIMENT_CACHE_TTL,
+            max_entries=settings.NEWS_SENTIMENT_CACHE_MAX_ENTRIES,
+        )
+        logger.info(
+            "article_sentiment_cache_created",
+            ttl=settings.NEWS_SENTIMENT_CACHE_TTL,
+            max_entries=settings.NEWS_SENTIMENT_CACHE_MAX_ENTRIES,
+        )
+
+    return _article_sentiment_cache
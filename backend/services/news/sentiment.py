@@ -3,16 +3,29 @@ News Sentiment Analyzer
 
 LLM-based sentiment analysis for news articles.
 Provides structured sentiment output for integration with trading agents.
+
+Articles are scored one by one and cached per stock (see article_cache),
+so repeated analyses of a stock only send new articles to the LLM.
 """
 
+import asyncio
 import json
 import re
-from typing import List, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 from pydantic import BaseModel, Field
 
 import structlog
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from .article_cache import (
+    ArticleCluster,
+    ArticleSentiment,
+    ArticleSentimentCache,
+    collapse_duplicates,
+    get_article_sentiment_cache,
+)
 from .base import NewsArticle
 
 logger = structlog.get_logger()
@@ -52,6 +65,14 @@ class NewsSentimentResult(BaseModel):
     )
 
 
+@dataclass
+class SentimentRequest:
+    """One stock's articles for batch sentiment analysis."""
+    articles: List[NewsArticle]
+    stock_name: str
+    stock_code: Optional[str] = None
+
+
 class NewsSentimentAnalyzer:
     """
     LLM-based news sentiment analyzer.
@@ -61,38 +82,70 @@ class NewsSentimentAnalyzer:
     - Sentiment score (-100 to 100)
     - Key topics and risk factors
     - Trading recommendation
+
+    Articles are scored individually and cached by stock and article;
+    near-duplicates are collapsed first. Only articles without a cached
+    score are sent to the LLM, and the stock-level result is aggregated
+    from the per-article scores. analyze_batch() scores many stocks in
+    one LLM call.
     """
 
+    MAX_ARTICLES = 15  # Distinct stories per analysis
+    MAX_BATCH_STOCKS = 8  # Stocks packed into one batch prompt
+
     SENTIMENT_PROMPT = """당신은 금융 뉴스 감성 분석 전문가입니다.
-주어진 뉴스 기사들을 분석하여 해당 종목에 대한 시장 심리를 평가하세요.
+주어진 뉴스 기사들을 각각 분석하여 해당 종목에 대한 영향을 평가하세요.
 
 분석 시 고려사항:
-1. 뉴스의 전반적인 톤 (긍정적/중립적/부정적)
+1. 기사의 톤 (긍정적/중립적/부정적)
 2. 주요 이슈 및 테마
-3. 잠재적 리스크 요인
-4. 긍정적 요인 (실적, 신규 계약, 시장 확대 등)
-5. 부정적 요인 (소송, 규제, 실적 악화 등)
+3. 긍정적 요인 (실적, 신규 계약, 시장 확대 등)
+4. 부정적 요인 (소송, 규제, 실적 악화 등)
 
-반드시 다음 JSON 형식으로만 응답하세요 (다른 텍스트 없이):
+반드시 다음 JSON 형식으로만 응답하세요 (다른 텍스트 없이, 모든 기사 포함):
 {
-    "sentiment": "positive" | "neutral" | "negative",
-    "score": -100에서 100 사이의 정수 (부정 ~ 긍정),
-    "confidence": 0.0에서 1.0 사이의 실수,
-    "summary": "2-3문장 요약",
-    "key_topics": ["주요 토픽1", "주요 토픽2"],
-    "risk_factors": ["리스크 요인1"] (있는 경우만),
-    "positive_factors": ["긍정 요인1"] (있는 경우만),
-    "recommendation": "BUY" | "SELL" | "HOLD"
+    "articles": [
+        {
+            "id": 기사 번호,
+            "score": -100에서 100 사이의 정수 (부정 ~ 긍정),
+            "sentiment": "positive" | "neutral" | "negative",
+            "topic": "주요 토픽 (짧게)",
+            "factor": "점수의 근거 (한 구절)"
+        }
+    ]
 }"""
 
-    def __init__(self, llm_provider):
+    BATCH_SENTIMENT_PROMPT = """당신은 금융 뉴스 감성 분석 전문가입니다.
+여러 종목의 뉴스 기사가 [종목 번호]별로 주어집니다. 각 기사를 해당 종목에 미치는 영향 기준으로 평가하세요.
+
+반드시 다음 JSON 형식으로만 응답하세요 (다른 텍스트 없이, 모든 종목과 기사 포함):
+{
+    "stocks": [
+        {
+            "stock": 종목 번호,
+            "articles": [
+                {
+                    "id": 기사 번호,
+                    "score": -100에서 100 사이의 정수 (부정 ~ 긍정),
+                    "sentiment": "positive" | "neutral" | "negative",
+                    "topic": "주요 토픽 (짧게)",
+                    "factor": "점수의 근거 (한 구절)"
+                }
+            ]
+        }
+    ]
+}"""
+
+    def __init__(self, llm_provider, cache: Optional[ArticleSentimentCache] = None):
         """
         Initialize the sentiment analyzer.
 
         Args:
             llm_provider: LLM provider instance for generating analysis
+            cache: Per-article score cache (defaults to the shared cache)
         """
         self.llm = llm_provider
+        self.cache = cache if cache is not None else get_article_sentiment_cache()
 
     async def analyze(
         self,
@@ -124,33 +177,32 @@ class NewsSentimentAnalyzer:
                 recommendation="HOLD",
             )
 
-        # Format articles for LLM
-        articles_text = self._format_articles(articles[:15])  # Limit to 15 articles
-
-        user_prompt = f"""종목: {stock_name}"""
-        if stock_code:
-            user_prompt += f" ({stock_code})"
-        user_prompt += f"\n\n최근 뉴스 ({len(articles)}건):\n{articles_text}"
-
-        messages = [
-            SystemMessage(content=self.SENTIMENT_PROMPT),
-            HumanMessage(content=user_prompt),
-        ]
-
-        try:
-            logger.debug("sentiment_analysis_request", stock_name=stock_name, article_count=len(articles))
-            response = await self.llm.generate(messages)
-            result = self._parse_response(response, stock_name)
-            logger.info(
-                "sentiment_analysis_complete",
-                stock_name=stock_name,
-                sentiment=result.sentiment,
-                score=result.score,
-            )
-            return result
-
-        except Exception as e:
-            logger.error("sentiment_analysis_failed", stock_name=stock_name, error=str(e))
+        stock = stock_code or stock_name
+        clusters, scores, pending = self._prepare(stock, articles)
+
+        response = None
+        if pending:
+            try:
+                logger.debug(
+                    "sentiment_analysis_request",
+                    stock_name=stock_name,
+                    article_count=len(articles),
+                    new_articles=len(pending),
+                )
+                response = await self.llm.generate(
+                    self._build_messages(pending, stock_name, stock_code)
+                )
+                new_scores = self._parse_article_scores(response, len(pending))
+            except Exception as e:
+                logger.error("sentiment_analysis_failed", stock_name=stock_name, error=str(e))
+                new_scores = {}
+
+            self._store_scores(stock, pending, new_scores, scores)
+
+        scored = [(c, scores[c.key]) for c in clusters if c.key in scores]
+        if not scored:
+            if response:
+                return self._create_fallback_result(response, stock_name)
             return NewsSentimentResult(
                 sentiment="neutral",
                 score=0,
@@ -162,6 +214,175 @@ class NewsSentimentAnalyzer:
                 recommendation="HOLD",
             )
 
+        result = self._aggregate(scored, stock_name, len(articles))
+        logger.info(
+            "sentiment_analysis_complete",
+            stock_name=stock_name,
+            sentiment=result.sentiment,
+            score=result.score,
+            articles=len(articles),
+            distinct=len(clusters),
+            cached=len(clusters) - len(pending),
+        )
+        return result
+
+    async def analyze_batch(self, requests: Sequence[SentimentRequest]) -> List[NewsSentimentResult]:
+        """
+        Analyze news sentiment for many stocks with batched LLM calls.
+
+        Uncached articles of up to MAX_BATCH_STOCKS stocks are packed into
+        one prompt with per-stock JSON output. Stocks whose section cannot
+        be parsed fall back to a single-stock analyze() call.
+
+        Args:
+            requests: Articles and stock identity per stock
+
+        Returns:
+            One NewsSentimentResult per request, in order
+        """
+        prepared = [self._prepare(r.stock_code or r.stock_name, r.articles) for r in requests]
+        pending_idx = [i for i, (_, _, pending) in enumerate(prepared) if pending]
+        chunks = [
+            pending_idx[k:k + self.MAX_BATCH_STOCKS]
+            for k in range(0, len(pending_idx), self.MAX_BATCH_STOCKS)
+        ]
+
+        failed: List[int] = []
+        for chunk_failed in await asyncio.gather(
+            *(self._score_batch(chunk, requests, prepared) for chunk in chunks)
+        ):
+            failed.extend(chunk_failed)
+
+        if failed:
+            logger.warning("batch_sentiment_fallback", stocks=len(failed), batch=len(pending_idx))
+
+        fallback = dict(zip(failed, await asyncio.gather(*(
+            self.analyze(requests[i].articles, requests[i].stock_name, requests[i].stock_code)
+            for i in failed
+        ))))
+
+        results = []
+        for i, request in enumerate(requests):
+            if i in fallback:
+                results.append(fallback[i])
+                continue
+
+            clusters, scores, _ = prepared[i]
+            scored = [(c, scores[c.key]) for c in clusters if c.key in scores]
+            if scored:
+                results.append(self._aggregate(scored, request.stock_name, len(request.articles)))
+            else:
+                # No articles at all
+                results.append(await self.analyze([], request.stock_name, request.stock_code))
+
+        logger.info(
+            "batch_sentiment_complete",
+            stocks=len(requests),
+            llm_calls=len(chunks) + len(failed),
+            fallbacks=len(failed),
+        )
+        return results
+
+    async def _score_batch(
+        self,
+        indices: List[int],
+        requests: Sequence[SentimentRequest],
+        prepared: list,
+    ) -> List[int]:
+        """
+        Score the uncached articles of several stocks in one LLM call.
+
+        Returns:
+            Indices of stocks that got no parsed scores
+        """
+        sections = []
+        for n, i in enumerate(indices, 1):
+            request = requests[i]
+            pending = prepared[i][2]
+            header = f"[종목 {n}] {request.stock_name}"
+            if request.stock_code:
+                header += f" ({request.stock_code})"
+            sections.append(
+                f"{header}\n{self._format_articles([c.article for c in pending])}"
+            )
+
+        messages = [
+            SystemMessage(content=self.BATCH_SENTIMENT_PROMPT),
+            HumanMessage(content=f"{len(indices)}개 종목의 뉴스 기사:\n\n" + "\n\n".join(sections)),
+        ]
+
+        try:
+            response = await self.llm.generate(messages)
+            parsed = self._parse_batch_scores(response, [len(prepared[i][2]) for i in indices])
+        except Exception as e:
+            logger.warning("batch_sentiment_failed", stocks=len(indices), error=str(e))
+            return list(indices)
+
+        failed = []
+        for n, i in enumerate(indices, 1):
+            new_scores = parsed.get(n)
+            if not new_scores:
+                failed.append(i)
+                continue
+            _, scores, pending = prepared[i]
+            request = requests[i]
+            self._store_scores(request.stock_code or request.stock_name, pending, new_scores, scores)
+        return failed
+
+    def _prepare(
+        self,
+        stock: str,
+        articles: List[NewsArticle],
+    ) -> Tuple[List[ArticleCluster], Dict[str, ArticleSentiment], List[ArticleCluster]]:
+        """
+        Collapse duplicates and look up the stock's cached scores.
+
+        Returns:
+            (clusters, cached scores by article key, clusters needing a score)
+        """
+        clusters = collapse_duplicates(articles)[:self.MAX_ARTICLES]
+        scores: Dict[str, ArticleSentiment] = {}
+        pending: List[ArticleCluster] = []
+        for cluster in clusters:
+            cached = self.cache.get(stock, cluster.key)
+            if cached is not None:
+                scores[cluster.key] = cached
+            else:
+                pending.append(cluster)
+        return clusters, scores, pending
+
+    def _store_scores(
+        self,
+        stock: str,
+        pending: List[ArticleCluster],
+        new_scores: Dict[int, ArticleSentiment],
+        scores: Dict[str, ArticleSentiment],
+    ) -> None:
+        """Cache a stock's newly parsed scores (numbered 1..len(pending))."""
+        for i, cluster in enumerate(pending, 1):
+            score = new_scores.get(i)
+            if score is not None:
+                self.cache.set(stock, cluster.key, score)
+                scores[cluster.key] = score
+
+    def _build_messages(
+        self,
+        clusters: List[ArticleCluster],
+        stock_name: str,
+        stock_code: Optional[str] = None,
+    ) -> list:
+        """Build the per-article scoring prompt."""
+        user_prompt = f"""종목: {stock_name}"""
+        if stock_code:
+            user_prompt += f" ({stock_code})"
+        articles_text = self._format_articles([c.article for c in clusters])
+        user_prompt += f"\n\n뉴스 기사 ({len(clusters)}건):\n{articles_text}"
+
+        return [
+            SystemMessage(content=self.SENTIMENT_PROMPT),
+            HumanMessage(content=user_prompt),
+        ]
+
     def _format_articles(self, articles: List[NewsArticle]) -> str:
         """Format articles for LLM input."""
         lines = []
@@ -185,50 +406,133 @@ class NewsSentimentAnalyzer:
 
         return "\n".join(lines)
 
-    def _parse_response(self, response: str, stock_name: str) -> NewsSentimentResult:
-        """Parse LLM response into structured result."""
+    def _parse_article_scores(self, response: str, count: int) -> Dict[int, ArticleSentiment]:
+        """
+        Parse per-article scores from an LLM response.
+
+        Returns:
+            Dict of article number (1-based) -> ArticleSentiment; articles
+            missing from the response are left out
+        """
         # Extract JSON from response (handle markdown code blocks)
-        json_match = re.search(r'\{[\s\S]*\}', response)
+        json_match = re.search(r'\{[\s\S]*\}|\[[\s\S]*\]', response)
         if not json_match:
             logger.warning("no_json_in_response", response_preview=response[:200])
-            return self._create_fallback_result(response, stock_name)
+            return {}
 
         try:
             data = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.warning("json_parse_failed", error=str(e), response_preview=response[:200])
+            return {}
 
-            # Validate and extract fields with defaults
-            sentiment = data.get("sentiment", "neutral")
-            if sentiment not in ("positive", "neutral", "negative"):
-                sentiment = "neutral"
-
-            score = data.get("score", 0)
-            if not isinstance(score, (int, float)):
-                score = 0
-            score = max(-100, min(100, int(score)))
+        items = data.get("articles", []) if isinstance(data, dict) else data
+        return parse_article_items(items, count)
 
-            confidence = data.get("confidence", 0.5)
-            if not isinstance(confidence, (int, float)):
-                confidence = 0.5
-            confidence = max(0.0, min(1.0, float(confidence)))
+    def _parse_batch_scores(
+        self,
+        response: str,
+        counts: List[int],
+    ) -> Dict[int, Dict[int, ArticleSentiment]]:
+        """
+        Parse per-stock article scores from a batch response.
 
-            recommendation = data.get("recommendation", "HOLD")
-            if recommendation not in ("BUY", "SELL", "HOLD"):
-                recommendation = "HOLD"
+        Args:
+            response: LLM response
+            counts: Number of articles per stock section
 
-            return NewsSentimentResult(
-                sentiment=sentiment,
-                score=score,
-                confidence=confidence,
-                summary=data.get("summary", f"{stock_name} 뉴스 분석 완료"),
-                key_topics=data.get("key_topics", [])[:5],
-                risk_factors=data.get("risk_factors", [])[:5],
-                positive_factors=data.get("positive_factors", [])[:5],
-                recommendation=recommendation,
-            )
+        Returns:
+            Dict of stock number (1-based) -> article scores; stocks
+            missing from the response are left out
+        """
+        json_match = re.search(r'\{[\s\S]*\}', response)
+        if not json_match:
+            logger.warning("no_json_in_batch_response", response_preview=response[:200])
+            return {}
 
+        try:
+            data = json.loads(json_match.group())
         except json.JSONDecodeError as e:
-            logger.warning("json_parse_failed", error=str(e), response_preview=response[:200])
-            return self._create_fallback_result(response, stock_name)
+            logger.warning("batch_json_parse_failed", error=str(e), response_preview=response[:200])
+            return {}
+
+        parsed: Dict[int, Dict[int, ArticleSentiment]] = {}
+        stocks = data.get("stocks", []) if isinstance(data, dict) else []
+        for stock in stocks if isinstance(stocks, list) else []:
+            if not isinstance(stock, dict):
+                continue
+            try:
+                n = int(stock.get("stock"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= n <= len(counts):
+                scores = parse_article_items(stock.get("articles"), counts[n - 1])
+                if scores:
+                    parsed[n] = scores
+        return parsed
+
+    def _aggregate(
+        self,
+        scored: List[Tuple[ArticleCluster, ArticleSentiment]],
+        stock_name: str,
+        article_count: int,
+    ) -> NewsSentimentResult:
+        """
+        Combine per-article scores into the stock-level result.
+
+        Each story is weighted by its number of near-duplicate copies.
+        """
+        total_weight = sum(c.count for c, _ in scored)
+        score = round(sum(s.score * c.count for c, s in scored) / total_weight)
+
+        if score >= 20:
+            sentiment = "positive"
+        elif score <= -20:
+            sentiment = "negative"
+        else:
+            sentiment = "neutral"
+
+        if score >= 30:
+            recommendation = "BUY"
+        elif score <= -30:
+            recommendation = "SELL"
+        else:
+            recommendation = "HOLD"
+
+        # Confidence grows with coverage and agreement between articles
+        agreeing = sum(c.count for c, s in scored if s.sentiment == sentiment)
+        coverage = min(1.0, len(scored) / 10)
+        confidence = round(0.3 + 0.6 * coverage * (agreeing / total_weight), 2)
+
+        topics = Counter()
+        for c, s in scored:
+            if s.topic:
+                topics[s.topic] += c.count
+
+        by_score = sorted(scored, key=lambda pair: pair[1].score)
+        positive_factors = [s.factor for _, s in reversed(by_score) if s.score > 0 and s.factor]
+        risk_factors = [s.factor for _, s in by_score if s.score < 0 and s.factor]
+
+        counts = Counter(s.sentiment for _, s in scored)
+        summary = (
+            f"{stock_name} 최근 뉴스 {article_count}건 (중복 제외 {len(scored)}건): "
+            f"긍정 {counts['positive']}건, 중립 {counts['neutral']}건, 부정 {counts['negative']}건, "
+            f"평균 감성 점수 {score:+d}."
+        )
+        strongest = max(scored, key=lambda pair: abs(pair[1].score))
+        if strongest[1].score != 0:
+            summary += f" 주요 기사: {strongest[0].article.title.strip()}"
+
+        return NewsSentimentResult(
+            sentiment=sentiment,
+            score=score,
+            confidence=confidence,
+            summary=summary,
+            key_topics=[topic for topic, _ in topics.most_common(5)],
+            risk_factors=risk_factors[:5],
+            positive_factors=positive_factors[:5],
+            recommendation=recommendation,
+        )
 
     def _create_fallback_result(self, response: str, stock_name: str) -> NewsSentimentResult:
         """Create fallback result when JSON parsing fails."""
@@ -259,6 +563,50 @@ class NewsSentimentAnalyzer:
         )
 
 
+def parse_article_items(items, count: int) -> Dict[int, ArticleSentiment]:
+    """
+    Validate per-article score items from an LLM response.
+
+    Args:
+        items: List of {"id", "score", "sentiment", "topic", "factor"} dicts
+        count: Number of articles in the prompt (ids are 1..count)
+
+    Returns:
+        Dict of article number -> ArticleSentiment
+    """
+    scores: Dict[int, ArticleSentiment] = {}
+    if not isinstance(items, list):
+        return scores
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        try:
+            article_id = int(item.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if not 1 <= article_id <= count:
+            continue
+
+        score = item.get("score", 0)
+        if not isinstance(score, (int, float)):
+            score = 0
+        score = max(-100, min(100, int(score)))
+
+        sentiment = item.get("sentiment")
+        if sentiment not in ("positive", "neutral", "negative"):
+            sentiment = "positive" if score >= 20 else "negative" if score <= -20 else "neutral"
+
+        scores[article_id] = ArticleSentiment(
+            score=score,
+            sentiment=sentiment,
+            topic=str(item.get("topic") or "")[:40],
+            factor=str(item.get("factor") or "")[:80],
+        )
+
+    return scores
+
+
 async def analyze_stock_news_sentiment(
     stock_name: str,
     stock_code: str,
@@ -313,3 +661,63 @@ async def analyze_stock_news_sentiment(
             positive_factors=[],
             recommendation="HOLD",
         )
+
+
+async def analyze_stocks_news_sentiment(
+    stocks: Sequence[Tuple[str, str]],
+    news_service,
+    llm_provider,
+    article_count: int = 10,
+) -> Dict[str, NewsSentimentResult]:
+    """
+    Fetch news and analyze sentiment for many stocks with batched LLM calls.
+
+    Args:
+        stocks: (stock_code, stock_name) pairs
+        news_service: NewsService instance
+        llm_provider: LLM provider instance
+        article_count: Number of articles to fetch per stock
+
+    Returns:
+        Dict mapping stock code to NewsSentimentResult
+    """
+    searches = await asyncio.gather(
+        *(
+            news_service.search_stock_news(
+                stock_code=stock_code,
+                stock_name=stock_name,
+                count=article_count,
+            )
+            for stock_code, stock_name in stocks
+        ),
+        return_exceptions=True,
+    )
+
+    results: Dict[str, NewsSentimentResult] = {}
+    requests: List[SentimentRequest] = []
+    for (stock_code, stock_name), search in zip(stocks, searches):
+        if isinstance(search, BaseException):
+            logger.error(
+                "stock_news_sentiment_failed",
+                stock_name=stock_name,
+                stock_code=stock_code,
+                error=str(search),
+            )
+            results[stock_code] = NewsSentimentResult(
+                sentiment="neutral",
+                score=0,
+                confidence=0.2,
+                summary=f"{stock_name} 뉴스 조회 실패",
+                key_topics=[],
+                risk_factors=[],
+                positive_factors=[],
+                recommendation="HOLD",
+            )
+        else:
+            requests.append(SentimentRequest(search.articles, stock_name, stock_code))
+
+    analyzer = NewsSentimentAnalyzer(llm_provider)
+    for request, result in zip(requests, await analyzer.analyze_batch(requests)):
+        results[request.stock_code] = result
+
+    return results
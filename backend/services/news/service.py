@@ -3,10 +3,14 @@ News Service
 
 Aggregates multiple news providers with automatic fallback support.
 Provides unified interface for news search across all providers.
+
+Provider quotas are read at most once per QUOTA_REFRESH_SECONDS and
+tracked locally in between, instead of a quota lookup before every search.
 """
 
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
 from .base import (
     NewsProvider,
@@ -27,6 +31,7 @@ class NewsService:
     - Automatic fallback on quota exhaustion
     - Provider prioritization
     - Usage statistics
+    - Batched quota checks (local estimate, periodic refresh)
 
     Example:
         service = NewsService()
@@ -39,10 +44,15 @@ class NewsService:
         quotas = await service.get_quota_status()
     """
 
+    # Seconds a provider's quota reading is trusted before re-reading it
+    QUOTA_REFRESH_SECONDS = 60.0
+
     def __init__(self):
         self.providers: Dict[str, NewsProvider] = {}
         self.primary_provider: Optional[str] = None
         self._fallback_order: List[str] = []
+        # provider name -> (estimated remaining, read at)
+        self._quota: Dict[str, Tuple[int, float]] = {}
 
     def register_provider(
         self,
@@ -120,8 +130,8 @@ class NewsService:
             news_provider = self.providers[provider_name]
 
             try:
-                # Check quota before attempting
-                remaining = await news_provider.get_remaining_quota()
+                # Check quota before attempting (local estimate)
+                remaining = await self._remaining_quota(news_provider)
                 if remaining == 0:
                     logger.warning(
                         f"[NewsService] {provider_name} quota exhausted, "
@@ -130,10 +140,13 @@ class NewsService:
                     continue
 
                 result = await news_provider.search(query, count, sort)
+                if not result.cached:
+                    self._consume_quota(provider_name)
                 return result
 
             except QuotaExceededError as e:
                 logger.warning(f"[NewsService] {provider_name}: {e}")
+                self._quota[provider_name] = (0, time.monotonic())
                 errors.append(str(e))
                 continue
 
@@ -186,7 +199,7 @@ class NewsService:
         status = {}
 
         for name, provider in self.providers.items():
-            remaining = await provider.get_remaining_quota()
+            remaining = await self._remaining_quota(provider, refresh=True)
             status[name] = {
                 "daily_limit": provider.daily_limit,
                 "remaining": remaining,
@@ -205,11 +218,38 @@ class NewsService:
         """
         total = 0
         for provider in self.providers.values():
-            remaining = await provider.get_remaining_quota()
+            remaining = await self._remaining_quota(provider)
             if remaining > 0:
                 total += remaining
         return total
 
+    async def _remaining_quota(self, provider: NewsProvider, refresh: bool = False) -> int:
+        """
+        Get a provider's remaining quota, reading it at most once per
+        QUOTA_REFRESH_SECONDS.
+
+        Args:
+            provider: News provider
+            refresh: Force a fresh reading
+
+        Returns:
+            Estimated remaining calls, or -1 if unlimited
+        """
+        now = time.monotonic()
+        cached = self._quota.get(provider.name)
+        if not refresh and cached is not None and now - cached[1] < self.QUOTA_REFRESH_SECONDS:
+            return cached[0]
+
+        remaining = await provider.get_remaining_quota()
+        self._quota[provider.name] = (remaining, now)
+        return remaining
+
+    def _consume_quota(self, provider_name: str) -> None:
+        """Count one API call against the local quota estimate."""
+        cached = self._quota.get(provider_name)
+        if cached is not None and cached[0] > 0:
+            self._quota[provider_name] = (cached[0] - 1, cached[1])
+
     def _get_fallback_order(self) -> List[str]:
         """Get provider fallback order with primary first."""
         order = []
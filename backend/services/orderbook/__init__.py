@@ -0,0 +1,18 @@
+"""
+Order Book
+
+In-memory L2 order books fed by the Upbit and Kiwoom orderbook streams,
+with incrementally maintained metrics (spread, microprice, depth,
+imbalance). The books themselves are held by the realtime services that
+own the streams (services.realtime_service, services.kr_realtime_service).
+"""
+
+from services.orderbook.book import ASK, BID, BookMetrics, Level, OrderBook
+
+__all__ = [
+    "ASK",
+    "BID",
+    "BookMetrics",
+    "Level",
+    "OrderBook",
+]
@@ -0,0 +1,253 @@
+"""
+L2 Order Book
+
+Price-level order book for one symbol, kept current from an exchange
+orderbook stream (Upbit orderbook, Kiwoom 주식호가잔량 0D). Both exchanges
+stream the top levels as full snapshots; apply_snapshot() turns each one
+into level updates, so only the levels that changed are touched.
+
+Totals are maintained per update; the remaining metrics (spread,
+microprice, depth and imbalance over the top N levels) are computed at most
+once per book version, however often they are read.
+"""
+
+import time
+from bisect import bisect_left, insort
+from dataclasses import asdict, dataclass
+from typing import Iterable, Optional
+
+# (price, size)
+Level = tuple[float, float]
+
+BID = "bid"
+ASK = "ask"
+
+
+@dataclass(frozen=True, slots=True)
+class BookMetrics:
+    """Metrics derived from the top `levels` levels of a book."""
+    best_bid: Optional[float]
+    best_ask: Optional[float]
+    spread: Optional[float]
+    spread_bps: Optional[float]  # spread / mid price, in basis points
+    mid_price: Optional[float]
+    microprice: Optional[float]  # mid price weighted by the opposite top-level size
+    bid_depth: float
+    ask_depth: float
+    imbalance: float  # (bid_depth - ask_depth) / (bid_depth + ask_depth), -1..1
+    levels: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Side:
+    """One side of the book: size per price plus the prices in sorted order."""
+
+    __slots__ = ("descending", "sizes", "prices", "total")
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self.sizes: dict[float, float] = {}
+        self.prices: list[float] = []  # ascending
+        self.total = 0.0
+
+    def set(self, price: float, size: float) -> bool:
+        """Set a level (size <= 0 removes it). Returns True if it changed."""
+        old = self.sizes.get(price)
+        if size <= 0:
+            if old is None:
+                return False
+            del self.sizes[price]
+            del self.prices[bisect_left(self.prices, price)]
+            self.total -= old
+            return True
+
+        if old == size:
+            return False
+        if old is None:
+            insort(self.prices, price)
+            old = 0.0
+        self.sizes[price] = size
+        self.total += size - old
+        return True
+
+    def top(self, n: Optional[int] = None) -> list[Level]:
+        """Best n levels, best first."""
+        count = len(self.prices) if n is None else min(n, len(self.prices))
+        if self.descending:
+            prices = self.prices[len(self.prices) - count:][::-1]
+        else:
+            prices = self.prices[:count]
+        return [(price, self.sizes[price]) for price in prices]
+
+    def clear(self) -> None:
+        self.sizes.clear()
+        self.prices.clear()
+        self.total = 0.0
+
+
+class OrderBook:
+    """
+    L2 order book for one symbol.
+
+    Usage:
+        book = OrderBook("KRW-BTC", depth_levels=5)
+        book.apply_snapshot(bids=[(99.0, 2.0)], asks=[(101.0, 1.0)])
+        book.update(BID, 99.5, 3.0)
+        book.metrics().imbalance
+    """
+
+    def __init__(self, symbol: str, depth_levels: int = 5):
+        """
+        Args:
+            symbol: Market or stock code
+            depth_levels: Levels used for depth and imbalance by default
+        """
+        self.symbol = symbol
+        self.depth_levels = depth_levels
+        self.version = 0
+        self.timestamp: Optional[int] = None  # exchange time of the last update (ms)
+        self.updated_at: Optional[float] = None  # monotonic time of the last update
+
+        self._sides = {BID: _Side(descending=True), ASK: _Side(descending=False)}
+        # Totals reported by the exchange (they may cover more levels than streamed)
+        self._reported_totals: dict[str, Optional[float]] = {BID: None, ASK: None}
+        self._metrics: Optional[tuple[int, int, BookMetrics]] = None
+
+    # -------------------------------------------
+    # Updates
+    # -------------------------------------------
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Level],
+        asks: Iterable[Level],
+        total_bid_size: Optional[float] = None,
+        total_ask_size: Optional[float] = None,
+        timestamp: Optional[int] = None,
+    ) -> None:
+        """
+        Replace the book with a full snapshot of its top levels.
+
+        Args:
+            bids: Bid levels (any order)
+            asks: Ask levels (any order)
+            total_bid_size: Exchange-reported total bid size (default: sum of levels)
+            total_ask_size: Exchange-reported total ask size (default: sum of levels)
+            timestamp: Exchange timestamp (ms)
+        """
+        changed = False
+        for side_name, levels in ((BID, bids), (ASK, asks)):
+            side = self._sides[side_name]
+            incoming = {price: size for price, size in levels if price > 0 and size > 0}
+            for price in [p for p in side.sizes if p not in incoming]:
+                changed |= side.set(price, 0.0)
+            for price, size in incoming.items():
+                changed |= side.set(price, size)
+
+        totals = {BID: total_bid_size, ASK: total_ask_size}
+        if totals != self._reported_totals:
+            self._reported_totals = totals
+            changed = True
+
+        self._touch(changed, timestamp)
+
+    def update(self, side: str, price: float, size: float, timestamp: Optional[int] = None) -> None:
+        """Apply one level update (size <= 0 removes the level)."""
+        self._touch(self._sides[side].set(price, size), timestamp)
+
+    def clear(self) -> None:
+        """Drop all levels (e.g. after a stream gap)."""
+        for side in self._sides.values():
+            side.clear()
+        self._reported_totals = {BID: None, ASK: None}
+        self._touch(True, None)
+        self.updated_at = None
+
+    def _touch(self, changed: bool, timestamp: Optional[int]) -> None:
+        if changed:
+            self.version += 1
+        if timestamp is not None:
+            self.timestamp = timestamp
+        self.updated_at = time.monotonic()
+
+    # -------------------------------------------
+    # Reads
+    # -------------------------------------------
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self._sides[BID].prices or self._sides[ASK].prices)
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last update, or None if never updated."""
+        if self.updated_at is None:
+            return None
+        return time.monotonic() - self.updated_at
+
+    def bids(self, n: Optional[int] = None) -> list[Level]:
+        """Best n bid levels, highest first."""
+        return self._sides[BID].top(n)
+
+    def asks(self, n: Optional[int] = None) -> list[Level]:
+        """Best n ask levels, lowest first."""
+        return self._sides[ASK].top(n)
+
+    @property
+    def total_bid_size(self) -> float:
+        reported = self._reported_totals[BID]
+        return self._sides[BID].total if reported is None else reported
+
+    @property
+    def total_ask_size(self) -> float:
+        reported = self._reported_totals[ASK]
+        return self._sides[ASK].total if reported is None else reported
+
+    def depth(self, side: str, levels: Optional[int] = None) -> float:
+        """Size resting in the best `levels` levels of one side."""
+        top = self._sides[side].top(levels or self.depth_levels)
+        return sum(size for _, size in top)
+
+    def metrics(self, levels: Optional[int] = None) -> BookMetrics:
+        """Derived metrics over the best `levels` levels (cached per version)."""
+        levels = levels or self.depth_levels
+        cached = self._metrics
+        if cached is not None and cached[0] == self.version and cached[1] == levels:
+            return cached[2]
+
+        metrics = self._compute_metrics(levels)
+        self._metrics = (self.version, levels, metrics)
+        return metrics
+
+    def _compute_metrics(self, levels: int) -> BookMetrics:
+        bids = self.bids(levels)
+        asks = self.asks(levels)
+        bid_depth = sum(size for _, size in bids)
+        ask_depth = sum(size for _, size in asks)
+        total_depth = bid_depth + ask_depth
+        imbalance = (bid_depth - ask_depth) / total_depth if total_depth > 0 else 0.0
+
+        best_bid = bids[0][0] if bids else None
+        best_ask = asks[0][0] if asks else None
+        spread = spread_bps = mid_price = microprice = None
+        if best_bid is not None and best_ask is not None:
+            bid_size, ask_size = bids[0][1], asks[0][1]
+            spread = best_ask - best_bid
+            mid_price = (best_bid + best_ask) / 2
+            spread_bps = spread / mid_price * 10_000
+            microprice = (best_ask * bid_size + best_bid * ask_size) / (bid_size + ask_size)
+
+        return BookMetrics(
+            best_bid=best_bid,
+            best_ask=best_ask,
+            spread=spread,
+            spread_bps=spread_bps,
+            mid_price=mid_price,
+            microprice=microprice,
+            bid_depth=bid_depth,
+            ask_depth=ask_depth,
+            imbalance=imbalance,
+            levels=levels,
+        )
@@ -7,19 +7,31 @@ market data to connected frontend clients.
 This service acts as a bridge between:
 - Upbit WebSocket (data source)
 - Frontend WebSocket clients (data consumers)
+
+It also builds candles from the trade stream (services.upbit.candle_builder)
+so candle reads are served from memory after a one-time REST seed, and keeps
+L2 order books (services.orderbook) current from the orderbook stream.
 """
 
 import asyncio
-from typing import Callable, Optional
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Optional
 
 import structlog
 
-from services.upbit import (
-    UpbitWebSocketClient,
-    WebSocketOrderbook,
-    WebSocketTicker,
-    WebSocketTrade,
-)
+from services.orderbook import BookMetrics, OrderBook
+from services.stream_codec import StreamMessage
+from services.tick_recorder import get_running_tick_recorder
+from services.upbit import OrderbookFrame, TickerFrame, TradeFrame, UpbitWebSocketClient
+from services.upbit.candle_builder import BACKFILL_COUNT, CANDLE_INTERVALS, Bar, CandleBuilder
+from services.upbit.history import fetch_candle_history
+from services.upbit.models import Orderbook, OrderbookUnit
+
+if TYPE_CHECKING:
+    from services.upbit import UpbitClient
+    from services.upbit.models import CoinAnalysisData
 
 logger = structlog.get_logger()
 
@@ -35,12 +47,26 @@ async def get_realtime_service() -> "RealtimeService":
     """Get or create the singleton realtime service instance."""
     global _realtime_service
     if _realtime_service is None:
-        _realtime_service = RealtimeService()
+        from app.config import settings
+
+        _realtime_service = RealtimeService(
+            candle_capacity=settings.UPBIT_CANDLE_BUFFER_SIZE,
+            candle_max_markets=settings.UPBIT_CANDLE_MAX_MARKETS,
+            orderbook_max_markets=settings.ORDERBOOK_MAX_SYMBOLS,
+            orderbook_depth_levels=settings.ORDERBOOK_DEPTH_LEVELS,
+            orderbook_max_age=settings.ORDERBOOK_MAX_AGE,
+            upbit_ws_url=settings.UPBIT_WS_URL,
+        )
         # Auto-start the service when first accessed
         await _realtime_service.start()
     return _realtime_service
 
 
+def get_running_realtime_service() -> Optional["RealtimeService"]:
+    """Get the realtime service only if it already exists (never starts it)."""
+    return _realtime_service
+
+
 async def close_realtime_service() -> None:
     """Close the realtime service and clean up resources."""
     global _realtime_service
@@ -83,8 +109,29 @@ class RealtimeService:
         service.unsubscribe_ticker(["KRW-BTC"], callback)
     """
 
-    def __init__(self):
+    # How long held daily candles are reused before being refetched
+    DAILY_CANDLE_TTL = 300.0
+
+    def __init__(
+        self,
+        candle_capacity: int = 1000,
+        candle_max_markets: int = 30,
+        orderbook_max_markets: int = 20,
+        orderbook_depth_levels: int = 5,
+        orderbook_max_age: float = 30.0,
+        upbit_ws_url: Optional[str] = None,
+    ):
+        """
+        Args:
+            candle_capacity: Bars kept per market and candle interval
+            candle_max_markets: Markets with built candles (least recently read dropped)
+            orderbook_max_markets: Markets with streamed order books (least recently read dropped)
+            orderbook_depth_levels: Levels used for order book depth and imbalance
+            orderbook_max_age: Seconds without an update before a book is reseeded
+            upbit_ws_url: Upbit WebSocket endpoint override (default: api.upbit.com)
+        """
         self._upbit_ws: Optional[UpbitWebSocketClient] = None
+        self._upbit_ws_url = upbit_ws_url
         self._running = False
         self._run_task: Optional[asyncio.Task] = None
 
@@ -97,6 +144,22 @@ class RealtimeService:
         self._latest_tickers: dict[str, dict] = {}
         self._latest_trades: dict[str, dict] = {}
 
+        # Daily candles held for analysis reuse: market -> (stored_at, candles newest first)
+        self._daily_candles: dict[str, tuple[float, list[dict]]] = {}
+
+        # Candles built from trades: markets in read order, pending REST seeds
+        self._candles = CandleBuilder(capacity=candle_capacity)
+        self._candle_max_markets = candle_max_markets
+        self._candle_markets: OrderedDict[str, None] = OrderedDict()
+        self._candle_seeds: dict[tuple[str, str], asyncio.Task] = {}
+        self._connected_once = False
+
+        # L2 order books fed by the orderbook stream, in read order
+        self._orderbooks: OrderedDict[str, OrderBook] = OrderedDict()
+        self._orderbook_max_markets = orderbook_max_markets
+        self._orderbook_depth_levels = orderbook_depth_levels
+        self._orderbook_max_age = orderbook_max_age
+
     async def start(self) -> None:
         """Start the realtime service and connect to Upbit WebSocket."""
         if self._running:
@@ -107,12 +170,19 @@ class RealtimeService:
         self._upbit_ws = UpbitWebSocketClient(
             reconnect=True,
             max_reconnect_attempts=0,  # Infinite reconnect
+            url=self._upbit_ws_url,
         )
 
         # Register internal callbacks
         self._upbit_ws.on_ticker(self._handle_ticker)
         self._upbit_ws.on_trade(self._handle_trade)
+        self._upbit_ws.on_orderbook(self._handle_orderbook)
         self._upbit_ws.on_error(self._handle_error)
+        self._upbit_ws.on_connect(self._handle_connect)
+
+        recorder = get_running_tick_recorder()
+        if recorder:
+            recorder.attach_upbit(self._upbit_ws)
 
         try:
             await self._upbit_ws.connect()
@@ -135,6 +205,10 @@ class RealtimeService:
                 pass
             self._run_task = None
 
+        for task in self._candle_seeds.values():
+            task.cancel()
+        self._candle_seeds.clear()
+
         if self._upbit_ws:
             await self._upbit_ws.disconnect()
             self._upbit_ws = None
@@ -252,7 +326,9 @@ class RealtimeService:
 
                 if not self._trade_callbacks[market]:
                     del self._trade_callbacks[market]
-                    removed_markets.append(market)
+                    # Candle building keeps the trade stream open
+                    if market not in self._candle_markets:
+                        removed_markets.append(market)
 
         if removed_markets and self._upbit_ws:
             await self._upbit_ws.unsubscribe_trade(removed_markets)
@@ -285,25 +361,26 @@ class RealtimeService:
     # Data Handlers
     # -------------------------------------------
 
-    def _handle_ticker(self, ticker: WebSocketTicker) -> None:
+    def _handle_ticker(self, ticker: TickerFrame) -> None:
         """Handle incoming ticker data from Upbit WebSocket."""
-        market = ticker.code
-
-        # Convert to dict for serialization
-        ticker_data = {
-            "type": "ticker",
-            "market": market,
-            "trade_price": ticker.trade_price,
-            "change": ticker.change.value,
-            "change_rate": ticker.signed_change_rate * 100,
-            "change_price": ticker.signed_change_price,
-            "high_price": ticker.high_price,
-            "low_price": ticker.low_price,
-            "acc_trade_volume_24h": ticker.acc_trade_volume_24h,
-            "acc_trade_price_24h": ticker.acc_trade_price_24h,
-            "trade_timestamp": ticker.trade_timestamp,
-            "stream_type": ticker.stream_type.value,
-        }
+        raw = ticker.raw
+        market = raw["code"]
+
+        # Broadcast message; encoded once for all clients (see StreamMessage)
+        ticker_data = StreamMessage(
+            type="ticker",
+            market=market,
+            trade_price=raw["trade_price"],
+            change=raw["change"],
+            change_rate=raw["signed_change_rate"] * 100,
+            change_price=raw["signed_change_price"],
+            high_price=raw["high_price"],
+            low_price=raw["low_price"],
+            acc_trade_volume_24h=raw["acc_trade_volume_24h"],
+            acc_trade_price_24h=raw["acc_trade_price_24h"],
+            trade_timestamp=raw["trade_timestamp"],
+            stream_type=raw["stream_type"],
+        )
 
         # Cache latest data
         self._latest_tickers[market] = ticker_data
@@ -320,20 +397,23 @@ class RealtimeService:
                     error=str(e),
                 )
 
-    def _handle_trade(self, trade: WebSocketTrade) -> None:
+    def _handle_trade(self, trade: TradeFrame) -> None:
         """Handle incoming trade data from Upbit WebSocket."""
-        market = trade.code
-
-        trade_data = {
-            "type": "trade",
-            "market": market,
-            "trade_price": trade.trade_price,
-            "trade_volume": trade.trade_volume,
-            "ask_bid": trade.ask_bid.value,
-            "trade_timestamp": trade.trade_timestamp,
-            "sequential_id": trade.sequential_id,
-            "stream_type": trade.stream_type.value,
-        }
+        raw = trade.raw
+        market = raw["code"]
+
+        self._candles.add_trade(market, raw["trade_price"], raw["trade_volume"], raw["trade_timestamp"])
+
+        trade_data = StreamMessage(
+            type="trade",
+            market=market,
+            trade_price=raw["trade_price"],
+            trade_volume=raw["trade_volume"],
+            ask_bid=raw["ask_bid"],
+            trade_timestamp=raw["trade_timestamp"],
+            sequential_id=raw["sequential_id"],
+            stream_type=raw["stream_type"],
+        )
 
         # Cache latest data
         self._latest_trades[market] = trade_data
@@ -350,10 +430,237 @@ class RealtimeService:
                     error=str(e),
                 )
 
+    def _handle_orderbook(self, orderbook: OrderbookFrame) -> None:
+        """Apply an orderbook snapshot to the market's book."""
+        raw = orderbook.raw
+        book = self._orderbooks.get(raw["code"])
+        if book is None:
+            return
+
+        units = raw["orderbook_units"]
+        book.apply_snapshot(
+            bids=[(u["bid_price"], u["bid_size"]) for u in units],
+            asks=[(u["ask_price"], u["ask_size"]) for u in units],
+            total_bid_size=raw["total_bid_size"],
+            total_ask_size=raw["total_ask_size"],
+            timestamp=raw["timestamp"],
+        )
+
+    async def feed(self, frame: TickerFrame | TradeFrame | OrderbookFrame) -> None:
+        """
+        Apply a frame from outside the stream, e.g. a recorded session
+        (services.tick_recorder). Orderbook frames start a book for their market.
+        """
+        if isinstance(frame, TickerFrame):
+            self._handle_ticker(frame)
+        elif isinstance(frame, TradeFrame):
+            self._handle_trade(frame)
+        elif isinstance(frame, OrderbookFrame):
+            market = frame.raw["code"]
+            if market not in self._orderbooks:
+                await self._track_orderbook(market)
+            self._handle_orderbook(frame)
+
     def _handle_error(self, error: Exception) -> None:
         """Handle WebSocket errors."""
         logger.error("upbit_websocket_error", error=str(error))
 
+    def _handle_connect(self) -> None:
+        """Updates were missed while reconnecting; reseed candles and books on next read."""
+        if self._connected_once and self._candle_markets:
+            self._candles.invalidate()
+            logger.info("candle_buffers_invalidated", markets=len(self._candle_markets))
+        if self._connected_once:
+            for book in self._orderbooks.values():
+                book.clear()
+        self._connected_once = True
+
+    # -------------------------------------------
+    # Candles
+    # -------------------------------------------
+
+    async def get_candles(
+        self,
+        client: "UpbitClient",
+        market: str,
+        interval: str,
+        count: int,
+    ) -> Optional[list[Bar]]:
+        """
+        Get candles built from the trade stream (newest first).
+
+        The first read of a market starts its trade stream and each interval
+        is seeded once from REST (deeper if a read needs more than the seed
+        holds); later reads make no REST call.
+
+        Args:
+            client: Upbit client for the one-time REST seed
+            market: Market code
+            interval: Candle interval (see CANDLE_INTERVALS)
+            count: Number of candles
+
+        Returns:
+            Bars with Upbit candle field names, or None if they cannot be
+            served from memory (unsupported interval, stream down, more than
+            the buffer holds, seed failed)
+        """
+        if (
+            interval not in CANDLE_INTERVALS
+            or count > self._candles.capacity
+            or not self.is_connected
+        ):
+            return None
+
+        market = market.upper()
+        await self._track_candles(market)
+
+        bars = self._candles.get(market, interval, count)
+        if bars is None:
+            try:
+                await self._seed_candles(client, market, interval, count)
+            except Exception as e:
+                logger.warning("candle_seed_failed", market=market, interval=interval, error=str(e))
+                return None
+            bars = self._candles.get(market, interval, count)
+
+        return bars
+
+    async def _track_candles(self, market: str) -> None:
+        """Start building candles for a market (dropping the least recently read)."""
+        if market in self._candle_markets:
+            self._candle_markets.move_to_end(market)
+            return
+
+        while len(self._candle_markets) >= self._candle_max_markets:
+            evicted, _ = self._candle_markets.popitem(last=False)
+            self._candles.drop(evicted)
+            if evicted not in self._trade_callbacks and self._upbit_ws:
+                await self._upbit_ws.unsubscribe_trade([evicted])
+
+        self._candle_markets[market] = None
+        self._candles.track(market)
+        if market not in self._trade_callbacks and self._upbit_ws:
+            await self._upbit_ws.subscribe_trade([market])
+        logger.debug("candle_market_tracked", market=market)
+
+    async def _seed_candles(
+        self,
+        client: "UpbitClient",
+        market: str,
+        interval: str,
+        count: int,
+    ) -> None:
+        """Seed one buffer from REST; concurrent readers share the request."""
+        key = (market, interval)
+        task = self._candle_seeds.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_seed(client, market, interval, count))
+            self._candle_seeds[key] = task
+            task.add_done_callback(lambda done: self._seed_done(key, done))
+        await asyncio.shield(task)
+
+    def _seed_done(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        self._candle_seeds.pop(key, None)
+        if not task.cancelled():
+            # Retrieved here so a seed whose readers went away is not logged as unhandled
+            task.exception()
+
+    async def _fetch_seed(self, client: "UpbitClient", market: str, interval: str, count: int) -> None:
+        depth = max(count, BACKFILL_COUNT)
+        candles = await fetch_candle_history(client, market, interval, depth)
+        if self._candles.is_tracked(market):
+            self._candles.seed(market, interval, candles, complete=len(candles) < depth)
+
+    # -------------------------------------------
+    # Order Books
+    # -------------------------------------------
+
+    async def get_orderbook(self, client: "UpbitClient", market: str) -> Optional[Orderbook]:
+        """
+        Get the market's order book from the streamed L2 book.
+
+        The first read of a market starts its orderbook stream and fills
+        the book from one REST snapshot; the stream keeps it current after
+        that, so later reads make no REST call. A book with no update for
+        longer than the max age is treated as missing and reseeded.
+
+        Args:
+            client: Upbit client for the one-time REST snapshot
+            market: Market code
+
+        Returns:
+            Orderbook, or None if the stream is down or the snapshot failed
+        """
+        if not self.is_connected:
+            return None
+
+        market = market.upper()
+        try:
+            book = await self._track_orderbook(market)
+        except Exception as e:
+            logger.warning("orderbook_subscribe_failed", market=market, error=str(e))
+            return None
+        if self._is_stale(book):
+            try:
+                orderbooks = await client.get_orderbook([market])
+            except Exception as e:
+                logger.warning("orderbook_seed_failed", market=market, error=str(e))
+                return None
+            # A streamed snapshot may have arrived while the request was in flight
+            if orderbooks and self._is_stale(book):
+                ob = orderbooks[0]
+                book.apply_snapshot(
+                    bids=[(u.bid_price, u.bid_size) for u in ob.orderbook_units],
+                    asks=[(u.ask_price, u.ask_size) for u in ob.orderbook_units],
+                    total_bid_size=ob.total_bid_size,
+                    total_ask_size=ob.total_ask_size,
+                    timestamp=ob.timestamp,
+                )
+            if self._is_stale(book):
+                return None
+
+        return Orderbook(
+            market=market,
+            timestamp=book.timestamp or 0,
+            total_ask_size=book.total_ask_size,
+            total_bid_size=book.total_bid_size,
+            orderbook_units=[
+                OrderbookUnit(ask_price=ask[0], bid_price=bid[0], ask_size=ask[1], bid_size=bid[1])
+                for ask, bid in zip(book.asks(), book.bids())
+            ],
+        )
+
+    def get_orderbook_metrics(self, market: str, levels: Optional[int] = None) -> Optional[BookMetrics]:
+        """Get metrics of a streamed book (None if the market has no live book)."""
+        book = self._orderbooks.get(market.upper())
+        if book is None or self._is_stale(book) or not self.is_connected:
+            return None
+        return book.metrics(levels)
+
+    def _is_stale(self, book: OrderBook) -> bool:
+        """Whether a book is empty or has gone without updates for too long."""
+        age = book.age
+        return book.is_empty or age is None or age > self._orderbook_max_age
+
+    async def _track_orderbook(self, market: str) -> OrderBook:
+        """Start streaming a market's book (dropping the least recently read)."""
+        book = self._orderbooks.get(market)
+        if book is not None:
+            self._orderbooks.move_to_end(market)
+            return book
+
+        while len(self._orderbooks) >= self._orderbook_max_markets:
+            evicted, _ = self._orderbooks.popitem(last=False)
+            if self._upbit_ws:
+                await self._upbit_ws.unsubscribe_orderbook([evicted])
+
+        if self._upbit_ws:
+            await self._upbit_ws.subscribe_orderbook([market])
+        # A concurrent read may have tracked the market while subscribing
+        book = self._orderbooks.setdefault(market, OrderBook(market, depth_levels=self._orderbook_depth_levels))
+        logger.debug("orderbook_market_tracked", market=market)
+        return book
+
     # -------------------------------------------
     # Utility Methods
     # -------------------------------------------
@@ -362,6 +669,85 @@ class RealtimeService:
         """Get the latest cached ticker for a market."""
         return self._latest_tickers.get(market.upper())
 
+    # -------------------------------------------
+    # Candle Reuse
+    # -------------------------------------------
+
+    def store_daily_candles(self, market: str, candles: list[dict]) -> None:
+        """Hold daily candles (newest first) for later analyses of the same market."""
+        if candles:
+            self._daily_candles[market.upper()] = (time.monotonic(), list(candles))
+
+    def get_daily_candles(self, market: str, count: int) -> Optional[list[dict]]:
+        """
+        Get held daily candles if they are fresh and long enough.
+
+        Today's candle is brought up to date with the latest streamed ticker.
+
+        Args:
+            market: Market code
+            count: Minimum number of candles required
+
+        Returns:
+            Candles (newest first) or None if a REST fetch is needed
+        """
+        market = market.upper()
+        held = self._daily_candles.get(market)
+        if held is None:
+            return None
+
+        stored_at, candles = held
+        if time.monotonic() - stored_at >= self.DAILY_CANDLE_TTL or len(candles) < count:
+            return None
+
+        candles = candles[:count]
+        ticker = self._latest_tickers.get(market)
+        if ticker and candles:
+            # Upbit daily candles start at 00:00 UTC (09:00 KST)
+            trade_date = datetime.fromtimestamp(
+                ticker["trade_timestamp"] / 1000, tz=timezone.utc
+            ).strftime("%Y-%m-%d")
+            today = candles[0]
+            if str(today.get("date", "")).startswith(trade_date):
+                price = ticker["trade_price"]
+                candles[0] = {
+                    **today,
+                    "close": price,
+                    "high": max(today["high"], price),
+                    "low": min(today["low"], price),
+                }
+        return candles
+
+    async def get_analysis_data(
+        self,
+        client: "UpbitClient",
+        market: str,
+        candle_count: int = 100,
+        trade_count: int = 50,
+    ) -> "CoinAnalysisData":
+        """
+        UpbitClient.get_analysis_data() that reuses held daily candles and
+        reads the orderbook from the streamed book.
+
+        Falls back to fetching candles (and holding them) when none are held.
+        """
+        candles = self.get_daily_candles(market, candle_count)
+        orderbook = await self.get_orderbook(client, market)
+        data = await client.get_analysis_data(
+            market,
+            candle_count=candle_count,
+            trade_count=trade_count,
+            candles=candles,
+            orderbook=orderbook,
+        )
+        if candles is None:
+            self.store_daily_candles(market, data.candles)
+
+        metrics = self.get_orderbook_metrics(market)
+        if metrics is not None and data.orderbook is not None:
+            data.orderbook.update(metrics.to_dict())
+        return data
+
     def get_subscribed_markets(self) -> dict[str, int]:
         """Get count of subscribers per market."""
         return {
@@ -0,0 +1,56 @@
+"""
+Stream Codec
+
+JSON decoding/encoding for the market data streams. Uses orjson when it
+is installed (several times faster on ticker-sized frames, and it parses
+the bytes frames Upbit sends without decoding them to str first), falling
+back to the standard json module.
+
+StreamMessage lets one broadcast message be encoded once and the same
+text be sent to every subscribed client.
+"""
+
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON frame (bytes or str). Raises ValueError on invalid JSON."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode compact JSON text (same output as Starlette's send_json)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class StreamMessage(dict):
+    """
+    Broadcast message that is JSON-encoded at most once.
+
+    It is a plain dict for callbacks that read fields; clients that forward
+    it to a WebSocket send `encoded` instead of encoding it again.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._encoded: Optional[str] = None
+
+    @property
+    def encoded(self) -> str:
+        if self._encoded is None:
+            self._encoded = dumps(self)
+        return self._encoded
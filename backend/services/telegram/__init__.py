@@ -2,15 +2,23 @@
 Telegram Notification Service Package
 
 Provides real-time trading alerts via Telegram bot.
-Uses polling mode (no webhook required).
+Uses polling mode (no webhook required). Delivery runs on a background
+queue so notifications never block the caller.
 """
 
 from services.telegram.config import TelegramConfig, get_telegram_config
-from services.telegram.service import TelegramNotifier, get_telegram_notifier
+from services.telegram.dispatcher import NotificationDispatcher
+from services.telegram.service import (
+    TelegramNotifier,
+    close_telegram_notifier,
+    get_telegram_notifier,
+)
 
 __all__ = [
     "TelegramConfig",
     "get_telegram_config",
     "TelegramNotifier",
     "get_telegram_notifier",
+    "close_telegram_notifier",
+    "NotificationDispatcher",
 ]
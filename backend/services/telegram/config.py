@@ -53,6 +53,24 @@ class TelegramConfig(BaseSettings):
         description="Send system start/stop/error notifications"
     )
 
+    # Delivery settings (background dispatch queue)
+    TELEGRAM_QUEUE_SIZE: int = Field(
+        default=200, ge=1,
+        description="Maximum queued messages before new ones are dropped"
+    )
+    TELEGRAM_MIN_INTERVAL: float = Field(
+        default=1.0, ge=0.0,
+        description="Minimum seconds between messages to one chat"
+    )
+    TELEGRAM_COALESCE_WINDOW: float = Field(
+        default=5.0, ge=0.0,
+        description="Seconds to gather sub-agent decisions into one digest"
+    )
+    TELEGRAM_MAX_RETRIES: int = Field(
+        default=3, ge=0,
+        description="Retries per message on network errors"
+    )
+
     @property
     def is_configured(self) -> bool:
         """Check if Telegram is properly configured."""
@@ -0,0 +1,277 @@
+"""
+Telegram Notification Dispatcher
+
+Background delivery queue for Telegram messages, so sending a notification
+never blocks the caller (analysis nodes, scanner, trading coordinator).
+
+Features:
+- Bounded queue; submit() is non-blocking and drops when full
+- Per-chat rate limiting (minimum interval between messages)
+- Coalescing: messages sharing a coalesce key within a short window are
+  merged into one digest (e.g., one message per analysis instead of one
+  per analyst)
+- Retry with backoff on network errors, honouring RetryAfter; Markdown
+  parse failures are resent as plain text
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import structlog
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+
+logger = structlog.get_logger()
+
+
+SendFn = Callable[[str, str, Optional[str]], Awaitable[None]]
+SplitFn = Callable[[str], List[str]]
+
+# Separator between coalesced messages in a digest
+DIGEST_SEPARATOR = "\n\n━━━━━━━━━━\n\n"
+
+
+@dataclass
+class Notification:
+    """A queued message."""
+    chat_id: str
+    text: str
+    parse_mode: Optional[str] = "Markdown"
+
+
+@dataclass
+class _CoalesceGroup:
+    chat_id: str
+    parse_mode: Optional[str]
+    parts: List[str] = field(default_factory=list)
+    started_at: float = 0.0
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class NotificationDispatcher:
+    """
+    Non-blocking, rate-limited Telegram delivery.
+
+    Usage:
+        dispatcher = NotificationDispatcher(send_chunk, split=split_message)
+        dispatcher.submit(chat_id, "text")                       # returns at once
+        dispatcher.submit(chat_id, "part", coalesce_key="analysis:005930")
+        await dispatcher.close()                                 # drain on shutdown
+    """
+
+    def __init__(
+        self,
+        send: SendFn,
+        split: Optional[SplitFn] = None,
+        max_queue: int = 200,
+        min_interval: float = 1.0,
+        coalesce_window: float = 5.0,
+        coalesce_max_delay: float = 30.0,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+    ):
+        """
+        Initialize Notification Dispatcher.
+
+        Args:
+            send: Async function sending one chunk (chat_id, text, parse_mode)
+            split: Splits a message into sendable chunks (default: as is)
+            max_queue: Maximum queued messages
+            min_interval: Minimum seconds between messages to one chat
+            coalesce_window: Seconds of quiet after which a digest is sent
+            coalesce_max_delay: Maximum seconds a digest is held back
+            max_retries: Retries per chunk on transient errors
+            retry_backoff: Base backoff in seconds (doubles per retry)
+        """
+        self._send = send
+        self._split = split or (lambda text: [text])
+        self.min_interval = min_interval
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_delay = coalesce_max_delay
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self._groups: Dict[str, _CoalesceGroup] = {}
+        self._last_sent: Dict[str, float] = {}
+        self._worker: Optional[asyncio.Task] = None
+
+        # Statistics
+        self._stats = {"submitted": 0, "coalesced": 0, "sent": 0, "failed": 0, "dropped": 0, "retries": 0}
+
+    # -------------------------------------------
+    # Submission
+    # -------------------------------------------
+
+    def submit(
+        self,
+        chat_id: str,
+        text: str,
+        parse_mode: Optional[str] = "Markdown",
+        coalesce_key: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a message without waiting for delivery.
+
+        Messages with a coalesce_key are held for coalesce_window seconds
+        (extended by each new part, up to coalesce_max_delay) and sent as
+        one digest. A message without a key first releases the chat's
+        pending digests, so delivery order is preserved.
+
+        Returns:
+            True if queued, False if dropped (queue full or no event loop)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("telegram_submit_without_loop")
+            return False
+
+        self._ensure_worker()
+        self._stats["submitted"] += 1
+
+        if coalesce_key is None:
+            for key in [k for k, g in self._groups.items() if g.chat_id == chat_id]:
+                self._flush_group(key)
+            return self._enqueue(Notification(chat_id, text, parse_mode))
+
+        group = self._groups.get(coalesce_key)
+        if group is None:
+            group = _CoalesceGroup(chat_id=chat_id, parse_mode=parse_mode, started_at=loop.time())
+            self._groups[coalesce_key] = group
+        else:
+            self._stats["coalesced"] += 1
+            group.timer.cancel()
+
+        group.parts.append(text)
+        delay = min(self.coalesce_window, group.started_at + self.coalesce_max_delay - loop.time())
+        group.timer = loop.call_later(max(delay, 0.0), self._flush_group, coalesce_key)
+        return True
+
+    def _flush_group(self, key: str) -> None:
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        if group.timer is not None:
+            group.timer.cancel()
+        self._enqueue(Notification(group.chat_id, DIGEST_SEPARATOR.join(group.parts), group.parse_mode))
+
+    def _enqueue(self, notification: Notification) -> bool:
+        try:
+            self._queue.put_nowait(notification)
+            return True
+        except asyncio.QueueFull:
+            self._stats["dropped"] += 1
+            logger.warning("telegram_queue_full", dropped=self._stats["dropped"])
+            return False
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    # -------------------------------------------
+    # Delivery
+    # -------------------------------------------
+
+    async def _run(self) -> None:
+        while True:
+            notification = await self._queue.get()
+            try:
+                await self._deliver(notification)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["failed"] += 1
+                logger.error("telegram_delivery_error", error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, notification: Notification) -> None:
+        for chunk in self._split(notification.text):
+            if await self._send_chunk(notification.chat_id, chunk, notification.parse_mode):
+                self._stats["sent"] += 1
+            else:
+                self._stats["failed"] += 1
+
+    async def _send_chunk(self, chat_id: str, text: str, parse_mode: Optional[str]) -> bool:
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_slot(chat_id)
+            try:
+                await self._send(chat_id, text, parse_mode)
+                return True
+            except RetryAfter as e:
+                wait = e.retry_after
+                wait = wait.total_seconds() if isinstance(wait, timedelta) else float(wait)
+                logger.warning("telegram_rate_limited", retry_after=wait)
+                await asyncio.sleep(wait)
+            except BadRequest as e:
+                # Usually unbalanced Markdown in free text: resend as plain text
+                if parse_mode is None:
+                    logger.error("telegram_send_failed", error=str(e))
+                    return False
+                parse_mode = None
+            except NetworkError as e:
+                if attempt == self.max_retries:
+                    logger.error("telegram_send_failed", error=str(e), attempts=attempt + 1)
+                    return False
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+            except TelegramError as e:
+                logger.error("telegram_send_failed", error=str(e))
+                return False
+            self._stats["retries"] += 1
+        return False
+
+    async def _wait_for_slot(self, chat_id: str) -> None:
+        """Per-chat rate limit: keep min_interval between messages."""
+        loop = asyncio.get_running_loop()
+        last = self._last_sent.get(chat_id)
+        if last is not None:
+            wait = last + self.min_interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self._last_sent[chat_id] = loop.time()
+
+    # -------------------------------------------
+    # Lifecycle
+    # -------------------------------------------
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Release pending digests and wait until the queue is delivered.
+
+        Returns:
+            True if everything was delivered within the timeout
+        """
+        for key in list(self._groups):
+            self._flush_group(key)
+
+        self._ensure_worker()
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Deliver what is pending (up to timeout) and stop the worker."""
+        delivered = await self.flush(timeout)
+        if not delivered:
+            logger.warning("telegram_queue_not_drained", pending=self._queue.qsize())
+
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    @property
+    def pending(self) -> int:
+        """Queued messages plus held digests."""
+        return self._queue.qsize() + len(self._groups)
+
+    def get_stats(self) -> dict:
+        """Get dispatcher statistics."""
+        return {**self._stats, "queued": self._queue.qsize(), "digests_pending": len(self._groups)}
@@ -3,9 +3,13 @@ Telegram Notification Service
 
 Sends trading alerts and notifications via Telegram bot.
 Uses polling mode - no external webhook required.
+
+Messages are handed to a background NotificationDispatcher: send methods
+return as soon as the message is queued, so Telegram latency never adds to
+analysis or trading latency. Sub-agent decisions for one stock are
+coalesced into a single digest.
 """
 
-import asyncio
 from datetime import datetime
 from functools import lru_cache
 from typing import Optional
@@ -15,6 +19,7 @@ from telegram import Bot
 from telegram.error import TelegramError
 
 from services.telegram.config import get_telegram_config, TelegramConfig
+from services.telegram.dispatcher import NotificationDispatcher
 
 logger = structlog.get_logger()
 
@@ -28,12 +33,21 @@ class TelegramNotifier:
     - Position updates (P&L changes)
     - Analysis completion notifications
     - System status messages
+    - Non-blocking delivery (queued, rate limited, retried)
     """
 
     def __init__(self, config: Optional[TelegramConfig] = None):
         self._config = config or get_telegram_config()
         self._bot: Optional[Bot] = None
         self._initialized = False
+        self._dispatcher = NotificationDispatcher(
+            self._send_chunk,
+            split=self._format_chunks,
+            max_queue=self._config.TELEGRAM_QUEUE_SIZE,
+            min_interval=self._config.TELEGRAM_MIN_INTERVAL,
+            coalesce_window=self._config.TELEGRAM_COALESCE_WINDOW,
+            max_retries=self._config.TELEGRAM_MAX_RETRIES,
+        )
 
     async def initialize(self) -> bool:
         """Initialize the Telegram bot."""
@@ -95,48 +109,66 @@ class TelegramNotifier:
 
         return chunks
 
-    async def _send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
-        """Send a message to the configured chat. Handles long messages by splitting."""
-        if not self._initialized or not self._bot:
-            return False
+    def _format_chunks(self, text: str) -> list[str]:
+        """Split a message and add continuation indicators to multi-part messages."""
+        chunks = self._split_message(text)
+        if len(chunks) == 1:
+            return chunks
+
+        formatted = []
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                chunk = chunk + "\n\n_(계속...)_"
+            elif i < len(chunks) - 1:
+                chunk = f"_(...계속)_\n\n{chunk}\n\n_(계속...)_"
+            else:
+                chunk = f"_(...계속)_\n\n{chunk}"
+            formatted.append(chunk)
+        return formatted
 
-        try:
-            # Split long messages
-            chunks = self._split_message(text)
-
-            for i, chunk in enumerate(chunks):
-                # Add continuation indicator for multi-part messages
-                if len(chunks) > 1:
-                    if i == 0:
-                        chunk = chunk + "\n\n_(계속...)_"
-                    elif i < len(chunks) - 1:
-                        chunk = f"_(...계속)_\n\n{chunk}\n\n_(계속...)_"
-                    else:
-                        chunk = f"_(...계속)_\n\n{chunk}"
-
-                await self._bot.send_message(
-                    chat_id=self._config.TELEGRAM_CHAT_ID,
-                    text=chunk,
-                    parse_mode=parse_mode,
-                )
-
-                # Small delay between chunks to maintain order
-                if i < len(chunks) - 1:
-                    await asyncio.sleep(0.3)
+    async def _send_chunk(self, chat_id: str, text: str, parse_mode: Optional[str]) -> None:
+        """Deliver one chunk (called by the dispatcher; errors are retried there)."""
+        await self._bot.send_message(chat_id=chat_id, text=text, parse_mode=parse_mode)
 
-            return True
-        except TelegramError as e:
-            logger.error("telegram_send_failed", error=str(e))
+    async def _send_message(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        coalesce_key: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a message to the configured chat.
+
+        Returns as soon as the message is queued; long messages are split
+        at delivery time.
+
+        Returns:
+            True if queued
+        """
+        if not self._initialized or not self._bot:
             return False
 
-    async def send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
+        return self._dispatcher.submit(
+            self._config.TELEGRAM_CHAT_ID,
+            text,
+            parse_mode=parse_mode,
+            coalesce_key=coalesce_key,
+        )
+
+    async def send_message(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        coalesce_key: Optional[str] = None,
+    ) -> bool:
         """
         Send a custom message to the Telegram chat.
 
         This is a public method for sending arbitrary messages.
         Use this for notifications that don't fit other specific methods.
+        Messages sharing a coalesce_key are merged into one digest.
         """
-        return await self._send_message(text, parse_mode)
+        return await self._send_message(text, parse_mode, coalesce_key)
 
     # -------------------------------------------
     # Trade Alerts
@@ -424,7 +456,8 @@ _모니터링 중..._
 *주요 요인:*
 {factors_text}
 """
-        return await self._send_message(message.strip())
+        # One digest per analysis instead of one message per analyst
+        return await self._send_message(message.strip(), coalesce_key=f"analysis:{ticker}")
 
     # -------------------------------------------
     # System Status
@@ -501,6 +534,18 @@ _모니터링 중..._
         """Check if notifier is ready to send messages."""
         return self._initialized and self._bot is not None
 
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued messages (and pending digests) are delivered."""
+        return await self._dispatcher.flush(timeout)
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """Deliver pending messages and stop the dispatcher."""
+        await self._dispatcher.close(timeout)
+
+    def get_stats(self) -> dict:
+        """Get delivery statistics."""
+        return self._dispatcher.get_stats()
+
 
 # Singleton instance
 _notifier_instance: Optional[TelegramNotifier] = None
@@ -515,3 +560,12 @@ async def get_telegram_notifier() -> TelegramNotifier:
         await _notifier_instance.initialize()
 
     return _notifier_instance
+
+
+async def close_telegram_notifier() -> None:
+    """Deliver pending notifications and stop the notifier."""
+    global _notifier_instance
+
+    if _notifier_instance is not None:
+        await _notifier_instance.close()
+        _notifier_instance = None
@@ -0,0 +1,45 @@
+"""
+Tick Recorder
+
+Records the live Upbit and Kiwoom market data streams to memory-mappable
+segment files and replays them, at N× speed, into the realtime services and
+price consumers (RiskMonitor, PositionManager) to reproduce market sessions
+offline.
+
+- format: Segment layout (fixed-width numpy records)
+- recorder: TickRecorder, attached to the stream clients
+- replay: TickSegment (memmap reader), TickReplay and its sinks
+"""
+
+from services.tick_recorder.format import RECORD_DTYPE, SegmentFormatError
+from services.tick_recorder.recorder import (
+    TickRecorder,
+    close_tick_recorder,
+    get_running_tick_recorder,
+    get_tick_recorder,
+)
+from services.tick_recorder.replay import (
+    MarketEvent,
+    TickReplay,
+    TickSegment,
+    kr_realtime_sink,
+    open_segments,
+    price_sink,
+    realtime_sink,
+)
+
+__all__ = [
+    "RECORD_DTYPE",
+    "SegmentFormatError",
+    "TickRecorder",
+    "get_tick_recorder",
+    "get_running_tick_recorder",
+    "close_tick_recorder",
+    "MarketEvent",
+    "TickSegment",
+    "TickReplay",
+    "open_segments",
+    "realtime_sink",
+    "kr_realtime_sink",
+    "price_sink",
+]
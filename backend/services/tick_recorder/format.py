@@ -0,0 +1,112 @@
+"""
+Tick Segment Format
+
+A segment file is a fixed-size JSON header followed by fixed-width records
+(RECORD_DTYPE), so a segment can be opened with numpy.memmap and filtered
+without parsing.
+
+Header (HEADER_SIZE bytes): MAGIC, then a JSON object padded with spaces:
+    {"version": 1, "records": <complete records>, "symbols": [...],
+     "created_ns": ...}
+Readers trust "records"; bytes after the last complete record (a write
+in progress) are ignored.
+
+Record columns by kind:
+
+    kind       price        size             side       ref             v0..v5
+    ticker     trade_price  trade_volume     ask/bid    -               Upbit: acc_trade_volume_24h,
+                                                                        acc_trade_price_24h,
+                                                                        signed_change_rate,
+                                                                        high, low, signed_change_price
+                                                                        Kiwoom: acml_vol, prdy_ctrt,
+                                                                        high, low, open, prdy_vrss
+                                                                        (ref = acml_tr_pbmn)
+    trade      trade_price  trade_volume     ask/bid    sequential_id   -
+    orderbook  level price  level size       bid/ask    -               v0 total bid, v1 total ask
+
+An orderbook snapshot is one record per level; its records share `seq`.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"JTICKS01"
+FORMAT_VERSION = 1
+HEADER_SIZE = 4096
+
+# Sources
+UPBIT = 1
+KIWOOM = 2
+SOURCE_NAMES = {UPBIT: "upbit", KIWOOM: "kiwoom"}
+
+# Kinds
+TICKER = 1
+TRADE = 2
+ORDERBOOK = 3
+KIND_NAMES = {TICKER: "ticker", TRADE: "trade", ORDERBOOK: "orderbook"}
+
+# Sides (buy/bid positive)
+BUY = 1
+SELL = -1
+
+RECORD_DTYPE = np.dtype([
+    ("ts_ns", "<i8"),        # receive time (epoch ns)
+    ("exchange_ts", "<i8"),  # exchange timestamp (epoch ms, 0 if unknown)
+    ("ref", "<i8"),          # kind-specific integer (see table above)
+    ("seq", "<u4"),          # event number within the segment
+    ("symbol", "<u2"),       # index into the header's symbol table
+    ("source", "u1"),
+    ("kind", "u1"),
+    ("side", "i1"),
+    ("level", "u1"),         # orderbook level (0 = best)
+    ("price", "<f8"),
+    ("size", "<f8"),
+    ("v", "<f8", (6,)),
+    ("_pad", "V6"),          # rows are 8-byte aligned
+])
+
+# Upper bound on a segment's symbols; long symbols fill the header sooner,
+# so writers also check that the encoded header fits (see encode_header)
+MAX_SYMBOLS = 1024
+
+
+class SegmentFormatError(ValueError):
+    """File is not a tick segment (or uses an unsupported version)."""
+
+
+def encode_header(records: int, symbols: list[str], created_ns: int) -> bytes:
+    """
+    Encode a segment header.
+
+    Raises:
+        OverflowError: Symbol table does not fit in the header
+    """
+    body = json.dumps({
+        "version": FORMAT_VERSION,
+        "records": records,
+        "symbols": symbols,
+        "created_ns": created_ns,
+    }, separators=(",", ":")).encode()
+    size = HEADER_SIZE - len(MAGIC)
+    if len(body) > size:
+        raise OverflowError("segment symbol table is full")
+    return MAGIC + body.ljust(size, b" ")
+
+
+def decode_header(data: bytes) -> dict[str, Any]:
+    """Decode a segment header."""
+    if len(data) < HEADER_SIZE or not data.startswith(MAGIC):
+        raise SegmentFormatError("not a tick segment")
+    header = json.loads(data[len(MAGIC):HEADER_SIZE])
+    if header.get("version") != FORMAT_VERSION:
+        raise SegmentFormatError(f"unsupported segment version: {header.get('version')}")
+    return header
+
+
+def read_header(path: Path) -> dict[str, Any]:
+    """Read the header of a segment file."""
+    with open(path, "rb") as f:
+        return decode_header(f.read(HEADER_SIZE))
@@ -0,0 +1,392 @@
+"""
+Tick Recorder
+
+Appends the live Upbit and Kiwoom streams (tickers/ticks, trades and
+orderbook snapshots) to segment files (see format.py) for offline replay.
+
+Stream callbacks only append a tuple to an in-memory batch; a background
+task converts each batch to records and writes it from a worker thread
+every flush_interval seconds. Segments rotate after segment_records
+records or when their symbol table is full.
+
+Usage:
+    recorder = get_tick_recorder()
+    await recorder.start()
+    recorder.attach_upbit(upbit_ws)
+    recorder.attach_kiwoom(kiwoom_ws)
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import structlog
+
+from .format import (
+    BUY,
+    KIWOOM,
+    MAX_SYMBOLS,
+    ORDERBOOK,
+    RECORD_DTYPE,
+    SELL,
+    TICKER,
+    TRADE,
+    UPBIT,
+    encode_header,
+)
+
+if TYPE_CHECKING:
+    from services.kiwoom import KiwoomWebSocketClient, OrderbookData, StockTickData
+    from services.upbit import OrderbookFrame, TickerFrame, TradeFrame, UpbitWebSocketClient
+
+logger = structlog.get_logger()
+
+
+# Record columns without padding, in the order rows are appended
+_ROW_DTYPE = np.dtype([(name, RECORD_DTYPE.fields[name][0]) for name in RECORD_DTYPE.names if name != "_pad"])
+_SYMBOL = _ROW_DTYPE.names.index("symbol")
+
+_NO_VALUES = (0.0,) * 6
+_SIDES = {"BID": BUY, "ASK": SELL, "+": BUY, "-": SELL}
+
+# Kiwoom 주식호가잔량 (0D) levels per side
+_KIWOOM_BOOK_LEVELS = 5
+
+
+# -------------------------------------------
+# Singleton
+# -------------------------------------------
+
+_tick_recorder: Optional["TickRecorder"] = None
+
+
+def get_tick_recorder() -> "TickRecorder":
+    """Get or create the singleton tick recorder (not started)."""
+    global _tick_recorder
+    if _tick_recorder is None:
+        from app.config import settings
+
+        _tick_recorder = TickRecorder(
+            directory=settings.TICK_RECORDER_DIR,
+            segment_records=settings.TICK_RECORDER_SEGMENT_RECORDS,
+            flush_interval=settings.TICK_RECORDER_FLUSH_INTERVAL,
+        )
+    return _tick_recorder
+
+
+def get_running_tick_recorder() -> Optional["TickRecorder"]:
+    """Get the tick recorder only if it is recording (never creates it)."""
+    if _tick_recorder is not None and _tick_recorder.is_running:
+        return _tick_recorder
+    return None
+
+
+async def close_tick_recorder() -> None:
+    """Flush and close the tick recorder."""
+    global _tick_recorder
+    if _tick_recorder is not None:
+        await _tick_recorder.stop()
+        _tick_recorder = None
+        logger.info("tick_recorder_closed")
+
+
+# -------------------------------------------
+# Recorder
+# -------------------------------------------
+
+
+class TickRecorder:
+    """
+    Records market data streams to segment files.
+
+    Segments are named by their creation time (YYYYmmdd-HHMMSS-n.seg), so
+    sorting the names orders them in time.
+    """
+
+    # Pending rows kept while writes fail (beyond this, rows are dropped)
+    MAX_PENDING_ROWS = 2_000_000
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_records: int = 1_000_000,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Args:
+            directory: Directory for segment files
+            segment_records: Records per segment before rotating
+            flush_interval: Seconds between batch writes
+        """
+        self.directory = Path(directory)
+        self.segment_records = segment_records
+        self.flush_interval = flush_interval
+
+        self._rows: list[tuple] = []
+        self._seq = 0
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+
+        # Current segment
+        self._file = None
+        self._path: Optional[Path] = None
+        self._records = 0
+        self._symbols: list[str] = []
+        self._symbol_ids: dict[str, int] = {}
+        self._created_ns = 0
+        self._segments = 0
+
+        self._stats = {"records": 0, "events": 0, "dropped": 0, "segments": 0}
+
+    # -------------------------------------------
+    # Lifecycle
+    # -------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background writer."""
+        if self._running:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info("tick_recorder_started", directory=str(self.directory))
+
+    async def stop(self) -> None:
+        """Write pending rows and close the current segment."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        async with self._write_lock:
+            await asyncio.to_thread(self._close_segment)
+        logger.info("tick_recorder_stopped", **self._stats)
+
+    async def _flush_loop(self) -> None:
+        while self._running:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("tick_recorder_flush_failed", error=str(e))
+
+    async def flush(self) -> None:
+        """Write the pending rows."""
+        async with self._write_lock:
+            rows, self._rows = self._rows, []
+            if not rows:
+                return
+            try:
+                await asyncio.to_thread(self._write, rows)
+            except Exception:
+                # Keep the rows for the next attempt
+                self._rows[:0] = rows
+                raise
+
+    # -------------------------------------------
+    # Stream Attachment
+    # -------------------------------------------
+
+    def attach_upbit(self, ws: "UpbitWebSocketClient") -> None:
+        """Record the Upbit client's ticker, trade and orderbook streams."""
+        ws.on_ticker(self.record_upbit_ticker)
+        ws.on_trade(self.record_upbit_trade)
+        ws.on_orderbook(self.record_upbit_orderbook)
+
+    def attach_kiwoom(self, ws: "KiwoomWebSocketClient") -> None:
+        """Record the Kiwoom client's tick (0B) and orderbook (0D) streams."""
+        ws.on_tick(self.record_kiwoom_tick)
+        ws.on_orderbook(self.record_kiwoom_orderbook)
+
+    # -------------------------------------------
+    # Recording (stream callbacks)
+    # -------------------------------------------
+
+    def record_upbit_ticker(self, frame: "TickerFrame") -> None:
+        d = frame.raw
+        self._append([(
+            time.time_ns(), d["trade_timestamp"], 0, self._next_seq(), d["code"], UPBIT, TICKER,
+            _SIDES.get(d.get("ask_bid"), 0), 0, d["trade_price"], d["trade_volume"],
+            (
+                d["acc_trade_volume_24h"], d["acc_trade_price_24h"], d["signed_change_rate"],
+                d["high_price"], d["low_price"], d["signed_change_price"],
+            ),
+        )])
+
+    def record_upbit_trade(self, frame: "TradeFrame") -> None:
+        d = frame.raw
+        self._append([(
+            time.time_ns(), d["trade_timestamp"], d["sequential_id"], self._next_seq(), d["code"],
+            UPBIT, TRADE, _SIDES.get(d["ask_bid"], 0), 0, d["trade_price"], d["trade_volume"],
+            _NO_VALUES,
+        )])
+
+    def record_upbit_orderbook(self, frame: "OrderbookFrame") -> None:
+        d = frame.raw
+        ts_ns, seq, code = time.time_ns(), self._next_seq(), d["code"]
+        totals = (d["total_bid_size"], d["total_ask_size"], 0.0, 0.0, 0.0, 0.0)
+        rows = []
+        for level, unit in enumerate(d["orderbook_units"]):
+            rows.append((ts_ns, d["timestamp"], 0, seq, code, UPBIT, ORDERBOOK, BUY, level,
+                         unit["bid_price"], unit["bid_size"], totals))
+            rows.append((ts_ns, d["timestamp"], 0, seq, code, UPBIT, ORDERBOOK, SELL, level,
+                         unit["ask_price"], unit["ask_size"], totals))
+        self._append(rows)
+
+    def record_kiwoom_tick(self, tick: "StockTickData") -> None:
+        self._append([(
+            time.time_ns(), int(tick.timestamp.timestamp() * 1000), tick.acml_tr_pbmn,
+            self._next_seq(), tick.stk_cd, KIWOOM, TICKER, _SIDES.get(tick.ask_bid, 0), 0,
+            tick.cur_prc, tick.ccld_qty,
+            (tick.acml_vol, tick.prdy_ctrt, tick.high_prc, tick.low_prc, tick.strt_prc, tick.prdy_vrss),
+        )])
+
+    def record_kiwoom_orderbook(self, data: "OrderbookData") -> None:
+        ts_ns, seq = time.time_ns(), self._next_seq()
+        exchange_ts = int(data.timestamp.timestamp() * 1000)
+        totals = (data.tot_buy_qty, data.tot_sell_qty, 0.0, 0.0, 0.0, 0.0)
+        rows = []
+        for i in range(_KIWOOM_BOOK_LEVELS):
+            for side, prefix in ((BUY, "buy"), (SELL, "sell")):
+                price = getattr(data, f"{prefix}_hoga_{i + 1}")
+                if price:
+                    size = getattr(data, f"{prefix}_hoga_qty_{i + 1}")
+                    rows.append((ts_ns, exchange_ts, 0, seq, data.stk_cd, KIWOOM, ORDERBOOK, side, i,
+                                 price, size, totals))
+        self._append(rows)
+
+    def _next_seq(self) -> int:
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        return self._seq
+
+    def _append(self, rows: list[tuple]) -> None:
+        if len(self._rows) >= self.MAX_PENDING_ROWS:
+            self._stats["dropped"] += len(rows)
+            return
+        self._rows.extend(rows)
+        self._stats["events"] += 1
+
+    # -------------------------------------------
+    # Segment Files (worker thread)
+    # -------------------------------------------
+
+    def _write(self, rows: list[tuple]) -> None:
+        """Write rows, rotating segments as needed."""
+        while rows:
+            if self._file is None or self._records >= self.segment_records:
+                self._open_segment()
+
+            chunk = rows[:self.segment_records - self._records]
+            new_symbols = self._new_symbols(chunk)
+            if new_symbols and not self._header_fits(self._symbols + new_symbols):
+                if self._records:
+                    self._open_segment()
+                    continue
+                # A fresh segment takes the rows whose symbols fit its header
+                chunk = self._fitting_rows(chunk)
+                new_symbols = self._new_symbols(chunk)
+
+            for symbol in new_symbols:
+                self._symbol_ids[symbol] = len(self._symbols)
+                self._symbols.append(symbol)
+
+            ids = self._symbol_ids
+            encoded = np.array(
+                [row[:_SYMBOL] + (ids[row[_SYMBOL]],) + row[_SYMBOL + 1:] for row in chunk],
+                dtype=_ROW_DTYPE,
+            )
+            records = np.zeros(len(chunk), dtype=RECORD_DTYPE)
+            for name in _ROW_DTYPE.names:
+                records[name] = encoded[name]
+
+            self._file.seek(0, 2)
+            self._file.write(records.tobytes())
+            self._records += len(chunk)
+            self._stats["records"] += len(chunk)
+            self._write_header()
+            rows = rows[len(chunk):]
+
+    def _new_symbols(self, rows: list[tuple]) -> list[str]:
+        """Symbols of the rows not yet in the segment's table, in first-seen order."""
+        return list(dict.fromkeys(row[_SYMBOL] for row in rows if row[_SYMBOL] not in self._symbol_ids))
+
+    def _header_fits(self, symbols: list[str]) -> bool:
+        """Whether the header still fits once the segment is full."""
+        if len(symbols) > MAX_SYMBOLS:
+            return False
+        try:
+            encode_header(self.segment_records, symbols, self._created_ns)
+        except OverflowError:
+            return False
+        return True
+
+    def _fitting_rows(self, rows: list[tuple]) -> list[tuple]:
+        """Leading rows whose symbols fit the current segment's header."""
+        symbols = list(self._symbols)
+        seen = set(self._symbol_ids)
+        for i, row in enumerate(rows):
+            symbol = row[_SYMBOL]
+            if symbol not in seen:
+                symbols.append(symbol)
+                if not self._header_fits(symbols):
+                    if i == 0:
+                        raise OverflowError(f"symbol does not fit a segment header: {symbol[:32]}")
+                    return rows[:i]
+                seen.add(symbol)
+        return rows
+
+    def _open_segment(self) -> None:
+        self._close_segment()
+        self._segments += 1
+        name = f"{datetime.now():%Y%m%d-%H%M%S}-{self._segments:04d}.seg"
+        self._path = self.directory / name
+        self._file = open(self._path, "wb")
+        self._records = 0
+        self._symbols = []
+        self._symbol_ids = {}
+        self._created_ns = time.time_ns()
+        self._write_header()
+        self._stats["segments"] += 1
+        logger.info("tick_segment_opened", path=str(self._path))
+
+    def _write_header(self) -> None:
+        """Publish the record count and symbol table (records are written first)."""
+        header = encode_header(self._records, self._symbols, self._created_ns)
+        self._file.flush()
+        self._file.seek(0)
+        try:
+            self._file.write(header)
+        finally:
+            self._file.seek(0, 2)
+        self._file.flush()
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # -------------------------------------------
+    # Status
+    # -------------------------------------------
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def stats(self) -> dict:
+        """Recorder statistics."""
+        return {
+            **self._stats,
+            "pending": len(self._rows),
+            "segment": str(self._path) if self._path else None,
+        }
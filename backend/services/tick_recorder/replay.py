@@ -0,0 +1,383 @@
+"""
+Tick Replay
+
+Reads recorded segments through numpy.memmap (nothing is loaded up front;
+symbol/time filters are vectorized over the mapped columns) and replays
+them as market events, paced by their receive times at N× speed.
+
+Sinks turn events back into what the live services consume:
+    realtime_sink(service)     Upbit frames -> RealtimeService.feed()
+    kr_realtime_sink(service)  Kiwoom data -> KrRealtimeService.feed()
+    price_sink(*targets)       prices -> target.on_price(symbol, price),
+                               e.g. RiskMonitor, PositionManager
+
+Usage:
+    replay = TickReplay("data/ticks", speed=10.0)
+    replay.add_sink(realtime_sink(service))
+    replay.add_sink(price_sink(risk_monitor))
+    stats = await replay.run()
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Iterator, Optional, Union
+
+import numpy as np
+import structlog
+
+from services.kiwoom import OrderbookData, StockTickData
+from services.upbit import OrderbookFrame, StreamFrame, TickerFrame, TradeFrame
+
+from .format import (
+    BUY,
+    HEADER_SIZE,
+    KIND_NAMES,
+    ORDERBOOK,
+    RECORD_DTYPE,
+    SOURCE_NAMES,
+    read_header,
+)
+
+if TYPE_CHECKING:
+    from services.kr_realtime_service import KrRealtimeService
+    from services.realtime_service import RealtimeService
+
+logger = structlog.get_logger()
+
+# Rows converted to Python objects at a time
+CHUNK_ROWS = 8192
+
+
+@dataclass(slots=True)
+class MarketEvent:
+    """One recorded ticker, trade or orderbook snapshot."""
+    ts_ns: int  # receive time (epoch ns)
+    exchange_ts: int  # exchange time (epoch ms)
+    source: str  # "upbit" | "kiwoom"
+    kind: str  # "ticker" | "trade" | "orderbook"
+    symbol: str
+    price: float = 0.0
+    size: float = 0.0
+    side: int = 0  # 1 buy/bid, -1 sell/ask
+    ref: int = 0
+    values: tuple = ()  # v0..v5 (see format.py)
+    bids: list[tuple[float, float]] = field(default_factory=list)  # orderbook levels, best first
+    asks: list[tuple[float, float]] = field(default_factory=list)
+
+
+# -------------------------------------------
+# Segments
+# -------------------------------------------
+
+
+class TickSegment:
+    """A segment file mapped read-only."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        header = read_header(self.path)
+        self.symbols: list[str] = header["symbols"]
+        self.created_ns: int = header["created_ns"]
+
+        count = header["records"]
+        if count:
+            self.records = np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def select(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ) -> np.ndarray:
+        """Records of the given symbols received in [start_ns, end_ns)."""
+        records = self.records
+        mask = None
+        if symbols is not None:
+            wanted = set(symbols)
+            ids = [i for i, symbol in enumerate(self.symbols) if symbol in wanted]
+            mask = np.isin(records["symbol"], ids)
+        if start_ns is not None:
+            mask = _and(mask, records["ts_ns"] >= start_ns)
+        if end_ns is not None:
+            mask = _and(mask, records["ts_ns"] < end_ns)
+        return records if mask is None else records[mask]
+
+    def events(self, **filters: Any) -> Iterator[MarketEvent]:
+        """Events in record order (see select() for filters)."""
+        records = self.select(**filters)
+        symbols = self.symbols
+        book: Optional[MarketEvent] = None
+        book_seq = None
+
+        for start in range(0, len(records), CHUNK_ROWS):
+            chunk = records[start:start + CHUNK_ROWS]
+            columns = [chunk[name].tolist() for name in (
+                "ts_ns", "exchange_ts", "ref", "seq", "symbol", "source", "kind", "side", "price", "size"
+            )]
+            values = chunk["v"].tolist()
+
+            for (ts_ns, exchange_ts, ref, seq, symbol, source, kind, side, price, size), v in zip(
+                zip(*columns), values
+            ):
+                if kind == ORDERBOOK:
+                    if book is not None and seq == book_seq and symbols[symbol] == book.symbol:
+                        (book.bids if side == BUY else book.asks).append((price, size))
+                        continue
+                    if book is not None:
+                        yield book
+                    book = MarketEvent(
+                        ts_ns, exchange_ts, SOURCE_NAMES[source], "orderbook", symbols[symbol],
+                        side=0, values=tuple(v),
+                    )
+                    book_seq = seq
+                    (book.bids if side == BUY else book.asks).append((price, size))
+                    continue
+
+                if book is not None:
+                    yield book
+                    book = None
+                yield MarketEvent(
+                    ts_ns, exchange_ts, SOURCE_NAMES[source], KIND_NAMES[kind], symbols[symbol],
+                    price, size, side, ref, tuple(v),
+                )
+
+        if book is not None:
+            yield book
+
+
+def _and(mask: Optional[np.ndarray], condition: np.ndarray) -> np.ndarray:
+    return condition if mask is None else mask & condition
+
+
+def open_segments(directory: Union[str, Path]) -> list[TickSegment]:
+    """Open the segments in a directory, oldest first."""
+    return [TickSegment(path) for path in sorted(Path(directory).glob("*.seg"))]
+
+
+# -------------------------------------------
+# Replay
+# -------------------------------------------
+
+Sink = Callable[[MarketEvent], Optional[Awaitable[None]]]
+
+
+class TickReplay:
+    """
+    Replays recorded segments into sinks.
+
+    Events are delivered in recorded order, spaced by their receive times
+    divided by `speed` (0 = as fast as possible).
+    """
+
+    # Events between yields to the event loop when running unpaced
+    YIELD_EVERY = 1000
+
+    def __init__(
+        self,
+        source: Union[str, Path, Iterable[Union[str, Path, TickSegment]]],
+        speed: float = 1.0,
+        symbols: Optional[Iterable[str]] = None,
+        start_ns: Optional[int] = None,
+        end_ns: Optional[int] = None,
+    ):
+        """
+        Args:
+            source: Segment directory, or segment paths/segments in time order
+            speed: Replay speed multiple (0 = as fast as possible)
+            symbols: Only replay these symbols
+            start_ns: Only replay events received at or after this time
+            end_ns: Only replay events received before this time
+        """
+        if speed < 0:
+            raise ValueError("speed must be >= 0")
+        if isinstance(source, (str, Path)):
+            self.segments = open_segments(source)
+        else:
+            self.segments = [s if isinstance(s, TickSegment) else TickSegment(s) for s in source]
+        self.speed = speed
+        self._filters = {
+            "symbols": set(symbols) if symbols is not None else None,
+            "start_ns": start_ns,
+            "end_ns": end_ns,
+        }
+        self._sinks: list[Sink] = []
+
+    def add_sink(self, sink: Sink) -> None:
+        """Deliver events to a sink (sync or async callable)."""
+        self._sinks.append(sink)
+
+    def events(self) -> Iterator[MarketEvent]:
+        """All selected events in recorded order, unpaced."""
+        for segment in self.segments:
+            yield from segment.events(**self._filters)
+
+    async def run(self) -> dict:
+        """
+        Replay all selected events.
+
+        Returns:
+            Stats: events, recorded_seconds, wall_seconds, max_lag_ms (how far
+            delivery fell behind the paced schedule)
+        """
+        started = time.monotonic()
+        first_ts = last_ts = None
+        max_lag = 0.0
+        count = 0
+
+        for event in self.events():
+            if first_ts is None:
+                first_ts = event.ts_ns
+            last_ts = event.ts_ns
+
+            if self.speed:
+                due = (event.ts_ns - first_ts) / 1e9 / self.speed
+                delay = due - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+            elif count % self.YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+            for sink in self._sinks:
+                result = sink(event)
+                if inspect.isawaitable(result):
+                    await result
+            count += 1
+
+        stats = {
+            "events": count,
+            "recorded_seconds": (last_ts - first_ts) / 1e9 if count else 0.0,
+            "wall_seconds": time.monotonic() - started,
+            "max_lag_ms": max_lag * 1000,
+        }
+        logger.info("tick_replay_finished", **stats)
+        return stats
+
+
+# -------------------------------------------
+# Sinks
+# -------------------------------------------
+
+
+def realtime_sink(service: "RealtimeService") -> Sink:
+    """Feed Upbit events to a RealtimeService (broadcasts, candles, books)."""
+    async def sink(event: MarketEvent) -> None:
+        if event.source == "upbit":
+            await service.feed(to_upbit_frame(event))
+    return sink
+
+
+def kr_realtime_sink(service: "KrRealtimeService") -> Sink:
+    """Feed Kiwoom events to a KrRealtimeService (tick subscribers, books)."""
+    async def sink(event: MarketEvent) -> None:
+        if event.source == "kiwoom":
+            await service.feed(to_kiwoom_data(event))
+    return sink
+
+
+def price_sink(*targets: Any) -> Sink:
+    """Feed ticker and trade prices to targets' on_price(symbol, price)."""
+    async def sink(event: MarketEvent) -> None:
+        if event.kind == "orderbook":
+            return
+        for target in targets:
+            await target.on_price(event.symbol, event.price)
+    return sink
+
+
+# -------------------------------------------
+# Conversions
+# -------------------------------------------
+
+_ASK_BID = {1: "BID", -1: "ASK"}
+
+
+def to_upbit_frame(event: MarketEvent) -> StreamFrame:
+    """Rebuild the Upbit stream frame of an event (recorded fields only)."""
+    if event.kind == "ticker":
+        acc_volume, acc_price, change_rate, high, low, change_price = event.values
+        return TickerFrame({
+            "type": "ticker",
+            "code": event.symbol,
+            "trade_price": event.price,
+            "trade_volume": event.size,
+            "acc_trade_volume_24h": acc_volume,
+            "acc_trade_price_24h": acc_price,
+            "signed_change_rate": change_rate,
+            "signed_change_price": change_price,
+            "change": "RISE" if change_price > 0 else "FALL" if change_price < 0 else "EVEN",
+            "high_price": high,
+            "low_price": low,
+            "ask_bid": _ASK_BID.get(event.side),
+            "trade_timestamp": event.exchange_ts,
+            "timestamp": event.exchange_ts,
+            "stream_type": "REALTIME",
+        })
+    if event.kind == "trade":
+        return TradeFrame({
+            "type": "trade",
+            "code": event.symbol,
+            "trade_price": event.price,
+            "trade_volume": event.size,
+            "ask_bid": _ASK_BID.get(event.side),
+            "trade_timestamp": event.exchange_ts,
+            "timestamp": event.exchange_ts,
+            "sequential_id": event.ref,
+            "stream_type": "REALTIME",
+        })
+
+    levels = max(len(event.bids), len(event.asks))
+    bids = event.bids + [(0.0, 0.0)] * (levels - len(event.bids))
+    asks = event.asks + [(0.0, 0.0)] * (levels - len(event.asks))
+    return OrderbookFrame({
+        "type": "orderbook",
+        "code": event.symbol,
+        "total_bid_size": event.values[0],
+        "total_ask_size": event.values[1],
+        "orderbook_units": [
+            {"ask_price": ask[0], "bid_price": bid[0], "ask_size": ask[1], "bid_size": bid[1]}
+            for bid, ask in zip(bids, asks)
+        ],
+        "timestamp": event.exchange_ts,
+        "stream_type": "REALTIME",
+    })
+
+
+def to_kiwoom_data(event: MarketEvent) -> StockTickData | OrderbookData:
+    """Rebuild the Kiwoom stream data of an event (recorded fields only)."""
+    if event.kind == "orderbook":
+        levels = {}
+        for prefix, side in (("buy", event.bids), ("sell", event.asks)):
+            for i, (price, size) in enumerate(side, start=1):
+                levels[f"{prefix}_hoga_{i}"] = int(price)
+                levels[f"{prefix}_hoga_qty_{i}"] = int(size)
+        return OrderbookData(
+            stk_cd=event.symbol,
+            tot_buy_qty=int(event.values[0]),
+            tot_sell_qty=int(event.values[1]),
+            **levels,
+        )
+
+    acml_vol, prdy_ctrt, high, low, open_price, prdy_vrss = event.values
+    return StockTickData(
+        stk_cd=event.symbol,
+        cur_prc=int(event.price),
+        ccld_qty=int(event.size),
+        acml_vol=int(acml_vol),
+        acml_tr_pbmn=event.ref,
+        prdy_ctrt=prdy_ctrt,
+        prdy_vrss=int(prdy_vrss),
+        high_prc=int(high),
+        low_prc=int(low),
+        strt_prc=int(open_price),
+        ask_bid={1: "+", -1: "-"}.get(event.side, ""),
+    )
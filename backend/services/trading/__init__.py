@@ -6,6 +6,8 @@ Provides AI-agent based automated trading with:
 - Order execution with rate limiting
 - Risk monitoring and alerts
 - Human-in-the-loop approval workflows
+- Vectorized backtests of strategy presets
+- Parallel risk/strategy parameter optimization
 """
 
 from .models import (
@@ -43,7 +45,9 @@ from .market_hours import (
 )
 from .portfolio_agent import PortfolioAgent
 from .order_agent import OrderAgent
+from .execution_scheduler import ExecutionAlgo, ExecutionScheduler
 from .risk_monitor import RiskMonitor
+from .trigger_book import Trigger, TriggerBook, get_trigger_book
 from .coordinator import ExecutionCoordinator
 from .strategy import (
     RiskTolerance,
@@ -60,6 +64,25 @@ from .strategy import (
     get_all_presets,
 )
 from .strategy_engine import StrategyEngine
+from .backtest import (
+    BarPanel,
+    BacktestConfig,
+    BacktestResult,
+    derive_scores,
+    run_backtest,
+)
+from .optimizer import (
+    OBJECTIVES,
+    OptimizationResult,
+    OptimizationRun,
+    ParameterOptimizer,
+    SweepResult,
+    apply_param_set,
+    grid_samples,
+    random_samples,
+    run_sweep,
+)
+from .optimization_store import OptimizationStore, get_optimization_store
 
 __all__ = [
     # Models
@@ -96,8 +119,14 @@ __all__ = [
     # Agents
     "PortfolioAgent",
     "OrderAgent",
+    "ExecutionAlgo",
+    "ExecutionScheduler",
     "RiskMonitor",
     "ExecutionCoordinator",
+    # Trigger Book
+    "Trigger",
+    "TriggerBook",
+    "get_trigger_book",
     # Strategy
     "RiskTolerance",
     "TradingStyle",
@@ -112,4 +141,22 @@ __all__ = [
     "get_strategy_preset",
     "get_all_presets",
     "StrategyEngine",
+    # Backtest
+    "BarPanel",
+    "BacktestConfig",
+    "BacktestResult",
+    "SweepResult",
+    "derive_scores",
+    "run_backtest",
+    "run_sweep",
+    # Optimizer
+    "OBJECTIVES",
+    "OptimizationResult",
+    "OptimizationRun",
+    "ParameterOptimizer",
+    "apply_param_set",
+    "grid_samples",
+    "random_samples",
+    "OptimizationStore",
+    "get_optimization_store",
 ]
@@ -0,0 +1,501 @@
+"""
+Strategy Backtest
+
+Runs the rule-based part of a TradingStrategy over daily bars for a whole
+universe at once:
+- Entry: StrategyEngine's score rules (at most MAX_FAILED_ENTRY_RULES
+  thresholds missed and a weighted score of at least BUY_SCORE_THRESHOLD),
+  best weighted scores first while position slots are free
+- Sizing: PositionSizingRules (risk-adjusted size, max positions, stock
+  ratio and cash ratio limits), as in StrategyEngine._calculate_position_size
+- Exit: stop-loss, take-profit, trailing stop and max holding days
+  (ExitConditions), as in StrategyEngine.evaluate_exit
+- Risk limits (optional RiskParameters): single position cap, the stricter
+  of the cash/stock ratio limits, max daily trades (new entries), and the
+  RiskMonitor's sudden-move pause (a held symbol closing at least
+  sudden_move_threshold_pct away from its last price pauses entries and
+  exits for the next day)
+
+LLM judgment and news-based exits are not simulated; entry conditions that
+StrategyEngine does not evaluate (RSI bands, require_uptrend, ...) are
+ignored here too.
+
+Days are simulated in order, since cash and slots carry over, but every
+rule is an array operation across all symbols. Signals use data up to a
+day's close and fill at the next day's open. Stops and targets fill
+intraday from the day's low/high (at the open when it gaps through); when
+both are hit on the same day the stop is assumed to come first.
+
+Usage:
+    panel = BarPanel.from_frames({"005930": df, "000660": df2})
+    result = run_backtest(panel, get_strategy_preset(StrategyPreset.TECHNICAL_BREAKOUT))
+    result.metrics["max_drawdown"]
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .models import RiskParameters
+from .strategy import EntryConditions, ExitConditions, PositionSizingRules, TradingStrategy
+from .strategy_engine import BUY_SCORE_THRESHOLD, MAX_FAILED_ENTRY_RULES, SCORE_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+
+SCORE_NAMES = ("technical_score", "fundamental_score", "sentiment_score", "risk_score")
+
+# Exit reasons (ExitDecision actions), by trade log code
+EXIT_REASONS = ("STOP_LOSS", "TAKE_PROFIT", "TRAILING_STOP", "TIME_EXIT")
+_STOP_LOSS, _TAKE_PROFIT, _TRAILING_STOP, _TIME_EXIT = range(len(EXIT_REASONS))
+
+TRADE_DTYPE = np.dtype([
+    ("symbol", "<i4"),       # index into BarPanel.symbols
+    ("entry_index", "<i4"),  # index into BarPanel.dates
+    ("exit_index", "<i4"),
+    ("entry_price", "<f8"),
+    ("exit_price", "<f8"),
+    ("quantity", "<f8"),
+    ("pnl", "<f8"),          # after costs
+    ("return_pct", "<f8"),   # after costs
+    ("reason", "i1"),        # index into EXIT_REASONS
+])
+
+
+# -------------------------------------------
+# Inputs
+# -------------------------------------------
+
+
+@dataclass(frozen=True)
+class BarPanel:
+    """Daily OHLCV bars of a universe as (days, symbols) arrays (NaN where a symbol has no bar)."""
+    dates: np.ndarray  # datetime64[D], ascending
+    symbols: Tuple[str, ...]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __post_init__(self):
+        shape = (len(self.dates), len(self.symbols))
+        for name in ("open", "high", "low", "close", "volume"):
+            if getattr(self, name).shape != shape:
+                raise ValueError(f"{name} must have shape {shape}")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.close.shape
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> "BarPanel":
+        """
+        Align per-symbol daily frames on their union of dates.
+
+        Args:
+            frames: symbol -> DataFrame with open/high/low/close/volume
+                columns and a "date" column or DatetimeIndex
+        """
+        columns = {}
+        for name in ("open", "high", "low", "close", "volume"):
+            series = {}
+            for symbol, df in frames.items():
+                if "date" in df.columns:
+                    df = df.set_index("date")
+                series[symbol] = df[name].astype(np.float64).groupby(level=0).last()
+            columns[name] = pd.DataFrame(series).sort_index()
+
+        close = columns["close"]
+        return cls(
+            dates=close.index.to_numpy().astype("datetime64[D]"),
+            symbols=tuple(close.columns),
+            **{name: frame.to_numpy() for name, frame in columns.items()},
+        )
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """Capital and trading costs."""
+    initial_capital: float = 100_000_000
+    fee_rate: float = 0.00015  # per side
+    sell_tax_rate: float = 0.0  # e.g. securities transaction tax
+    slippage_pct: float = 0.0  # per side, against the fill
+    whole_shares: bool = True  # False for fractional (coin) quantities
+
+
+def derive_scores(panel: BarPanel) -> Dict[str, np.ndarray]:
+    """
+    Bar-derived stand-ins for the analysis agents' scores (0-100 per day and symbol).
+
+    - technical_score: close above SMA20 and SMA20 above SMA60 (40%), RSI(14)
+      near 55 (30%), MACD histogram above zero (30%)
+    - sentiment_score: 20-day return, percentile across the universe
+    - risk_score: 20-day volatility, percentile across the universe
+    - fundamental_score: neutral 50 (not derivable from bars)
+
+    Scores are NaN until a symbol has 60 bars, so no entries are made then.
+    Pass stored analysis scores to run_backtest() to replace any of these.
+    """
+    close = pd.DataFrame(panel.close)
+
+    sma20 = close.rolling(20).mean()
+    sma60 = close.rolling(60).mean()
+    trend = 50.0 * (close > sma20) + 50.0 * (sma20 > sma60)
+
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+    rsi = 100 - 100 / (1 + gain / loss.replace(0, np.nan))
+    rsi = rsi.where(loss != 0, 100.0)
+    rsi_score = (100 - 2 * (rsi - 55).abs()).clip(lower=0)
+
+    macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+    macd_score = 100.0 * (macd - macd.ewm(span=9, adjust=False).mean() > 0)
+
+    warm = sma60.notna()
+    technical = (0.4 * trend + 0.3 * rsi_score + 0.3 * macd_score).where(warm)
+
+    returns = close.pct_change(20, fill_method=None)
+    volatility = close.pct_change(fill_method=None).rolling(20).std()
+
+    return {
+        "technical_score": technical.to_numpy(),
+        "fundamental_score": np.where(warm, 50.0, np.nan),
+        "sentiment_score": (returns.rank(axis=1, pct=True) * 100).where(warm).to_numpy(),
+        "risk_score": (volatility.rank(axis=1, pct=True) * 100).where(warm).to_numpy(),
+    }
+
+
+def entry_signals(scores: Dict[str, np.ndarray], entry: EntryConditions) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    StrategyEngine's rule-based BUY decision for every day and symbol.
+
+    Returns:
+        (signal, weighted score) arrays
+    """
+    tech, fund, sent, risk = (scores[name] for name in SCORE_NAMES)
+    failed = (
+        (tech < entry.min_technical_score).astype(np.int8)
+        + (fund < entry.min_fundamental_score)
+        + (sent < entry.min_sentiment_score)
+        + (risk > entry.max_risk_score)
+    )
+    weighted = (
+        tech * SCORE_WEIGHTS["technical_score"]
+        + fund * SCORE_WEIGHTS["fundamental_score"]
+        + sent * SCORE_WEIGHTS["sentiment_score"]
+        + (100 - risk) * SCORE_WEIGHTS["risk_score"]
+    )
+    # NaN scores compare False, so symbols without scores never signal
+    signal = (failed <= MAX_FAILED_ENTRY_RULES) & (weighted >= BUY_SCORE_THRESHOLD)
+    return signal, weighted
+
+
+def position_sizes(risk_score: np.ndarray, sizing: PositionSizingRules) -> np.ndarray:
+    """Risk-adjusted position sizes (fraction of equity) before account limits."""
+    size = np.full(risk_score.shape, sizing.max_position_pct)
+    if sizing.adjust_by_risk_score:
+        size = size * (1 - risk_score / 100 * sizing.risk_adjustment_factor)
+    return np.clip(size, sizing.min_position_pct, sizing.max_position_pct)
+
+
+# -------------------------------------------
+# Result
+# -------------------------------------------
+
+
+@dataclass
+class BacktestResult:
+    """Equity curve, trade log and summary metrics of one backtest."""
+    strategy_name: str
+    dates: np.ndarray
+    symbols: Tuple[str, ...]
+    equity: np.ndarray  # end-of-day equity
+    exposure: np.ndarray  # end-of-day stock value / equity
+    trades: np.ndarray  # TRADE_DTYPE, closed trades in exit order
+    open_positions: int
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    def trade_log(self) -> List[Dict[str, Any]]:
+        """Closed trades as dicts."""
+        return [
+            {
+                "symbol": self.symbols[t["symbol"]],
+                "entry_date": str(self.dates[t["entry_index"]]),
+                "exit_date": str(self.dates[t["exit_index"]]),
+                "entry_price": float(t["entry_price"]),
+                "exit_price": float(t["exit_price"]),
+                "quantity": float(t["quantity"]),
+                "pnl": float(t["pnl"]),
+                "return_pct": float(t["return_pct"]),
+                "reason": EXIT_REASONS[t["reason"]],
+            }
+            for t in self.trades
+        ]
+
+
+def _compute_metrics(
+    equity: np.ndarray,
+    exposure: np.ndarray,
+    trades: np.ndarray,
+    dates: np.ndarray,
+    traded_value: float,
+    initial_capital: float,
+) -> Dict[str, Any]:
+    days = len(equity)
+    if days == 0:
+        return {}
+
+    final = float(equity[-1])
+    total_return = final / initial_capital - 1
+    years = days / TRADING_DAYS_PER_YEAR
+
+    curve = np.concatenate(([initial_capital], equity))
+    daily = curve[1:] / curve[:-1] - 1
+    std = daily.std()
+    peak = np.maximum.accumulate(curve)
+    drawdown = curve / peak - 1
+
+    # Traded value per unit of average equity (buys and sells averaged)
+    turnover = traded_value / 2 / float(np.mean(equity))
+
+    wins = trades["pnl"] > 0
+    holding = (dates[trades["exit_index"]] - dates[trades["entry_index"]]).astype(np.int64)
+
+    return {
+        "final_equity": final,
+        "total_return": total_return,
+        "cagr": (final / initial_capital) ** (1 / years) - 1 if final > 0 else -1.0,
+        "sharpe": float(daily.mean() / std * np.sqrt(TRADING_DAYS_PER_YEAR)) if std > 0 else 0.0,
+        "volatility": float(std * np.sqrt(TRADING_DAYS_PER_YEAR)),
+        "max_drawdown": float(-drawdown.min()),
+        "turnover": turnover,
+        "annual_turnover": turnover / years,
+        "exposure": float(exposure.mean()),
+        "trades": int(len(trades)),
+        "win_rate": float(wins.mean()) if len(trades) else 0.0,
+        "avg_trade_return": float(trades["return_pct"].mean()) if len(trades) else 0.0,
+        "avg_holding_days": float(holding.mean()) if len(trades) else 0.0,
+        "exit_reasons": {
+            reason: int((trades["reason"] == code).sum()) for code, reason in enumerate(EXIT_REASONS)
+        },
+    }
+
+
+# -------------------------------------------
+# Simulation
+# -------------------------------------------
+
+
+def run_backtest(
+    panel: BarPanel,
+    strategy: TradingStrategy,
+    scores: Optional[Dict[str, np.ndarray]] = None,
+    config: Optional[BacktestConfig] = None,
+    risk_params: Optional[RiskParameters] = None,
+) -> BacktestResult:
+    """
+    Simulate a strategy over a bar panel.
+
+    Args:
+        panel: Daily bars of the universe
+        strategy: Strategy (preset or custom)
+        scores: Analysis scores by name (SCORE_NAMES), each shaped like the
+            panel; missing ones are derived from the bars (derive_scores)
+        config: Capital and costs
+        risk_params: Account risk limits applied on top of the strategy
+
+    Returns:
+        BacktestResult
+    """
+    config = config or BacktestConfig()
+    scores = dict(scores or {})
+    if any(name not in scores for name in SCORE_NAMES):
+        derived = derive_scores(panel)
+        for name in SCORE_NAMES:
+            scores.setdefault(name, derived[name])
+    for name in SCORE_NAMES:
+        if np.shape(scores[name]) != panel.shape:
+            raise ValueError(f"{name} must have shape {panel.shape}")
+
+    signal, weighted = entry_signals(scores, strategy.entry_conditions)
+    sizes = position_sizes(scores["risk_score"], strategy.position_sizing)
+    sizing = strategy.position_sizing
+    exits: ExitConditions = strategy.exit_conditions
+
+    min_cash_ratio, max_stock_pct = sizing.min_cash_ratio, sizing.max_total_stock_pct
+    max_entries = sizing.max_positions
+    sudden_move = np.inf
+    if risk_params is not None:
+        sizes = np.minimum(sizes, risk_params.max_single_position_pct)
+        min_cash_ratio = max(min_cash_ratio, risk_params.min_cash_ratio)
+        max_stock_pct = min(max_stock_pct, risk_params.max_total_stock_pct)
+        max_entries = risk_params.max_daily_trades
+        sudden_move = risk_params.sudden_move_threshold_pct / 100
+
+    opens, highs, lows, closes = panel.open, panel.high, panel.low, panel.close
+    days, n = panel.shape
+    buy_cost = (1 + config.slippage_pct) * (1 + config.fee_rate)
+    sell_net = (1 - config.slippage_pct) * (1 - config.fee_rate - config.sell_tax_rate)
+
+    # Position state per symbol
+    held = np.zeros(n, dtype=bool)
+    quantity = np.zeros(n)
+    entry_price = np.full(n, np.nan)  # fill price before costs
+    entry_cost = np.zeros(n)  # cash paid
+    entry_index = np.full(n, -1, dtype=np.int64)
+    highest = np.full(n, np.nan)
+    mark = np.full(n, np.nan)  # last close
+
+    cash = float(config.initial_capital)
+    traded_value = 0.0
+    equity = np.empty(days)
+    exposure = np.empty(days)
+    closed: List[np.ndarray] = []
+    paused = False
+    paused_days = 0
+
+    for t in range(days):
+        if paused:
+            # RiskMonitor pause: no entries and no trigger exits until resumed
+            paused_days += 1
+        # 1. Yesterday's signals fill at today's open
+        if t > 0 and not paused:
+            slots = min(sizing.max_positions - int(held.sum()), max_entries)
+            candidates = np.flatnonzero(signal[t - 1] & ~held & np.isfinite(opens[t]))
+            if slots > 0 and candidates.size:
+                order = candidates[np.argsort(-weighted[t - 1, candidates], kind="stable")][:slots]
+                stock_value = float(np.nansum(quantity * mark))
+                total = cash + stock_value
+                capacity = min(max_stock_pct - stock_value / total, cash / total - min_cash_ratio)
+
+                pct = sizes[t - 1, order]
+                pct = np.clip(np.minimum(pct, capacity - (np.cumsum(pct) - pct)), 0, None)
+                price = opens[t, order]
+                qty = total * pct / (price * buy_cost)
+                if config.whole_shares:
+                    qty = np.floor(qty)
+                buy = qty > 0
+                order, qty, price = order[buy], qty[buy], price[buy]
+
+                cost = qty * price * buy_cost
+                cash -= float(cost.sum())
+                traded_value += float((qty * price).sum())
+                held[order] = True
+                quantity[order] = qty
+                entry_price[order] = price
+                entry_cost[order] = cost
+                entry_index[order] = t
+                highest[order] = price
+                mark[order] = price
+
+        # 2. Exits (positions with a bar today, including today's entries)
+        active = np.flatnonzero(held & np.isfinite(lows[t]))
+        if active.size and not paused:
+            entry = entry_price[active]
+            low, high, open_ = lows[t, active], highs[t, active], opens[t, active]
+
+            # Downside: the higher of the stop-loss and trailing levels is crossed first
+            stop = entry * (1 - exits.stop_loss_pct)
+            reason_down = np.full(active.size, _STOP_LOSS, dtype=np.int8)
+            if exits.trailing_stop_enabled:
+                trail = highest[active] * (1 - exits.trailing_stop_pct)
+                reason_down[trail > stop] = _TRAILING_STOP
+                stop = np.maximum(stop, trail)
+            target = entry * (1 + exits.take_profit_pct)
+
+            hit_down = low <= stop
+            hit_up = ~hit_down & (high >= target)
+            reason = np.where(hit_down, reason_down, _TAKE_PROFIT).astype(np.int8)
+            price = np.where(hit_down, np.minimum(open_, stop), np.maximum(open_, target))
+            exiting = hit_down | hit_up
+
+            if exits.max_holding_days:
+                held_days = (panel.dates[t] - panel.dates[entry_index[active]]).astype(np.int64)
+                timed = ~exiting & (held_days >= exits.max_holding_days) & np.isfinite(closes[t, active])
+                reason[timed] = _TIME_EXIT
+                price = np.where(timed, closes[t, active], price)
+                exiting |= timed
+
+            highest[active] = np.fmax(highest[active], high)
+
+            if exiting.any():
+                out = active[exiting]
+                px, qty = price[exiting], quantity[out]
+                proceeds = qty * px * sell_net
+                cash += float(proceeds.sum())
+                traded_value += float((qty * px).sum())
+
+                trades = np.empty(out.size, dtype=TRADE_DTYPE)
+                trades["symbol"] = out
+                trades["entry_index"] = entry_index[out]
+                trades["exit_index"] = t
+                trades["entry_price"] = entry_price[out]
+                trades["exit_price"] = px
+                trades["quantity"] = qty
+                trades["pnl"] = proceeds - entry_cost[out]
+                trades["return_pct"] = proceeds / entry_cost[out] - 1
+                trades["reason"] = reason[exiting]
+                closed.append(trades)
+
+                held[out] = False
+                quantity[out] = 0.0
+                entry_price[out] = np.nan
+                highest[out] = np.nan
+
+        # 3. Mark to market at the close; a sudden move pauses the next day
+        with np.errstate(invalid="ignore", divide="ignore"):
+            paused = bool(np.any(held & (np.abs(closes[t] / mark - 1) >= sudden_move)))
+        mark = np.where(np.isfinite(closes[t]), closes[t], mark)
+        stock_value = float(np.nansum(quantity * mark))
+        equity[t] = cash + stock_value
+        exposure[t] = stock_value / equity[t] if equity[t] > 0 else 0.0
+
+    trades = np.concatenate(closed) if closed else np.empty(0, dtype=TRADE_DTYPE)
+    result = BacktestResult(
+        strategy_name=strategy.name,
+        dates=panel.dates,
+        symbols=panel.symbols,
+        equity=equity,
+        exposure=exposure,
+        trades=trades,
+        open_positions=int(held.sum()),
+    )
+    result.metrics = _compute_metrics(
+        equity, exposure, trades, panel.dates, traded_value, config.initial_capital
+    )
+    result.metrics["paused_days"] = paused_days
+    return result
+
+
+# -------------------------------------------
+# Parameter Overrides
+# -------------------------------------------
+
+
+def apply_params(strategy: TradingStrategy, params: Dict[str, Any]) -> TradingStrategy:
+    """
+    Copy a strategy with parameters replaced.
+
+    Args:
+        params: Dotted field paths to values, e.g. {"exit_conditions.stop_loss_pct": 0.05}
+
+    Raises:
+        KeyError: Unknown field path
+        pydantic.ValidationError: Value outside the field's range
+    """
+    data = strategy.model_dump()
+    for path, value in params.items():
+        *parents, name = path.split(".")
+        target = data
+        for part in parents:
+            target = target[part]
+        if not isinstance(target, dict) or name not in target:
+            raise KeyError(path)
+        target[name] = value
+    return TradingStrategy.model_validate(data)
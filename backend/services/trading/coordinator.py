@@ -32,7 +32,7 @@ from .models import (
     WatchStatus,
 )
 from .portfolio_agent import PortfolioAgent
-from .order_agent import OrderAgent, KiwoomRateLimiter
+from .order_agent import OrderAgent
 from .risk_monitor import RiskMonitor
 from .market_hours import MarketType, get_market_hours_service
 from .strategy import TradingStrategy
@@ -59,7 +59,6 @@ class ExecutionCoordinator:
     def __init__(
         self,
         kiwoom_client=None,
-        redis_client=None,
         risk_params: Optional[RiskParameters] = None,
     ):
         """
@@ -67,17 +66,14 @@ class ExecutionCoordinator:
 
         Args:
             kiwoom_client: Kiwoom API client
-            redis_client: Redis client for rate limiting
             risk_params: Risk parameters
         """
         self.risk_params = risk_params or RiskParameters()
 
         # Initialize agents
         self.portfolio_agent = PortfolioAgent(self.risk_params)
-        self.order_agent = OrderAgent(
-            kiwoom_client=kiwoom_client,
-            rate_limiter=KiwoomRateLimiter(redis_client),
-        )
+        # Orders share the Kiwoom client's rate limiter
+        self.order_agent = OrderAgent(kiwoom_client=kiwoom_client)
         self.risk_monitor = RiskMonitor(
             risk_params=self.risk_params,
             price_fetcher=self._get_current_price,
@@ -95,6 +91,7 @@ class ExecutionCoordinator:
         # Callbacks
         self._alert_callback: Optional[Callable[[TradingAlert], Awaitable[None]]] = None
         self._state_callback: Optional[Callable[[TradingState], Awaitable[None]]] = None
+        self._watch_list_listeners: List[Callable[[], None]] = []
 
         # Strategy
         self._strategy: Optional[TradingStrategy] = None
@@ -139,8 +136,12 @@ class ExecutionCoordinator:
         """Start the auto-trading system."""
         logger.info("[Coordinator] Starting auto-trading system")
 
-        # Fetch initial account info
+        # Fetch initial account info and follow later fills/balance updates
         await self._refresh_account_info()
+        if self._kiwoom:
+            from services.account_state import get_account_state_service
+
+            get_account_state_service().subscribe(self._apply_account_snapshot)
 
         # Start risk monitor
         await self.risk_monitor.start()
@@ -170,6 +171,10 @@ class ExecutionCoordinator:
         await self.risk_monitor.stop()
         self._state.mode = TradingMode.STOPPED
 
+        from services.account_state import get_account_state_service
+
+        get_account_state_service().unsubscribe(self._apply_account_snapshot)
+
         self._log_activity(
             ActivityType.SYSTEM_STOP,
             "Auto-trading system stopped",
@@ -665,29 +670,18 @@ class ExecutionCoordinator:
     # -------------------------------------------
 
     async def _refresh_account_info(self):
-        """Refresh account information from Kiwoom."""
+        """Refresh account information from the shared account state."""
         if self._kiwoom:
             try:
-                # Fetch balance from Kiwoom
-                # AccountBalance is a Pydantic model with:
-                # - evlu_amt: 평가금액 (may include cash, so don't use directly)
-                # - d2_ord_psbl_amt: D+2 주문가능금액 (available cash)
-                # - holdings: list of Holding with individual evlu_amt
-                # - total_value: property (evlu_amt + d2_ord_psbl_amt)
-                balance = await self._kiwoom.get_account_balance()
-
-                # Calculate stock value from holdings (not evlu_amt which may include cash)
-                # See kr_stocks.py line 968-970 for reference
-                stock_value = sum(h.evlu_amt for h in balance.holdings)
-                available_cash = balance.d2_ord_psbl_amt
-                total_equity = available_cash + stock_value
-
-                self._state.account = AccountInfo(
-                    total_equity=total_equity,
-                    available_cash=available_cash,
-                    total_stock_value=stock_value,
+                from services.account_state import get_account_state_service
+
+                # Stream-fed snapshot; REST only when the streams are down
+                snapshot = await get_account_state_service().get_snapshot()
+                self._apply_account_snapshot(snapshot)
+                logger.info(
+                    f"[Coordinator] Account refreshed: equity={snapshot.total_equity:,}, "
+                    f"cash={snapshot.available_cash:,}, stocks={snapshot.stock_value:,}"
                 )
-                logger.info(f"[Coordinator] Account refreshed: equity={total_equity:,}, cash={available_cash:,}, stocks={stock_value:,}")
             except Exception as e:
                 logger.error(f"[Coordinator] Failed to refresh account: {e}")
         else:
@@ -700,6 +694,16 @@ class ExecutionCoordinator:
 
         self._state.last_updated = datetime.now()
 
+    def _apply_account_snapshot(self, snapshot) -> None:
+        """Update account info from an AccountSnapshot (also called on every fill)."""
+        # Stock value comes from holdings (account evlu_amt may include cash)
+        self._state.account = AccountInfo(
+            total_equity=snapshot.total_equity,
+            available_cash=snapshot.available_cash,
+            total_stock_value=snapshot.stock_value,
+        )
+        self._state.last_updated = datetime.now()
+
     async def _get_current_price(self, ticker: str) -> float:
         """Get current price for a ticker."""
         if self._kiwoom:
@@ -725,6 +729,19 @@ class ExecutionCoordinator:
         """Set callback for state changes."""
         self._state_callback = callback
 
+    def on_watch_list_change(self, callback: Callable[[], None]):
+        """Register a (sync) listener called whenever the watch list changes."""
+        if callback not in self._watch_list_listeners:
+            self._watch_list_listeners.append(callback)
+
+    def _notify_watch_list_change(self):
+        """Notify watch list listeners."""
+        for callback in self._watch_list_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"[Coordinator] Watch list listener failed: {e}")
+
     async def _on_alert(self, alert: TradingAlert):
         """Handle alert from risk monitor."""
         self._state.pending_alerts.append(alert)
@@ -1165,6 +1182,7 @@ class ExecutionCoordinator:
             existing.last_checked = datetime.now()
 
             logger.info(f"[Coordinator] Watch list updated: {ticker}")
+            self._notify_watch_list_change()
             return existing
 
         # Create new watch list entry
@@ -1200,6 +1218,7 @@ class ExecutionCoordinator:
         )
 
         logger.info(f"[Coordinator] Added to watch list: {watched.id}")
+        self._notify_watch_list_change()
         return watched
 
     def get_watch_list(self) -> List[WatchedStock]:
@@ -1221,6 +1240,7 @@ class ExecutionCoordinator:
                 )
 
                 logger.info(f"[Coordinator] Removed from watch list: {watch_id}")
+                self._notify_watch_list_change()
                 return True
         return False
 
@@ -1280,6 +1300,7 @@ class ExecutionCoordinator:
         )
 
         logger.info(f"[Coordinator] Watch list converted: {watch_id} -> {queued_trade.id}")
+        self._notify_watch_list_change()
         return queued_trade
 
     def get_watched_stock(self, ticker: str) -> Optional[WatchedStock]:
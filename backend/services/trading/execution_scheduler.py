@@ -0,0 +1,434 @@
+"""
+Execution Scheduler
+
+Slices parent orders into child orders on a TWAP or volume-weighted (VWAP)
+schedule and tracks their fills.
+
+- Child orders are released at their scheduled offsets and submitted
+  concurrently; a slow submission never delays the next slice
+- Fills are reconciled from the Kiwoom order-execution stream (주문체결)
+  by order number instead of polling; a child still open at the fill
+  timeout has its remainder cancelled
+- VWAP weights follow the KRX intraday volume profile and each child is
+  capped by live traded volume (max participation)
+"""
+
+import asyncio
+import logging
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from .models import OrderRequest, OrderResult
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionAlgo(str, Enum):
+    """Parent order slicing algorithm."""
+    TWAP = "twap"  # Equal slices over time
+    VWAP = "vwap"  # Slices weighted by expected volume
+
+
+# Share of daily KRX volume per 30-minute bucket from 09:00 to 15:30.
+# U-shaped: heavy open, quiet midday, heavy close (incl. closing auction).
+KRX_INTRADAY_VOLUME_PROFILE = (
+    0.160, 0.090, 0.070, 0.060, 0.055, 0.050, 0.050,
+    0.050, 0.055, 0.060, 0.070, 0.085, 0.145,
+)
+
+_PROFILE_BUCKET_SECONDS = 30 * 60
+
+# Shortest schedule for which VWAP differs from TWAP (one profile bucket)
+VWAP_MIN_DURATION = float(_PROFILE_BUCKET_SECONDS)
+
+# Execution reports buffered while waiting for their order number
+_MAX_UNMATCHED = 500
+
+
+# -------------------------------------------
+# Schedule Building
+# -------------------------------------------
+
+
+def slice_offsets(num_slices: int, duration: float) -> List[float]:
+    """Release offsets (seconds from start) for evenly spaced slices."""
+    if num_slices <= 0:
+        return []
+    step = duration / num_slices if duration > 0 else 0.0
+    return [i * step for i in range(num_slices)]
+
+
+def profile_weights(
+    offsets: Sequence[float],
+    duration: float,
+    start: datetime,
+    profile: Sequence[float] = KRX_INTRADAY_VOLUME_PROFILE,
+) -> List[float]:
+    """
+    Volume weight for each slice from the intraday profile.
+
+    A slice takes the weight of the profile bucket containing its
+    midpoint, so short horizons inside one bucket degrade to TWAP.
+    """
+    if not offsets:
+        return []
+
+    market_open = start.replace(hour=9, minute=0, second=0, microsecond=0)
+    step = duration / len(offsets)
+    weights = []
+    for offset in offsets:
+        midpoint = start + timedelta(seconds=offset + step / 2)
+        bucket = int((midpoint - market_open).total_seconds() // _PROFILE_BUCKET_SECONDS)
+        weights.append(profile[min(max(bucket, 0), len(profile) - 1)])
+    return weights
+
+
+def split_quantity(quantity: int, weights: Sequence[float]) -> List[int]:
+    """
+    Apportion a quantity by weights (largest remainder).
+
+    The result always sums to quantity.
+    """
+    if not weights:
+        return []
+
+    total = sum(weights)
+    if total <= 0:
+        weights = [1.0] * len(weights)
+        total = float(len(weights))
+
+    exact = [quantity * w / total for w in weights]
+    shares = [math.floor(x) for x in exact]
+    leftover = quantity - sum(shares)
+    by_remainder = sorted(range(len(exact)), key=lambda i: exact[i] - shares[i], reverse=True)
+    for i in by_remainder[:leftover]:
+        shares[i] += 1
+    return shares
+
+
+# -------------------------------------------
+# Child Orders
+# -------------------------------------------
+
+
+@dataclass
+class ChildOrder:
+    """A scheduled slice of a parent order."""
+    index: int
+    planned_quantity: int
+    offset: float
+    request: Optional[OrderRequest] = None
+    order_no: Optional[str] = None
+    filled_quantity: int = 0
+    filled_value: float = 0.0
+    status: str = "scheduled"  # scheduled, submitted, partial, filled, cancelled, rejected, skipped
+    message: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def quantity(self) -> int:
+        return self.request.quantity if self.request else 0
+
+    @property
+    def avg_price(self) -> float:
+        return self.filled_value / self.filled_quantity if self.filled_quantity else 0.0
+
+    def apply_execution(self, execution) -> None:
+        """
+        Apply an order-execution report (주문체결).
+
+        Reports may carry either cumulative or per-fill quantities; the
+        cumulative fill is taken as max(ccld_qty, ord_qty - rmn_qty).
+        """
+        if execution.ccld_qty <= 0:
+            return  # acceptance / confirmation without a fill
+
+        filled = execution.ccld_qty
+        if execution.ord_qty:
+            filled = max(filled, execution.ord_qty - execution.rmn_qty)
+        filled = min(filled, self.quantity)
+
+        delta = filled - self.filled_quantity
+        if delta > 0:
+            price = execution.ccld_prc or (self.request.price if self.request else 0) or 0
+            self.filled_value += delta * price
+            self.filled_quantity = filled
+
+        if self.filled_quantity >= self.quantity:
+            self.status = "filled"
+            self.done.set()
+        elif self.filled_quantity > 0:
+            self.status = "partial"
+
+    def to_result(self) -> OrderResult:
+        """Convert to an OrderResult for aggregation."""
+        status = self.status
+        if status == "submitted":
+            status = "pending"
+
+        return OrderResult(
+            order_id=self.order_no or f"child-{self.index}",
+            ticker=self.request.ticker,
+            side=self.request.side,
+            requested_quantity=self.quantity,
+            filled_quantity=self.filled_quantity,
+            avg_price=self.avg_price,
+            status=status,
+            message=self.message,
+            filled_at=datetime.now() if self.filled_quantity > 0 else None,
+        )
+
+
+SubmitFn = Callable[[OrderRequest, bool], Awaitable[OrderResult]]
+CancelFn = Callable[[OrderRequest, str, int], Awaitable[bool]]
+
+
+# -------------------------------------------
+# Scheduler
+# -------------------------------------------
+
+
+class ExecutionScheduler:
+    """
+    Schedules, submits and tracks child orders.
+
+    The submit function receives (child_request, await_fill). With
+    await_fill=True it should return status "submitted" once the order is
+    accepted; fills are then taken from the execution stream. Any other
+    status is treated as final.
+
+    The cancel function receives (child_request, order_no, quantity) and
+    returns True once the broker accepted the cancellation. It is called
+    for the unfilled remainder of a child that times out.
+
+    Usage:
+        scheduler = ExecutionScheduler(submit, fill_stream=kr_realtime_service)
+        results = await scheduler.execute(order, ExecutionAlgo.VWAP, num_slices=5, duration=60)
+    """
+
+    def __init__(
+        self,
+        submit: SubmitFn,
+        fill_stream=None,
+        fill_timeout: float = 30.0,
+        cancel: Optional[CancelFn] = None,
+    ):
+        """
+        Initialize Execution Scheduler.
+
+        Args:
+            submit: Async function submitting one child order
+            fill_stream: Order-execution source with subscribe_order_execution /
+                unsubscribe_order_execution (e.g., KrRealtimeService)
+            fill_timeout: Seconds to wait for a submitted child to fill
+            cancel: Async function cancelling a child's unfilled remainder
+        """
+        self._submit = submit
+        self._cancel = cancel
+        self._stream = fill_stream
+        self.fill_timeout = fill_timeout
+
+        # order_no -> open child
+        self._open: Dict[str, ChildOrder] = {}
+        self._unmatched: Dict[str, list] = {}
+        self._active = 0
+
+    @property
+    def tracks_fills(self) -> bool:
+        """Whether fills are reconciled from the execution stream."""
+        return self._stream is not None
+
+    async def execute(
+        self,
+        order: OrderRequest,
+        algo: ExecutionAlgo = ExecutionAlgo.TWAP,
+        num_slices: int = 3,
+        duration: float = 0.0,
+        max_participation: Optional[float] = None,
+    ) -> List[OrderResult]:
+        """
+        Execute a parent order as scheduled child orders.
+
+        Args:
+            order: Parent order
+            algo: Slicing algorithm
+            num_slices: Number of child orders
+            duration: Seconds over which children are released
+            max_participation: Cap each child at this share of the volume
+                traded since the previous release (VWAP, live ticks only)
+
+        Returns:
+            One OrderResult per submitted child
+        """
+        offsets = slice_offsets(num_slices, duration)
+        if algo == ExecutionAlgo.VWAP:
+            weights = profile_weights(offsets, duration, datetime.now())
+        else:
+            weights = [1.0] * len(offsets)
+
+        children = [
+            ChildOrder(index=i, planned_quantity=qty, offset=offsets[i])
+            for i, qty in enumerate(split_quantity(order.quantity, weights))
+            if qty > 0
+        ]
+        parent_id = str(uuid.uuid4())[:8]
+
+        logger.info(
+            f"[ExecutionScheduler] {parent_id}: {algo.value} {order.quantity} {order.ticker} "
+            f"in {len(children)} slices over {duration:.0f}s"
+        )
+
+        use_volume = bool(
+            algo == ExecutionAlgo.VWAP
+            and max_participation
+            and hasattr(self._stream, "get_latest_tick")
+        )
+
+        # A tick subscription keeps the latest cumulative volume fresh
+        keepalive = (lambda tick: None) if use_volume else None
+
+        await self._attach(order.ticker, keepalive)
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            tasks = []
+            carry = 0
+            last_volume = self._live_volume(order.ticker) if use_volume else None
+
+            for n, child in enumerate(children):
+                delay = start + child.offset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                quantity = child.planned_quantity + carry
+                carry = 0
+
+                if use_volume and n < len(children) - 1:
+                    volume = self._live_volume(order.ticker)
+                    if volume is not None and last_volume is not None:
+                        cap = int((volume - last_volume) * max_participation)
+                        if cap < quantity:
+                            carry = quantity - cap
+                            quantity = cap
+                    last_volume = volume
+
+                if quantity <= 0:
+                    child.status = "skipped"
+                    continue
+
+                child.request = OrderRequest(
+                    ticker=order.ticker,
+                    stock_name=order.stock_name,
+                    side=order.side,
+                    quantity=quantity,
+                    price=order.price,
+                    order_type=order.order_type,
+                    session_id=order.session_id,
+                    reason=f"{order.reason} ({algo.value} {n + 1}/{len(children)})",
+                )
+                tasks.append(asyncio.create_task(self._run_child(child)))
+
+            await asyncio.gather(*tasks)
+
+        finally:
+            await self._detach(order.ticker, keepalive)
+
+        return [child.to_result() for child in children if child.request is not None]
+
+    async def _run_child(self, child: ChildOrder) -> None:
+        """Submit a child order and wait for its fill."""
+        try:
+            result = await self._submit(child.request, self.tracks_fills)
+        except Exception as e:
+            child.status = "rejected"
+            child.message = str(e)
+            return
+
+        child.order_no = result.order_id
+        child.message = result.message
+
+        if result.status != "submitted":
+            child.filled_quantity = result.filled_quantity
+            child.filled_value = result.filled_quantity * result.avg_price
+            child.status = result.status
+            return
+
+        child.status = "submitted"
+        self._open[child.order_no] = child
+        for execution in self._unmatched.pop(child.order_no, []):
+            child.apply_execution(execution)
+
+        try:
+            await asyncio.wait_for(child.done.wait(), timeout=self.fill_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[ExecutionScheduler] Child {child.order_no} not filled after "
+                f"{self.fill_timeout}s ({child.filled_quantity}/{child.quantity})"
+            )
+            # Still routed while cancelling: fills racing the cancel are counted
+            await self._cancel_remainder(child)
+        finally:
+            self._open.pop(child.order_no, None)
+
+    async def _cancel_remainder(self, child: ChildOrder) -> None:
+        """Cancel a timed-out child's unfilled quantity at the broker."""
+        remaining = child.quantity - child.filled_quantity
+        if remaining <= 0:
+            return
+
+        if self._cancel is None:
+            child.message = f"{remaining} unfilled after {self.fill_timeout:.0f}s, not cancelled"
+            return
+
+        try:
+            cancelled = await self._cancel(child.request, child.order_no, remaining)
+        except Exception as e:
+            cancelled = False
+            logger.error(f"[ExecutionScheduler] Cancel of child {child.order_no} failed: {e}")
+
+        if not cancelled:
+            child.message = f"{remaining} unfilled, cancel failed"
+            return
+
+        remaining = child.quantity - child.filled_quantity
+        if child.status != "filled":
+            child.status = "partial" if child.filled_quantity > 0 else "cancelled"
+            child.message = f"{remaining} unfilled cancelled after {self.fill_timeout:.0f}s"
+
+    def on_execution(self, execution) -> None:
+        """Route an order-execution report to its child order."""
+        child = self._open.get(execution.ord_no)
+        if child is not None:
+            child.apply_execution(execution)
+            return
+
+        # Reports can arrive before the submit call returns the order number
+        if self._active and len(self._unmatched) < _MAX_UNMATCHED:
+            self._unmatched.setdefault(execution.ord_no, []).append(execution)
+
+    def _live_volume(self, ticker: str) -> Optional[int]:
+        tick = self._stream.get_latest_tick(ticker)
+        return tick.acml_vol if tick is not None and tick.acml_vol else None
+
+    async def _attach(self, ticker: str, keepalive: Optional[Callable]) -> None:
+        self._active += 1
+        if self._stream is None:
+            return
+        if self._active == 1:
+            await self._stream.subscribe_order_execution(self.on_execution)
+        if keepalive is not None:
+            await self._stream.subscribe_tick([ticker], keepalive)
+
+    async def _detach(self, ticker: str, keepalive: Optional[Callable]) -> None:
+        self._active -= 1
+        if self._stream is None:
+            return
+        if keepalive is not None:
+            await self._stream.unsubscribe_tick([ticker], keepalive)
+        if self._active == 0:
+            await self._stream.unsubscribe_order_execution(self.on_execution)
+            self._unmatched.clear()
@@ -4,7 +4,8 @@ Market Hours Service
 Provides market open/close time checking for different markets.
 Supports Korean stocks (KRX) and cryptocurrency (24/7).
 
-Updated to use dynamic KRX holiday data from KRXHolidayService.
+Updated to use dynamic KRX holiday data from KRXHolidayService; next-open
+lookups use the compiled TradingCalendar instead of stepping day by day.
 
 Also provides KRX tick size (호가 단위) calculation functions.
 """
@@ -16,6 +17,8 @@ import pytz
 
 import structlog
 
+from services.krx_holiday.calendar import TradingCalendar
+
 logger = structlog.get_logger()
 
 
@@ -95,6 +98,7 @@ class MarketHoursService:
 
     def __init__(self):
         self._holiday_cache: Set[date] = set(self.FALLBACK_HOLIDAYS)
+        self._fallback_calendar = TradingCalendar(self.FALLBACK_HOLIDAYS)
         self._holiday_service = None
         self._holiday_service_checked = False
 
@@ -126,17 +130,24 @@ class MarketHoursService:
 
         Uses KRXHolidayService if available, falls back to hardcoded holidays.
         """
-        # Try to use dynamic holiday service
+        return self._krx_calendar().is_holiday(check_date)
+
+    def _krx_calendar(self) -> TradingCalendar:
+        """
+        Get the compiled KRX trading calendar.
+
+        Uses KRXHolidayService's calendar if available, falls back to one
+        compiled from hardcoded holidays.
+        """
         holiday_service = self._get_holiday_service()
         if holiday_service:
             try:
-                return holiday_service.is_holiday(check_date)
+                return holiday_service.calendar
             except Exception as e:
-                logger.warning(f"Error checking holiday via service: {e}")
+                logger.warning(f"Error loading calendar via service: {e}")
                 # Fall through to fallback
 
-        # Fallback to hardcoded holidays
-        return check_date in self._holiday_cache
+        return self._fallback_calendar
 
     def _get_holiday_name(self, check_date: date) -> Optional[str]:
         """
@@ -219,10 +230,11 @@ class MarketHoursService:
         today = now.date()
         weekday = now.weekday()  # 0=Monday, 6=Sunday
 
+        calendar = self._krx_calendar()
+
         # Weekend check
         if weekday >= 5:
-            next_monday = today + timedelta(days=(7 - weekday))
-            next_open = datetime.combine(next_monday, time(9, 0), tzinfo=KST)
+            next_open = datetime.combine(calendar.next_trading_day(today), time(9, 0), tzinfo=KST)
             return MarketSession(
                 is_open=False,
                 current_time=now,
@@ -232,15 +244,9 @@ class MarketHoursService:
             )
 
         # Holiday check (using dynamic holiday service)
-        if self._is_krx_holiday(today):
+        if calendar.is_holiday(today):
             holiday_name = self._get_holiday_name(today) or "Holiday"
-            next_day = today + timedelta(days=1)
-            while next_day.weekday() >= 5 or self._is_krx_holiday(next_day):
-                next_day += timedelta(days=1)
-                # Safety limit
-                if (next_day - today).days > 30:
-                    break
-            next_open = datetime.combine(next_day, time(9, 0), tzinfo=KST)
+            next_open = datetime.combine(calendar.next_trading_day(today), time(9, 0), tzinfo=KST)
             return MarketSession(
                 is_open=False,
                 current_time=now,
@@ -265,13 +271,7 @@ class MarketHoursService:
             )
 
         if current_time > market_close:
-            next_day = today + timedelta(days=1)
-            while next_day.weekday() >= 5 or self._is_krx_holiday(next_day):
-                next_day += timedelta(days=1)
-                # Safety limit
-                if (next_day - today).days > 30:
-                    break
-            next_open = datetime.combine(next_day, market_open, tzinfo=KST)
+            next_open = datetime.combine(calendar.next_trading_day(today), market_open, tzinfo=KST)
             return MarketSession(
                 is_open=False,
                 current_time=now,
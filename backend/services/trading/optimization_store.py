@@ -0,0 +1,359 @@
+"""
+Optimization Result Storage
+
+SQLite-based storage for parameter optimization runs.
+
+Results are keyed by (context_key, param_key): the same parameter set
+backtested on the same bars, base strategy, base risk parameters and costs
+always gives the same metrics, so a stored result is reused by every later
+run instead of being evaluated again.
+"""
+
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Metrics stored as columns, so results can be filtered and ordered by them
+METRIC_COLUMNS = (
+    "sharpe",
+    "cagr",
+    "total_return",
+    "max_drawdown",
+    "volatility",
+    "turnover",
+    "win_rate",
+    "trades",
+)
+
+
+class OptimizationStore:
+    """
+    SQLite-based storage for optimization runs and backtest results.
+
+    Tables:
+    - optimization_runs: one row per run (objective, sample counts, best set)
+    - optimization_results: metrics per (context_key, param_key), shared by runs
+    - optimization_run_results: which results each run evaluated or reused
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the storage.
+
+        Args:
+            db_path: Path to SQLite database file.
+                     Defaults to 'data/optimization.db' in project root.
+        """
+        if db_path is None:
+            data_dir = Path(__file__).parent.parent.parent / "data"
+            data_dir.mkdir(exist_ok=True)
+            db_path = str(data_dir / "optimization.db")
+
+        self.db_path = db_path
+        self._init_database()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get database connection with context management."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self):
+        """Initialize database schema."""
+        metric_columns = ",\n".join(f"                    {name} REAL" for name in METRIC_COLUMNS)
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS optimization_runs (
+                    id TEXT PRIMARY KEY,
+                    name TEXT,
+                    status TEXT NOT NULL,
+                    strategy_name TEXT,
+                    context_key TEXT,
+                    objective TEXT NOT NULL,
+                    symbols INTEGER,
+                    start_date TEXT,
+                    end_date TEXT,
+                    samples INTEGER DEFAULT 0,
+                    evaluated INTEGER DEFAULT 0,
+                    cached INTEGER DEFAULT 0,
+                    best_param_key TEXT,
+                    best_score REAL,
+                    error TEXT,
+                    base_strategy TEXT,
+                    base_risk_params TEXT,
+                    started_at TEXT NOT NULL,
+                    completed_at TEXT
+                )
+            """)
+
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS optimization_results (
+                    context_key TEXT NOT NULL,
+                    param_key TEXT NOT NULL,
+                    params TEXT NOT NULL,
+{metric_columns},
+                    metrics TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (context_key, param_key)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS optimization_run_results (
+                    run_id TEXT NOT NULL,
+                    param_key TEXT NOT NULL,
+                    score REAL,
+                    PRIMARY KEY (run_id, param_key)
+                )
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_optimization_runs_started
+                ON optimization_runs(started_at)
+            """)
+
+            conn.commit()
+            logger.debug(f"Initialized optimization database at {self.db_path}")
+
+    # -------------------------------------------
+    # Runs
+    # -------------------------------------------
+
+    def create_run(
+        self,
+        run_id: str,
+        objective: str,
+        name: Optional[str] = None,
+        strategy: Optional[Dict[str, Any]] = None,
+        risk_params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a started run (status "running")."""
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO optimization_runs
+                    (id, name, status, strategy_name, objective, base_strategy, base_risk_params, started_at)
+                VALUES (?, ?, 'running', ?, ?, ?, ?, ?)
+                """,
+                (
+                    run_id,
+                    name,
+                    (strategy or {}).get("name"),
+                    objective,
+                    json.dumps(strategy, default=str) if strategy is not None else None,
+                    json.dumps(risk_params, default=str) if risk_params is not None else None,
+                    datetime.now().isoformat(),
+                ),
+            )
+            conn.commit()
+
+    def update_run(self, run_id: str, **fields: Any) -> None:
+        """Update run columns (status, counts, best set, error, ...)."""
+        if not fields:
+            return
+        if fields.get("status") in ("completed", "failed"):
+            fields.setdefault("completed_at", datetime.now().isoformat())
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self._get_connection() as conn:
+            conn.execute(
+                f"UPDATE optimization_runs SET {assignments} WHERE id = ?",
+                (*fields.values(), run_id),
+            )
+            conn.commit()
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get a run with its best parameter set and metrics."""
+        with self._get_connection() as conn:
+            row = conn.execute("SELECT * FROM optimization_runs WHERE id = ?", (run_id,)).fetchone()
+            if row is None:
+                return None
+            run = self._run_to_dict(row)
+
+            run["best"] = None
+            if row["best_param_key"]:
+                best = conn.execute(
+                    "SELECT * FROM optimization_results WHERE context_key = ? AND param_key = ?",
+                    (row["context_key"], row["best_param_key"]),
+                ).fetchone()
+                if best is not None:
+                    run["best"] = self._result_to_dict(best)
+                    run["best"]["score"] = row["best_score"]
+            return run
+
+    def list_runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent runs first."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM optimization_runs ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+            return [self._run_to_dict(row) for row in rows]
+
+    # -------------------------------------------
+    # Results
+    # -------------------------------------------
+
+    def get_cached(self, context_key: str, param_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Stored metrics for the given parameter keys (param_key -> metrics)."""
+        keys = list(param_keys)
+        cached = {}
+        with self._get_connection() as conn:
+            # Stay below SQLite's host parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = conn.execute(
+                    f"""
+                    SELECT param_key, metrics FROM optimization_results
+                    WHERE context_key = ? AND param_key IN ({", ".join("?" * len(chunk))})
+                    """,
+                    (context_key, *chunk),
+                ).fetchall()
+                cached.update((row["param_key"], json.loads(row["metrics"])) for row in rows)
+        return cached
+
+    def save_results(self, context_key: str, results: Iterable[tuple]) -> int:
+        """
+        Save evaluated parameter sets.
+
+        Args:
+            context_key: Bars/base/cost fingerprint the results belong to
+            results: (param_key, params, metrics) tuples
+
+        Returns:
+            Number of results saved
+        """
+        rows = [
+            (
+                context_key,
+                param_key,
+                json.dumps(params, sort_keys=True),
+                *(metrics.get(name) for name in METRIC_COLUMNS),
+                json.dumps(metrics),
+            )
+            for param_key, params, metrics in results
+        ]
+        if not rows:
+            return 0
+        placeholders = ", ".join("?" * (3 + len(METRIC_COLUMNS) + 1))
+        with self._get_connection() as conn:
+            conn.executemany(
+                f"""
+                INSERT OR REPLACE INTO optimization_results
+                    (context_key, param_key, params, {", ".join(METRIC_COLUMNS)}, metrics)
+                VALUES ({placeholders})
+                """,
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
+    def link_results(self, run_id: str, scores: Dict[str, Optional[float]]) -> None:
+        """Record the results a run evaluated or reused, with its objective scores."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO optimization_run_results (run_id, param_key, score) VALUES (?, ?, ?)",
+                [(run_id, key, score) for key, score in scores.items()],
+            )
+            conn.commit()
+
+    def get_results(
+        self,
+        run_id: str,
+        order_by: str = "score",
+        descending: bool = True,
+        min_trades: int = 0,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """
+        Results of a run, ordered by its objective score or a metric.
+
+        Args:
+            run_id: Run ID
+            order_by: "score" or one of METRIC_COLUMNS
+            descending: Highest first
+            min_trades: Skip results with fewer closed trades
+            limit: Maximum results
+
+        Raises:
+            ValueError: Unknown order_by
+        """
+        if order_by != "score" and order_by not in METRIC_COLUMNS:
+            raise ValueError(f"Cannot order by {order_by!r}")
+        column = "l.score" if order_by == "score" else f"r.{order_by}"
+        direction = "DESC" if descending else "ASC"
+
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT r.*, l.score AS score FROM optimization_run_results l
+                JOIN optimization_runs o ON o.id = l.run_id
+                JOIN optimization_results r
+                    ON r.context_key = o.context_key AND r.param_key = l.param_key
+                WHERE l.run_id = ? AND r.trades >= ?
+                ORDER BY {column} IS NULL, {column} {direction}
+                LIMIT ?
+                """,
+                (run_id, min_trades, limit),
+            ).fetchall()
+            results = []
+            for row in rows:
+                result = self._result_to_dict(row)
+                result["score"] = row["score"]
+                results.append(result)
+            return results
+
+    def get_result(self, run_id: str, param_key: str) -> Optional[Dict[str, Any]]:
+        """One result of a run."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                """
+                SELECT r.*, l.score AS score FROM optimization_run_results l
+                JOIN optimization_runs o ON o.id = l.run_id
+                JOIN optimization_results r
+                    ON r.context_key = o.context_key AND r.param_key = l.param_key
+                WHERE l.run_id = ? AND l.param_key = ?
+                """,
+                (run_id, param_key),
+            ).fetchone()
+            if row is None:
+                return None
+            result = self._result_to_dict(row)
+            result["score"] = row["score"]
+            return result
+
+    def _run_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        run = dict(row)
+        for name in ("base_strategy", "base_risk_params"):
+            run[name] = json.loads(run[name]) if run[name] else None
+        return run
+
+    def _result_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "param_key": row["param_key"],
+            "params": json.loads(row["params"]),
+            "metrics": json.loads(row["metrics"]),
+            "created_at": row["created_at"],
+        }
+
+
+# Singleton instance
+_store: Optional[OptimizationStore] = None
+
+
+def get_optimization_store() -> OptimizationStore:
+    """Get the singleton OptimizationStore instance."""
+    global _store
+    if _store is None:
+        _store = OptimizationStore()
+    return _store
@@ -0,0 +1,607 @@
+"""
+Parameter Optimizer
+
+Searches RiskParameters and strategy preset parameters for the set that
+backtests best on historical bars:
+- Samples: every grid combination (grid_samples) or random draws from
+  ranges (random_samples)
+- Evaluation: run_backtest in worker processes; the bars and scores are
+  copied once into a shared memory block that every worker maps
+  (evaluate_param_sets); run_sweep backtests a plain strategy grid on it
+- Caching: metrics are kept per (context, parameter set), so a set already
+  evaluated on the same bars, base parameters and costs is never rerun
+- Storage: runs and results go to OptimizationStore, queryable by run,
+  objective score or metric
+
+Parameter paths are TradingStrategy dotted paths (see apply_params), or
+"risk.<field>" for RiskParameters fields:
+    {"exit_conditions.stop_loss_pct": [0.03, 0.05], "risk.sudden_move_threshold_pct": [5, 10]}
+
+Usage:
+    optimizer = ParameterOptimizer(panel, get_strategy_preset(StrategyPreset.BALANCED), store=store)
+    run = optimizer.run(random_samples({"risk.max_single_position_pct": (0.05, 0.3)}, 200))
+    run.best.params
+
+    results = run_sweep(panel, strategy, {"exit_conditions.stop_loss_pct": [0.05, 0.07, 0.10]})
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import random
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .backtest import (
+    SCORE_NAMES,
+    BacktestConfig,
+    BarPanel,
+    apply_params,
+    derive_scores,
+    run_backtest,
+)
+from .models import RiskParameters
+from .optimization_store import OptimizationStore
+from .strategy import TradingStrategy
+
+logger = logging.getLogger(__name__)
+
+RISK_PREFIX = "risk."
+
+# Objective metrics: 1 = higher is better, -1 = lower is better
+OBJECTIVES = {
+    "sharpe": 1,
+    "cagr": 1,
+    "total_return": 1,
+    "win_rate": 1,
+    "max_drawdown": -1,
+    "volatility": -1,
+    "turnover": -1,
+}
+
+# Bar and score arrays in a shared block, in this order
+_SHARED_ARRAYS = ("open", "high", "low", "close", "volume", *SCORE_NAMES)
+
+# RiskParameters fields the backtest simulates (the rest do not change results)
+_SIMULATED_RISK_FIELDS = (
+    "max_single_position_pct",
+    "min_cash_ratio",
+    "max_total_stock_pct",
+    "sudden_move_threshold_pct",
+    "max_daily_trades",
+)
+
+
+# -------------------------------------------
+# Parameter Sets
+# -------------------------------------------
+
+
+def apply_param_set(
+    strategy: TradingStrategy,
+    risk_params: RiskParameters,
+    params: Dict[str, Any],
+) -> Tuple[TradingStrategy, RiskParameters]:
+    """
+    Copy a strategy and risk parameters with a parameter set applied.
+
+    Raises:
+        KeyError: Unknown parameter path
+        pydantic.ValidationError: Value outside the field's range
+    """
+    strategy_params = {k: v for k, v in params.items() if not k.startswith(RISK_PREFIX)}
+    risk_values = {k[len(RISK_PREFIX):]: v for k, v in params.items() if k.startswith(RISK_PREFIX)}
+
+    if strategy_params:
+        strategy = apply_params(strategy, strategy_params)
+    if risk_values:
+        data = risk_params.model_dump()
+        for name, value in risk_values.items():
+            if name not in data:
+                raise KeyError(f"{RISK_PREFIX}{name}")
+            data[name] = value
+        risk_params = RiskParameters.model_validate(data)
+    return strategy, risk_params
+
+
+def grid_samples(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Every combination of a grid's values, in grid order."""
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def random_samples(
+    space: Dict[str, Any],
+    count: int,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Random parameter sets.
+
+    Args:
+        space: Path -> (low, high) range or list of choices. Ranges with
+            integer bounds draw integers; float draws are rounded to 4
+            decimals so that nearby runs can share cached results.
+        count: Number of draws (duplicates are dropped)
+        seed: Random seed, for reproducible samples
+
+    Raises:
+        ValueError: Invalid range or empty choices
+    """
+    rng = random.Random(seed)
+    samples: Dict[str, Dict[str, Any]] = {}
+    for _ in range(count):
+        params = {}
+        for path, spec in space.items():
+            if isinstance(spec, tuple):
+                if len(spec) != 2 or spec[0] > spec[1]:
+                    raise ValueError(f"{path}: range must be (low, high)")
+                low, high = spec
+                if isinstance(low, int) and isinstance(high, int):
+                    params[path] = rng.randint(low, high)
+                else:
+                    params[path] = round(rng.uniform(low, high), 4)
+            else:
+                if not spec:
+                    raise ValueError(f"{path}: no choices")
+                params[path] = rng.choice(list(spec))
+        samples.setdefault(param_key(params), params)
+    return list(samples.values())
+
+
+def param_key(params: Dict[str, Any]) -> str:
+    """Stable key of a parameter set."""
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def context_key(
+    panel: BarPanel,
+    scores: Dict[str, np.ndarray],
+    strategy: TradingStrategy,
+    risk_params: RiskParameters,
+    config: BacktestConfig,
+) -> str:
+    """
+    Fingerprint of everything a parameter set is evaluated against.
+
+    Covers the bars, scores, the simulated parts of the base strategy and
+    risk parameters, and the capital/cost settings.
+    """
+    digest = hashlib.sha1()
+    digest.update(panel.dates.astype("datetime64[D]").astype(np.int64).tobytes())
+    digest.update(json.dumps(panel.symbols).encode())
+    for name in _SHARED_ARRAYS[:5]:
+        digest.update(np.ascontiguousarray(getattr(panel, name), dtype=np.float64).tobytes())
+    for name in SCORE_NAMES:
+        digest.update(np.ascontiguousarray(scores[name], dtype=np.float64).tobytes())
+    base = {
+        "strategy": strategy.model_dump(
+            mode="json", include={"entry_conditions", "exit_conditions", "position_sizing"}
+        ),
+        "risk": risk_params.model_dump(mode="json", include=set(_SIMULATED_RISK_FIELDS)),
+        "config": vars(config),
+    }
+    digest.update(json.dumps(base, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def objective_score(metrics: Dict[str, Any], objective: str, min_trades: int = 0) -> Optional[float]:
+    """Objective value, higher is better (None below min_trades)."""
+    if metrics.get("trades", 0) < min_trades:
+        return None
+    return OBJECTIVES[objective] * float(metrics[objective])
+
+
+# -------------------------------------------
+# Shared Bars
+# -------------------------------------------
+
+
+@dataclass(frozen=True)
+class SharedBarsRef:
+    """Picklable handle to a panel and its scores in a shared memory block."""
+    shm_name: str
+    dates: np.ndarray
+    symbols: Tuple[str, ...]
+
+
+class SharedBars:
+    """
+    Panel and score arrays copied into one shared memory block.
+
+    The creator owns the block; use as a context manager (or call close())
+    to release and unlink it.
+    """
+
+    def __init__(self, panel: BarPanel, scores: Dict[str, np.ndarray]):
+        days, n = panel.shape
+        self._shm = shared_memory.SharedMemory(create=True, size=max(len(_SHARED_ARRAYS) * days * n * 8, 1))
+        try:
+            block = np.ndarray((len(_SHARED_ARRAYS), days, n), dtype=np.float64, buffer=self._shm.buf)
+            for i, name in enumerate(_SHARED_ARRAYS):
+                block[i] = scores[name] if name in SCORE_NAMES else getattr(panel, name)
+            del block
+        except Exception:
+            self.close()
+            raise
+        self.ref = SharedBarsRef(shm_name=self._shm.name, dates=panel.dates, symbols=panel.symbols)
+
+    def close(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedBars":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_shared_bars(
+    ref: SharedBarsRef,
+) -> Tuple[shared_memory.SharedMemory, BarPanel, Dict[str, np.ndarray]]:
+    """
+    Map a SharedBarsRef without copying.
+
+    The arrays are views into the returned block, which must stay open
+    while they are used.
+    """
+    # Workers are spawned children and share the creator's resource tracker,
+    # so attaching here must not unregister the block; the creator unlinks it.
+    shm = shared_memory.SharedMemory(name=ref.shm_name)
+    block = np.ndarray((len(_SHARED_ARRAYS), len(ref.dates), len(ref.symbols)), dtype=np.float64, buffer=shm.buf)
+    arrays = dict(zip(_SHARED_ARRAYS, block))
+    panel = BarPanel(
+        dates=ref.dates,
+        symbols=ref.symbols,
+        **{name: arrays[name] for name in _SHARED_ARRAYS[:5]},
+    )
+    return shm, panel, {name: arrays[name] for name in SCORE_NAMES}
+
+
+# Worker state, set once per process by _init_optimizer_worker
+_worker_inputs: Optional[tuple] = None
+
+
+def _init_optimizer_worker(
+    ref: SharedBarsRef,
+    strategy: TradingStrategy,
+    risk_params: Optional[RiskParameters],
+    config: BacktestConfig,
+) -> None:
+    global _worker_inputs
+    shm, panel, scores = attach_shared_bars(ref)
+    _worker_inputs = (shm, panel, scores, strategy, risk_params, config)
+
+
+def _evaluate_in_worker(params: Dict[str, Any]) -> Dict[str, Any]:
+    _, panel, scores, strategy, risk_params, config = _worker_inputs
+    return _backtest_param_set(panel, scores, strategy, risk_params, config, params)
+
+
+def _backtest_param_set(
+    panel: BarPanel,
+    scores: Dict[str, np.ndarray],
+    strategy: TradingStrategy,
+    risk_params: Optional[RiskParameters],
+    config: BacktestConfig,
+    params: Dict[str, Any],
+) -> Dict[str, Any]:
+    if risk_params is None:
+        variant, risk = apply_params(strategy, params), None
+    else:
+        variant, risk = apply_param_set(strategy, risk_params, params)
+    return run_backtest(panel, variant, scores, config, risk).metrics
+
+
+def evaluate_param_sets(
+    panel: BarPanel,
+    scores: Dict[str, np.ndarray],
+    strategy: TradingStrategy,
+    samples: Sequence[Dict[str, Any]],
+    risk_params: Optional[RiskParameters] = None,
+    config: Optional[BacktestConfig] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Backtest parameter sets across worker processes sharing one copy of the bars.
+
+    Blocking; call it from a thread inside the event loop.
+
+    Args:
+        scores: Every SCORE_NAMES array (see derive_scores)
+        samples: Parameter sets, already validated
+        risk_params: Base risk parameters (None: no risk limits, and
+            "risk.<field>" paths are rejected)
+        max_workers: Worker processes (default: CPU count; 0 runs inline)
+
+    Returns:
+        Backtest metrics per parameter set, in sample order
+    """
+    if not samples:
+        return []
+    config = config or BacktestConfig()
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = min(max_workers, len(samples))
+    if workers <= 1:
+        return [_backtest_param_set(panel, scores, strategy, risk_params, config, params) for params in samples]
+
+    with SharedBars(panel, scores) as shared:
+        # spawn: never fork a process that may have a running event loop
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_optimizer_worker,
+            initargs=(shared.ref, strategy, risk_params, config),
+        ) as pool:
+            chunksize = max(1, len(samples) // (workers * 4))
+            return list(pool.map(_evaluate_in_worker, samples, chunksize=chunksize))
+
+
+def _complete_scores(panel: BarPanel, scores: Optional[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Given scores plus the missing ones derived from the bars (once, not per worker)."""
+    scores = dict(scores or {})
+    if any(name not in scores for name in SCORE_NAMES):
+        derived = derive_scores(panel)
+        for name in SCORE_NAMES:
+            scores.setdefault(name, derived[name])
+    return scores
+
+
+# -------------------------------------------
+# Sweeps
+# -------------------------------------------
+
+
+@dataclass
+class SweepResult:
+    """Metrics of one parameter combination."""
+    params: Dict[str, Any]
+    metrics: Dict[str, Any]
+
+
+def run_sweep(
+    panel: BarPanel,
+    strategy: TradingStrategy,
+    grid: Dict[str, List[Any]],
+    scores: Optional[Dict[str, np.ndarray]] = None,
+    config: Optional[BacktestConfig] = None,
+    max_workers: Optional[int] = None,
+) -> List[SweepResult]:
+    """
+    Backtest every combination of a strategy parameter grid across CPU cores.
+
+    Runs without risk limits and without the result cache or store (see
+    ParameterOptimizer for those). Blocking; call it from a thread (or
+    the compute pool's run()) inside the event loop.
+
+    Args:
+        grid: Dotted field paths to candidate values (see apply_params)
+        max_workers: Worker processes (default: CPU count; 0 runs inline)
+
+    Returns:
+        One SweepResult per combination, in grid order
+
+    Raises:
+        KeyError / pydantic.ValidationError: Invalid grid value
+    """
+    samples = grid_samples(grid)
+    for params in samples:
+        apply_params(strategy, params)
+
+    metrics = evaluate_param_sets(
+        panel, _complete_scores(panel, scores), strategy, samples, config=config, max_workers=max_workers
+    )
+
+    logger.info(f"[Optimizer] Sweep of {len(samples)} variants finished")
+    return [SweepResult(params=params, metrics=m) for params, m in zip(samples, metrics)]
+
+
+# -------------------------------------------
+# Optimizer
+# -------------------------------------------
+
+
+@dataclass
+class OptimizationResult:
+    """Metrics and objective score of one parameter set."""
+    param_key: str
+    params: Dict[str, Any]
+    metrics: Dict[str, Any]
+    score: Optional[float]
+    cached: bool = False
+
+
+@dataclass
+class OptimizationRun:
+    """Outcome of one optimization run, results best first."""
+    run_id: str
+    objective: str
+    context_key: str
+    evaluated: int
+    cached: int
+    results: List[OptimizationResult] = field(default_factory=list)
+
+    @property
+    def best(self) -> Optional[OptimizationResult]:
+        """Best scored result (None when no set reached min_trades)."""
+        if self.results and self.results[0].score is not None:
+            return self.results[0]
+        return None
+
+
+class ParameterOptimizer:
+    """
+    Evaluates parameter sets of a base strategy and risk parameters.
+
+    Blocking; call run() from a thread inside the event loop.
+    """
+
+    def __init__(
+        self,
+        panel: BarPanel,
+        strategy: TradingStrategy,
+        risk_params: Optional[RiskParameters] = None,
+        scores: Optional[Dict[str, np.ndarray]] = None,
+        config: Optional[BacktestConfig] = None,
+        store: Optional[OptimizationStore] = None,
+        objective: str = "sharpe",
+        min_trades: int = 1,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            panel: Historical daily bars
+            strategy: Base strategy (preset or custom)
+            risk_params: Base risk parameters (default: RiskParameters())
+            scores: Analysis scores (missing ones are derived from the bars)
+            config: Capital and costs
+            store: Result store (default: in-memory cache only)
+            objective: Metric to optimize (see OBJECTIVES)
+            min_trades: Sets with fewer closed trades are not ranked
+            max_workers: Worker processes (default: CPU count; 0 runs inline)
+
+        Raises:
+            ValueError: Unknown objective
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective {objective!r} (expected one of {', '.join(OBJECTIVES)})")
+
+        scores = _complete_scores(panel, scores)
+
+        self.panel = panel
+        self.scores = scores
+        self.strategy = strategy
+        self.risk_params = risk_params or RiskParameters()
+        self.config = config or BacktestConfig()
+        self.store = store
+        self.objective = objective
+        self.min_trades = min_trades
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+
+        self.context_key = context_key(panel, scores, strategy, self.risk_params, self.config)
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
+    def run(
+        self,
+        samples: Sequence[Dict[str, Any]],
+        name: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> OptimizationRun:
+        """
+        Evaluate parameter sets, reusing cached results.
+
+        Args:
+            samples: Parameter sets (grid_samples(), random_samples(), ...)
+            name: Run name for the store
+            run_id: Run already created in the store (default: create one)
+
+        Returns:
+            OptimizationRun with results ordered best first
+
+        Raises:
+            KeyError / pydantic.ValidationError: Invalid parameter set
+        """
+        if run_id is None:
+            run_id = uuid.uuid4().hex
+            if self.store is not None:
+                self.store.create_run(
+                    run_id,
+                    self.objective,
+                    name=name,
+                    strategy=self.strategy.model_dump(mode="json"),
+                    risk_params=self.risk_params.model_dump(mode="json"),
+                )
+
+        try:
+            run = self._run(run_id, samples)
+        except Exception as e:
+            if self.store is not None:
+                self.store.update_run(run_id, status="failed", error=str(e))
+            raise
+
+        if self.store is not None:
+            best = run.best
+            self.store.link_results(run_id, {r.param_key: r.score for r in run.results})
+            self.store.update_run(
+                run_id,
+                status="completed",
+                context_key=self.context_key,
+                symbols=len(self.panel.symbols),
+                start_date=str(self.panel.dates[0]) if len(self.panel.dates) else None,
+                end_date=str(self.panel.dates[-1]) if len(self.panel.dates) else None,
+                samples=len(run.results),
+                evaluated=run.evaluated,
+                cached=run.cached,
+                best_param_key=best.param_key if best else None,
+                best_score=best.score if best else None,
+            )
+        return run
+
+    def _run(self, run_id: str, samples: Sequence[Dict[str, Any]]) -> OptimizationRun:
+        unique: Dict[str, Dict[str, Any]] = {}
+        for params in samples:
+            # Reject invalid sets before any work is done
+            apply_param_set(self.strategy, self.risk_params, params)
+            unique.setdefault(param_key(params), dict(params))
+
+        cached = {key: self._cache[key] for key in unique if key in self._cache}
+        if self.store is not None:
+            missing = [key for key in unique if key not in cached]
+            cached.update(self.store.get_cached(self.context_key, missing))
+
+        pending = [key for key in unique if key not in cached]
+        metrics = self._evaluate([unique[key] for key in pending])
+        evaluated = dict(zip(pending, metrics))
+        if self.store is not None:
+            self.store.save_results(self.context_key, ((key, unique[key], evaluated[key]) for key in pending))
+
+        self._cache.update(cached)
+        self._cache.update(evaluated)
+
+        results = [
+            OptimizationResult(
+                param_key=key,
+                params=params,
+                metrics=self._cache[key],
+                score=objective_score(self._cache[key], self.objective, self.min_trades),
+                cached=key in cached,
+            )
+            for key, params in unique.items()
+        ]
+        results.sort(key=lambda r: (r.score is None, -(r.score or 0.0)))
+
+        logger.info(
+            f"[Optimizer] Run {run_id}: {len(pending)} evaluated, {len(cached)} cached "
+            f"({self.objective}, {len(self.panel.symbols)} symbols)"
+        )
+        return OptimizationRun(
+            run_id=run_id,
+            objective=self.objective,
+            context_key=self.context_key,
+            evaluated=len(pending),
+            cached=len(cached),
+            results=results,
+        )
+
+    def _evaluate(self, samples: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return evaluate_param_sets(
+            self.panel,
+            self.scores,
+            self.strategy,
+            samples,
+            risk_params=self.risk_params,
+            config=self.config,
+            max_workers=self.max_workers,
+        )
@@ -4,14 +4,21 @@ Order Agent
 Handles order execution via Kiwoom API with rate limiting and split orders.
 
 Uses KRX tick size (호가 단위) for proper price rounding.
+
+Large orders are sliced by the ExecutionScheduler (TWAP / VWAP) and their
+fills reconciled from the Kiwoom order-execution stream. Rate limiting uses
+the Kiwoom client's own limiter, so orders are never throttled twice.
 """
 
 import asyncio
 import logging
+import math
 import uuid
 from datetime import datetime
 from typing import Optional, List
 
+from services.kiwoom.rate_limiter import KiwoomRateLimiter
+
 from .models import (
     OrderRequest,
     OrderResult,
@@ -23,6 +30,7 @@ from .market_hours import (
     is_valid_tick_price,
     get_krx_tick_size,
 )
+from .execution_scheduler import VWAP_MIN_DURATION, ExecutionAlgo, ExecutionScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -37,138 +45,6 @@ class OrderExecutionError(Exception):
     pass
 
 
-class KiwoomRateLimiter:
-    """
-    Rate limiter for Kiwoom API.
-
-    Kiwoom limits:
-    - 5 requests per second
-    - 100 requests per minute
-    """
-
-    RATE_PER_SECOND = 5
-    RATE_PER_MINUTE = 100
-
-    def __init__(self, redis_client=None):
-        """
-        Initialize rate limiter.
-
-        Args:
-            redis_client: Optional Redis client for distributed limiting
-        """
-        self.redis = redis_client
-        # In-memory fallback
-        self._second_counts: dict = {}
-        self._minute_counts: dict = {}
-
-    async def acquire(self) -> bool:
-        """
-        Try to acquire a rate limit slot.
-
-        Returns:
-            True if acquired, False if limit exceeded
-        """
-        if self.redis:
-            return await self._acquire_redis()
-        return await self._acquire_memory()
-
-    async def _acquire_redis(self) -> bool:
-        """Acquire using Redis for distributed limiting."""
-        now = datetime.now()
-        second_key = f"kiwoom:rate:{now.strftime('%Y%m%d%H%M%S')}"
-        minute_key = f"kiwoom:rate:{now.strftime('%Y%m%d%H%M')}"
-
-        try:
-            # Check second limit
-            second_count = await self.redis.incr(second_key)
-            await self.redis.expire(second_key, 2)
-
-            if second_count > self.RATE_PER_SECOND:
-                await self.redis.decr(second_key)
-                return False
-
-            # Check minute limit
-            minute_count = await self.redis.incr(minute_key)
-            await self.redis.expire(minute_key, 120)
-
-            if minute_count > self.RATE_PER_MINUTE:
-                await self.redis.decr(minute_key)
-                await self.redis.decr(second_key)
-                return False
-
-            return True
-
-        except Exception as e:
-            logger.warning(f"[RateLimiter] Redis error: {e}, using memory fallback")
-            return await self._acquire_memory()
-
-    async def _acquire_memory(self) -> bool:
-        """Acquire using in-memory counting."""
-        now = datetime.now()
-        second_key = now.strftime('%Y%m%d%H%M%S')
-        minute_key = now.strftime('%Y%m%d%H%M')
-
-        # Clean old entries
-        self._cleanup_old_entries(now)
-
-        # Check second limit
-        second_count = self._second_counts.get(second_key, 0)
-        if second_count >= self.RATE_PER_SECOND:
-            return False
-
-        # Check minute limit
-        minute_count = self._minute_counts.get(minute_key, 0)
-        if minute_count >= self.RATE_PER_MINUTE:
-            return False
-
-        # Increment
-        self._second_counts[second_key] = second_count + 1
-        self._minute_counts[minute_key] = minute_count + 1
-
-        return True
-
-    def _cleanup_old_entries(self, now: datetime):
-        """Remove old rate limit entries."""
-        current_second = now.strftime('%Y%m%d%H%M%S')
-        current_minute = now.strftime('%Y%m%d%H%M')
-
-        # Keep only current second
-        self._second_counts = {
-            k: v for k, v in self._second_counts.items()
-            if k >= current_second[:12]  # Same minute
-        }
-
-        # Keep only current and previous minute
-        self._minute_counts = {
-            k: v for k, v in self._minute_counts.items()
-            if k >= current_minute[:10]  # Same hour
-        }
-
-    async def wait_for_slot(self, timeout: float = 30.0) -> bool:
-        """
-        Wait until a rate limit slot is available.
-
-        Args:
-            timeout: Maximum wait time in seconds
-
-        Returns:
-            True if slot acquired
-
-        Raises:
-            RateLimitExceeded: If timeout reached
-        """
-        start = asyncio.get_event_loop().time()
-
-        while asyncio.get_event_loop().time() - start < timeout:
-            if await self.acquire():
-                return True
-            await asyncio.sleep(0.2)
-
-        raise RateLimitExceeded(
-            f"Kiwoom rate limit timeout after {timeout}s"
-        )
-
-
 class OrderAgent:
     """
     Order execution agent.
@@ -176,36 +52,103 @@ class OrderAgent:
     Responsibilities:
     - Execute orders via Kiwoom API
     - Handle rate limiting
-    - Split large orders
+    - Slice large orders (TWAP / VWAP)
     - Track order status
     """
 
     # Split orders larger than this
     SPLIT_THRESHOLD = 100
 
+    # Slicing: one child per SPLIT_THRESHOLD shares, within these bounds
+    MIN_SLICES = 2
+    MAX_SLICES = 10
+    SLICE_INTERVAL_SECONDS = 1.0
+
+    # VWAP: cap children at this share of live traded volume. Only used
+    # when the schedule spans at least one intraday profile bucket;
+    # shorter schedules run as TWAP.
+    MAX_PARTICIPATION = 0.2
+
+    # Seconds to wait for a submitted child order to fill
+    FILL_TIMEOUT_SECONDS = 30.0
+
     def __init__(
         self,
         kiwoom_client=None,
         rate_limiter: Optional[KiwoomRateLimiter] = None,
+        fill_stream=None,
+        algo: ExecutionAlgo = ExecutionAlgo.TWAP,
     ):
         """
         Initialize Order Agent.
 
         Args:
             kiwoom_client: Kiwoom API client
-            rate_limiter: Rate limiter instance
+            rate_limiter: Rate limiter (defaults to the client's own limiter)
+            fill_stream: Order-execution stream (defaults to the KR realtime
+                service when a Kiwoom client is configured)
+            algo: Default slicing algorithm for large orders
         """
         self.kiwoom = kiwoom_client
-        self.limiter = rate_limiter or KiwoomRateLimiter()
+        self.limiter = (
+            rate_limiter
+            or getattr(kiwoom_client, "rate_limiter", None)
+            or KiwoomRateLimiter()
+        )
+        self.algo = algo
+        self._fill_stream = fill_stream
+        self._scheduler: Optional[ExecutionScheduler] = None
 
         # Order tracking
         self._pending_orders: dict = {}
         self._completed_orders: dict = {}
 
+    async def _acquire_order_slot(self) -> None:
+        """Take an order token unless the Kiwoom client throttles the request itself."""
+        if self.kiwoom is not None and self.limiter is getattr(self.kiwoom, "rate_limiter", None):
+            return
+
+        if not await self.limiter.acquire_order():
+            raise RateLimitExceeded("Kiwoom order rate limit timeout")
+
+    async def _get_scheduler(self) -> ExecutionScheduler:
+        """Create the execution scheduler, attaching the fill stream if available."""
+        if self._scheduler is None:
+            stream = self._fill_stream
+            if stream is None and self.kiwoom is not None:
+                try:
+                    from services.kr_realtime_service import get_kr_realtime_service
+                    stream = await get_kr_realtime_service()
+                except Exception as e:
+                    logger.warning(f"[OrderAgent] Fill stream unavailable, assuming fills: {e}")
+
+            self._scheduler = ExecutionScheduler(
+                submit=self._execute_single_order,
+                fill_stream=stream,
+                fill_timeout=self.FILL_TIMEOUT_SECONDS,
+                cancel=self._cancel_child,
+            )
+        return self._scheduler
+
+    async def _cancel_child(self, order: OrderRequest, order_no: str, quantity: int) -> bool:
+        """Cancel the unfilled remainder of a timed-out child order."""
+        if self.kiwoom is None:
+            return True
+
+        await self._acquire_order_slot()
+        response = await self.kiwoom.cancel_order(
+            org_ord_no=order_no,
+            stk_cd=order.ticker,
+            qty=quantity,
+        )
+        return response.return_code == 0
+
     async def execute_order(
         self,
         order: OrderRequest,
         split: bool = True,
+        algo: Optional[ExecutionAlgo] = None,
+        duration: Optional[float] = None,
     ) -> OrderResult:
         """
         Execute an order.
@@ -213,31 +156,42 @@ class OrderAgent:
         Args:
             order: Order to execute
             split: Whether to split large orders
+            algo: Slicing algorithm (defaults to the agent's algo)
+            duration: Schedule length in seconds for split orders
+                (defaults to SLICE_INTERVAL_SECONDS per slice)
 
         Returns:
             OrderResult with execution details
         """
         logger.info(
-            f"[OrderAgent] Executing order: {order.side.value} "
+            f"[OrderAgent] Executing order: {OrderSide(order.side).value} "
             f"{order.quantity} {order.ticker} @ {order.price or 'market'}"
         )
 
         # Determine if we should split
         if split and order.quantity > self.SPLIT_THRESHOLD:
-            return await self._execute_split_order(order)
+            return await self._execute_split_order(order, algo=algo, duration=duration)
 
         return await self._execute_single_order(order)
 
     async def _execute_single_order(
         self,
         order: OrderRequest,
+        await_fill: bool = False,
     ) -> OrderResult:
-        """Execute a single order."""
+        """
+        Execute a single order.
+
+        Args:
+            order: Order to execute
+            await_fill: Return "submitted" once accepted; the caller
+                reconciles fills from the execution stream
+        """
         order_id = str(uuid.uuid4())[:8]
 
         try:
             # Wait for rate limit slot
-            await self.limiter.wait_for_slot()
+            await self._acquire_order_slot()
 
             # Track as pending
             self._pending_orders[order_id] = order
@@ -247,7 +201,7 @@ class OrderAgent:
                 result = await self._simulate_order(order_id, order)
             else:
                 # Real execution
-                result = await self._execute_kiwoom_order(order_id, order)
+                result = await self._execute_kiwoom_order(order_id, order, await_fill)
 
             # Move to completed
             del self._pending_orders[order_id]
@@ -288,46 +242,45 @@ class OrderAgent:
     async def _execute_split_order(
         self,
         order: OrderRequest,
-        num_splits: int = 3,
+        num_splits: Optional[int] = None,
+        algo: Optional[ExecutionAlgo] = None,
+        duration: Optional[float] = None,
     ) -> OrderResult:
         """
-        Execute order in multiple splits.
+        Execute order as scheduled child orders.
 
-        Helps reduce market impact and get better fills.
+        Helps reduce market impact and get better fills. Children are
+        released every SLICE_INTERVAL_SECONDS (or evenly over `duration`)
+        and submitted concurrently. VWAP needs a schedule of at least one
+        volume-profile bucket; shorter schedules fall back to TWAP.
         """
-        logger.info(
-            f"[OrderAgent] Splitting order into {num_splits} parts"
-        )
-
-        base_qty = order.quantity // num_splits
-        remainder = order.quantity % num_splits
-
-        results: List[OrderResult] = []
-
-        for i in range(num_splits):
-            # Last split gets remainder
-            qty = base_qty + (remainder if i == num_splits - 1 else 0)
-
-            if qty <= 0:
-                continue
-
-            split_order = OrderRequest(
-                ticker=order.ticker,
-                stock_name=order.stock_name,
-                side=order.side,
-                quantity=qty,
-                price=order.price,
-                order_type=order.order_type,
-                session_id=order.session_id,
-                reason=f"{order.reason} (split {i+1}/{num_splits})",
+        algo = algo or self.algo
+        if num_splits is None:
+            num_splits = math.ceil(order.quantity / self.SPLIT_THRESHOLD)
+            num_splits = min(max(num_splits, self.MIN_SLICES), self.MAX_SLICES)
+        if duration is None:
+            duration = num_splits * self.SLICE_INTERVAL_SECONDS
+
+        if algo == ExecutionAlgo.VWAP and duration < VWAP_MIN_DURATION:
+            # Profile weights and per-interval volume caps are meaningless
+            # over a few seconds
+            logger.info(
+                f"[OrderAgent] {duration:.0f}s schedule is too short for VWAP, using TWAP"
             )
+            algo = ExecutionAlgo.TWAP
 
-            result = await self._execute_single_order(split_order)
-            results.append(result)
+        logger.info(
+            f"[OrderAgent] Splitting order into {num_splits} parts ({algo.value})"
+        )
 
-            # Wait between splits (1-2 seconds)
-            if i < num_splits - 1:
-                await asyncio.sleep(1.5)
+        scheduler = await self._get_scheduler()
+        results = await scheduler.execute(
+            order,
+            algo=algo,
+            num_slices=num_splits,
+            duration=duration,
+            max_participation=self.MAX_PARTICIPATION if algo == ExecutionAlgo.VWAP else None,
+        )
 
         # Aggregate results
         return self._aggregate_results(order, results)
@@ -336,15 +289,16 @@ class OrderAgent:
         self,
         order_id: str,
         order: OrderRequest,
+        await_fill: bool = False,
     ) -> OrderResult:
         """Execute order via Kiwoom API."""
-        # Map to Kiwoom order type
-        order_type_code = "00" if order.order_type == OrderType.LIMIT else "03"
-        side_code = "01" if order.side == OrderSide.BUY else "02"
+        from services.kiwoom.models import OrderType as KiwoomOrderType
+
+        is_limit = order.order_type == OrderType.LIMIT and bool(order.price)
 
         # Apply tick size rounding for limit orders
-        price_to_use = 0
-        if order.price and order.order_type == OrderType.LIMIT:
+        price_to_use = None
+        if is_limit:
             # Round price to valid tick size
             direction = "up" if order.side == OrderSide.BUY else "down"
             price_to_use = round_to_tick_size(order.price, direction)
@@ -356,19 +310,34 @@ class OrderAgent:
                     f"(tick size: {get_krx_tick_size(order.price)})"
                 )
 
+        place = (
+            self.kiwoom.place_buy_order
+            if order.side == OrderSide.BUY
+            else self.kiwoom.place_sell_order
+        )
+
         try:
-            response = await self.kiwoom.place_order(
-                order_type=side_code,
-                stock_code=order.ticker,
-                quantity=order.quantity,
-                price=price_to_use,
-                price_type=order_type_code,
+            response = await place(
+                stk_cd=order.ticker,
+                qty=order.quantity,
+                price=int(price_to_use) if price_to_use else None,
+                order_type=KiwoomOrderType.LIMIT if is_limit else KiwoomOrderType.MARKET,
             )
 
             # Parse response
-            if response.get("rt_cd") == "0":
+            if response.return_code == 0:
+                if await_fill:
+                    # Accepted; fills arrive on the order-execution stream
+                    return OrderResult(
+                        order_id=response.ord_no or order_id,
+                        ticker=order.ticker,
+                        side=order.side,
+                        requested_quantity=order.quantity,
+                        filled_quantity=0,
+                        status="submitted",
+                    )
                 return OrderResult(
-                    order_id=response.get("order_no", order_id),
+                    order_id=response.ord_no or order_id,
                     ticker=order.ticker,
                     side=order.side,
                     requested_quantity=order.quantity,
@@ -385,7 +354,7 @@ class OrderAgent:
                     requested_quantity=order.quantity,
                     filled_quantity=0,
                     status="rejected",
-                    message=response.get("msg1", "Unknown error"),
+                    message=response.return_msg or "Unknown error",
                 )
 
         except Exception as e:
@@ -434,11 +403,13 @@ class OrderAgent:
         total_value = sum(r.filled_quantity * r.avg_price for r in results)
         avg_price = total_value / total_filled if total_filled > 0 else 0
 
-        # Determine overall status
+        # Determine overall status; a pending child may still fill at the broker
         if total_filled >= original_order.quantity:
             status = "filled"
         elif total_filled > 0:
             status = "partial"
+        elif any(r.status == "pending" for r in results):
+            status = "pending"
         else:
             status = "rejected"
 
@@ -467,8 +438,13 @@ class OrderAgent:
 
         if self.kiwoom:
             try:
-                await self.limiter.wait_for_slot()
-                await self.kiwoom.cancel_order(order_id)
+                await self._acquire_order_slot()
+                order = self._pending_orders[order_id]
+                await self.kiwoom.cancel_order(
+                    org_ord_no=order_id,
+                    stk_cd=order.ticker,
+                    qty=order.quantity,
+                )
             except Exception as e:
                 logger.error(f"[OrderAgent] Cancel failed: {e}")
                 return False
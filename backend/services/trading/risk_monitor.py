@@ -3,6 +3,9 @@ Risk Monitor
 
 Real-time monitoring of positions for stop-loss, take-profit, and sudden moves.
 Sends alerts and can auto-execute based on configuration.
+
+Stop-loss / take-profit levels live in the shared TriggerBook, so a price
+update only touches the triggers it actually crosses.
 """
 
 import asyncio
@@ -21,10 +24,16 @@ from .models import (
     OrderRequest,
     OrderSide,
 )
+from .trigger_book import LOWER, UPPER, Trigger, TriggerBook, get_trigger_book
 
 logger = logging.getLogger(__name__)
 
 
+# Trigger kinds registered in the trigger book
+STOP_LOSS = "stop_loss"
+TAKE_PROFIT = "take_profit"
+
+
 class RiskMonitor:
     """
     Risk monitoring agent.
@@ -43,6 +52,7 @@ class RiskMonitor:
         price_fetcher: Optional[Callable[[str], Awaitable[float]]] = None,
         alert_sender: Optional[Callable[[TradingAlert], Awaitable[None]]] = None,
         order_executor: Optional[Callable[[OrderRequest], Awaitable[None]]] = None,
+        trigger_book: Optional[TriggerBook] = None,
     ):
         """
         Initialize Risk Monitor.
@@ -52,6 +62,7 @@ class RiskMonitor:
             price_fetcher: Async function to get current price
             alert_sender: Async function to send alerts
             order_executor: Async function to execute orders
+            trigger_book: Trigger book (defaults to the shared instance)
         """
         self.risk_params = risk_params or RiskParameters()
         self._get_price = price_fetcher
@@ -68,6 +79,11 @@ class RiskMonitor:
         self._alerts: List[TradingAlert] = []
         self._pending_alerts: List[TradingAlert] = []
 
+        # Stop-loss / take-profit triggers
+        self._book = trigger_book or get_trigger_book()
+        self._owner = f"risk_monitor-{uuid.uuid4().hex[:6]}"
+        self._book.register_handler(self._owner, self._on_trigger_hits)
+
     async def start(self):
         """Start the risk monitoring loop."""
         if self._running:
@@ -75,6 +91,12 @@ class RiskMonitor:
 
         self._running = True
         self._trading_mode = TradingMode.ACTIVE
+
+        # stop() dropped our handler and triggers from the shared book
+        self._book.register_handler(self._owner, self._on_trigger_hits)
+        for config in self._watching.values():
+            self._arm_triggers(config)
+
         self._task = asyncio.create_task(self._monitor_loop())
 
         logger.info("[RiskMonitor] Started monitoring")
@@ -84,6 +106,9 @@ class RiskMonitor:
         self._running = False
         self._trading_mode = TradingMode.STOPPED
 
+        # Other owners keep pushing prices into the shared book
+        self._book.unregister_owner(self._owner)
+
         if self._task:
             self._task.cancel()
             try:
@@ -146,6 +171,7 @@ class RiskMonitor:
             last_price=position.current_price,
         )
         self._watching[position.ticker] = config
+        self._arm_triggers(config)
 
         logger.info(
             f"[RiskMonitor] Watching {position.ticker}: "
@@ -157,20 +183,52 @@ class RiskMonitor:
         """Remove a position from watching."""
         if ticker in self._watching:
             del self._watching[ticker]
+            self._book.remove(self._owner, ticker)
             logger.info(f"[RiskMonitor] Stopped watching {ticker}")
 
     def update_stop_loss(self, ticker: str, new_stop_loss: float):
         """Update stop-loss for a position."""
         if ticker in self._watching:
             self._watching[ticker].stop_loss = new_stop_loss
+            self._arm_triggers(self._watching[ticker])
             logger.info(f"[RiskMonitor] Updated {ticker} stop-loss to {new_stop_loss}")
 
     def update_take_profit(self, ticker: str, new_take_profit: float):
         """Update take-profit for a position."""
         if ticker in self._watching:
             self._watching[ticker].take_profit = new_take_profit
+            self._arm_triggers(self._watching[ticker])
             logger.info(f"[RiskMonitor] Updated {ticker} take-profit to {new_take_profit}")
 
+    def _arm_triggers(self, config: "WatchConfig"):
+        """Register the position's stop-loss / take-profit in the trigger book."""
+        self._book.remove(self._owner, config.ticker)
+        if config.stop_loss:
+            self._book.set(self._owner, config.ticker, STOP_LOSS, config.stop_loss, LOWER)
+        if config.take_profit:
+            self._book.set(self._owner, config.ticker, TAKE_PROFIT, config.take_profit, UPPER)
+
+    def _rearm(self, ticker: str, kind: str):
+        """Re-register a fired stop-loss / take-profit trigger (still watched positions only)."""
+        config = self._watching.get(ticker)
+        if config is None:
+            return
+        if kind == STOP_LOSS and config.stop_loss:
+            self._book.set(self._owner, ticker, STOP_LOSS, config.stop_loss, LOWER)
+        elif kind == TAKE_PROFIT and config.take_profit:
+            self._book.set(self._owner, ticker, TAKE_PROFIT, config.take_profit, UPPER)
+
+    async def on_price(self, ticker: str, price: float):
+        """
+        Push a live price (e.g., from a WebSocket tick).
+
+        Only triggers crossed by this price are evaluated.
+        """
+        config = self._watching.get(ticker)
+        if config is None:
+            return
+        await self._process_price(ticker, config, price)
+
     async def _monitor_loop(self):
         """Main monitoring loop."""
         while self._running:
@@ -207,6 +265,10 @@ class RiskMonitor:
             # Simulation: use last known price
             current_price = config.last_price
 
+        await self._process_price(ticker, config, current_price)
+
+    async def _process_price(self, ticker: str, config: "WatchConfig", current_price: float):
+        """Run sudden-move detection and trigger checks for a price."""
         if current_price <= 0:
             return
 
@@ -229,13 +291,25 @@ class RiskMonitor:
         if self._trading_mode == TradingMode.PAUSED:
             return
 
-        # Check stop-loss
-        if config.stop_loss and current_price <= config.stop_loss:
-            await self._handle_stop_loss(ticker, config, current_price)
+        # Crossed stop-loss / take-profit are delivered to _on_trigger_hits
+        await self._book.update_price(ticker, current_price)
+
+    async def _on_trigger_hits(self, hits: List[Trigger], current_price: float):
+        """Handle this monitor's crossed triggers (one-shot until re-armed)."""
+        for trigger in hits:
+            config = self._watching.get(trigger.ticker)
+            if config is None:
+                continue
+
+            if not self._running or self._trading_mode in (TradingMode.PAUSED, TradingMode.STOPPED):
+                # Keep the trigger armed until monitoring (re)starts or trading resumes
+                self._book.set(self._owner, trigger.ticker, trigger.kind, trigger.level, trigger.side)
+                continue
 
-        # Check take-profit
-        elif config.take_profit and current_price >= config.take_profit:
-            await self._handle_take_profit(ticker, config, current_price)
+            if trigger.kind == STOP_LOSS:
+                await self._handle_stop_loss(trigger.ticker, config, current_price)
+            elif trigger.kind == TAKE_PROFIT:
+                await self._handle_take_profit(trigger.ticker, config, current_price)
 
     async def _handle_sudden_move(
         self,
@@ -365,9 +439,10 @@ class RiskMonitor:
         config: "WatchConfig",
         current_price: float,
     ):
-        """Execute stop-loss order."""
+        """Execute stop-loss order (the trigger is re-armed if it cannot be executed)."""
         if not self._execute_order:
             logger.warning("[RiskMonitor] No order executor configured")
+            self._rearm(ticker, STOP_LOSS)
             return
 
         order = OrderRequest(
@@ -395,6 +470,8 @@ class RiskMonitor:
 
         except Exception as e:
             logger.error(f"[RiskMonitor] Stop-loss execution failed: {e}")
+            # Retry on the next price at or below the stop
+            self._rearm(ticker, STOP_LOSS)
 
             alert = TradingAlert(
                 id=str(uuid.uuid4())[:8],
@@ -413,9 +490,10 @@ class RiskMonitor:
         config: "WatchConfig",
         current_price: float,
     ):
-        """Execute take-profit order."""
+        """Execute take-profit order (the trigger is re-armed if it cannot be executed)."""
         if not self._execute_order:
             logger.warning("[RiskMonitor] No order executor configured")
+            self._rearm(ticker, TAKE_PROFIT)
             return
 
         order = OrderRequest(
@@ -443,6 +521,7 @@ class RiskMonitor:
 
         except Exception as e:
             logger.error(f"[RiskMonitor] Take-profit execution failed: {e}")
+            self._rearm(ticker, TAKE_PROFIT)
 
     async def _add_alert(self, alert: TradingAlert):
         """Add and send alert."""
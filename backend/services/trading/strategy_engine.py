@@ -21,6 +21,19 @@ from .models import ManagedPosition, AllocationPlan
 
 logger = logging.getLogger(__name__)
 
+# Rule-based decision parameters (also used by services.trading.backtest)
+# Weights of the aggregate score; the risk score counts inverted (100 - risk)
+SCORE_WEIGHTS = {
+    "technical_score": 0.3,
+    "fundamental_score": 0.3,
+    "sentiment_score": 0.2,
+    "risk_score": 0.2,
+}
+BUY_SCORE_THRESHOLD = 65
+SELL_SCORE_THRESHOLD = 35
+# Entry is allowed with at most this many of the 4 score thresholds missed
+MAX_FAILED_ENTRY_RULES = 1
+
 
 class StrategyEngine:
     """
@@ -171,7 +184,7 @@ class StrategyEngine:
         alignment = int((len(passed_rules) / total_rules) * 100) if total_rules > 0 else 0
 
         # Determine if passed (at least 3 of 4 rules)
-        passed = len(failed_rules) <= 1
+        passed = len(failed_rules) <= MAX_FAILED_ENTRY_RULES
 
         return {
             "passed": passed,
@@ -229,12 +242,17 @@ class StrategyEngine:
         sent = scores.get("sentiment_score", 50)
         risk = scores.get("risk_score", 50)
 
-        # Weighted average (can be customized)
-        weighted_score = (tech * 0.3) + (fund * 0.3) + (sent * 0.2) + ((100 - risk) * 0.2)
+        # Weighted average (see SCORE_WEIGHTS)
+        weighted_score = (
+            tech * SCORE_WEIGHTS["technical_score"]
+            + fund * SCORE_WEIGHTS["fundamental_score"]
+            + sent * SCORE_WEIGHTS["sentiment_score"]
+            + (100 - risk) * SCORE_WEIGHTS["risk_score"]
+        )
 
-        if weighted_score >= 65:
+        if weighted_score >= BUY_SCORE_THRESHOLD:
             return "BUY"
-        elif weighted_score <= 35:
+        elif weighted_score <= SELL_SCORE_THRESHOLD:
             return "SELL"
         else:
             return "HOLD"
@@ -0,0 +1,306 @@
+"""
+Trigger Book
+
+Shared, indexed price triggers for stop-loss / take-profit / trailing stops.
+
+Each ticker keeps two sorted level lists:
+- lower: fire when price <= level (stop-loss, trailing stop, warnings)
+- upper: fire when price >= level (take-profit, gain thresholds)
+
+A price update bisects both lists and returns only the crossed triggers,
+so the per-tick cost is O(log n + hits) regardless of how many positions
+and watch items are registered. Triggers are one-shot: a crossed trigger
+is removed and must be registered again to re-arm.
+
+Trailing triggers keep a high-water mark; a new high raises the level.
+
+Owners (RiskMonitor, PositionManager, ...) register an async handler and
+receive their own hits from update_price().
+"""
+
+import asyncio
+import bisect
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+LOWER = "lower"
+UPPER = "upper"
+
+
+@dataclass
+class Trigger:
+    """A registered price trigger."""
+    owner: str
+    ticker: str
+    kind: str
+    level: float
+    side: str  # LOWER or UPPER
+    trail_pct: Optional[float] = None
+    high_water: Optional[float] = None
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.owner, self.ticker, self.kind)
+
+    @property
+    def is_trailing(self) -> bool:
+        return self.trail_pct is not None
+
+
+TriggerHandler = Callable[[List[Trigger], float], Awaitable[None]]
+
+
+class _TickerLevels:
+    """Sorted (level, seq, trigger) entries for one ticker."""
+
+    __slots__ = ("lower", "upper", "trailing")
+
+    def __init__(self):
+        self.lower: List[Tuple[float, int, Trigger]] = []
+        self.upper: List[Tuple[float, int, Trigger]] = []
+        self.trailing: Dict[Tuple[str, str, str], Trigger] = {}
+
+    def side(self, side: str) -> List[Tuple[float, int, Trigger]]:
+        return self.lower if side == LOWER else self.upper
+
+    def __bool__(self) -> bool:
+        return bool(self.lower or self.upper)
+
+
+class TriggerBook:
+    """
+    Per-ticker sorted trigger levels shared by all monitors.
+
+    Usage:
+        book = get_trigger_book()
+        book.register_handler("risk_monitor", handle_hits)
+        book.set("risk_monitor", "005930", "stop_loss", 68000, LOWER)
+        await book.update_price("005930", 67900)  # -> handle_hits([...], 67900)
+    """
+
+    def __init__(self):
+        self._tickers: Dict[str, _TickerLevels] = {}
+        self._index: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
+        self._handlers: Dict[str, TriggerHandler] = {}
+        self._seq = itertools.count()
+
+        # Statistics
+        self._updates = 0
+        self._hits = 0
+
+    # -------------------------------------------
+    # Registration
+    # -------------------------------------------
+
+    def register_handler(self, owner: str, handler: TriggerHandler) -> None:
+        """Set the async handler that receives an owner's hits."""
+        self._handlers[owner] = handler
+
+    def unregister_owner(self, owner: str) -> None:
+        """Drop an owner's handler and all of its triggers."""
+        self._handlers.pop(owner, None)
+        for key in [k for k in self._index if k[0] == owner]:
+            self._remove_key(key)
+
+    def set(self, owner: str, ticker: str, kind: str, level: float, side: str) -> Trigger:
+        """
+        Register (or move) a trigger.
+
+        Args:
+            owner: Registering component
+            ticker: Stock code or market (e.g., "005930", "KRW-BTC")
+            kind: Trigger name, unique per owner and ticker
+            level: Price level
+            side: LOWER (fires at price <= level) or UPPER (price >= level)
+
+        Returns:
+            The registered Trigger
+        """
+        if side not in (LOWER, UPPER):
+            raise ValueError(f"Unknown trigger side: {side}")
+
+        trigger = Trigger(owner=owner, ticker=ticker, kind=kind, level=level, side=side)
+        self._insert(trigger)
+        return trigger
+
+    def set_trailing(
+        self,
+        owner: str,
+        ticker: str,
+        kind: str,
+        trail_pct: float,
+        high_water: float,
+    ) -> Trigger:
+        """
+        Register or update a trailing stop (LOWER side).
+
+        The level is high_water * (1 - trail_pct / 100). An existing
+        trigger keeps its higher high-water mark, so the stop never moves
+        down.
+
+        Returns:
+            The registered Trigger
+        """
+        existing = self.get(owner, ticker, kind)
+        if existing is not None and existing.high_water is not None:
+            high_water = max(high_water, existing.high_water)
+
+        trigger = Trigger(
+            owner=owner,
+            ticker=ticker,
+            kind=kind,
+            level=high_water * (1 - trail_pct / 100),
+            side=LOWER,
+            trail_pct=trail_pct,
+            high_water=high_water,
+        )
+        self._insert(trigger)
+        return trigger
+
+    def get(self, owner: str, ticker: str, kind: str) -> Optional[Trigger]:
+        """Get a registered trigger."""
+        entry = self._index.get((owner, ticker, kind))
+        if entry is None:
+            return None
+        levels = self._tickers[ticker]
+        for side in (levels.lower, levels.upper):
+            i = bisect.bisect_left(side, entry, key=lambda e: (e[0], e[1]))
+            if i < len(side) and (side[i][0], side[i][1]) == entry:
+                return side[i][2]
+        return None
+
+    def remove(self, owner: str, ticker: str, kind: Optional[str] = None) -> int:
+        """
+        Remove one trigger, or all of an owner's triggers for a ticker.
+
+        Returns:
+            Number of triggers removed
+        """
+        if kind is not None:
+            return 1 if self._remove_key((owner, ticker, kind)) else 0
+
+        keys = [k for k in self._index if k[0] == owner and k[1] == ticker]
+        for key in keys:
+            self._remove_key(key)
+        return len(keys)
+
+    def _insert(self, trigger: Trigger) -> None:
+        self._remove_key(trigger.key)
+
+        levels = self._tickers.setdefault(trigger.ticker, _TickerLevels())
+        seq = next(self._seq)
+        bisect.insort(levels.side(trigger.side), (trigger.level, seq, trigger), key=lambda e: (e[0], e[1]))
+        self._index[trigger.key] = (trigger.level, seq)
+        if trigger.is_trailing:
+            levels.trailing[trigger.key] = trigger
+
+    def _remove_key(self, key: Tuple[str, str, str]) -> bool:
+        entry = self._index.pop(key, None)
+        if entry is None:
+            return False
+
+        ticker = key[1]
+        levels = self._tickers[ticker]
+        levels.trailing.pop(key, None)
+        for side in (levels.lower, levels.upper):
+            i = bisect.bisect_left(side, entry, key=lambda e: (e[0], e[1]))
+            if i < len(side) and (side[i][0], side[i][1]) == entry:
+                del side[i]
+                break
+
+        if not levels:
+            del self._tickers[ticker]
+        return True
+
+    # -------------------------------------------
+    # Price Updates
+    # -------------------------------------------
+
+    def on_price(self, ticker: str, price: float) -> List[Trigger]:
+        """
+        Apply a price update and pop the crossed triggers.
+
+        Trailing triggers first raise their high-water mark (and level)
+        if the price made a new high.
+
+        Returns:
+            Crossed triggers (lower side first, nearest level first)
+        """
+        levels = self._tickers.get(ticker)
+        if levels is None or price <= 0:
+            return []
+
+        self._updates += 1
+
+        if levels.trailing:
+            for trigger in list(levels.trailing.values()):
+                if price > trigger.high_water:
+                    self.set_trailing(trigger.owner, ticker, trigger.kind, trigger.trail_pct, price)
+
+        # lower: level >= price, upper: level <= price
+        lo = bisect.bisect_left(levels.lower, price, key=lambda e: e[0])
+        hi = bisect.bisect_right(levels.upper, price, key=lambda e: e[0])
+        hits = [e[2] for e in reversed(levels.lower[lo:])] + [e[2] for e in reversed(levels.upper[:hi])]
+
+        for trigger in hits:
+            self._remove_key(trigger.key)
+
+        self._hits += len(hits)
+        return hits
+
+    async def update_price(self, ticker: str, price: float) -> List[Trigger]:
+        """
+        Apply a price update and deliver hits to their owners' handlers.
+
+        Returns:
+            All crossed triggers
+        """
+        hits = self.on_price(ticker, price)
+        if not hits:
+            return hits
+
+        by_owner: Dict[str, List[Trigger]] = {}
+        for trigger in hits:
+            by_owner.setdefault(trigger.owner, []).append(trigger)
+
+        for owner, owner_hits in by_owner.items():
+            handler = self._handlers.get(owner)
+            if handler is None:
+                continue
+            try:
+                await handler(owner_hits, price)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[TriggerBook] Handler for {owner} failed: {e}")
+
+        return hits
+
+    def get_stats(self) -> dict:
+        """Get trigger book statistics."""
+        return {
+            "tickers": len(self._tickers),
+            "triggers": len(self._index),
+            "owners": len(self._handlers),
+            "updates": self._updates,
+            "hits": self._hits,
+        }
+
+
+# Singleton instance
+_trigger_book: Optional[TriggerBook] = None
+
+
+def get_trigger_book() -> TriggerBook:
+    """Get or create the process-wide trigger book."""
+    global _trigger_book
+
+    if _trigger_book is None:
+        _trigger_book = TriggerBook()
+
+    return _trigger_book
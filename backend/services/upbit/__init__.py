@@ -8,8 +8,16 @@ Provides integration with Upbit cryptocurrency exchange API.
 """
 
 from .auth import generate_jwt_token
-from .client import UpbitClient
+from .cache import UpbitCache
+from .candle_builder import CandleBuilder
+from .client import UpbitAPIError, UpbitClient
+from .market_index import UpbitMarketIndex, get_market_index
+from .rate_limiter import UpbitRateLimiter
 from .websocket import (
+    OrderbookFrame,
+    StreamFrame,
+    TickerFrame,
+    TradeFrame,
     UpbitWebSocketClient,
     WebSocketOrderbook,
     WebSocketTicker,
@@ -17,10 +25,20 @@ from .websocket import (
 )
 
 __all__ = [
+    "UpbitAPIError",
+    "UpbitCache",
+    "CandleBuilder",
     "UpbitClient",
+    "UpbitRateLimiter",
+    "UpbitMarketIndex",
+    "get_market_index",
     "UpbitWebSocketClient",
     "generate_jwt_token",
     "WebSocketTicker",
     "WebSocketTrade",
     "WebSocketOrderbook",
+    "StreamFrame",
+    "TickerFrame",
+    "TradeFrame",
+    "OrderbookFrame",
 ]
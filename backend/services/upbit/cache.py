@@ -0,0 +1,139 @@
+"""
+Upbit Response Cache
+
+Short-TTL, in-process cache for Upbit QUOTATION responses (ticker,
+orderbook, candles). Dashboards poll the same markets from many tabs and
+routes; within a TTL they share one response, and concurrent identical
+requests share one in-flight call.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+
+class UpbitCache:
+    """
+    LRU + TTL cache with single-flight fetches.
+
+    Usage:
+        cache = UpbitCache()
+        tickers = await cache.get_or_fetch("ticker:KRW-BTC", fetch, ttl=1.0)
+    """
+
+    # Default TTL per key prefix (seconds)
+    DEFAULT_TTL = {
+        "ticker": 1.0,
+        "orderbook": 0.5,
+        "candles_seconds": 1.0,
+        "candles_minutes": 5.0,
+        "candles_days": 30.0,
+        "candles_weeks": 60.0,
+        "candles_months": 60.0,
+    }
+
+    def __init__(self, max_size: int = 1000, ttl: Optional[dict[str, float]] = None):
+        """
+        Args:
+            max_size: Maximum number of cached responses (LRU)
+            ttl: TTL overrides per key prefix
+        """
+        self.max_size = max_size
+        self.ttl = {**self.DEFAULT_TTL, **(ttl or {})}
+        self._entries: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+
+    def _ttl_for(self, key: str) -> float:
+        return self.ttl.get(key.split(":", 1)[0], 1.0)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value (None if missing or expired)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value (TTL defaults to the key prefix's TTL)."""
+        ttl = self._ttl_for(key) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Get a cached value or fetch it once for all concurrent callers.
+
+        Errors are not cached; every waiting caller receives the exception.
+        """
+        value = self.get(key)
+        if value is not None:
+            self._hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._shared += 1
+            return await asyncio.shield(inflight)
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self.set(key, value, ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> int:
+        """Drop all cached responses."""
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "shared_inflight": self._shared,
+            "hit_rate": f"{(self._hits / total * 100) if total else 0.0:.1f}%",
+        }
@@ -0,0 +1,300 @@
+"""
+Upbit Candle Builder
+
+Builds multi-resolution OHLCV bars from the trade stream into a ring buffer
+per market and interval. Each buffer is seeded once from REST (at least
+the last 200 candles, see history.py for deeper seeds); after that every
+bar is kept up to date from trades alone, so candle reads need no REST call.
+
+Bars use Upbit's candle field names, so they can be used wherever REST
+candles (services.upbit.models.Candle) are read.
+"""
+
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .client import UpbitClient
+
+# Interval -> bar length in seconds. Upbit aligns all of these to UTC
+# (minute candles on the minute, 4h candles at 00/04/08.. UTC, days at 00:00 UTC).
+CANDLE_INTERVALS = {
+    "1s": 1,
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "10m": 600,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+
+# REST returns at most 200 candles per request
+BACKFILL_COUNT = 200
+
+_KST = timedelta(hours=9)
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+@dataclass(slots=True)
+class Bar:
+    """One OHLCV bar (Upbit candle field names)."""
+    start: int  # bar start (epoch ms, UTC)
+    opening_price: float
+    high_price: float
+    low_price: float
+    trade_price: float
+    candle_acc_trade_volume: float
+    candle_acc_trade_price: float
+    first_timestamp: int  # first trade in the bar (ms)
+    timestamp: int  # last trade in the bar (ms)
+
+    @property
+    def candle_date_time_utc(self) -> str:
+        return _format(self.start, timedelta(0))
+
+    @property
+    def candle_date_time_kst(self) -> str:
+        return _format(self.start, _KST)
+
+    def add(self, price: float, volume: float, timestamp: int) -> None:
+        """Apply one trade."""
+        if price > self.high_price:
+            self.high_price = price
+        if price < self.low_price:
+            self.low_price = price
+        if timestamp >= self.timestamp:
+            self.trade_price = price
+            self.timestamp = timestamp
+        elif timestamp < self.first_timestamp:
+            self.opening_price = price
+            self.first_timestamp = timestamp
+        self.candle_acc_trade_volume += volume
+        self.candle_acc_trade_price += price * volume
+
+
+def _format(start_ms: int, offset: timedelta) -> str:
+    moment = datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc) + offset
+    return moment.strftime(_DATETIME_FORMAT)
+
+
+def _parse_utc(value: str) -> int:
+    moment = datetime.strptime(value[:19], _DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def bar_from_candle(candle) -> Bar:
+    """Convert a REST candle to a Bar."""
+    start = _parse_utc(candle.candle_date_time_utc)
+    return Bar(
+        start=start,
+        opening_price=candle.opening_price,
+        high_price=candle.high_price,
+        low_price=candle.low_price,
+        trade_price=candle.trade_price,
+        candle_acc_trade_volume=candle.candle_acc_trade_volume,
+        candle_acc_trade_price=candle.candle_acc_trade_price,
+        first_timestamp=start,
+        timestamp=candle.timestamp,
+    )
+
+
+def _merge(rest: Bar, live: Bar) -> Bar:
+    """
+    Merge the REST and live versions of the same bar.
+
+    Trades after the REST snapshot come from the live bar. When the live bar
+    started before the snapshot, its overlapping volume is already in the
+    REST bar; the few trades between the snapshot and the end of the live
+    bar are then only reflected in price, not volume.
+    """
+    merged = replace(rest)
+    merged.high_price = max(rest.high_price, live.high_price)
+    merged.low_price = min(rest.low_price, live.low_price)
+    if live.timestamp > rest.timestamp:
+        merged.trade_price = live.trade_price
+        merged.timestamp = live.timestamp
+    if live.first_timestamp > rest.timestamp:
+        merged.candle_acc_trade_volume += live.candle_acc_trade_volume
+        merged.candle_acc_trade_price += live.candle_acc_trade_price
+    return merged
+
+
+async def fetch_candles(
+    client: "UpbitClient",
+    market: str,
+    interval: str,
+    count: int = BACKFILL_COUNT,
+    to: Optional[str] = None,
+) -> list:
+    """Fetch one page of REST candles (newest first, before `to` if given)."""
+    if interval == "1s":
+        return await client.get_candles_seconds(market=market, count=count, to=to)
+    if interval == "1d":
+        return await client.get_candles_days(market=market, count=count, to=to)
+    unit = CANDLE_INTERVALS[interval] // 60
+    return await client.get_candles_minutes(market=market, unit=unit, count=count, to=to)
+
+
+class CandleBuilder:
+    """
+    Ring buffers of bars per (market, interval), fed by trades.
+
+    Trades are aggregated for every tracked market right away; a buffer is
+    served only once it has been seeded from REST (see seed()).
+
+    Usage:
+        builder = CandleBuilder()
+        builder.track("KRW-BTC")
+        builder.add_trade("KRW-BTC", 100.0, 0.5, 1735689600000)
+        builder.seed("KRW-BTC", "1m", rest_candles)
+        bars = builder.get("KRW-BTC", "1m", 100)
+    """
+
+    def __init__(self, capacity: int = 1000, intervals: Iterable[str] = CANDLE_INTERVALS):
+        """
+        Args:
+            capacity: Bars kept per market and interval
+            intervals: Intervals to build
+        """
+        self.capacity = capacity
+        self._intervals = [(name, CANDLE_INTERVALS[name] * 1000) for name in intervals]
+        # market -> interval -> bars (oldest first)
+        self._bars: dict[str, dict[str, deque[Bar]]] = {}
+        # (market, interval) seeded from REST; -> True if REST had no older candles
+        self._seeded: dict[tuple[str, str], bool] = {}
+
+        # Statistics
+        self._trades = 0
+        self._late_trades = 0
+
+    def track(self, market: str) -> None:
+        """Start building bars for a market."""
+        if market not in self._bars:
+            self._bars[market] = {
+                name: deque(maxlen=self.capacity) for name, _ in self._intervals
+            }
+
+    def drop(self, market: str) -> None:
+        """Stop building bars for a market."""
+        self._bars.pop(market, None)
+        for key in [key for key in self._seeded if key[0] == market]:
+            del self._seeded[key]
+
+    def invalidate(self) -> None:
+        """Require a new REST seed for every buffer (e.g. after a stream gap)."""
+        self._seeded.clear()
+
+    def is_tracked(self, market: str) -> bool:
+        return market in self._bars
+
+    def is_ready(self, market: str, interval: str) -> bool:
+        return (market, interval) in self._seeded
+
+    @property
+    def markets(self) -> list[str]:
+        return list(self._bars)
+
+    def add_trade(self, market: str, price: float, volume: float, timestamp: int) -> None:
+        """Apply one trade to every interval of a tracked market."""
+        buffers = self._bars.get(market)
+        if buffers is None:
+            return
+
+        self._trades += 1
+        for name, length in self._intervals:
+            bars = buffers[name]
+            start = timestamp - timestamp % length
+            last = bars[-1] if bars else None
+
+            if last is None or start > last.start:
+                bars.append(Bar(
+                    start=start,
+                    opening_price=price,
+                    high_price=price,
+                    low_price=price,
+                    trade_price=price,
+                    candle_acc_trade_volume=volume,
+                    candle_acc_trade_price=price * volume,
+                    first_timestamp=timestamp,
+                    timestamp=timestamp,
+                ))
+            elif start == last.start:
+                last.add(price, volume, timestamp)
+            else:
+                self._add_late(bars, start, price, volume, timestamp)
+
+    def _add_late(self, bars: deque[Bar], start: int, price: float, volume: float, timestamp: int) -> None:
+        """Apply an out-of-order trade to an earlier bar still in the buffer."""
+        self._late_trades += 1
+        for bar in reversed(bars):
+            if bar.start == start:
+                bar.add(price, volume, timestamp)
+                return
+            if bar.start < start:
+                return
+
+    def seed(
+        self,
+        market: str,
+        interval: str,
+        candles: list,
+        complete: Optional[bool] = None,
+    ) -> None:
+        """
+        Merge REST candles (newest first) into a buffer and mark it ready.
+
+        Bars built from trades before the seed are kept; the bar both sources
+        cover is merged (see _merge).
+
+        Args:
+            complete: REST has no older candles (default: fewer than one page)
+        """
+        self.track(market)
+        bars = self._bars[market][interval]
+
+        by_start = {bar.start: bar for bar in map(bar_from_candle, candles)}
+        for live in bars:
+            rest = by_start.get(live.start)
+            by_start[live.start] = live if rest is None else _merge(rest, live)
+
+        bars.clear()
+        bars.extend(by_start[start] for start in sorted(by_start)[-self.capacity:])
+        self._seeded[(market, interval)] = (
+            len(candles) < BACKFILL_COUNT if complete is None else complete
+        )
+
+    def get(self, market: str, interval: str, count: int) -> Optional[list[Bar]]:
+        """
+        Get the latest bars (newest first).
+
+        Returns:
+            Bars, or None if the buffer is not seeded or too short for count
+        """
+        complete = self._seeded.get((market, interval))
+        if complete is None:
+            return None
+
+        bars = self._bars[market][interval]
+        if len(bars) < count and not complete:
+            return None
+
+        result = [bars[i] for i in range(len(bars) - 1, max(len(bars) - count, 0) - 1, -1)]
+        if result:
+            # The newest bar keeps changing; hand out a snapshot
+            result[0] = replace(result[0])
+        return result
+
+    @property
+    def stats(self) -> dict:
+        """Builder statistics."""
+        return {
+            "markets": len(self._bars),
+            "ready_buffers": len(self._seeded),
+            "trades": self._trades,
+            "late_trades": self._late_trades,
+        }
@@ -3,15 +3,22 @@ Upbit API Client
 
 Async HTTP client for Upbit cryptocurrency exchange API.
 Supports both QUOTATION (public) and EXCHANGE (authenticated) APIs.
+
+- Keep-alive connection pool (HTTP/2 when the h2 package is installed)
+- Per-group token bucket rate limiting synced with Remaining-Req headers
+- Short-TTL cache for ticker, orderbook and candles
 """
 
 import asyncio
-from typing import Optional
+import importlib.util
+from typing import Awaitable, Callable, Optional
 
 import httpx
 import structlog
 
 from .auth import generate_authorization_header
+from .cache import UpbitCache
+from .market_index import get_market_index
 from .models import (
     Account,
     Candle,
@@ -24,9 +31,13 @@ from .models import (
     Ticker,
     Trade,
 )
+from .rate_limiter import UpbitRateLimiter, get_request_group
 
 logger = structlog.get_logger()
 
+# httpx speaks HTTP/2 only with the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class UpbitAPIError(Exception):
     """Upbit API error with status code and message."""
@@ -46,18 +57,31 @@ class UpbitClient:
     - QUOTATION API (no auth): Market data, candles, orderbook, trades
     - EXCHANGE API (auth required): Accounts, orders
 
-    Rate Limits:
-    - Orders: 8/sec, 200/min
-    - Others: 30/sec, 900/min
+    Rate Limits (per group, see rate_limiter.GROUP_LIMITS):
+    - Quotation: 10/sec per group (market, candle, ticker, trade, orderbook)
+    - Orders: 8/sec
+    - Other exchange requests: 30/sec
+
+    Prefer the process-wide client (app.core.upbit_singleton) over creating
+    one per request, so the connection pool, limiter and cache are shared.
     """
 
     BASE_URL = "https://api.upbit.com/v1"
 
+    # 429 retries (exponential backoff: 0.5s, 1s, 2s)
+    MAX_RETRY_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5
+
     def __init__(
         self,
         access_key: Optional[str] = None,
         secret_key: Optional[str] = None,
         timeout: float = 30.0,
+        enable_rate_limit: bool = True,
+        enable_cache: bool = True,
+        max_connections: int = 20,
+        http2: Optional[bool] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize Upbit client.
@@ -66,15 +90,53 @@ class UpbitClient:
             access_key: API access key (required for EXCHANGE API)
             secret_key: API secret key (required for EXCHANGE API)
             timeout: Request timeout in seconds
+            enable_rate_limit: Enable per-group rate limiting
+            enable_cache: Enable the short-TTL quotation cache
+            max_connections: Connection pool size (kept alive)
+            http2: Use HTTP/2 (default: when h2 is installed)
+            base_url: REST endpoint override (e.g. a local load-test stand-in)
         """
         self.access_key = access_key
         self.secret_key = secret_key
+
+        self._rate_limiter: Optional[UpbitRateLimiter] = (
+            UpbitRateLimiter() if enable_rate_limit else None
+        )
+        self._cache: Optional[UpbitCache] = UpbitCache() if enable_cache else None
+
         self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
+            base_url=base_url or self.BASE_URL,
             timeout=timeout,
             headers={"Accept": "application/json"},
+            http2=HTTP2_AVAILABLE if http2 is None else http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=60.0,
+            ),
         )
 
+    def set_credentials(self, access_key: Optional[str], secret_key: Optional[str]) -> None:
+        """Swap API keys (keys only sign requests; the pool is kept)."""
+        self.access_key = access_key
+        self.secret_key = secret_key
+
+    @property
+    def rate_limiter(self) -> Optional[UpbitRateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def cache(self) -> Optional[UpbitCache]:
+        return self._cache
+
+    @property
+    def stats(self) -> dict:
+        """Rate limiter and cache statistics."""
+        return {
+            "rate_limiter": self._rate_limiter.stats if self._rate_limiter else {"enabled": False},
+            "cache": self._cache.stats if self._cache else {"enabled": False},
+        }
+
     async def close(self):
         """Close the HTTP client."""
         await self._client.aclose()
@@ -114,8 +176,12 @@ class UpbitClient:
             List of Ticker objects
         """
         params = {"markets": ",".join(markets)}
-        response = await self._request("GET", "/ticker", params=params)
-        return [Ticker(**t) for t in response]
+
+        async def fetch():
+            response = await self._request("GET", "/ticker", params=params)
+            return [Ticker(**t) for t in response]
+
+        return await self._cached(f"ticker:{params['markets']}", fetch)
 
     async def get_candles_minutes(
         self,
@@ -143,9 +209,12 @@ class UpbitClient:
         if to:
             params["to"] = to
 
-        response = await self._request("GET", f"/candles/minutes/{unit}", params=params)
-        # Note: Upbit API already includes 'unit' in the response, no need to add it
-        return [MinuteCandle(**c) for c in response]
+        async def fetch():
+            response = await self._request("GET", f"/candles/minutes/{unit}", params=params)
+            # Note: Upbit API already includes 'unit' in the response, no need to add it
+            return [MinuteCandle(**c) for c in response]
+
+        return await self._cached(_candle_key("candles_minutes", unit, params), fetch)
 
     async def get_candles_days(
         self,
@@ -172,8 +241,11 @@ class UpbitClient:
         if converting_price_unit:
             params["convertingPriceUnit"] = converting_price_unit
 
-        response = await self._request("GET", "/candles/days", params=params)
-        return [DayCandle(**c) for c in response]
+        async def fetch():
+            response = await self._request("GET", "/candles/days", params=params)
+            return [DayCandle(**c) for c in response]
+
+        return await self._cached(_candle_key("candles_days", 1, params), fetch)
 
     async def get_candles_weeks(
         self,
@@ -186,8 +258,11 @@ class UpbitClient:
         if to:
             params["to"] = to
 
-        response = await self._request("GET", "/candles/weeks", params=params)
-        return [Candle(**c) for c in response]
+        async def fetch():
+            response = await self._request("GET", "/candles/weeks", params=params)
+            return [Candle(**c) for c in response]
+
+        return await self._cached(_candle_key("candles_weeks", 1, params), fetch)
 
     async def get_candles_months(
         self,
@@ -200,8 +275,11 @@ class UpbitClient:
         if to:
             params["to"] = to
 
-        response = await self._request("GET", "/candles/months", params=params)
-        return [Candle(**c) for c in response]
+        async def fetch():
+            response = await self._request("GET", "/candles/months", params=params)
+            return [Candle(**c) for c in response]
+
+        return await self._cached(_candle_key("candles_months", 1, params), fetch)
 
     async def get_candles_seconds(
         self,
@@ -229,8 +307,11 @@ class UpbitClient:
         if to:
             params["to"] = to
 
-        response = await self._request("GET", "/candles/seconds", params=params)
-        return [Candle(**c) for c in response]
+        async def fetch():
+            response = await self._request("GET", "/candles/seconds", params=params)
+            return [Candle(**c) for c in response]
+
+        return await self._cached(_candle_key("candles_seconds", 1, params), fetch)
 
     async def get_orderbook(self, markets: list[str]) -> list[Orderbook]:
         """
@@ -243,8 +324,12 @@ class UpbitClient:
             List of Orderbook objects
         """
         params = {"markets": ",".join(markets)}
-        response = await self._request("GET", "/orderbook", params=params)
-        return [Orderbook(**o) for o in response]
+
+        async def fetch():
+            response = await self._request("GET", "/orderbook", params=params)
+            return [Orderbook(**o) for o in response]
+
+        return await self._cached(f"orderbook:{params['markets']}", fetch)
 
     async def get_trades(
         self,
@@ -409,48 +494,54 @@ class UpbitClient:
         market: str,
         candle_count: int = 100,
         trade_count: int = 50,
+        candles: Optional[list[dict]] = None,
+        orderbook: Optional[Orderbook] = None,
     ) -> CoinAnalysisData:
         """
         Get aggregated data for AI analysis.
 
         Fetches ticker, orderbook, candles, and trades in parallel.
+        Market names come from the process-wide market index (refreshed
+        hourly) instead of a /market/all request per analysis.
 
         Args:
             market: Market code (e.g., "KRW-BTC")
             candle_count: Number of daily candles to fetch
             trade_count: Number of recent trades to fetch
+            candles: Daily candles the caller already holds (newest first,
+                same format as CoinAnalysisData.candles); skips the candle request
+            orderbook: Orderbook the caller already holds (e.g. from the
+                streamed book); skips the orderbook request
 
         Returns:
             CoinAnalysisData with all relevant data
         """
         # Fetch all data in parallel
-        ticker_task = self.get_ticker([market])
-        orderbook_task = self.get_orderbook([market])
-        candles_task = self.get_candles_days(market, count=candle_count)
-        trades_task = self.get_trades(market, count=trade_count)
-        markets_task = self.get_markets()
-
-        results = await asyncio.gather(
-            ticker_task,
-            orderbook_task,
-            candles_task,
-            trades_task,
-            markets_task,
-            return_exceptions=True,
-        )
-
-        ticker_data, orderbook_data, candles_data, trades_data, markets_data = results
-
-        # Handle any errors
-        for result in results:
-            if isinstance(result, Exception):
+        tasks = [
+            self.get_ticker([market]),
+            self.get_orderbook([market]) if orderbook is None else _resolved([orderbook]),
+            self.get_trades(market, count=trade_count),
+            get_market_index().get(market, client=self),
+        ]
+        if candles is None:
+            tasks.append(self.get_candles_days(market, count=candle_count))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        ticker_data, orderbook_data, trades_data, market_info = results[:4]
+        candles_data = results[4] if candles is None else None
+
+        # Handle any errors (market names are optional)
+        for i, result in enumerate(results):
+            if isinstance(result, Exception) and i != 3:
                 raise result
+        if isinstance(market_info, Exception):
+            logger.warning("upbit_market_info_unavailable", market=market, error=str(market_info))
+            market_info = None
 
         ticker = ticker_data[0]
         orderbook = orderbook_data[0]
 
-        # Find market info
-        market_info = next((m for m in markets_data if m.market == market), None)
         korean_name = market_info.korean_name if market_info else market
         english_name = market_info.english_name if market_info else market
 
@@ -461,6 +552,9 @@ class UpbitClient:
             else 0
         )
 
+        if candles is None:
+            candles = self.candles_to_records(candles_data)
+
         return CoinAnalysisData(
             market=market,
             korean_name=korean_name,
@@ -477,17 +571,7 @@ class UpbitClient:
             bid_ask_ratio=bid_ask_ratio,
             total_bid_size=orderbook.total_bid_size,
             total_ask_size=orderbook.total_ask_size,
-            candles=[
-                {
-                    "date": c.candle_date_time_kst,
-                    "open": c.opening_price,
-                    "high": c.high_price,
-                    "low": c.low_price,
-                    "close": c.trade_price,
-                    "volume": c.candle_acc_trade_volume,
-                }
-                for c in candles_data
-            ],
+            candles=candles[:candle_count],
             recent_trades=[
                 {
                     "time": t.trade_time_utc,
@@ -497,12 +581,35 @@ class UpbitClient:
                 }
                 for t in trades_data
             ],
+            orderbook=orderbook.model_dump(),
+            trades=[t.model_dump() for t in trades_data],
         )
 
+    @staticmethod
+    def candles_to_records(candles: list[Candle]) -> list[dict]:
+        """Convert candles to the OHLCV dicts used by CoinAnalysisData."""
+        return [
+            {
+                "date": c.candle_date_time_kst,
+                "open": c.opening_price,
+                "high": c.high_price,
+                "low": c.low_price,
+                "close": c.trade_price,
+                "volume": c.candle_acc_trade_volume,
+            }
+            for c in candles
+        ]
+
     # ============================================================
     # Internal Methods
     # ============================================================
 
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[list]]) -> list:
+        """Serve a quotation list from the cache (a fresh list per caller)."""
+        if self._cache is None:
+            return await fetch()
+        return list(await self._cache.get_or_fetch(key, fetch))
+
     async def _request(
         self,
         method: str,
@@ -512,7 +619,7 @@ class UpbitClient:
         auth: bool = False,
     ) -> dict | list:
         """
-        Make HTTP request to Upbit API.
+        Make HTTP request to Upbit API (retried on 429).
 
         Args:
             method: HTTP method
@@ -524,6 +631,42 @@ class UpbitClient:
         Returns:
             JSON response
         """
+        group = get_request_group(method, endpoint)
+
+        for attempt in range(self.MAX_RETRY_ATTEMPTS):
+            try:
+                return await self._request_once(group, method, endpoint, params, data, auth)
+            except UpbitAPIError as e:
+                if e.status_code != 429 or attempt == self.MAX_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = self.RETRY_BASE_DELAY * (2 ** attempt)
+                if self._rate_limiter:
+                    self._rate_limiter.throttled(group, delay)
+                logger.warning(
+                    "upbit_rate_limit_retry",
+                    group=group,
+                    attempt=attempt + 1,
+                    delay=delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _request_once(
+        self,
+        group: str,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        auth: bool = False,
+    ) -> dict | list:
+        """Single HTTP request to Upbit API."""
+        if self._rate_limiter and not await self._rate_limiter.acquire(group):
+            raise UpbitAPIError(
+                status_code=429,
+                message="Rate limit wait timed out",
+                error_code="client_rate_limit",
+            )
+
         headers = {}
 
         if auth:
@@ -547,10 +690,16 @@ class UpbitClient:
                 headers=headers,
             )
 
+            if self._rate_limiter:
+                self._rate_limiter.update(response.headers.get("Remaining-Req"))
+
             # Check for errors
             if response.status_code >= 400:
-                error_data = response.json() if response.text else {}
-                error = error_data.get("error", {})
+                try:
+                    error_data = response.json() if response.text else {}
+                except ValueError:
+                    error_data = {}  # e.g. plain-text 429 "Too many API requests."
+                error = error_data.get("error", {}) if isinstance(error_data, dict) else {}
                 raise UpbitAPIError(
                     status_code=response.status_code,
                     message=error.get("message", response.text),
@@ -565,3 +714,20 @@ class UpbitClient:
                 status_code=500,
                 message=f"HTTP error: {str(e)}",
             )
+
+
+def _candle_key(prefix: str, unit: int, params: dict) -> str:
+    """Cache key of a candle request."""
+    return ":".join([
+        prefix,
+        params["market"],
+        str(unit),
+        str(params["count"]),
+        params.get("to", ""),
+        params.get("convertingPriceUnit", ""),
+    ])
+
+
+async def _resolved(value):
+    """Awaitable for a value the caller already has (keeps gather() positions)."""
+    return value
@@ -0,0 +1,91 @@
+"""
+Upbit Candle History
+
+Fetches more candles than one REST page (200) allows. Upbit's `to` cursor
+is a timestamp, so the windows before the newest page are known up front
+and are fetched concurrently; the client's per-group rate limiter paces
+them.
+"""
+
+import asyncio
+import math
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import structlog
+
+from .candle_builder import BACKFILL_COUNT, CANDLE_INTERVALS, bar_from_candle, fetch_candles
+
+if TYPE_CHECKING:
+    from .client import UpbitClient
+
+logger = structlog.get_logger()
+
+# Pages fetched at once (the candle group allows 10 requests/sec)
+DEFAULT_CONCURRENCY = 4
+
+
+def _to_param(start_ms: int) -> str:
+    return datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+async def fetch_candle_history(
+    client: "UpbitClient",
+    market: str,
+    interval: str,
+    count: int,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list:
+    """
+    Fetch up to `count` candles (newest first) across several REST pages.
+
+    The newest page is fetched first. Older pages cover consecutive
+    200-bar time windows before it; windows without trades return fewer
+    candles, so extra waves are fetched until `count` is reached or a
+    window comes back empty (the market's history has ended).
+
+    Args:
+        client: Upbit client
+        market: Market code
+        interval: Candle interval (see CANDLE_INTERVALS)
+        count: Number of candles wanted
+        concurrency: Pages fetched at once
+
+    Returns:
+        Candles, newest first (fewer than count if history is shorter)
+    """
+    newest = await fetch_candles(client, market, interval, BACKFILL_COUNT)
+    if count <= len(newest) or len(newest) < BACKFILL_COUNT:
+        return newest[:count]
+
+    window = BACKFILL_COUNT * CANDLE_INTERVALS[interval] * 1000
+    cursor = bar_from_candle(newest[-1]).start
+    candles = {c.candle_date_time_utc: c for c in newest}
+    max_pages = math.ceil(count / BACKFILL_COUNT) + concurrency
+    pages = 1
+
+    while len(candles) < count and pages < max_pages:
+        wave = min(concurrency, max_pages - pages)
+        cursors = [cursor - i * window for i in range(wave)]
+        results = await asyncio.gather(*(
+            fetch_candles(client, market, interval, BACKFILL_COUNT, to=_to_param(to))
+            for to in cursors
+        ))
+        pages += wave
+        cursor -= wave * window
+
+        for page in results:
+            for candle in page:
+                candles.setdefault(candle.candle_date_time_utc, candle)
+        if any(not page for page in results):
+            break
+
+    logger.debug(
+        "upbit_candle_history_fetched",
+        market=market,
+        interval=interval,
+        candles=len(candles),
+        pages=pages,
+    )
+    ordered = sorted(candles.values(), key=lambda c: c.candle_date_time_utc, reverse=True)
+    return ordered[:count]
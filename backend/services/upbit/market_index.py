@@ -0,0 +1,138 @@
+"""
+Upbit Market Metadata Index
+
+Process-wide index of the Upbit market list (/market/all).
+
+The market list rarely changes, so it is fetched once and refreshed at
+most once per hour instead of on every coin analysis. Lookups are dict
+based (market code -> Market).
+"""
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional
+
+import structlog
+
+from .models import Market
+
+if TYPE_CHECKING:
+    from .client import UpbitClient
+
+logger = structlog.get_logger()
+
+
+class UpbitMarketIndex:
+    """
+    Cached market code -> Market index.
+
+    Refresh failures keep serving the previous (stale) index; an empty
+    index simply returns None for every lookup.
+    """
+
+    REFRESH_INTERVAL = 3600.0  # 1 hour
+
+    def __init__(self, refresh_interval: float = REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._markets: dict[str, Market] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+        # Statistics
+        self._refreshes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.refresh_interval
+        )
+
+    def load(self, markets: list[Market]) -> None:
+        """Replace the index with a freshly fetched market list."""
+        self._markets = {m.market: m for m in markets}
+        self._loaded_at = time.monotonic()
+        self._refreshes += 1
+
+    async def refresh(self, client: Optional["UpbitClient"] = None, force: bool = False) -> None:
+        """
+        Refresh the index if it is stale (or force=True).
+
+        Concurrent callers share one /market/all request.
+
+        Args:
+            client: Client to use (a temporary one is created if omitted)
+            force: Refresh even if the index is fresh
+        """
+        if not force and not self.is_stale:
+            return
+
+        async with self._lock:
+            if not force and not self.is_stale:
+                return
+
+            try:
+                if client is not None:
+                    markets = await client.get_markets(is_details=True)
+                else:
+                    from app.config import settings
+
+                    from .client import UpbitClient
+
+                    async with UpbitClient(base_url=settings.UPBIT_BASE_URL) as temp_client:
+                        markets = await temp_client.get_markets(is_details=True)
+            except Exception as e:
+                if not self._markets:
+                    raise
+                logger.warning("upbit_market_index_refresh_failed", error=str(e))
+                return
+
+            self.load(markets)
+            logger.info("upbit_market_index_refreshed", markets=len(self._markets))
+
+    async def get(self, market: str, client: Optional["UpbitClient"] = None) -> Optional[Market]:
+        """Look up a market, refreshing the index first if it is stale."""
+        await self.refresh(client)
+        return self.get_cached(market)
+
+    def get_cached(self, market: str) -> Optional[Market]:
+        """Look up a market without any network access."""
+        info = self._markets.get(market.upper())
+        if info is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return info
+
+    def all(self) -> list[Market]:
+        """All indexed markets."""
+        return list(self._markets.values())
+
+    def get_stats(self) -> dict:
+        """Get index statistics."""
+        return {
+            "markets": len(self._markets),
+            "age_seconds": (
+                round(time.monotonic() - self._loaded_at, 1)
+                if self._loaded_at is not None else None
+            ),
+            "refreshes": self._refreshes,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+# Singleton instance
+_market_index: Optional[UpbitMarketIndex] = None
+
+
+def get_market_index() -> UpbitMarketIndex:
+    """Get or create the process-wide market index."""
+    global _market_index
+
+    if _market_index is None:
+        _market_index = UpbitMarketIndex()
+
+    return _market_index
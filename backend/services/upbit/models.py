@@ -204,3 +204,7 @@ class CoinAnalysisData(BaseModel):
 
     # Recent trades
     recent_trades: list[dict]
+
+    # Full orderbook/trade dumps (so callers don't re-request them)
+    orderbook: Optional[dict] = None
+    trades: list[dict] = Field(default_factory=list)
@@ -0,0 +1,199 @@
+"""
+Upbit API Rate Limiter
+
+Token bucket per Upbit request group. Upbit limits requests per group
+(per IP for quotation, per account for exchange) and reports what is left
+in every response:
+
+    Remaining-Req: group=candle; min=599; sec=9
+
+The buckets start from the published quotas and are pulled down to the
+reported remaining count, so requests made by other processes sharing the
+IP/account are accounted for. A 429 empties the bucket and pauses the group.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+# Requests per second per group (Upbit quotas)
+GROUP_LIMITS = {
+    # QUOTATION (per IP)
+    "market": 10,
+    "candle": 10,
+    "ticker": 10,
+    "trade": 10,
+    "orderbook": 10,
+    # EXCHANGE (per account)
+    "default": 30,
+    "order": 8,
+}
+
+DEFAULT_GROUP_LIMIT = 10
+
+
+def get_request_group(method: str, endpoint: str) -> str:
+    """Map a request to its Upbit rate limit group."""
+    if endpoint.startswith("/candles"):
+        return "candle"
+    if endpoint == "/market/all":
+        return "market"
+    if endpoint == "/ticker":
+        return "ticker"
+    if endpoint.startswith("/trades"):
+        return "trade"
+    if endpoint == "/orderbook":
+        return "orderbook"
+    if (method, endpoint) in (("POST", "/orders"), ("DELETE", "/order")):
+        return "order"
+    return "default"
+
+
+def parse_remaining_req(header: Optional[str]) -> Optional[tuple[str, int]]:
+    """
+    Parse a Remaining-Req header.
+
+    Returns:
+        (group, remaining requests in the current second), or None
+    """
+    if not header:
+        return None
+
+    values = {}
+    for part in header.split(";"):
+        key, _, value = part.strip().partition("=")
+        values[key] = value
+
+    try:
+        return values["group"], int(values["sec"])
+    except (KeyError, ValueError):
+        return None
+
+
+@dataclass
+class GroupBucket:
+    """Token bucket for one request group."""
+    rate: float  # tokens per second (= bucket size)
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False)
+    paused_until: float = field(default=0.0, init=False)
+    _lock: asyncio.Lock = field(init=False)
+
+    def __post_init__(self):
+        self.tokens = self.rate
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, waiting for a refill if needed.
+
+        Returns:
+            True if acquired, False if timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            async with self._lock:
+                self._refill()
+                now = time.monotonic()
+                if now >= self.paused_until and self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return True
+                wait = max(self.paused_until - now, (1.0 - self.tokens) / self.rate)
+
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            await asyncio.sleep(wait)
+
+    def sync(self, remaining: int) -> None:
+        """Never assume more tokens than the server reports as remaining."""
+        self._refill()
+        self.tokens = min(self.tokens, float(remaining))
+
+    def pause(self, seconds: float) -> None:
+        """Stop issuing requests for a while (after a 429)."""
+        self.tokens = 0.0
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+
+class UpbitRateLimiter:
+    """
+    Per-group Upbit rate limiter.
+
+    Usage:
+        limiter = UpbitRateLimiter()
+        await limiter.acquire("candle")
+        response = await http.get(...)
+        limiter.update(response.headers.get("Remaining-Req"))
+    """
+
+    def __init__(self, limits: Optional[dict[str, int]] = None):
+        """
+        Args:
+            limits: Requests per second per group (defaults to GROUP_LIMITS)
+        """
+        self._limits = {**GROUP_LIMITS, **(limits or {})}
+        self._buckets: dict[str, GroupBucket] = {}
+
+        # Statistics
+        self._requests: dict[str, int] = {}
+        self._throttled = 0
+        self._wait_time_total = 0.0
+
+    def _bucket(self, group: str) -> GroupBucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            bucket = GroupBucket(rate=float(self._limits.get(group, DEFAULT_GROUP_LIMIT)))
+            self._buckets[group] = bucket
+        return bucket
+
+    async def acquire(self, group: str, timeout: Optional[float] = 30.0) -> bool:
+        """
+        Take a token for a request group.
+
+        Returns:
+            True if acquired, False if timeout
+        """
+        start = time.monotonic()
+        acquired = await self._bucket(group).acquire(timeout)
+
+        self._requests[group] = self._requests.get(group, 0) + 1
+        self._wait_time_total += time.monotonic() - start
+        return acquired
+
+    def update(self, remaining_req: Optional[str]) -> None:
+        """Apply a Remaining-Req response header."""
+        parsed = parse_remaining_req(remaining_req)
+        if parsed is not None:
+            group, remaining = parsed
+            self._bucket(group).sync(remaining)
+
+    def throttled(self, group: str, seconds: float = 1.0) -> None:
+        """Record a 429 for a group and pause it."""
+        self._throttled += 1
+        self._bucket(group).pause(seconds)
+        logger.warning("upbit_rate_limited", group=group, pause=seconds)
+
+    @property
+    def stats(self) -> dict:
+        """Rate limiter statistics."""
+        return {
+            "requests": dict(self._requests),
+            "throttled": self._throttled,
+            "total_wait_time": f"{self._wait_time_total:.3f}s",
+            "tokens_available": {
+                group: round(bucket.tokens, 2) for group, bucket in self._buckets.items()
+            },
+        }
@@ -3,6 +3,9 @@ Upbit WebSocket Client
 
 Real-time data streaming from Upbit exchange via WebSocket.
 Supports ticker, trade, and orderbook subscriptions.
+
+Frames are decoded with services.stream_codec and delivered as lightweight
+StreamFrame views; a frame type without callbacks is not wrapped at all.
 """
 
 import asyncio
@@ -16,6 +19,8 @@ import websockets
 from pydantic import BaseModel, ConfigDict, Field
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+from services.stream_codec import loads
+
 logger = structlog.get_logger()
 
 
@@ -125,14 +130,73 @@ class WebSocketOrderbook(BaseModel):
     stream_type: StreamType = Field(..., description="스트림 타입")
 
 
+# -------------------------------------------
+# Stream Frames
+# -------------------------------------------
+
+
+class StreamFrame:
+    """
+    Lightweight view over a decoded stream message.
+
+    Fields are read lazily from the decoded dict, with nothing validated or
+    copied per frame. Field names follow the pydantic models above, but enum
+    fields (change, ask_bid, stream_type) are the raw strings. Use
+    to_model() for a validated model.
+    """
+
+    __slots__ = ("_data",)
+    model: type[BaseModel]
+
+    def __init__(self, data: dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            field = self.model.model_fields.get(name)
+            if field is not None and not field.is_required():
+                return field.default
+            raise AttributeError(name) from None
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The decoded message."""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """Validate into the full pydantic model."""
+        return self.model(**self._data)
+
+
+class TickerFrame(StreamFrame):
+    """Ticker frame (fields of WebSocketTicker)."""
+    __slots__ = ()
+    model = WebSocketTicker
+
+
+class TradeFrame(StreamFrame):
+    """Trade frame (fields of WebSocketTrade)."""
+    __slots__ = ()
+    model = WebSocketTrade
+
+
+class OrderbookFrame(StreamFrame):
+    """Orderbook frame (fields of WebSocketOrderbook)."""
+    __slots__ = ()
+    model = WebSocketOrderbook
+
+
 # -------------------------------------------
 # Callback Types
 # -------------------------------------------
 
-TickerCallback = Callable[[WebSocketTicker], None]
-TradeCallback = Callable[[WebSocketTrade], None]
-OrderbookCallback = Callable[[WebSocketOrderbook], None]
+TickerCallback = Callable[[TickerFrame], None]
+TradeCallback = Callable[[TradeFrame], None]
+OrderbookCallback = Callable[[OrderbookFrame], None]
 ErrorCallback = Callable[[Exception], None]
+ConnectCallback = Callable[[], None]
 
 
 # -------------------------------------------
@@ -165,6 +229,7 @@ class UpbitWebSocketClient:
         max_reconnect_attempts: int = 10,
         reconnect_delay: float = 1.0,
         max_reconnect_delay: float = 60.0,
+        url: Optional[str] = None,
     ):
         """
         Initialize WebSocket client.
@@ -174,7 +239,9 @@ class UpbitWebSocketClient:
             max_reconnect_attempts: Maximum reconnection attempts (0 = infinite)
             reconnect_delay: Initial delay between reconnection attempts
             max_reconnect_delay: Maximum delay between reconnection attempts
+            url: WebSocket endpoint override (e.g. a local load-test stand-in)
         """
+        self._url = url or self.WSS_URL
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._running = False
         self._reconnect = reconnect
@@ -193,6 +260,14 @@ class UpbitWebSocketClient:
         self._trade_callbacks: list[TradeCallback] = []
         self._orderbook_callbacks: list[OrderbookCallback] = []
         self._error_callbacks: list[ErrorCallback] = []
+        self._connect_callbacks: list[ConnectCallback] = []
+
+        # Message type -> (callbacks, frame type)
+        self._dispatch: dict[str, tuple[list, type[StreamFrame]]] = {
+            "ticker": (self._ticker_callbacks, TickerFrame),
+            "trade": (self._trade_callbacks, TradeFrame),
+            "orderbook": (self._orderbook_callbacks, OrderbookFrame),
+        }
 
         # Receive task
         self._receive_task: Optional[asyncio.Task] = None
@@ -201,12 +276,12 @@ class UpbitWebSocketClient:
         """Establish WebSocket connection."""
         try:
             self._ws = await websockets.connect(
-                self.WSS_URL,
+                self._url,
                 ping_interval=30,
                 ping_timeout=10,
             )
             self._reconnect_attempts = 0
-            logger.info("upbit_websocket_connected", url=self.WSS_URL)
+            logger.info("upbit_websocket_connected", url=self._url)
 
             # Re-subscribe to all markets
             await self._resubscribe()
@@ -215,6 +290,12 @@ class UpbitWebSocketClient:
             logger.error("upbit_websocket_connect_failed", error=str(e))
             raise
 
+        for callback in self._connect_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("connect_callback_error", error=str(e))
+
     async def disconnect(self) -> None:
         """Close WebSocket connection."""
         self._running = False
@@ -355,6 +436,10 @@ class UpbitWebSocketClient:
         """Register error callback."""
         self._error_callbacks.append(callback)
 
+    def on_connect(self, callback: ConnectCallback) -> None:
+        """Register callback run after every (re)connection."""
+        self._connect_callbacks.append(callback)
+
     # -------------------------------------------
     # Message Handling
     # -------------------------------------------
@@ -396,51 +481,32 @@ class UpbitWebSocketClient:
                 break
 
             try:
-                data = json.loads(message)
-                await self._process_message(data)
-            except json.JSONDecodeError as e:
+                data = loads(message)
+            except ValueError as e:
                 logger.warning("upbit_websocket_invalid_json", error=str(e))
+                continue
+            await self._process_message(data)
 
     async def _process_message(self, data: dict[str, Any]) -> None:
         """Process incoming WebSocket message."""
         msg_type = data.get("type")
+        dispatch = self._dispatch.get(msg_type)
+        if dispatch is None:
+            return
 
-        try:
-            if msg_type == "ticker":
-                ticker = WebSocketTicker(**data)
-                for callback in self._ticker_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(ticker)
-                        else:
-                            callback(ticker)
-                    except Exception as e:
-                        logger.error("ticker_callback_error", error=str(e))
-
-            elif msg_type == "trade":
-                trade = WebSocketTrade(**data)
-                for callback in self._trade_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(trade)
-                        else:
-                            callback(trade)
-                    except Exception as e:
-                        logger.error("trade_callback_error", error=str(e))
-
-            elif msg_type == "orderbook":
-                orderbook = WebSocketOrderbook(**data)
-                for callback in self._orderbook_callbacks:
-                    try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(orderbook)
-                        else:
-                            callback(orderbook)
-                    except Exception as e:
-                        logger.error("orderbook_callback_error", error=str(e))
+        callbacks, frame_type = dispatch
+        if not callbacks:
+            return  # Nobody listens: skip wrapping entirely
 
-        except Exception as e:
-            logger.error("upbit_websocket_process_error", type=msg_type, error=str(e))
+        frame = frame_type(data)
+        for callback in callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    await callback(frame)
+                else:
+                    callback(frame)
+            except Exception as e:
+                logger.error("stream_callback_error", type=msg_type, error=str(e))
 
     async def _handle_reconnect(self) -> None:
         """Handle reconnection with exponential backoff."""
@@ -0,0 +1,102 @@
+"""
+Tests for the yfinance SQLite cache (bulk upsert + incremental download)
+"""
+
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agents.tools import market_data
+
+
+def _make_history(start: str, periods: int, base: float = 100.0) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="D", tz="America/New_York", name="Date")
+    close = base + np.arange(periods, dtype=float)
+    return pd.DataFrame({
+        "Open": close - 1,
+        "High": close + 1,
+        "Low": close - 2,
+        "Close": close,
+        "Volume": np.arange(periods, dtype=np.int64) * 1000,
+    }, index=index)
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    path = tmp_path / "market_data.db"
+    with patch.object(market_data, "CACHE_DB", path), \
+            patch.object(market_data, "_initialized_cache_dbs", set()):
+        yield path
+
+
+class TestCacheStorage:
+    """Bulk upsert and load"""
+
+    def test_round_trip(self, cache_db):
+        df = _make_history("2024-01-01", 10)
+        assert market_data.save_to_cache("AAPL", df) == 10
+
+        loaded = market_data.load_from_cache("AAPL", days=5)
+        assert list(loaded.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert loaded.index.is_monotonic_increasing
+        assert loaded.index[-1] == pd.Timestamp("2024-01-10")
+        assert loaded["Close"].tolist() == df["Close"].iloc[-5:].tolist()
+        assert loaded["Volume"].dtype == np.int64
+
+    def test_upsert_overwrites_existing_dates(self, cache_db):
+        market_data.save_to_cache("AAPL", _make_history("2024-01-01", 5))
+        market_data.save_to_cache("AAPL", _make_history("2024-01-04", 4, base=200.0))
+
+        loaded = market_data.load_from_cache("AAPL", days=100)
+        assert len(loaded) == 7
+        assert loaded.loc["2024-01-04", "Close"] == 200.0
+        assert market_data.get_latest_cached_date("AAPL") == "2024-01-07"
+        assert market_data.get_cache_stats()["tickers"]["AAPL"]["days"] == 7
+
+    def test_schema_is_created_once(self, cache_db):
+        with patch.object(market_data.sqlite3, "connect", wraps=market_data.sqlite3.connect) as connect:
+            market_data.save_to_cache("AAPL", _make_history("2024-01-01", 3))
+            market_data.save_to_cache("MSFT", _make_history("2024-01-01", 3))
+
+        # One connection for the schema, then one per save
+        assert connect.call_count == 3
+
+
+class TestIncrementalDownload:
+    """download_historical_data(incremental=True)"""
+
+    async def test_fetches_only_new_dates(self, cache_db):
+        market_data.save_to_cache("AAPL", _make_history("2024-01-01", 5))
+
+        ticker = MagicMock()
+        # yfinance echoes back the last cached session
+        ticker.history.return_value = _make_history("2024-01-05", 3, base=300.0)
+        yf = SimpleNamespace(Ticker=MagicMock(return_value=ticker))
+
+        with patch.dict(sys.modules, {"yfinance": yf}), \
+                patch.object(market_data.asyncio, "sleep", AsyncMock()):
+            results = await market_data.download_historical_data(["AAPL"], incremental=True)
+
+        assert ticker.history.call_args.kwargs["start"] == "2024-01-06"
+        assert "period" not in ticker.history.call_args.kwargs
+        assert len(results["AAPL"]) == 2
+        assert market_data.get_latest_cached_date("AAPL") == "2024-01-07"
+        assert market_data.load_from_cache("AAPL", days=100).loc["2024-01-05", "Close"] == 104.0
+
+    async def test_uncached_ticker_downloads_full_period(self, cache_db):
+        ticker = MagicMock()
+        ticker.history.return_value = _make_history("2024-01-01", 3)
+        yf = SimpleNamespace(Ticker=MagicMock(return_value=ticker))
+
+        with patch.dict(sys.modules, {"yfinance": yf}), \
+                patch.object(market_data.asyncio, "sleep", AsyncMock()):
+            results = await market_data.download_historical_data(
+                ["MSFT"], period="1y", incremental=True
+            )
+
+        assert ticker.history.call_args.kwargs["period"] == "1y"
+        assert len(results["MSFT"]) == 3
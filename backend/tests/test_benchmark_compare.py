@@ -0,0 +1,83 @@
+"""
+Tests for the benchmark comparison report
+"""
+
+import json
+
+from benchmarks.compare import compare_runs, main, render_report
+
+
+def _stats(median: float, iqr: float = 0.0) -> dict:
+    return {"min": median, "mean": median, "median": median, "max": median, "iqr": iqr}
+
+
+def _write_run(path, medians: dict):
+    path.write_text(json.dumps({
+        "benchmarks": [
+            {"fullname": name, "stats": _stats(median)} for name, median in medians.items()
+        ],
+    }))
+
+
+class TestCompareRuns:
+    """Regression/improvement classification"""
+
+    def test_statuses(self):
+        baseline = {
+            "slower": _stats(1.0),
+            "faster": _stats(1.0),
+            "noisy": _stats(1.0, iqr=0.5),
+            "steady": _stats(1.0),
+            "removed": _stats(1.0),
+        }
+        current = {
+            "slower": _stats(1.2),
+            "faster": _stats(0.8),
+            "noisy": _stats(1.3),
+            "steady": _stats(1.05),
+            "added": _stats(1.0),
+        }
+
+        statuses = {c.name: c.status for c in compare_runs(baseline, current, threshold_pct=10)}
+
+        assert statuses == {
+            "slower": "regression",
+            "faster": "improved",
+            "noisy": "unchanged",  # Within the baseline's IQR
+            "steady": "unchanged",
+            "removed": "missing",
+            "added": "new",
+        }
+
+    def test_report_lists_regressions_first(self):
+        comparisons = compare_runs(
+            {"a": _stats(1.0), "b": _stats(1.0)},
+            {"a": _stats(1.0), "b": _stats(2.0)},
+        )
+        report = render_report(comparisons, "median", 10)
+
+        rows = [line for line in report.splitlines() if line.startswith("| b") or line.startswith("| a")]
+        assert rows[0].startswith("| b") and "REGRESSION" in rows[0]
+        assert "1 regression(s)" in report
+
+
+class TestMain:
+    """Command line: baseline storage and exit codes"""
+
+    def test_save_and_compare(self, tmp_path):
+        baseline = tmp_path / "baselines" / "baseline.json"
+        run = tmp_path / "run.json"
+
+        _write_run(run, {"bench": 0.010})
+        assert main([str(run), "--baseline", str(baseline), "--save-baseline"]) == 0
+        assert baseline.exists()
+
+        assert main([str(run), "--baseline", str(baseline)]) == 0
+
+        _write_run(run, {"bench": 0.020})
+        report = tmp_path / "report.md"
+        assert main([str(run), "--baseline", str(baseline), "--output", str(report)]) == 1
+        assert "REGRESSION" in report.read_text()
+
+    def test_missing_inputs(self, tmp_path):
+        assert main(["--storage", str(tmp_path), "--baseline", str(tmp_path / "none.json")]) == 2
@@ -0,0 +1,216 @@
+"""
+Tests for the load-test stand-ins and report
+"""
+
+import json
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from loadtest.fake_llm import FakeLLMServer, build_reply
+from loadtest.kiwoom_sim import CHART_PAGE_SIZE, KiwoomSimulator
+from loadtest.market import SyntheticMarket
+from loadtest.scenario import ScenarioConfig, ScenarioReport, diff_stats, render_report
+from loadtest.stats import LatencyRecorder, percentile
+from loadtest.upbit_sim import UpbitSimulator
+from services.kiwoom.client import KiwoomClient
+from services.upbit.rate_limiter import parse_remaining_req
+from services.upbit.websocket import WebSocketTicker
+
+SIM_URL = "http://sim"
+
+
+@pytest.fixture
+def market():
+    return SyntheticMarket(stocks=50, coins=6)
+
+
+def _asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=SIM_URL)
+
+
+class TestStats:
+    """Percentiles and recorder summary"""
+
+    def test_percentile(self):
+        assert percentile([], 50) is None
+        assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+        assert percentile([1.0, 2.0], 50) == pytest.approx(1.5)
+        assert percentile(list(range(101)), 99) == pytest.approx(99.0)
+
+    def test_recorder_summary(self):
+        recorder = LatencyRecorder("op")
+        recorder.record(0.1, started=0.0)
+        recorder.record(0.3)
+        recorder.error()
+        with pytest.raises(ValueError):
+            with recorder.measure():
+                raise ValueError("boom")
+
+        summary = recorder.summary()
+        assert summary["count"] == 2
+        assert summary["errors"] == 2
+        assert summary["p50"] == pytest.approx(0.2)
+        assert summary["max"] == pytest.approx(0.3)
+
+
+class TestKiwoomSimulator:
+    """Kiwoom REST stand-in"""
+
+    async def _token(self, client: httpx.AsyncClient) -> str:
+        response = await client.post("/oauth2/token", json={"appkey": "k", "secretkey": "s"})
+        return response.json()["token"]
+
+    async def test_rate_limit_returns_1700(self, market):
+        sim = KiwoomSimulator(market, rate_limit=5)
+        async with _asgi_client(sim.create_app()) as client:
+            headers = {"authorization": f"Bearer {await self._token(client)}", "api-id": "ka10001"}
+            responses = [
+                await client.post("/api/dostk/stkinfo", json={"stk_cd": "005930"}, headers=headers)
+                for _ in range(6)
+            ]
+
+        assert [r.status_code for r in responses[:5]] == [200] * 5
+        assert responses[5].status_code == 429
+        body = responses[5].json()
+        assert body["return_code"] == 5
+        assert "1700" in body["return_msg"]
+        assert sim.stats()["rate_limited"] == 1
+
+    async def test_orders_and_queries_limited_separately(self, market):
+        sim = KiwoomSimulator(market, rate_limit=1)
+        async with _asgi_client(sim.create_app()) as client:
+            auth = f"Bearer {await self._token(client)}"
+            query = await client.post(
+                "/api/dostk/stkinfo", json={"stk_cd": "005930"}, headers={"authorization": auth, "api-id": "ka10001"}
+            )
+            order = await client.post(
+                "/api/dostk/ordr",
+                json={"dmst_stex_tp": "KRX", "stk_cd": "005930", "ord_qty": "1", "trde_tp": "3"},
+                headers={"authorization": auth, "api-id": "kt10000"},
+            )
+        assert query.status_code == 200
+        assert order.status_code == 200
+        assert order.json()["return_code"] == 0
+        assert sim.holdings["005930"][0] == 1
+
+    async def test_daily_chart_pages(self, market):
+        sim = KiwoomSimulator(market)
+        async with _asgi_client(sim.create_app()) as client:
+            headers = {"authorization": f"Bearer {await self._token(client)}", "api-id": "ka10081"}
+            first = await client.post("/api/dostk/chart", json={"stk_cd": "005930"}, headers=headers)
+            second = await client.post(
+                "/api/dostk/chart",
+                json={"stk_cd": "005930"},
+                headers={**headers, "cont-yn": "Y", "next-key": first.headers["next-key"]},
+            )
+
+        first_rows = first.json()["stk_dt_pole_chart_qry"]
+        second_rows = second.json()["stk_dt_pole_chart_qry"]
+        assert first.headers["cont-yn"] == "Y"
+        assert len(first_rows) == CHART_PAGE_SIZE
+        assert second.headers["cont-yn"] == "N"
+        assert second_rows[0]["dt"] < first_rows[-1]["dt"]
+
+    async def test_client_retries_through_rate_limit(self, market):
+        sim = KiwoomSimulator(market, rate_limit=2)
+        client = KiwoomClient(
+            app_key="k", secret_key="s", enable_rate_limit=False, enable_cache=False, base_url=SIM_URL
+        )
+        client.RETRY_BASE_DELAY = 0.5
+        app = sim.create_app()
+        client._client = _asgi_client(app)
+        client.auth._client = _asgi_client(app)
+        try:
+            infos = [await client.get_stock_info("005930") for _ in range(4)]
+        finally:
+            await client.close()
+
+        assert all(info.stk_cd == "005930" for info in infos)
+        assert sim.stats()["rate_limited"] >= 1
+
+
+class TestUpbitSimulator:
+    """Upbit REST/WebSocket stand-in"""
+
+    async def test_remaining_req_and_429(self, market):
+        sim = UpbitSimulator(market, group_limits={"ticker": 2})
+        async with _asgi_client(sim.create_app()) as client:
+            responses = [await client.get("/v1/ticker", params={"markets": "KRW-BTC"}) for _ in range(3)]
+
+        assert parse_remaining_req(responses[0].headers["Remaining-Req"]) == ("ticker", 1)
+        assert responses[0].json()[0]["market"] == "KRW-BTC"
+        assert responses[2].status_code == 429
+        assert responses[2].text == "Too many API requests."
+
+    async def test_exchange_requires_auth(self, market):
+        sim = UpbitSimulator(market)
+        async with _asgi_client(sim.create_app()) as client:
+            response = await client.get("/v1/accounts")
+        assert response.status_code == 401
+        assert "error" in response.json()
+
+    def test_ticker_snapshot_matches_client_model(self, market):
+        sim = UpbitSimulator(market, tick_interval=60)
+        with TestClient(sim.create_app()) as client:
+            with client.websocket_connect("/websocket/v1") as ws:
+                ws.send_text(json.dumps([
+                    {"ticket": "t"},
+                    {"type": "ticker", "codes": ["KRW-BTC"]},
+                    {"format": "DEFAULT"},
+                ]))
+                frame = json.loads(ws.receive_bytes())
+
+        assert frame["stream_type"] == "SNAPSHOT"
+        ticker = WebSocketTicker.model_validate(frame)
+        assert ticker.code == "KRW-BTC"
+
+
+class TestFakeLLM:
+    """OpenAI-compatible fake"""
+
+    def test_batch_reply_has_section_per_stock(self):
+        reply = " ".join(build_reply("다음 3개 종목을 분석하세요", tokens=10))
+        assert "[종목 3]" in reply
+        assert "[종목 4]" not in reply
+
+    async def test_completion_and_stream(self):
+        server = FakeLLMServer(latency_ms=0, tokens_per_sec=10_000, completion_tokens=40)
+        request = {"model": "x", "messages": [{"role": "user", "content": "분석"}]}
+        async with _asgi_client(server.create_app()) as client:
+            completion = (await client.post("/v1/chat/completions", json=request)).json()
+            streamed = await client.post("/v1/chat/completions", json={**request, "stream": True})
+
+        assert completion["choices"][0]["message"]["content"].startswith("ACTION: HOLD")
+        assert completion["usage"]["completion_tokens"] == 40
+        events = [line[6:] for line in streamed.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        assert json.loads(events[-2])["choices"][0]["finish_reason"] == "stop"
+        assert server.stats()["completion_tokens"] == 80
+
+
+class TestReport:
+    """Stand-in counter diff and markdown report"""
+
+    def test_diff_stats_keeps_gauges(self):
+        before = {"requests": {"ka10001": 3}, "rate_limited": 1, "ws_connections": 5}
+        after = {"requests": {"ka10001": 10, "ka10081": 2}, "rate_limited": 4, "ws_connections": 2}
+        assert diff_stats(before, after) == {
+            "requests": {"ka10001": 7, "ka10081": 2},
+            "rate_limited": 3,
+            "ws_connections": 2,
+        }
+
+    def test_render_report(self):
+        recorder = LatencyRecorder("analysis.total")
+        recorder.record(1.5, started=0.0)
+        report = ScenarioReport(
+            config=ScenarioConfig(analyses=1, sockets=0),
+            wall_time=2.0,
+            workloads={"analysis.total": recorder.summary()},
+            stand_ins={"kiwoom": {"requests": {"ka10001": 7, "ka10081": 2}, "rate_limited": 3, "ws_frames": 10}},
+        )
+        text = render_report(report)
+        assert "| analysis.total | 1 | 0 | 1.50 s |" in text
+        assert "| kiwoom | 9 | 3 | 10 |" in text
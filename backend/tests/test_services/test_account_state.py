@@ -0,0 +1,253 @@
+"""
+Tests for the shared Account State Service
+
+Tests REST-only freshness, stream-fed updates from fills and balance
+messages, coalesced reconciliation, subscribers and the market snapshot
+position part.
+"""
+
+import asyncio
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.account_state import AccountStateService
+from services.kiwoom import BalanceData, OrderExecutionData
+from services.kiwoom.models import AccountBalance, Holding
+from services.market_snapshot import POSITION, MarketSnapshotService
+
+
+def _balance(quantity: int = 10, cash: int = 1_000_000) -> AccountBalance:
+    holdings = [
+        Holding(
+            stk_cd="005930", stk_nm="삼성전자", hldg_qty=quantity, avg_buy_prc=70000,
+            cur_prc=76000, evlu_amt=76000 * quantity, evlu_pfls_amt=6000 * quantity,
+            evlu_pfls_rt=8.57,
+        )
+    ] if quantity else []
+    return AccountBalance(
+        pchs_amt=70000 * quantity,
+        evlu_amt=76000 * quantity,
+        evlu_pfls_amt=6000 * quantity,
+        evlu_pfls_rt=8.57 if quantity else 0.0,
+        d2_ord_psbl_amt=cash,
+        holdings=holdings,
+    )
+
+
+def _execution(side: str, qty: int, price: int, stk_cd: str = "005930") -> OrderExecutionData:
+    return OrderExecutionData(
+        stk_cd=stk_cd, stk_nm="삼성전자", ord_no="0001", ord_qty=qty, ord_prc=price,
+        ccld_qty=qty, ccld_prc=price, ord_tp=side,
+    )
+
+
+def _holding_balance(quantity: int, avg_price: int, price: int = 76000) -> BalanceData:
+    return BalanceData(
+        stk_cd="005930", stk_nm="삼성전자", hldg_qty=quantity, avg_buy_prc=avg_price,
+        cur_prc=price, evlu_amt=price * quantity, evlu_pfls_amt=(price - avg_price) * quantity,
+    )
+
+
+class FakeRealtime:
+    """Stands in for KrRealtimeService."""
+
+    def __init__(self):
+        self.balance_callbacks = set()
+        self.execution_callbacks = set()
+        self.is_connected = True
+
+    async def subscribe_balance(self, callback):
+        self.balance_callbacks.add(callback)
+
+    async def unsubscribe_balance(self, callback):
+        self.balance_callbacks.discard(callback)
+
+    async def subscribe_order_execution(self, callback):
+        self.execution_callbacks.add(callback)
+
+    async def unsubscribe_order_execution(self, callback):
+        self.execution_callbacks.discard(callback)
+
+    async def emit(self, data):
+        callbacks = self.balance_callbacks if isinstance(data, BalanceData) else self.execution_callbacks
+        for callback in list(callbacks):
+            await callback(data)
+
+
+@pytest.fixture
+def client():
+    client = AsyncMock()
+    client.cache = None
+    client.get_account_balance.return_value = _balance()
+    return client
+
+
+def _service(client, **kwargs) -> AccountStateService:
+    async def factory():
+        return client
+
+    return AccountStateService(client_factory=factory, **kwargs)
+
+
+class TestRestOnly:
+    """Without streams the service is a shared, max-age bounded cache."""
+
+    async def test_one_call_shared_until_stale(self, client):
+        service = _service(client, stale_after=60)
+
+        snapshots = await asyncio.gather(*(service.get_snapshot() for _ in range(5)))
+
+        assert client.get_account_balance.await_count == 1
+        assert all(s is snapshots[0] for s in snapshots)
+        assert snapshots[0].holding("005930").hldg_qty == 10
+        assert snapshots[0].total_equity == 1_760_000
+
+        await service.get_snapshot(refresh=True)
+        assert client.get_account_balance.await_count == 2
+
+    async def test_stale_snapshot_refetched(self, client):
+        service = _service(client, stale_after=0)
+
+        await service.get_snapshot()
+        await service.get_snapshot()
+
+        assert client.get_account_balance.await_count == 2
+
+
+class TestStreaming:
+    """Balance and execution streams keep the state current."""
+
+    async def test_fill_updates_cash_balance_updates_holding(self, client):
+        realtime = FakeRealtime()
+        service = _service(client, fill_reconcile_delay=0)
+        await service.start(realtime)
+        published = []
+        service.subscribe(published.append)
+
+        before = await service.get_snapshot()
+        await realtime.emit(_execution("매수", 10, 80000))
+        after = await service.get_snapshot()
+
+        assert client.get_account_balance.await_count == 1
+        assert published == [after]
+        assert after.version == before.version + 1
+        assert after.available_cash == 1_000_000 - 800_000
+        # Quantities only come from the balance stream
+        assert after.holding("005930").hldg_qty == 10
+
+        await realtime.emit(_holding_balance(20, 75000))
+        after = service.peek()
+        holding = after.holding("005930")
+        assert holding.hldg_qty == 20
+        assert holding.avg_buy_prc == 75000
+        assert after.pchs_amt == 1_500_000
+
+        # Earlier snapshots are untouched
+        assert before.holding("005930").hldg_qty == 10
+        with pytest.raises(FrozenInstanceError):
+            after.d2_ord_psbl_amt = 0
+
+        await service.stop()
+        assert not realtime.execution_callbacks
+
+    async def test_balance_before_execution_is_not_double_counted(self, client):
+        realtime = FakeRealtime()
+        service = _service(client, fill_reconcile_delay=0)
+        await service.start(realtime)
+        await service.get_snapshot()
+
+        # 04 (absolute, includes the fill) arrives before 00 for a 5-share buy
+        await realtime.emit(_holding_balance(15, 72000))
+        await realtime.emit(_execution("매수", 5, 76000))
+
+        snapshot = service.peek()
+        assert snapshot.holding("005930").hldg_qty == 15
+        assert snapshot.available_cash == 1_000_000 - 380_000
+
+        await service.stop()
+
+    async def test_balance_message_sets_and_removes_holding(self, client):
+        realtime = FakeRealtime()
+        service = _service(client)
+        await service.start(realtime)
+
+        await realtime.emit(BalanceData(
+            stk_cd="000660", stk_nm="SK하이닉스", hldg_qty=5, avg_buy_prc=200000,
+            cur_prc=210000, evlu_amt=1_050_000, evlu_pfls_amt=50000, evlu_pfls_rt=5.0,
+        ))
+        assert {h.stk_cd for h in service.peek().holdings} == {"005930", "000660"}
+
+        await realtime.emit(BalanceData(stk_cd="005930", hldg_qty=0, avg_buy_prc=0, cur_prc=76000))
+        snapshot = service.peek()
+        assert snapshot.holding("005930") is None
+        assert snapshot.pchs_amt == 1_000_000
+        assert snapshot.stock_value == 1_050_000
+
+        await service.stop()
+
+    async def test_fills_trigger_one_coalesced_reconcile(self, client):
+        realtime = FakeRealtime()
+        service = _service(client, fill_reconcile_delay=0.05)
+        await service.start(realtime)
+
+        client.get_account_balance.return_value = _balance(quantity=0, cash=2_500_000)
+        await realtime.emit(_execution("매도", 4, 76000))
+        await realtime.emit(_execution("매도", 6, 76000))
+        assert service.peek().available_cash == 1_000_000 + 760_000
+
+        await asyncio.sleep(0.1)
+        assert client.get_account_balance.await_count == 2
+        assert service.peek().available_cash == 2_500_000
+        assert service.peek().holding("005930") is None
+
+        await service.stop()
+
+    async def test_disconnected_stream_falls_back_to_max_age(self, client):
+        realtime = FakeRealtime()
+        service = _service(client, stale_after=0)
+        await service.start(realtime)
+
+        await service.get_snapshot()
+        assert client.get_account_balance.await_count == 1
+
+        realtime.is_connected = False
+        await service.get_snapshot()
+        assert client.get_account_balance.await_count == 2
+
+        await service.stop()
+
+
+class TestMarketSnapshotPosition:
+    """The snapshot position part follows the shared account state."""
+
+    async def test_position_part_refreshes_after_fill(self, client):
+        realtime = FakeRealtime()
+        account_state = _service(client, fill_reconcile_delay=0)
+        await account_state.start(realtime)
+        service = MarketSnapshotService(account_state=account_state)
+
+        first = await service.get_snapshot("005930", parts=(POSITION,))
+        assert first.position["quantity"] == 10
+
+        await realtime.emit(_execution("매도", 3, 76000))
+        await realtime.emit(_holding_balance(7, 70000))
+        second = await service.get_snapshot("005930", parts=(POSITION,))
+
+        assert second.position["quantity"] == 7
+        assert client.get_account_balance.await_count == 1
+        await account_state.stop()
+
+    async def test_simple_balance_objects_accepted(self):
+        client = AsyncMock()
+        client.get_account_balance.return_value = SimpleNamespace(
+            holdings=[], pchs_amt=0, evlu_amt=0, evlu_pfls_amt=0, evlu_pfls_rt=0.0,
+            d2_ord_psbl_amt=500,
+        )
+        client.cache = None
+        snapshot = await _service(client).get_snapshot()
+
+        assert snapshot.available_cash == 500
+        assert snapshot.holdings == ()
@@ -272,3 +272,111 @@ class TestChatRoomIntegration:
         assert session.decision.action == DecisionAction.BUY
         assert len(session.rounds) >= 1
         assert len(session.votes) == 4
+
+
+# -------------------------------------------
+# Parallel Rounds & Prompt Layout Tests
+# -------------------------------------------
+
+
+class TestParallelRounds:
+    """Tests for parallel discussion rounds and the shared prompt prefix."""
+
+    def _seed_analyses(self, chat_room):
+        chat_room.session.start_round("analysis")
+        for agent_type in chat_room.discussion_order:
+            chat_room.session.add_message(AgentMessage(
+                agent_type=agent_type,
+                agent_name=chat_room.agents[agent_type].agent_name,
+                message_type=MessageType.ANALYSIS,
+                content=f"{agent_type.value} 분석",
+            ))
+        chat_room.session.end_round()
+
+    @pytest.mark.asyncio
+    async def test_responses_run_concurrently_in_order(self, chat_room):
+        """Agents respond concurrently; transcript keeps discussion order."""
+        import asyncio
+
+        self._seed_analyses(chat_room)
+        in_flight = 0
+        max_in_flight = 0
+
+        def make_respond(agent_type, delay):
+            async def respond(message, context, chat_history):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(delay)
+                in_flight -= 1
+                return AgentMessage(
+                    agent_type=agent_type,
+                    agent_name=agent_type.value,
+                    message_type=MessageType.OPINION,
+                    content=f"{agent_type.value} 응답",
+                    in_response_to=message.id,
+                )
+            return respond
+
+        # Later agents finish first
+        for i, agent_type in enumerate(chat_room.discussion_order):
+            chat_room.agents[agent_type].respond = make_respond(agent_type, 0.04 - i * 0.01)
+        chat_room.agents[AgentType.MODERATOR].summarize_round = AsyncMock(return_value=AgentMessage(
+            agent_type=AgentType.MODERATOR,
+            agent_name="토론 진행자",
+            message_type=MessageType.SUMMARY,
+            content="라운드 요약",
+        ))
+
+        assert chat_room.parallel_rounds is True
+        should_continue = await chat_room._run_discussion_round(1)
+
+        assert should_continue is True
+        assert max_in_flight == 4
+        responders = [
+            m.agent_type for m in chat_room.session.rounds[-1].messages
+            if m.message_type == MessageType.OPINION
+        ]
+        assert responders == chat_room.discussion_order
+
+    @pytest.mark.asyncio
+    async def test_failed_response_is_skipped(self, chat_room):
+        """One failing agent does not cancel the parallel round."""
+        self._seed_analyses(chat_room)
+        for agent_type in chat_room.discussion_order:
+            chat_room.agents[agent_type].respond = AsyncMock(return_value=None)
+        chat_room.agents[AgentType.RISK].respond = AsyncMock(side_effect=RuntimeError("LLM timeout"))
+
+        should_continue = await chat_room._run_discussion_round(1)
+
+        assert should_continue is False
+        assert chat_room.session.status == SessionStatus.INITIALIZING
+
+    @pytest.mark.asyncio
+    async def test_system_prompts_share_prefix(self, chat_room):
+        """Every agent's system prompt starts with the same room prefix."""
+        sent = {}
+        for agent_type, agent in chat_room.agents.items():
+            async def generate(messages, agent_type=agent_type):
+                sent[agent_type] = messages[0].content
+                return "신뢰도: 70%"
+            agent.llm = MagicMock()
+            agent.llm.generate = generate
+
+        for agent in chat_room.agents.values():
+            await agent._call_llm(agent.system_prompt, "분석 요청")
+
+        prefix = chat_room.shared_prefix
+        assert "72,500원" in prefix
+        assert all(content.startswith(prefix) for content in sent.values())
+        assert len(set(sent.values())) == len(chat_room.agents)
+
+    def test_sequential_mode(self, mock_market_context):
+        """parallel_rounds=False keeps one-at-a-time responses."""
+        room = ChatRoom(
+            ticker="005930",
+            stock_name="삼성전자",
+            context=mock_market_context,
+            parallel_rounds=False,
+        )
+        assert room.parallel_rounds is False
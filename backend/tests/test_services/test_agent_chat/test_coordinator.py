@@ -296,46 +296,6 @@ class TestManualDiscussion:
             )
 
 
-# -------------------------------------------
-# Opportunity Detection Tests
-# -------------------------------------------
-
-
-class TestOpportunityDetection:
-    """Tests for opportunity detection logic."""
-
-    @pytest.mark.asyncio
-    async def test_detect_opportunity_target_price_hit(self, coordinator):
-        """Test opportunity detection when target price is near."""
-        stock = {
-            "ticker": "005930",
-            "current_price": 72000,
-            "target_entry_price": 72500,
-            "confidence": 0.8,
-        }
-
-        should_discuss = await coordinator._detect_opportunity(stock)
-
-        # Within 3% of target should trigger
-        # Implementation may vary, check both cases
-        assert should_discuss is True or should_discuss is False
-
-    @pytest.mark.asyncio
-    async def test_detect_opportunity_low_confidence(self, coordinator):
-        """Test that low confidence doesn't trigger discussion."""
-        stock = {
-            "ticker": "005930",
-            "current_price": 72500,
-            "target_entry_price": 80000,  # Far from current price (>3%)
-            "confidence": 0.5,  # Low confidence
-        }
-
-        should_discuss = await coordinator._detect_opportunity(stock)
-
-        # Low confidence + price far from target = no trigger
-        assert should_discuss is False
-
-
 # -------------------------------------------
 # Discussion Interval Tests
 # -------------------------------------------
@@ -411,3 +371,166 @@ class TestCoordinatorSingleton:
         coord2 = await get_chat_coordinator()
 
         assert coord1 is coord2
+
+
+# -------------------------------------------
+# Event-driven Trigger Tests
+# -------------------------------------------
+
+
+class TestTickTriggers:
+    """Tests for tick-driven opportunity detection."""
+
+    @pytest.mark.asyncio
+    async def test_tick_entering_band_starts_discussion(self, coordinator):
+        """A tick inside the target band starts a discussion immediately."""
+        import asyncio
+        from types import SimpleNamespace
+
+        coordinator._running = True
+        coordinator._start_discussion = AsyncMock()
+        coordinator._get_watch_list = AsyncMock(return_value=[{
+            "ticker": "005930",
+            "stock_name": "삼성전자",
+            "confidence": 0.5,
+            "current_price": 80000,
+            "target_entry_price": 72500,
+        }])
+        coordinator._tick_service = MagicMock()
+        coordinator._tick_service.subscribe_tick = AsyncMock()
+        coordinator._tick_service.get_latest_tick = MagicMock(return_value=None)
+
+        await coordinator._check_watch_list()
+        coordinator._tick_service.subscribe_tick.assert_awaited_once_with(
+            ["005930"], coordinator._on_tick
+        )
+        coordinator._start_discussion.assert_not_called()
+
+        await coordinator._on_tick(SimpleNamespace(stk_cd="005930", cur_prc=78000))
+        await coordinator._on_tick(SimpleNamespace(stk_cd="005930", cur_prc=73000))
+        await asyncio.sleep(0)
+
+        coordinator._start_discussion.assert_awaited_once()
+        stock = coordinator._start_discussion.await_args.args[0]
+        assert stock["current_price"] == 73000
+
+    @pytest.mark.asyncio
+    async def test_watch_list_sync_uses_latest_tick(self, coordinator):
+        """A watch list edit evaluates the band at the live price, not the stored one."""
+        import asyncio
+        from types import SimpleNamespace
+
+        coordinator._running = True
+        coordinator._start_discussion = AsyncMock()
+        coordinator._get_watch_list = AsyncMock(return_value=[{
+            "ticker": "005930",
+            "stock_name": "삼성전자",
+            "confidence": 0.5,
+            "current_price": 72500,  # Stale snapshot inside the band
+            "target_entry_price": 72500,
+        }])
+        coordinator._tick_service = MagicMock()
+        coordinator._tick_service.subscribe_tick = AsyncMock()
+        coordinator._tick_service.get_latest_tick = MagicMock(
+            return_value=SimpleNamespace(stk_cd="005930", cur_prc=90000)
+        )
+
+        await coordinator._check_watch_list()
+        await asyncio.sleep(0)
+        coordinator._start_discussion.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_watch_list_change_task_is_referenced(self, coordinator):
+        """Background checks are kept alive until they finish."""
+        import asyncio
+
+        coordinator._running = True
+        coordinator._check_watch_list = AsyncMock()
+
+        coordinator._on_watch_list_change()
+        assert len(coordinator._background_tasks) == 1
+        await asyncio.gather(*coordinator._background_tasks)
+        await asyncio.sleep(0)
+
+        coordinator._check_watch_list.assert_awaited_once()
+        assert not coordinator._background_tasks
+
+    @pytest.mark.asyncio
+    async def test_watch_list_news_sentiment_is_batched(self, coordinator):
+        """One batched sentiment call per refresh; fresh tickers are not rescored."""
+        from types import SimpleNamespace
+
+        watch_list = [
+            {"ticker": "005930", "stock_name": "삼성전자", "confidence": 0.5},
+            {"ticker": "000660", "stock_name": "SK하이닉스", "confidence": 0.5},
+        ]
+        coordinator._running = True
+        coordinator._get_watch_list = AsyncMock(return_value=watch_list)
+        coordinator._poll_quotes = AsyncMock()
+        news_service = SimpleNamespace(providers=["naver"])
+        batch = AsyncMock(return_value={
+            "005930": SimpleNamespace(sentiment="positive"),
+            "000660": SimpleNamespace(sentiment="negative"),
+        })
+
+        with patch("app.dependencies.get_news_service", AsyncMock(return_value=news_service)), \
+                patch("agents.llm_provider.get_llm_provider", MagicMock()), \
+                patch("services.news.analyze_stocks_news_sentiment", batch):
+            await coordinator._check_watch_list()
+            await coordinator._sentiment_task
+            await coordinator._check_watch_list()
+
+        batch.assert_awaited_once()
+        assert batch.await_args.args[0] == [("005930", "삼성전자"), ("000660", "SK하이닉스")]
+        assert coordinator._get_news_sentiment("000660").sentiment == "negative"
+
+    @pytest.mark.asyncio
+    async def test_market_context_falls_back_to_tools(self, coordinator):
+        """Failed snapshot parts fall back to the tools (mock data without Kiwoom)."""
+        import pandas as pd
+        from services.market_snapshot import MarketSnapshot
+
+        snapshot = MarketSnapshot(stk_cd="005930", version=1, created_at=datetime.now())
+        service = MagicMock()
+        service.get_snapshot = AsyncMock(return_value=snapshot)
+        coordinator._fetch_news_count = AsyncMock(return_value=0)
+        chart = pd.DataFrame({"date": ["20250102"], "close": [72000]})
+
+        async def run_frame(func, df, *args):
+            return func(df, *args)
+
+        with patch("services.market_snapshot.get_market_snapshot_service", return_value=service), \
+                patch("agents.tools.kr_market_data.get_kr_stock_info",
+                      AsyncMock(return_value={"stk_nm": "삼성전자", "cur_prc": 72000, "prdy_ctrt": 1.0})), \
+                patch("agents.tools.kr_market_data.get_kr_daily_chart", AsyncMock(return_value=chart)), \
+                patch("agents.tools.kr_market_data.chart_df_to_records", return_value=[{"close": 72000}]), \
+                patch("agents.tools.kr_market_data.calculate_kr_technical_indicators",
+                      return_value={"trend": "neutral"}), \
+                patch("services.compute.get_compute_executor") as executor:
+            executor.return_value.run_frame.side_effect = run_frame
+            context = await coordinator._fetch_market_context("005930", "삼성전자")
+
+        assert context.current_price == 72000
+        assert context.chart_data == [{"close": 72000}]
+        assert context.indicators == {"trend": "neutral"}
+
+    @pytest.mark.asyncio
+    async def test_blocked_trigger_is_rearmed(self, coordinator):
+        """A trigger hit during the cool-down fires again after it."""
+        from types import SimpleNamespace
+
+        coordinator._running = True
+        coordinator._start_discussion = AsyncMock()
+        coordinator._triggers.sync([{
+            "ticker": "005930",
+            "confidence": 0.5,
+            "target_entry_price": 72500,
+        }])
+        coordinator._last_discussion["005930"] = datetime.now()
+
+        await coordinator._on_tick(SimpleNamespace(stk_cd="005930", cur_prc=72500))
+        coordinator._start_discussion.assert_not_called()
+
+        coordinator._last_discussion["005930"] = datetime.now() - timedelta(hours=1)
+        await coordinator._on_tick(SimpleNamespace(stk_cd="005930", cur_prc=72600))
+        assert "005930" in coordinator._pending_discussions
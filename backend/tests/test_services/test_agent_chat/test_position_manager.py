@@ -8,6 +8,7 @@ import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 
 from services.agent_chat.position_manager import (
     PositionManager,
@@ -18,6 +19,7 @@ from services.agent_chat.position_manager import (
     PositionEvent,
     get_position_manager,
 )
+from services.kiwoom.models import Holding
 
 
 # -------------------------------------------
@@ -597,3 +599,49 @@ class TestEventHistory:
         events = position_manager.get_events(limit=5)
 
         assert len(events) == 5
+
+
+# -------------------------------------------
+# Account Sync Tests
+# -------------------------------------------
+
+
+def _account(*holdings):
+    """Account snapshot holding (stk_cd, quantity, price) tuples."""
+    return SimpleNamespace(holdings=tuple(
+        Holding(
+            stk_cd=code, stk_nm=code, hldg_qty=quantity, avg_buy_prc=price, cur_prc=price,
+            evlu_amt=quantity * price, evlu_pfls_amt=0, evlu_pfls_rt=0.0,
+        )
+        for code, quantity, price in holdings
+    ))
+
+
+class TestAccountSync:
+    """Syncing positions from account snapshots"""
+
+    def test_manual_position_survives_sync(self, position_manager):
+        """Test that positions added by hand are not dropped by account syncs."""
+        position_manager.add_position(ticker="035720", stock_name="카카오", quantity=5, avg_price=50000)
+
+        position_manager.apply_account_snapshot(_account(("005930", 10, 72000)))
+        position_manager.apply_account_snapshot(_account(("005930", 10, 72000)))
+
+        assert {p.ticker for p in position_manager.get_all_positions()} == {"005930", "035720"}
+
+    def test_sold_holding_removed(self, position_manager):
+        """Test that a holding the account stops reporting is removed."""
+        position_manager.apply_account_snapshot(_account(("005930", 10, 72000), ("000660", 3, 120000)))
+        position_manager.apply_account_snapshot(_account(("005930", 10, 72000)))
+
+        assert [p.ticker for p in position_manager.get_all_positions()] == ["005930"]
+
+    def test_only_changed_holdings_applied(self, position_manager):
+        """Test that unchanged holdings are not re-applied."""
+        position_manager.apply_account_snapshot(_account(("005930", 10, 72000), ("000660", 3, 120000)))
+
+        with patch.object(position_manager, "update_position", wraps=position_manager.update_position) as update:
+            position_manager.apply_account_snapshot(_account(("005930", 15, 72500), ("000660", 3, 120000)))
+
+        update.assert_called_once_with(ticker="005930", quantity=15, current_price=72500)
+        assert position_manager.get_position("005930").quantity == 15
@@ -0,0 +1,75 @@
+"""
+Tests for Discussion Prompt Layout
+
+Shared prefix rendering and the token-budgeted history summarizer.
+"""
+
+from services.agent_chat.models import AgentMessage, AgentType, MarketContext, MessageType
+from services.agent_chat.prompting import (
+    HistorySummarizer,
+    build_shared_prefix,
+    estimate_tokens,
+)
+
+
+def _message(agent_type: AgentType, content: str, confidence: float = 0.5) -> AgentMessage:
+    return AgentMessage(
+        agent_type=agent_type,
+        agent_name=agent_type.value,
+        message_type=MessageType.OPINION,
+        content=content,
+        confidence=confidence,
+    )
+
+
+class TestSharedPrefix:
+    """Tests for build_shared_prefix."""
+
+    def test_prefix_is_deterministic(self):
+        """Same context renders byte-identical prefixes, regardless of dict order."""
+        a = MarketContext(
+            ticker="005930", stock_name="삼성전자", current_price=72500, price_change_pct=0.69,
+            indicators={"rsi": 35.0, "trend": "bullish"},
+        )
+        b = MarketContext(
+            ticker="005930", stock_name="삼성전자", current_price=72500, price_change_pct=0.69,
+            indicators={"trend": "bullish", "rsi": 35.0, "ignored": [1, 2]},
+        )
+
+        assert build_shared_prefix(a) == build_shared_prefix(b)
+        assert "삼성전자 (005930)" in build_shared_prefix(a)
+        assert "ignored" not in build_shared_prefix(b)
+
+
+class TestHistorySummarizer:
+    """Tests for HistorySummarizer."""
+
+    def test_empty_history(self):
+        assert HistorySummarizer().format([]) == "이전 대화 없음"
+
+    def test_short_history_is_verbatim(self):
+        messages = [_message(AgentType.TECHNICAL, "RSI 35"), _message(AgentType.RISK, "손절 5%")]
+        text = HistorySummarizer().format(messages)
+
+        assert "요약" not in text
+        assert text.index("RSI 35") < text.index("손절 5%")
+
+    def test_old_messages_are_folded_within_budget(self):
+        messages = [
+            _message(AgentType.TECHNICAL if i % 2 else AgentType.FUNDAMENTAL, f"{i}번 발언 " + "가" * 80, 0.6)
+            for i in range(20)
+        ]
+        summarizer = HistorySummarizer(token_budget=300)
+        text = summarizer.format(messages)
+
+        assert "19번 발언" in text
+        assert "0번 발언" not in text
+        assert "이전 발언" in text
+        assert estimate_tokens(text) < 400
+
+    def test_rendered_lines_are_cached(self):
+        summarizer = HistorySummarizer()
+        message = _message(AgentType.SENTIMENT, "뉴스 긍정적")
+        summarizer.format([message])
+
+        assert message.id in summarizer._lines
@@ -0,0 +1,101 @@
+"""
+Tests for WatchTriggerEngine
+
+Event-driven watch list opportunity detection.
+"""
+
+from services.agent_chat.triggers import (
+    HIGH_CONFIDENCE,
+    TARGET_BAND,
+    WatchTriggerEngine,
+)
+
+
+def _stock(ticker="005930", target=72500, confidence=0.5, price=80000):
+    return {
+        "ticker": ticker,
+        "stock_name": "삼성전자",
+        "target_entry_price": target,
+        "confidence": confidence,
+        "current_price": price,
+    }
+
+
+class TestWatchTriggerEngine:
+    """Tests for the watch list trigger engine."""
+
+    def test_band_fires_once_on_entry(self):
+        engine = WatchTriggerEngine()
+        assert engine.sync([_stock()]) == []
+
+        assert engine.on_price("005930", 76000) == []
+        assert engine.on_price("005930", 74000) == [TARGET_BAND]
+        # Still inside the band: no re-fire, no re-evaluation
+        assert engine.on_price("005930", 73000) == []
+        assert engine.on_price("005930", 72000) == []
+        assert engine.get_stock("005930")["current_price"] == 74000
+
+        # Leave and re-enter fires again
+        assert engine.on_price("005930", 60000) == []
+        assert engine.on_price("005930", 71000) == [TARGET_BAND]
+
+    def test_ticks_in_same_zone_skip_evaluation(self):
+        engine = WatchTriggerEngine()
+        engine.sync([_stock()])
+
+        for price in range(90000, 80000, -10):
+            engine.on_price("005930", price)
+
+        stats = engine.get_stats()
+        assert stats["ticks"] == 1000
+        assert stats["evaluations"] == 1  # All ticks are above the band
+
+    def test_band_edges_are_inclusive(self):
+        engine = WatchTriggerEngine(band_pct=0.1)
+        engine.sync([_stock(target=1000)])
+        assert engine.on_price("005930", 1100) == [TARGET_BAND]
+
+    def test_sync_fires_confidence_and_live_price(self):
+        engine = WatchTriggerEngine()
+        fired = engine.sync(
+            [
+                _stock("005930", confidence=0.8),
+                _stock("000660", target=100000, price=80000),
+                _stock("035420", target=None),
+            ],
+            prices={"000660": 99000},
+        )
+
+        assert [(s["ticker"], rules) for s, rules in fired] == [
+            ("005930", [HIGH_CONFIDENCE]),
+            ("000660", [TARGET_BAND]),
+        ]
+        # Unchanged entries do not fire again
+        assert engine.sync([_stock("005930", confidence=0.8)]) == []
+        assert engine.tickers == ["005930"]
+
+    def test_sync_ignores_stored_snapshot_price(self):
+        engine = WatchTriggerEngine()
+        # Stored price is inside the band but may be stale
+        assert engine.sync([_stock(target=72500, price=72500)]) == []
+        # Live price outside the band: nothing fires
+        assert engine.on_price("005930", 90000) == []
+        assert engine.on_price("005930", 73000) == [TARGET_BAND]
+
+    def test_changed_target_rebuilds_rules(self):
+        engine = WatchTriggerEngine()
+        engine.sync([_stock(target=72500)], prices={"005930": 90000})
+        fired = engine.sync([_stock(target=90000)], prices={"005930": 90000})
+        assert fired[0][1] == [TARGET_BAND]
+
+    def test_rearm(self):
+        engine = WatchTriggerEngine()
+        engine.sync([_stock(confidence=0.9)], prices={"005930": 72500})
+        assert engine.on_price("005930", 72400) == []
+
+        engine.rearm("005930")
+        assert engine.on_price("005930", 72400) == [TARGET_BAND]
+
+        engine.rearm("005930")
+        fired = engine.sync([_stock(confidence=0.9)], prices={"005930": 72500})
+        assert fired[0][1] == [HIGH_CONFIDENCE, TARGET_BAND]
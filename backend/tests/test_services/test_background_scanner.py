@@ -0,0 +1,288 @@
+"""
+Tests for Background Scanner checkpoint/resume and incremental mode
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import aiosqlite
+import pandas as pd
+import pytest
+
+from services.background_scanner import BackgroundScanner, ScanStatus
+from services.background_scanner import scanner as scanner_module
+from services.market_snapshot import MarketSnapshotService
+
+
+STOCKS = [(f"{i:06d}", f"종목{i}", "코스피") for i in range(1, 8)]
+
+
+def _make_client(prices: dict, volumes: dict):
+    """Mock Kiwoom client returning fixed quotes and a flat chart."""
+    client = AsyncMock()
+
+    async def get_stock_info(stk_cd):
+        return SimpleNamespace(
+            cur_prc=prices[stk_cd],
+            acml_vol=volumes[stk_cd],
+            prdy_ctrt=0.0,
+        )
+
+    client.get_stock_info.side_effect = get_stock_info
+    client.get_daily_chart_df.return_value = pd.DataFrame()
+    return client
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "scanner_results.db"
+    with patch.object(scanner_module, "DB_PATH", path):
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def snapshot_service():
+    """Fresh market snapshot cache per test (quotes are cached for a few seconds)."""
+    service = MarketSnapshotService()
+    with patch.object(scanner_module, "get_market_snapshot_service", return_value=service):
+        yield service
+
+
+async def _wait_for_task(scanner: BackgroundScanner):
+    await asyncio.wait_for(scanner._task, timeout=10)
+
+
+class TestCheckpointResume:
+    """Scans checkpoint per batch and resume from the checkpoint."""
+
+    async def test_resume_continues_from_checkpoint(self, db_path, snapshot_service):
+        prices = {code: 10000 for code, _, _ in STOCKS}
+        volumes = {code: 1000 for code, _, _ in STOCKS}
+        client = _make_client(prices, volumes)
+
+        scanner = BackgroundScanner()
+        original_save = scanner._save_results_batch
+        calls = 0
+
+        async def crash_after_first_batch(results, session_id, checkpoint_index=None):
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise RuntimeError("process died")
+            await original_save(results, session_id, checkpoint_index=checkpoint_index)
+
+        with patch(
+            "app.core.kiwoom_singleton.get_shared_kiwoom_client_async",
+            AsyncMock(return_value=client),
+        ), patch.object(scanner, "_save_results_batch", crash_after_first_batch), \
+                patch.object(scanner, "_send_telegram_notification", AsyncMock()):
+            with patch.object(BackgroundScanner, "_scan_all_stocks_quick",
+                              _quick_with_batch_size(3)):
+                await scanner.start_scan(stock_list=STOCKS, notify_progress=False)
+                with pytest.raises(RuntimeError):
+                    await _wait_for_task(scanner)
+
+        session = await scanner._get_resumable_session()
+        assert session is not None
+        assert session["checkpoint_index"] == 3
+
+        # A fresh scanner (new process) resumes the remaining 4 stocks
+        snapshot_service.invalidate()
+        client.get_stock_info.reset_mock()
+        resumed = BackgroundScanner()
+        with patch(
+            "app.core.kiwoom_singleton.get_shared_kiwoom_client_async",
+            AsyncMock(return_value=client),
+        ), patch.object(resumed, "_send_telegram_notification", AsyncMock()):
+            session_id = await resumed.resume_interrupted_scan(notify_progress=False)
+            assert session_id == session["id"]
+            await _wait_for_task(resumed)
+
+        assert client.get_stock_info.await_count == 4
+        assert resumed.get_progress().status == ScanStatus.COMPLETED
+        assert resumed.get_progress().completed == len(STOCKS)
+
+        results = await resumed.get_results_from_db(session_id=session_id)
+        assert sorted(r.stk_cd for r in results) == sorted(code for code, _, _ in STOCKS)
+        assert await resumed._get_resumable_session() is None
+
+    async def test_nothing_to_resume(self, db_path):
+        scanner = BackgroundScanner()
+        assert await scanner.resume_interrupted_scan(notify_progress=False) is None
+
+
+class TestIncrementalScan:
+    """Incremental scans reuse results of stocks that barely moved."""
+
+    async def test_unchanged_stocks_are_reused(self, db_path, snapshot_service):
+        prices = {code: 10000 for code, _, _ in STOCKS}
+        volumes = {code: 1000 for code, _, _ in STOCKS}
+        client = _make_client(prices, volumes)
+
+        scanner = BackgroundScanner()
+        with patch(
+            "app.core.kiwoom_singleton.get_shared_kiwoom_client_async",
+            AsyncMock(return_value=client),
+        ), patch.object(scanner, "_send_telegram_notification", AsyncMock()):
+            await scanner.start_scan(stock_list=STOCKS, notify_progress=False)
+            await _wait_for_task(scanner)
+
+            # One stock moves 5% in price, another doubles its volume
+            prices["000001"] = 10500
+            volumes["000002"] = 2000
+            client.get_daily_chart_df.reset_mock()
+            snapshot_service.invalidate()
+
+            # Session IDs have one-second resolution
+            await asyncio.sleep(1.1)
+            await scanner.start_scan(stock_list=STOCKS, notify_progress=False, incremental=True)
+            await _wait_for_task(scanner)
+
+        progress = scanner.get_progress()
+        assert progress.completed == len(STOCKS)
+        assert progress.reused_count == len(STOCKS) - 2
+        assert client.get_daily_chart_df.await_count == 2
+
+    def test_reuse_thresholds(self):
+        scanner = BackgroundScanner()
+        scanner._previous_results = {
+            "005930": scanner_module.ScanResult(
+                stk_cd="005930", stk_nm="삼성전자", action="BUY", signal="buy",
+                confidence=0.8, summary="", current_price=70000, volume=100000,
+            ),
+        }
+
+        quote = SimpleNamespace(cur_prc=70300, acml_vol=110000)
+        reused = scanner._reuse_if_unchanged("005930", quote)
+        assert reused is not None
+        assert reused.action == "BUY"
+        assert reused.current_price == 70000  # Baseline kept to avoid drift
+
+        moved = SimpleNamespace(cur_prc=71000, acml_vol=100000)
+        assert scanner._reuse_if_unchanged("005930", moved) is None
+
+        busy = SimpleNamespace(cur_prc=70000, acml_vol=150000)
+        assert scanner._reuse_if_unchanged("005930", busy) is None
+
+        assert scanner._reuse_if_unchanged("000660", quote) is None
+
+
+def _quick_with_batch_size(size: int):
+    """Wrap the quick scan loop with a smaller batch size."""
+    original = BackgroundScanner._scan_all_stocks_quick
+
+    async def wrapper(self, stocks, session_id, notify_progress, batch_size, start_index=0):
+        return await original(self, stocks, session_id, notify_progress, size, start_index)
+
+    return wrapper
+
+
+async def _insert_session(scanner: BackgroundScanner, session_id: str, started_at: str, rows: list):
+    """Write a completed session straight into the row store."""
+    await scanner._init_db()
+    async with aiosqlite.connect(scanner_module.DB_PATH) as db:
+        await db.execute(
+            "INSERT INTO scan_sessions (id, started_at, status) VALUES (?, ?, 'completed')",
+            (session_id, started_at),
+        )
+        await db.executemany("""
+            INSERT INTO scan_results
+            (stk_cd, stk_nm, action, signal, confidence, summary, key_factors,
+             current_price, volume, market_type, scanned_at, scan_session_id)
+            VALUES (?, ?, ?, '', ?, '', '', ?, 0, '', ?, ?)
+        """, [
+            (code, f"종목{code}", action, confidence, price, started_at, session_id)
+            for code, action, confidence, price in rows
+        ])
+        await db.commit()
+
+
+class TestScanArchive:
+    """Columnar cross-session archive."""
+
+    async def _populate(self, scanner):
+        await _insert_session(scanner, "s1", "2025-01-01 09:00:00", [
+            ("005930", "BUY", 0.7, 70000),
+            ("000660", "HOLD", 0.5, 120000),
+            ("035420", "SELL", 0.6, 200000),
+        ])
+        await _insert_session(scanner, "s2", "2025-01-02 09:00:00", [
+            ("005930", "BUY", 0.8, 71000),
+            ("000660", "BUY", 0.65, 125000),
+            ("035420", "SELL", 0.4, 195000),
+        ])
+        await _insert_session(scanner, "s3", "2025-01-03 09:00:00", [
+            ("005930", "BUY", 0.9, 72000),
+            ("000660", "BUY", 0.75, 130000),
+            ("035420", "HOLD", 0.55, 198000),
+            # Duplicate row (resumed batch): the later row wins
+            ("035420", "WATCH", 0.6, 199000),
+        ])
+
+    async def test_backfill_and_queries(self, db_path):
+        scanner = BackgroundScanner()
+        await self._populate(scanner)
+        archive = await scanner.get_archive()
+
+        sessions = await archive.get_sessions()
+        assert [s["session_id"] for s in sessions] == ["s3", "s2", "s1"]
+        assert sessions[0]["rows"] == 3
+
+        history = await archive.get_ticker_history("005930")
+        assert [h["confidence"] for h in history] == pytest.approx([0.9, 0.8, 0.7])
+        assert await archive.get_ticker_history("999999") == []
+
+        transitions = await archive.get_action_transitions()
+        assert [(t["stk_cd"], t["from_action"], t["to_action"]) for t in transitions] == [
+            ("035420", "SELL", "WATCH"),
+        ]
+        upgrades = await archive.get_action_transitions(from_session="s1", to_session="s2", to_action="buy")
+        assert [t["stk_cd"] for t in upgrades] == ["000660"]
+
+        streaks = await archive.get_action_streaks("BUY", sessions=3)
+        assert [s["stk_cd"] for s in streaks] == ["005930"]
+        assert streaks[0]["confidence_trend"] == pytest.approx([0.7, 0.8, 0.9])
+        assert len(await archive.get_action_streaks("BUY", sessions=2)) == 2
+        assert await archive.get_action_streaks("BUY", sessions=4) == []
+
+        top = await archive.get_top_by_confidence(n=2)
+        assert [t["stk_cd"] for t in top] == ["005930", "000660"]
+        top_sell = await archive.get_top_by_confidence(n=5, session_id="s1", action="SELL")
+        assert [t["stk_cd"] for t in top_sell] == ["035420"]
+
+    async def test_partitions_persist_and_append(self, db_path):
+        scanner = BackgroundScanner()
+        await self._populate(scanner)
+        await (await scanner.get_archive()).get_sessions()
+
+        # New session appended after the archive is loaded
+        await _insert_session(scanner, "s4", "2025-01-04 09:00:00", [("005930", "SELL", 0.6, 69000)])
+        await scanner.archive.append_session("s4")
+        assert (await scanner.archive.get_ticker_history("005930", limit=1))[0]["action"] == "SELL"
+
+        # A fresh instance decodes the stored partitions without re-reading scan_results
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("DELETE FROM scan_results")
+            await db.commit()
+
+        fresh = BackgroundScanner()
+        history = await (await fresh.get_archive()).get_ticker_history("005930")
+        assert [h["session_id"] for h in history] == ["s4", "s3", "s2", "s1"]
+
+    async def test_completed_scan_is_archived(self, db_path):
+        prices = {code: 10000 for code, _, _ in STOCKS}
+        volumes = {code: 1000 for code, _, _ in STOCKS}
+        client = _make_client(prices, volumes)
+
+        scanner = BackgroundScanner()
+        with patch(
+            "app.core.kiwoom_singleton.get_shared_kiwoom_client_async",
+            AsyncMock(return_value=client),
+        ), patch.object(scanner, "_send_telegram_notification", AsyncMock()):
+            await scanner.start_scan(stock_list=STOCKS, notify_progress=False)
+            await _wait_for_task(scanner)
+
+        sessions = await scanner.archive.get_sessions()
+        assert len(sessions) == 1
+        assert sessions[0]["rows"] == len(STOCKS)
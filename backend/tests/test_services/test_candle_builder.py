@@ -0,0 +1,231 @@
+"""
+Tests for candles built from the Upbit trade stream
+
+Tests multi-resolution aggregation, the REST seed merge, ring buffer
+limits, paged history fetches and serving candles from RealtimeService
+without REST calls.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from services.realtime_service import RealtimeService
+from services.upbit.candle_builder import CandleBuilder
+from services.upbit.history import fetch_candle_history
+
+T0 = 1735689600000  # 2025-01-01 00:00:00 UTC
+
+
+def _candle(start_ms: int, price: float, volume: float = 1.0, last_trade: int = None):
+    """REST candle (only the fields the builder reads)."""
+    start = datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc)
+    return SimpleNamespace(
+        candle_date_time_utc=start.strftime("%Y-%m-%dT%H:%M:%S"),
+        opening_price=price,
+        high_price=price,
+        low_price=price,
+        trade_price=price,
+        candle_acc_trade_volume=volume,
+        candle_acc_trade_price=price * volume,
+        timestamp=start_ms if last_trade is None else last_trade,
+    )
+
+
+class TestAggregation:
+    """Trades roll up into every interval."""
+
+    def test_trades_build_bars_per_interval(self):
+        builder = CandleBuilder()
+        builder.track("KRW-BTC")
+
+        builder.add_trade("KRW-BTC", 100.0, 1.0, T0 + 1_000)
+        builder.add_trade("KRW-BTC", 105.0, 2.0, T0 + 30_000)
+        builder.add_trade("KRW-BTC", 95.0, 1.0, T0 + 61_000)
+        builder.seed("KRW-BTC", "1m", [])
+        builder.seed("KRW-BTC", "1d", [])
+
+        minutes = builder.get("KRW-BTC", "1m", 10)
+        assert [b.candle_date_time_kst for b in minutes] == [
+            "2025-01-01T09:01:00",
+            "2025-01-01T09:00:00",
+        ]
+        assert (minutes[1].opening_price, minutes[1].high_price, minutes[1].trade_price) == (100.0, 105.0, 105.0)
+        assert minutes[1].candle_acc_trade_volume == 3.0
+
+        day = builder.get("KRW-BTC", "1d", 1)[0]
+        assert (day.opening_price, day.low_price, day.trade_price) == (100.0, 95.0, 95.0)
+        assert day.candle_acc_trade_volume == 4.0
+
+    def test_late_trade_updates_earlier_bar(self):
+        builder = CandleBuilder(intervals=["1m"])
+        builder.track("KRW-BTC")
+        builder.add_trade("KRW-BTC", 100.0, 1.0, T0 + 59_000)
+        builder.add_trade("KRW-BTC", 101.0, 1.0, T0 + 60_000)
+        builder.add_trade("KRW-BTC", 90.0, 1.0, T0 + 10_000)
+        builder.seed("KRW-BTC", "1m", [])
+
+        older = builder.get("KRW-BTC", "1m", 2)[1]
+        assert (older.opening_price, older.low_price, older.trade_price) == (90.0, 90.0, 100.0)
+        assert builder.stats["late_trades"] == 1
+
+    def test_untracked_market_ignored(self):
+        builder = CandleBuilder()
+        builder.add_trade("KRW-ETH", 1.0, 1.0, T0)
+        assert builder.stats["trades"] == 0
+
+
+class TestSeed:
+    """REST seeds fill history and merge with bars built before them."""
+
+    def test_not_served_before_seed(self):
+        builder = CandleBuilder(intervals=["1m"])
+        builder.track("KRW-BTC")
+        builder.add_trade("KRW-BTC", 100.0, 1.0, T0)
+
+        assert builder.get("KRW-BTC", "1m", 1) is None
+
+    def test_seed_merges_overlapping_bar(self):
+        builder = CandleBuilder(intervals=["1m"])
+        builder.track("KRW-BTC")
+        # Live trades after the REST snapshot of the current minute
+        builder.add_trade("KRW-BTC", 110.0, 2.0, T0 + 60_000 + 40_000)
+
+        builder.seed("KRW-BTC", "1m", [
+            _candle(T0 + 60_000, 100.0, volume=5.0, last_trade=T0 + 60_000 + 30_000),
+            _candle(T0, 90.0),
+        ])
+
+        bars = builder.get("KRW-BTC", "1m", 2)
+        assert (bars[0].opening_price, bars[0].trade_price, bars[0].high_price) == (100.0, 110.0, 110.0)
+        assert bars[0].candle_acc_trade_volume == 7.0
+        assert bars[1].trade_price == 90.0
+
+    def test_capacity_and_short_history(self):
+        builder = CandleBuilder(capacity=3, intervals=["1s"])
+        builder.seed("KRW-NEW", "1s", [_candle(T0 + i * 1000, 100.0 + i) for i in range(5, 0, -1)])
+
+        bars = builder.get("KRW-NEW", "1s", 10)
+        # A new listing: fewer REST candles than a full page means nothing older exists
+        assert [b.trade_price for b in bars] == [105.0, 104.0, 103.0]
+
+    def test_returned_newest_bar_is_snapshot(self):
+        builder = CandleBuilder(intervals=["1m"])
+        builder.seed("KRW-BTC", "1m", [])
+        builder.add_trade("KRW-BTC", 100.0, 1.0, T0)
+
+        newest = builder.get("KRW-BTC", "1m", 1)[0]
+        builder.add_trade("KRW-BTC", 200.0, 1.0, T0 + 1)
+
+        assert newest.trade_price == 100.0
+
+
+class TestRealtimeServiceCandles:
+    """Candle reads after the first seed make no REST call."""
+
+    def _service(self, max_markets: int = 30):
+        service = RealtimeService(candle_max_markets=max_markets)
+        service._upbit_ws = SimpleNamespace(
+            is_connected=True,
+            subscribe_trade=AsyncMock(),
+            unsubscribe_trade=AsyncMock(),
+        )
+        return service
+
+    def _client(self):
+        return SimpleNamespace(get_candles_minutes=AsyncMock(return_value=[_candle(T0, 100.0)]))
+
+    async def test_seeded_once_then_fed_by_trades(self):
+        service = self._service()
+        client = self._client()
+
+        first = await service.get_candles(client, "krw-btc", "1m", 1)
+        service._candles.add_trade("KRW-BTC", 120.0, 1.0, T0 + 60_000)
+        second = await service.get_candles(client, "KRW-BTC", "1m", 2)
+
+        assert first[0].trade_price == 100.0
+        assert [b.trade_price for b in second] == [120.0, 100.0]
+        assert client.get_candles_minutes.await_count == 1
+        service._upbit_ws.subscribe_trade.assert_awaited_once_with(["KRW-BTC"])
+
+    async def test_reconnect_reseeds(self):
+        service = self._service()
+        client = self._client()
+        service._handle_connect()
+        await service.get_candles(client, "KRW-BTC", "1m", 1)
+
+        service._handle_connect()
+        await service.get_candles(client, "KRW-BTC", "1m", 1)
+
+        assert client.get_candles_minutes.await_count == 2
+
+    async def test_falls_back_when_not_servable(self):
+        service = self._service()
+        client = self._client()
+
+        assert await service.get_candles(client, "KRW-BTC", "1w", 1) is None
+
+        client.get_candles_minutes.side_effect = RuntimeError("down")
+        assert await service.get_candles(client, "KRW-BTC", "1m", 1) is None
+
+        service._upbit_ws.is_connected = False
+        assert await service.get_candles(client, "KRW-BTC", "1m", 1) is None
+
+    async def test_least_recently_read_market_dropped(self):
+        service = self._service(max_markets=1)
+        client = self._client()
+
+        await service.get_candles(client, "KRW-BTC", "1m", 1)
+        await service.get_candles(client, "KRW-ETH", "1m", 1)
+
+        assert service._candles.markets == ["KRW-ETH"]
+        service._upbit_ws.unsubscribe_trade.assert_awaited_once_with(["KRW-BTC"])
+
+
+class FakeDayCandles:
+    """Daily REST candles with Upbit's `to` (exclusive) and 200-per-page semantics."""
+
+    def __init__(self, days: int, skip: set[int] = frozenset()):
+        self.starts = [T0 - d * 86_400_000 for d in range(days) if d not in skip]
+        self.calls = []
+
+    async def get_candles_days(self, market, count, to=None):
+        self.calls.append(to)
+        end = _parse_to(to) if to else float("inf")
+        return [_candle(start, 100.0) for start in self.starts if start < end][:count]
+
+
+def _parse_to(value: str) -> int:
+    moment = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+class TestCandleHistory:
+    """Deep history is fetched as concurrent time-window pages."""
+
+    async def test_single_page_when_enough(self):
+        client = FakeDayCandles(days=500)
+
+        candles = await fetch_candle_history(client, "KRW-BTC", "1d", 150)
+
+        assert len(candles) == 150
+        assert client.calls == [None]
+
+    async def test_pages_merged_newest_first(self):
+        client = FakeDayCandles(days=1200)
+
+        candles = await fetch_candle_history(client, "KRW-BTC", "1d", 1000)
+
+        starts = [datetime.strptime(c.candle_date_time_utc, "%Y-%m-%dT%H:%M:%S") for c in candles]
+        assert len(candles) == 1000
+        assert starts == sorted(starts, reverse=True)
+        assert len(set(starts)) == 1000
+        # Newest page, then one concurrent wave of four windows
+        assert len(client.calls) == 5
+
+    async def test_gaps_and_short_history(self):
+        client = FakeDayCandles(days=450, skip={250, 251, 252})
+
+        candles = await fetch_candle_history(client, "KRW-BTC", "1d", 1000)
+
+        assert len(candles) == 447
@@ -0,0 +1,120 @@
+"""
+Tests for Compute Offloading (process pool executor + loop lag monitor)
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.compute import (
+    ComputeExecutor,
+    LoopLagMonitor,
+    frame_from_shared,
+    frame_to_shared,
+)
+from services.compute.executor import _calculate_all_indicators
+from services.technical_indicators import TechnicalIndicators
+
+
+def _make_ohlcv(rows: int = 300, date_index: bool = False) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    close = 50000 + rng.normal(0, 500, rows).cumsum()
+    df = pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=rows, freq="D"),
+        "open": close + rng.normal(0, 100, rows),
+        "high": close + 500,
+        "low": close - 500,
+        "close": close,
+        "volume": rng.integers(100_000, 1_000_000, rows),
+    })
+    if date_index:
+        df = df.set_index("date")
+    return df
+
+
+class TestSharedFrame:
+    """Shared-memory DataFrame transport"""
+
+    @pytest.mark.parametrize("date_index", [False, True])
+    def test_round_trip_is_lossless(self, date_index):
+        df = _make_ohlcv(date_index=date_index)
+        shm, ref = frame_to_shared(df)
+        try:
+            restored = frame_from_shared(ref)
+        finally:
+            shm.close()
+            shm.unlink()
+
+        pd.testing.assert_frame_equal(restored, df, check_freq=False)
+
+    def test_rejects_object_columns(self):
+        df = pd.DataFrame({"name": ["a", "b"], "close": [1.0, 2.0]})
+        with pytest.raises(TypeError):
+            frame_to_shared(df)
+
+
+class TestComputeExecutor:
+    """Process pool executor"""
+
+    async def test_run_frame_in_process_pool(self):
+        executor = ComputeExecutor(max_workers=1)
+        try:
+            df = _make_ohlcv()
+            result = await executor.run_frame(_calculate_all_indicators, df)
+        finally:
+            await executor.shutdown()
+
+        assert result == TechnicalIndicators(df).calculate_all()
+        assert executor.get_stats()["submitted"] == 1
+
+    async def test_large_frame_uses_shared_memory(self, monkeypatch):
+        monkeypatch.setattr("services.compute.executor.SHARED_MEMORY_MIN_BYTES", 1)
+        executor = ComputeExecutor(max_workers=1)
+        try:
+            df = _make_ohlcv()
+            result = await executor.run_frame(_calculate_all_indicators, df)
+        finally:
+            await executor.shutdown()
+
+        assert result["current_price"] == pytest.approx(df["close"].iloc[-1])
+        assert executor.get_stats()["shared_memory"] == 1
+
+    async def test_thread_mode_and_small_frames_run_inline(self):
+        executor = ComputeExecutor(max_workers=0)
+        result = await executor.run_frame(len, _make_ohlcv(rows=10))
+        assert result == 10
+        assert executor.get_stats()["inline"] == 1
+        assert executor.get_stats()["pool_running"] is False
+
+
+class TestLoopLagMonitor:
+    """Event loop lag monitor"""
+
+    async def test_detects_blocking_call(self):
+        monitor = LoopLagMonitor(interval=0.01, warn_threshold_ms=1000)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        time.sleep(0.1)  # Block the loop on purpose
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        stats = monitor.get_stats()
+        assert stats["samples"] > 0
+        assert stats["max_ms"] >= 50
+        assert stats["running"] is False
+
+    def test_percentiles(self):
+        monitor = LoopLagMonitor()
+        for lag in range(1, 101):
+            monitor.record(float(lag))
+
+        stats = monitor.get_stats()
+        assert stats["p50_ms"] == pytest.approx(50, abs=1)
+        assert stats["p99_ms"] == pytest.approx(99, abs=1)
+        assert stats["max_ms"] == 100
+
+        monitor.reset()
+        assert monitor.get_stats()["samples"] == 0
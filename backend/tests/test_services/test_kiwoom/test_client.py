@@ -298,6 +298,50 @@ class TestKiwoomClientDailyChart:
             assert isinstance(df, pd.DataFrame)
             assert len(df) == 0
 
+    @staticmethod
+    def _chart_page(dates, cont_yn="N", next_key=""):
+        return {
+            "return_code": 0,
+            "stk_cd": "005930",
+            "stk_dt_pole_chart_qry": [
+                {"dt": dt, "open_pric": "100", "high_pric": "110", "low_pric": "90",
+                 "cur_prc": "105", "trde_qty": "1000"}
+                for dt in dates
+            ],
+            "cont-yn": cont_yn,
+            "next-key": next_key,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_daily_chart_history_pages(self, client):
+        """Test daily chart history follows next-key until count is reached"""
+        pages = [
+            self._chart_page(["20241220", "20241219", "20241218"], "Y", "key-1"),
+            self._chart_page(["20241218", "20241217", "20241216"], "Y", "key-2"),
+        ]
+
+        with patch.object(client, '_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = pages
+
+            charts = await client.get_daily_chart_history("005930", count=5, base_dt="20241220")
+
+            assert [c.dt for c in charts] == ["20241220", "20241219", "20241218", "20241217", "20241216"]
+            assert mock_request.await_count == 2
+            assert mock_request.await_args_list[0].kwargs["next_key"] == ""
+            assert mock_request.await_args_list[1].kwargs["cont_yn"] == "Y"
+            assert mock_request.await_args_list[1].kwargs["next_key"] == "key-1"
+
+    @pytest.mark.asyncio
+    async def test_get_daily_chart_history_stops_at_last_page(self, client):
+        """Test daily chart history stops when no continuation is offered"""
+        with patch.object(client, '_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = self._chart_page(["20241220", "20241219"])
+
+            df = await client.get_daily_chart_df("005930", base_dt="20241220", count=1000)
+
+            assert len(df) == 2
+            assert mock_request.await_count == 1
+
 
 class TestKiwoomClientAccountBalance:
     """Test account balance methods"""
@@ -643,6 +687,27 @@ class TestKiwoomClientRequest:
                     )
 
 
+    @pytest.mark.asyncio
+    async def test_request_exposes_continuation_headers(self, client):
+        """Test _request returns cont-yn/next-key response headers with the body"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"return_code": 0}
+        mock_response.headers = {"cont-yn": "Y", "next-key": "abc"}
+
+        with patch.object(client.auth, 'get_token', new_callable=AsyncMock) as mock_token:
+            mock_token.return_value = "test_token"
+
+            with patch.object(client, '_get_client', new_callable=AsyncMock) as mock_get_client:
+                mock_http = AsyncMock()
+                mock_http.post.return_value = mock_response
+                mock_get_client.return_value = mock_http
+
+                result = await client._request(api_id="ka10081", endpoint="/api/dostk/chart")
+
+                assert result["cont-yn"] == "Y"
+                assert result["next-key"] == "abc"
+
+
 class TestKiwoomClientContextManager:
     """Test async context manager"""
 
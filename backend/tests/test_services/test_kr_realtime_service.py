@@ -0,0 +1,82 @@
+"""
+Tests for the KR (Kiwoom) real-time tick, order-execution and balance service
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from services.kiwoom import BalanceData, OrderExecutionData, StockTickData
+from services.kr_realtime_service import KrRealtimeService
+
+
+async def test_tick_fanout_and_subscription_refcount():
+    service = KrRealtimeService()
+    service._ws = MagicMock()
+    service._ws.subscribe_tick = AsyncMock()
+    service._ws.unsubscribe_tick = AsyncMock()
+
+    received_a, received_b = [], []
+
+    async def callback_a(tick):
+        received_a.append(tick.cur_prc)
+
+    def callback_b(tick):
+        received_b.append(tick.cur_prc)
+
+    await service.subscribe_tick(["005930"], callback_a)
+    await service.subscribe_tick(["005930", "000660"], callback_b)
+    service._ws.subscribe_tick.assert_any_await(["005930"])
+    service._ws.subscribe_tick.assert_any_await(["000660"])
+
+    await service._handle_tick(StockTickData(stk_cd="005930", cur_prc=72500))
+    assert received_a == [72500]
+    assert received_b == [72500]
+    assert service.get_latest_tick("005930").cur_prc == 72500
+
+    # Late subscriber gets the cached tick
+    late = []
+    await service.subscribe_tick(["005930"], late.append)
+    assert late[0].cur_prc == 72500
+
+    await service.unsubscribe_all(callback_b)
+    service._ws.unsubscribe_tick.assert_awaited_once_with(["000660"])
+    assert service.get_subscribed_stocks() == {"005930": 2}
+
+
+async def test_order_execution_stream_follows_subscribers():
+    service = KrRealtimeService()
+    service._ws = MagicMock()
+    service._ws.subscribe_order_execution = AsyncMock()
+    service._ws.unsubscribe_order_execution = AsyncMock()
+
+    received = []
+    await service.subscribe_order_execution(received.append)
+    await service.subscribe_order_execution(lambda e: None)
+    service._ws.subscribe_order_execution.assert_awaited_once()
+
+    execution = OrderExecutionData(
+        stk_cd="005930", ord_no="0001", ord_qty=10, ord_prc=72500,
+        ccld_qty=10, ccld_prc=72500, ord_tp="+매수",
+    )
+    await service._handle_order_execution(execution)
+    assert received == [execution]
+
+    await service.unsubscribe_order_execution(received.append)
+    service._ws.unsubscribe_order_execution.assert_not_awaited()
+
+
+async def test_balance_stream_follows_subscribers():
+    service = KrRealtimeService()
+    service._ws = MagicMock()
+    service._ws.subscribe_balance = AsyncMock()
+    service._ws.unsubscribe_balance = AsyncMock()
+
+    received = []
+    await service.subscribe_balance(received.append)
+    service._ws.subscribe_balance.assert_awaited_once()
+
+    balance = BalanceData(stk_cd="005930", hldg_qty=10, avg_buy_prc=70000, cur_prc=72500)
+    await service._handle_balance(balance)
+    assert received == [balance]
+
+    await service.unsubscribe_balance(received.append)
+    service._ws.unsubscribe_balance.assert_awaited_once()
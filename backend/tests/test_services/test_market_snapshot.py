@@ -0,0 +1,177 @@
+"""
+Tests for the shared Market Snapshot Service
+"""
+
+import asyncio
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.market_snapshot import (
+    ALL_PARTS,
+    BARS,
+    POSITION,
+    QUOTE,
+    MarketSnapshotService,
+)
+
+
+def _chart(rows: int = 60) -> pd.DataFrame:
+    close = 70000 + np.arange(rows) * 100
+    return pd.DataFrame({
+        "date": pd.date_range("2025-01-01", periods=rows, freq="D"),
+        "open": close,
+        "high": close + 500,
+        "low": close - 500,
+        "close": close,
+        "volume": np.full(rows, 1_000_000),
+    })
+
+
+def _stock_info(price: int = 76000):
+    return SimpleNamespace(
+        stk_cd="005930", stk_nm="삼성전자", cur_prc=price, prdy_vrss=100, prdy_ctrt=0.5,
+        acml_vol=1000, acml_tr_pbmn=0, strt_prc=price, high_prc=price, low_prc=price,
+        stk_hgpr=0, stk_lwpr=0, per=10.0, pbr=1.0, eps=100, bps=100, lstg_stqt=0, mrkt_tot_amt=0,
+    )
+
+
+def _make_client():
+    client = AsyncMock()
+
+    async def slow_stock_info(stk_cd):
+        await asyncio.sleep(0.01)
+        return _stock_info()
+
+    client.get_stock_info.side_effect = slow_stock_info
+    client.get_daily_chart_df.return_value = _chart()
+    client.get_orderbook.return_value = SimpleNamespace(
+        stk_cd="005930",
+        sell_hogas=[SimpleNamespace(price=76100, quantity=10)],
+        buy_hogas=[SimpleNamespace(price=76000, quantity=30)],
+        tot_sell_qty=10,
+        tot_buy_qty=30,
+    )
+    client.get_account_balance.return_value = SimpleNamespace(
+        holdings=[SimpleNamespace(
+            stk_cd="005930", stk_nm="삼성전자", hldg_qty=10, avg_buy_prc=70000,
+            cur_prc=76000, evlu_amt=760000, evlu_pfls_amt=60000, evlu_pfls_rt=8.57,
+        )],
+        pchs_amt=700000, evlu_amt=760000, evlu_pfls_amt=60000, evlu_pfls_rt=8.57,
+        d2_ord_psbl_amt=1_000_000,
+    )
+    return client
+
+
+@pytest.fixture
+def client():
+    client = _make_client()
+    with patch(
+        "app.core.kiwoom_singleton.get_shared_kiwoom_client_async",
+        AsyncMock(return_value=client),
+    ), patch("services.compute.get_compute_executor") as executor:
+        # Run the bar bundle inline instead of in the process pool
+        async def run_frame(func, df, *args):
+            return func(df, *args)
+
+        executor.return_value.run_frame.side_effect = run_frame
+        yield client
+
+
+class TestMarketSnapshotService:
+    """Snapshot building, sharing and freshness"""
+
+    async def test_builds_all_parts_once(self, client):
+        service = MarketSnapshotService()
+        snapshot = await service.get_snapshot("005930", parts=ALL_PARTS)
+
+        assert snapshot.version == 1
+        assert snapshot.quote["cur_prc"] == 76000
+        assert len(snapshot.chart_records) == 60
+        assert snapshot.indicators["current_price"] == pytest.approx(75900)
+        assert snapshot.kr_indicators["trend"] in ("bullish", "bearish", "neutral")
+        assert snapshot.orderbook["bid_ask_ratio"] == 3.0
+        assert snapshot.position["quantity"] == 10
+        assert snapshot.portfolio["available_cash"] == 1_000_000
+        assert not snapshot.errors
+
+        with pytest.raises(FrozenInstanceError):
+            snapshot.version = 2
+        with pytest.raises(TypeError):
+            snapshot.portfolio["available_cash"] = 0
+
+        # Chat, graph and scanner asking again share the same snapshot
+        again = await service.get_snapshot("005930", parts=(QUOTE, BARS))
+        assert again is snapshot
+        assert client.get_stock_info.await_count == 1
+        assert client.get_daily_chart_df.await_count == 1
+        assert service.get_stats()["hits"] == 1
+
+    async def test_concurrent_callers_share_one_fetch(self, client):
+        service = MarketSnapshotService()
+        snapshots = await asyncio.gather(*(
+            service.get_snapshot("005930", parts=(QUOTE, BARS)) for _ in range(5)
+        ))
+
+        assert all(s is snapshots[0] for s in snapshots)
+        assert client.get_stock_info.await_count == 1
+
+    async def test_only_stale_parts_are_refetched(self, client):
+        service = MarketSnapshotService(max_age={QUOTE: 0.05})
+        first = await service.get_snapshot("005930", parts=(QUOTE, BARS))
+
+        await asyncio.sleep(0.06)
+        client.get_stock_info.side_effect = None
+        client.get_stock_info.return_value = _stock_info(price=77000)
+        second = await service.get_snapshot("005930", parts=(QUOTE, BARS))
+
+        assert second.version == 2
+        assert second.quote["cur_prc"] == 77000
+        assert second.chart_records is first.chart_records
+        assert client.get_daily_chart_df.await_count == 1
+        assert first.quote["cur_prc"] == 76000  # Old version unchanged
+
+    async def test_failed_part_is_reported_and_retried(self, client):
+        service = MarketSnapshotService()
+        client.get_account_balance.side_effect = RuntimeError("token expired")
+
+        snapshot = await service.get_snapshot("005930", parts=(QUOTE, POSITION))
+        assert snapshot.portfolio is None
+        assert "token expired" in snapshot.errors[POSITION]
+        assert snapshot.quote is not None
+
+        client.get_account_balance.side_effect = None
+        retried = await service.get_snapshot("005930", parts=(QUOTE, POSITION))
+        assert retried.position["quantity"] == 10
+        assert POSITION not in retried.errors
+
+    async def test_failed_refresh_drops_stale_quote(self, client):
+        service = MarketSnapshotService(max_age={QUOTE: 0.05})
+        first = await service.get_snapshot("005930", parts=(QUOTE, BARS))
+
+        await asyncio.sleep(0.06)
+        client.get_stock_info.side_effect = RuntimeError("timeout")
+        second = await service.get_snapshot("005930", parts=(QUOTE, BARS))
+
+        assert first.quote["cur_prc"] == 76000
+        assert second.quote is None
+        assert not second.has(QUOTE)
+        assert "timeout" in second.errors[QUOTE]
+        assert second.chart_records is first.chart_records
+
+    async def test_balance_shared_across_tickers_and_lru(self, client):
+        service = MarketSnapshotService(max_entries=2)
+        for stk_cd in ("005930", "000660", "035420"):
+            await service.get_snapshot(stk_cd, parts=(POSITION,))
+
+        assert client.get_account_balance.await_count == 1
+        assert service.peek("005930") is None
+        assert service.peek("035420").position is None
+
+    async def test_unknown_part_rejected(self):
+        with pytest.raises(ValueError):
+            await MarketSnapshotService().get_snapshot("005930", parts=("news",))
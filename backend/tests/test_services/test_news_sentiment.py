@@ -0,0 +1,269 @@
+"""
+Tests for news sentiment caching.
+
+Tests article identity and near-duplicate collapsing, incremental
+per-article scoring, multi-stock batch scoring, and batched provider quota
+checks.
+"""
+
+import json
+import re
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.news import (
+    ArticleSentiment,
+    NewsArticle,
+    NewsProviderError,
+    NewsSearchResult,
+    NewsService,
+    NewsSentimentAnalyzer,
+    SentimentRequest,
+)
+from services.news.article_cache import ArticleSentimentCache, article_key, collapse_duplicates
+
+
+def make_article(title, link, original_link=None, description=""):
+    return NewsArticle(
+        title=title,
+        description=description,
+        link=link,
+        original_link=original_link,
+        pub_date=datetime(2026, 3, 2, 9, 0),
+    )
+
+
+class FakeLLM:
+    """Scores every article in the prompt with a fixed score."""
+
+    def __init__(self, score=50):
+        self.score = score
+        self.calls = []
+
+    async def generate(self, messages):
+        prompt = messages[-1].content
+        self.calls.append(prompt)
+        count = sum(1 for line in prompt.splitlines() if line[:1].isdigit())
+        return json.dumps({
+            "articles": [
+                {"id": i, "score": self.score, "topic": "실적", "factor": f"요인{i}"}
+                for i in range(1, count + 1)
+            ]
+        })
+
+
+class FakeBatchLLM(FakeLLM):
+    """Answers batch prompts per stock section; can omit stocks."""
+
+    def __init__(self, score=50, omit=()):
+        super().__init__(score)
+        self.omit = set(omit)
+
+    async def generate(self, messages):
+        prompt = messages[-1].content
+        if "[종목" not in prompt:
+            return await super().generate(messages)
+
+        self.calls.append(prompt)
+        stocks = []
+        for n, section in enumerate(re.split(r"\[종목 \d+\]", prompt)[1:], 1):
+            if n in self.omit:
+                continue
+            count = sum(1 for line in section.splitlines() if line[:1].isdigit())
+            stocks.append({
+                "stock": n,
+                "articles": [{"id": i, "score": self.score} for i in range(1, count + 1)],
+            })
+        return json.dumps({"stocks": stocks})
+
+
+class TestArticleIdentity:
+    """Tests for article keys and duplicate collapsing."""
+
+    def test_key_prefers_original_link_and_ignores_query(self):
+        a = make_article("A", "https://n.news.naver.com/1", "https://news.example.com/a?utm=x")
+        b = make_article("B", "https://n.news.naver.com/2", "https://news.example.com/a")
+        assert article_key(a) == article_key(b)
+
+    def test_near_duplicates_collapse(self):
+        articles = [
+            make_article("[속보] 삼성전자, 2분기 영업이익 10조 돌파", "https://a.com/1"),
+            make_article("삼성전자 2분기 영업이익 10조 돌파 (종합)", "https://b.com/1"),
+            make_article("SK하이닉스 HBM 공급 계약 체결", "https://c.com/1"),
+        ]
+
+        clusters = collapse_duplicates(articles)
+
+        assert [c.count for c in clusters] == [2, 1]
+        assert clusters[0].article is articles[0]
+
+
+class TestIncrementalSentiment:
+    """Tests for cached per-article scoring."""
+
+    @pytest.mark.asyncio
+    async def test_only_new_articles_sent_to_llm(self):
+        llm = FakeLLM(score=60)
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+        first = [
+            make_article("삼성전자 신규 수주", "https://a.com/1"),
+            make_article("삼성전자 배당 확대", "https://a.com/2"),
+        ]
+
+        result = await analyzer.analyze(first, "삼성전자", "005930")
+        assert result.score == 60
+        assert result.recommendation == "BUY"
+
+        # Same articles again: served from cache
+        await analyzer.analyze(first, "삼성전자", "005930")
+        assert len(llm.calls) == 1
+
+        # One new article: only it goes to the LLM
+        llm.score = -90
+        result = await analyzer.analyze(
+            first + [make_article("삼성전자 공장 화재", "https://a.com/3")], "삼성전자", "005930"
+        )
+        assert len(llm.calls) == 2
+        assert "공장 화재" in llm.calls[-1]
+        assert "신규 수주" not in llm.calls[-1]
+        assert result.score == round((60 + 60 - 90) / 3)
+        assert result.risk_factors == ["요인1"]
+
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self):
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value="호재가 많습니다")
+        cache = ArticleSentimentCache()
+        analyzer = NewsSentimentAnalyzer(llm, cache=cache)
+
+        result = await analyzer.analyze([make_article("제목", "https://a.com/1")], "삼성전자")
+
+        assert result.sentiment == "positive"
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_article_scored_per_stock(self):
+        llm = FakeLLM(score=70)
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+        story = [make_article("삼성전자, SK하이닉스 고객사 뺏어와", "https://a.com/1")]
+
+        winner = await analyzer.analyze(story, "삼성전자", "005930")
+        llm.score = -70
+        loser = await analyzer.analyze(story, "SK하이닉스", "000660")
+
+        assert len(llm.calls) == 2
+        assert (winner.score, loser.score) == (70, -70)
+        assert (await analyzer.analyze(story, "삼성전자", "005930")).score == 70
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_per_stock_scores_of_shared_article(self):
+        llm = FakeBatchLLM(score=30)
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+        story = [make_article("반도체 수출 규제 강화", "https://a.com/1")]
+        await analyzer.analyze(story, "삼성전자", "005930")
+
+        llm.score = -30
+        results = await analyzer.analyze_batch([
+            SentimentRequest(story, "삼성전자", "005930"),
+            SentimentRequest(story, "SK하이닉스", "000660"),
+        ])
+
+        assert [r.score for r in results] == [30, -30]
+        assert len(llm.calls) == 2
+        assert "SK하이닉스" in llm.calls[-1] and "삼성전자" not in llm.calls[-1]
+
+    def test_cache_ttl_and_lru(self):
+        cache = ArticleSentimentCache(ttl=0, max_entries=2)
+
+        cache.set("005930", "a", ArticleSentiment(score=1))
+        assert cache.get("005930", "a") is None
+
+        cache.ttl = 60
+        for key in ("a", "b", "c"):
+            cache.set("005930", key, ArticleSentiment(score=1))
+        assert len(cache) == 2
+        assert cache.get("005930", "a") is None
+
+
+class TestBatchSentiment:
+    """Tests for multi-stock batch scoring."""
+
+    @staticmethod
+    def make_requests(n):
+        return [
+            SentimentRequest(
+                articles=[
+                    make_article(f"종목{i} {headline}", f"https://s{i}.com/{j}")
+                    for j, headline in enumerate(["신규 수주 확대", "공장 증설 발표"])
+                ],
+                stock_name=f"종목{i}",
+                stock_code=f"00000{i}",
+            )
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_many_stocks_in_one_call(self):
+        llm = FakeBatchLLM(score=40)
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+
+        results = await analyzer.analyze_batch(self.make_requests(3))
+
+        assert len(llm.calls) == 1
+        assert [r.score for r in results] == [40, 40, 40]
+
+        # Everything cached now: no LLM call at all
+        await analyzer.analyze_batch(self.make_requests(3))
+        assert len(llm.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_unparsed_stock_falls_back_to_single_call(self):
+        llm = FakeBatchLLM(score=-50, omit={2})
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+
+        results = await analyzer.analyze_batch(self.make_requests(3))
+
+        assert len(llm.calls) == 2
+        assert "[종목" not in llm.calls[-1]
+        assert "종목1 신규 수주" in llm.calls[-1]
+        assert [r.recommendation for r in results] == ["SELL", "SELL", "SELL"]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped(self):
+        llm = FakeBatchLLM()
+        analyzer = NewsSentimentAnalyzer(llm, cache=ArticleSentimentCache())
+        analyzer.MAX_BATCH_STOCKS = 2
+
+        results = await analyzer.analyze_batch(self.make_requests(5) + [SentimentRequest([], "빈종목")])
+
+        assert len(llm.calls) == 3
+        assert results[-1].summary == "빈종목 관련 최근 뉴스가 없습니다."
+
+
+class TestQuotaBatching:
+    """Tests for NewsService quota checks."""
+
+    @pytest.mark.asyncio
+    async def test_quota_read_once_per_refresh_window(self):
+        provider = AsyncMock()
+        provider.name = "naver"
+        provider.daily_limit = 100
+        provider.get_remaining_quota = AsyncMock(return_value=2)
+        provider.search = AsyncMock(
+            return_value=NewsSearchResult(query="q", provider="naver", cached=False)
+        )
+
+        service = NewsService()
+        service.register_provider(provider, primary=True)
+
+        await service.search("q")
+        await service.search("q")
+
+        assert provider.get_remaining_quota.await_count == 1
+
+        # Local estimate is exhausted after two uncached calls
+        with pytest.raises(NewsProviderError):
+            await service.search("q")
+        assert provider.search.await_count == 2
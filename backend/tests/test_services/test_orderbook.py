@@ -0,0 +1,269 @@
+"""
+Tests for stream-fed L2 order books
+
+Tests level updates and snapshot diffs, derived metrics and their caching,
+and serving Upbit/Kiwoom order books from the realtime services without
+repeated REST calls.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.kiwoom import Orderbook as KiwoomOrderbook
+from services.kiwoom import OrderbookData
+from services.kiwoom.models import OrderbookUnit as KiwoomOrderbookUnit
+from services.kr_realtime_service import KrRealtimeService
+from services.orderbook import ASK, BID, OrderBook
+from services.realtime_service import RealtimeService
+from services.upbit import OrderbookFrame
+from services.upbit.models import Orderbook, OrderbookUnit
+
+
+class TestOrderBook:
+    """Levels, totals and metrics."""
+
+    def test_levels_sorted_best_first(self):
+        book = OrderBook("KRW-BTC")
+        book.apply_snapshot(
+            bids=[(98.0, 1.0), (99.0, 2.0), (97.0, 3.0)],
+            asks=[(102.0, 1.0), (101.0, 4.0)],
+        )
+
+        assert book.bids() == [(99.0, 2.0), (98.0, 1.0), (97.0, 3.0)]
+        assert book.asks(1) == [(101.0, 4.0)]
+        assert (book.total_bid_size, book.total_ask_size) == (6.0, 5.0)
+
+    def test_updates_and_removals(self):
+        book = OrderBook("KRW-BTC")
+        book.apply_snapshot(bids=[(99.0, 2.0)], asks=[(101.0, 1.0)])
+
+        book.update(BID, 99.5, 1.0)
+        book.update(ASK, 101.0, 0)
+
+        assert book.bids() == [(99.5, 1.0), (99.0, 2.0)]
+        assert book.asks() == []
+        assert book.total_bid_size == 3.0
+
+    def test_snapshot_touches_only_changed_levels(self):
+        book = OrderBook("KRW-BTC")
+        book.apply_snapshot(bids=[(99.0, 2.0)], asks=[(101.0, 1.0)])
+        version = book.version
+
+        book.apply_snapshot(bids=[(99.0, 2.0)], asks=[(101.0, 1.0)])
+        assert book.version == version
+
+        # Level 101 dropped out of the snapshot
+        book.apply_snapshot(bids=[(99.0, 2.0)], asks=[(102.0, 1.0)])
+        assert book.version == version + 1
+        assert book.asks() == [(102.0, 1.0)]
+
+    def test_metrics(self):
+        book = OrderBook("KRW-BTC", depth_levels=2)
+        book.apply_snapshot(
+            bids=[(99.0, 3.0), (98.0, 1.0), (97.0, 10.0)],
+            asks=[(101.0, 1.0), (102.0, 1.0)],
+        )
+
+        metrics = book.metrics()
+
+        assert (metrics.best_bid, metrics.best_ask, metrics.spread) == (99.0, 101.0, 2.0)
+        assert metrics.mid_price == 100.0
+        assert metrics.spread_bps == pytest.approx(200.0)
+        # Leans toward the ask: more size resting on the bid
+        assert metrics.microprice == pytest.approx((101.0 * 3.0 + 99.0 * 1.0) / 4.0)
+        assert (metrics.bid_depth, metrics.ask_depth) == (4.0, 2.0)
+        assert metrics.imbalance == pytest.approx(2.0 / 6.0)
+        assert book.metrics(levels=3).bid_depth == 14.0
+
+    def test_metrics_cached_per_version(self):
+        book = OrderBook("KRW-BTC")
+        book.apply_snapshot(bids=[(99.0, 1.0)], asks=[(101.0, 1.0)])
+
+        first = book.metrics()
+        assert book.metrics() is first
+
+        book.update(BID, 99.0, 2.0)
+        assert book.metrics() is not first
+        assert book.metrics().imbalance == pytest.approx(1.0 / 3.0)
+
+    def test_reported_totals_and_one_sided_book(self):
+        book = OrderBook("005930")
+        book.apply_snapshot(bids=[(70000, 10)], asks=[], total_bid_size=500, total_ask_size=0)
+
+        metrics = book.metrics()
+        assert book.total_bid_size == 500
+        assert metrics.spread is None and metrics.microprice is None
+        assert metrics.imbalance == 1.0
+
+        book.clear()
+        assert book.is_empty and book.age is None
+
+
+def _upbit_frame(market: str, bid: float, ask: float, size: float = 1.0) -> OrderbookFrame:
+    return OrderbookFrame({
+        "type": "orderbook",
+        "code": market,
+        "total_ask_size": size,
+        "total_bid_size": size,
+        "timestamp": 1735689600000,
+        "orderbook_units": [{"ask_price": ask, "bid_price": bid, "ask_size": size, "bid_size": size}],
+    })
+
+
+class TestRealtimeServiceOrderbook:
+    """Upbit order books are read from the stream after one REST snapshot."""
+
+    def _service(self, max_markets: int = 20):
+        service = RealtimeService(orderbook_max_markets=max_markets)
+        service._upbit_ws = SimpleNamespace(
+            is_connected=True,
+            subscribe_orderbook=AsyncMock(),
+            unsubscribe_orderbook=AsyncMock(),
+        )
+        return service
+
+    def _client(self):
+        rest = Orderbook(
+            market="KRW-BTC",
+            timestamp=0,
+            total_ask_size=1.0,
+            total_bid_size=2.0,
+            orderbook_units=[OrderbookUnit(ask_price=101.0, bid_price=99.0, ask_size=1.0, bid_size=2.0)],
+        )
+        return SimpleNamespace(get_orderbook=AsyncMock(return_value=[rest]))
+
+    async def test_seeded_once_then_streamed(self):
+        service = self._service()
+        client = self._client()
+
+        first = await service.get_orderbook(client, "krw-btc")
+        service._handle_orderbook(_upbit_frame("KRW-BTC", 100.0, 100.5, size=3.0))
+        second = await service.get_orderbook(client, "KRW-BTC")
+
+        assert first.orderbook_units[0].bid_price == 99.0
+        assert second.orderbook_units[0].bid_price == 100.0
+        assert second.total_bid_size == 3.0
+        assert client.get_orderbook.await_count == 1
+        service._upbit_ws.subscribe_orderbook.assert_awaited_once_with(["KRW-BTC"])
+        assert service.get_orderbook_metrics("KRW-BTC").spread == 0.5
+
+    async def test_untracked_markets_ignored(self):
+        service = self._service()
+
+        service._handle_orderbook(_upbit_frame("KRW-ETH", 1.0, 2.0))
+
+        assert service.get_orderbook_metrics("KRW-ETH") is None
+
+    async def test_reconnect_clears_books(self):
+        service = self._service()
+        client = self._client()
+        service._handle_connect()
+        await service.get_orderbook(client, "KRW-BTC")
+
+        service._handle_connect()
+        assert service.get_orderbook_metrics("KRW-BTC") is None
+        await service.get_orderbook(client, "KRW-BTC")
+
+        assert client.get_orderbook.await_count == 2
+
+    async def test_least_recently_read_market_dropped(self):
+        service = self._service(max_markets=1)
+        client = self._client()
+
+        await service.get_orderbook(client, "KRW-BTC")
+        await service.get_orderbook(client, "KRW-ETH")
+
+        assert list(service._orderbooks) == ["KRW-ETH"]
+        service._upbit_ws.unsubscribe_orderbook.assert_awaited_once_with(["KRW-BTC"])
+
+    async def test_falls_back_when_stream_down(self):
+        service = self._service()
+        service._upbit_ws.is_connected = False
+
+        assert await service.get_orderbook(self._client(), "KRW-BTC") is None
+
+    async def test_failed_subscribe_not_tracked(self):
+        service = self._service()
+        service._upbit_ws.subscribe_orderbook.side_effect = ConnectionError("closed")
+        client = self._client()
+
+        assert await service.get_orderbook(client, "KRW-BTC") is None
+        assert "KRW-BTC" not in service._orderbooks
+        client.get_orderbook.assert_not_awaited()
+
+    async def test_stale_book_reseeded(self):
+        service = self._service()
+        client = self._client()
+        await service.get_orderbook(client, "KRW-BTC")
+        service._handle_orderbook(_upbit_frame("KRW-BTC", 100.0, 100.5, size=3.0))
+
+        service._orderbooks["KRW-BTC"].updated_at -= service._orderbook_max_age + 1
+        assert service.get_orderbook_metrics("KRW-BTC") is None
+        reseeded = await service.get_orderbook(client, "KRW-BTC")
+
+        assert reseeded.orderbook_units[0].bid_price == 99.0
+        assert client.get_orderbook.await_count == 2
+        assert service.get_orderbook_metrics("KRW-BTC").spread == 2.0
+
+    async def test_stale_book_missing_when_reseed_fails(self):
+        service = self._service()
+        client = self._client()
+        await service.get_orderbook(client, "KRW-BTC")
+
+        service._orderbooks["KRW-BTC"].updated_at -= service._orderbook_max_age + 1
+        client.get_orderbook.side_effect = TimeoutError()
+
+        assert await service.get_orderbook(client, "KRW-BTC") is None
+
+
+class TestKrRealtimeServiceOrderbook:
+    """Kiwoom 주식호가잔량 (0D) snapshots keep the stock's book current."""
+
+    def _service(self):
+        service = KrRealtimeService()
+        service._ws = MagicMock()
+        service._ws.is_connected = True
+        service._ws.subscribe_orderbook = AsyncMock()
+        service._ws.unsubscribe_orderbook = AsyncMock()
+        return service
+
+    async def test_seeded_once_then_streamed(self):
+        service = self._service()
+        client = SimpleNamespace(get_orderbook=AsyncMock(return_value=KiwoomOrderbook(
+            stk_cd="005930",
+            sell_hogas=[KiwoomOrderbookUnit(price=72600, quantity=100)],
+            buy_hogas=[KiwoomOrderbookUnit(price=72500, quantity=300)],
+            tot_sell_qty=100,
+            tot_buy_qty=300,
+        )))
+
+        first = await service.get_orderbook(client, "005930")
+        service._handle_orderbook(OrderbookData(
+            stk_cd="005930",
+            sell_hoga_1=72700, sell_hoga_qty_1=50,
+            sell_hoga_2=72800, sell_hoga_qty_2=70,
+            buy_hoga_1=72600, buy_hoga_qty_1=200,
+            tot_sell_qty=1000, tot_buy_qty=2000,
+        ))
+        second = await service.get_orderbook(client, "005930")
+
+        assert first.bid_ask_ratio == 3.0
+        assert [h.price for h in second.sell_hogas] == [72700, 72800]
+        assert second.buy_hogas[0].price == 72600
+        assert (second.tot_sell_qty, second.tot_buy_qty) == (1000, 2000)
+        assert client.get_orderbook.await_count == 1
+        service._ws.subscribe_orderbook.assert_awaited_once_with(["005930"])
+
+        metrics = service.get_orderbook_metrics("005930")
+        assert (metrics.spread, metrics.bid_depth, metrics.ask_depth) == (100, 200, 120)
+
+    async def test_failed_subscribe_not_tracked(self):
+        service = self._service()
+        service._ws.subscribe_orderbook.side_effect = ConnectionError("closed")
+        client = SimpleNamespace(get_orderbook=AsyncMock())
+
+        assert await service.get_orderbook(client, "005930") is None
+        assert "005930" not in service._orderbooks
+        client.get_orderbook.assert_not_awaited()
@@ -0,0 +1,161 @@
+"""
+Tests for market data stream decoding
+
+Tests the JSON codec, lazy Upbit stream frames, skipping frames nobody
+listens to and encoding broadcast messages once.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from services.kiwoom.websocket import KiwoomWebSocketClient
+from services.realtime_service import RealtimeService
+from services.stream_codec import StreamMessage, dumps, loads
+from services.upbit import TickerFrame, TradeFrame, UpbitWebSocketClient, WebSocketTicker
+
+TICKER = {
+    "type": "ticker",
+    "code": "KRW-BTC",
+    "opening_price": 100.0,
+    "high_price": 110.0,
+    "low_price": 95.0,
+    "trade_price": 105.0,
+    "prev_closing_price": 100.0,
+    "change": "RISE",
+    "change_price": 5.0,
+    "signed_change_price": 5.0,
+    "change_rate": 0.05,
+    "signed_change_rate": 0.05,
+    "trade_volume": 0.1,
+    "acc_trade_volume": 10.0,
+    "acc_trade_volume_24h": 20.0,
+    "acc_trade_price": 1000.0,
+    "acc_trade_price_24h": 2000.0,
+    "trade_date": "20250101",
+    "trade_time": "000000",
+    "trade_timestamp": 1735689600000,
+    "ask_bid": "BID",
+    "acc_ask_volume": 4.0,
+    "acc_bid_volume": 6.0,
+    "highest_52_week_price": 120.0,
+    "highest_52_week_date": "2024-12-01",
+    "lowest_52_week_price": 50.0,
+    "lowest_52_week_date": "2024-01-01",
+    "market_state": "ACTIVE",
+    "timestamp": 1735689600001,
+    "stream_type": "REALTIME",
+}
+
+
+class TestCodec:
+    """orjson-backed decoding with the json module's output format."""
+
+    def test_round_trip(self):
+        frame = json.dumps(TICKER, ensure_ascii=False).encode()
+
+        assert loads(frame) == TICKER
+        assert json.loads(dumps(TICKER)) == TICKER
+
+    def test_compact_unicode_output(self):
+        assert dumps({"name": "비트코인", "price": 1}) == '{"name":"비트코인","price":1}'
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            loads(b"{not json")
+
+    def test_stream_message_encoded_once(self):
+        message = StreamMessage(type="ticker", market="KRW-BTC")
+
+        encoded = message.encoded
+
+        assert json.loads(encoded) == {"type": "ticker", "market": "KRW-BTC"}
+        assert message.encoded is encoded
+
+
+class TestStreamFrames:
+    """Frames read fields lazily from the decoded message."""
+
+    def test_fields_and_defaults(self):
+        frame = TickerFrame(dict(TICKER))
+
+        assert frame.trade_price == 105.0
+        assert frame.change == "RISE"
+        with pytest.raises(AttributeError):
+            frame.unknown_field
+
+        # Optional model field missing from the message
+        assert TradeFrame({"type": "trade"}).best_ask_price is None
+
+    def test_to_model(self):
+        model = TickerFrame(dict(TICKER)).to_model()
+
+        assert isinstance(model, WebSocketTicker)
+        assert model.code == "KRW-BTC"
+
+
+class TestUpbitDispatch:
+    """Only subscribed message types are delivered."""
+
+    async def test_frame_delivered_to_callbacks(self):
+        client = UpbitWebSocketClient()
+        received = []
+        client.on_ticker(received.append)
+
+        await client._process_message(dict(TICKER))
+
+        assert isinstance(received[0], TickerFrame)
+        assert received[0].code == "KRW-BTC"
+
+    async def test_unsubscribed_type_not_wrapped(self):
+        client = UpbitWebSocketClient()
+
+        with patch.object(TickerFrame, "__init__", side_effect=AssertionError) as init:
+            await client._process_message(dict(TICKER))
+            await client._process_message({"type": "unknown"})
+
+        init.assert_not_called()
+
+    async def test_callback_error_isolated(self):
+        client = UpbitWebSocketClient()
+        received = []
+
+        def failing(frame):
+            raise RuntimeError("boom")
+
+        client.on_ticker(failing)
+        client.on_ticker(received.append)
+
+        await client._process_message(dict(TICKER))
+
+        assert len(received) == 1
+
+
+class TestKiwoomDispatch:
+    """Kiwoom messages are parsed only when someone listens."""
+
+    async def test_unsubscribed_type_not_parsed(self):
+        with patch.object(KiwoomWebSocketClient, "_parse_tick_data") as parse:
+            client = KiwoomWebSocketClient()
+            await client._process_message({"header": {"rq_type": "0B"}, "body": {}})
+
+        parse.assert_not_called()
+
+
+class TestRealtimeBroadcast:
+    """Ticker broadcasts carry the same message to every subscriber."""
+
+    async def test_ticker_broadcast_is_stream_message(self):
+        service = RealtimeService()
+        first, second = [], []
+        service._ticker_callbacks["KRW-BTC"] = {first.append, second.append}
+
+        service._handle_ticker(TickerFrame(dict(TICKER)))
+        message = service._latest_tickers["KRW-BTC"]
+
+        assert isinstance(message, StreamMessage)
+        assert first[0] is second[0] is message
+        assert json.loads(message.encoded)["change_rate"] == pytest.approx(5.0)
+        assert message["change"] == "RISE"
+        assert message["stream_type"] == "REALTIME"
@@ -0,0 +1,162 @@
+"""
+Tests for the Telegram notification dispatcher.
+
+Tests non-blocking submission, coalescing into digests, per-chat rate
+limiting, retries, and TelegramNotifier's use of the queue.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram.error import BadRequest, RetryAfter, TimedOut
+
+from services.telegram import NotificationDispatcher, TelegramConfig, TelegramNotifier
+from services.telegram.dispatcher import DIGEST_SEPARATOR
+
+
+class Recorder:
+    """Send function recording deliveries; can fail the first calls."""
+
+    def __init__(self, delay=0.0, errors=()):
+        self.sent = []
+        self.delay = delay
+        self.errors = list(errors)
+
+    async def __call__(self, chat_id, text, parse_mode):
+        await asyncio.sleep(self.delay)
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((chat_id, text, parse_mode))
+
+
+def make_dispatcher(send, **kwargs):
+    options = dict(min_interval=0, coalesce_window=0.05, retry_backoff=0)
+    options.update(kwargs)
+    return NotificationDispatcher(send, **options)
+
+
+class TestNotificationDispatcher:
+    """Tests for queued delivery."""
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_wait_for_delivery(self):
+        send = Recorder(delay=0.2)
+        dispatcher = make_dispatcher(send)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert dispatcher.submit("chat", "hello") is True
+        assert loop.time() - started < 0.05
+        assert send.sent == []
+
+        await dispatcher.close()
+        assert send.sent == [("chat", "hello", "Markdown")]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_parts_become_one_digest(self):
+        send = Recorder()
+        dispatcher = make_dispatcher(send)
+
+        for agent in ("technical", "fundamental", "sentiment"):
+            dispatcher.submit("chat", agent, coalesce_key="analysis:005930")
+
+        await asyncio.sleep(0.1)
+        await dispatcher.flush()
+
+        assert [text for _, text, _ in send.sent] == [
+            DIGEST_SEPARATOR.join(["technical", "fundamental", "sentiment"])
+        ]
+        assert dispatcher.get_stats()["coalesced"] == 2
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_plain_message_releases_pending_digest_first(self):
+        send = Recorder()
+        dispatcher = make_dispatcher(send, coalesce_window=10)
+
+        dispatcher.submit("chat", "technical", coalesce_key="analysis:005930")
+        dispatcher.submit("chat", "proposal")
+
+        await dispatcher.flush()
+        assert [text for _, text, _ in send.sent] == ["technical", "proposal"]
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_per_chat_rate_limit(self):
+        send = Recorder()
+        dispatcher = make_dispatcher(send, min_interval=0.05)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for i in range(3):
+            dispatcher.submit("chat", str(i))
+        await dispatcher.flush()
+
+        assert len(send.sent) == 3
+        assert loop.time() - started >= 0.1
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_and_plain_text_fallback(self):
+        send = Recorder(errors=[TimedOut(), RetryAfter(0), BadRequest("can't parse entities")])
+        dispatcher = make_dispatcher(send)
+
+        dispatcher.submit("chat", "*broken")
+        await dispatcher.flush()
+
+        assert send.sent == [("chat", "*broken", None)]
+        assert dispatcher.get_stats()["retries"] == 3
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops(self):
+        dispatcher = make_dispatcher(Recorder(delay=0.05), max_queue=1)
+
+        assert dispatcher.submit("chat", "a") is True
+        assert dispatcher.submit("chat", "b") is False
+        assert dispatcher.get_stats()["dropped"] == 1
+        await dispatcher.close()
+
+
+class TestTelegramNotifierQueue:
+    """Tests for TelegramNotifier on top of the dispatcher."""
+
+    @staticmethod
+    def make_notifier():
+        config = TelegramConfig(
+            TELEGRAM_BOT_TOKEN="token",
+            TELEGRAM_CHAT_ID="42",
+            TELEGRAM_ENABLED=True,
+            TELEGRAM_MIN_INTERVAL=0,
+            TELEGRAM_COALESCE_WINDOW=0.05,
+        )
+        notifier = TelegramNotifier(config)
+        notifier._bot = MagicMock()
+        notifier._bot.send_message = AsyncMock()
+        notifier._initialized = True
+        return notifier
+
+    @pytest.mark.asyncio
+    async def test_subagent_decisions_sent_as_one_digest(self):
+        notifier = self.make_notifier()
+
+        for agent in ("technical", "fundamental", "sentiment", "risk"):
+            await notifier.send_subagent_decision("005930", "삼성전자", agent, "BUY", 0.7, ["요인"])
+
+        notifier._bot.send_message.assert_not_awaited()
+        await asyncio.sleep(0.1)
+        await notifier.close()
+
+        notifier._bot.send_message.assert_awaited_once()
+        text = notifier._bot.send_message.await_args.kwargs["text"]
+        assert "Technical" in text and "Risk" in text
+
+    @pytest.mark.asyncio
+    async def test_long_message_split_at_delivery(self):
+        notifier = self.make_notifier()
+
+        await notifier.send_message("가" * 9000)
+        await notifier.close()
+
+        assert notifier._bot.send_message.await_count == 3
@@ -0,0 +1,260 @@
+"""
+Tests for the tick recorder and replay
+
+Tests recording stream frames to segment files, reading them back through
+the memory-mapped reader (filters, orderbook grouping, segment rotation),
+and replaying them into the realtime services and on_price consumers.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from services.kiwoom import OrderbookData, StockTickData
+from services.kr_realtime_service import KrRealtimeService
+from services.realtime_service import RealtimeService
+from services.tick_recorder import (
+    RECORD_DTYPE,
+    SegmentFormatError,
+    TickRecorder,
+    TickReplay,
+    TickSegment,
+    kr_realtime_sink,
+    open_segments,
+    price_sink,
+    realtime_sink,
+)
+from services.tick_recorder.format import HEADER_SIZE
+from services.upbit import OrderbookFrame, TickerFrame, TradeFrame
+
+
+def _ticker(code: str, price: float, ts: int = 1735689600000) -> TickerFrame:
+    return TickerFrame({
+        "type": "ticker",
+        "code": code,
+        "trade_price": price,
+        "trade_volume": 0.5,
+        "acc_trade_volume_24h": 100.0,
+        "acc_trade_price_24h": 1e10,
+        "signed_change_rate": 0.01,
+        "signed_change_price": 1000.0,
+        "change": "RISE",
+        "high_price": price + 10,
+        "low_price": price - 10,
+        "ask_bid": "BID",
+        "trade_timestamp": ts,
+        "stream_type": "REALTIME",
+    })
+
+
+def _trade(code: str, price: float, seq: int) -> TradeFrame:
+    return TradeFrame({
+        "type": "trade",
+        "code": code,
+        "trade_price": price,
+        "trade_volume": 0.25,
+        "ask_bid": "ASK",
+        "trade_timestamp": 1735689600000 + seq,
+        "sequential_id": seq,
+        "stream_type": "REALTIME",
+    })
+
+
+def _orderbook(code: str, bid: float, ask: float) -> OrderbookFrame:
+    return OrderbookFrame({
+        "type": "orderbook",
+        "code": code,
+        "total_ask_size": 7.0,
+        "total_bid_size": 9.0,
+        "timestamp": 1735689600000,
+        "orderbook_units": [
+            {"ask_price": ask, "bid_price": bid, "ask_size": 1.0, "bid_size": 2.0},
+            {"ask_price": ask + 1, "bid_price": bid - 1, "ask_size": 3.0, "bid_size": 4.0},
+        ],
+        "stream_type": "REALTIME",
+    })
+
+
+class PriceTarget:
+    """on_price consumer (RiskMonitor/PositionManager interface)."""
+
+    def __init__(self):
+        self.prices = []
+
+    async def on_price(self, ticker: str, price: float):
+        self.prices.append((ticker, price))
+
+
+class TestRecorder:
+    """Recording and reading segments back."""
+
+    async def test_round_trip(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        recorder.record_upbit_ticker(_ticker("KRW-BTC", 100.0))
+        recorder.record_upbit_trade(_trade("KRW-ETH", 50.0, seq=7))
+        recorder.record_upbit_orderbook(_orderbook("KRW-BTC", 99.0, 101.0))
+        await recorder.stop()
+
+        [segment] = open_segments(tmp_path)
+        assert isinstance(segment.records, np.memmap)
+        assert segment.records.dtype == RECORD_DTYPE
+        assert len(segment) == 6  # ticker, trade, 2 levels x 2 sides
+
+        ticker, trade, book = list(segment.events())
+        assert (ticker.kind, ticker.symbol, ticker.price, ticker.side) == ("ticker", "KRW-BTC", 100.0, 1)
+        assert ticker.values == (100.0, 1e10, 0.01, 110.0, 90.0, 1000.0)
+        assert (trade.kind, trade.ref, trade.side, trade.exchange_ts) == ("trade", 7, -1, 1735689600007)
+        assert book.kind == "orderbook"
+        assert book.bids == [(99.0, 2.0), (98.0, 4.0)]
+        assert book.asks == [(101.0, 1.0), (102.0, 3.0)]
+        assert book.values[:2] == (9.0, 7.0)
+
+    async def test_filters(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        for i in range(5):
+            recorder.record_upbit_trade(_trade("KRW-BTC" if i % 2 else "KRW-ETH", 10.0 + i, seq=i))
+        await recorder.stop()
+
+        [segment] = open_segments(tmp_path)
+        assert [e.price for e in segment.events(symbols=["KRW-BTC"])] == [11.0, 13.0]
+
+        times = segment.records["ts_ns"]
+        selected = segment.select(start_ns=int(times[1]), end_ns=int(times[3]))
+        assert selected["price"].tolist() == [11.0, 12.0]
+
+    async def test_segments_rotate(self, tmp_path):
+        recorder = TickRecorder(tmp_path, segment_records=3)
+        for i in range(7):
+            recorder.record_upbit_trade(_trade("KRW-BTC", float(i), seq=i))
+        await recorder.flush()
+        recorder.record_upbit_trade(_trade("KRW-BTC", 7.0, seq=7))
+        await recorder.stop()
+
+        segments = open_segments(tmp_path)
+        assert [len(s) for s in segments] == [3, 3, 2]
+        assert recorder.stats["records"] == 8
+        prices = [e.price for e in TickReplay(segments, speed=0).events()]
+        assert prices == [float(i) for i in range(8)]
+
+    async def test_long_symbols_rotate_before_header_fills(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        codes = [f"KRW-LONGSYMBOL{i:04d}" for i in range(600)]
+        for i, code in enumerate(codes[:300]):
+            recorder.record_upbit_trade(_trade(code, float(i), seq=i))
+        await recorder.flush()
+        for i, code in enumerate(codes[300:], start=300):
+            recorder.record_upbit_trade(_trade(code, float(i), seq=i))
+        await recorder.flush()
+        await recorder.stop()
+
+        segments = open_segments(tmp_path)
+        assert len(segments) > 1
+        assert recorder.stats["pending"] == 0
+        assert [s for segment in segments for s in segment.symbols] == codes
+        prices = [e.price for e in TickReplay(segments, speed=0).events()]
+        assert prices == [float(i) for i in range(600)]
+
+    async def test_header_published_per_flush(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        recorder.record_upbit_trade(_trade("KRW-BTC", 1.0, seq=1))
+        await recorder.flush()
+
+        # Readable while the segment is still being written
+        segment = TickSegment(recorder.stats["segment"])
+        assert len(segment) == 1 and segment.symbols == ["KRW-BTC"]
+        await recorder.stop()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.seg"
+        path.write_bytes(b"x" * HEADER_SIZE)
+
+        with pytest.raises(SegmentFormatError):
+            TickSegment(path)
+
+    async def test_kiwoom_round_trip(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        recorder.record_kiwoom_tick(StockTickData(
+            stk_cd="005930", cur_prc=72500, ccld_qty=10, acml_vol=1000, acml_tr_pbmn=72_500_000,
+            prdy_ctrt=1.5, prdy_vrss=1000, high_prc=73000, low_prc=72000, strt_prc=72100,
+            timestamp=datetime(2025, 1, 2, 9, 0),
+        ))
+        recorder.record_kiwoom_orderbook(OrderbookData(
+            stk_cd="005930",
+            sell_hoga_1=72600, sell_hoga_qty_1=100,
+            buy_hoga_1=72500, buy_hoga_qty_1=300,
+            buy_hoga_2=72400, buy_hoga_qty_2=50,
+            tot_sell_qty=100, tot_buy_qty=350,
+        ))
+        await recorder.stop()
+
+        service = KrRealtimeService()
+        replay = TickReplay(tmp_path, speed=0)
+        replay.add_sink(kr_realtime_sink(service))
+        await replay.run()
+
+        tick = service.get_latest_tick("005930")
+        assert (tick.cur_prc, tick.acml_tr_pbmn, tick.strt_prc) == (72500, 72_500_000, 72100)
+        book = service._orderbooks["005930"]
+        assert book.bids() == [(72500, 300), (72400, 50)]
+        assert book.total_bid_size == 350
+
+
+class TestReplay:
+    """Replaying recorded sessions into consumers."""
+
+    async def _record(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        recorder.record_upbit_ticker(_ticker("KRW-BTC", 100.0))
+        recorder.record_upbit_orderbook(_orderbook("KRW-BTC", 99.0, 101.0))
+        recorder.record_upbit_trade(_trade("KRW-BTC", 101.0, seq=1))
+        await recorder.stop()
+
+    async def test_into_realtime_service(self, tmp_path):
+        await self._record(tmp_path)
+        service = RealtimeService()
+        received = []
+        service._ticker_callbacks["KRW-BTC"] = {received.append}
+
+        replay = TickReplay(tmp_path, speed=0)
+        replay.add_sink(realtime_sink(service))
+        stats = await replay.run()
+
+        assert stats["events"] == 3
+        assert [m["trade_price"] for m in received] == [100.0]
+        assert service.get_latest_ticker("KRW-BTC")["change"] == "RISE"
+        assert service._orderbooks["KRW-BTC"].metrics().spread == 2.0
+        assert service._latest_trades["KRW-BTC"]["sequential_id"] == 1
+
+    async def test_into_price_consumers(self, tmp_path):
+        await self._record(tmp_path)
+        first, second = PriceTarget(), PriceTarget()
+
+        replay = TickReplay(tmp_path, speed=0)
+        replay.add_sink(price_sink(first, second))
+        await replay.run()
+
+        assert first.prices == [("KRW-BTC", 100.0), ("KRW-BTC", 101.0)]
+        assert second.prices == first.prices
+
+    async def test_paced_by_speed(self, tmp_path):
+        path = tmp_path / "paced.seg"
+        recorder = TickRecorder(tmp_path)
+        recorder.record_upbit_trade(_trade("KRW-BTC", 1.0, seq=1))
+        recorder.record_upbit_trade(_trade("KRW-BTC", 2.0, seq=2))
+        await recorder.stop()
+        [segment] = open_segments(tmp_path)
+
+        # Rewrite receive times 1s apart
+        records = np.array(segment.records)
+        records["ts_ns"] = [0, 1_000_000_000]
+        path.write_bytes(open(segment.path, "rb").read(HEADER_SIZE) + records.tobytes())
+
+        stats = await TickReplay([path], speed=20.0).run()
+
+        assert stats["recorded_seconds"] == 1.0
+        assert 0.04 <= stats["wall_seconds"] < 0.5
+
+    def test_rejects_negative_speed(self, tmp_path):
+        with pytest.raises(ValueError):
+            TickReplay(tmp_path, speed=-1)
@@ -0,0 +1,267 @@
+"""
+Tests for the vectorized strategy backtest
+
+Tests entry parity with StrategyEngine's rule-based decision, fills and
+exits (take-profit, stop gaps, trailing and time exits), sizing limits,
+metrics, bar panel alignment and parameter sweeps.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+
+from services.trading import (
+    BacktestConfig,
+    BarPanel,
+    StrategyEngine,
+    StrategyPreset,
+    TradingStrategy,
+    derive_scores,
+    get_strategy_preset,
+    run_backtest,
+    run_sweep,
+)
+from services.trading.backtest import SCORE_NAMES, apply_params, entry_signals
+from services.trading.strategy import ExitConditions, PositionSizingRules
+
+NO_COSTS = BacktestConfig(initial_capital=1_000_000, fee_rate=0.0, whole_shares=False)
+
+
+def _panel(opens, highs, lows, closes) -> BarPanel:
+    opens, highs, lows, closes = (np.asarray(a, dtype=float).reshape(len(a), -1) for a in (opens, highs, lows, closes))
+    days, n = closes.shape
+    return BarPanel(
+        dates=np.datetime64("2025-01-01") + np.arange(days),
+        symbols=tuple(f"S{i}" for i in range(n)),
+        open=opens,
+        high=highs,
+        low=lows,
+        close=closes,
+        volume=np.ones((days, n)),
+    )
+
+
+def _scores(shape, buy_days=(), buy_symbols=None, risk=0.0) -> dict:
+    """Scores that signal BUY on the given days (all symbols unless limited)."""
+    scores = {name: np.zeros(shape) for name in SCORE_NAMES}
+    scores["risk_score"][:] = 100.0
+    for day in buy_days:
+        columns = slice(None) if buy_symbols is None else list(buy_symbols)
+        for name in ("technical_score", "fundamental_score", "sentiment_score"):
+            scores[name][day, columns] = 100.0
+        scores["risk_score"][day, columns] = risk
+    return scores
+
+
+def _strategy(**exit_kwargs) -> TradingStrategy:
+    return TradingStrategy(
+        exit_conditions=ExitConditions(**{"stop_loss_pct": 0.05, "take_profit_pct": 0.10, **exit_kwargs}),
+        position_sizing=PositionSizingRules(
+            max_position_pct=0.10, adjust_by_risk_score=False, min_cash_ratio=0.0, max_total_stock_pct=1.0
+        ),
+    )
+
+
+class TestEntrySignals:
+    """Entry decisions match StrategyEngine's rule-based path."""
+
+    def test_matches_strategy_engine(self):
+        rng = np.random.default_rng(7)
+        scores = {name: rng.integers(0, 101, size=(40, 25)).astype(float) for name in SCORE_NAMES}
+
+        for preset in StrategyPreset:
+            strategy = get_strategy_preset(preset)
+            engine = StrategyEngine(strategy)
+            signal, _ = entry_signals(scores, strategy.entry_conditions)
+
+            for t, i in np.ndindex(signal.shape):
+                row = {name: int(scores[name][t, i]) for name in SCORE_NAMES}
+                expected = (
+                    engine._check_entry_rules(row)["passed"]
+                    and engine._determine_action_from_scores(row) == "BUY"
+                )
+                assert signal[t, i] == expected
+
+    def test_missing_scores_never_signal(self):
+        scores = {name: np.full((1, 1), 100.0) for name in SCORE_NAMES}
+        scores["risk_score"][:] = np.nan
+
+        signal, _ = entry_signals(scores, TradingStrategy().entry_conditions)
+
+        assert not signal.any()
+
+
+class TestSimulation:
+    """Fills, exits and sizing."""
+
+    def test_take_profit_fills_at_target(self):
+        panel = _panel(
+            opens=[100, 100, 104, 106],
+            highs=[100, 102, 111, 107],
+            lows=[100, 99, 103, 105],
+            closes=[100, 101, 106, 106],
+        )
+
+        result = run_backtest(panel, _strategy(), _scores(panel.shape, buy_days=[0]), NO_COSTS)
+
+        [trade] = result.trade_log()
+        assert (trade["entry_date"], trade["exit_date"]) == ("2025-01-02", "2025-01-03")
+        assert trade["entry_price"] == 100.0
+        assert trade["exit_price"] == pytest.approx(110.0)
+        assert trade["reason"] == "TAKE_PROFIT"
+        assert trade["quantity"] == pytest.approx(1000.0)  # 10% of 1,000,000 at 100
+        assert result.metrics["final_equity"] == pytest.approx(1_010_000)
+
+    def test_stop_gap_fills_at_open(self):
+        panel = _panel(
+            opens=[100, 100, 90],
+            highs=[100, 100, 91],
+            lows=[100, 98, 88],
+            closes=[100, 99, 89],
+        )
+
+        result = run_backtest(panel, _strategy(), _scores(panel.shape, buy_days=[0]), NO_COSTS)
+
+        [trade] = result.trade_log()
+        assert (trade["reason"], trade["exit_price"]) == ("STOP_LOSS", 90.0)
+        assert result.metrics["max_drawdown"] == pytest.approx(0.01)
+
+    def test_trailing_stop_follows_high(self):
+        panel = _panel(
+            opens=[100, 100, 105, 107],
+            highs=[100, 100, 108, 107],
+            lows=[100, 100, 104, 101],
+            closes=[100, 100, 107, 102],
+        )
+        strategy = _strategy(take_profit_pct=0.5, trailing_stop_enabled=True, trailing_stop_pct=0.05)
+
+        result = run_backtest(panel, strategy, _scores(panel.shape, buy_days=[0]), NO_COSTS)
+
+        [trade] = result.trade_log()
+        assert trade["reason"] == "TRAILING_STOP"
+        assert trade["exit_price"] == pytest.approx(108 * 0.95)
+
+    def test_time_exit_at_close(self):
+        panel = _panel(opens=[100] * 5, highs=[101] * 5, lows=[99] * 5, closes=[100, 100, 100, 100, 100.5])
+
+        result = run_backtest(panel, _strategy(max_holding_days=3), _scores(panel.shape, buy_days=[0]), NO_COSTS)
+
+        [trade] = result.trade_log()
+        assert (trade["reason"], trade["exit_date"], trade["exit_price"]) == ("TIME_EXIT", "2025-01-05", 100.5)
+
+    def test_sizing_limits(self):
+        flat = np.full((3, 4), 100.0)
+        panel = _panel(flat, flat, flat, flat)
+        scores = _scores(panel.shape, buy_days=[0])
+        scores["technical_score"][0] = [100, 99, 98, 97]  # entry order
+        strategy = TradingStrategy(position_sizing=PositionSizingRules(
+            max_position_pct=0.10, adjust_by_risk_score=False, max_positions=3,
+            min_cash_ratio=0.0, max_total_stock_pct=0.25,
+        ))
+
+        result = run_backtest(panel, strategy, scores, NO_COSTS)
+
+        # Three slots, the third cut to the remaining 5% of stock capacity
+        assert result.open_positions == 3
+        assert result.exposure[-1] == pytest.approx(0.25)
+
+    def test_risk_adjusted_size_and_costs(self):
+        flat = np.full((3, 1), 100.0)
+        panel = _panel(flat, flat, flat, flat)
+        strategy = TradingStrategy(position_sizing=PositionSizingRules(
+            max_position_pct=0.10, min_position_pct=0.02, risk_adjustment_factor=0.5,
+            min_cash_ratio=0.0, max_total_stock_pct=1.0,
+        ))
+        config = BacktestConfig(initial_capital=1_000_000, fee_rate=0.001)
+
+        result = run_backtest(panel, strategy, _scores(panel.shape, buy_days=[0], risk=40.0), config)
+
+        # 10% x (1 - 0.4 x 0.5) = 8%, whole shares after the fee
+        assert result.exposure[-1] * result.equity[-1] == pytest.approx(799 * 100)
+        assert result.equity[-1] == pytest.approx(1_000_000 - 799 * 100 * 0.001)
+        assert result.metrics["turnover"] > 0
+
+    def test_rejects_mismatched_scores(self):
+        flat = np.full((3, 1), 100.0)
+        panel = _panel(flat, flat, flat, flat)
+
+        with pytest.raises(ValueError):
+            run_backtest(panel, _strategy(), {name: np.zeros((2, 1)) for name in SCORE_NAMES})
+
+
+class TestInputs:
+    """Panels and derived scores."""
+
+    def test_from_frames_aligns_dates(self):
+        a = pd.DataFrame({
+            "date": pd.to_datetime(["2025-01-02", "2025-01-03"]),
+            "open": [1, 2], "high": [1, 2], "low": [1, 2], "close": [1, 2], "volume": [10, 20],
+        })
+        b = pd.DataFrame(
+            {"open": [5], "high": [5], "low": [5], "close": [5], "volume": [50]},
+            index=pd.to_datetime(["2025-01-03"]),
+        )
+
+        panel = BarPanel.from_frames({"A": a, "B": b})
+
+        assert panel.symbols == ("A", "B")
+        assert panel.dates.tolist() == [np.datetime64("2025-01-02"), np.datetime64("2025-01-03")]
+        assert np.isnan(panel.close[0, 1]) and panel.close[1, 1] == 5
+
+    def test_derived_scores_warm_up(self):
+        rng = np.random.default_rng(1)
+        closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, (120, 5)), axis=0)
+        panel = _panel(closes, closes, closes, closes)
+
+        scores = derive_scores(panel)
+
+        assert set(scores) == set(SCORE_NAMES)
+        assert np.isnan(scores["technical_score"][:59]).all()
+        for values in scores.values():
+            assert values.shape == panel.shape
+            assert np.nanmin(values) >= 0 and np.nanmax(values) <= 100
+
+        result = run_backtest(panel, get_strategy_preset(StrategyPreset.VALUE_INVESTING))
+        assert len(result.equity) == 120
+
+
+class TestSweep:
+    """Parameter grids."""
+
+    def _panel(self):
+        rng = np.random.default_rng(3)
+        closes = 100 * np.cumprod(1 + rng.normal(0.001, 0.02, (150, 8)), axis=0)
+        return _panel(closes, closes * 1.01, closes * 0.99, closes)
+
+    def test_apply_params(self):
+        strategy = apply_params(TradingStrategy(), {"exit_conditions.stop_loss_pct": 0.03})
+        assert strategy.exit_conditions.stop_loss_pct == 0.03
+
+        with pytest.raises(KeyError):
+            apply_params(TradingStrategy(), {"exit_conditions.unknown": 1})
+        with pytest.raises(ValidationError):
+            apply_params(TradingStrategy(), {"exit_conditions.stop_loss_pct": 0.9})
+
+    def test_grid_in_workers_matches_inline(self):
+        panel = self._panel()
+        strategy = get_strategy_preset(StrategyPreset.GROWTH_MOMENTUM)
+        grid = {
+            "exit_conditions.trailing_stop_pct": [0.03, 0.08],
+            "position_sizing.max_positions": [2, 5],
+        }
+
+        inline = run_sweep(panel, strategy, grid, max_workers=0)
+        pooled = run_sweep(panel, strategy, grid, max_workers=2)
+
+        assert [r.params for r in inline] == [
+            {"exit_conditions.trailing_stop_pct": 0.03, "position_sizing.max_positions": 2},
+            {"exit_conditions.trailing_stop_pct": 0.03, "position_sizing.max_positions": 5},
+            {"exit_conditions.trailing_stop_pct": 0.08, "position_sizing.max_positions": 2},
+            {"exit_conditions.trailing_stop_pct": 0.08, "position_sizing.max_positions": 5},
+        ]
+        assert [r.metrics for r in pooled] == [r.metrics for r in inline]
+
+    def test_invalid_grid_rejected_before_running(self):
+        with pytest.raises(KeyError):
+            run_sweep(self._panel(), TradingStrategy(), {"risk.min_cash_ratio": [0.1]}, max_workers=2)
@@ -0,0 +1,327 @@
+"""
+Tests for the execution scheduler and split-order execution.
+
+Tests TWAP/VWAP slicing, fill reconciliation from order-execution reports,
+and OrderAgent's use of the shared Kiwoom rate limiter.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.kiwoom import OrderExecutionData, StockTickData
+from services.kiwoom.models import OrderResponse
+from services.trading.execution_scheduler import (
+    ExecutionAlgo,
+    ExecutionScheduler,
+    profile_weights,
+    slice_offsets,
+    split_quantity,
+)
+from services.trading.models import OrderRequest, OrderResult, OrderSide
+from services.trading.order_agent import OrderAgent
+
+
+def make_order(quantity=300, price=70000):
+    return OrderRequest(
+        ticker="005930",
+        stock_name="삼성전자",
+        side=OrderSide.BUY,
+        quantity=quantity,
+        price=price,
+        reason="test",
+    )
+
+
+def make_execution(ord_no, ord_qty, ccld_qty, ccld_prc, rmn_qty):
+    return OrderExecutionData(
+        stk_cd="005930",
+        ord_no=ord_no,
+        ord_qty=ord_qty,
+        ord_prc=ccld_prc,
+        ccld_qty=ccld_qty,
+        ccld_prc=ccld_prc,
+        rmn_qty=rmn_qty,
+        ord_tp="+매수",
+    )
+
+
+class FakeStream:
+    """Minimal stand-in for KrRealtimeService."""
+
+    def __init__(self):
+        self.execution_callbacks = set()
+        self.ticks = {}
+        self.tick_subscriptions = []
+
+    async def subscribe_order_execution(self, callback):
+        self.execution_callbacks.add(callback)
+
+    async def unsubscribe_order_execution(self, callback):
+        self.execution_callbacks.discard(callback)
+
+    async def subscribe_tick(self, codes, callback):
+        self.tick_subscriptions.append(("sub", tuple(codes)))
+
+    async def unsubscribe_tick(self, codes, callback):
+        self.tick_subscriptions.append(("unsub", tuple(codes)))
+
+    def get_latest_tick(self, stk_cd):
+        return self.ticks.get(stk_cd)
+
+    def emit(self, execution):
+        for callback in list(self.execution_callbacks):
+            callback(execution)
+
+
+class TestScheduleBuilding:
+    """Tests for schedule helpers."""
+
+    def test_split_quantity_sums_to_total(self):
+        assert split_quantity(100, [1, 1, 1]) == [34, 33, 33]
+        assert sum(split_quantity(1001, [0.16, 0.09, 0.145])) == 1001
+
+    def test_slice_offsets(self):
+        assert slice_offsets(4, 8.0) == [0.0, 2.0, 4.0, 6.0]
+        assert slice_offsets(3, 0) == [0.0, 0.0, 0.0]
+
+    def test_profile_weights_follow_intraday_curve(self):
+        """Slices at the open weigh more than midday slices."""
+        start = datetime(2026, 3, 2, 9, 0)
+        offsets = slice_offsets(13, 13 * 1800)
+
+        weights = profile_weights(offsets, 13 * 1800, start)
+
+        assert weights[0] > weights[6]
+        assert weights[-1] > weights[6]
+
+    def test_profile_weights_short_horizon_is_twap(self):
+        start = datetime(2026, 3, 2, 11, 0)
+        weights = profile_weights(slice_offsets(5, 10), 10, start)
+        assert len(set(weights)) == 1
+
+
+class TestExecutionScheduler:
+    """Tests for child submission and fill tracking."""
+
+    @pytest.mark.asyncio
+    async def test_children_submitted_concurrently(self):
+        """A slow child submission does not delay the next slice."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def submit(request, await_fill):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return OrderResult(
+                order_id="x", ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, filled_quantity=request.quantity,
+                avg_price=70000, status="filled",
+            )
+
+        scheduler = ExecutionScheduler(submit)
+        results = await scheduler.execute(make_order(300), num_slices=3, duration=0)
+
+        assert [r.requested_quantity for r in results] == [100, 100, 100]
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_fills_reconciled_from_execution_stream(self):
+        """Submitted children complete from execution reports, incl. early ones."""
+        stream = FakeStream()
+        counter = iter(range(1, 10))
+
+        async def submit(request, await_fill):
+            assert await_fill is True
+            ord_no = f"000{next(counter)}"
+            if ord_no == "0001":
+                # Report arrives before the REST response
+                stream.emit(make_execution(ord_no, request.quantity, request.quantity, 70100, 0))
+            return OrderResult(
+                order_id=ord_no, ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, status="submitted",
+            )
+
+        scheduler = ExecutionScheduler(submit, fill_stream=stream, fill_timeout=1.0)
+        task = asyncio.create_task(scheduler.execute(make_order(200), num_slices=2, duration=0))
+
+        await asyncio.sleep(0.01)
+        stream.emit(make_execution("0002", 100, 40, 70000, 60))
+        stream.emit(make_execution("0002", 100, 100, 70200, 0))
+
+        results = await task
+
+        assert [r.status for r in results] == ["filled", "filled"]
+        assert results[0].avg_price == 70100
+        assert results[1].avg_price == pytest.approx((40 * 70000 + 60 * 70200) / 100)
+        assert stream.execution_callbacks == set()
+
+    @pytest.mark.asyncio
+    async def test_unfilled_child_times_out_as_partial(self):
+        stream = FakeStream()
+
+        async def submit(request, await_fill):
+            return OrderResult(
+                order_id="0001", ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, status="submitted",
+            )
+
+        scheduler = ExecutionScheduler(submit, fill_stream=stream, fill_timeout=0.05)
+        task = asyncio.create_task(scheduler.execute(make_order(100), num_slices=1))
+        await asyncio.sleep(0.01)
+        stream.emit(make_execution("0001", 100, 30, 70000, 70))
+
+        results = await task
+
+        assert results[0].status == "partial"
+        assert results[0].filled_quantity == 30
+
+    @pytest.mark.asyncio
+    async def test_timed_out_child_remainder_is_cancelled(self):
+        stream = FakeStream()
+        order_nos = iter(["0001", "0002"])
+        cancels = []
+
+        async def submit(request, await_fill):
+            return OrderResult(
+                order_id=next(order_nos), ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, status="submitted",
+            )
+
+        async def cancel(request, order_no, quantity):
+            cancels.append((order_no, quantity))
+            return True
+
+        scheduler = ExecutionScheduler(submit, fill_stream=stream, fill_timeout=0.05, cancel=cancel)
+        task = asyncio.create_task(scheduler.execute(make_order(100), num_slices=2))
+        await asyncio.sleep(0.01)
+        stream.emit(make_execution("0001", 50, 20, 70000, 30))
+
+        results = await task
+
+        assert sorted(cancels) == [("0001", 30), ("0002", 50)]
+        assert [r.status for r in results] == ["partial", "cancelled"]
+        assert [r.filled_quantity for r in results] == [20, 0]
+
+    @pytest.mark.asyncio
+    async def test_vwap_participation_cap_carries_remainder(self):
+        """Children are capped by live volume; the last slice sweeps the rest."""
+        stream = FakeStream()
+        stream.ticks["005930"] = StockTickData(stk_cd="005930", cur_prc=70000, acml_vol=1000)
+        submitted = []
+
+        async def submit(request, await_fill):
+            submitted.append(request.quantity)
+            # Market trades 100 shares between releases
+            tick = stream.ticks["005930"]
+            stream.ticks["005930"] = tick.model_copy(update={"acml_vol": tick.acml_vol + 100})
+            return OrderResult(
+                order_id=str(len(submitted)), ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, filled_quantity=request.quantity,
+                avg_price=70000, status="filled",
+            )
+
+        scheduler = ExecutionScheduler(submit, fill_stream=stream)
+        await scheduler.execute(
+            make_order(300), algo=ExecutionAlgo.VWAP, num_slices=3,
+            duration=0.03, max_participation=0.2,
+        )
+
+        # First slice: no interval volume yet -> capped at 0 and carried
+        assert sum(submitted) == 300
+        assert submitted[-1] >= 100
+        assert ("sub", ("005930",)) in stream.tick_subscriptions
+        assert ("unsub", ("005930",)) in stream.tick_subscriptions
+
+
+class TestOrderAgentExecution:
+    """Tests for OrderAgent with the scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_split_order_aggregates_children(self):
+        agent = OrderAgent()
+        agent.SLICE_INTERVAL_SECONDS = 0
+
+        async def fake_single(order, await_fill=False):
+            return OrderResult(
+                order_id="x", ticker=order.ticker, side=order.side,
+                requested_quantity=order.quantity, filled_quantity=order.quantity,
+                avg_price=70000, status="filled",
+            )
+
+        agent._execute_single_order = fake_single
+
+        result = await agent.execute_order(make_order(250))
+
+        assert result.status == "filled"
+        assert result.filled_quantity == 250
+        assert result.message == "Split order: 3 parts"
+
+    @pytest.mark.asyncio
+    async def test_uncancelled_children_leave_parent_pending(self):
+        """Children that timed out and could not be cancelled may still fill."""
+        stream = FakeStream()
+        order_nos = iter(["0001", "0002"])
+
+        async def submit(request, await_fill):
+            return OrderResult(
+                order_id=next(order_nos), ticker=request.ticker, side=request.side,
+                requested_quantity=request.quantity, status="submitted",
+            )
+
+        async def cancel(request, order_no, quantity):
+            return False
+
+        agent = OrderAgent()
+        agent.SLICE_INTERVAL_SECONDS = 0
+        agent._scheduler = ExecutionScheduler(submit, fill_stream=stream, fill_timeout=0.05, cancel=cancel)
+
+        result = await agent._execute_split_order(make_order(100), num_splits=2)
+
+        assert result.status == "pending"
+        assert result.filled_quantity == 0
+
+    @pytest.mark.asyncio
+    async def test_short_vwap_schedule_runs_as_twap(self):
+        """Second-scale schedules cannot follow the 30-minute volume profile."""
+        agent = OrderAgent(algo=ExecutionAlgo.VWAP)
+        scheduler = MagicMock()
+        scheduler.execute = AsyncMock(return_value=[])
+        agent._scheduler = scheduler
+
+        await agent.execute_order(make_order(250))
+        kwargs = scheduler.execute.await_args.kwargs
+        assert kwargs["algo"] == ExecutionAlgo.TWAP
+        assert kwargs["max_participation"] is None
+
+        await agent.execute_order(make_order(250), duration=3600)
+        kwargs = scheduler.execute.await_args.kwargs
+        assert kwargs["algo"] == ExecutionAlgo.VWAP
+        assert kwargs["max_participation"] == agent.MAX_PARTICIPATION
+
+    @pytest.mark.asyncio
+    async def test_uses_kiwoom_client_rate_limiter_once(self):
+        """Real orders rely on the client's limiter instead of acquiring twice."""
+        limiter = MagicMock()
+        limiter.acquire_order = AsyncMock(return_value=True)
+        kiwoom = SimpleNamespace(
+            rate_limiter=limiter,
+            place_buy_order=AsyncMock(
+                return_value=OrderResponse(ord_no="0001", return_code=0, return_msg="")
+            ),
+        )
+        agent = OrderAgent(kiwoom_client=kiwoom)
+
+        result = await agent.execute_order(make_order(10), split=False)
+
+        assert agent.limiter is limiter
+        limiter.acquire_order.assert_not_called()
+        kiwoom.place_buy_order.assert_awaited_once()
+        assert result.order_id == "0001"
+        assert result.status == "filled"
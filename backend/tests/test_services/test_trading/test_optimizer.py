@@ -0,0 +1,231 @@
+"""
+Tests for the parameter optimizer
+
+Tests RiskParameters limits in the backtest, parameter sets (grid, random
+samples, risk paths), shared memory bars, cached and stored results, and
+parallel evaluation matching inline evaluation.
+"""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from services.trading import (
+    BacktestConfig,
+    BarPanel,
+    OptimizationStore,
+    ParameterOptimizer,
+    RiskParameters,
+    StrategyPreset,
+    TradingStrategy,
+    apply_param_set,
+    get_strategy_preset,
+    grid_samples,
+    random_samples,
+    run_backtest,
+)
+from services.trading.backtest import SCORE_NAMES
+from services.trading.optimizer import SharedBars, attach_shared_bars, param_key
+from services.trading.strategy import PositionSizingRules
+
+NO_COSTS = BacktestConfig(initial_capital=1_000_000, fee_rate=0.0, whole_shares=False)
+
+
+def _flat_panel(days: int, n: int, closes=None) -> BarPanel:
+    closes = np.full((days, n), 100.0) if closes is None else np.asarray(closes, dtype=float)
+    return BarPanel(
+        dates=np.datetime64("2025-01-01") + np.arange(days),
+        symbols=tuple(f"S{i}" for i in range(n)),
+        open=closes.copy(),
+        high=closes.copy(),
+        low=closes.copy(),
+        close=closes,
+        volume=np.ones((days, n)),
+    )
+
+
+def _buy_scores(shape, buy_days) -> dict:
+    scores = {name: np.zeros(shape) for name in SCORE_NAMES}
+    scores["risk_score"][:] = 100.0
+    for day in buy_days:
+        for name in ("technical_score", "fundamental_score", "sentiment_score"):
+            scores[name][day] = 100.0
+        scores["risk_score"][day] = 0.0
+    return scores
+
+
+def _open_strategy() -> TradingStrategy:
+    return TradingStrategy(position_sizing=PositionSizingRules(
+        max_position_pct=0.10, adjust_by_risk_score=False, max_positions=10,
+        min_cash_ratio=0.0, max_total_stock_pct=1.0,
+    ))
+
+
+def _random_panel(days=150, n=8, seed=3) -> BarPanel:
+    rng = np.random.default_rng(seed)
+    closes = 100 * np.cumprod(1 + rng.normal(0.001, 0.02, (days, n)), axis=0)
+    panel = _flat_panel(days, n, closes)
+    return BarPanel(
+        dates=panel.dates, symbols=panel.symbols, open=closes, high=closes * 1.01,
+        low=closes * 0.99, close=closes, volume=panel.volume,
+    )
+
+
+class TestRiskLimits:
+    """RiskParameters applied by run_backtest."""
+
+    def test_position_and_daily_trade_caps(self):
+        panel = _flat_panel(3, 6)
+        risk = RiskParameters(max_single_position_pct=0.05, min_cash_ratio=0.0, max_daily_trades=4)
+
+        result = run_backtest(panel, _open_strategy(), _buy_scores(panel.shape, [0]), NO_COSTS, risk)
+
+        assert result.open_positions == 4
+        assert result.exposure[-1] == pytest.approx(0.20)
+
+    def test_stricter_ratio_limits_win(self):
+        panel = _flat_panel(3, 10)
+        risk = RiskParameters(max_single_position_pct=0.5, min_cash_ratio=0.7, max_total_stock_pct=1.0)
+
+        result = run_backtest(panel, _open_strategy(), _buy_scores(panel.shape, [0]), NO_COSTS, risk)
+
+        assert result.exposure[-1] == pytest.approx(0.30)
+
+    def test_sudden_move_pauses_next_day(self):
+        # S0 jumps 20% on day 2, S1 signals that day: its entry (day 3) is skipped
+        closes = np.full((5, 2), 100.0)
+        closes[2:, 0] = 120.0
+        panel = _flat_panel(5, 2, closes)
+        scores = _buy_scores(panel.shape, [])
+        for name in ("technical_score", "fundamental_score", "sentiment_score"):
+            scores[name][0, 0] = scores[name][2, 1] = 100.0
+        scores["risk_score"][0, 0] = scores["risk_score"][2, 1] = 0.0
+        strategy = _open_strategy()
+        strategy.exit_conditions.take_profit_pct = 0.5
+
+        paused = run_backtest(panel, strategy, scores, NO_COSTS, RiskParameters(sudden_move_threshold_pct=10))
+        calm = run_backtest(panel, strategy, scores, NO_COSTS, RiskParameters(sudden_move_threshold_pct=30))
+
+        assert paused.metrics["paused_days"] == 1 and paused.open_positions == 1
+        assert calm.metrics["paused_days"] == 0 and calm.open_positions == 2
+
+
+class TestParameterSets:
+    """Sampling and applying parameter sets."""
+
+    def test_apply_param_set(self):
+        strategy, risk = apply_param_set(
+            TradingStrategy(),
+            RiskParameters(),
+            {"exit_conditions.stop_loss_pct": 0.03, "risk.max_daily_trades": 3},
+        )
+        assert strategy.exit_conditions.stop_loss_pct == 0.03
+        assert risk.max_daily_trades == 3
+
+        with pytest.raises(KeyError):
+            apply_param_set(TradingStrategy(), RiskParameters(), {"risk.unknown": 1})
+        with pytest.raises(ValidationError):
+            apply_param_set(TradingStrategy(), RiskParameters(), {"risk.sudden_move_threshold_pct": 50})
+
+    def test_samples(self):
+        grid = grid_samples({"risk.max_daily_trades": [1, 2], "exit_conditions.stop_loss_pct": [0.05]})
+        assert grid == [
+            {"risk.max_daily_trades": 1, "exit_conditions.stop_loss_pct": 0.05},
+            {"risk.max_daily_trades": 2, "exit_conditions.stop_loss_pct": 0.05},
+        ]
+
+        space = {"risk.max_daily_trades": (1, 3), "risk.max_single_position_pct": (0.05, 0.3)}
+        samples = random_samples(space, 50, seed=1)
+        assert samples == random_samples(space, 50, seed=1)
+        assert len({param_key(p) for p in samples}) == len(samples)
+        for params in samples:
+            assert params["risk.max_daily_trades"] in (1, 2, 3)
+            assert 0.05 <= params["risk.max_single_position_pct"] <= 0.3
+
+        with pytest.raises(ValueError):
+            random_samples({"risk.max_daily_trades": (3, 1)}, 1)
+
+    def test_shared_bars_round_trip(self):
+        panel = _random_panel(days=20, n=3)
+        scores = _buy_scores(panel.shape, [5])
+
+        with SharedBars(panel, scores) as shared:
+            shm, attached, attached_scores = attach_shared_bars(shared.ref)
+            try:
+                np.testing.assert_array_equal(attached.close, panel.close)
+                np.testing.assert_array_equal(attached_scores["risk_score"], scores["risk_score"])
+                assert attached.symbols == panel.symbols
+            finally:
+                del attached, attached_scores
+                shm.close()
+
+
+class TestOptimizer:
+    """Runs, caching and the result store."""
+
+    def test_cached_results_are_reused(self, tmp_path):
+        store = OptimizationStore(str(tmp_path / "optimization.db"))
+        panel = _random_panel()
+        strategy = get_strategy_preset(StrategyPreset.GROWTH_MOMENTUM)
+        samples = grid_samples({"risk.max_single_position_pct": [0.05, 0.1, 0.2]})
+
+        first = ParameterOptimizer(panel, strategy, store=store, min_trades=0, max_workers=0).run(samples)
+        # A new optimizer (e.g. the next night's run) finds them in the store
+        second = ParameterOptimizer(panel, strategy, store=store, min_trades=0, max_workers=0).run(
+            samples + grid_samples({"risk.max_single_position_pct": [0.3]})
+        )
+
+        assert (first.evaluated, first.cached) == (3, 0)
+        assert (second.evaluated, second.cached) == (1, 3)
+        assert first.context_key == second.context_key
+
+        scores = [r.score for r in second.results]
+        assert scores == sorted(scores, reverse=True)
+
+        run = store.get_run(second.run_id)
+        assert run["status"] == "completed" and run["samples"] == 4
+        assert run["best"]["params"] == second.best.params
+        by_drawdown = store.get_results(second.run_id, order_by="max_drawdown", descending=False)
+        drawdowns = [r["metrics"]["max_drawdown"] for r in by_drawdown]
+        assert drawdowns == sorted(drawdowns)
+        with pytest.raises(ValueError):
+            store.get_results(second.run_id, order_by="params; DROP TABLE optimization_runs")
+
+    def test_changed_base_is_not_cached(self, tmp_path):
+        store = OptimizationStore(str(tmp_path / "optimization.db"))
+        panel = _random_panel()
+        samples = grid_samples({"risk.max_daily_trades": [2, 5]})
+
+        ParameterOptimizer(panel, TradingStrategy(), store=store, max_workers=0).run(samples)
+        run = ParameterOptimizer(
+            panel, TradingStrategy(), risk_params=RiskParameters(min_cash_ratio=0.5), store=store, max_workers=0
+        ).run(samples)
+
+        assert run.cached == 0
+
+    def test_workers_match_inline(self, tmp_path):
+        panel = _random_panel()
+        strategy = get_strategy_preset(StrategyPreset.GROWTH_MOMENTUM)
+        samples = grid_samples({
+            "exit_conditions.trailing_stop_pct": [0.03, 0.08],
+            "risk.sudden_move_threshold_pct": [3.0, 20.0],
+        })
+
+        inline = ParameterOptimizer(panel, strategy, max_workers=0).run(samples)
+        pooled = ParameterOptimizer(panel, strategy, max_workers=2).run(samples)
+
+        assert [(r.params, r.metrics) for r in pooled.results] == [(r.params, r.metrics) for r in inline.results]
+
+    def test_invalid_set_fails_run(self, tmp_path):
+        store = OptimizationStore(str(tmp_path / "optimization.db"))
+        optimizer = ParameterOptimizer(_random_panel(), TradingStrategy(), store=store, max_workers=0)
+
+        with pytest.raises(KeyError):
+            optimizer.run([{"risk.unknown": 1}])
+
+        [run] = store.list_runs()
+        assert run["status"] == "failed" and "risk.unknown" in run["error"]
+
+    def test_rejects_unknown_objective(self):
+        with pytest.raises(ValueError):
+            ParameterOptimizer(_random_panel(), TradingStrategy(), objective="luck")
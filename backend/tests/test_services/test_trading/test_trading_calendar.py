@@ -0,0 +1,113 @@
+"""
+Tests for the compiled KRX trading calendar.
+
+Tests bisect-based next/previous/nth/count lookups, gap detection,
+range extension, and the holiday service / MarketHoursService wiring.
+"""
+
+from datetime import date, datetime, time
+from unittest.mock import patch
+
+import pytest
+
+from services.krx_holiday import HolidayInfo, KRXHolidayService, TradingCalendar
+from services.trading.market_hours import KST, MarketHoursService
+
+SEOLLAL_2025 = [date(2025, 1, 28), date(2025, 1, 29), date(2025, 1, 30)]
+
+
+@pytest.fixture
+def calendar():
+    return TradingCalendar(
+        [date(2025, 1, 1)] + SEOLLAL_2025 + [date(2024, 12, 31)],
+        names={d: "설날" for d in SEOLLAL_2025},
+    )
+
+
+class TestTradingCalendar:
+    """Tests for TradingCalendar queries."""
+
+    def test_is_trading_day(self, calendar):
+        assert calendar.is_trading_day(date(2025, 1, 27))
+        assert not calendar.is_trading_day(date(2025, 1, 28))  # holiday
+        assert not calendar.is_trading_day(date(2025, 2, 1))   # Saturday
+        assert calendar.holiday_name(date(2025, 1, 29)) == "설날"
+
+    def test_next_and_previous_skip_holidays(self, calendar):
+        assert calendar.next_trading_day(date(2025, 1, 27)) == date(2025, 1, 31)
+        assert calendar.previous_trading_day(date(2025, 1, 31)) == date(2025, 1, 27)
+        # Friday -> Monday
+        assert calendar.next_trading_day(date(2025, 1, 31)) == date(2025, 2, 3)
+
+    def test_nth_trading_day(self, calendar):
+        assert calendar.nth_trading_day(date(2025, 1, 27), 2) == date(2025, 2, 3)
+        assert calendar.nth_trading_day(date(2025, 1, 28), 0) == date(2025, 1, 31)
+        assert calendar.nth_trading_day(date(2025, 1, 27), 0) == date(2025, 1, 27)
+        # Back across the year end (2024-12-31 and 2025-01-01 are closed)
+        assert calendar.nth_trading_day(date(2025, 1, 2), -1) == date(2024, 12, 30)
+
+    def test_count_and_list_trading_days(self, calendar):
+        start, end = date(2025, 1, 27), date(2025, 2, 3)
+        assert calendar.count_trading_days(start, end) == 3
+        assert calendar.trading_days(start, end) == [
+            date(2025, 1, 27), date(2025, 1, 31), date(2025, 2, 3),
+        ]
+        assert calendar.count_trading_days(end, start) == 0
+
+    def test_missing_trading_days(self, calendar):
+        bars = [date(2025, 1, 24), date(2025, 1, 27), date(2025, 2, 3)]
+        assert calendar.missing_trading_days(bars) == [date(2025, 1, 31)]
+        assert calendar.missing_trading_days([]) == []
+
+    def test_range_extends_on_demand(self):
+        calendar = TradingCalendar(start_year=2025, end_year=2025)
+
+        assert calendar.next_trading_day(date(2025, 12, 31)) == date(2026, 1, 1)
+        assert calendar.end == date(2026, 12, 31)
+
+        assert calendar.previous_trading_day(date(2025, 1, 1)) == date(2024, 12, 31)
+        assert calendar.start == date(2024, 1, 1)
+
+
+class TestHolidayServiceCalendar:
+    """Tests for KRXHolidayService lookups through the compiled calendar."""
+
+    def test_lookups_do_not_requery_storage(self, tmp_path):
+        service = KRXHolidayService(str(tmp_path / "holidays.db"))
+        service.storage.save_holidays(
+            [HolidayInfo(date=d, day_of_week="", name="설날", year=2025) for d in SEOLLAL_2025]
+        )
+
+        with patch.object(service.storage, "get_holidays", wraps=service.storage.get_holidays) as spy:
+            assert service.get_next_trading_day(date(2025, 1, 27)) == date(2025, 1, 31)
+            assert service.get_previous_trading_day(date(2025, 1, 31)) == date(2025, 1, 27)
+            assert service.count_trading_days(date(2025, 1, 27), date(2025, 1, 31)) == 2
+            assert service.is_holiday(date(2025, 1, 29))
+            assert service.get_holiday_info(date(2025, 1, 29)).name == "설날"
+
+        assert spy.call_count <= 1
+
+
+class TestMarketHoursCalendar:
+    """Tests for MarketHoursService next-open calculation."""
+
+    def test_weekend_next_open_skips_monday_holiday(self):
+        market_hours = MarketHoursService()
+        market_hours._holiday_service_checked = True  # use fallback holidays
+
+        # Saturday 2025-10-04; Chuseok closes Mon 10-06 through Thu 10-09
+        now = KST.localize(datetime(2025, 10, 4, 10, 0))
+        session = market_hours._get_krx_session(now)
+
+        assert not session.is_open
+        assert session.next_open.date() == date(2025, 10, 10)
+        assert session.next_open.time() == time(9, 0)
+
+    def test_after_hours_next_open_skips_holidays(self):
+        market_hours = MarketHoursService()
+        market_hours._holiday_service_checked = True
+
+        now = KST.localize(datetime(2025, 1, 27, 16, 0))
+        session = market_hours._get_krx_session(now)
+
+        assert session.next_open.date() == date(2025, 1, 31)
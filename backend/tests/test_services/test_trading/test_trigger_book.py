@@ -0,0 +1,297 @@
+"""
+Tests for the shared trigger book.
+
+Tests indexed crossing detection, trailing stops, and owner dispatch used by
+RiskMonitor and PositionManager.
+"""
+
+import pytest
+
+from services.agent_chat.position_manager import (
+    PositionManager,
+    PositionEventType,
+)
+from services.trading.models import ManagedPosition, StopLossMode, AlertType
+from services.trading.risk_monitor import RiskMonitor
+from services.trading.trigger_book import LOWER, UPPER, TriggerBook
+
+
+@pytest.fixture
+def book():
+    return TriggerBook()
+
+
+class TestTriggerBook:
+    """Tests for TriggerBook crossing detection."""
+
+    def test_returns_only_crossed_triggers(self, book):
+        """Only levels crossed by the price are returned."""
+        book.set("a", "005930", "stop", 68000, LOWER)
+        book.set("a", "005930", "deep_stop", 60000, LOWER)
+        book.set("a", "005930", "target", 80000, UPPER)
+
+        assert book.on_price("005930", 70000) == []
+
+        hits = book.on_price("005930", 67000)
+        assert [t.kind for t in hits] == ["stop"]
+
+        hits = book.on_price("005930", 81000)
+        assert [t.kind for t in hits] == ["target"]
+
+    def test_triggers_are_one_shot(self, book):
+        """A crossed trigger fires once until registered again."""
+        book.set("a", "005930", "stop", 68000, LOWER)
+
+        assert len(book.on_price("005930", 67000)) == 1
+        assert book.on_price("005930", 66000) == []
+        assert book.get("a", "005930", "stop") is None
+
+    def test_set_moves_existing_trigger(self, book):
+        """Registering the same key again replaces its level."""
+        book.set("a", "005930", "stop", 68000, LOWER)
+        book.set("a", "005930", "stop", 65000, LOWER)
+
+        assert book.on_price("005930", 67000) == []
+        assert book.get_stats()["triggers"] == 1
+
+    def test_boundary_is_inclusive(self, book):
+        """Prices exactly at the level cross it."""
+        book.set("a", "005930", "stop", 68000, LOWER)
+        book.set("a", "005930", "target", 80000, UPPER)
+
+        assert len(book.on_price("005930", 68000)) == 1
+        assert len(book.on_price("005930", 80000)) == 1
+
+    def test_remove_by_owner_and_ticker(self, book):
+        """remove() without kind drops the owner's triggers for a ticker."""
+        book.set("a", "005930", "stop", 68000, LOWER)
+        book.set("a", "005930", "target", 80000, UPPER)
+        book.set("b", "005930", "stop", 68000, LOWER)
+
+        assert book.remove("a", "005930") == 2
+
+        hits = book.on_price("005930", 60000)
+        assert [t.owner for t in hits] == ["b"]
+
+    def test_trailing_stop_follows_high_water(self, book):
+        """Trailing levels rise with new highs and never move down."""
+        book.set_trailing("a", "005930", "trail", 5.0, 100000)
+
+        book.on_price("005930", 110000)
+        assert book.get("a", "005930", "trail").level == pytest.approx(104500)
+
+        # Lower high-water mark is ignored
+        book.set_trailing("a", "005930", "trail", 5.0, 100000)
+        assert book.get("a", "005930", "trail").high_water == 110000
+
+        hits = book.on_price("005930", 104000)
+        assert [t.kind for t in hits] == ["trail"]
+
+    def test_many_tickers_are_isolated(self, book):
+        """Updates for one ticker never touch another ticker's triggers."""
+        for i in range(500):
+            book.set("a", f"{i:06d}", "stop", 100, LOWER)
+
+        assert book.on_price("000001", 200) == []
+        assert [t.ticker for t in book.on_price("000001", 50)] == ["000001"]
+        assert book.get_stats()["triggers"] == 499
+
+    @pytest.mark.asyncio
+    async def test_update_price_dispatches_per_owner(self, book):
+        """Hits are grouped and delivered to each owner's handler."""
+        received = {}
+
+        async def handler_a(hits, price):
+            received["a"] = ([t.kind for t in hits], price)
+
+        async def handler_b(hits, price):
+            raise RuntimeError("boom")
+
+        book.register_handler("a", handler_a)
+        book.register_handler("b", handler_b)
+        book.set("a", "005930", "stop", 68000, LOWER)
+        book.set("b", "005930", "stop", 68000, LOWER)
+
+        hits = await book.update_price("005930", 67000)
+
+        assert len(hits) == 2
+        assert received["a"] == (["stop"], 67000)
+
+
+class TestMonitorsShareBook:
+    """RiskMonitor and PositionManager registered in one book."""
+
+    @pytest.mark.asyncio
+    async def test_one_update_reaches_both_monitors(self, book):
+        """A single price update triggers both monitors' stop-loss handling."""
+        risk_monitor = RiskMonitor(trigger_book=book)
+        position_manager = PositionManager(trigger_book=book)
+
+        risk_monitor.add_position(
+            ManagedPosition(
+                ticker="005930",
+                stock_name="삼성전자",
+                quantity=10,
+                avg_price=72500,
+                current_price=72500,
+                stop_loss=68875,
+                stop_loss_mode=StopLossMode.USER_APPROVAL,
+            )
+        )
+        position_manager.add_position(
+            ticker="005930",
+            stock_name="삼성전자",
+            quantity=10,
+            avg_price=72500,
+            stop_loss=68875,
+        )
+
+        events = []
+        position_manager.on_event(lambda e: events.append(e.event_type))
+
+        await risk_monitor.start()
+        try:
+            await book.update_price("005930", 68000)
+        finally:
+            await risk_monitor.stop()
+
+        assert any(a.alert_type == AlertType.STOP_LOSS_TRIGGERED for a in risk_monitor.get_pending_alerts())
+        assert PositionEventType.STOP_LOSS_HIT in events
+        # The warning is superseded by the hit
+        assert PositionEventType.STOP_LOSS_NEAR not in events
+
+    @pytest.mark.asyncio
+    async def test_paused_risk_monitor_keeps_trigger_armed(self, book):
+        """While paused, crossed triggers are re-armed instead of handled."""
+        risk_monitor = RiskMonitor(trigger_book=book)
+        risk_monitor.add_position(
+            ManagedPosition(
+                ticker="005930",
+                stock_name="삼성전자",
+                quantity=10,
+                avg_price=72500,
+                current_price=72500,
+                stop_loss=68875,
+            )
+        )
+        await risk_monitor.pause("test")
+
+        await book.update_price("005930", 68000)
+
+        assert book.get(risk_monitor._owner, "005930", "stop_loss") is not None
+        assert not any(a.alert_type == AlertType.STOP_LOSS_TRIGGERED for a in risk_monitor.get_pending_alerts())
+
+    @pytest.mark.asyncio
+    async def test_stopped_risk_monitor_does_not_execute(self, book):
+        """A stopped monitor leaves the book; other owners' prices do not reach it."""
+        executed = []
+
+        async def execute(order):
+            executed.append((order.side.value, order.price))
+
+        risk_monitor = RiskMonitor(trigger_book=book, order_executor=execute)
+        risk_monitor.add_position(
+            ManagedPosition(
+                ticker="005930",
+                stock_name="삼성전자",
+                quantity=10,
+                avg_price=72500,
+                current_price=72500,
+                stop_loss=66000,
+                stop_loss_mode=StopLossMode.AGENT_AUTO,
+            )
+        )
+        await risk_monitor.start()
+        await risk_monitor.stop()
+
+        position_manager = PositionManager(trigger_book=book)
+        position_manager.add_position(
+            ticker="005930",
+            stock_name="삼성전자",
+            quantity=10,
+            avg_price=72500,
+            stop_loss=66000,
+        )
+        await position_manager.on_price("005930", 65000)
+
+        assert executed == []
+        assert book.get(risk_monitor._owner, "005930", "stop_loss") is None
+
+        # Restarting re-arms the watched positions
+        await risk_monitor.start()
+        try:
+            assert book.get(risk_monitor._owner, "005930", "stop_loss") is not None
+        finally:
+            await risk_monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_stop_loss_is_rearmed(self, book):
+        """A stop-loss whose execution fails fires again on the next price below it."""
+        attempts = []
+
+        async def execute(order):
+            attempts.append(order.price)
+            raise RuntimeError("broker down")
+
+        risk_monitor = RiskMonitor(trigger_book=book, order_executor=execute)
+        risk_monitor.risk_params.sudden_move_threshold_pct = 50
+        risk_monitor.add_position(
+            ManagedPosition(
+                ticker="005930",
+                stock_name="삼성전자",
+                quantity=10,
+                avg_price=72500,
+                current_price=72500,
+                stop_loss=66000,
+                take_profit=80000,
+                stop_loss_mode=StopLossMode.AGENT_AUTO,
+            )
+        )
+        await risk_monitor.start()
+        try:
+            for price in (65000, 64000, 63000):
+                await risk_monitor.on_price("005930", price)
+        finally:
+            await risk_monitor.stop()
+
+        assert attempts == [65000.0, 64000.0, 63000.0]
+        assert sum(a.alert_type == AlertType.ORDER_FAILED for a in risk_monitor.get_pending_alerts()) == 3
+
+    @pytest.mark.asyncio
+    async def test_position_manager_trailing_stop_hit(self, book):
+        """A trailing stop raised by pushed prices fires STOP_LOSS_HIT."""
+        position_manager = PositionManager(trigger_book=book)
+        position_manager.add_position(
+            ticker="005930",
+            stock_name="삼성전자",
+            quantity=10,
+            avg_price=72500,
+            trailing_stop_pct=5.0,
+        )
+
+        events = []
+        position_manager.on_event(lambda e: events.append(e.event_type))
+
+        await position_manager.on_price("005930", 76000)
+        position = position_manager.get_position("005930")
+        assert position.trailing_stop_price == pytest.approx(72200)
+
+        await position_manager.on_price("005930", 72000)
+        assert PositionEventType.STOP_LOSS_HIT in events
+
+    def test_remove_position_clears_triggers(self, book):
+        """Removing a position drops its triggers from the book."""
+        position_manager = PositionManager(trigger_book=book)
+        position_manager.add_position(
+            ticker="005930",
+            stock_name="삼성전자",
+            quantity=10,
+            avg_price=72500,
+            stop_loss=68875,
+            take_profit=79750,
+        )
+        assert book.get_stats()["triggers"] > 0
+
+        position_manager.remove_position("005930")
+
+        assert book.get_stats()["triggers"] == 0
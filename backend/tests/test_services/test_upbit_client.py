@@ -0,0 +1,184 @@
+"""
+Tests for the pooled Upbit client
+
+Tests Remaining-Req parsing and bucket sync, 429 retries, the quotation
+cache with single-flight fetches and the shared client singleton.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.core import upbit_singleton
+from services.upbit import UpbitAPIError, UpbitCache, UpbitClient, UpbitRateLimiter
+from services.upbit.rate_limiter import get_request_group, parse_remaining_req
+
+ORDERBOOK = [{
+    "market": "KRW-BTC",
+    "timestamp": 0,
+    "total_ask_size": 2.0,
+    "total_bid_size": 3.0,
+    "orderbook_units": [{"ask_price": 101, "bid_price": 99, "ask_size": 2, "bid_size": 3}],
+}]
+
+
+def _client(handler, **kwargs) -> UpbitClient:
+    client = UpbitClient(**kwargs)
+    client._client = httpx.AsyncClient(
+        base_url=UpbitClient.BASE_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestRateLimiter:
+    """Per-group buckets follow the server's Remaining-Req header."""
+
+    def test_parse_remaining_req(self):
+        assert parse_remaining_req("group=candle; min=599; sec=9") == ("candle", 9)
+        assert parse_remaining_req("group=order; sec=abc") is None
+        assert parse_remaining_req(None) is None
+
+    def test_request_groups(self):
+        assert get_request_group("GET", "/candles/minutes/1") == "candle"
+        assert get_request_group("GET", "/ticker") == "ticker"
+        assert get_request_group("POST", "/orders") == "order"
+        assert get_request_group("GET", "/accounts") == "default"
+
+    async def test_header_caps_tokens(self):
+        limiter = UpbitRateLimiter()
+        assert await limiter.acquire("candle")
+
+        limiter.update("group=candle; min=100; sec=0")
+        assert not await limiter.acquire("candle", timeout=0.01)
+        # Other groups are unaffected
+        assert await limiter.acquire("ticker", timeout=0.01)
+
+    async def test_throttled_pauses_group(self):
+        limiter = UpbitRateLimiter()
+        limiter.throttled("order", 5.0)
+
+        assert not await limiter.acquire("order", timeout=0.01)
+        assert limiter.stats["throttled"] == 1
+
+
+class TestClientRequests:
+    """Requests go through the limiter and retry on 429."""
+
+    async def test_retries_on_429(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(429, text="Too many API requests.")
+            return httpx.Response(
+                200, json=ORDERBOOK, headers={"Remaining-Req": "group=orderbook; min=599; sec=8"},
+            )
+
+        client = _client(handler, enable_cache=False)
+        client.RETRY_BASE_DELAY = 0.01
+
+        orderbooks = await client.get_orderbook(["KRW-BTC"])
+
+        assert len(calls) == 2
+        assert orderbooks[0].market == "KRW-BTC"
+        assert client.stats["rate_limiter"]["throttled"] == 1
+        await client.close()
+
+    async def test_gives_up_after_max_attempts(self):
+        client = _client(lambda request: httpx.Response(429, text="Too many"), enable_cache=False)
+        client.RETRY_BASE_DELAY = 0.001
+
+        with pytest.raises(UpbitAPIError) as exc_info:
+            await client.get_orderbook(["KRW-BTC"])
+
+        assert exc_info.value.status_code == 429
+        await client.close()
+
+
+class TestQuotationCache:
+    """Identical quotation requests share one response."""
+
+    async def test_concurrent_requests_share_one_call(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, json=ORDERBOOK)
+
+        client = _client(handler)
+
+        results = await asyncio.gather(*(client.get_orderbook(["KRW-BTC"]) for _ in range(5)))
+        await client.get_orderbook(["KRW-BTC"])
+
+        assert calls == 1
+        assert all(r[0].market == "KRW-BTC" for r in results)
+        # Each caller gets its own list
+        assert results[0] is not results[1]
+        assert client.cache.stats["shared_inflight"] == 4
+        await client.close()
+
+    async def test_entries_expire(self):
+        cache = UpbitCache(ttl={"ticker": 0.01})
+        cache.set("ticker:KRW-BTC", [1])
+        assert cache.get("ticker:KRW-BTC") == [1]
+
+        await asyncio.sleep(0.02)
+        assert cache.get("ticker:KRW-BTC") is None
+
+    async def test_errors_not_cached(self):
+        cache = UpbitCache()
+
+        async def failing():
+            raise UpbitAPIError(500, "boom")
+
+        with pytest.raises(UpbitAPIError):
+            await cache.get_or_fetch("ticker:KRW-BTC", failing)
+        assert len(cache) == 0
+
+
+class TestSharedClient:
+    """One client per event loop, following runtime key changes."""
+
+    async def test_reused_and_keys_updated(self):
+        keys = ("access-1", "secret-1")
+        with patch.object(upbit_singleton, "_get_runtime_keys", side_effect=lambda: keys):
+            first = upbit_singleton.get_shared_upbit_client()
+            keys = ("access-2", "secret-2")
+            second = upbit_singleton.get_shared_upbit_client()
+
+        assert first is second
+        assert second.access_key == "access-2"
+
+        await upbit_singleton.close_upbit_client()
+        assert upbit_singleton._upbit_client is None
+
+    async def test_async_with_keeps_client_open(self):
+        with patch.object(upbit_singleton, "_get_runtime_keys", return_value=(None, None)):
+            async with upbit_singleton.get_shared_upbit_client() as client:
+                pass
+            assert not client._client.is_closed
+            assert upbit_singleton.get_shared_upbit_client() is client
+
+        await upbit_singleton.close_upbit_client()
+        assert client._client.is_closed
+
+    async def test_client_of_other_loop_closed_on_replace(self):
+        old_loop = asyncio.new_event_loop()
+        old = UpbitClient()
+        upbit_singleton._upbit_client, upbit_singleton._upbit_loop = old, old_loop
+        try:
+            with patch.object(upbit_singleton, "_get_runtime_keys", return_value=(None, None)):
+                new = upbit_singleton.get_shared_upbit_client()
+            await asyncio.gather(*upbit_singleton._closing)
+        finally:
+            old_loop.close()
+
+        assert new is not old
+        assert old._client.is_closed
+        await upbit_singleton.close_upbit_client()
@@ -0,0 +1,154 @@
+"""
+Tests for the Upbit market metadata index and candle reuse in get_analysis_data
+"""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.realtime_service import RealtimeService
+from services.upbit import UpbitClient, UpbitMarketIndex
+from services.upbit.models import Market, Orderbook, OrderbookUnit, Trade
+
+MARKETS = [
+    Market(market="KRW-BTC", korean_name="비트코인", english_name="Bitcoin"),
+    Market(market="KRW-ETH", korean_name="이더리움", english_name="Ethereum"),
+]
+
+
+def _make_client() -> UpbitClient:
+    client = UpbitClient()
+    client.get_markets = AsyncMock(return_value=MARKETS)
+    client.get_ticker = AsyncMock(return_value=[SimpleNamespace(
+        trade_price=100.0,
+        signed_change_rate=0.01,
+        signed_change_price=1.0,
+        acc_trade_volume_24h=10.0,
+        acc_trade_price_24h=1000.0,
+        high_price=105.0,
+        low_price=95.0,
+        highest_52_week_price=200.0,
+        lowest_52_week_price=50.0,
+    )])
+    client.get_orderbook = AsyncMock(return_value=[Orderbook(
+        market="KRW-BTC",
+        timestamp=0,
+        total_ask_size=2.0,
+        total_bid_size=3.0,
+        orderbook_units=[OrderbookUnit(ask_price=101, bid_price=99, ask_size=2, bid_size=3)],
+    )])
+    client.get_trades = AsyncMock(return_value=[Trade(
+        market="KRW-BTC",
+        trade_date_utc="2025-01-01",
+        trade_time_utc="00:00:01",
+        timestamp=0,
+        trade_price=100.0,
+        trade_volume=0.1,
+        prev_closing_price=99.0,
+        change_price=1.0,
+        ask_bid="BID",
+        sequential_id=1,
+    )])
+    client.get_candles_days = AsyncMock(return_value=[
+        SimpleNamespace(
+            candle_date_time_kst=f"2025-01-{day:02d}T09:00:00",
+            opening_price=100.0,
+            high_price=110.0,
+            low_price=90.0,
+            trade_price=100.0 + day,
+            candle_acc_trade_volume=5.0,
+        )
+        for day in range(10, 0, -1)
+    ])
+    return client
+
+
+@pytest.fixture
+def market_index():
+    index = UpbitMarketIndex()
+    with patch("services.upbit.client.get_market_index", return_value=index):
+        yield index
+
+
+class TestUpbitMarketIndex:
+    """Process-wide market metadata index"""
+
+    async def test_refreshes_once_per_interval(self):
+        client = _make_client()
+        index = UpbitMarketIndex(refresh_interval=3600)
+
+        assert (await index.get("krw-btc", client=client)).korean_name == "비트코인"
+        assert (await index.get("KRW-ETH", client=client)).english_name == "Ethereum"
+        assert await index.get("KRW-XRP", client=client) is None
+        assert client.get_markets.await_count == 1
+
+        index._loaded_at = time.monotonic() - 3601
+        await index.get("KRW-BTC", client=client)
+        assert client.get_markets.await_count == 2
+
+    async def test_refresh_failure_keeps_stale_index(self):
+        client = _make_client()
+        index = UpbitMarketIndex()
+        await index.refresh(client)
+
+        client.get_markets.side_effect = RuntimeError("429")
+        await index.refresh(client, force=True)
+        assert index.get_cached("KRW-BTC") is not None
+
+        empty = UpbitMarketIndex()
+        with pytest.raises(RuntimeError):
+            await empty.refresh(client)
+
+
+class TestAnalysisData:
+    """get_analysis_data without per-call /market/all"""
+
+    async def test_uses_index_instead_of_market_list(self, market_index):
+        client = _make_client()
+        for _ in range(3):
+            data = await client.get_analysis_data("KRW-BTC", candle_count=5)
+        await client.close()
+
+        assert data.korean_name == "비트코인"
+        assert len(data.candles) == 5
+        assert data.orderbook["total_bid_size"] == 3.0
+        assert data.trades[0]["sequential_id"] == 1
+        assert client.get_markets.await_count == 1
+
+    async def test_market_info_failure_is_not_fatal(self, market_index):
+        client = _make_client()
+        client.get_markets.side_effect = RuntimeError("down")
+        data = await client.get_analysis_data("KRW-BTC")
+        await client.close()
+
+        assert data.korean_name == "KRW-BTC"
+
+    async def test_realtime_service_reuses_candles(self, market_index):
+        client = _make_client()
+        service = RealtimeService()
+
+        first = await service.get_analysis_data(client, "KRW-BTC", candle_count=5)
+        assert client.get_candles_days.await_count == 1
+
+        # A streamed ticker from another day leaves the held candles unchanged
+        service._latest_tickers["KRW-BTC"] = {
+            "trade_price": 120.0,
+            "trade_timestamp": 1736726400000,  # 2025-01-13 00:00 UTC
+        }
+        second = await service.get_analysis_data(client, "KRW-BTC", candle_count=5)
+        assert client.get_candles_days.await_count == 1
+        assert second.candles == first.candles
+
+        # A ticker for the newest candle's day updates its close/high
+        service._latest_tickers["KRW-BTC"]["trade_timestamp"] = 1736467200000  # 2025-01-10 00:00 UTC
+        third = await service.get_analysis_data(client, "KRW-BTC", candle_count=5)
+        assert third.candles[0]["close"] == 120.0
+        assert third.candles[0]["high"] == 120.0
+        assert third.candles[1] == first.candles[1]
+
+        # More candles than held -> fetch again
+        await service.get_analysis_data(client, "KRW-BTC", candle_count=50)
+        assert client.get_candles_days.await_count == 2
+        await client.close()
@@ -18,6 +18,9 @@ Examples:
     # Download with longer history
     python scripts/download_market_data.py --period 5y
 
+    # Only fetch days newer than what is already cached
+    python scripts/download_market_data.py --incremental
+
     # Show cache statistics
     python scripts/download_market_data.py --stats
 
@@ -51,6 +54,7 @@ Examples:
     %(prog)s                          # Download popular tickers (2 years)
     %(prog)s --tickers AAPL MSFT     # Download specific tickers
     %(prog)s --period 5y              # Download 5 years of history
+    %(prog)s --incremental            # Fetch only days missing from the cache
     %(prog)s --stats                  # Show cache statistics
     %(prog)s --export                 # Export cached data to CSV
         """,
@@ -67,6 +71,11 @@ Examples:
         choices=["1y", "2y", "5y", "max"],
         help="Time period to download (default: 2y)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only download dates after the newest cached row per ticker",
+    )
     parser.add_argument(
         "--stats",
         action="store_true",
@@ -136,12 +145,19 @@ Examples:
     print("=" * 50)
     print(f"Tickers: {len(tickers)}")
     print(f"Period: {args.period}")
+    print(f"Mode: {'incremental' if args.incremental else 'full'}")
     print("-" * 50)
 
-    results = await download_historical_data(tickers, period=args.period)
+    results = await download_historical_data(
+        tickers,
+        period=args.period,
+        incremental=args.incremental,
+    )
 
     print("\n✅ Download Complete!")
     print(f"Successfully downloaded: {len(results)} tickers")
+    if args.incremental:
+        print(f"No new data: {len(tickers) - len(results)} tickers")
 
     # Show summary
     if results: